@@ -12,6 +12,7 @@ from flask_cdn import CDN
 from .auth import bp as auth_blueprint
 from .main import bp as main_blueprint
 from .fever import bp as fever_blueprint
+from .filters import bp as filters_blueprint
 from .auth import SessionUser
 import coldsweat.commands as commands
 import coldsweat.models as models
@@ -95,8 +96,8 @@ def create_app(config_class=None):
     # Add CLI support
     commands.add_commands(app)
 
-    with app.app_context():
-        from . import filters  # noqa
+    # Register Jinja filters
+    app.register_blueprint(filters_blueprint)
 
     return app
 
@@ -1,9 +1,14 @@
 from getpass import getpass
 import click
+from peewee import chunked
 from werkzeug import security
+import coldsweat.counters as counters
 import coldsweat.feed as feed
 import coldsweat.models as models
-from .models import User
+import coldsweat.migrations as migrations
+import coldsweat.unread as unread
+from .scheduler import FetchScheduler
+from .models import Feed, User
 
 
 def add_commands(app):
@@ -52,15 +57,58 @@ def add_commands(app):
         print(f"Setup completed for user {email}")
 
 
+    @app.cli.command("migrate", help="Upgrade an existing Coldsweat database to the latest schema.")
+    def command_migrate():
+        count = migrations.migrate_database()
+        print(f"Applied {count} migration(s)")
+
     @app.cli.command("fetch", help="Update all feeds.")
-    def command_fetch():
-        feed.fetch_all_feeds()
+    @click.option('-w', '--workers', type=int, default=None, help='Number of concurrent fetcher threads, defaults to FETCH_WORKERS setting')
+    def command_fetch(workers):
+        feed.fetch_all_feeds(workers)
+
+    @app.cli.command("fetcher", help="Run the feed fetcher continuously, checking feeds as they become due.")
+    @click.option('-w', '--workers', type=int, default=None, help='Number of concurrent fetcher threads, defaults to FETCH_WORKERS setting')
+    def command_fetcher(workers):
+        workers = workers or app.config.get('FETCH_WORKERS', feed.FETCH_WORKERS)
+        FetchScheduler(workers).run()
+
+    @app.cli.command("prune", help="Delete old entries and feeds without subscribers, saved entries are always kept.")
+    @click.option('-d', '--days', type=int, default=None, help='Delete entries older than given days, defaults to RETENTION_DAYS setting')
+    @click.option('-k', '--keep', type=int, default=None, help='Keep only the newest given entries of each feed, defaults to RETENTION_ENTRIES setting')
+    @click.option('-f', '--feed', 'feed_ids', type=int, multiple=True, help='Prune only given feed id, can be repeated')
+    @click.option('--vacuum', is_flag=True, default=False, help='Give disk space back to the file system afterwards')
+    def command_prune(days, keep, feed_ids, vacuum):
+        days = days or app.config.get('RETENTION_DAYS')
+        keep = keep or app.config.get('RETENTION_ENTRIES')
+
+        feeds = list(Feed.select().where(Feed.id << feed_ids)) if feed_ids else None
+        count = feed.prune_entries(days, keep, feeds)
+        print(f"Deleted {count} entries")
+        count = feed.remove_orphan_feeds()
+        print(f"Deleted {count} feeds without subscribers")
+        if vacuum:
+            feed.vacuum_database()
+
+    @app.cli.command("compress", help="Compress content of existing entries, see COMPRESS_CONTENT setting.")
+    @click.option('--undo', is_flag=True, default=False, help='Store content as plain text again')
+    def command_compress(undo):
+        count = feed.compress_entries(not undo)
+        print(f"Converted {count} entries")
+
+    @app.cli.command("recount", help="Rebuild unread entries index and entry counters from scratch.")
+    def command_recount():
+        with models.db_wrapper.database.atomic():
+            unread.rebuild()
+            count = counters.rebuild()
+        print(f"Recounted entries of {count} subscriptions")
 
     @app.cli.command("import", help="Import an OPML file for given user.")
     @click.argument("filename")
     @click.argument("email")
     @click.option('-f', '--fetch', is_flag=True, default=False, help='Fetch subscriptions immediately after import')
-    def command_import(filename, email, fetch):
+    @click.option('-w', '--workers', type=int, default=None, help='Number of concurrent fetcher threads, defaults to FETCH_WORKERS setting')
+    def command_import(filename, email, fetch, workers):
         '''
         Import an OPML file and add subscription to given user
         '''
@@ -70,17 +118,36 @@ def add_commands(app):
             print(f"Unable to find user with email {email}. Please specify a different user or run setup command to create the desired user first")
             return
 
-        feeds = feed.add_feeds_from_opml(filename)
-        for f, g in feeds:
-            feed.add_subscription(user, f, g)
+        feed_ids = feed.add_feeds_from_opml(filename, user)
+        print(f"Imported {len(feed_ids)} feeds for user {user.email}")
         if fetch:
             # Fetch only imported feeds
-            feed.fetch_feeds([f for f, _ in feeds])
+            feeds = [f for ids in chunked(feed_ids, feed.IMPORT_BATCH_SIZE)
+                     for f in Feed.select().where(Feed.id << ids)]
+            feed.fetch_feeds(feeds, workers)
 
         app.logger.info("import%s completed for user %s."
                         % (' and fetch' if fetch else '',
                            user.email))
 
+    @app.cli.command("export", help="Export subscriptions as OPML, or saved entries as Atom, for given user.")
+    @click.argument("email")
+    @click.option('-s', '--saved', is_flag=True, default=False, help='Export saved entries instead of subscriptions')
+    @click.option('-o', '--output', type=click.File('w', encoding='utf-8'), default='-', help='Write to file instead of standard output')
+    def command_export(email, saved, output):
+        '''
+        Write exported data a chunk at time, without loading all rows in memory
+        '''
+        user = User.get_or_none(User.email == email)
+        if not user:
+            print(f"Unable to find user with email {email}")
+            return
+
+        chunks = feed.export_saved_entries(user) if saved else feed.export_subscriptions(user)
+        for chunk in chunks:
+            output.write(chunk)
+
+
 def validate_password(password):
     valid = User.validate_password(password)
     if not valid:
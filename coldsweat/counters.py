@@ -0,0 +1,101 @@
+'''
+Per-subscription entry counters
+
+Every subscribed feed has a counter row for the user, holding the
+  number of entries of the feed and how many of them are unread, so
+  listing pages and API calls read counts instead of counting
+  entries. Counters are updated in the same transaction of the change
+  they reflect; rebuild() recomputes them if they ever drift
+'''
+
+from peewee import Value, fn
+from .models import (Counter, Entry, Subscription, Unread)
+
+__all__ = [
+    'add_subscriptions',
+    'remove_subscription',
+    'update_entry_counts',
+    'update_unread_counts',
+    'get_entry_count',
+    'get_unread_count',
+    'rebuild',
+]
+
+
+def add_subscriptions(user, feed_ids):
+    '''
+    Create counters for feeds just subscribed by user
+    '''
+    (Counter.insert_many([{'user': user, 'feed': feed_id} for feed_id in feed_ids])
+     .on_conflict_ignore()
+     .execute())
+    _recount((Counter.user == user) & (Counter.feed << feed_ids))
+
+
+def remove_subscription(user, feed):
+    Counter.delete().where((Counter.user == user) & (Counter.feed == feed)).execute()
+
+
+def update_entry_counts(deltas):
+    '''
+    Add or subtract entries for all subscribers, given (feed id, delta) pairs
+    '''
+    for feed_id, delta in deltas:
+        if delta:
+            (Counter.update(entry_count=Counter.entry_count + delta)
+             .where(Counter.feed == feed_id)
+             .execute())
+
+
+def update_unread_counts(deltas):
+    '''
+    Add or subtract unread entries, given (user id, feed id, delta) triples
+    '''
+    for user_id, feed_id, delta in deltas:
+        if delta:
+            (Counter.update(unread_count=Counter.unread_count + delta)
+             .where((Counter.user == user_id) & (Counter.feed == feed_id))
+             .execute())
+
+
+def get_entry_count(user, feed=None, group=None):
+    return _sum(Counter.entry_count, user, feed, group)
+
+
+def get_unread_count(user, feed=None, group=None):
+    return _sum(Counter.unread_count, user, feed, group)
+
+
+def rebuild(user=None):
+    '''
+    Recreate counters from subscriptions, entries and the unread index
+    '''
+    q = Subscription.select(Subscription.user, Subscription.feed, Value(0), Value(0)).distinct()
+    if user:
+        Counter.delete().where(Counter.user == user).execute()
+        q = q.where(Subscription.user == user)
+    else:
+        Counter.delete().execute()
+    Counter.insert_from(q, [Counter.user, Counter.feed, Counter.entry_count, Counter.unread_count]).execute()
+    return _recount((Counter.user == user) if user else None)
+
+
+def _recount(where=None):
+    q = Counter.update(
+        entry_count=Entry.select(fn.COUNT(Entry.id)).where(Entry.feed == Counter.feed),
+        unread_count=(Unread.select(fn.COUNT(Unread.id))
+                      .join(Entry)
+                      .where((Unread.user == Counter.user) & (Entry.feed == Counter.feed))))
+    if where is not None:
+        q = q.where(where)
+    return q.execute()
+
+
+def _sum(field, user, feed, group):
+    where = (Counter.user == user)
+    if feed:
+        where &= (Counter.feed == feed)
+    if group:
+        where &= (Counter.feed << Subscription.select(Subscription.feed).where(
+            (Subscription.user == user) & (Subscription.group == group)))
+    return Counter.select(fn.COALESCE(fn.SUM(field), 0)).where(where).scalar()
@@ -3,12 +3,27 @@ Shared feed logic functions
 '''
 
 import time
+from datetime import datetime, timedelta
+import itertools
+import threading
+from queue import Queue, Empty
 from xml.etree import ElementTree
+import flask
 from flask import current_app as app
-from peewee import JOIN, fn, IntegrityError
-from .models import (Entry, Feed, Group, Read, Saved, Subscription)
-from .utilities import make_sha1_hash, scrub_url
-from .fetcher import Fetcher
+from peewee import JOIN, Value, chunked, fn, IntegrityError
+from .models import (Counter, Entry, Feed, Group, Read, Saved, Subscription, Unread, db_wrapper)
+from .utilities import make_sha1_hash, scrub_url, format_http_datetime
+from . import __version__
+import coldsweat.unread as unread
+import coldsweat.counters as counters
+from .fetcher import Fetcher, fetch_stats, write_lock, INSERT_CHUNK_SIZE
+
+FETCH_WORKERS = 1  # Default is to fetch feeds sequentially
+FETCH_PROGRESS_INTERVAL = 100  # Feeds, between progress reports
+EXPORT_TAG_URI = 'tag:lab.passiomatic.com,2017:coldsweat:saved:%s'
+PRUNE_BATCH_SIZE = 500  # Entries deleted per transaction
+SQLITE_INCREMENTAL_VACUUM = 2
+IMPORT_BATCH_SIZE = 500  # OPML outlines saved at once, stay below SQLite limit of 999 query variables
 
 
 def add_subscription(user, feed, group):
@@ -16,9 +31,12 @@ def add_subscription(user, feed, group):
     Associate a feed/group pair to current user
     '''
     try:
-        subscription = Subscription.create(user=user,
-                                           feed=feed,
-                                           group=group)
+        with db_wrapper.database.atomic():
+            subscription = Subscription.create(user=user,
+                                               feed=feed,
+                                               group=group)
+            unread.add_entries(Entry.feed == feed, user)
+            counters.add_subscriptions(user, [feed.id])
     except IntegrityError:
         app.logger.debug(
             'user %s already has feed %s in subscriptions' % (
@@ -35,9 +53,12 @@ def remove_subscription(user, feed):
     '''
     Remove a feed subscription for current user
     '''
-    Subscription.delete().where(
-        (Subscription.user == user) & (
-            Subscription.feed == feed)).execute()
+    with db_wrapper.database.atomic():
+        Subscription.delete().where(
+            (Subscription.user == user) & (
+                Subscription.feed == feed)).execute()
+        unread.remove_entries(Entry.feed == feed, user)
+        counters.remove_subscription(user, feed)
 
 # ------------------------------------------------------
 # Entry queries
@@ -50,14 +71,18 @@ def mark_entry(user, entry, status):
     '''
     if status == 'read':
         try:
-            Read.create(user=user, entry=entry)
+            with db_wrapper.database.atomic():
+                Read.create(user=user, entry=entry)
+                unread.remove_entries(Entry.id == entry.id, user)
         except IntegrityError:
             app.logger.debug('entry %s already marked as read, ignored' %
                              entry.id)
             return
     elif status == 'unread':
-        count = Read.delete().where((Read.user == user) & (
-            Read.entry == entry)).execute()
+        with db_wrapper.database.atomic():
+            count = Read.delete().where((Read.user == user) & (
+                Read.entry == entry)).execute()
+            unread.add_entries(Entry.id == entry.id, user)
         if not count:
             app.logger.debug(
                 'entry %s never marked as read, ignored' % entry.id)
@@ -79,11 +104,58 @@ def mark_entry(user, entry, status):
     app.logger.debug('marked entry %s as %s' % (entry.id, status))
 
 
+def mark_entries_as_read(user, before=None, feed=None, group=None, max_id=None):
+    '''
+    Mark as read with a single statement all entries published before given
+      time and/or fetched up to given entry id, optionally limited to a
+      feed or a group of the user. Return the number of entries marked
+    '''
+    where = (Subscription.user == user)
+    if before:
+        where &= (Entry.published_on < before)
+    if max_id:
+        where &= (Entry.id <= max_id)
+    if feed:
+        where &= (Subscription.feed == feed)
+    if group:
+        where &= (Subscription.group == group)
+    q = (Entry.select(Value(user.id), Entry.id, Value(datetime.utcnow()))
+         .join(Subscription, on=(Subscription.feed == Entry.feed))
+         .where(where &
+                # Exclude entries already marked as read
+                ~(Entry.id << Read.select(Read.entry).where(Read.user == user)))
+         .distinct())
+    with write_lock(), db_wrapper.database.atomic():
+        count = (Read.insert_from(q, [Read.user, Read.entry, Read.read_on])
+                 .on_conflict_ignore()
+                 .as_rowcount()
+                 .execute())
+        entries = (Entry.select(Entry.id)
+                   .join(Subscription, on=(Subscription.feed == Entry.feed))
+                   .where(where))
+        unread.remove_entries(Entry.id << entries, user)
+    app.logger.debug('marked %d entries as read' % count)
+    return count
+
+
+def get_read_and_saved_ids(user, entries):
+    '''
+    Return the ids of given entries read and saved by user, looking
+      up just those entries instead of the whole user history
+    '''
+    ids = [entry.id for entry in entries]
+    read_ids = set(entry_id for entry_id, in Read.select(Read.entry).where(
+        (Read.user == user) & (Read.entry << ids)).tuples())
+    saved_ids = set(entry_id for entry_id, in Saved.select(Saved.entry).where(
+        (Saved.user == user) & (Saved.entry << ids)).tuples())
+    return read_ids, saved_ids
+
+
 def get_unread_entries(user, *select):
     # @@TODO: include saved information
     q = _q(*select).where((Subscription.user == user) &
-                          ~(Entry.id << Read.select(Read.entry).where(
-                              Read.user == user))).distinct()
+                          (Entry.id << Unread.select(Unread.entry).where(
+                              Unread.user == user))).distinct()
     return q
 
 
@@ -122,11 +194,11 @@ def get_feed_entries(user, feed, *select):
 
 
 def get_feeds(user, *select):
-    select = select or [Feed, fn.Count(Entry.id).alias('entry_count')]
-    q = Feed.select(*select).join(
-        Entry, JOIN.LEFT_OUTER).switch(
-        Feed).join(Subscription).where(
-        Subscription.user == user).group_by(Feed)
+    select = select or [Feed, fn.COALESCE(Counter.entry_count, 0).alias('entry_count')]
+    q = Feed.select(*select).join(Subscription).switch(Feed).join(
+        Counter, JOIN.LEFT_OUTER, on=(
+            (Counter.feed == Feed.id) & (Counter.user == user))).where(
+        Subscription.user == user).distinct()
     return q
 
 
@@ -190,117 +262,420 @@ def add_feed_from_url(self_link, fetch_data=False):
     return add_feed(feed, fetch_data)
 
 
-# @@TODO: delete feed if there are no subscribers
 def remove_feed(feed):
-    pass
+    '''
+    Delete a feed nobody is subscribed to, along with its entries. Entries
+      saved by users are kept, and so is their feed. Return True if
+      the feed has been deleted
+    '''
+    subscriptions = Subscription.select().where(Subscription.feed == feed)
+    if subscriptions.exists():
+        return False
 
+    _delete_entries((Entry.feed == feed) & ~(Entry.id << Saved.select(Saved.entry)))
 
-def add_feeds_from_opml(filename, fetch_data=False):
+    # Someone could have subscribed meanwhile
+    with write_lock():
+        count = (Feed.delete()
+                 .where((Feed.id == feed.id) &
+                        ~fn.EXISTS(subscriptions) &
+                        ~fn.EXISTS(Entry.select().where(Entry.feed == feed)))
+                 .execute())
+    if count:
+        app.logger.debug(f'removed feed {feed.self_link}')
+    return bool(count)
+
+
+def remove_orphan_feeds():
     '''
-    Add feeds to database reading from a file containing OPML data.
+    Delete all feeds without subscribers. Return the number of deleted feeds
     '''
+    q = (Feed.select(Feed.id, Feed.self_link)
+         .join(Subscription, JOIN.LEFT_OUTER)
+         .where(Subscription.id.is_null()))
+    return sum(remove_feed(feed) for feed in list(q))
 
-    # Map OPML attr keys to Feed model
-    feed_allowed_attribs = {
-        'xmlUrl': 'self_link',
-        'htmlUrl': 'alternate_link',
-        'title': 'title',
-        'text': 'title',  # Alias for title
-    }
 
-    # Map OPML attr keys to Group model
-    group_allowed_attribs = {
-        'title': 'title',
-        'text': 'title',  # Alias for title
-    }
+def add_feeds_from_opml(filename, user=None):
+    '''
+    Add feeds to database reading from a file containing OPML data,
+      optionally subscribing given user to them. The file is parsed
+      incrementally and outlines are saved in batches, so large files
+      need a handful of queries. Return ids of all the listed feeds
+    '''
 
     default_group = Group.get(Group.title == Group.DEFAULT_GROUP)
 
-    feeds = []
-    groups = [default_group]
+    feed_ids = []
+    outlines = []
+    group_titles = [default_group.title]
 
     for event, element in ElementTree.iterparse(filename,
                                                 events=('start', 'end')):
+        if element.tag != 'outline':
+            continue
         if event == 'start':
-            if (element.tag == 'outline') and (
-                    'xmlUrl' not in element.attrib):
-                # Entering a group
-                group = Group()
+            if 'xmlUrl' not in element.attrib:
+                # Entering a group, untitled ones are merged into parent
+                group_titles.append(_get_outline_title(element) or group_titles[-1])
+        elif event == 'end':
+            if 'xmlUrl' in element.attrib:
+                # Leaving a feed
+                outlines.append((element.attrib['xmlUrl'],
+                                 _get_outline_title(element),
+                                 element.attrib.get('htmlUrl', ''),
+                                 group_titles[-1]))
+                if len(outlines) == IMPORT_BATCH_SIZE:
+                    feed_ids.extend(_add_outlines(outlines, user))
+                    outlines = []
+                    app.logger.info('imported %d feeds so far' % len(feed_ids))
+            else:
+                # Leaving a group
+                group_titles.pop()
+            # Free memory of parsed outlines
+            element.clear()
 
-                for k, v in element.attrib.items():
-                    if k in group_allowed_attribs:
-                        setattr(group, group_allowed_attribs[k], v)
+    if outlines:
+        feed_ids.extend(_add_outlines(outlines, user))
+    return feed_ids
 
-                try:
-                    group = Group.get(Group.title == group.title)
-                except Group.DoesNotExist:
-                    group.save()
-                    app.logger.debug(
-                        'added group %s to database' % group.title)
 
-                groups.append(group)
+def _get_outline_title(element):
+    return element.attrib.get('title') or element.attrib.get('text', '')
 
-        elif event == 'end':
-            if (element.tag == 'outline') and ('xmlUrl' in element.attrib):
 
-                # Leaving a feed
-                feed = Feed()
+def _add_outlines(outlines, user):
+    '''
+    Save a batch of (self link, title, alternate link, group title) outlines
+    '''
+    # Keep the first occurrence of feeds listed more than once
+    outlines_by_link = {}
+    for self_link, title, alternate_link, group_title in outlines:
+        outlines_by_link.setdefault(scrub_url(self_link), (title, alternate_link, group_title))
+    links = list(outlines_by_link)
+
+    groups = _get_or_create_groups(set(group_title for _, _, group_title in outlines_by_link.values()))
+
+    feeds = dict(Feed.select(Feed.self_link, Feed.id).where(Feed.self_link << links).tuples())
+    new_feeds = [{
+        'self_link': self_link,
+        'title': title[:Feed.MAX_TITLE_LENGTH],
+        'alternate_link': alternate_link,
+    } for self_link, (title, alternate_link, _) in outlines_by_link.items() if self_link not in feeds]
+    if new_feeds:
+        with db_wrapper.database.atomic():
+            for batch in chunked(new_feeds, INSERT_CHUNK_SIZE):
+                Feed.insert_many(batch).on_conflict_ignore().execute()
+        feeds.update(Feed.select(Feed.self_link, Feed.id)
+                     .where(Feed.self_link << [f['self_link'] for f in new_feeds])
+                     .tuples())
+        app.logger.debug('added %d feeds to database' % len(new_feeds))
+
+    if user:
+        subscriptions = [{
+            'user': user,
+            'group': groups[group_title],
+            'feed': feeds[self_link],
+        } for self_link, (_, _, group_title) in outlines_by_link.items()]
+        with db_wrapper.database.atomic():
+            for batch in chunked(subscriptions, INSERT_CHUNK_SIZE):
+                Subscription.insert_many(batch).on_conflict_ignore().execute()
+                feed_ids = [s['feed'] for s in batch]
+                unread.add_entries(Entry.feed << feed_ids, user)
+                counters.add_subscriptions(user, feed_ids)
+
+    return [feeds[self_link] for self_link in links]
+
+
+def _get_or_create_groups(titles):
+    '''
+    Return a title to group id map, adding missing groups
+    '''
+    groups = dict(Group.select(Group.title, Group.id).where(Group.title << list(titles)).tuples())
+    new_titles = [title for title in titles if title not in groups]
+    if new_titles:
+        Group.insert_many([{'title': title} for title in new_titles]).on_conflict_ignore().execute()
+        groups.update(Group.select(Group.title, Group.id).where(Group.title << new_titles).tuples())
+        app.logger.debug('added groups %s to database' % ', '.join(new_titles))
+    return groups
 
-                for k, v in element.attrib.items():
-                    if k in feed_allowed_attribs:
-                        setattr(feed, feed_allowed_attribs[k], v)
+# ------------------------------------------------------
+# Pruning
+# ------------------------------------------------------
 
-                feed = add_feed(feed, fetch_data)
-                feeds.append((feed, groups[-1]))
-            elif element.tag == 'outline':
-                # Leaving a group
-                groups.pop()
-    return feeds
+
+def prune_entries(days=None, keep=None, feeds=None):
+    '''
+    Delete entries older than given days and entries past the
+      newest keep ones of each feed, optionally limited to given
+      feeds. Entries saved by any user are never deleted.
+      Return the number of deleted entries
+    '''
+    saved_entries = Saved.select(Saved.entry)
+    feed_ids = [f.id for f in feeds] if feeds is not None else None
+
+    count = 0
+    if days:
+        where = (Entry.published_on < datetime.utcnow() - timedelta(days=days)) & ~(Entry.id << saved_entries)
+        if feed_ids is not None:
+            where &= (Entry.feed << feed_ids)
+        count += _delete_entries(where)
+
+    if keep:
+        if feed_ids is None:
+            feed_ids = [feed_id for feed_id, in Entry.select(Entry.feed).distinct().tuples()]
+        for feed_id in feed_ids:
+            # Find the oldest entry to keep, entries past it can go
+            oldest = (Entry.select(Entry.id, Entry.published_on)
+                      .where(Entry.feed == feed_id)
+                      .order_by(Entry.published_on.desc(), Entry.id.desc())
+                      .offset(keep - 1)
+                      .first())
+            if not oldest:
+                continue
+            where = ((Entry.feed == feed_id) &
+                     ((Entry.published_on < oldest.published_on) |
+                      ((Entry.published_on == oldest.published_on) & (Entry.id < oldest.id))) &
+                     ~(Entry.id << saved_entries))
+            count += _delete_entries(where)
+
+    return count
+
+
+def _delete_entries(where):
+    '''
+    Delete matching entries and their read marks in short transactions,
+      so writers like the fetcher are not locked out for long
+    '''
+    count = 0
+    while True:
+        with write_lock(), db_wrapper.database.atomic():
+            ids = [entry_id for entry_id, in Entry.select(Entry.id).where(where).limit(PRUNE_BATCH_SIZE).tuples()]
+            if not ids:
+                break
+            counters.update_entry_counts([
+                (feed_id, -count) for feed_id, count in
+                Entry.select(Entry.feed, fn.COUNT(Entry.id)).where(Entry.id << ids).group_by(Entry.feed).tuples()])
+            Read.delete().where(Read.entry << ids).execute()
+            unread.remove_entries(Entry.id << ids)
+            Entry.delete().where(Entry.id << ids).execute()
+        count += len(ids)
+        app.logger.debug('deleted %d entries so far' % count)
+    return count
+
+
+def vacuum_database():
+    '''
+    Give space of deleted rows back to the file system
+    '''
+    database = db_wrapper.database
+    engine = db_wrapper.get_engine()
+    if engine == 'sqlite':
+        if database.pragma('auto_vacuum') != SQLITE_INCREMENTAL_VACUUM:
+            # Switching mode needs a one-time full vacuum
+            app.logger.info('enabling incremental vacuum, this may take a while')
+            database.pragma('auto_vacuum', SQLITE_INCREMENTAL_VACUUM)
+            database.execute_sql('VACUUM')
+        else:
+            # Every step of the statement frees one page, so drain the
+            #   cursor and repeat until the free list is empty
+            freelist_count = database.pragma('freelist_count')
+            while freelist_count:
+                database.execute_sql('PRAGMA incremental_vacuum').fetchall()
+                count, freelist_count = freelist_count, database.pragma('freelist_count')
+                if freelist_count >= count:
+                    break
+    elif engine == 'postgres':
+        database.execute_sql(f'VACUUM ANALYZE "{Entry._meta.table_name}", "{Read._meta.table_name}"')
+    else:
+        database.execute_sql(f'OPTIMIZE TABLE `{Entry._meta.table_name}`, `{Read._meta.table_name}`')
+
+
+def compress_entries(compress=True):
+    '''
+    Store content of existing entries compressed, or back as plain
+      text, in short transactions. Return the number of converted entries
+    '''
+    where = Entry.compressed_content.is_null(compress)
+    count, last_id = 0, 0
+    while True:
+        with write_lock(), db_wrapper.database.atomic():
+            entries = list(Entry.select(Entry.id, Entry.raw_content, Entry.compressed_content)
+                           .where(where & (Entry.id > last_id))
+                           .order_by(Entry.id)
+                           .limit(PRUNE_BATCH_SIZE))
+            if not entries:
+                break
+            for entry in entries:
+                (Entry.update(**Entry.encode_content(entry.content, compress))
+                 .where(Entry.id == entry.id)
+                 .execute())
+        count += len(entries)
+        last_id = entries[-1].id
+        app.logger.debug('converted %d entries so far' % count)
+    return count
+
+# ------------------------------------------------------
+# Export
+# ------------------------------------------------------
+
+
+def export_subscriptions(user):
+    '''
+    Render user subscriptions as OPML, yielding text as it is generated
+    '''
+    return flask.stream_template('main/export.xml',
+                                 groups=get_export_groups(user),
+                                 timestamp=format_http_datetime(datetime.utcnow()))
+
+
+def export_saved_entries(user):
+    '''
+    Render user saved entries as an Atom feed, yielding text as it is generated
+    '''
+    return flask.stream_template('main/export-saved.xml',
+                                 user=user,
+                                 entries=get_export_saved_entries(user),
+                                 guid=EXPORT_TAG_URI % user.id,
+                                 version='%d.%d.%d%s' % __version__,
+                                 timestamp=datetime.utcnow())
+
+
+def get_export_groups(user):
+    '''
+    Yield (group title, feeds) pairs for user subscriptions,
+      without loading all of them in memory
+    '''
+    q = (Feed.select(Feed.title, Feed.self_link, Feed.alternate_link, Group.title.alias('group_title'))
+         .join(Subscription)
+         .join(Group)
+         .where(Subscription.user == user)
+         .order_by(Group.title, Feed.title)
+         .objects()
+         .iterator())
+    for group_title, feeds in itertools.groupby(q, key=lambda feed: feed.group_title):
+        yield group_title, feeds
+
+
+def get_export_saved_entries(user):
+    return (Entry.select(Entry, Feed)
+            .join(Saved)
+            .switch(Entry)
+            .join(Feed)
+            .where(Saved.user == user)
+            .order_by(Saved.saved_on.desc())
+            .iterator())
 
 # ------------------------------------------------------
 # Fetching
 # ------------------------------------------------------
 
 
-def fetch_feeds(feeds):
+def fetch_feeds(feeds, workers=None):
     """
     Fetch given feeds, possibly parallelizing requests
     """
 
     start = time.time()
 
-    app.logger.debug("starting fetcher")
-
-    # if config.fetcher.processes:
-    #     from multiprocessing import Pool
-    #     # Each worker has its own connection
-    #     p = Pool(4, initializer=database.connect)
-    #     p.map(feed_worker, feeds)
-    #     # Exit the worker processes so their connections do not leak
-    #     p.close()
-    # else:
-    # Just sequence requests in this process
-    for feed in feeds:
-        feed_worker(feed)
+    # Materialize the query once, worker threads must not share a cursor
+    feeds = list(feeds)
+    workers = workers or app.config.get('FETCH_WORKERS', FETCH_WORKERS)
+    workers = max(1, min(workers, len(feeds)))
 
-    app.logger.info("fetch completed: %d feeds checked in %.1fs" % (
-        len(feeds), time.time() - start))
+    app.logger.debug("starting fetcher with %d worker(s)" % workers)
+    fetch_stats.reset()
 
+    lock, done_count = threading.Lock(), 0
 
-def fetch_all_feeds():
+    def fetch(feed):
+        nonlocal done_count
+        feed_worker(feed)
+        with lock:
+            done_count += 1
+            if done_count % FETCH_PROGRESS_INTERVAL == 0:
+                app.logger.info("fetched %d of %d feeds" % (done_count, len(feeds)))
+
+    if workers > 1:
+        _fetch_feeds_concurrently(feeds, workers, fetch)
+    else:
+        # Just sequence requests in this process
+        for feed in feeds:
+            fetch(feed)
+
+    _log_fetch_stats(len(feeds), time.time() - start, workers)
+
+
+def _log_fetch_stats(count, elapsed, workers):
+    app.logger.info("fetch completed: %d feeds checked in %.1fs (%.1f feeds/s, %d workers)" % (
+        count, elapsed, count / elapsed if elapsed else 0, workers))
+    app.logger.info("fetch stats: %d new/%d reused connections, %d feeds parsed, %d unchanged bodies skipped, %d unchanged entries skipped" % (
+        fetch_stats['new_connections'], fetch_stats['reused_connections'],
+        fetch_stats['parsed_feeds'], fetch_stats['unchanged_bodies'], fetch_stats['unchanged_entries']))
+    app.logger.info("fetch stats: %d not modified (304), %d modified (200), %.1f KB received" % (
+        fetch_stats['not_modified'], fetch_stats['modified'], fetch_stats['bytes_received'] / 1024))
+    app.logger.info("fetch stats: %d requests waited %.1fs on host limits, %d feeds deferred by throttling hosts" % (
+        fetch_stats['host_waits'], fetch_stats['host_wait_ms'] / 1000, fetch_stats['deferred_feeds']))
+
+def _fetch_feeds_concurrently(feeds, workers, fetch):
+    """
+    Run fetch on a bounded pool of threads. Each thread pushes its 
+      own app context and holds its own database connection, so network 
+      I/O overlaps while database writes are serialized by the fetcher
+    """
+
+    queue = Queue()
+    for feed in feeds:
+        queue.put(feed)
+
+    flask_app = app._get_current_object()
+
+    def worker():
+        with flask_app.app_context():
+            db_wrapper.database.connect(reuse_if_open=True)
+            try:
+                while True:
+                    try:
+                        feed = queue.get_nowait()
+                    except Empty:
+                        break
+                    try:
+                        fetch(feed)
+                    except Exception:
+                        # Do not let a single feed take down the whole thread
+                        app.logger.exception(
+                            "unexpected error while fetching %s, skipped" % feed.self_link)
+            finally:
+                db_wrapper.database.close()
+
+    threads = [threading.Thread(target=worker, name=f'fetcher-{i}', daemon=True)
+               for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def fetch_all_feeds(workers=None):
     """
     Fetch all enabled feeds with at least one subscription
+      which are due for a check. Feeds are taken from the shared
+      job queue, so concurrent runs on other hosts do not overlap
     """
+    from .scheduler import FetchScheduler
+
+    start = time.time()
+    workers = workers or app.config.get('FETCH_WORKERS', FETCH_WORKERS)
+    fetch_stats.reset()
 
-    feeds = (Feed.select()
-        .join(Subscription)
-        .where(Feed.enabled == True))
+    scheduler = FetchScheduler(workers, drain=True)
+    scheduler.run()
 
-    if feeds.count() == 0:
-        app.logger.info("no feeds found to fetch, halted")
+    if not scheduler.fetched_count:
+        app.logger.info("no feeds due for a fetch, halted")
         return
 
-    fetch_feeds(feeds)
+    _log_fetch_stats(scheduler.fetched_count, time.time() - start, workers)
 
 
 def feed_worker(feed):
@@ -3,40 +3,77 @@ The feed fetcher
 '''
 
 import urllib
-
-from datetime import datetime
-from peewee import chunked
+import time
+import random
+import socket
+import threading
+import contextlib
+from collections import Counter
+
+from datetime import datetime, timedelta
+from peewee import EXCLUDED, chunked, fn
 import flask
 from flask import current_app as app
 import feedparser
 import requests
-from requests.exceptions import RequestException
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException, ReadTimeout
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 import werkzeug.exceptions as exceptions
 from werkzeug import http
 from . import markup
-from .models import (Entry, Feed, db_wrapper, FEED_GENERIC, FEED_MASTODON)
-from .utilities import (datetime_as_epoch, 
-                        tuple_as_datetime, 
+from . import counters
+from . import unread
+from .models import (Entry, Feed, Icon, db_wrapper, FEED_GENERIC, FEED_MASTODON)
+from .utilities import (tuple_as_datetime, 
                         scrub_url, 
                         truncate,
                         format_http_datetime,
                         make_sha1_hash,
-                        make_data_uri,
+                        make_sha1_data_hash,
                         make_nonce)
 from . import __version__
 
 __all__ = [
     'Fetcher',
-    'fetch_url'
+    'fetch_url',
+    'fetch_stats'
 ]
 
 INSERT_CHUNK_SIZE = 100  # SQLite has a limit of total 999 max variables
 FETCH_TIMEOUT = 10  # Seconds
+FETCH_DEADLINE = 60  # Seconds, to download a whole response body
+MAX_FETCH_SIZE = 10*1024*1024  # Bytes, after decompression
+FETCH_CHUNK_SIZE = 64*1024  # Bytes
 MIN_FETCH_INTERVAL = 60*3  # Seconds
+MAX_FETCH_INTERVAL = 60*60*24  # Seconds
+DEFAULT_FETCH_INTERVAL = 60*60  # Seconds, used when feed history is too short
+FETCH_INTERVAL_FACTOR = 0.5  # Poll twice as often as a feed usually posts
+SCHEDULE_SAMPLE_SIZE = 10  # Most recent entries used to estimate posting rate
 MAX_FETCH_ERRORS = 50
+BACKOFF_BASE_INTERVAL = 60*15  # Seconds, retry delay after the first error
+MAX_BACKOFF_INTERVAL = 60*60*24*7  # Seconds
+BACKOFF_JITTER = 0.2  # Spread retries of feeds which failed together
 FETCH_ICONS_INTERVAL = 30  # Days
+MAX_ICON_SIZE = 256*1024  # Bytes
+# Fields overwritten when a stored entry changes upstream
+ENTRY_UPDATED_FIELDS = [Entry.title, Entry.author, Entry.raw_content, Entry.compressed_content, Entry.content_type, Entry.content_hash]
 ENTRY_TAG_URI = 'tag:lab.passiomatic.com,2017:coldsweat:entry:%s'
 USER_AGENT = ('Coldsweat/%d.%d.%d%s <https://lab.passiomatic.com/coldsweat/>' % __version__)
+POOL_CONNECTIONS = 100  # Number of hosts to keep connection pools for
+POOL_MAXSIZE = 10  # Keep-alive connections per host
+HOST_MAX_CONNECTIONS = 2  # Concurrent requests per host
+HOST_MIN_INTERVAL = 0.25  # Seconds between two requests to the same host
+
+# SQLite allows a single writer at time, so fetcher threads
+#   serialize their writes instead of failing with 'database is locked'
+_write_lock = threading.RLock()
+
+
+def write_lock():
+    if db_wrapper.get_engine() == 'sqlite':
+        return _write_lock
+    return contextlib.nullcontext()
 
 
 class Fetcher(object):
@@ -53,7 +90,7 @@ class Fetcher(object):
         '''
         Internal server error
         '''
-        #self.feed.error_count += 1
+        self.feed.error_count += 1
         self.feed.last_status = response.status_code
         app.logger.warning(
             "%s has caused an error on server, skipped" % self.feed.self_link)
@@ -83,17 +120,57 @@ class Fetcher(object):
         '''
         self.feed.enabled = False
         self.feed.error_count += 1
-        self.feed.last_statu = response.status_code
+        self.feed.last_status = response.status_code
         app.logger.warning("%s is gone, disabled" % self.feed.self_link)
         self._synthesize_entry('Feed has been removed from the origin server.')
         raise exceptions.Gone
 
+    def handle_429(self, response):
+        '''
+        Too many requests
+        '''
+        self.feed.last_status = response.status_code
+        retry_on = get_retry_after(response.headers, self.instant) or \
+            (self.instant + timedelta(seconds=BACKOFF_BASE_INTERVAL))
+        self._defer_host(retry_on)
+
+    def handle_503(self, response):
+        '''
+        Service unavailable
+        '''
+        retry_on = get_retry_after(response.headers, self.instant)
+        if not retry_on:
+            # A plain server error
+            return self.handle_500(response)
+        self.feed.last_status = response.status_code
+        self._defer_host(retry_on)
+
+    def _defer_host(self, retry_on):
+        '''
+        Server asked us to slow down: postpone all feeds on 
+          the same host without counting it as an error
+        '''
+        host = get_host(self.feed.self_link)
+        retry_on = min(retry_on, self.instant + timedelta(seconds=MAX_BACKOFF_INTERVAL))
+        host_limiter.block(host, retry_on)
+        self.feed.next_check_on = retry_on
+        with write_lock():
+            count = defer_host_feeds(host, retry_on)
+        app.logger.warning(
+            "%s is throttling requests, %d feeds on host deferred to %s" % (
+                host, count, retry_on))
+        raise FetchDeferred
+
     def handle_304(self, response):
         '''
         Not modified
         '''
         app.logger.debug("%s hasn't been modified, skipped" % self.feed.self_link)
         self.feed.last_status = response.status_code
+        # Servers may refresh validators along with a 304
+        self.feed.etag = response.headers.get('ETag', self.feed.etag)
+        self.feed.last_modified = response.headers.get('Last-Modified', self.feed.last_modified)
+        fetch_stats.incr('not_modified')
 
     def handle_301(self, response):
         '''
@@ -124,9 +201,21 @@ class Fetcher(object):
         OK plus redirects
         '''
         self.feed.etag = response.headers.get('ETag', '')
+        self.feed.last_modified = response.headers.get('Last-Modified', '')
+        fetch_stats.incr('modified')
+        fetch_stats.incr('bytes_received', len(response.content))
         # Save final status code discarding redirects
         self.feed.last_status = response.status_code
-        self._parse_feed(response.text)
+        # Many servers ignore conditional GETs, so check the body itself
+        body_hash = make_sha1_data_hash(response.content)
+        if body_hash == self.feed.body_hash:
+            fetch_stats.incr('unchanged_bodies')
+            app.logger.debug("%s body hasn't changed, skipped" % self.feed.self_link)
+        else:
+            # Hand raw bytes to the parser, which sniffs the encoding on its own
+            self._parse_feed(response.content, response.headers)
+            self.feed.body_hash = body_hash
+            fetch_stats.incr('parsed_feeds')
         self._fetch_icon()        
 
     handle_307 = handle_200   # Alias
@@ -138,34 +227,51 @@ class Fetcher(object):
         app.logger.debug("updating %s" % self.feed.self_link)
 
         # Check freshness
-        for value in [self.feed.last_checked_on, self.feed.last_updated_on]:
-            if not value:
-                continue
+        if self.feed.next_check_on and self.feed.next_check_on > self.instant:
+            app.logger.debug(
+                "%s is not due for a check until %s, skipped"
+                % (self.feed.self_link, self.feed.next_check_on))
+            return
 
-            # No datetime.timedelta since we need to
-            #   deal with large seconds values
-            delta = datetime_as_epoch(self.instant) - datetime_as_epoch(value)
-            # @@TODO Skip check while DEBUG env
-            if delta < MIN_FETCH_INTERVAL:
-                app.logger.debug(
-                    "%s is below minimun fetch interval, skipped"
-                    % self.feed.self_link)
-                return
+        blocked_until = host_limiter.blocked_until(get_host(self.feed.self_link), self.instant)
+        if blocked_until:
+            app.logger.debug(
+                "%s host asked to slow down until %s, deferred"
+                % (self.feed.self_link, blocked_until))
+            fetch_stats.incr('deferred_feeds')
+            self.feed.next_check_on = blocked_until
+            with write_lock():
+                self.feed.save()
+            return
 
+        fetch_stats.incr('checked_feeds')
         try:
             response = fetch_url(self.feed.self_link,
                                  timeout=FETCH_TIMEOUT,
                                  etag=self.feed.etag,
-                                 modified_since=self.feed.last_updated_on)
+                                 modified_since=self.feed.last_modified)
+        except ContentTooLarge:
+            self.feed.last_status = FeedTooLarge.code
+            self.feed.error_count += 1
+            app.logger.warning(
+                "%s exceeds the maximum allowed size, skipped"
+                % self.feed.self_link)
+            with write_lock():
+                self.check_feed_health()
+                self.schedule_retry()
+                self.feed.save()
+            return
         except RequestException:
             # Record any network error as 'Service Unavailable'
             self.feed.last_status = exceptions.ServiceUnavailable.code
-            #self.feed.error_count += 1
+            self.feed.error_count += 1
             app.logger.warning(
                 "a network error occured while fetching %s, skipped"
                 % self.feed.self_link)
-            self.check_feed_health()
-            self.feed.save()
+            with write_lock():
+                self.check_feed_health()
+                self.schedule_retry()
+                self.feed.save()
             return
 
         self.feed.last_checked_on = self.instant
@@ -176,6 +282,7 @@ class Fetcher(object):
         else:
             status = response.status_code
 
+        outcome = 'failed'
         try:
             handler = getattr(self, f'handle_{status}', None)
             if handler:
@@ -183,14 +290,29 @@ class Fetcher(object):
                 handler(response)
             else:
                 self.feed.last_status = status
+                self.feed.error_count += 1
                 app.logger.warning(
                     "%s replied with unhandled status %d, aborted" % (
                         self.feed.self_link, status))
                 return
+            outcome = 'succeeded'
+        except FetchDeferred:
+            # Keep errors count and the next check set by handler
+            outcome = 'deferred'
+            fetch_stats.incr('deferred_feeds')
         except exceptions.HTTPException:
-            self.check_feed_health()
+            pass
         finally:
-            self.feed.save()
+            with write_lock():
+                if outcome == 'failed':
+                    self.check_feed_health()
+                    self.schedule_retry()
+                elif outcome == 'succeeded':
+                    # Errors count is reset by any successful check
+                    self.feed.error_count = 0
+                    self.schedule_next_check()
+                self.honour_cache_headers(response)
+                self.feed.save()
 
     def check_feed_health(self):
         if self.feed.error_count > MAX_FETCH_ERRORS:
@@ -201,13 +323,68 @@ class Fetcher(object):
                 "%s has accomulated too many errors, disabled" % self.feed.self_link)
             self.feed.enabled = False
 
-    def update_feed_with_data(self, data):
-        self._parse_feed(data)
-        self.feed.save()
+    def schedule_next_check(self):
+        '''
+        Set the next fetch time from the feed posting rate. Feeds which 
+          post rarely or went quiet are polled less often
+        '''
+        q = (Entry.select(Entry.published_on)
+             .where(Entry.feed == self.feed)
+             .order_by(Entry.published_on.desc())
+             .limit(SCHEDULE_SAMPLE_SIZE))
+        timestamps = [e.published_on for e in q]
+
+        if len(timestamps) < 2:
+            interval = DEFAULT_FETCH_INTERVAL
+        else:
+            newest, oldest = timestamps[0], timestamps[-1]
+            average_gap = (newest - oldest).total_seconds() / (len(timestamps) - 1)
+            quiet_for = (self.instant - newest).total_seconds()
+            interval = max(average_gap, quiet_for) * FETCH_INTERVAL_FACTOR
 
-    def _parse_feed(self, data):
+        interval = min(max(interval, MIN_FETCH_INTERVAL), MAX_FETCH_INTERVAL)
+        self.feed.next_check_on = self.instant + timedelta(seconds=interval)
+        app.logger.debug("%s next check is due in %ds" % (self.feed.self_link, interval))
 
-        soup = feedparser.parse(data)
+    def schedule_retry(self):
+        '''
+        Push the next fetch attempt further out after each 
+          consecutive error, with some jitter
+        '''
+        exponent = min(max(self.feed.error_count - 1, 0), 16)
+        interval = min(BACKOFF_BASE_INTERVAL * 2 ** exponent, MAX_BACKOFF_INTERVAL)
+        interval *= random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)
+        self.feed.next_check_on = self.instant + timedelta(seconds=interval)
+        app.logger.debug("%s will be retried in %ds after %d error(s)" % (
+            self.feed.self_link, interval, self.feed.error_count))
+
+    def honour_cache_headers(self, response):
+        '''
+        Do not check the feed again before the server says 
+          its content could change or it is willing to serve us
+        '''
+        not_before = get_response_expiration(response.headers, self.instant)
+        if not not_before:
+            return
+        not_before = min(not_before, self.instant + timedelta(seconds=MAX_BACKOFF_INTERVAL))
+        if not self.feed.next_check_on or not_before > self.feed.next_check_on:
+            self.feed.next_check_on = not_before
+            app.logger.debug("%s next check deferred to %s as requested by server" % (
+                self.feed.self_link, not_before))
+
+    def update_feed_with_data(self, data, response_headers=None):
+        count = self._parse_feed(data, response_headers)
+        self.feed.body_hash = make_sha1_data_hash(data)
+        with write_lock():
+            self.schedule_next_check()
+            self.feed.save()
+        return count
+
+    def _parse_feed(self, data, response_headers=None):
+
+        # Feedparser looks up HTTP headers by lowercase name
+        response_headers = dict((k.lower(), v) for k, v in (response_headers or {}).items())
+        soup = feedparser.parse(data, response_headers=response_headers)
         # Got parsing error?
         if hasattr(soup, 'bozo') and soup.bozo:
             app.logger.debug(
@@ -231,11 +408,34 @@ class Fetcher(object):
         
         feed_author = get_feed_author(soup.feed)
 
-        new_entries = []
-        for entry_dict in soup.entries:
+        # Load hashes of the stored entries found in the document, so
+        #   unchanged entries are neither sanitized nor written again
+        guids = [get_entry_guid(entry_dict, default=get_entry_link(entry_dict)) for entry_dict in soup.entries]
+        stored_hashes = {}
+        for batch in chunked([make_sha1_hash(guid) for guid in guids if guid], INSERT_CHUNK_SIZE):
+            q = (Entry.select(Entry.guid_hash, Entry.content_hash)
+                 .where((Entry.feed == self.feed) & (Entry.guid_hash << batch))
+                 .tuples())
+            stored_hashes.update(q)
+
+        # Do not add back entries deleted by the prune command
+        retention_days = app.config.get('RETENTION_DAYS')
+        expired_on = self.instant - timedelta(days=retention_days) if retention_days else None
+        # Same for entries past the newest ones kept for each feed
+        retention_entries = app.config.get('RETENTION_ENTRIES')
+        kept_since = None
+        if retention_entries:
+            # None unless the feed already holds that many entries
+            kept_since = (Entry.select(Entry.published_on)
+                          .where(Entry.feed == self.feed)
+                          .order_by(Entry.published_on.desc())
+                          .offset(retention_entries - 1)
+                          .scalar())
+
+        new_entries, unchanged_count = [], 0
+        for entry_dict, guid in zip(soup.entries, guids):
 
             link = get_entry_link(entry_dict)
-            guid = get_entry_guid(entry_dict, default=link)
 
             # If an entry doesn't have a link nor a GUID we
             #   cannot uniquely identify it
@@ -245,56 +445,111 @@ class Fetcher(object):
                     % self.feed.self_link)
                 continue
 
-            timestamp = get_entry_timestamp(entry_dict, default=self.instant)
+            title = get_entry_title(entry_dict, default='Untitled')
+            author = get_entry_author(entry_dict) or feed_author
             content_type, content = get_entry_content(entry_dict, ('text/plain', ''))
+            # Hash raw values of the fields updated on conflict below
+            content_hash = make_sha1_hash('\0'.join([title, author, content_type, content]))
+            guid_hash = make_sha1_hash(guid)
+            if stored_hashes.get(guid_hash) == content_hash:
+                unchanged_count += 1
+                continue
+
+            timestamp = get_entry_timestamp(entry_dict, default=self.instant)
+            if expired_on and timestamp < expired_on:
+                continue
+            if kept_since and guid_hash not in stored_hashes and timestamp < kept_since:
+                continue
             thumbnail_url = get_entry_thumbnail_url(entry_dict)
 
             entry = {
                 'feed_id': self.feed.id,
                 'guid': guid,
+                'guid_hash': guid_hash,
                 'link': link,
-                'title': get_entry_title(entry_dict, default='Untitled'),
-                'author': get_entry_author(entry_dict) or feed_author,
-                'content': markup.parse_html(content),
+                'title': title,
+                'author': author,
                 'content_type': content_type,
+                'content_hash': content_hash,
                 'thumbnail_url': thumbnail_url,
-                'published_on': timestamp
+                'published_on': timestamp,
+                **Entry.encode_content(markup.parse_html(content))
             }
             new_entries.append(entry)
 
+        fetch_stats.incr('unchanged_entries', unchanged_count)
+        app.logger.debug(f"{unchanged_count} entries from {self.feed.self_link} are unchanged, skipped")
         
         count = 0
         engine = db_wrapper.get_engine()
-        with db_wrapper.database.atomic():
+        with write_lock(), db_wrapper.database.atomic():
             for batch in chunked(new_entries, INSERT_CHUNK_SIZE):
+                guid_hashes = [entry['guid_hash'] for entry in batch]
+                # Tell new entries from updated ones, for counters
+                stored_count = Entry.select().where(Entry.guid_hash << guid_hashes).count()
                 if engine in ['sqlite', 'postgres']:
                     count += (Entry.insert_many(batch).on_conflict(
-                        conflict_target=[Entry.guid],
+                        conflict_target=[Entry.guid_hash],
                         # Pass down these new values only for certain values
-                        preserve=[Entry.title, Entry.author, Entry.content, Entry.content_type])
+                        preserve=ENTRY_UPDATED_FIELDS,
+                        # Never overwrite a different entry on a hash collision
+                        where=(Entry.guid == EXCLUDED.guid))
                         .as_rowcount()
                         .execute())
                 else: 
-                    # MySQL doesn't support conflict targets, see:
+                    # MySQL doesn't support conflict targets nor where clauses, see:
                     # https://stackoverflow.com/questions/74691515/python-peewee-using-excluded-to-resolve-conflict-resolution
-                    count += (Entry.insert_many(batch).on_conflict(
-                        # Pass down these new values only for certain fields
-                        preserve=[Entry.title, Entry.author, Entry.content, Entry.content_type])
-                        .as_rowcount()
-                        .execute())
+                    # Pass down these new values only for certain fields,
+                    #   unless the stored entry is a different one
+                    update = {field: fn.IF(Entry.guid == fn.VALUES(Entry.guid), fn.VALUES(field), field)
+                              for field in ENTRY_UPDATED_FIELDS}
+                    count += (Entry.insert_many(batch).on_conflict(update=update)
+                              .as_rowcount()
+                              .execute())
+                counters.update_entry_counts([(self.feed.id, len(set(guid_hashes)) - stored_count)])
+                unread.add_entries((Entry.feed == self.feed) & (Entry.guid_hash << guid_hashes))
         
         app.logger.debug(f"added/updated {count} entries from {self.feed.self_link}")
         return count
 
     def _fetch_icon(self):
 
-        if not self.feed.icon or not self.feed.icon_last_updated_on or \
+        if not self.feed.icon_last_updated_on or \
            ((self.instant - self.feed.icon_last_updated_on).days > FETCH_ICONS_INTERVAL):
-            self.feed.icon = self._favicon_fetcher(self.feed.icon_url)
-            # If fetch is unsuccessful we'll retry to fetch after FETCH_ICONS_INTERVAL
-            self.feed.icon_last_updated_on = self.instant
+            self._update_icon()
 
-            app.logger.debug(f"fetched favicon at {self.feed.icon_url}")
+    def refresh_icon(self):
+        '''
+        Fetch the feed favicon again, regardless of its age
+        '''
+        self._update_icon()
+        with write_lock():
+            self.feed.save()
+
+    def _update_icon(self):
+        url = self.feed.icon_url
+        if not url:
+            return
+
+        # Feeds of the same site share the icon URL, so reuse
+        #   an icon recently fetched for one of them
+        fresh_on = self.instant - timedelta(days=FETCH_ICONS_INTERVAL)
+        sibling = (Feed.select(Feed.icon)
+                   .where((Feed.icon_url == url) &
+                          (Feed.id != self.feed.id) &
+                          Feed.icon.is_null(False) &
+                          (Feed.icon_last_updated_on > fresh_on))
+                   .first())
+        if sibling:
+            self.feed.icon = sibling.icon_id
+            app.logger.debug(f"reused favicon at {url}")
+        else:
+            icon = self._favicon_fetcher(url)
+            if icon:
+                self.feed.icon = icon
+                app.logger.debug(f"fetched favicon at {url}")
+        # If fetch is unsuccessful we'll retry to fetch after FETCH_ICONS_INTERVAL
+        self.feed.icon_last_updated_on = self.instant
 
     def _favicon_fetcher(self, url):
         '''
@@ -302,15 +557,18 @@ class Fetcher(object):
         '''
 
         try:
-            response = fetch_url(url)
+            response = fetch_url(url, max_size=MAX_ICON_SIZE)
         except RequestException as exc:
             app.logger.warning(
                 "could not fetch favicon for %s (%s)" % (url, exc))
-            # @@TODO: Endpoint should point to a default icon from static folder
-            return (Feed.DEFAULT_ICON, url)
+            return None
 
-        return make_data_uri(
-            response.headers['Content-Type'], response.content)
+        if response.status_code != 200 or not response.content:
+            app.logger.warning(
+                "could not fetch favicon for %s (status %d)" % (url, response.status_code))
+            return None
+
+        return store_icon(response.headers.get('Content-Type', 'image/x-icon'), response.content)
 
     def add_synthesized_entry(self, title, content_type, content):
         '''
@@ -325,13 +583,17 @@ class Fetcher(object):
         entry = Entry(
             feed=self.feed,
             guid=guid,
+            guid_hash=make_sha1_hash(guid),
             title=title,
             author='Coldsweat',
             content=content,
             content_type=content_type,
             published_on=self.instant
         )
-        entry.save()
+        with write_lock(), db_wrapper.database.atomic():
+            entry.save()
+            counters.update_entry_counts([(self.feed.id, 1)])
+            unread.add_entries(Entry.id == entry.id)
         app.logger.debug("synthesized entry %s" % guid)
         return entry
 
@@ -341,25 +603,36 @@ class Fetcher(object):
         return self.add_synthesized_entry(title, 'text/html', content)
 
 
-def fetch_url(url, timeout=10, etag=None, modified_since=None):
+def fetch_url(url, timeout=10, etag=None, modified_since=None, max_size=None):
     '''
-    Fecth a given URL optionally issuing a 'Conditional GET' request
+    Fecth a given URL optionally issuing a 'Conditional GET' request. 
+      The response body is streamed and read at most up to max_size bytes
     '''
 
-    request_headers = {
-        'User-Agent': USER_AGENT
-    }
+    request_headers = {}
 
-    # Conditional GET headers
-    if etag and modified_since:
+    # Conditional GET headers, each validator is sent on its own
+    if etag:
+        request_headers['If-None-Match'] = etag
+    if modified_since:
+        # Prefer to echo back the server Last-Modified value verbatim
+        if isinstance(modified_since, datetime):
+            modified_since = format_http_datetime(modified_since)
+        request_headers['If-Modified-Since'] = modified_since
+    if request_headers:
         app.logger.debug(
             "fetching %s with a conditional GET (%s %s)" %
-            (url, etag, format_http_datetime(modified_since)))
-        request_headers['If-None-Match'] = etag
-        request_headers['If-Modified-Since'] = format_http_datetime(
-            modified_since)
+            (url, etag, modified_since))
     try:
-        response = requests.get(url, timeout=timeout, headers=request_headers)
+        with host_limiter.slot(get_host(url)):
+            response = get_session().get(url, timeout=timeout, headers=request_headers, stream=True)
+            try:
+                _read_content(response,
+                              max_size or app.config.get('MAX_FETCH_SIZE', MAX_FETCH_SIZE),
+                              app.config.get('FETCH_DEADLINE', FETCH_DEADLINE))
+            finally:
+                # Release the connection to the pool, or drop it if body was not fully read
+                response.close()
     except RequestException as exc:
         app.logger.debug(
             "tried to fetch %s but got %s" % (url, exc.__class__.__name__))
@@ -367,6 +640,187 @@ def fetch_url(url, timeout=10, etag=None, modified_since=None):
     return response
 
 
+def _read_content(response, max_size, deadline):
+    '''
+    Read a streamed response body into response.content, 
+      giving up on oversized or slowly trickling downloads
+    '''
+    content_length = response.headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise ContentTooLarge(f"declared size {content_length} exceeds {max_size} bytes", response=response)
+
+    # A read blocks until a whole chunk arrives, so a watchdog closes
+    #   the connection of servers still sending past the deadline
+    expired = threading.Event()
+
+    def expire():
+        expired.set()
+        # Closing the socket alone does not wake up a blocked read
+        sock = getattr(getattr(response.raw, '_connection', None), 'sock', None)
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        response.close()
+
+    watchdog = threading.Timer(deadline, expire)
+    watchdog.daemon = True
+    watchdog.start()
+    chunks, size = [], 0
+    try:
+        for chunk in response.iter_content(FETCH_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_size:
+                raise ContentTooLarge(f"body exceeds {max_size} bytes", response=response)
+            chunks.append(chunk)
+    except Exception:
+        if not expired.is_set():
+            raise
+    finally:
+        watchdog.cancel()
+    if expired.is_set():
+        raise ReadTimeout(f"body not received within {deadline} seconds", response=response)
+    # Same as Requests does when reading the whole body at once
+    response._content = b''.join(chunks)
+
+
+# ------------------------------------------------------
+# Shared HTTP session
+# ------------------------------------------------------
+
+class FetchStats(object):
+    '''
+    Thread-safe counters collected during a fetch run
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = Counter()
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    def reset(self):
+        with self._lock:
+            self.counters = Counter()
+
+    def __getitem__(self, name):
+        return self.counters[name]
+
+
+fetch_stats = FetchStats()
+
+
+class _CountingPoolMixin(object):
+    '''
+    Tell apart requests sent on a fresh connection from 
+      the ones which reused a kept-alive connection
+    '''
+
+    def _make_request(self, conn, *args, **kwargs):
+        if getattr(conn, 'sock', None) is None:
+            fetch_stats.incr('new_connections')
+        else:
+            fetch_stats.incr('reused_connections')
+        return super()._make_request(conn, *args, **kwargs)
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _PooledAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+
+
+class HostLimiter(object):
+    '''
+    Bound concurrent requests and request rate per host, and keep 
+      track of hosts which asked us to back off
+    '''
+
+    def __init__(self, max_connections=HOST_MAX_CONNECTIONS, min_interval=HOST_MIN_INTERVAL):
+        self.max_connections = max_connections
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_request_at = {}
+        self._blocked_until = {}
+
+    @contextlib.contextmanager
+    def slot(self, host):
+        '''
+        Wait for a free connection slot on host and for
+          its minimum interval between requests to elapse
+        '''
+        start = time.monotonic()
+        with self._lock:
+            semaphore = self._semaphores.setdefault(
+                host, threading.BoundedSemaphore(self.max_connections))
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                request_at = max(self._next_request_at.get(host, now), now)
+                self._next_request_at[host] = request_at + self.min_interval
+            if request_at > now:
+                time.sleep(request_at - now)
+            waited = time.monotonic() - start
+            if waited > 0.001:
+                fetch_stats.incr('host_waits')
+                fetch_stats.incr('host_wait_ms', int(waited * 1000))
+            yield
+
+    def block(self, host, until):
+        with self._lock:
+            self._blocked_until[host] = max(until, self._blocked_until.get(host, until))
+
+    def blocked_until(self, host, now):
+        with self._lock:
+            until = self._blocked_until.get(host)
+        return until if until and until > now else None
+
+
+host_limiter = HostLimiter()
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    '''
+    Return the process-wide HTTP session. Connections are kept alive
+      and pooled per host, so feeds and favicons served by the same
+      host share them
+    '''
+    global _session
+    with _session_lock:
+        if not _session:
+            session = requests.Session()
+            adapter = _PooledAdapter(pool_connections=POOL_CONNECTIONS,
+                                     pool_maxsize=POOL_MAXSIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Encoding': 'gzip, deflate',
+            })
+            _session = session
+    return _session
+
+
 # ------------------------------------------------------
 # Helpers
 # ------------------------------------------------------
@@ -374,6 +828,77 @@ def fetch_url(url, timeout=10, etag=None, modified_since=None):
 IMAGE_TYPES = ['image/jpeg', 'image/png', 'image/gif']
 
 
+def _parse_http_datetime(value):
+    value = http.parse_date(value)
+    if value:
+        # Deal with naive UTC datetimes like the rest of the code
+        return value.replace(tzinfo=None) - (value.utcoffset() or timedelta(0))
+    return None
+
+
+def store_icon(content_type, data):
+    '''
+    Save icon image, unless an identical one is already stored
+    '''
+    data_hash = make_sha1_data_hash(data)
+    with write_lock():
+        Icon.insert(data_hash=data_hash, content_type=content_type, data=data).on_conflict_ignore().execute()
+    return Icon.get(Icon.data_hash == data_hash)
+
+
+def get_host(url):
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+def defer_host_feeds(host, until):
+    '''
+    Postpone checks of all enabled feeds on host until given time
+    '''
+    q = Feed.update(next_check_on=until).where(
+        (Feed.self_link.startswith(f'http://{host}/') |
+         Feed.self_link.startswith(f'https://{host}/')) &
+        (Feed.enabled == True) &  # noqa
+        (Feed.next_check_on.is_null() | (Feed.next_check_on < until)))
+    return q.execute()
+
+
+def get_retry_after(headers, default):
+    '''
+    Return the Retry-After header value as a datetime, or None. 
+      Delays in seconds are computed from default
+    '''
+    retry_after = headers.get('Retry-After', '').strip()
+    if retry_after.isdigit():
+        return default + timedelta(seconds=int(retry_after))
+    elif retry_after:
+        return _parse_http_datetime(retry_after)
+    return None
+
+
+def get_response_expiration(headers, default):
+    '''
+    Return when the server allows to request a resource again 
+      according to Retry-After, Cache-Control max-age and Expires 
+      headers, or None. Relative values are computed from default
+    '''
+    candidates = [get_retry_after(headers, default)]
+
+    cache_control = http.parse_cache_control_header(headers.get('Cache-Control'))
+    if cache_control.no_cache or cache_control.no_store:
+        pass
+    elif cache_control.max_age is not None:
+        # Discount time the response already spent in caches
+        age = headers.get('Age', '')
+        age = int(age) if age.isdigit() else 0
+        candidates.append(default + timedelta(seconds=max(cache_control.max_age - age, 0)))
+    elif 'Expires' in headers:
+        # Max-age takes precedence over Expires
+        candidates.append(_parse_http_datetime(headers['Expires']))
+
+    candidates = [c for c in candidates if c]
+    return max(candidates) if candidates else None
+
+
 def get_feed_generator(feed_dict):
     value = feed_dict.get('generator', '')
     if 'Mastodon' in value:
@@ -529,5 +1054,23 @@ class DuplicatedFeed(exceptions.HTTPException):
     code = 900
     description = 'Feed address matches another already present in the database'
 
+class FeedTooLarge(exceptions.HTTPException):
+    code = 901
+    description = 'Feed exceeds the maximum allowed size'
+
+
+class FetchDeferred(Exception):
+    '''
+    Feed check has been postponed on server request
+    '''
+
+
+class ContentTooLarge(RequestException):
+    '''
+    Response body exceeds the maximum allowed size
+    '''
+
+
 # Update Werkzeug status codes map
 http.HTTP_STATUS_CODES[DuplicatedFeed.code] = "Duplicated feed"
+http.HTTP_STATUS_CODES[FeedTooLarge.code] = "Feed too large"
@@ -1,20 +1,24 @@
 import re
 from collections import defaultdict
 from datetime import datetime, timedelta
-from peewee import fn, IntegrityError
+from peewee import chunked, fn
 import flask
 from . import bp
 from flask import current_app as app
 from ..utilities import datetime_as_epoch
 import coldsweat.feed as feed
 import coldsweat.models as models
+import coldsweat.unread as unread
+import coldsweat.counters as counters
 from ..models import (
-    User, Feed, Group, Entry, Read, Saved, Subscription)
+    User, Feed, Group, Icon, Entry, Read, Unread, Saved, Subscription)
 
 MAX_ENTRIES = 50  # As per Fever API
 RE_DIGITS = re.compile('[0-9]+')
 RECENTLY_READ_DELTA = 600  # 10 minutes
 API_VERSION = 3
+QUERY_CHUNK_SIZE = 500  # SQLite has a limit of total 999 max variables
+DEFAULT_FAVICON_ID = 0  # Feeds without an icon of their own
 
 
 @bp.route('/fever', strict_slashes=False, methods=['POST', 'GET'])
@@ -68,7 +72,7 @@ def feeds_command(user, result):
     q = feed.get_feeds(user)
     result['feeds'] = [{
         'id': feed.id,
-        'favicon_id': feed.id,
+        'favicon_id': feed.icon_id or DEFAULT_FAVICON_ID,
         'title': feed.title,
         'url': feed.self_link,
         'site_url': feed.alternate_link,
@@ -79,28 +83,54 @@ def feeds_command(user, result):
 
 
 def unread_item_ids_command(user, result):
-    q = feed.get_unread_entries(user, Entry.id).objects()
-    ids = [r.id for r in q]
-    result['unread_item_ids'] = ','.join(map(str, ids))
+    q = (Unread.select(Unread.entry)
+         .where(Unread.user == user)
+         .order_by(Unread.entry)
+         .tuples())
+    result['unread_item_ids'] = ','.join(str(entry_id) for entry_id, in q)
 
 
 def saved_item_ids_command(user, result):
-    q = feed.get_saved_entries(user, Entry.id).objects()
-    ids = [r.id for r in q]
-    result['saved_item_ids'] = ','.join(map(str, ids))
-
-
-def favicons_command(_, result):
-    q = Feed.select()
-    result['favicons'] = [{
-        'id': feed.id,
-        'data': feed.icon_or_default
-    } for feed in q]
+    subscribed = Subscription.select().where(
+        (Subscription.feed == Entry.feed) & (Subscription.user == user))
+    q = (Saved.select(Saved.entry)
+         .join(Entry)
+         .where((Saved.user == user) & fn.EXISTS(subscribed))
+         .order_by(Saved.entry)
+         .tuples())
+    result['saved_item_ids'] = ','.join(str(entry_id) for entry_id, in q)
+
+
+def favicons_command(user, result):
+    # Feeds of the same site share their icon
+    q = (Icon.select(Icon.id, Icon.data_hash)
+         .join(Feed)
+         .join(Subscription)
+         .where(Subscription.user == user)
+         .distinct())
+    favicons = [{
+        'id': DEFAULT_FAVICON_ID,
+        'data': Feed.DEFAULT_ICON
+    }]
+    # Load image data only for icons not encoded yet
+    missing_ids = []
+    for icon in q:
+        data_uri = Icon.get_cached_data_uri(icon.data_hash)
+        if data_uri:
+            favicons.append({'id': icon.id, 'data': data_uri})
+        else:
+            missing_ids.append(icon.id)
+    for ids in chunked(missing_ids, QUERY_CHUNK_SIZE):
+        favicons.extend({
+            'id': icon.id,
+            'data': icon.data_uri
+        } for icon in Icon.select().where(Icon.id << ids))
+    result['favicons'] = favicons
 
 
 def items_command(user, result):
 
-    result['total_items'] = feed.get_all_entries(user, Entry.id).count()
+    result['total_items'] = counters.get_entry_count(user)
     # From the API: "Use the since_id argument with the highest id
     #  of locally cached items to request 50 additional items.
     if 'since_id' in flask.request.args:
@@ -133,15 +163,18 @@ def items_command(user, result):
         return
 
     # Unfiltered results, but still bound to MAX_ENTRIES, since we don't want to
-    #   bog down the server returning an arbitrary long list of entries
-    result['items'] = get_entries(user)
+    #   bog down the server returning an arbitrary long list of entries.
+    #   Start from the oldest ones, as with since_id=0
+    result['items'] = get_entries_min(user, 0)
 
 
 def unread_recently_read_command(user, result):
     since = datetime.utcnow() - timedelta(seconds=RECENTLY_READ_DELTA)
-    q = Read.delete().where((Read.user == user
-                             ) & (Read.read_on > since))
-    count = q.execute()
+    recently_read = (Read.user == user) & (Read.read_on > since)
+    with models.db_wrapper.database.atomic():
+        entry_ids = [entry_id for entry_id, in Read.select(Read.entry).where(recently_read).tuples()]
+        count = Read.delete().where(recently_read).execute()
+        unread.add_entries(Entry.id << entry_ids, user)
     app.logger.debug('%d entries marked as unread' % count)
 
 
@@ -164,46 +197,15 @@ def mark_command(user, result):
             app.logger.debug('could not find entry %d, ignored' % object_id)
             flask.abort(404)
 
-        if status == 'read':
-            try:
-                Read.create(user=user, entry=entry)
-            except IntegrityError:
-                app.logger.debug(
-                    'entry %d already marked as read, ignored' %
-                    object_id)
-                return
         # Strangely enough 'unread' is not mentioned in
         #  the Fever API, but Reeder app asks for it
-        elif status == 'unread':
-            count = Read.delete().where(
-                (Read.user == user) & (Read.entry == entry)).execute()
-            if not count:
-                app.logger.debug(
-                    'entry %d never marked as read, ignored' % object_id)
-                return
-        elif status == 'saved':
-            try:
-                Saved.create(user=user, entry=entry)
-            except IntegrityError:
-                app.logger.debug('entry %d already marked as saved, ignored'
-                                 % object_id)
-                return
-        elif status == 'unsaved':
-            count = Saved.delete().where((
-                Saved.user == user) & (
-                Saved.entry == entry)).execute()
-            if not count:
-                app.logger.debug(
-                    u'entry %d never marked as saved, ignored' % object_id)
-                return
-
-        app.logger.debug('marked entry %d as %s' % (object_id, status))
+        feed.mark_entry(user, entry, status)
 
     elif mark == 'feed' and status == 'read':
 
         try:
             # Sanity check
-            feed = Feed.get(Feed.id == object_id)
+            feed_ = Feed.get(Feed.id == object_id)
         except Feed.DoesNotExist:
             app.logger.debug('could not find feed %d, ignored' % object_id)
             flask.abort(404)
@@ -216,27 +218,7 @@ def mark_command(user, result):
                 'missing or invalid parameter (%s), ignored' % ex)
             flask.abort(400)
 
-        q = Entry.select(Entry).join(Feed).join(Subscription).where(
-            (Subscription.user == user) &
-            (Subscription.feed == feed) &
-            # Exclude entries already marked as read
-            ~(Entry.id << Read.select(Read.entry).where(
-                Read.user == user)) &
-            # Exclude entries fetched after last sync
-            (Entry.published_on < before)
-        ).distinct().objects()
-
-        with models.db_wrapper.database.transaction():
-            for entry in q:
-                try:
-                    Read.create(user=user, entry=entry)
-                except IntegrityError:
-                    # Should not happen,
-                    # due to the query above, log as warning
-                    app.logger.warning(
-                        'entry %d already marked as read, ignored'
-                        % entry.id)
-                    continue
+        feed.mark_entries_as_read(user, before, feed=feed_)
 
         app.logger.debug('marked feed %d as %s' % (object_id, status))
 
@@ -252,14 +234,7 @@ def mark_command(user, result):
 
         # Mark all as read?
         if object_id == 0:
-            q = Entry.select(Entry).join(Feed).join(Subscription).where(
-                (Subscription.user == user) &
-                # Exclude entries already marked as read
-                ~(Entry.id << Read.select(Read.entry).where(
-                    Read.user == user)) &
-                # Exclude entries fetched after last sync
-                (Entry.published_on < before)
-            ).distinct().objects()
+            group = None
         else:
             try:
                 group = Group.get(Group.id == object_id)
@@ -268,28 +243,7 @@ def mark_command(user, result):
                     'could not find group %d, ignored' % object_id)
                 flask.abort(404)
 
-            q = Entry.select(Entry).join(Feed).join(
-                Subscription).where(
-                (Subscription.user == user) &
-                (Subscription.group == group) &
-                # Exclude entries already marked as read
-                ~(Entry.id << Read.select(
-                    Read.entry).where(Read.user == user)) &
-                # Exclude entries fetched after last sync
-                (Entry.published_on < before)
-            ).distinct().objects()
-
-        with models.db_wrapper.database.transaction():
-            for entry in q:
-                try:
-                    Read.create(user=user, entry=entry)
-                except IntegrityError:
-                    # Should not happen thanks to the query above,
-                    # log as warning
-                    app.logger.warn(
-                        'entry %d already marked as read, ignored'
-                        % entry.id)
-                    continue
+        feed.mark_entries_as_read(user, before, group=group)
 
         app.logger.debug('marked group %d as %s' % (object_id, status))
 
@@ -336,14 +290,11 @@ def get_feed_groups(user):
 
 def _get_entries(user, q):
 
-    r = Entry.select(Entry.id).join(Read).where(Read.user == user).objects()
-    s = Entry.select(Entry.id).join(Saved).where(Saved.user == user).objects()
-
-    read_ids = dict((i.id, None) for i in r)
-    saved_ids = dict((i.id, None) for i in s)
+    entries = list(q)
+    read_ids, saved_ids = feed.get_read_and_saved_ids(user, entries)
 
     result = []
-    for entry in q:
+    for entry in entries:
         result.append({
             'id': entry.id,
             'feed_id': entry.feed.id,
@@ -358,32 +309,38 @@ def _get_entries(user, q):
     return result
 
 
-def get_entries(user, ids=None, bound=MAX_ENTRIES):
+def _get_user_entries(user):
+    '''
+    Entries of feeds the user is subscribed to. Test subscriptions with
+      EXISTS rather than a join, so no DISTINCT is needed and entries
+      can be walked in primary key order
+    '''
+    subscribed = Subscription.select().where(
+        (Subscription.feed == Entry.feed) & (Subscription.user == user))
+    return Entry.select(Entry, Feed).join(Feed).where(fn.EXISTS(subscribed))
 
-    if ids:
-        where_clause = (Subscription.user == user) & (Entry.id << ids)
-    else:
-        where_clause = (Subscription.user == user)
 
-    q = Entry.select(Entry,
-                     Feed).join(Feed).join(
-        Subscription).where(where_clause).distinct().limit(bound)
+def get_entries(user, ids, bound=MAX_ENTRIES):
+    q = (_get_user_entries(user)
+         .where(Entry.id << ids)
+         .order_by(Entry.id)
+         .limit(bound))
     return _get_entries(user, q)
 
 
 def get_entries_min(user, min_id, bound=MAX_ENTRIES):
-    q = Entry.select(Entry, Feed).join(
-        Feed).join(Subscription).where((Subscription.user == user) &
-                                       (Entry.id > min_id
-                                        )).distinct().limit(bound)
+    q = (_get_user_entries(user)
+         .where(Entry.id > min_id)
+         .order_by(Entry.id)
+         .limit(bound))
     return _get_entries(user, q)
 
 
 def get_entries_max(user, max_id, bound=MAX_ENTRIES):
-    q = Entry.select(Entry,
-                     Feed).join(Feed).join(Subscription).where(
-        (Subscription.user == user) &
-        (Entry.id < max_id)).distinct().limit(bound)
+    q = (_get_user_entries(user)
+         .where(Entry.id < max_id)
+         .order_by(Entry.id.desc())
+         .limit(bound))
     return _get_entries(user, q)
 
 
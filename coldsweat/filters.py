@@ -2,61 +2,64 @@
 Custom Jinja Filters
 '''
 
-from flask import current_app as app
+from flask import Blueprint, url_for
 from werkzeug import http
 from . import utilities
 
+# Register filters with every app, not just the first one created
+bp = Blueprint('filters', __name__)
 
-@app.template_filter('friendly_url')
+
+@bp.app_template_filter('friendly_url')
 def friendly_url(value):
     if value:
         return utilities.friendly_url(value)
     return ''
 
 
-@app.template_filter('datetime')
+@bp.app_template_filter('datetime')
 def datetime(value):
     if value:
         return utilities.format_datetime(value)
     return '—'
 
 
-@app.template_filter('iso_datetime')
+@bp.app_template_filter('iso_datetime')
 def iso_datetime(value):
     if value:
         return utilities.format_iso_datetime(value)
     return ''
 
 
-@app.template_filter('date')
+@bp.app_template_filter('date')
 def date(value):
     if value:
         return utilities.format_date(value)
     return '—'
 
 
-@app.template_filter('since')
+@bp.app_template_filter('since')
 def datetime_since(value):
     if value:
         return utilities.datetime_since(value)
     return '—'
 
 
-@app.template_filter('since_today')
+@bp.app_template_filter('since_today')
 def datetime_since_today(value):
     if value:
         return utilities.datetime_since_today(value)
     return '—'
 
 
-@app.template_filter('epoch')
+@bp.app_template_filter('epoch')
 def epoch(value):
     if value:
         return utilities.datetime_as_epoch(value)
     return '—'
 
 
-@app.template_filter('status_title')
+@bp.app_template_filter('status_title')
 def status_title(code):
     title = 'Unknown (%s)' % code
     try:
@@ -64,3 +67,10 @@ def status_title(code):
     except KeyError:
         pass
     return title
+
+
+@bp.app_template_filter('favicon_url')
+def favicon_url(feed):
+    if feed.icon_id:
+        return url_for('main.favicon', icon_id=feed.icon_id)
+    return feed.DEFAULT_ICON
@@ -0,0 +1,266 @@
+'''
+Background jobs queue
+
+Jobs live in the database, so several workers, possibly running on
+  different hosts, can share them. A worker claims a job by taking a
+  lease on it; leases of crashed workers expire and their jobs become
+  available again
+'''
+
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from flask import current_app as app
+from peewee import Value, fn
+from .models import (Feed, Job, Subscription, db_wrapper)
+from .fetcher import (Fetcher, write_lock, DEFAULT_FETCH_INTERVAL, FETCH_ICONS_INTERVAL)
+import coldsweat.feed as feed
+
+__all__ = [
+    'FETCH_FEED',
+    'FETCH_ICON',
+    'REMOVE_FEED',
+    'enqueue',
+    'sync_jobs',
+    'claim_job',
+    'run_job',
+    'complete_job',
+    'fail_job',
+    'recover_expired_leases',
+    'count_due_jobs',
+    'make_worker_id',
+]
+
+FETCH_FEED = 'fetch_feed'
+FETCH_ICON = 'fetch_icon'
+REMOVE_FEED = 'remove_feed'
+
+LEASE_DURATION = 60*10  # Seconds, well above the time needed to fetch a feed
+JOB_RETRY_INTERVAL = 60*5  # Seconds, delay after the first failed attempt
+MAX_JOB_ATTEMPTS = 5
+
+JOB_HANDLERS = {}
+
+
+def job_handler(kind):
+    '''
+    Register a function running jobs of the given kind. It returns when the
+      job should run again, or None if the job is done and can be dropped
+    '''
+    def decorator(func):
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+def make_worker_id():
+    return '%s:%d:%s' % (socket.gethostname(), os.getpid(), threading.current_thread().name)
+
+
+def enqueue(kind, feed=None, payload='', run_after=None):
+    '''
+    Add a job to the queue. A job of the same kind already
+      queued for the feed is moved to the new time instead
+    '''
+    run_after = run_after or datetime.utcnow()
+    with write_lock():
+        count = (Job.insert(kind=kind, feed=feed, payload=payload, run_after=run_after)
+                 .on_conflict_ignore()
+                 .as_rowcount()
+                 .execute())
+        if not count and feed:
+            # Leave alone jobs currently in progress
+            (Job.update(run_after=run_after, payload=payload)
+             .where((Job.kind == kind) & (Job.feed == feed) & Job.locked_until.is_null())
+             .execute())
+
+
+def sync_jobs():
+    '''
+    Make sure every enabled feed with at least one subscription has
+      its fetch job queued and stale favicons get refreshed
+    '''
+    now = datetime.utcnow()
+    active_feeds = (Feed.select(Feed.id)
+                    .join(Subscription)
+                    .where(Feed.enabled == True))  # noqa
+
+    with write_lock():
+        # Drop jobs for disabled or no longer subscribed feeds
+        removed_count = (Job.delete()
+                         .where((Job.kind == FETCH_FEED) &
+                                Job.locked_until.is_null() &
+                                ~(Job.feed << active_feeds))
+                         .execute())
+
+        q = (Feed.select(Value(FETCH_FEED), Feed.id, Value(''),
+                         fn.COALESCE(Feed.next_check_on, now), Value(0), Value(''))
+             .join(Subscription)
+             .where(Feed.enabled == True)  # noqa
+             .distinct())
+        added_count = (Job.insert_from(q, [Job.kind, Job.feed, Job.payload,
+                                           Job.run_after, Job.attempts, Job.worker_id])
+                       .on_conflict_ignore()
+                       .as_rowcount()
+                       .execute())
+
+        stale_on = now - timedelta(days=FETCH_ICONS_INTERVAL)
+        q = (Feed.select(Value(FETCH_ICON), Feed.id, Value(''), Value(now), Value(0), Value(''))
+             .join(Subscription)
+             .where((Feed.enabled == True) &  # noqa
+                    (Feed.icon_url != '') &
+                    (Feed.icon_last_updated_on.is_null() | (Feed.icon_last_updated_on < stale_on)))
+             .distinct())
+        (Job.insert_from(q, [Job.kind, Job.feed, Job.payload,
+                             Job.run_after, Job.attempts, Job.worker_id])
+         .on_conflict_ignore()
+         .execute())
+
+    app.logger.debug("jobs synced: %d fetch jobs added, %d removed" % (added_count, removed_count))
+
+
+def _claimable(now):
+    return (Job.run_after <= now) & (Job.locked_until.is_null() | (Job.locked_until < now))
+
+
+def claim_job(worker_id):
+    '''
+    Lease the next due job to the given worker, return None if no job is due
+    '''
+    now = datetime.utcnow()
+    lease = now + timedelta(seconds=LEASE_DURATION)
+
+    if db_wrapper.get_engine() == 'sqlite':
+        # SQLite has no row locks but allows a single writer at time,
+        #   so pick and lease the job with just one UPDATE statement
+        next_job = (Job.select(Job.id)
+                    .where(_claimable(now))
+                    .order_by(Job.run_after)
+                    .limit(1))
+        with write_lock():
+            count = (Job.update(worker_id=worker_id, locked_until=lease, attempts=Job.attempts + 1)
+                     .where((Job.id << next_job) & _claimable(now))
+                     .execute())
+        if not count:
+            return None
+        return Job.get_or_none((Job.worker_id == worker_id) & (Job.locked_until == lease))
+
+    with db_wrapper.database.atomic():
+        # Other workers skip the row we are locking, instead of waiting for it
+        job = (Job.select()
+               .where(_claimable(now))
+               .order_by(Job.run_after)
+               .for_update('FOR UPDATE SKIP LOCKED')
+               .first())
+        if not job:
+            return None
+        job.worker_id = worker_id
+        job.locked_until = lease
+        job.attempts += 1
+        job.save()
+    return job
+
+
+def run_job(job):
+    '''
+    Run a claimed job and release it
+    '''
+    handler = JOB_HANDLERS.get(job.kind)
+    if not handler:
+        app.logger.warning("unknown job kind %s, dropped" % job.kind)
+        complete_job(job)
+        return
+
+    try:
+        run_after = handler(job)
+    except Exception:
+        app.logger.exception("unexpected error while running %s job %d" % (job.kind, job.id))
+        fail_job(job)
+        return
+
+    complete_job(job, run_after)
+
+
+def complete_job(job, run_after=None):
+    '''
+    Drop a job or put it back in queue for a later run. Nothing happens if
+      meanwhile the lease expired and the job has been claimed by someone else
+    '''
+    leased = (Job.id == job.id) & (Job.worker_id == job.worker_id)
+    with write_lock():
+        if run_after:
+            (Job.update(run_after=run_after, attempts=0, worker_id='', locked_until=None)
+             .where(leased)
+             .execute())
+        else:
+            Job.delete().where(leased).execute()
+
+
+def fail_job(job):
+    '''
+    Retry a failed job later, giving up after too many attempts
+    '''
+    leased = (Job.id == job.id) & (Job.worker_id == job.worker_id)
+    with write_lock():
+        if job.attempts >= MAX_JOB_ATTEMPTS:
+            app.logger.warning("%s job %d failed %d times, dropped" % (job.kind, job.id, job.attempts))
+            Job.delete().where(leased).execute()
+            return
+        run_after = datetime.utcnow() + timedelta(seconds=JOB_RETRY_INTERVAL * 2 ** (job.attempts - 1))
+        (Job.update(run_after=run_after, worker_id='', locked_until=None)
+         .where(leased)
+         .execute())
+
+
+def recover_expired_leases():
+    '''
+    Release jobs held by workers which went away without completing them
+    '''
+    with write_lock():
+        count = (Job.update(worker_id='', locked_until=None)
+                 .where(Job.locked_until < datetime.utcnow())
+                 .execute())
+    if count:
+        app.logger.warning("recovered %d jobs with expired leases" % count)
+    return count
+
+
+def count_due_jobs():
+    return Job.select().where(_claimable(datetime.utcnow())).count()
+
+# ------------------------------------------------------
+# Job handlers
+# ------------------------------------------------------
+
+
+@job_handler(FETCH_FEED)
+def fetch_feed_job(job):
+    # Load a fresh copy, it could have been changed meanwhile
+    feed_ = Feed.get_or_none(Feed.id == job.feed_id)
+    if not feed_ or not feed_.enabled:
+        return None
+
+    feed.feed_worker(feed_)
+
+    now, next_check_on = datetime.utcnow(), feed_.next_check_on
+    # Do not spin on feeds which could not be scheduled
+    if not next_check_on or next_check_on <= now:
+        next_check_on = now + timedelta(seconds=DEFAULT_FETCH_INTERVAL)
+    return next_check_on
+
+
+@job_handler(FETCH_ICON)
+def fetch_icon_job(job):
+    feed_ = Feed.get_or_none(Feed.id == job.feed_id)
+    if feed_:
+        Fetcher(feed_).refresh_icon()
+    return None
+
+
+@job_handler(REMOVE_FEED)
+def remove_feed_job(job):
+    feed_ = Feed.get_or_none(Feed.id == job.feed_id)
+    if feed_:
+        feed.remove_feed(feed_)
+    return None
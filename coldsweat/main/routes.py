@@ -1,14 +1,13 @@
-from datetime import datetime
 import flask
 import flask_login
-from flask import current_app as app
-from peewee import IntegrityError
+from peewee import fn
 from playhouse.flask_utils import get_object_or_404
 from requests.exceptions import RequestException
-from ..models import (User, Feed, Group, Subscription, Entry, Read, Saved)
-import coldsweat.models as models
+from ..models import (User, Feed, Group, Icon, Subscription, Entry)
+import coldsweat.counters as counters
 import coldsweat.feed as feed
 import coldsweat.fetcher as fetcher
+import coldsweat.jobs as jobs
 import coldsweat.markup as markup
 from . import bp
 import coldsweat.utilities as utilities
@@ -16,6 +15,7 @@ import coldsweat.utilities as utilities
 ENTRIES_PER_PAGE = 30
 FEEDS_PER_PAGE = 60
 GROUPS_PER_PAGE = 30
+FAVICON_MAX_AGE = 60*60*24*365  # Seconds, stored icons never change
 
 
 @bp.route('/')
@@ -32,12 +32,20 @@ def entry_list():
         unread, saved, group or feed
     '''
     offset = flask.request.args.get('offset', 0, type=int)
-    query, view_variables = _make_view_variables(flask_login.current_user.db_user)
+    user = flask_login.current_user.db_user
+    query, view_variables = _make_view_variables(user)
+
+    entries = list(query.order_by(
+        Entry.published_on.desc()
+    ).offset(offset).limit(ENTRIES_PER_PAGE))
+    read_ids, saved_ids = feed.get_read_and_saved_ids(user, entries)
 
     view_variables.update({
-        'entries': query.order_by(
-            Entry.published_on.desc()
-        ).offset(offset).limit(ENTRIES_PER_PAGE),
+        'entries': entries,
+        # Entries fetched after the page load are not marked as read
+        'max_id': Entry.select(fn.MAX(Entry.id)).scalar() or 0,
+        'read_ids': read_ids,
+        'saved_ids': saved_ids,
         'offset': offset + ENTRIES_PER_PAGE,
         'prev_date': flask.request.args.get('prev_date', None),
         'is_xhr': flask.request.args.get('xhr', 0, type=int)
@@ -55,13 +63,16 @@ def entry(entry_id):
 
     feed.mark_entry(user, entry, 'read')
     query, view_variables = _make_view_variables(user)
-    n = query.where(Entry.published_on < entry.published_on).order_by(
-        Entry.published_on.desc()).limit(1)
+    n = list(query.where(Entry.published_on < entry.published_on).order_by(
+        Entry.published_on.desc()).limit(1))
+    read_ids, saved_ids = feed.get_read_and_saved_ids(user, [entry] + n)
 
     view_variables.update({
         'entry': entry,
         'page_title': entry.title,
         'next_entries': n,
+        'read_ids': read_ids,
+        'saved_ids': saved_ids,
         'count': 0  # Fake it
     })
 
@@ -95,7 +106,7 @@ def feed_list():
 
     offset = flask.request.args.get('offset', 0, type=int)
     user = flask_login.current_user.db_user
-    max_errors = 100
+    max_errors = fetcher.MAX_FETCH_ERRORS
     groups = feed.get_groups(user)
     count, query = feed.get_feeds(user, Feed.id).count(), feed.get_feeds(user)
     feeds = query.order_by(Feed.title).offset(offset).limit(FEEDS_PER_PAGE)
@@ -133,57 +144,30 @@ def entry_list_mark():
     feed_id = flask.request.args.get('feed', 0, type=int)
 
     if flask.request.method == 'GET':
-        now = datetime.utcnow()
+        max_id = flask.request.args.get('max_id', 0, type=int)
         return flask.render_template('main/_entries_mark_%s_read.html' % ('feed' if feed_id else 'all'), **locals())
 
     # Handle postback
-    try:
-        before = datetime.utcfromtimestamp(flask.request.form.get('before', type=int))
-    except (KeyError, ValueError):
-        flask.abort(400, 'Missing parameter before=time')
+    max_id = flask.request.form.get('max_id', type=int)
+    if not max_id:
+        flask.abort(400, 'Missing parameter max_id=id')
 
     user = flask_login.current_user.db_user
 
     if feed_id:
         try:
-            feed = Feed.get((Feed.id == feed_id))
+            feed_ = Feed.get((Feed.id == feed_id))
         except Feed.DoesNotExist:
             flask.abort(404, f'No such feed {feed_id}')
 
-        q = Entry.select(Entry).join(Feed).join(Subscription).where(
-            (Subscription.user == user) &
-            # Exclude entries already marked as read
-            ~(Entry.id << Read.select(Read.entry).where(
-                Read.user == user)) &
-            # Filter by current feed
-            (Entry.feed == feed) &
-            # Exclude entries fetched after the page load
-            (Feed.last_checked_on < before)
-        ).distinct()
+        feed.mark_entries_as_read(user, feed=feed_, max_id=max_id)
         flask.flash('Feed has been marked as read', category="info")
         redirect_url = flask.url_for('main.entry_list', feed=feed_id)
     else:
-        q = Entry.select(Entry).join(Feed).join(Subscription).where(
-            (Subscription.user == user) &
-            # Exclude entries already marked as read
-            ~(Entry.id << Read.select(Read.entry).where(
-                Read.user == user)) &
-            # Exclude entries fetched after the page load
-            (Feed.last_checked_on < before)
-        ).distinct()
+        feed.mark_entries_as_read(user, max_id=max_id)
         flask.flash('All entries have been marked as read', category="info")
         redirect_url = flask.url_for('main.entry_list', unread='')
 
-    #  @@TODO: Use insert_many()
-    with models.db_wrapper.database.transaction():
-        for entry in q:
-            try:
-                Read.create(user=user, entry=entry)
-            except IntegrityError:
-                app.logger.debug(
-                    'entry %d already marked as read, ignored' % entry.id)
-                continue
-
     return _render_script('main/_modal_done.js', location=redirect_url)
 
 
@@ -261,7 +245,7 @@ def feed_add_1():
 
     feed_ = feed.add_feed_from_url(self_link, fetch_data=False)
     #app.logger.debug("starting fetcher")
-    fetcher.Fetcher(feed_).update_feed_with_data(response.text)
+    fetcher.Fetcher(feed_).update_feed_with_data(response.content, response.headers)
 
     return _add_subscription(feed_, group_id)
 
@@ -297,21 +281,21 @@ def feed_remove():
     user = flask_login.current_user.db_user
 
     try:
-        feed = Feed.get(Feed.id == feed_id)
+        feed_ = Feed.get(Feed.id == feed_id)
     except Feed.DoesNotExist:
         flask.abort(404, 'No such feed %s' % feed_id)
 
     if flask.request.method == 'GET':
-        return _render_modal(flask.url_for('main.feed_remove', feed=feed.id),
+        return _render_modal(flask.url_for('main.feed_remove', feed=feed_.id),
             title='Remove <i>%s</i> from your subscriptions?'
-            % feed.title, button='Remove')
+            % feed_.title, button='Remove')
 
     # Handle postback
-    Subscription.delete().where(
-        (Subscription.user == user
-            ) & (Subscription.feed == feed)).execute()
+    feed.remove_subscription(user, feed_)
+    # Let a worker delete the feed if this was the last subscription
+    jobs.enqueue(jobs.REMOVE_FEED, feed_)
     flask.flash(
-        f'You are no longer subscribed to <i>{feed.title}</i>.', category="info")
+        f'You are no longer subscribed to <i>{feed_.title}</i>.', category="info")
     
     return flask.redirect(flask.url_for('main.feed_list'))
 
@@ -337,7 +321,10 @@ def feed_enable():
     # Handle postback
     feed.enabled = True
     feed.error_count = 0
+    # Make it due for the very next fetch
+    feed.next_check_on = None
     feed.save()
+    jobs.enqueue(jobs.FETCH_FEED, feed)
     flask.flash('Feed <i>%s</i> is now enabled.' % feed.title, category="info")
 
     return flask.redirect(flask.url_for('main.feed_list'))
@@ -362,6 +349,39 @@ def profile():
     return flask.render_template('main/_user_edit.html', user=user)
 
 
+@bp.route('/favicons/<int:icon_id>')
+@flask_login.login_required
+def favicon(icon_id):
+    # Check validators before loading image data
+    icon = get_object_or_404(Icon.select(Icon.id, Icon.data_hash, Icon.content_type), Icon.id == icon_id)
+    if icon.data_hash in flask.request.if_none_match:
+        r = flask.make_response('', 304)
+    else:
+        data = Icon.select(Icon.data).where(Icon.id == icon_id).scalar()
+        r = flask.make_response(bytes(data))
+        r.headers['Content-Type'] = icon.content_type
+    # Icon ids always point to the same image, let browsers keep it
+    r.set_etag(icon.data_hash)
+    r.cache_control.private = True
+    r.cache_control.max_age = FAVICON_MAX_AGE
+    r.cache_control.immutable = True
+    return r
+
+
+@bp.route('/export/subscriptions')
+@flask_login.login_required
+def export_subscriptions():
+    user = flask_login.current_user.db_user
+    return _stream_download(feed.export_subscriptions(user), 'text/x-opml', 'coldsweat-subscriptions.opml')
+
+
+@bp.route('/export/saved')
+@flask_login.login_required
+def export_saved():
+    user = flask_login.current_user.db_user
+    return _stream_download(feed.export_saved_entries(user), 'application/atom+xml', 'coldsweat-saved.xml')
+
+
 @bp.route('/cheatsheet')
 def cheatsheet():
     return flask.render_template('main/_cheatsheet.html', **locals())
@@ -388,6 +408,13 @@ def _render_script(filename, location):
     return r  
 
 
+def _stream_download(chunks, content_type, filename):
+    # Chunks come from stream_template, which keeps request context alive
+    r = flask.Response(chunks, content_type=content_type)
+    r.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return r
+
+
 def _render_modal(url, title='', body='', button='Close', params=None):
     namespace = {
         'url': url,
@@ -405,12 +432,6 @@ def _make_view_variables(user):
         filter_class, panel_title, page_title = 0, 0, 0, '', '', '', ''
 
     groups = feed.get_groups(user)
-    r = Entry.select(Entry.id).join(Read).where((Read.user ==
-                                                 user)).objects()
-    s = Entry.select(Entry.id).join(Saved).where((Saved.user ==
-                                                  user)).objects()
-    read_ids = dict((i.id, None) for i in r)
-    saved_ids = dict((i.id, None) for i in s)
 
     filter = flask.request.args.get('filter', 'unread')
     if filter == 'saved':
@@ -422,7 +443,7 @@ def _make_view_variables(user):
     elif filter ==  'group':
         group_id = flask.request.args.get('id', type=int)
         group = Group.get(Group.id == group_id)
-        count = feed.get_group_entries(user, group, Entry.id).count()
+        count = counters.get_entry_count(user, group=group)
         q = feed.get_group_entries(user, group)
         panel_title = group.title
         filter_class = 'groups'  # The same when listing group
@@ -431,26 +452,23 @@ def _make_view_variables(user):
     elif filter ==  'feed':
         feed_id = flask.request.args.get('id', type=int)
         feed_ = Feed.get(Feed.id == feed_id)
-        count = feed.get_feed_entries(user, feed_, Feed.id).count()
+        count = counters.get_entry_count(user, feed=feed_)
         q = feed.get_feed_entries(user, feed_)
         panel_title = feed_.title
         filter_class = 'feeds'
         filter_name = f'feed={feed_id}'
         page_title = feed_.title
     elif filter == 'all':
-        count = feed.get_all_entries(user, Entry.id).count()
+        count = counters.get_entry_count(user)
         q = feed.get_all_entries(user)
         panel_title = 'All'
         filter_class = filter_name = 'all'
         page_title = 'All'
     else:  # Default
-        count = feed.get_unread_entries(user, Entry.id).count()
+        count = counters.get_unread_count(user)
         q = feed.get_unread_entries(user)
         panel_title = 'Unread'
         filter_class = filter_name = 'unread'
         page_title = 'Unread'
 
-    # Cleanup namespace
-    del r, s
-
     return q, locals()
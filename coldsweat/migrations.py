@@ -0,0 +1,198 @@
+'''
+Database schema migrations
+
+Each migration is a function taking a schema migrator, registered in
+  order of appearance. Applied migrations are recorded in the
+  migrations table, so every one of them runs exactly once
+'''
+
+import base64
+from flask import current_app as app
+from peewee import BlobField, CharField, DateTimeField, ForeignKeyField, Table, fn
+from playhouse.migrate import SchemaMigrator, migrate
+from .models import (Counter, Entry, Icon, Job, Migration, Read, Subscription, Unread, db_wrapper)
+from .utilities import make_sha1_data_hash, make_sha1_hash
+from . import counters
+
+__all__ = [
+    'migrate_database',
+    'mark_as_applied',
+]
+
+MIGRATIONS = []
+GUID_HASH_BATCH_SIZE = 1000
+
+
+def migration(func):
+    MIGRATIONS.append(func)
+    return func
+
+
+def migrate_database():
+    '''
+    Apply pending migrations to an existing database
+    '''
+    database = db_wrapper.database
+    # Databases created before migrations were introduced lack this table
+    database.create_tables([Migration], safe=True)
+
+    applied = set(m.name for m in Migration.select(Migration.name))
+    # FlaskDB hands out a proxy, the migrator needs the actual database
+    migrator = SchemaMigrator.from_database(database.obj)
+    is_sqlite = db_wrapper.get_engine() == 'sqlite'
+    if is_sqlite:
+        # SQLite rebuilds tables to alter columns, do not 
+        #   let that cascade deletes to referencing rows
+        database.pragma('foreign_keys', 0)
+    count = 0
+    try:
+        for func in MIGRATIONS:
+            if func.__name__ in applied:
+                continue
+            with database.atomic():
+                func(migrator)
+                Migration.create(name=func.__name__)
+            app.logger.info(f"applied migration {func.__name__}")
+            count += 1
+    finally:
+        if is_sqlite:
+            database.pragma('foreign_keys', 1)
+    return count
+
+
+def mark_as_applied():
+    '''
+    Record all known migrations as applied, used when
+      a database is created with the latest schema
+    '''
+    Migration.insert_many(
+        [{'name': func.__name__} for func in MIGRATIONS]
+    ).on_conflict_ignore().execute()
+
+
+# ------------------------------------------------------
+# Migrations
+# ------------------------------------------------------
+
+
+@migration
+def add_feed_next_check_on(migrator):
+    migrate(
+        migrator.add_column('feeds', 'next_check_on', DateTimeField(null=True)),
+        migrator.add_index('feeds', ['next_check_on'], False),
+    )
+
+
+@migration
+def add_feed_body_hash(migrator):
+    migrate(
+        migrator.add_column('feeds', 'body_hash', CharField(default='', max_length=40)),
+    )
+
+
+@migration
+def add_entry_content_hash(migrator):
+    migrate(
+        migrator.add_column('entries', 'content_hash', CharField(default='', max_length=40)),
+    )
+
+
+@migration
+def add_feed_last_modified(migrator):
+    migrate(
+        migrator.add_column('feeds', 'last_modified', CharField(default='')),
+    )
+
+
+@migration
+def add_jobs_table(migrator):
+    Job.create_table(safe=True)
+
+
+@migration
+def move_feed_icons(migrator):
+    Icon.create_table(safe=True)
+    migrate(
+        migrator.add_column('feeds', 'icon_id', ForeignKeyField(Icon, null=True, on_delete='SET NULL', field=Icon.id)),
+    )
+    # Icons were stored inline as base64 data URIs
+    feeds = Table('feeds', ('id', 'icon', 'icon_id')).bind(migrator.database)
+    for feed_id, data_uri in list(feeds.select(feeds.id, feeds.icon).where(feeds.icon != '').tuples()):
+        try:
+            header, encoded = data_uri.split(',', 1)
+            content_type = header[len('data:'):].split(';')[0]
+            data = base64.standard_b64decode(encoded)
+        except ValueError:
+            continue
+        data_hash = make_sha1_data_hash(data)
+        Icon.insert(data_hash=data_hash, content_type=content_type, data=data).on_conflict_ignore().execute()
+        icon_id = Icon.get(Icon.data_hash == data_hash).id
+        feeds.update({feeds.icon_id: icon_id}).where(feeds.id == feed_id).execute()
+    migrate(
+        migrator.drop_column('feeds', 'icon'),
+    )
+
+
+@migration
+def add_entry_compressed_content(migrator):
+    migrate(
+        migrator.add_column('entries', 'compressed_content', BlobField(null=True)),
+    )
+
+
+@migration
+def add_entry_guid_hash(migrator):
+    migrate(
+        migrator.add_column('entries', 'guid_hash', CharField(default='', max_length=40)),
+    )
+    entries = Table('entries', ('id', 'guid', 'guid_hash')).bind(migrator.database)
+    # Walk entries in id ranges, so a large table is never loaded at once
+    last_id = 0
+    while True:
+        batch = list(entries.select(entries.id, entries.guid)
+                     .where(entries.id > last_id)
+                     .order_by(entries.id)
+                     .limit(GUID_HASH_BATCH_SIZE)
+                     .tuples())
+        if not batch:
+            break
+        migrator.database.cursor().executemany(
+            'UPDATE entries SET guid_hash = {0} WHERE id = {0}'.format(migrator.database.param),
+            [(make_sha1_hash(guid), entry_id) for entry_id, guid in batch])
+        last_id = batch[-1][0]
+    # Old databases name the guid index differently, look it up
+    guid_indexes = [index.name for index in migrator.database.get_indexes('entries')
+                    if index.unique and index.columns == ['guid']]
+    migrate(
+        migrator.add_index('entries', ['guid_hash'], True),
+        *[migrator.drop_index('entries', name) for name in guid_indexes]
+    )
+
+
+@migration
+def add_query_indexes(migrator):
+    migrate(
+        migrator.add_index('entries', ['published_on'], False),
+        migrator.add_index('entries', ['feed_id', 'published_on'], False),
+        migrator.add_index('read', ['user_id', 'read_on'], False),
+        migrator.add_index('users', ['fever_api_key'], False),
+    )
+
+
+@migration
+def add_unread_table(migrator):
+    Unread.create_table(safe=True)
+    # Fill the index with a plain INSERT ... SELECT: unread.add_entries
+    #   updates counters, whose table is added by a later migration
+    q = (Entry.select(Subscription.user, Entry.id)
+         .join(Subscription, on=(Subscription.feed == Entry.feed))
+         .where(~fn.EXISTS(Read.select().where(
+             (Read.user == Subscription.user) & (Read.entry == Entry.id))))
+         .distinct())
+    Unread.insert_from(q, [Unread.user, Unread.entry]).execute()
+
+
+@migration
+def add_counters_table(migrator):
+    Counter.create_table(safe=True)
+    counters.rebuild()
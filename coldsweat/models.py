@@ -1,25 +1,32 @@
 '''
 Database models
 '''
+import zlib
 from datetime import datetime
+from flask import current_app, has_app_context
 from playhouse.signals import (pre_save, Model)
 from playhouse.flask_utils import FlaskDB
-from peewee import (BooleanField, CharField, FixedCharField, DateTimeField,
+from peewee import (BlobField, BooleanField, CharField, FixedCharField, DateTimeField,
                     ForeignKeyField,
                     IntegerField,
                     TextField)
 from werkzeug import security
 from markupsafe import Markup
-from .utilities import datetime_as_epoch, make_md5_hash, make_sha1_hash
+from .utilities import datetime_as_epoch, make_data_uri, make_md5_hash, make_sha1_hash
 
 __all__ = [
     'User',
     'Group',
+    'Icon',
     'Feed',
     'Entry',
     'Read',
+    'Unread',
     'Saved',
     'Subscription',
+    'Counter',
+    'Migration',
+    'Job',
     'ColdsweatDB',
     'setup',
 ]
@@ -38,6 +45,8 @@ DfHjCbUKnl6OZTgAEAR+pHH9rWoLkAAAAASUVORK5CYII="
 FEED_GENERIC = 'G'
 FEED_MASTODON = 'M'
 FEED_YOUTUBE = 'Y'
+CONTENT_COMPRESSION_LEVEL = 6  # Zlib default, good trade-off for short HTML documents
+MAX_CACHED_ICONS = 1024  # Encoded icons kept in memory
 MAX_URL_LENGTH = 3072 // 4  # Stay below the 3072 char limit of recent MySQL versions with 4-byte text encodings
 
 class ColdsweatDB(FlaskDB):
@@ -77,7 +86,7 @@ class User(db_wrapper.Model):
 
     display_name = CharField(default='')
     email = CharField(unique=True)
-    fever_api_key = CharField()
+    fever_api_key = CharField(index=True)  # Looked up on every Fever API request
     enabled = BooleanField(default=True)
     password_hash = CharField()
 
@@ -128,6 +137,38 @@ class Group(db_wrapper.Model):
         table_name = 'groups'
 
 
+# Icon data URIs by data hash
+_icon_data_uris = {}
+
+
+class Icon(db_wrapper.Model):
+    """
+    Feed favicon, shared by all feeds with the same image
+    """
+    data_hash = CharField(unique=True, max_length=40)  # SHA-1 of image data
+    content_type = CharField(default='image/x-icon')
+    data = BlobField()
+
+    class Meta:
+        table_name = 'icons'
+
+    @property
+    def data_uri(self):
+        # Stored icons never change, so encode each of them once
+        try:
+            return _icon_data_uris[self.data_hash]
+        except KeyError:
+            pass
+        if len(_icon_data_uris) >= MAX_CACHED_ICONS:
+            _icon_data_uris.clear()
+        data_uri = _icon_data_uris[self.data_hash] = make_data_uri(self.content_type, bytes(self.data))
+        return data_uri
+
+    @staticmethod
+    def get_cached_data_uri(data_hash):
+        return _icon_data_uris.get(data_hash)
+
+
 class Feed(db_wrapper.Model):
     """
     Atom/RSS feed
@@ -143,6 +184,8 @@ class Feed(db_wrapper.Model):
     # URL associated with the feed (rel=alternate)
     alternate_link = CharField(default='', max_length=MAX_URL_LENGTH)
     etag = CharField(default='')  # HTTP E-tag
+    last_modified = CharField(default='')  # HTTP Last-Modified, as sent by server
+    body_hash = CharField(default='', max_length=40)  # SHA-1 of last fetched raw feed body
     source = FixedCharField(default=FEED_GENERIC, max_length=1)  # Future use
 
     # Nullable fields
@@ -150,8 +193,9 @@ class Feed(db_wrapper.Model):
     last_updated_on = DateTimeField(null=True)
     last_checked_on = DateTimeField(index=True, null=True)
     last_status = IntegerField(null=True)  # Last returned HTTP code
+    next_check_on = DateTimeField(index=True, null=True)  # When feed is due for a fetch again
 
-    icon = TextField(default='')  # Stored as data URI
+    icon = ForeignKeyField(Icon, null=True, on_delete='SET NULL')
     icon_url = CharField(default='', max_length=MAX_URL_LENGTH)
     icon_last_updated_on = DateTimeField(null=True)
 
@@ -165,10 +209,6 @@ class Feed(db_wrapper.Model):
             return datetime_as_epoch(self.last_updated_on)
         return 0
 
-    @property
-    def icon_or_default(self):
-        return self.icon if self.icon else Feed.DEFAULT_ICON
-
 
 class Entry(db_wrapper.Model):
     """
@@ -177,23 +217,59 @@ class Entry(db_wrapper.Model):
 
     MAX_TITLE_LENGTH = 255
 
-    guid = CharField(unique=True, max_length=MAX_URL_LENGTH)  # 'id' in Atom parlance
+    guid = CharField(max_length=MAX_URL_LENGTH)  # 'id' in Atom parlance
+    guid_hash = CharField(unique=True, max_length=40)  # SHA-1 of guid, keeps the unique index small
     feed = ForeignKeyField(Feed, on_delete='CASCADE')
     title = CharField(max_length=MAX_TITLE_LENGTH)
     content_type = CharField(default='text/html')
-    content = TextField()
+    # Use the content property to read and write these two
+    raw_content = TextField(column_name='content', default='')
+    compressed_content = BlobField(null=True)  # Zlib compressed content, if enabled
+    content_hash = CharField(default='', max_length=40)  # SHA-1 of raw feed values, to detect changes
     thumbnail_url = CharField(default='', max_length=MAX_URL_LENGTH)  # Future use
-    published_on = DateTimeField()
+    published_on = DateTimeField(index=True)
     author = CharField(default='')
     link = CharField(default='', max_length=MAX_URL_LENGTH)  # If empty the entry *must* provide a GUID
 
     class Meta:
+        indexes = (
+            (('feed', 'published_on'), False),
+        )
         table_name = 'entries'
 
     @property
     def published_on_as_epoch(self):
         return datetime_as_epoch(self.published_on)
 
+    @property
+    def content(self):
+        # Decompress on first access only
+        if self.compressed_content is None:
+            return self.raw_content
+        try:
+            return self._content
+        except AttributeError:
+            self._content = zlib.decompress(bytes(self.compressed_content)).decode('utf-8')
+            return self._content
+
+    @content.setter
+    def content(self, value):
+        for name, field_value in Entry.encode_content(value).items():
+            setattr(self, name, field_value)
+        self.__dict__.pop('_content', None)
+
+    @staticmethod
+    def encode_content(value, compress=None):
+        '''
+        Return field values storing given content, by default compressed
+          only if COMPRESS_CONTENT setting is enabled
+        '''
+        if compress is None:
+            compress = has_app_context() and current_app.config.get('COMPRESS_CONTENT', False)
+        if compress:
+            return {'raw_content': '', 'compressed_content': zlib.compress(value.encode('utf-8'), CONTENT_COMPRESSION_LEVEL)}
+        return {'raw_content': value, 'compressed_content': None}
+
     @property
     def text_content(self):
         '''
@@ -224,6 +300,21 @@ class Read(db_wrapper.Model):
     entry = ForeignKeyField(Entry, on_delete='CASCADE')
     read_on = DateTimeField(default=datetime.utcnow)
 
+    class Meta:
+        indexes = (
+            (('user', 'entry'), True),
+            (('user', 'read_on'), False),
+        )
+
+
+class Unread(db_wrapper.Model):
+    """
+    Entries not read yet by a subscribed user, kept in sync with
+      subscriptions and read marks to answer unread queries quickly
+    """
+    user = ForeignKeyField(User)
+    entry = ForeignKeyField(Entry, on_delete='CASCADE')
+
     class Meta:
         indexes = (
             (('user', 'entry'), True),
@@ -245,6 +336,54 @@ class Subscription(db_wrapper.Model):
         table_name = 'subscriptions'
 
 
+class Counter(db_wrapper.Model):
+    """
+    Number of entries of a subscribed feed, read or not, kept
+      up to date along with entries and read marks
+    """
+    user = ForeignKeyField(User)
+    feed = ForeignKeyField(Feed, on_delete='CASCADE')
+    entry_count = IntegerField(default=0)
+    unread_count = IntegerField(default=0)
+
+    class Meta:
+        indexes = (
+            (('user', 'feed'), True),
+        )
+        table_name = 'counters'
+
+
+class Migration(db_wrapper.Model):
+    """
+    Database schema migration applied so far
+    """
+    name = CharField(unique=True)
+    applied_on = DateTimeField(default=datetime.utcnow)
+
+    class Meta:
+        table_name = 'migrations'
+
+
+class Job(db_wrapper.Model):
+    """
+    Background job, leased to a single worker at time
+    """
+    kind = CharField()
+    feed = ForeignKeyField(Feed, null=True, on_delete='CASCADE')
+    payload = TextField(default='')  # Kind-specific arguments
+    run_after = DateTimeField(default=datetime.utcnow, index=True)
+    attempts = IntegerField(default=0)
+    # A job can be claimed when unlocked or when its lease has expired
+    worker_id = CharField(default='')
+    locked_until = DateTimeField(null=True)
+
+    class Meta:
+        indexes = (
+            (('kind', 'feed'), True),
+        )
+        table_name = 'jobs'
+
+
 BUILTIN_GROUPS = [
     {'id': 1, 'title': Group.DEFAULT_GROUP},
     {'id': 2, 'title': 'Reserved 2'},
@@ -259,10 +398,25 @@ BUILTIN_GROUPS = [
 
 def setup():
     """
-    Create database tables for all models and bootstrap data
+    Create database tables for all models, upgrade an 
+      existing schema and bootstrap data
     """
-    with db_wrapper.database as database:
-        database.create_tables([User, Feed, Entry, Group, Read, Saved,
-                                Subscription], safe=True)
+    from .migrations import migrate_database, mark_as_applied
+
+    models = [User, Icon, Feed, Entry, Group, Read, Unread, Saved,
+              Subscription, Counter, Migration, Job]
+
+    # A brand new database gets the latest schema straight away
+    is_new = not Feed.table_exists()
+    if is_new:
+        with db_wrapper.database as database:
+            database.create_tables(models)
+        mark_as_applied()
+    else:
+        # Bring existing tables up to date first, indexes of the
+        #   current models may refer to columns not added yet
+        migrate_database()
+        with db_wrapper.database as database:
+            database.create_tables([model for model in models if not model.table_exists()])
 
     Group.insert_many(BUILTIN_GROUPS).on_conflict_replace().execute()
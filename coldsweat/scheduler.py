@@ -0,0 +1,135 @@
+'''
+Long-running feed fetcher
+'''
+
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+from flask import current_app as app
+from .models import db_wrapper
+from .fetcher import fetch_stats
+import coldsweat.jobs as jobs
+from .utilities import format_iso_datetime
+
+__all__ = [
+    'FetchScheduler',
+]
+
+RELOAD_INTERVAL = 60*5  # Seconds, pick up added, removed or re-enabled feeds
+HEARTBEAT_INTERVAL = 60  # Seconds
+POLL_INTERVAL = 5  # Seconds, how often idle workers look for due jobs
+HEARTBEAT_FILENAME = 'fetcher-heartbeat'
+
+
+class FetchScheduler(object):
+    '''
+    Continuously run due jobs from the shared job queue on a pool of
+      worker threads. Several schedulers, even on different hosts, can
+      share the same queue since each job is leased to one worker at time
+    '''
+
+    def __init__(self, workers, drain=False):
+        self.workers = max(1, workers)
+        # Stop as soon as no more jobs are due, instead of waiting for them
+        self.drain = drain
+        # Feeds skipped as not due yet are not counted
+        self._checked_feeds = fetch_stats['checked_feeds']
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def run(self):
+        '''
+        Run jobs until stopped by SIGINT or SIGTERM
+        '''
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        self.reload()
+
+        flask_app = app._get_current_object()
+        threads = [threading.Thread(target=self._worker, args=(flask_app,), name=f'fetcher-{i}')
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        if self.drain:
+            for thread in threads:
+                thread.join()
+            return
+
+        app.logger.info("fetcher started with %d worker(s)" % self.workers)
+        next_reload = time.monotonic() + RELOAD_INTERVAL
+        next_heartbeat = time.monotonic()
+        try:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                if now >= next_reload:
+                    self.reload()
+                    next_reload = now + RELOAD_INTERVAL
+                if now >= next_heartbeat:
+                    self.heartbeat()
+                    next_heartbeat = now + HEARTBEAT_INTERVAL
+                self._stop.wait(max(min(next_reload, next_heartbeat) - now, 0))
+        finally:
+            # Let workers finish their current job, then exit
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            app.logger.info("fetcher stopped, %d feeds checked" % self.fetched_count)
+
+    def stop(self, *args):
+        self._stop.set()
+
+    @property
+    def fetched_count(self):
+        return fetch_stats['checked_feeds'] - self._checked_feeds
+
+    def reload(self):
+        '''
+        Queue jobs for added or re-enabled feeds and take over
+          jobs left behind by workers which went away
+        '''
+        jobs.recover_expired_leases()
+        jobs.sync_jobs()
+
+    def heartbeat(self):
+        with self._lock:
+            in_flight = self._in_flight
+        app.logger.info("fetcher heartbeat: %d jobs due, %d in flight, %d feeds checked so far, %d new/%d reused connections" % (
+            jobs.count_due_jobs(), in_flight, self.fetched_count,
+            fetch_stats['new_connections'], fetch_stats['reused_connections']))
+        # Let monitoring tools know we are alive
+        with open(os.path.join(app.instance_path, HEARTBEAT_FILENAME), 'w') as f:
+            f.write(format_iso_datetime(datetime.utcnow()))
+
+    def _worker(self, flask_app):
+        worker_id = jobs.make_worker_id()
+        with flask_app.app_context():
+            try:
+                while not self._stop.is_set():
+                    try:
+                        db_wrapper.database.connect(reuse_if_open=True)
+                        job = jobs.claim_job(worker_id)
+                        if not job:
+                            if self.drain:
+                                break
+                            self._stop.wait(POLL_INTERVAL)
+                            continue
+                        with self._lock:
+                            self._in_flight += 1
+                        try:
+                            jobs.run_job(job)
+                        finally:
+                            with self._lock:
+                                self._in_flight -= 1
+                    except Exception:
+                        # Say the database is locked, keep the worker alive
+                        app.logger.exception("fetcher worker failed, retrying in %d seconds" % POLL_INTERVAL)
+                        db_wrapper.database.close()
+                        self._stop.wait(POLL_INTERVAL)
+            finally:
+                db_wrapper.database.close()
@@ -0,0 +1,81 @@
+'''
+Per-user index of unread entries
+
+Instead of looking for entries without a read mark every time, each
+  subscriber gets a row for every unread entry. Rows are added when
+  entries are fetched, a feed is subscribed or an entry is marked as
+  unread, and removed on the opposite operations. Callers are expected
+  to hold the write lock where needed
+'''
+
+from peewee import fn
+from .models import (Entry, Read, Subscription, Unread)
+from . import counters
+
+__all__ = [
+    'add_entries',
+    'remove_entries',
+    'rebuild',
+]
+
+
+def add_entries(where=None, user=None):
+    '''
+    Add matching entries, or all of them, for every subscriber or just for
+      given user, skipping entries already read. Return the number of added rows
+    '''
+    not_read = ~fn.EXISTS(Read.select().where(
+        (Read.user == Subscription.user) & (Read.entry == Entry.id)))
+    where = not_read if where is None else (where & not_read)
+    if user:
+        where &= (Subscription.user == user)
+
+    # Count entries not in the index yet, to keep counters in step
+    not_indexed = ~fn.EXISTS(Unread.select().where(
+        (Unread.user == Subscription.user) & (Unread.entry == Entry.id)))
+    deltas = list(Entry.select(Subscription.user, Entry.feed, fn.COUNT(fn.DISTINCT(Entry.id)))
+                  .join(Subscription, on=(Subscription.feed == Entry.feed))
+                  .where(where & not_indexed)
+                  .group_by(Subscription.user, Entry.feed)
+                  .tuples())
+
+    q = (Entry.select(Subscription.user, Entry.id)
+         .join(Subscription, on=(Subscription.feed == Entry.feed))
+         .where(where)
+         .distinct())
+    count = (Unread.insert_from(q, [Unread.user, Unread.entry])
+             .on_conflict_ignore()
+             .as_rowcount()
+             .execute())
+    counters.update_unread_counts(deltas)
+    return count
+
+
+def remove_entries(where, user=None):
+    '''
+    Remove matching entries from the index of given user, or of everyone
+    '''
+    indexed = Unread.entry << Entry.select(Entry.id).where(where)
+    if user:
+        indexed &= (Unread.user == user)
+    deltas = [(user_id, feed_id, -count) for user_id, feed_id, count in
+              Unread.select(Unread.user, Entry.feed, fn.COUNT(Unread.id))
+              .join(Entry)
+              .where(indexed)
+              .group_by(Unread.user, Entry.feed)
+              .tuples()]
+    count = Unread.delete().where(indexed).execute()
+    counters.update_unread_counts(deltas)
+    return count
+
+
+def rebuild(user=None):
+    '''
+    Recreate the index from subscriptions and read marks, counters
+      need to be rebuilt afterwards
+    '''
+    if user:
+        Unread.delete().where(Unread.user == user).execute()
+    else:
+        Unread.delete().execute()
+    return add_entries(user=user)
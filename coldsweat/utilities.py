@@ -46,6 +46,10 @@ def make_sha1_hash(s):
     return sha1(encode(s)).hexdigest()
 
 
+def make_sha1_data_hash(data):
+    return sha1(data).hexdigest()
+
+
 def make_nonce():
     nonce = os.urandom(16)
     return nonce.hex()
@@ -1,138 +1,5 @@
 PRAGMA foreign_keys=OFF;
 BEGIN TRANSACTION;
-CREATE TABLE IF NOT EXISTS "feeds" ("id" INTEGER NOT NULL PRIMARY KEY, "enabled" INTEGER NOT NULL, "self_link" VARCHAR(511) NOT NULL, "error_count" INTEGER NOT NULL, "title" VARCHAR(255) NOT NULL, "alternate_link" VARCHAR(511) NOT NULL, "etag" VARCHAR(255) NOT NULL, "source" CHAR(1) NOT NULL, "last_updated_on" DATETIME, "last_checked_on" DATETIME, "last_status" INTEGER, "icon" TEXT NOT NULL, "icon_url" VARCHAR(511) NOT NULL, "icon_last_updated_on" DATETIME);
-INSERT INTO feeds VALUES(1,1,'https://lab.passiomatic.com/coldsweat/tests/wrong-feed.xml',1,'404 Test','https://lab.passiomatic.com/coldsweat/','','G',NULL,'2023-07-09 15:04:20.770416',404,'','',NULL);
-INSERT INTO feeds VALUES(2,1,'https://lab.passiomatic.com/coldsweat/tests/feed1.xml',0,'500px: Editor’s Choice','https://500px.com/editors.rss','"5403-5fc70f2249c07-gzip"','G','2022-06-08 18:58:09','2023-07-09 15:04:21.491449',200,'data:image/x-icon;base64,AAABAAEAQEAAAAEAIAAoQgAAFgAAACgAAABAAAAAgAAAAAEAIAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACEAAACJAAAAyQAAANkAAAC1AAAAawAAAAMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOgAAAJsAAADbAAAA9gAAAPAAAADPAAAAhgAAAB8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlAAAAiwAAANIAAADyAAAA9QAAANgAAACVAAAAMwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFgAAADxAAAA+QAAALsAAACcAAAA1gAAAP8AAADNAAAAHwAAAAAAAAAAAAAAAAAAAAAAAAAPAAAAqwAAAP8AAAD/AAAA2AAAALYAAAC/AAAA7AAAAP8AAAD4AAAAfQAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMAAACJAAAA+wAAAP8AAADjAAAAuwAAALgAAADeAAAA/wAAAP4AAACgAAAACgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADQAAAD9AAAAyAAAAB4AAAAAAAAAAAAAAAAAAABMAAAA8wAAAMYAAAAEAAAAAAAAAAAAAAARAAAA1AAAAP8AAADCAAAAKgAAAAAAAAAAAAAAAAAAAAMAAABZAAAA7AAAAP8AAACiAAAAAAAAAAAAAAAAAAAAAAAAAAIAAACxAAAA/wAAANsAAABCAAAAAAAAAAAAAAAAAAAAAAAAADYAAADRAAAA/wAAAMkAAAAKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADKAAAA6AAAAA4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFYAAAD/AAAAZwAAAAAAAAAAAAAAtgAAAP8AAAB/AAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgAAADHAAAA/wAAAHMAAAAAAAAAAAAAAAAAAACEAAAA/wAAAKkAAAAKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgAAAJgAAAD/AAAApQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAA3gAAAK0AAAAAAAAASwAAAP8AAAC4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIQAAAPQAAADyAAAAFQAAAAAAAAAgAAAA+QAAAN4AAAAMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGAAAA0wAAAP8AAAA6AAAAAAAAAEMAAAD2AAAAMwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAL0AAADbAAAAAAAAALEAAAD7AAAAHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABzAAAA/wAAAG4AAAAAAAAAfwAAAP8AAABJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADkAAAD/AAAAoAAAAAAAAABVAAAA/wAAAEQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADUAAAAvgAAAAEAAAD1AAAAvgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGAAAAP8AAAC0AAAAAAAAAMUAAADtAAAAAwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4QAAAOYAAAAAAAAAVQAAAP8AAABEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANwAAAGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA7AAAA/wAAAJEAAAAVAAAA/wAAAJgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADwAAAA0QAAAAAAAADjAAAAyQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALwAAAD+AAAABQAAAFUAAAD/AAAARAAAAAAAAAA+AAAAPgAAAAQAAAAAAAAAAAAAAAAAAAApAAAACQAAAAAAAAAAAAAAAAAAAAAAAAAIAAAAJQAAAKcAAAD/AAAAgwAAAAMAAAAAAAAAAAAAAAAAAAAqAAAA4QAAAPkAAAAhAAAAFQAAAP8AAACaAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8QAAANAAAAAAAAAA4wAAAMwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADAAAAA/gAAAAUAAABVAAAA/wAAAEQAAAAAAAAA7gAAAP8AAADlAAAAOAAAAAAAAAAKAAAA9wAAAMAAAAALAAAAAAAAAAAAAAAJAAAAuwAAAN4AAACnAAAA/wAAAP8AAADYAAAAhQAAAG4AAACjAAAA9wAAAP0AAABYAAAAAAAAAAEAAAD2AAAAxAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHAAAAP8AAACwAAAAAAAAAMUAAADxAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAA6AAAAOUAAAAAAAAAVgAAAP8AAABEAAAAAAAAACQAAABZAAAA1wAAAPYAAABAAAAAAAAAAGMAAAD+AAAAwAAAAAsAAAAJAAAAuwAAAPMAAAA5AAAApwAAAOEAAABmAAAA4QAAAP8AAAD/AAAA/gAAAMcAAAA6AAAAAAAAAAAAAAAAAAAAsQAAAPwAAAAmAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHkAAAD/AAAAaQAAAAAAAACAAAAA/wAAAFUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASAAAAP8AAACgAAAAAAAAAFUAAAD/AAAARAAAAAAAAAAAAAAAAAAAABEAAADzAAAAygAAAAAAAAAAAAAAaAAAAP8AAADAAAAAuwAAAPUAAAA/AAAAAAAAAKcAAADdAAAAAAAAAAUAAAAwAAAAOwAAABcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEsAAAD/AAAAxQAAAAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACgAAAD3AAAA7wAAABEAAAAAAAAAIAAAAPkAAADnAAAAEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADQAAAOAAAAD/AAAAOQAAAAAAAABSAAAA/wAAAEcAAAAAAAAAAAAAAAAAAAAAAAAApQAAAP4AAAAHAAAAAAAAAAAAAABzAAAA/wAAAP8AAABLAAAAAAAAAAAAAACnAAAA3QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAtgAAAP8AAACTAAAABgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACAAAADQAAAA/wAAAGoAAAAAAAAAAAAAAAAAAACEAAAA/wAAALgAAAATAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADwAAAK8AAAD/AAAApAAAAAAAAAAAAAAAKwAAAP8AAABzAAAAAAAAAAAAAAAAAAAAAAAAALQAAAD0AAAAAAAAAAAAAAAIAAAAuAAAAPgAAAD9AAAAswAAAAYAAAAAAAAApwAAAN0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABEAAADUAAAA/wAAANIAAAA+AAAAAQAAAAAAAAAAAAAACwAAAGwAAADzAAAA/wAAAJcAAAAAAAAAAAAAAAAAAAAAAAAAAgAAALAAAAD/AAAA5wAAAFYAAAAGAAAAAAAAAAAAAAAEAAAAUQAAAOMAAAD/AAAAyQAAAAoAAAAAAAAAAAAAAAMAAADTAAAA6QAAACoAAAAAAAAAAAAAAFYAAAD+AAAArAAAAAAAAAAIAAAAuAAAAPkAAABKAAAAXAAAAP0AAACzAAAABgAAAKgAAAD1AAAArgAAAK4AAACuAAAArgAAAK4AAACuAAAArgAAAEMAAAAAAAAAAAAAAAAAAAAAAAAADgAAAKsAAAD/AAAA/wAAAOsAAADLAAAA0wAAAPgAAAD/AAAA9QAAAHMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADAAAAiQAAAPsAAAD/AAAA8wAAANAAAADPAAAA8QAAAP8AAAD+AAAAnwAAAAkAAAAAAAAAAAAAAAAAAAAAAAAANwAAAO8AAAD6AAAAvwAAAM0AAAD/AAAA6QAAACMAAAACAAAAuAAAAPsAAABQAAAAAAAAAAAAAABdAAAA/QAAALEAAABmAAAA1gAAANcAAADXAAAA1wAAANcAAADXAAAA1wAAANcAAABTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOgAAAJoAAADbAAAA9gAAAO4AAADLAAAAgAAAABoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlAAAAigAAANIAAADxAAAA9AAAANgAAACUAAAAMQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAjAAAAnAAAAOUAAADpAAAAowAAABsAAAAAAAAABgAAALgAAABVAAAAAAAAAAAAAAAAAAAAAAAAAFsAAACVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wH8A/4B///+APAA+AB///w4YODweD///Hxh+HD8P//8/Ef8If4R///+R/4j/xH///4P/iP/kf/8/A//J/+BHPA4D/8n/4EIYACP/iP/EQQAAcf+I/8RxgSHw/wh/hHjDP/h+HD8MeYE/+Bg8DAwxAAA8AH4AHgAYAD8A/4B/Ajz///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8=','https://icons.duckduckgo.com/ip3/500px.com.ico','2023-07-09 15:04:21.491449');
-INSERT INTO feeds VALUES(3,1,'https://lab.passiomatic.com/coldsweat/tests/feed2.xml',0,'Ars Technica','https://arstechnica.com','"1451e-5fc70f22d8542-gzip"','G','2023-05-24 13:26:29','2023-07-09 15:04:22.655855',200,'data:image/x-icon;base64,AAABAAMAICAAAAEAIACoEAAANgAAABAQAAABACAAaAQAAN4QAABAQAAAAQAgAChCAABGFQAAKAAAACAAAABAAAAAAQAgAAAAAACAEAAAEwsAABMLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8KFF3/QhRd/3wUXf+pFF3/xBRd/9IUXf/SFF3/xRRd/60UXf+DFF3/SBRd/w4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8aFF3/ehRd/9MUXf/+FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/2xRd/4UUXf8hAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/aBRd/+AUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/+gUXf94FF3/BgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/FxRd/6oUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+8FF3/IQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/x0UXf/LFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/ZFF3/KQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8VFF3/zRRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/cFF3/IAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/AhRd/6wUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/CFF3/CQAAAAAAAAAAAAAAAAAAAAAUXf9mFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf9+AAAAAAAAAAAAAAAAFF3/FxRd/+QUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//IUXf8mAAAAAAAAAAAUXf96FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/5IAAAAAFF3/CRRd/9YUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/6RRd/xYUXf9AFF3//xRd//8UXf//FF3//xRd//8UXf//E1z//whU//8FU///BlP//w5Z//8HVP//EVv//xFb//8GU///Elv//xVd//8VXf//D1r//wZT//8EUv//BFP//whV//8TXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/VhRd/3sUXf//FF3//xRd//8UXf//FF3//xNc//8QW///ZZX//6bC//+Bp///LG3//3Cc/v8nav//KWv//32l/v8laP//EFr//xFb//8oa///cJ3//6bB//+iv///U4j//w1Z//8TXP//FF3//xRd//8UXf//FF3//xRd//8UXf+UFF3/qRRd//8UXf//FF3//xRd//8UXf//CFT//2SU////////tMv//7nO///e6P///////zx4//9Ffv///////zp3//8LV///BlT//5u6/v/j6/7/qsT//7LK///3+f//aZj//whV//8UXf//FF3//xRd//8UXf//FF3//xRd/78UXf/CFF3//xRd//8UXf//FF3//xRd//8EUv//nLv+/+Lr/v8ATv//AEf//3Ke////////OXb//0J8///6+v//OHb//wxX//8RW///NHP+/xti//8ARv//AEj//8jZ//+4zv//BlP//xNd//8UXf//FF3//xRd//8UXf//FF3/1xRd/9EUXf//FF3//xRd//8UXf//FF3//wlW//9Qhv7/+fv+/6K///87dP//UYf///v8//86d///Qnz///n6//81dP//DFf//xZe//8GU///IWb//2uZ//+4zf///////3Ke//8HVP//FF3//xRd//8UXf//FF3//xRd//8UXf/jFF3/0RRd//8UXf//FF3//xRd//8UXf//FF3//wtX//9Kg/7/ts3//9rm/v/m7v///P3//zl2//9Be///+/z//zx4//8EUf//C1f//z56///j7P//8/f//7zR//9cj///Dln//xNc//8UXf//FF3//xRd//8UXf//FF3//xRd/+QUXf/EFF3//xRd//8UXf//FF3//xRd//8UXf//Fl7//xNc//8ATf//BlP//2WU////////N3X//z96////////yNj//yRo//8ATP//nLv//+nv//8eYv//AEn//wpW//8WX///FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/2BRd/6wUXf//FF3//xRd//8UXf//FF3//w9a//8laf//0uD+/7XM//+Ss///1uP//+bu//8WXv//S4L///T3/v/J2f//8PX//3Gd/v9dj///9/n+/5u5/v+evP//1+P+/zt4//8LV///FF3//xRd//8UXf//FF3//xRd//8UXf/BFF3/gBRd//8UXf//FF3//xRd//8UXf//E1z//xVe//9cj///pMD//7nP/v+kwP//PXn//whU//80c///d6H+/xlg//+Cqf//cJz//wZT//9klP//ssr+/7LK/v+Dqf//IWX//xBb//8UXf//FF3//xRd//8UXf//FF3//xRd/5kUXf9FFF3//xRd//8UXf//FF3//xRd//8UXf//E1z//whU//8FU///CVX//wZT//8LV///FV7//xBb//8HVf//EFr//wZT//8MWP//FF3//whU//8IVf//CFX//wZT//8RW///FV3//xRd//8UXf//FF3//xRd//8UXf//FF3/XRRd/w0UXf/cFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8TXP//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xNd//8TXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/+wUXf8aAAAAABRd/4MUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/nAAAAAAAAAAAFF3/HRRd/+sUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//cUXf8wAAAAAAAAAAAAAAAAFF3/dBRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/iwAAAAAAAAAAAAAAAAAAAAAUXf8GFF3/uxRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/84UXf8PAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8dFF3/2hRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/lFF3/KwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8oFF3/2RRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/4xRd/zkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8iFF3/vhRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/8wUXf8rAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8IFF3/fBRd/+0UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//UUXf+JFF3/EAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/KRRd/5EUXf/jFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/+oUXf+aFF3/MwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/xQUXf9UFF3/khRd/7sUXf/WFF3/3hRd/94UXf/XFF3/vxRd/5cUXf9aFF3/GgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/wAP//wAA//4AAD/4AAAf8AAAD+AAAAfAAAADwAAAA4AAAAGAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgAAAAYAAAAHAAAADwAAAA+AAAAfwAAAP+AAAH/wAAD//AAD//8AD/ygAAAAQAAAAIAAAAAEAIAAAAAAAQAQAABMLAAATCwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnsD+YECE/r8AW///AFv//wBb//8AW///QIT+v57A/mAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADe6f4fMHn+zwBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///MHn+z97p/h8AAAAAAAAAAAAAAADe6f4fEGX+7gBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8QZf7u3un+HwAAAAAAAAAAMHn+zwBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//zB5/s8AAAAAnsD+YABb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///nsD+YECE/r8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//0CE/r8AW///AFv//wBb///H2///5/D///f6//+Arf//3+v//0CE//8wev//9/r//+/1///H2///AFv//wBb//8AW///AFv//wBb//8AW///1+b//4Ct///P4f//gK3//9/r//9AhP//EGX//0CE//+fwv//3+v//wBb//8AW///AFv//wBb//8AW///AFv//xBl//+Arf//7/X//4Ct///f6///cKP//zB6///3+v//gK3//yBw//8AW///AFv//wBb//8AW///AFv//wBb//+40f//7/X///f6//9Qjv//v9b//+fw//+Pt///7/X//+fw///A1v//AFv//wBb//8AW///QIT+vwBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///QIT+v57A/mAAW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//57A/mAAAAAAMHn+zwBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//zB5/s8AAAAAAAAAAN7p/h8QZf7uAFv//wBb//8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//xBl/u7e6f4fAAAAAAAAAAAAAAAA3un+HzB5/s8AW///AFv//wBb//8AW///AFv//wBb//8AW///AFv//zB5/s/e6f4fAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnsD+YECE/r8AW///AFv//wBb//8AW///QIT+v57A/mAAAAAAAAAAAAAAAAAAAAAA8A8AAMAD8L+AAQAAgAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgAH//4AB///AAwAA8A8AACgAAABAAAAAgAAAAAEAIAAAAAAAAEIAABMLAAATCwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8GFF3/HxRd/0sUXf9yFF3/kBRd/6MUXf+2FF3/vhRd/74UXf+4FF3/pRRd/5MUXf96FF3/VBRd/ykUXf8MAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/FRRd/08UXf+ZFF3/zRRd//cUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/9FF3/2BRd/6UUXf9eFF3/HQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf82FF3/lxRd/+IUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/+4UXf+pFF3/SxRd/wUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/0cUXf+2FF3//BRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/IFF3/XBRd/wQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/LxRd/6sUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/EFF3/RgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8DFF3/eRRd//UUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+cFF3/FgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8mFF3/vRRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/9YUXf9AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf9GFF3/5BRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/9xRd/2gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf9dFF3/9hRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/hgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf9eFF3//BRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+MAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf9eFF3//RRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/4oAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf9FFF3/+BRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/bwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8iFF3/5hRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//sUXf9IAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8FFF3/vxRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/4hRd/xkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/eRRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+qAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/KBRd//MUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/1MAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/68UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/ZFF3/DQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/0EUXf/8FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/28AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf+4FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/eFF3/DwAAAAAAAAAAAAAAAAAAAAAUXf81FF3/+hRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/2IAAAAAAAAAAAAAAAAAAAAAFF3/lRRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/GFF3/AwAAAAAAAAAAFF3/EBRd/+IUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//RRd/zIAAAAAAAAAABRd/00UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+BAAAAAAAAAAAUXf+XFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//EFr//wxY//8MWP//D1n//xNc//8UXf//FF3//xBb//8QWv//E1z//xRd//8UXf//Elz//xBa//8QWv//E1z//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//EVv//w1Z//8MWP//DFj//w5Z//8TXP//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/wRRd/wIUXf8FFF3/zBRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8SXP//CVb//yFm//84dv//OXb//ylr//8NWP//C1f//xRd//8eZP7/Imb+/xhg//8TXf//E13//xlh//8iZv7/IWb+/xdf//8UXf//FF3//xRd//8UXf//FF3//xNc//8LV///B1T//xph//8wcP//OXb//zl2//8rbP//D1n//wlV//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//MUXf8aFF3/HhRd//YUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8SXP//EFr//32l/v/c5/7////////////p7/7/sMj+/0B7/v8VXv//xdf+/97o/v9dj/7/C1b//whV//9ql/7/3ef+/93n/v9Dff//DFf//xRd//8UXf//FF3//xNc//8WXv//TYT+/6G9///S4P7/9Pf+////////////6/H+/73R/v9YjP7/DFj//xNc//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/TxRd/0cUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//CVX//3yk/v/////////////////////////////////7/P//l7f+//r7////////bZr+/wlV//8GU///faT+////////////TYT//wpW//8UXf//FF3//xRd//8KVv//S4P+/////////////////////////////////////////////v///3Oe/v8JVv//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/3oUXf9uFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//EVv//xti///d5/7///////T4//92oP7/N3X//0yD//+Yt/7/9Pf//////////////////2qY/v8JVf//BlP//3qi/v///////////0uD//8KVv//FF3//xRd//8UXf//DFj//z96/v////7/4er+/5W1//9UiP7/PHn//zp4//9smf7/4uv////////t8v7/K23+/w9a//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+eFF3/ixRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//w5Z//8ycv7/7/T+//////+sxv7/AlD//wpW//8JVv//BVL//z56/v/Z5f////////////9qmP7/CVX//wZT//96ov7///////////9Lg///Clb//xRd//8UXf//FF3//xFb//8laf7/eaL+/yZp//8FU///Clb//wtX//8LV///AEz//2aV/v///////////1KH//8JVf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/uxRd/6EUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8PWf//LG7+/+zy/v//////s8v+/wZU//8QWv//FF3//xRd//8ATv//dZ/+////////////apj+/wlV//8GU///eqL+////////////S4P//wpW//8UXf//FF3//xRd//8UXf//E1z//wlW//8PWf//FF3//xRd//8RW///DFf//wBN//95ov7///////////9Uif//CVX//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/9AUXf+uFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//E1z//xBb///D1f7///////n6//92of7/Dln//wdU//8LV///AE///3Oe/v///////////2qY/v8JVf//BlP//3qi/v///////////0uD//8KVv//FF3//xRd//8UXf//FF3//xRd//8UXf//E1z//wpW//8HVP//GWD+/zl2//+Mrv7/8/f////////19/7/MnH+/w5Z//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/WFF3/vhRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8LV///Rn/+//H2/v///////////8ra//97o/7/RX///yBl/v97o/7///////////9qmP7/CVX//wZT//96ov7///////////9Lg///Clb//xRd//8UXf//FF3//xRd//8VXf//Dln//xFb//9Qhf7/n7z+/9Lg/v/7/P//////////////////ja/+/wxY//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/6BRd/74UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//wpW//9Dfv7/v9L+///////////////////////r8f7/6vH/////////////apj+/wlV//8GU///eqL+////////////RoD//wpW//8UXf//FF3//xRd//8UXf//D1r//yBl//+zy/7////////////////////////////Y5P7/cp3+/xBa//8SXP//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/+sUXf+wFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//C1f//xBb//9Igf7/jrD+/7zR/v/i6v7//v7//////////////////2qY/v8JVf//BlP//3qi/v///////////3Cb//8CUf//FF3//xRd//8UXf//E13//wxY//+ow/7/////////////////ytr+/5S1/v9Rh/7/G2L//whV//8SXP//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/WFF3/ohRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//w9a//8RW///C1f//wVT//8PWv//IWb//yVp//+Psv7///////////9qmP7/CVX//wZT//96ov7////////////p7/7/P3r+/wRS//8TXP//FF3//xBa//8maf//6/H////////e6P//TIP//xJb//8FU///Clb//xBb//8QWv//E1z//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/1RRd/5IUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xVd//8qbP//EFr//wdU//8MV///DFf//wlW//8ASP//g6r+////////////V4v//wlW//8GU///eqL+/////////////////+Xt//9SiP7/CFX//wZU//8JVv//Onf+//X4/v//////ia3//wBI//8NWP//Dln//wtX//8HVP//IWb//xti//8TXP//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/70UXf91FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xJc//8XX///0N7+/7/S//9wnP7/PHj//zBw//8sbv//XI7//+vx////////+/z+/zx4/v8MWP//BlP//3qi/v//////8/f+/+Dp/v///////v7//7LJ/v9wnP7/K23//xhg///g6v///////9vm/v9Kgf7/I2f+/yps//9GgP//jbD+/9zn/v9Dff7/DFf//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+kFF3/URRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8OWf//Lm/+//r8///////////////////y9f7/8vX+/////////////////6/H/v8PWv//E13//wZT//98o/7//////+Lr/v9Ae/7/0N7+/////////////////1yO//8ATv//dqD+/////////////////+Ts/v/r8f7/////////////////ZJP//wdU//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/gxRd/yMUXf/6FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//Elz//xti//9vm/7/vtL+/+7z/v//////////////////////9Pf//6bA/v8hZv//D1n//xRd//8HVP//cp3+//P2/v/D1f7/CVX//yRo//+lwf7/8/f+//79/v8+ef7/Clf//w5Z//9znv7/3uj+///////////////////////v9P7/wNP+/0V+//8NWP//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/1MUXf8IFF3/1RRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8SXP//B1T//w5Z//8rbf//R4D//1yO/v9mlf7/T4b//zJy//8OWP//D1r//xRd//8UXf//Elz//x9k//8wcP//Jmn//xNc//8OWf//DVj//zJy//9Ohf7/HWP//xJc//8TXP//CVX//yFm//9Gf///Y5P+/1yP/v9Igf//LG3//xBa//8OWf//FV3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//oUXf8kAAAAABRd/6AUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8TXP//Dln//wtX//8JVv//CVX//wpW//8NWP//E1z//xRd//8UXf//FF3//xRd//8RW///DVn//w9a//8UXf//FF3//xNc//8NWP//C1f//xNc//8UXf//FF3//xRd//8QWv//C1f//wlV//8JVv//C1f//w5Z//8TXP//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/NFF3/BQAAAAAUXf9bFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/jAAAAAAAAAAAFF3/FxRd/+0UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//hRd/z0AAAAAAAAAAAAAAAAUXf+lFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/9IUXf8IAAAAAAAAAAAAAAAAFF3/RBRd//0UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf92AAAAAAAAAAAAAAAAAAAAABRd/wQUXf/HFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/rFF3/GQAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/UxRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/iwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/wQUXf/FFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/6RRd/xcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/PhRd//0UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/20AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf+UFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/8UUXf8EAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/ERRd/9cUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//EUXf8sAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf86FF3/9hRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf9jAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/2QUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+RAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/gBRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+oFF3/BgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf+MFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+6FF3/DAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/4YUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+nFF3/DAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/axRd//gUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf+OFF3/AwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf9DFF3/3BRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/+8UXf9lAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/xkUXf+lFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/7wUXf8vAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/1AUXf/QFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3/5BRd/2wUXf8DAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/DBRd/3EUXf/aFF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf/mFF3/ixRd/xkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF3/DxRd/2EUXf+/FF3/+hRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd/88UXf90FF3/GQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRd/ysUXf95FF3/vBRd//IUXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//8UXf//FF3//xRd//YUXf/HFF3/ihRd/zsUXf8HAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAUXf8aFF3/RxRd/3YUXf+ZFF3/txRd/84UXf/XFF3/1hRd/9YUXf/XFF3/0BRd/7oUXf+fFF3/fxRd/1IUXf8gFF3/AwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////AAD///////gAAB//////4AAAA/////+AAAAA/////gAAAAB////4AAAAAB////AAAAAAD///4AAAAAAH///AAAAAAAP//4AAAAAAAf//AAAAAAAA//4AAAAAAAB//AAAAAAAAD/4AAAAAAAAH/gAAAAAAAAf8AAAAAAAAA/wAAAAAAAAB+AAAAAAAAAH4AAAAAAAAAPAAAAAAAAAA8AAAAAAAAABgAAAAAAAAAGAAAAAAAAAAYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACAAAAAAAAAAIAAAAAAAAABgAAAAAAAAAHAAAAAAAAAAcAAAAAAAAADwAAAAAAAAAPgAAAAAAAAB+AAAAAAAAAH8AAAAAAAAA/4AAAAAAAAD/gAAAAAAAAf/AAAAAAAAD/+AAAAAAAAf/8AAAAAAAB//4AAAAAAAP//wAAAAAAB///gAAAAAAP///AAAAAAD///+AAAAAAf///+AAAAAD////8AAAAA/////8AAAAP/////+AAAD///////AAB///8=','https://icons.duckduckgo.com/ip3/arstechnica.com.ico','2023-07-09 15:04:22.655855');
-INSERT INTO feeds VALUES(4,1,'https://lab.passiomatic.com/coldsweat/tests/feed3.xml',0,'Polygon','https://www.polygon.com/','"33a0-5fc70f2287465-gzip"','G','2023-05-24 13:00:00','2023-07-09 15:04:23.917718',200,'data:image/x-icon;base64,iVBORw0KGgoAAAANSUhEUgAAACYAAAAmCAYAAACoPemuAAAKRGlDQ1BJQ0MgUHJvZmlsZQAASA2dlndUFNcXx9/MbC+0XZYiZem9twWkLr1IlSYKy+4CS1nWZRewN0QFIoqICFYkKGLAaCgSK6JYCAgW7AEJIkoMRhEVlczGHPX3Oyf5/U7eH3c+8333nnfn3vvOGQAoASECYQ6sAEC2UCKO9PdmxsUnMPG9AAZEgAM2AHC4uaLQKL9ogK5AXzYzF3WS8V8LAuD1LYBaAK5bBIQzmX/p/+9DkSsSSwCAwtEAOx4/l4tyIcpZ+RKRTJ9EmZ6SKWMYI2MxmiDKqjJO+8Tmf/p8Yk8Z87KFPNRHlrOIl82TcRfKG/OkfJSREJSL8gT8fJRvoKyfJc0WoPwGZXo2n5MLAIYi0yV8bjrK1ihTxNGRbJTnAkCgpH3FKV+xhF+A5gkAO0e0RCxIS5cwjbkmTBtnZxYzgJ+fxZdILMI53EyOmMdk52SLOMIlAHz6ZlkUUJLVlokW2dHG2dHRwtYSLf/n9Y+bn73+GWS9/eTxMuLPnkGMni/al9gvWk4tAKwptDZbvmgpOwFoWw+A6t0vmv4+AOQLAWjt++p7GLJ5SZdIRC5WVvn5+ZYCPtdSVtDP6386fPb8e/jqPEvZeZ9rx/Thp3KkWRKmrKjcnKwcqZiZK+Jw+UyL/x7ifx34VVpf5WEeyU/li/lC9KgYdMoEwjS03UKeQCLIETIFwr/r8L8M+yoHGX6aaxRodR8BPckSKPTRAfJrD8DQyABJ3IPuQJ/7FkKMAbKbF6s99mnuUUb3/7T/YeAy9BXOFaQxZTI7MprJlYrzZIzeCZnBAhKQB3SgBrSAHjAGFsAWOAFX4Al8QRAIA9EgHiwCXJAOsoEY5IPlYA0oAiVgC9gOqsFeUAcaQBM4BtrASXAOXARXwTVwE9wDQ2AUPAOT4DWYgSAID1EhGqQGaUMGkBlkC7Egd8gXCoEioXgoGUqDhJAUWg6tg0qgcqga2g81QN9DJ6Bz0GWoH7oDDUPj0O/QOxiBKTAd1oQNYSuYBXvBwXA0vBBOgxfDS+FCeDNcBdfCR+BW+Bx8Fb4JD8HP4CkEIGSEgeggFggLYSNhSAKSioiRlUgxUonUIk1IB9KNXEeGkAnkLQaHoWGYGAuMKyYAMx/DxSzGrMSUYqoxhzCtmC7MdcwwZhLzEUvFamDNsC7YQGwcNg2bjy3CVmLrsS3YC9ib2FHsaxwOx8AZ4ZxwAbh4XAZuGa4UtxvXjDuL68eN4KbweLwa3gzvhg/Dc/ASfBF+J/4I/gx+AD+Kf0MgE7QJtgQ/QgJBSFhLqCQcJpwmDBDGCDNEBaIB0YUYRuQRlxDLiHXEDmIfcZQ4Q1IkGZHcSNGkDNIaUhWpiXSBdJ/0kkwm65KdyRFkAXk1uYp8lHyJPEx+S1GimFLYlESKlLKZcpBylnKH8pJKpRpSPakJVAl1M7WBep76kPpGjiZnKRcox5NbJVcj1yo3IPdcnihvIO8lv0h+qXyl/HH5PvkJBaKCoQJbgaOwUqFG4YTCoMKUIk3RRjFMMVuxVPGw4mXFJ0p4JUMlXyWeUqHSAaXzSiM0hKZHY9O4tHW0OtoF2igdRzeiB9Iz6CX07+i99EllJWV75RjlAuUa5VPKQwyEYcgIZGQxyhjHGLcY71Q0VbxU+CqbVJpUBlSmVeeoeqryVYtVm1Vvqr5TY6r5qmWqbVVrU3ugjlE3VY9Qz1ffo35BfWIOfY7rHO6c4jnH5tzVgDVMNSI1lmkc0OjRmNLU0vTXFGnu1DyvOaHF0PLUytCq0DqtNa5N03bXFmhXaJ/RfspUZnoxs5hVzC7mpI6GToCOVGe/Tq/OjK6R7nzdtbrNug/0SHosvVS9Cr1OvUl9bf1Q/eX6jfp3DYgGLIN0gx0G3QbThkaGsYYbDNsMnxipGgUaLTVqNLpvTDX2MF5sXGt8wwRnwjLJNNltcs0UNnUwTTetMe0zg80czQRmu836zbHmzuZC81rzQQuKhZdFnkWjxbAlwzLEcq1lm+VzK32rBKutVt1WH60drLOs66zv2SjZBNmstemw+d3W1JZrW2N7w45q52e3yq7d7oW9mT3ffo/9bQeaQ6jDBodOhw+OTo5ixybHcSd9p2SnXU6DLDornFXKuuSMdfZ2XuV80vmti6OLxOWYy2+uFq6Zroddn8w1msufWzd3xE3XjeO2323Ineme7L7PfchDx4PjUevxyFPPk+dZ7znmZeKV4XXE67m3tbfYu8V7mu3CXsE+64P4+PsU+/T6KvnO9632fein65fm1+g36e/gv8z/bAA2IDhga8BgoGYgN7AhcDLIKWhFUFcwJTgquDr4UYhpiDikIxQODQrdFnp/nsE84by2MBAWGLYt7EG4Ufji8B8jcBHhETURjyNtIpdHdkfRopKiDke9jvaOLou+N994vnR+Z4x8TGJMQ8x0rE9seexQnFXcirir8erxgvj2BHxCTEJ9wtQC3wXbF4wmOiQWJd5aaLSwYOHlReqLshadSpJP4iQdT8YmxyYfTn7PCePUcqZSAlN2pUxy2dwd3Gc8T14Fb5zvxi/nj6W6pZanPklzS9uWNp7ukV6ZPiFgC6oFLzICMvZmTGeGZR7MnM2KzWrOJmQnZ58QKgkzhV05WjkFOf0iM1GRaGixy+LtiyfFweL6XCh3YW67hI7+TPVIjaXrpcN57nk1eW/yY/KPFygWCAt6lpgu2bRkbKnf0m+XYZZxl3Uu11m+ZvnwCq8V+1dCK1NWdq7SW1W4anS1/+pDa0hrMtf8tNZ6bfnaV+ti13UUahauLhxZ77++sUiuSFw0uMF1w96NmI2Cjb2b7Dbt3PSxmFd8pcS6pLLkfSm39Mo3Nt9UfTO7OXVzb5lj2Z4tuC3CLbe2emw9VK5YvrR8ZFvottYKZkVxxavtSdsvV9pX7t1B2iHdMVQVUtW+U3/nlp3vq9Orb9Z41zTv0ti1adf0bt7ugT2ee5r2au4t2ftun2Df7f3++1trDWsrD+AO5B14XBdT1/0t69uGevX6kvoPB4UHhw5FHupqcGpoOKxxuKwRbpQ2jh9JPHLtO5/v2pssmvY3M5pLjoKj0qNPv0/+/tax4GOdx1nHm34w+GFXC62luBVqXdI62ZbeNtQe395/IuhEZ4drR8uPlj8ePKlzsuaU8qmy06TThadnzyw9M3VWdHbiXNq5kc6kznvn487f6Iro6r0QfOHSRb+L57u9us9ccrt08rLL5RNXWFfarjpebe1x6Gn5yeGnll7H3tY+p772a87XOvrn9p8e8Bg4d93n+sUbgTeu3px3s//W/Fu3BxMHh27zbj+5k3Xnxd28uzP3Vt/H3i9+oPCg8qHGw9qfTX5uHnIcOjXsM9zzKOrRvRHuyLNfcn95P1r4mPq4ckx7rOGJ7ZOT437j154ueDr6TPRsZqLoV8Vfdz03fv7Db56/9UzGTY6+EL+Y/b30pdrLg6/sX3VOhU89fJ39ema6+I3am0NvWW+738W+G5vJf49/X/XB5EPHx+CP92ezZ2f/AAOY8/wRDtFgAAAACXBIWXMAAC4jAAAuIwF4pT92AAAE9ElEQVRYCb2Y328UVRTHv7vTbdlSmrhIIkiRtvQHEUMaS+mLoUR8FURaUBORPhptMSqIBE1QRDE+sBQwMfYRK28a/wMfgAcT9UWlKAo81E20JZaEdnfmer5z987OjrO7sz/iaXbuvXPPvfez33Pm3tnGlBjqNE4Ri8W8WYJtr6OKSrwK31BX5TguVC6Xw3dXr7k+hKz7+8oENZtj297Yi1NTVF59M3PZu+c4jlevtsJvVpP5oS6cTbtQewaG1CMC99WlGW/OWuFqAiuCSmuogd7NasRaow50P6bWNgCuajDbF74L6XOuUtsEaj1a1A6sVnub1qvRri2qo064qsDCoAYFqhutArZCjeBB9QzWqt2Jh9WYwG2oAy4yWChUT7/qQjIPlsyDrVNP4yG1Jw9Xa85F2i4kgRGPa9eL6XN4eeJVDPb04+/ZW/Igmv2LUdUWk3sq62D59jy2d27B5PMH8PUXX7qdUbeSimD/gZqc8EEZlPBSZW0s35nHkIG7NBMZrixYGNQ2UWpBlOLAuChTKI1yfsi8cncWXLjDLzwH2UoiwTX5p/HXZSPywnf+bBqvHJ7EgEDNzf7hc9Phi0PhPhz5021eiWlKJ5vDkig3KMpNCBxtt4TXhNV/nLmdcikBps8+Kvbp1HkXanvPZtwVpVa6GhWrw1aToPDDugmD8XLvSs7lRLnhjY/ihMBll5aw76WDRWesgWIZCqYcAYvHsPDzdSQkpz7rG0F8dlEU6PeP9epUxhKkjOiWwZILqLXzXHQlq5BItqNdWv/cuAnHsRG3LJFWvH0vAXQOBdOzAM2y2BA24dZiDPdkaSoStqABW0QOCWTlw+AGPQWqbzUyP13BrpOnsf/4UZFWH/ZhoTSqG5ai0nFb97EBSbTELC+PcrKoHfJhjhGHV13qPGPL6kth7pcreEKgxo4fKQvFZcuC0UFJSlOpLsmuNqkRKjiIuWTyiWOKjUqlkBGoHe99KEodkTQRRfOvS8W+hVZwjUKPr0blCNeJVsHTcKVBfAPlSyR6U/hToEbe/wj7336zAJXfsP3e/nokMEIwdE2iVXQ48SfUdQ01duyNyFAEjARGx2rhCJUh1KkzGDsWXSmuRYsMRmcDZ5VVjko94ELtJNRbVEqePuZUhfBxDWNVgXEQ4fj0+eGy0uZ9mlFq5wcfY7RGKM5TEUyfhgQyS+tB3AJMzq1yHwgHiU3tklNXoaFer0kpQtHKgvG8tGWbtYVJfna4SlEtPggss3IlcIfsc60dbZi78S12naZSAsVfSlWGTyPpa9mdv0mOizb8Biu5FcqSTUOOqqDxjrVOwG7fROrUJxg++prIWx8U1wgFM0m6sr8HvdOXgfGTQPdW4PdlShdkA1a0yD3pe+pJDWXbiPEMrMNKh5IHK+3QKPD5O8CvPwIbm0WeQq5pB7m6vs1Q8sbAUWFnn+cbsVIaTMKhF5SZxgl3QuB+yMOFzc5XJb46NsZKg3H+INz0u3k4CV19kapIXx4sCHdoH/A/wVUGKwn3PdApyjUqdgENQ5/KgI9umrCypHK0cQlt90AhF/Xdhlyjg3G5UDh5Yh8fZmdDgMwk1YFxVCjcGelY1VC26sHC4CxJ1YPPygEXLWU5RSWrDYyz+pV7cS/w17T89LlXab3I/TH+hy2yd5gjhxMyZwPzd4E1Kf0w8F4dVj8YFzdwwXodYP8CxxfVra06+hAAAAAASUVORK5CYII=','https://icons.duckduckgo.com/ip3/www.polygon.com.ico','2023-07-09 15:04:23.917718');
-INSERT INTO feeds VALUES(5,1,'https://lab.passiomatic.com/coldsweat/tests/feed5.xml',0,'Daring Fireball','https://daringfireball.net/','"22c78-5fc70f2312ec0-gzip"','G','2023-05-24 02:51:01','2023-07-09 15:04:24.987618',200,'data:image/x-icon;base64,AAABAAIAEBAAAAEAIAAoBQAAJgAAACAgAAABACAAKBQAAE4FAAAoAAAAEAAAACAAAAABACAAAAAAAAAFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4MCyoyLSmQS0I81VRMRvNUTEbzS0I81TItKZAODAsqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEBBTMvKpRZT0j9WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WU9I/TMvKpQBAQEFAAAAAAAAAAAAAAAAAQEBBUI7NbxaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/Qjs1vAEBAQUAAAAAAAAAADMvKpRaUkr/WlJK/42Hg/91bmn/WlJK/1pSSv9aUkr/WlJK/3Vvav+Mh4L/WlJK/1pSSv8zLSqTAAAAAA4MCypZT0j9WlJK/1pSSv94cWz/7Ozr/5uWkv9aUkr/WlJK/5uXk//s7Ov/dm9q/1pSSv9aUkr/WU9I/Q4MCyoyLSmQWlJK/1pSSv9aUkr/WlJK/93c2//x8fH/xMG//8TBv//x8fH/3Nva/1pSSv9aUkr/WlJK/1pSSv8yLSmQS0I81VpSSv9aUkr/WlJK/1pSSv+wrKn/8fHx//Hx8f/x8fH/8fHx/7Csqf9aUkr/WlJK/1pSSv9aUkr/S0I81VRMRvNaUkr/WlJK/1pSSv9bU0v/uLWz//Hx8f/x8fH/8fHx//Hx8f+4tbL/W1NL/1pSSv9aUkr/WlJK/1RMRvNUTEbzWlJK/1pSSv9rZF3/0M7M//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx/8/NzP9qY13/WlJK/1pSSv9UTEbzS0I81VpSSv+Ff3v/5OPj//Dw8P/w8PD/8fHx//Hx8f/x8fH/8fHx//Dw8P/w8PD/4+Pi/4R+ef9aUkr/S0I81TItKZBaUkr/WlJK/1pSSv9aUkr/WlJK/4J8d//x8fH/8fHx/4F6dv9aUkr/WlJK/1pSSv9aUkr/WlJK/zItKZAODAsqWU9I/VpSSv9aUkr/WlJK/1pSSv9aUkv/5OTj/+Pj4v9aUkr/WlJK/1pSSv9aUkr/WlJK/1lPSP0ODAsqAAAAADMvKpRaUkr/WlJK/1pSSv9aUkr/WlJK/7i1s/+4tbL/WlJK/1pSSv9aUkr/WlJK/1pSSv8zLyqUAAAAAAAAAAABAQEFQjs1vFpSSv9aUkr/WlJK/1pSSv+GgHz/hX97/1pSSv9aUkr/WlJK/1pSSv9COzW8AQEBBQAAAAAAAAAAAAAAAAEBAQUzLyqUWU9I/VpSSv9aUkr/XFRN/1xUTf9aUkr/WlJK/1lPSP0zLyqUAQEBBQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4MCyoyLSmQS0I81VRMRvNUTEbzS0I81TItKZAODAsqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoAAAAIAAAAEAAAAABACAAAAAAAAAUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEBAQcZFRRHMy0qk0M8OMJMRD7bVExG81RMRvNMRD7bQzw4wjMtKpMZFRRHAQEBBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAcGBhczLSqTVU1F9FpSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9VTUX0My0qkwcGBhcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEBAQYuKSaEVU1F9FpSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/VU1F9C4pJoQBAQEGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHBgYXRD04xVpSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/0Q9OMUHBgYXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADw0MLVBHQONaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1BHQOMPDQwtAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAcGBhdQR0DjWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1BHQOMHBgYXAAAAAAAAAAAAAAAAAAAAAAAAAAABAQEGRD04xVpSSv9aUkr/WlJK/1pSSv9pYVv/jomF/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/5CMiP9mXlj/WlJK/1pSSv9aUkr/WlJK/0Q9OMUBAQEGAAAAAAAAAAAAAAAAAAAAAC4pJoRaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv/a2dj/uLWz/2BYUf9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/2FYUv+6t7X/2NbW/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/y4pJoQAAAAAAAAAAAAAAAAHBgYXVU1F9FpSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/6yppv/x8fH/29rZ/3hybf9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv95cm3/29rZ//Hx8f+ppqP/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/VU1F9AcGBhcAAAAAAAAAADMtKpNaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/eXJt//Hx8f/x8fH/7e3t/5+bl/9aUkr/WlJK/1pSSv9aUkr/n5yY/+3t7f/x8fH/8fHx/3dwa/9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/My0qkwAAAAABAQEHVU1F9FpSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/397d//Hx8f/x8fH/8fHx/8jFxf9nYFn/Z2BZ/8jGxf/x8fH/8fHx//Hx8f/d3Nv/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9VTUX0AQEBBxkVFEdaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv+xrav/8fHx//Hx8f/x8fH/8fHx/+Pj4v/k4+P/8fHx//Hx8f/x8fH/8fHx/7Csqf9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv8ZFRRHMy0qk1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/395dP/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/fndz/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/zMtKpNDPDjCWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/+Pi4f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx/+Lh4P9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/Qzw4wkxEPttaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/x8XE//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/x8XE/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9MRD7bVExG81pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/Y1tV/8C+vP/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/wL68/2NaU/9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1RMRvNUTEbzWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/3lybf/d3Nv/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/3Nva/3hybf9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/VExG80xEPttaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv+cl5T/7e3t//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/7ezs/5qVkf9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9MRD7bQzw4wlpSSv9aUkr/WlJK/1pSSv9jWlP/wL68//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/8fHx/7+8uv9iWVL/WlJK/1pSSv9aUkr/WlJK/0M8OMIzLSqTWlJK/1pSSv9aUkr/dm9q/9rY1//u7u3/7u7t/+7u7f/u7u3/7u7t/+7u7f/u7u3/8fHx//Hx8f/x8fH/8fHx//Hx8f/x8fH/7u7t/+7u7f/u7u3/7u7t/+7u7f/u7u3/7u7t/9jX1v90bWj/WlJK/1pSSv9aUkr/My0qkxkVFEdaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv+/vbv/8fHx//Hx8f/x8fH/8fHx/7y5t/9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv8ZFRRHAQEBB1VNRfRaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/46Jhf/x8fH/8fHx//Hx8f/x8fH/i4WB/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/VU1F9AEBAQcAAAAAMy0qk1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/YFhR/+rq6v/x8fH/8fHx/+np6P9dVU//WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv8zLSqTAAAAAAAAAAAHBgYXVU1F9FpSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/wsC+//Hx8f/x8fH/wL+8/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/VU1F9AcGBhcAAAAAAAAAAAAAAAAuKSaEWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv+SjYn/8fHx//Hx8f+Qi4f/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv8uKSaEAAAAAAAAAAAAAAAAAAAAAAEBAQZEPTjFWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/2NaU//t7e3/7ezs/2FYUv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/RD04xQEBAQYAAAAAAAAAAAAAAAAAAAAAAAAAAAcGBhdQR0DjWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/8bFw//Fw8H/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1BHQOMHBgYXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8NDC1QR0DjWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/lZGN/5WRjf9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9QR0DjDw0MLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAcGBhdEPTjFWlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9lXFf/ZVxX/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/RD04xQcGBhcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEBAQYuKSaEVU1F9FpSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/VU1F9C4pJoQBAQEGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHBgYXMy0qk1VNRfRaUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/WlJK/1pSSv9aUkr/VU1F9DMtKpMHBgYXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEBBxkVFEczLSqTQzw4wkxEPttUTEbzVExG80xEPttDPDjCMy0qkxkVFEcBAQEHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=','https://icons.duckduckgo.com/ip3/daringfireball.net.ico','2023-07-09 15:04:24.987618');
-INSERT INTO feeds VALUES(6,1,'https://lab.passiomatic.com/coldsweat/tests/feed4.xml',0,'Reddit Italy','https://www.reddit.com/r/italy','"10866-5fc711f20eb3b-gzip"','G','2023-05-24 14:13:51','2023-07-09 15:04:26.430919',200,'data:image/x-icon;base64,iVBORw0KGgoAAAANSUhEUgAAAMAAAADACAYAAABS3GwHAAAhr0lEQVR4AezbA4w0yxrG8Xe9n23bthfVPYtr27ZtO7i2fWzbtm17OXjOP5NJ8lmrwdvJr59aY4rdXebHoR9qtHIFq1FkQzCS8lhMo7wer8WnFdtPyb/iBFykYLeQ9+JJPIM2ZHLa8AyexL25z70Qx+Ovue/1abyG8jpyKsZiJIbkfpdymDskB/VJLmGVirOVfTSmKthG8h34IY5RsJvIp9CGDnSiC91IIoU0MjsRdpbZSRopJNGNLnSiA214CjfhGPwA78AGTBONkRxGVsPc/u3tna7BKrKVKLaJmI9WfJX3HYf7dqrcO1ds9audGspOjeRhBTub/AneoIQtIicq2DCyAuZ8BNi7Jqsmx2GOgiXIbynOVqZnBrii96RhPIOzFOwbZKyYv42/0UcHwEeAyCoxXrEtxpso/xG3IwUVmaRiu438A95IeSk5CVU+ApSaYCPJJXg9fo07kYFKyAP4O96MJYptJKzUcCoRzdmebiYifBvXIQ2VuDSuzU35AjlTwSp9ClQsIqvJDffvwv/xJOT26kn8D+/CSjXaEFgx41SkIhuOLfg0zkY35A5KCpfgi9iihA2DFSNORabBBiuyOnwX10KuR67FdxUsJof5IjhfhexUZxvlb3vF7xO34ocIarTBPgXKFy+zMkW2Cd/B5ZDrU9fj+wq20RfBAy22ufhc7rkZuX6TwQX4LBb4FKi/NdsI8p04Di9AbkC8gBPxDgz3BtA/1uG3eAByeeEB/F6xbfcbYX0lslH4OC5AEnJ5JYXLFdun1WRjYYWAUwEI2as7/8JjkMtrT+A/2OZToJ5qtVry/bgCScgVhCSuwIcwxBvA4YhtIfkbPAy5gvSogv1asS3wNcChiCyBM9AGuYLWhrMUrMXvAxxInJ3yvAc3+pSnqKRwCz6g2Ab7CLCnMkxSZN/DY8hArqhk8Di+i4kKViYfARBZuWKbR/7Bb2qVhBfwFwVbqISVl/bToJFVYBWOQifkSkInTlFsG8iK0rwKFFslWYcLfb5fkpKK7RIyKGFVpTUCBKtWbM3wbYm+HfNGxdaK6tJYBDfyhwZ7We75cl/sugzuwCuVsJriHgGC1Yo/FHcgAzmXc7diew1ZW5xrgEarUbBXU74fcm4v7s/WkdhqimsK1GSVCvZSRXYX5Nx+3KvYXqFgVcVxH6Axe5mrifLNpJw7CLcpWLNiqyjsEWCclSlYHW44xH+Ac9ejXvOtDNZXOPWhYGtyG1gykHOHIIOLsbpQF8HzcLxf5+8Bl8axCragoNYAuQfb/ogU1APOpfBnxTaxMNYAwQYpsu+hA3KuF7Tju0rY4Py/ERbZe33vbh9wT+AD+b0GCBaTN/Vw0esasGMn9WhAI6I+FNCAOuxAI+p3+h3CgC+Kb1Fszfk6BVqU28aYhNxhaq6SPr5J+u8PpRN+K/3re9LP3i19tkF6ywwpUS7V5SpkYy9Wynq8dCg/p1H6/eekY34hnfpn6cTfSf/8jvS9N0pvmLLTzxwQKZyJ+fk1AtTZEAX7jc/7eygukz68RrrlMimdUvZIdktPPCjdda101ZnSWf+W/vMDGsV7pE/XSW+ckqvAaDiMRhHQVCl9PpJO/xs/5zrphWe186Fkl/TI3dLlp0i/+Kj0ihED2QhebO8soOM4lq9fkpkdznvPL5w4zIza3ZmRGcPMzMyx5TAzMzMzJ6aw2XE4MTOTZEn3q3t6zmf9961B2p2dXqn7nF9PyNJG6pqurq66tUR5QGllkwt0mjJVgaOOeAoX1rNlWOUoX2KM4q9RwIivgK9eMTvGbScA5+0HHLwekEozCLKi73nPGcA/Y4HqKqxyzJ5qdoYjNwL8otjUJpQz7DAAI1r1Qw78fmcAh3UAhn2GOo0li4xR/D0GGDMYGPS6MYpbjwPO2Rvou7Yxhpr0aAPceyYwazJqNSqWAl+r0R36b+5acZ0HfoAn+8R7D5BkW1F5QSlXkCXOAI7rCMyZjpyNxQvM4h4/zrhVQ94CXroRuPkY4MzdgesOBab+jTqN8sXAK7cCXZvH9TMrV55DJ1krPmlEX85TZirIEkdpI+DSwLghUY3qamDxfGDWFGDSb8CMCchq8OtccAAP5nGGRs+PxwXyZF/2kcqR6+Po3gp48HxkHBPGAT98BMyewsOxUmUWM4lz8ID+/iNAl2bx5gsFsmd+w6BJaUc57Bw1nnN4St+1GIXJ7MY8NwDosx5w1EbGn7/7dBOeHDMEmD/bLMTKZcsNI1+D32vyH0CfNeL8+ZUrD6GTtM2PC+RLsXKc0+fPsQEwnPn7MKQNE368/tDlF1FBMf1uE705cB3g2M2Bq3sAT10FfP0qXRsaDSNFDF9yx4jWKGiAPE+Yw3BcjEcgx1BsK/JDMC8hIsjydJy0jYnkpA8eXs/cbeW3wIzjd2sB9GxrdpITtgbKDgSeKQOGvAlM+8f4/ksXh0aRw3PGwrnA5Z1pmDZkjW4arQH40li5SFmgwJHD298BB5m3dfr49j0TwvRqeaFGo+BOwbMFd4rz9mW83/jsv/5AY6hPBkAWhGuzcZSH4L1dQ7oI6NGa6QbpESDz9+8/DCRy4F4wUtOpCdC5GXD0psBnzyEnY95M4JQd4naBCBmo7BGNARwgzZnm7FyfCOizJvDNO/TV0/1rk5eTyPF5gxdgj12Wm0Pw+J+B3u1tKqAZUAt9oVpp+iTgyzAFjhzDA3CmCykeaPv1BpI5/n4phcl182chq8HzxGu3p4VBY+dH5YDc7gCdpFUoaw1HjgmKGUUxiyl9/PwtcOI2QCqiqNMHj2UXIZo2Hjh1xzT/3wpYPNMqdzuALyklCmUHB9+ed5wMVFYA6eObd4GuraLJvPSU8/c3SXB1GYvmA09cYdvbn5ARCKQkNxdhKWkb+v5wRHQAfvu+9AiQMYi37wdKIrx74IGYef5T/qz94mc0yfj+tjJAaZ0LF2gfZaQCRwRwEfFGN90VmTsduP8cIBnxBRxDpdcews+weqHRSb8Dr9xiQrO+2MwwZa/sDCAlLfV5sQJHFBSxysuEEtPHhF+Ay0rzUwbJJ315ZneOGghMHw8sXcT0CnM2oTH+McIU45T1pdsT/jnruRApaaHICuC0EnzZ3sX9I6RTI13knUzaQvoY9y2NI38LLRXeFfDQfdNRwJNXsfKM9xPmAu3CBNCtZdqOZD0Dle3qtgMwlurL8RHn+rsDMOPx6REgukND3wGCxvn/TCklUaMwns+w3NIYY0FRrhyPUmla+yiQLxspryqIEJcC/eVLxtWoOeh+vHp7bi7AHC8rG9Z+BwjEC9taIkLcAZg3qXzjpxea3H5Sbvx/x3QlVTsDKJX2CGRAxB/MKUAwA3Th3MwH4PP2yZUBODzpj5S0W/1DcKls40KfEcNszRuOMO5O+vjle6Y1587ndgyHJ1uvXjo0DwyBHOoEriKmS1MTdqTCQs3BC7HBrwNeDrMrHRXw5CAkpIkiNeCUhi/rKg8riBAHL6B++tQs+PRb1uevy73747gfgayz6lSIUtna9fLKAyxS4YVT+qC2zw2H594AHH+gVLZaeRjUdOc73On65yED9Pz9gAVzkD4w8VcWmOTe/3dUIpBD0Emarrgo3pd1lMcURIzTALrvLGDJwgwH4O9Y3xvN93U8rKy94jBoIJsqv0b8IRwsTfzwcaCi/H8LTL543r39o8KTn5VNMkeBktJIn6Uu+pOnFAiGOtNrgHkn8PgVzgCiYxk88ZCQRv8bBfKljVKmIGIcR29iDrvpY9Zkavw4A4iWqxFIm0xRoPWVL/LwAdwNcL9erMfNXANM4/AlKhyefKqsn+kirCN8masgYpwBPH1NhgNwNfDzUB6Qo/3+jrlKx/97CE5JE3jS14U/64hHakR46OMz05PyhdTNZFoD4/4HrWs09Ye+bfQ80zX3P34S6NyUaRLLC829NPwscVTCk55Kk5o7QGvFaf7UdrFzsfZsYxb34f8FTtwauDhF/X1TMP7OA8DAV4EfPgZGDwZ++4lx/sylh+WLTdMJKsRRaY1KbidvZ0Ss+LUPWZ+GRPlDc4scFNXNMBxV8KRMab3cAHxZS/nISZ2vYtHzzdx7DeCIDYDTdmItrdHfHPgaMPEXVnbVkC8npHo5IKsQmuKfrwldJZ4Nhn9B9WiTJnHr8UYl+pjNuKPwMzG06gxi9ahW3g/X/P/X+v+vPicrCHF4SioMWXKR8W3cv7cpCB871AjZxjkqKymmZbRDX77Z7By8QT68g1Ga8FbSMM8xSemgMAQqxfBkL1f6WGPR04+ny3H6zqbx3Bcvmrwd28fMycDgNyinaFwxSqfTRUulGYOjHIHsgVIp5g7QTDlOqWjQCz9pNHr4pqdWDnVvqM1fsIOH6uGfm5rjC0uAozY2KdhJZwhKhXK00kzCfqs3NcgIkGklanzos/fiYqEcofHF69PgncOg10xnmTN2A3q1b+iGwBvhG5RWNID2ylsFEQFKhSRrkFK8Or7x2U/38k7AizeYTooNYfwx3LRcuijB6FVDNYQq5XV40k50WksZa18EKE2mIygycfTjtzQRmNN3Me4KQ4QMC5ashnSHpyTMG5+hRkoSMv2gQQ729nrjbuCKLgyvhi2YarlzlpAav6NQRsW8mKyPBI1W1pIwAjTbWveEC/yq7sCjl7AxnNHLYUhw5FfAjx8Dnz4DPH8tcOORNAgeYDOLNyWV7i2Bi1JGcoQLwA0TSXr9TuAS35yBEqvxOznkX8C5+5g+w3efBjxyCfDQBXSx+M+M6O7B65v/lvhWMguedKALtLuyWIE1JBT+AG86mp1M+EtarVY9bCVKQ6EhGNeoBidsAzzdD/hrFNzIMKgSTSW4s/Y0L5FUBpfxhK2AO0/hjTXrFjJLOvKf/fYj/xsahPkzvpU7wmJ4sosgkIPgyxKrLpz4S+DbfvbUukU/vv8AuO4Q9t5iOoKR+vv+Q3NR5caKBy/wKJJ739nAIf8GkjWCBLccS7l21izXrlP9d+8Dt59IN8u23WCJ0kcoIKostWLxB0XmUEr3pqoyex+Xqgtv3mO6JLpRu75fnz9vOteftB3w8i3ZnZX4Z+lmHbelTWp3SxHIeaLTbVZcgnnCHzgLRXJ6W8qkszoON/4cyZeReZNnO6h/RHVpGlTSGt3QW0Snp2K/BEsqjOxQJqT+Djfogn74GHDkxjYYQYXyhOj0bqxlkJ5y4Lqm2Rr99/o93GCwgheO3dsAXuyXYW/RBRoS6y1wUrmmV0OKx7vBlPBL/Lh3gUploOg0LrZb4JQJdzJv3o0GNKqreCg2N9FerLfBY0WnibHdAicVCkRRItyNhjUmjDMXZslYb4PHi04zYjMAT7n1ONMgwo2GNfg756VaUBynAUwTnebFYgCewksqVji50TAH72iY3+XFZgBzJLY0iJTC6qWPnoQbDXQwr+u4LeJMk1gssUWAUsoxm5p6WttGdTVDsqYed9E8YOEcZS4vhMK63ypLUxkq+blNgf1ShX9ts3v58zdszxrnOaAyXgM42kID4MJhiyLeS1zVzZQVsik0s1IvKKHaA/NlaAyMZthzwTRnGvDjJyZtgbk8hO7lkLdYKhkqUVTDqvHrj0xrj90AYnSB/ksXyJ63/pyppi/uERuaYnhmRQZFy5talxYb9QUaxB0nMYMy3jcsdyImDDKv/5TtqUVEqRalSUhTKk0b9Yhny1jiadeOMOpr4OTt4zSAxfEegtkl8YUbLCkQ+R3o1zuUJi9aPYlzllGyNiGORUV3hzpDV3ZjQdAqPnORqQc+x3xea/KjqINEKchUvIfg+MKg5Nbj434r8S3Kxc83Zi2NuIiLir5s/nerX38ALjhgVcaaRhHz81lIZIf79sL15iXoxRcGjf0ijL9EikrFNpaV069nSLbuvwiqSMydgbyNGRONDpAvdcAYLS+iYj+3sBWUF/dFmBdzKgRFp95/GLENvknpP6ey+H9g8cgHj+bP9WFJZ+86tlH1FJ4V7j83Xldo1ECTAZyMPxVicKzJcCmlrC8wdzpiGSyT7JnF258khBVTjAzlp4aX0amSrHZehh+Z7x+fZtHjlwPdWgFenCK5JhnunTjToU1C3L+At+4DKivy/4tgJmoqB67cefuZ3STqMeh13p9k95k94Q0sb2Lji/6ctnPc2aDLlDdFpydjL4hJKGftAYweiLyO6eNzk5CVUo7vaGTPox68n+jaAvCyNAAe+O85A3kf7Ixz4xFA0MiGgpjHBZ4NJZGkiPIn+d2WeeHFA2EuDODIDYEvX8qPy5bM0c5LCZN8jjnTTTFMrzUAzwp90Ju5A1xgTVE8Y+vX9GRYkaG+PO0A++XGAHhjPPjNwjKAaw/Jb+TqiStN9V/KpqJ43zJZFN/409TCp6Zl5GkPPFAmsz8D0IVjikTk4/U7zGWdl3WvYsqV5Cftedx3vDk38iopi2RRAuktOu1moTAW0yT4Q4v+juDhi4BuLbNbUCUKdYgoJxLt4C7D3Sb7QzAX4/PXI9LBZELe9p6zr2kukrJMGCuQnYWNAqyVRvQUpsxGOUZ8ARzXEUhmU9ewJvDaHfk7uF/dE0hk+bNlGvKwz6K/YWfRy/52SiMq/5GwVcwYK8Vx+dZgB5QoB1OHKeHXtY67QEooMJs/rVGmMLxxFxPy6v5GLW0CDDiYKd7RGwAjTQkrxXFHKWtJKI/+ppXy6PRTv30XkQ/WJF+UrH15XjIMfw55O/+hRKZf8PN6dUxD//6D/ORY8eWSsFIe/TWlnYQNMm60skFGUmE+ez4Guziyk0opF9XqRn62MOK9PEznezAT9OJU6IbVwl3rsybw6m3MxcmPod52oo0GsEy5DgEbZHjCFknHWtkiqUTYnyt/GZZ/juCWzQ4qmRtveEoqvES6sivVqCn5F1/9wu/DgOsPNenQqdW8/eVZZcFs5GVQk/WmI22USK9AIEehVJqKTsVsGMaLASsNgL26qirzmxrNhU29e4Y2uWhKG1M7n6nE7AFshGOn/FmLzxXxoZhyg5f4yw3BS4NnqSs6A0PfMiWe+Rr8GTFr1T4DKEep7I7OUiw6CQLpELaOhFUkFLNd5//tOm8WMOl33kwbvfvfh5s2SrOm2Ce4y58Pk+RGDzIvjKeuYaNtdsFhmJdnFP77/Ndd8Gx1WScbDWDi8japvpC1lA+UausM4OlravvWcgK0/HlxZ5g50bg7lTHtVHxxsClfyrIIUCDvKmsqIpyU1sq11kWCksptx5tfpBuFN3jPYHR/7IoABdJfaVXTAJoova2LBKWUc/YG/hqNAhtu0I389FkgZULLFlGJQHqgVJooIjoZfOmozFVgDWHYjvnjBTbcWDCHpaY2hkBnI5AtFCGcDL6sr3xu311AETtBRh5xcSOCCFC/3jYegD8O17oQToZA2ij9rbwMu+NkYPYUFNBw7s+ogaz3tq8JtydXKW0UIZwMvjRSAmWZdW7QUZtEUG7oRqRZoAxfJ4tsvAH2kJJGihBOywlkU+VXKzND33vItTktlMH7k0s8G3sDj1U2UYQQTjVZR3lUsW3bogJaesNsN2wV6GUCI2ssfLGLQB5S1lYkhFMNPGkKXw6zMjGuSzMWV0SgHOFGBJmqNr79K5WDlaYr3gFIqWylzz+s3AUuDWzfBVzXF6ZdMG/KF9v4jWtbkRpwSiOQdeHLgwqsrA/46AnKGeZXLn3ct9TTZF6Q9e2cmIFJAVw2uKZkel7HjAlU9rAv8mO4N3TxZeU7QEqa6PMQ66JBhJy5G2+G86MaQUP74BHg5O2oHUodU8q5MyHOzhwglnfefDRw8HqmpvqB8/hZ8/OzqihnoIKuqo2Lv0I5kLe/q94BSCDbwJcRCqyEOfu8aYw6ls3LnCM2ADwxpBTWCvD7M/OyYqk9fXepF8p0bU8MRvyK2aHctaLvUzB2iKkz9sVGhsGTrRRJg1MGApZJSpkCK6GPyTdxVWW0tbe8e0iPZnhKUGSk/V68gZVZ8bVMmj6B8jG8cTVqcakMNdUsSYzaUHlJWXagra4P6ae0UyQdTpkJxAt7B8BKTtyGb+EI2/5Um1/sRYnM1WFJhU0nLkxQ5543n/mrDmNdwgePATccYYrjkyv4fId1YBoJd4Boz0jPDUjvrWAT05WUIrUzAE821OcrCqyFUaG/x0Qb02YiHhdapjespySUzk1M3vu9Z5lD+h8jcn9pN+1v1keb+ojLuwB91gASGRZ+KtyhWAzzyVNs8Bftz+fdB4GD1oPF6+QlZcPaG0CKtcJyvLJUgZUERZT3M8UfUQ4uvpdu5mE489vWU5JKSuEBlLvCbScAL94IfPUyMGYw+3Px3ELXatWHWZZlsgLt2/eBt+41h9mrepgifEbCSlbwGRKhRumjlzJilb8WR77YSrlyPGt/FckAp5WyHQIZZPUuwK2X4ktzp0cvpc4Cj/vPAQ75V+ZFSFJKIoTnB+YxMXLF0sD+fYGbjqIkoXJSGieya765RLq6h5GHPHFrpoMvX9yplRhfz7b82lSOy08F3fcfmsYivtjM1whkO0VWAKeV0hK+XKhUK7AVdjyhjCLj0JGPeTMog05DoE5/uDBXcnmXUpJKIqRkNUgoyfQFn/mNz+YePATT1+dOmJfB4noatelPZjMXIJAW2RgA2Ru+DFdgLZ5CH/3GI4HJfyIvgzsOdwTKfZ+6A/WE0tyjCDAGRUzr03vONA0zJv2Wv6Z31EE6ZYdCWPw/KXsqsjI4rZxSaUMRIQVW44X5Qv375LfHAIvOqc/z+XPAHacAJ23LQ3H6G7z2pO8gQRH9bR7IGdun4nJ+b3rDAy91VO1f/GR53W92OwDxJEktxYIwgk5Njeb/4DfynwXJsOlfo4yu0Cu38SDM22OGI2kUyxe0txJSSlBsIitn78ldjc27TY7NH8Pp5uU3FYSDqtfc6Q7vUCiLf4RSokj2OwBJSEt4VI0QWI8XLiBKiL98MxvXxVcUwmgOb5P/Hs0LM5OjM/A14LNnjc+eDiNGP30K/PI9Dcnk1c+azENtfH19aXTXHmwO2b4UCEb2UJHc7ADEWNRPCgoGRlAoq/LPWKY22JMxyTd4RRr8Z5UV9nxOfp4vXwTO2hPo1CzdlbOZH5T9FcndDkBS0hx+1NpBEdClOfvRmkSthfNWZ4G5ghY2JWG+E8O9QaNCWvxVSpnSLPcGYNhTGaigoAiKTTYn4/Bjh/KN6wwhU0IbXS3mWJ2+C9ClBeBLofEVOx4pQnLrAhFfGisXKvMVFBydmgBHbgQ8cjF1K3m5RUNwb3yek0Z8yYQ286IwfRIKjXnK+QikcXQGYNgMvrwdoSsUffpE52YmdffZMhNDL19MQ2h4C59vfCbx8faZPcOYPepLIVKlvIlANlEkagMoCvsJTFBACtYQGDJlfs8LNwDjx7JlUP0X4OKux/sDRpuYOtFnLSP/7kshM145imszegMgvrRVHlYqFBS+ITRmEhtzcRiqZBUV03zrl39P4578OzNEmSnKPCWTWOdLoVOuPIiEtFGktnCqG4HsA1++iTZPKAZj4MJg07u372cMnCoHJs+/4EY1XRxmspq3PfsEsGKMKRuBucyqB1QrQ5Q9FKkDnLLAk3OjL5qJ0Rh6tzdF3m/eA/z6IxUpmNJsn5uUnko94Rdg+Oc84zCr1BTu+FIfmamcp0gcBkDWVl6Iqr2SVd3r+65lCnAevxz4+lU2f+AtL9ME6FfHo7+5eD5vihnRMoU77zxg0qpP3dG4dZ4Y/HpJufIcPFlLkbrCKTt82Vf5waKoUPTZmL5y6H/YKM/0EnvnfvYz5h0Db50pTcKDJl2Q7NspMULFhLuZk+nDs1DGSJ58+RJLMc1N95m7G9ctlZ6AV2+pUr5T9lYkzh3AEMip+pyqoMGQnusfFJlksfP3N2HF+84GnunPswQXKw2E2kImhZox91GDjJICGaNwUVPW5MdPgO8/MuWPHz8FvHorE9FYNMNCGfN279kGSKbXDDQopignK2KHAaRYOCP3K0sUxIB9RkESNQpc6JIwoYxF7JQNP2pj3kUoHfmkjg9TDyi7Ygp8vBp/liTFjjd8/CxR7kUXaaFItnDKDQE7zMgnKxHUcnhppGrgpeFnwLFM+QiebK5ILuCUO3zxlbERhEYdjmplNAJJKZIrOOUWX05UpitwOHLINOUERXIJp9wSmLTpHJ4HHI7FShm6SnNFcginCDBNyB7LQZ8Bh6NSeRyerKdIruEUDYFsnmXWqMNRpbyhbKFIFHCKDk92ZgGNOxQ76kA1PBmi7KRIVHCKjg2liLXEdVCUcDhGwpMEOkqRIlHBKVo8aYRAOsGXnxU4HKvEdCrtjFJppEiUcIqeLiyllG6r0XvM4fgbgfTUZxNFooZTvmgKT/qupJLM4Riv9EGpNFMkH3DKH5SrCKQXO/a5g3Ea7sD7l9KX8juK5AtO+SVgn1bproxTnBE4qsO10B1JaaZIHuEUA/TvAimlhmODvidwVMGT0UqXfPn8aXCKCaPfcgDvCVwGaYPN7BxK4WW25lUkBjjFSCCN4MuOyuvKUgUNAsdS5UN4srs+GykSE5xipxgexbbkEWWhAke9ZqHyhNIRnhQrEiecbICCRuuHWaTT3OG43h52pysDmNimzyJF4oaTPSSkediZcpRSoaDe4Pz9scrJSEgLRWyBk334klA+VBYpKHicy/MxPPEUsQ1OdmJSYO9TJitwFCRTlXt5xlPEGUBtKZHm+jyJGjAuVFpQVCjfK6ehRFoqYiuc7MejDqk8q0xT4LCaGcrz6aJVtsKpMEhKe32erQxyB2QrqVSGKucrayniDCAadlMeUMYrsAaXxfmgspciUeIMgFALPpCjwxvkuQpiwbFAeUs5Cp60VqTQ4FTIbEh5bFd3HEux+tfKhQhkU0UKFU6Fj2mQ0E8ZqsARKcOUAcruihQ6nOoHPaVx6IOWKcMVOHLKGOV6JYGu0kyR+gCn+oVHpWo5QBmgDFPgyIqflDIlGZmf784AEeBLawSyJ0On8OSTWnexcbk7g5QL4cle0S98ZwBR0kTZGr4cp7ykzFSwQtwl1kvK8coOSnNF6jGcGghGmmUjJmXps78yHE67lFQqw5R+SkrZkD8rRRoAnBoggbSDL9vos4dyM3XnG5gxVCm/Kw/Ck4P1ubU+2ynSwODUgOkmxQhkTZRKR30eEjb/HldPE++WwZOfFd7YHoJS2Uqf6yIpjRVpqHBykM7SJGz7uqniIZCr4cmnypxwd6gqkMu26vCzViqzlU/gyVV0b/S5ibK20kQRODhlwEE90zb6XD+sS+gJj6FAeU+ZpJQrFcqyGA3DLHTzGSqU8vCzvcfPGrp3/Ozrw5M2KJViRRy1V4ZzULOGoUBmOXrSIVQzOEaf14f5SKOVWcoiZYmyNM1IzA5iqK4BSNo/qwqpTFvcS8OvvSj8XqPD7329cjQ82U3pEH7G1iiVJoo4nAHknqQUU+YRnrTSZ7sahrELtS31yfykW/T5ZNgkZJAyVvlLmanMVRYq1SELw382M/xvxoZ/5u3wa9wSfs0+ys7Kf5S1wu/dimp7/EyKOGrH/wPym2ivUm45uQAAAABJRU5ErkJggg==','https://icons.duckduckgo.com/ip3/www.reddit.com.ico','2023-07-09 15:04:26.430919');
-CREATE TABLE IF NOT EXISTS "entries" ("id" INTEGER NOT NULL PRIMARY KEY, "guid" VARCHAR(511) NOT NULL, "feed_id" INTEGER NOT NULL, "title" VARCHAR(255) NOT NULL, "content_type" VARCHAR(255) NOT NULL, "content" TEXT NOT NULL, "thumbnail_url" VARCHAR(511) NOT NULL, "published_on" DATETIME NOT NULL, "author" VARCHAR(255) NOT NULL, "link" VARCHAR(511) NOT NULL, FOREIGN KEY ("feed_id") REFERENCES "feeds" ("id") ON DELETE CASCADE);
-INSERT INTO entries VALUES(1,'https://500px.com/photo/1049390382/-by-oprisco-',2,'*** by oprisco','text/html',replace('<a href="https://500px.com/photo/1049390382"><img src="https://drscdn.500px.org/photo/1049390382/q%3D50_h%3D450/v2?sig=ef71ba188888bfa209c61b176ad1ce2ebff74011a78e4aebc729ce69cc6369ab" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049390382">***</a> by <a href="https://500px.com/oprisco">oprisco </a></h2>\n          <br />\n          <h3>check video backstages on my instagram.com/oprisco/</h3>\n          <br />\n          <small>oprisco : <a href="https://500px.com/oprisco">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 16:50:14','','https://500px.com/photo/1049390382/-by-oprisco-');
-INSERT INTO entries VALUES(2,'https://500px.com/photo/1049369564/navegando-entre-a-espuma-das-palavras-by-António-Leão-de-Sousa',2,'navegando entre a espuma das palavras by António Leão de Sousa','text/html',replace('<a href="https://500px.com/photo/1049369564"><img src="https://drscdn.500px.org/photo/1049369564/q%3D50_h%3D450/v2?sig=bcb7bb166f409c2ed64471246ebbc425d7b84e4f4be574e20d619af0c63dd071" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049369564">navegando entre a espuma das palavras</a> by <a href="https://500px.com/antonio_leao">António Leão de Sousa</a></h2>\n          <br />\n          <h3>          </h3>\n          <br />\n          <small>António Leão de Sousa: <a href="https://500px.com/antonio_leao">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 08:44:08','','https://500px.com/photo/1049369564/navegando-entre-a-espuma-das-palavras-by-António-Leão-de-Sousa');
-INSERT INTO entries VALUES(3,'https://500px.com/photo/1049348329/Lighthouse-at-Dyrhólaey--by-Hayden-Scott',2,'Lighthouse at Dyrhólaey  by Hayden Scott','text/html',replace('<a href="https://500px.com/photo/1049348329"><img src="https://drscdn.500px.org/photo/1049348329/q%3D50_h%3D450/v2?sig=eb1c141465d5f4a9baf9fb23e8240427913c3b1866d9cae449cbb20555572892" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049348329">Lighthouse at Dyrhólaey </a> by <a href="https://500px.com/HaydenScott">Hayden Scott</a></h2>\n          <br />\n          <h3>One of many of the Icelandic Lighthouses </h3>\n          <br />\n          <small>Hayden Scott: <a href="https://500px.com/HaydenScott">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-07 19:23:00','','https://500px.com/photo/1049348329/Lighthouse-at-Dyrhólaey--by-Hayden-Scott');
-INSERT INTO entries VALUES(4,'https://500px.com/photo/1049364498/swimming-pool-2014-by-Cristina-Coral',2,'swimming pool 2014 by Cristina Coral','text/html',replace('<a href="https://500px.com/photo/1049364498"><img src="https://drscdn.500px.org/photo/1049364498/q%3D50_h%3D450/v2?sig=04d535273340076036c8af98f9a4b49aa1a94ace76f4ab5d81cdaa729a272d80" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049364498">swimming pool 2014</a> by <a href="https://500px.com/cristinacoral">Cristina Coral</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Cristina Coral: <a href="https://500px.com/cristinacoral">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 06:36:52','','https://500px.com/photo/1049364498/swimming-pool-2014-by-Cristina-Coral');
-INSERT INTO entries VALUES(5,'https://500px.com/photo/1049377656/Sleeping-in-the-ocean-by-Sylvain-Girardot',2,'Sleeping in the ocean by Sylvain Girardot','text/html',replace('<a href="https://500px.com/photo/1049377656"><img src="https://drscdn.500px.org/photo/1049377656/q%3D50_h%3D450/v2?sig=fecb46674b905a7ffa6baddad16e5fb7f1ecc188961314b670fd5641a2b1e3ad" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049377656">Sleeping in the ocean</a> by <a href="https://500px.com/sylvaingirardottahiti">Sylvain Girardot</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Sylvain Girardot: <a href="https://500px.com/sylvaingirardottahiti">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 11:58:50','','https://500px.com/photo/1049377656/Sleeping-in-the-ocean-by-Sylvain-Girardot');
-INSERT INTO entries VALUES(6,'https://500px.com/photo/1049332413/Seasoning-Sauce-by-Sarawut-Intarob',2,'Seasoning Sauce by Sarawut Intarob','text/html',replace('<a href="https://500px.com/photo/1049332413"><img src="https://drscdn.500px.org/photo/1049332413/q%3D50_h%3D450/v2?sig=e761e5f2543fe507e0d52653cfeac5f9b4b0be905a47559269c81e68804f51f5" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049332413">Seasoning Sauce</a> by <a href="https://500px.com/sarawutkaka">Sarawut Intarob</a></h2>\n          <br />\n          <h3>Seasoning Sauce</h3>\n          <br />\n          <small>Sarawut Intarob: <a href="https://500px.com/sarawutkaka">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-07 12:34:55','','https://500px.com/photo/1049332413/Seasoning-Sauce-by-Sarawut-Intarob');
-INSERT INTO entries VALUES(7,'https://500px.com/photo/1049306168/like-a-bird-by-Jordie-Hennigar',2,'like a bird by Jordie Hennigar','text/html',replace('<a href="https://500px.com/photo/1049306168"><img src="https://drscdn.500px.org/photo/1049306168/q%3D50_h%3D450/v2?sig=f0bc9b4fa8f64bf82a9143c30d25c5a41668c58f2b65343580690ac0c066a9c1" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049306168">like a bird</a> by <a href="https://500px.com/jordiehennigar">Jordie Hennigar</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Jordie Hennigar: <a href="https://500px.com/jordiehennigar">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-07 00:50:20','','https://500px.com/photo/1049306168/like-a-bird-by-Jordie-Hennigar');
-INSERT INTO entries VALUES(8,'https://500px.com/photo/1049072560/Streets-of-Toronto-by-Rakesh-Baro',2,'Streets of Toronto by Rakesh Baro','text/html',replace('<a href="https://500px.com/photo/1049072560"><img src="https://drscdn.500px.org/photo/1049072560/q%3D50_h%3D450/v2?sig=063c9ddde7477cc43dd07cccdc1d9a2224487c0ed06cfb5d3d472d00cdebe8c2" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049072560">Streets of Toronto</a> by <a href="https://500px.com/RakeshBaro2013">Rakesh Baro</a></h2>\n          <br />\n          <h3>Whenever time permits I go out and do some street photography in Toronto. These are some of them.</h3>\n          <br />\n          <small>Rakesh Baro: <a href="https://500px.com/RakeshBaro2013">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-01 18:22:08','','https://500px.com/photo/1049072560/Streets-of-Toronto-by-Rakesh-Baro');
-INSERT INTO entries VALUES(9,'https://500px.com/photo/1049200521/NO-ENTRY-by-Alireza-Bagheri-Sani',2,'NO ENTRY by Alireza Bagheri Sani','text/html',replace('<a href="https://500px.com/photo/1049200521"><img src="https://drscdn.500px.org/photo/1049200521/q%3D50_h%3D450/v2?sig=00a4ed2acef5a3a8c9e9e7d0168cae8867508afa7326959f89b591c53792fd22" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049200521">NO ENTRY</a> by <a href="https://500px.com/alirezabagherisani">Alireza Bagheri Sani</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Alireza Bagheri Sani: <a href="https://500px.com/alirezabagherisani">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-04 17:33:44','','https://500px.com/photo/1049200521/NO-ENTRY-by-Alireza-Bagheri-Sani');
-INSERT INTO entries VALUES(10,'https://500px.com/photo/1049277127/Sunrise-in-the-Dolomites-by-Michael--Bottari',2,'Sunrise in the Dolomites by Michael  Bottari','text/html',replace('<a href="https://500px.com/photo/1049277127"><img src="https://drscdn.500px.org/photo/1049277127/q%3D50_h%3D450/v2?sig=aa77975d0df2c8cda8bacaf9c22e9d897d0d2491e9eda9ae1d761c4abe75345b" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049277127">Sunrise in the Dolomites</a> by <a href="https://500px.com/michaelbottari">Michael  Bottari</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Michael  Bottari: <a href="https://500px.com/michaelbottari">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-06 10:29:12','','https://500px.com/photo/1049277127/Sunrise-in-the-Dolomites-by-Michael--Bottari');
-INSERT INTO entries VALUES(11,'https://500px.com/photo/1049184377/Katya-by-PHOTOGRAPHER-ANNA--',2,'Katya by PHOTOGRAPHER ANNA','text/html',replace('<a href="https://500px.com/photo/1049184377"><img src="https://drscdn.500px.org/photo/1049184377/q%3D50_h%3D450/v2?sig=5de8b5382bb79524399e8d421025acc7c0ea7eb8f0ab9652963cd10e4126e913" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049184377">Katya</a> by <a href="https://500px.com/photographerann">PHOTOGRAPHER ANNA  </a></h2>\n          <br />\n          <h3>instagram  photographer.ann</h3>\n          <br />\n          <small>PHOTOGRAPHER ANNA  : <a href="https://500px.com/photographerann">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-04 10:27:36','','https://500px.com/photo/1049184377/Katya-by-PHOTOGRAPHER-ANNA--');
-INSERT INTO entries VALUES(12,'https://500px.com/photo/1049245019/Roebuck-by-Gusztáv-Sebestyén',2,'Roebuck by Gusztáv Sebestyén','text/html',replace('<a href="https://500px.com/photo/1049245019"><img src="https://drscdn.500px.org/photo/1049245019/q%3D50_h%3D450/v2?sig=154835a666ba1c19723793a558666b4a42140c18cf90efb2badbb4e9ca7d27d2" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049245019">Roebuck</a> by <a href="https://500px.com/SGuszti">Gusztáv Sebestyén</a></h2>\n          <br />\n          <h3>Thanks for watching!\nFacebook: https://www.facebook.com/sebestyengusztavphotography\nInstagram: https://www.instagram.com/sguszti_photo</h3>\n          <br />\n          <small>Gusztáv Sebestyén: <a href="https://500px.com/SGuszti">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 17:31:05','','https://500px.com/photo/1049245019/Roebuck-by-Gusztáv-Sebestyén');
-INSERT INTO entries VALUES(13,'https://500px.com/photo/1049258253/三幅人像天青色等烟雨-by-三幅人像-',2,'三幅人像：天青色等烟雨 by 三幅人像','text/html',replace('<a href="https://500px.com/photo/1049258253"><img src="https://drscdn.500px.org/photo/1049258253/q%3D50_h%3D450/v2?sig=66c81ceee679de9c23342649189a3d52f92ca647189fe3a14ec5444a42d09112" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049258253">三幅人像：天青色等烟雨</a> by <a href="https://500px.com/vcg-15460c2f64fafb7b3d60055602bbd8524">三幅人像 </a></h2>\n          <br />\n          <h3>目之所及，皆是回忆。心之所向，皆是过往。我们不慌不忙，总以为来日方长。 @无忌  @黄山  @行者｜LC  @姜渔火 /视觉中国  @子晴｜LC  @吉礼  @龙摄天下（刘承斌）  @摄行天下  @都市流浪  @释然  #这几年#  #每一处都有生命#  #清新夏日#  #都市故事#  #路在脚下#  #光影的魅力# </h3>\n          <br />\n          <small>三幅人像 : <a href="https://500px.com/vcg-15460c2f64fafb7b3d60055602bbd8524">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-06 03:23:06','','https://500px.com/photo/1049258253/三幅人像天青色等烟雨-by-三幅人像-');
-INSERT INTO entries VALUES(14,'https://500px.com/photo/1049252765/青山图书馆楼梯-by-FGL-',2,'青山图书馆楼梯 by F.G.L','text/html',replace('<a href="https://500px.com/photo/1049252765"><img src="https://drscdn.500px.org/photo/1049252765/q%3D50_h%3D450/v2?sig=768c77fa8df394f8a620ec28671714bbc66db470879f0d8349bcf0539a62087e" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049252765">青山图书馆楼梯</a> by <a href="https://500px.com/vcg-FGLiu">F.G.L </a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>F.G.L : <a href="https://500px.com/vcg-FGLiu">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 23:54:03','','https://500px.com/photo/1049252765/青山图书馆楼梯-by-FGL-');
-INSERT INTO entries VALUES(15,'https://500px.com/photo/1049246537/A-Dream-Within-a-Dream--by-Pedro-Quintela',2,'A Dream Within a Dream  by Pedro Quintela','text/html',replace('<a href="https://500px.com/photo/1049246537"><img src="https://drscdn.500px.org/photo/1049246537/q%3D50_h%3D450/v2?sig=a58e93917a0a9e268f508cbf55bd1b354135d665bcd7a7b4b3ed6e290756cb56" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049246537">A Dream Within a Dream </a> by <a href="https://500px.com/PedroQuintela1">Pedro Quintela</a></h2>\n          <br />\n          <h3>I wanted to shoot in the Palazzo Comunale, Siena (Italy) for many years. Finally, I got the chance to make that trip and found that this was really a dream within a dream... </h3>\n          <br />\n          <small>Pedro Quintela: <a href="https://500px.com/PedroQuintela1">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 18:28:48','','https://500px.com/photo/1049246537/A-Dream-Within-a-Dream--by-Pedro-Quintela');
-INSERT INTO entries VALUES(16,'https://500px.com/photo/1049242021/池鹭探鱼-by-黄添福-',2,'池鹭探鱼 by 黄添福','text/html',replace('<a href="https://500px.com/photo/1049242021"><img src="https://drscdn.500px.org/photo/1049242021/q%3D50_h%3D450/v2?sig=42a2445528dcab496b4bfd52f5b3bdaca2a7fc33be1eaa52909d021a2a6a6cc3" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049242021">池鹭探鱼</a> by <a href="https://500px.com/vcg-49622a40246b082753dc9e31cf9831762">黄添福 </a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>黄添福 : <a href="https://500px.com/vcg-49622a40246b082753dc9e31cf9831762">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 16:10:17','','https://500px.com/photo/1049242021/池鹭探鱼-by-黄添福-');
-INSERT INTO entries VALUES(17,'https://500px.com/photo/1049250340/沙海丽影-by-bingo-',2,'沙海丽影 by bingo','text/html',replace('<a href="https://500px.com/photo/1049250340"><img src="https://drscdn.500px.org/photo/1049250340/q%3D50_h%3D450/v2?sig=e1fe40497e48b0c7f029f1c92605bb17db611194a3d954d2ac0fc1404616e0c0" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049250340">沙海丽影</a> by <a href="https://500px.com/vcg-bingo">bingo </a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>bingo : <a href="https://500px.com/vcg-bingo">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 21:26:42','','https://500px.com/photo/1049250340/沙海丽影-by-bingo-');
-INSERT INTO entries VALUES(18,'https://500px.com/photo/1049247095/The-Apartment-by-Ash-Camas',2,'The Apartment by Ash Camas','text/html',replace('<a href="https://500px.com/photo/1049247095"><img src="https://drscdn.500px.org/photo/1049247095/q%3D50_h%3D450/v2?sig=5ffc8b3526b0c6d6fec8708652b264cff9c67ff37a94352a2249c130cbf2360f" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049247095">The Apartment</a> by <a href="https://500px.com/adyy_cam">Ash Camas</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Ash Camas: <a href="https://500px.com/adyy_cam">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 18:43:08','','https://500px.com/photo/1049247095/The-Apartment-by-Ash-Camas');
-INSERT INTO entries VALUES(19,'https://500px.com/photo/1049158020/Lighthouse---by-Joachim-Bergauer',2,'***Lighthouse***   by Joachim Bergauer','text/html',replace('<a href="https://500px.com/photo/1049158020"><img src="https://drscdn.500px.org/photo/1049158020/q%3D50_h%3D450/v2?sig=0eda1ad7edae898bea49c83555a7c4a4c9f6bbc8442f4c2be0a7b68cee8abe6c" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049158020">***Lighthouse***  </a> by <a href="https://500px.com/joachimbergauer">Joachim Bergauer</a></h2>\n          <br />\n          <h3>www.bergauer.cc</h3>\n          <br />\n          <small>Joachim Bergauer: <a href="https://500px.com/joachimbergauer">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-03 19:59:24','','https://500px.com/photo/1049158020/Lighthouse---by-Joachim-Bergauer');
-INSERT INTO entries VALUES(20,'https://500px.com/photo/1049231221/Lonely-Chapel-by-Marc-Hennige',2,'Lonely Chapel by Marc Hennige','text/html',replace('<a href="https://500px.com/photo/1049231221"><img src="https://drscdn.500px.org/photo/1049231221/q%3D50_h%3D450/v2?sig=d982e95d5ed781c443418413599bcdd00f840ebbe15776a6c6d76f685e709354" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049231221">Lonely Chapel</a> by <a href="https://500px.com/Marc_Hennige">Marc Hennige</a></h2>\n          <br />\n          <h3>Building a little chapel in the middle of a meadow - awesome!\nMore content: https://www.instagram.com/marc.hennige/ </h3>\n          <br />\n          <small>Marc Hennige: <a href="https://500px.com/Marc_Hennige">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 12:31:56','','https://500px.com/photo/1049231221/Lonely-Chapel-by-Marc-Hennige');
-INSERT INTO entries VALUES(21,'https://arstechnica.com/?p=1941623',3,'Internet from a small satellite in geostationary orbit? Sure, why not','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Employees at Astranis'' headquarters in San Francisco react to deployment of the Arcturus satellite this month." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/fb92110a-cdeb-4951-b3cb-4e03db20e695-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/fb92110a-cdeb-4951-b3cb-4e03db20e695.jpg">Enlarge</a> <span class="sep">/</span> Employees at Astranis'' headquarters in San Francisco react to deployment of the Arcturus satellite this month. (credit: Astranis)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>A startup space company says it has successfully deployed and tested a kitchen-stove-sized satellite in geostationary orbit and begun delivering Internet service to Alaska.</p>\n<p>Earlier this month, the ''Arcturus'' satellite, built by a company named Astranis, launched as a rideshare payload on a Falcon Heavy rocket, separating a few hours after liftoff and successfully deploying its solar arrays, boom, and a subreflector.</p>\n<p>After gaining control of the satellite, Astranis began to send commands and update the flight software before raising Arcturus'' orbit and slotting it into a geostationary position directly over Alaska. Once there, the satellite linked up with an Internet gateway in Utah and communicated with multiple user terminals in Alaska, where Astranis will provide high-speed bandwidth to an Internet service provider, Pacific Dataport.</p></div><p><a href="https://arstechnica.com/?p=1941623#p3">Read 8 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941623&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 13:06:14','Eric Berger','https://arstechnica.com/?p=1941623');
-INSERT INTO entries VALUES(22,'https://arstechnica.com/?p=1941045',3,'AMD Radeon RX 7600 review: Another water-treading mid-range GPU for $269','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="AMD''s Radeon RX 7600." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/IMG_1114-800x533.jpeg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/IMG_1114.jpeg">Enlarge</a> <span class="sep">/</span> AMD''s Radeon RX 7600. (credit: Andrew Cunningham)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Earlier this month, AMD briefed the press on its first mainstream RX 7000-series card, the RX 7600. A mostly incremental upgrade over the original RX 6600 but with many of the new features from the <a href="https://arstechnica.com/gadgets/2022/12/review-amds-radeon-rx-7900-gpus-are-great-4k-gaming-gpus-with-caveats/">RX 7900 XTX and XT</a>, it would come with a price cut, from the RX 6600''s $329 to $299. Nvidia then briefed the press on its new mainstream RTX 4060 series. The prices for the higher-end 8GB and 16GB RTX 4060 Ti are already set at $399 and $499. The price for the lower-end RTX 4060 was left undisclosed.</p>\n<p>A few days later, presumably having caught wind of AMD''s pricing plan for the RX 7600, Nvidia <a href="https://arstechnica.com/gadgets/2023/05/nvidias-399-4060-ti-comes-with-no-price-hike-but-mild-performance-improvements/">announced the price for the RTX 4060</a>: also a surprisingly low $299. (This entire time, review embargoes and briefings have been shifting by a few days here and there as the companies maneuver around each other.) Then, around 36 hours before this article was published, a new update came from AMD: The RX 7600 will now be launching for $269, $30 less than the RTX 4060 and $50 less than the old RX 6600.</p>\n\n<p>This is what competition in the mid-range GPU market looks like after a years-long cryptocurrency-and-scalper-fueled shortage and many more months of Nvidia and AMD focusing on their pricey flagships. These are new, modern cards with modern features available at a price that can at least be called "literally affordable" even if they aren''t quite "budget."</p></div><p><a href="https://arstechnica.com/?p=1941045#p3">Read 18 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941045&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 13:00:05','Andrew Cunningham','https://arstechnica.com/?p=1941045');
-INSERT INTO entries VALUES(23,'https://arstechnica.com/?p=1941561',3,'BMW plays it safe with design of new electric sedan, the 2024 i5','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="BMW i5 in grey, seen from the front 3/4s" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-1-800x600.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-1-scaled.jpg">Enlarge</a> <span class="sep">/</span> The eighth-generation 5 Series has the least-outrageous styling we''ve seen from BMW in some time. (credit: Jonathan Gitlin)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<aside class="pullbox sidebar fullwidth">BMW provided flights from DC to Milan and back, plus three nights in a hotel so we could get a preview of the new 5 Series and i5. Ars does not accept paid editorial content.</aside>\n<p>COMO, ITALY—BMW has earned a reputation for challenging car designs. It''s not a new thing, either. People mocked the Z1''s disappearing doors. The Z3 coupe''s "clown shoe" nickname was not at all affectionate. And few could find a kind word about the infamous "Bangle butt" on the fourth-gen 7 Series. But it doesn''t take those kinds of risks with every model, particularly not the latest 5 Series, which now includes a fully electric i5.</p>\n<p>The 5 Series is BMW''s midsize sedan, and until the advent of the luxury SUV—a category that BMW basically invented—it was the company''s bread and butter. There''s a new 5 Series out this October, the eighth generation to bear the nameplate. Like other recent BMWs, it uses the manufacturer''s latest flexible architecture that supports battery-electric, plug-in hybrid, and conventional powertrains, something we''ve seen to good effect with the <a href="https://arstechnica.com/cars/2021/10/the-2023-bmw-i4-is-the-electric-bmw-sedan-youve-been-waiting-for/">4 Series</a> and particularly with last year''s <a href="https://arstechnica.com/cars/2022/11/how-the-the-wire-helped-me-understand-the-2023-bmw-760i-xdrive/">7 Series</a> and <a href="https://arstechnica.com/cars/2022/11/testing-bmws-biggest-and-best-sedan-now-fully-electric-the-2023-i7/">i7</a>.</p>\n<div class="image shortcode-img center"><a href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-12-scaled.jpg"><img alt="Now try to picture it wearing a taxi livery or perhaps a police version." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-12-980x735.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-12-scaled.jpg" rel="nofollow">Now try to picture it wearing a taxi livery or perhaps a police version.</a> (credit: Jonathan Gitlin)</p></div>\n<h2>The sedan is not dead</h2>\n<p>"We''re particularly happy with how it turned out proportion-wise. I think it is a long, elegant, sporty sedan, and that, for me, is the essence of any BMW anyway. And the 5 series, of course, is the core of the brand in many, many markets," said Adrian van Hooydonk, design director at BMW Group.</p></div><p><a href="https://arstechnica.com/?p=1941561#p3">Read 13 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941561&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 12:00:42','Jonathan M. Gitlin','https://arstechnica.com/?p=1941561');
-INSERT INTO entries VALUES(24,'https://arstechnica.com/?p=1941281',3,'Dealmaster: Save on Lenovo’s latest ThinkPad X1 Gen 11 laptop, and more','text/html',replace('<div id="rss-wrap">\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Summer is so close we can almost smell the suntan lotion and burnt hot dogs. Today''s Dealmaster has the usual office fare—including a great deal on Lenovo''s gold-standard business-class <a href="https://howl.me/cjNRIP1B6zM" rel="noopener" target="_blank">ThinkPad X1</a> Carbon series, including the <a href="https://howl.me/cjNRHe4tlBm" rel="noopener" target="_blank">Gen 11 model</a> with Intel''s 13th Gen processor—but also a few picks for relaxing and travel. That includes a great price on Sony''s highly rated <a href="https://amzn.to/43jDZAq" rel="noopener" target="_blank">WH-1000XM5</a> noise-canceling headphones, as well as <a href="https://howl.me/cjNRAnazb3P" rel="noopener" target="_blank">Microsoft''s Surface Pro 9</a> tablet.</p>\n<h2>Featured deals</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2022/08/IMG_0331.jpeg"><img alt="Lenovo''s ThinkPad X1 Carbon Gen 10." src="https://cdn.arstechnica.net/wp-content/uploads/2022/08/IMG_0331-640x427.jpeg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2022/08/IMG_0331.jpeg" rel="nofollow">Lenovo''s ThinkPad X1 Carbon Gen 10.</a> (credit: Andrew Cunningham)</p></div>\n<ul>\n<li>Lenovo ThinkPad X1 Carbon Gen 11 laptop starting at $1,598 with THINKVICW1 coupon (was $2,619) at <a href="https://howl.me/cjNRHe4tlBm" rel="noopener" target="_blank">Lenovo</a></li>\n<li>Lenovo ThinkPad X1 Carbon Gen 10 laptop for $1,804 with THKNKMEMDEALS coupon (was $3,609) at <a href="https://howl.me/cjNRIP1B6zM" rel="noopener" target="_blank">Lenovo</a></li>\n</ul>\n<h2>Headphones</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2022/05/Sony-WH-1000XM5-and-folded-Sony-WH-1000XM4.jpg"><img alt="The WH-1000XM5''s earcups can''t fold up for easier storage, sadly." src="https://cdn.arstechnica.net/wp-content/uploads/2022/05/Sony-WH-1000XM5-and-folded-Sony-WH-1000XM4-640x427.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2022/05/Sony-WH-1000XM5-and-folded-Sony-WH-1000XM4.jpg" rel="nofollow">The WH-1000XM5''s earcups can''t fold up for easier storage, sadly.</a> (credit: Jeff Dunn)</p></div>\n<ul>\n<li>Sony WH-1000XM5 noise-canceling headphones for $348 (was $400) at <a href="https://amzn.to/43jDZAq" rel="noopener" target="_blank">Amazon</a></li>\n<li>Sony WH-1000XM4 noise-canceling headphones for $278 (was $350) at <a href="https://amzn.to/45pSoNa" rel="noopener" target="_blank">Amazon</a> | $280 at <a href="https://howl.me/cjNROjNeYiC" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Sony LinkBud S noise-canceling earbuds for $150 (was $200) at <a href="https://amzn.to/3IwKWpx" rel="noopener" target="_blank">Amazon</a> | $150 at <a href="https://howl.me/cjNRRpLN57o" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Apple AirPods Pro (2nd Gen) for $200 (was $250) at <a href="https://howl.me/cjNRPO7j8o0" rel="noopener" target="_blank">Best Buy</a></li>\n</ul>\n<h2>Desktop and laptop PCs</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2022/10/render_04_RGB_engrave.jpg"><img alt="A snazzy sub-variant of the blue Surface Pro 9 includes an intricate pattern called &quot;Liberty,&quot; which will sadly only be available at Liberty and Microsoft Stores and only for a limited time." src="https://cdn.arstechnica.net/wp-content/uploads/2022/10/render_04_RGB_engrave-640x360.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2022/10/render_04_RGB_engrave.jpg" rel="nofollow">A snazzy sub-variant of the blue Surface Pro 9 includes an intricate pattern called "Liberty," which will sadly only be available at Liberty and Microsoft Stores and only for a limited time.</a> (credit: Microsoft)</p></div>\n<ul>\n<li>Microsoft Surface Pro 9 with Core i5 and Signature Keyboard bundle for $1,000 (was $1,280) at <a href="https://howl.me/cjNRAnazb3P" rel="noopener" target="_blank">Best Buy</a></li>\n<li>HP Spectre 2-in-1 with Intel Core i7 for $1,150 (was $1,650) at <a href="https://howl.me/cjNRCGXbbeT" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Lenovo Yoga 7i 2-in-1 with Intel Core i5 for $700 (was $850) at <a href="https://howl.me/cjNRD8APkBH" rel="noopener" target="_blank">Best Buy</a></li>\n<li>HP Victus 15L gaming desktop with AMD Ryzen 7 5700G and Radeon RX 6600XT for $750 (was $1,260) at <a href="https://amzn.to/3IYuPBJ" rel="noopener" target="_blank">Amazon</a></li>\n<li>Asus ROG Strix G15 gaming desktop with Intel Core i7-12700F and Nvidia RTX 3060 for $1,355 (was $1,430) at <a href="https://amzn.to/3IAgH18" rel="noopener" target="_blank">Amazon</a></li>\n<li>Cyberpower Gamer Xtreme gaming desktop with Intel Core i5-12400F and RTX 3050 for $850 (was $950) at <a href="https://amzn.to/43h0Ddb" rel="noopener" target="_blank">Amazon</a></li>\n<li>Zotak MEK Hero G1 gaming desktop with AMD Ryzen 7 5800X and RTX 3070 for $1,260 (was $1,900) at <a href="https://amzn.to/42ZNqoB" rel="noopener" target="_blank">Amazon</a></li>\n<li>MSI Pulse GL76 17.3-inch gaming laptop with Intel Core i7-12700H and RTX 3060 for $1,150 (was $1,400) at <a href="https://amzn.to/3q9cif4" rel="noopener" target="_blank">Amazon</a></li>\n<li>MSI Stealth 15M gaming laptop with Intel Core i7-1260P and RTX 3060 for $1,150 (was $1,400) at <a href="https://amzn.to/43nSovw" rel="noopener" target="_blank">Amazon</a></li>\n<li>Acer Swift X creator laptop with AMD Ryzen 7 5825U and RTX 3050 Ti for $800 (was $1,100) at <a href="https://amzn.to/3OAwqB7" rel="noopener" target="_blank">Amazon</a></li>\n<li>Asus TUF F17 gaming laptop with Intel Core i5-11400H and RTX 3050 for $800 (was $900) at <a href="https://amzn.to/3IwLI6b" rel="noopener" target="_blank">Amazon</a></li>\n<li>MSI Stealth 17 Studio gaming laptop with 13th Gen Intel Core i9 and RTX 4080 for $2,640 (was $2,800) at <a href="https://amzn.to/3BRXX9O" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Drones</h2>\n<div class="image shortcode-img center full"><img src="https://cdn.arstechnica.net/wp-content/uploads/2018/11/dji-mavic-air.jpg" /></div>\n<ul>\n<li>DJI Air 2S Quadcopter drone with 5.4K video recording for $849 (was $999) at <a href="https://amzn.to/45COuki" rel="noopener" target="_blank">Amazon</a></li>\n<li>DJI Air 2S Fly More Combo for $1,109 (was $1,299) at <a href="https://amzn.to/3MtJ2Y7" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Robot vacuums</h2>\n<ul>\n<li>iRobot Roomba j6+ robot vacuum for $650 (was $800) at <a href="https://amzn.to/3q12Ieh" rel="noopener" target="_blank">Amazon</a></li>\n<li>iRobot Braava Jet m6 robot mop for $400 (was $500) at <a href="https://amzn.to/45tMTNI" rel="noopener" target="_blank">Amazon</a></li>\n<li>iRobot Roomba s9+ robot vacuum for $899 (was $999) at <a href="https://howl.me/cjNTHbnExpB" rel="noopener" target="_blank">Best Buy</a></li>\n<li>iRobot Roomba i3+ EVO robot vacuum for $500 (was $550) at <a href="https://howl.me/cjNTKOdPR9w" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Roborock s7 smart vacuum and mop for $400 (was $650) at <a href="https://amzn.to/43jGjYa" rel="noopener" target="_blank">Amazon</a></li>\n<li>Narwal Freo smart vacuum and mop with auto dry for $1,000 after coupon (was $1,400) at <a href="https://amzn.to/3q15C2F" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Gaming accessories</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2019/08/steelseries7.jpg"><img src="https://cdn.arstechnica.net/wp-content/uploads/2019/08/steelseries7-640x752.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2019/08/steelseries7.jpg" rel="nofollow"></a> (credit: SteelSeries)</p></div>\n<ul>\n<li>SteelSeries Arctis 9 wireless gaming headset for $126 (was $200) at <a href="https://amzn.to/3q3Zt63" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Stratus Duo wireless gaming controller for $39 (was $60) at <a href="https://amzn.to/41WSUPS" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Arctis Nova 3 gaming headset for $70 (was $100) at <a href="https://amzn.to/43gmy3q" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Arena 7 2.1 desktop speakers for $240 (was $300) at <a href="https://amzn.to/45ukZAT" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Rival 5 wired gaming mouse for $40 (was $60) at <a href="https://amzn.to/3IAILBq" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Arctis 1 wireless gaming headset for $63 (was $100) at <a href="https://amzn.to/3ol1YjV" rel="noopener" target="_blank">Amazon</a></li>\n<li>Logitech Blue Yeti USB microphone for $90 (was $130) at <a href="https://amzn.to/45CR61A" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Smart home and personal care</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2023/04/Ecobee-Smart-Thermostat-scaled.jpg"><img alt="Ecobee''s Smart Thermostat comes with a presence sensor to automatically shut off when no one''s around." src="https://cdn.arstechnica.net/wp-content/uploads/2023/04/Ecobee-Smart-Thermostat-640x360.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/04/Ecobee-Smart-Thermostat-scaled.jpg" rel="nofollow">Ecobee''s Smart Thermostat comes with a presence sensor to automatically shut off when no one''s around.</a> (credit: Chuong Nguyen)</p></div>\n<ul>\n<li>Levoit smart air purifier for homes up to 1,900 square feet for $155 after coupon (was $190) at <a href="https://amzn.to/3ojQE7D" rel="noopener" target="_blank">Amazon</a></li>\n<li>ecobee Smart Thermostat Enhanced for $170 (was $190) at <a href="https://amzn.to/43gUoWN" rel="noopener" target="_blank">Amazon</a> | $170 at <a href="https://howl.me/cjNRST0THkn" rel="noopener" target="_blank">Best Buy</a></li>\n<li>ecobee Smart Thermostat Premium with smart sensors for $240 (was $330) at <a href="https://amzn.to/3IwFovt" rel="noopener" target="_blank">Amazon</a></li>\n<li>ecobee Smart Thermostat Enhanced with smart sensors for $190 (was $270) at <a href="https://amzn.to/3or4KEc" rel="noopener" target="_blank">Amazon</a></li>\n<li>ecobee smart sensors (2-pack) for $60 (was $80) at <a href="https://amzn.to/43l0btJ" rel="noopener" target="_blank">Amazon</a></li>\n<li>TP-Link Deco XE75 Pro AXE5400 (2-pack) mesh Wi-Fi 6E for $270 (was $350) at <a href="https://amzn.to/431PLzo" rel="noopener" target="_blank">Amazon</a></li>\n<li>Philips Sonicare DiamondClean Smart 9300 electric toothbrush for $200 (was $230) at <a href="https://howl.me/cjNTbJGJIi3" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Philips Sonicare Power Flosser 3000 cordless for $65 (was $80) at <a href="https://howl.me/cjNTcVVsVhP" rel="noopener" target="_blank">Best Buy</a></li>\n</ul>\n<h2>Kitchen, grilling, and power tools</h2>\n<ul>\n<li>Ninja OG751 Woodfire Pro outdoor grill and smoker for $350 (was $400) at <a href="https://amzn.to/41XsddH" rel="noopener" target="_blank">Amazon</a></li>\n<li>Ninja Compact Kitchen System with blender and food processor for $130 (was $160) at <a href="https://amzn.to/430GTKF" rel="noopener" target="_blank">Amazon</a></li>\n<li>Ninja KT200 electric kettle for $70 (was $90) at <a href="https://amzn.to/3BSRAmm" rel="noopener" target="_blank">Amazon</a></li>\n<li>Dewalt 20V MAX cordless drill and impact driver combo kit for $149 (was $239) at <a href="https://amzn.to/3q45ShB" rel="noopener" target="_blank">Amazon</a></li>\n<li>Ooni Karu multi-fuel outdoor pizza oven for $640 (was $800) at <a href="https://howl.me/cjNS6dui6Mx" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Ooni Koda 16 gas outdoor pizza oven for $480 (was $600) at <a href="https://howl.me/cjNS7rbbi7X" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Weber Genesis S-w335 propane gas grill for $1,329 (was $1,429) at <a href="https://howl.me/cjNS9mDWaFp" rel="noopener" target="_blank">Best Buy</a></li>\n</ul>\n\n</div><p><a href="https://arstechnica.com/?p=1941281">Read on Ars Technica</a> | <a href="https://arstechnica.com/?p=1941281&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 11:00:02','Chuong Nguyen','https://arstechnica.com/?p=1941281');
-INSERT INTO entries VALUES(25,'https://arstechnica.com/?p=1941212',3,'Your fave illustration of Franklin’s kite experiment is likely riddled with errors','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Hand-colored lithograph of Ben Franklin''s kite experiment published by Currier &amp; Ives in 1876" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/franklin1CROP-800x533.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/franklin1CROP.jpg">Enlarge</a> <span class="sep">/</span> Hand-colored lithograph published by Currier &amp; Ives in 1876, probably the most widely distributed illustration of Benjamin Franklin''s kite experiment. Franklin is wrongly shown to be holding the string in one hand above where the key is attached. (credit: Public domain)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Most Americans are familiar with the story of <a href="https://en.wikipedia.org/wiki/Benjamin_Franklin">Benjamin Franklin</a> and his famous <a href="https://en.wikipedia.org/wiki/Kite_experiment">18th-century experiment</a> in which he attached a metal key <a href="https://founders.archives.gov/documents/Franklin/01-04-02-0135">to a kite</a> during a thunderstorm to see if the lightning would pass through the metal. That''s largely due to many iconic illustrations commemorating the event that found their way into the popular imagination and became part of our shared cultural lore. But most of those classic illustrations are riddled with historical errors, according to a <a href="https://link.springer.com/article/10.1007/s11191-023-00421-y">new paper</a> published in the journal Science and Education.</p>\n<p>Franklin''s <a href="https://arstechnica.com/science/2019/11/that-time-benjamin-franklin-tried-and-failed-to-electrocute-a-turkey/">explorations into electricity</a> began as he was approaching 40 years old after his thriving career as an entrepreneur in the printing business. His scientific interest was piqued in 1743 when he saw a demonstration by scientist/showman <a href="https://en.wikipedia.org/wiki/Archibald_Spencer">Archibald Spencer</a>, known for performing various amusing parlor tricks involving electricity. He soon started a correspondence with a British botanist named <a href="https://en.wikipedia.org/wiki/Peter_Collinson_(botanist)">Peter Collinson</a> and began reproducing some of Spencer''s impressive parlor tricks in his own home.</p>\n<p>He would have guests rub a tube to create static and then have them kiss, producing an electrical shock. He designed a fake spider suspended by two electrified wires so that it seemed to swing back and forth of its own accord. And he devised a game dubbed "Treason," whereby he wired up a portrait of King George so that anyone who touched the monarch''s crown would be shocked. And he once infamously shocked himself while trying to kill a turkey with electricity. </p></div><p><a href="https://arstechnica.com/?p=1941212#p3">Read 13 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941212&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 22:46:20','Jennifer Ouellette','https://arstechnica.com/?p=1941212');
-INSERT INTO entries VALUES(26,'https://arstechnica.com/?p=1941492',3,'Widespread FBI abuse of foreign spy law sets off “alarm bells,” tech group says','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Widespread FBI abuse of foreign spy law sets off “alarm bells,” tech group says" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-73534290-800x534.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-73534290.jpg">Enlarge</a> (credit: <a class="caption-link" href="https://www.gettyimages.com/detail/news-photo/the-seal-of-the-f-b-i-hangs-in-the-flag-room-at-the-bureaus-news-photo/73534290" rel="nofollow">Chip Somodevilla / Staff | Getty Images North America</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>The FBI isn''t supposed to use <a href="https://arstechnica.com/tech-policy/2023/02/the-fbis-most-controversial-surveillance-tool-is-under-threat/2/">its most controversial spy tool</a> to snoop on emails, texts, and other private communications of Americans or anyone located in the United States. However, that didn''t stop the FBI from sometimes knowingly using its Foreign Intelligence Surveillance Act (FISA) Section 702 powers to conduct warrantless searches on US persons more than 280,000 times in 2020 and 2021, according to <a href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/US-Foreign-Intelligence-Surveillance-Court-Section-702-FBI-report-4-21-2022.pdf">new disclosures</a>. US Senator Ron Wyden (D-Ore.) <a href="https://www.wyden.senate.gov/news/press-releases/wyden-calls-for-reforms-to-fisa-surveillance-following-disclosure-of-new-abuses">described</a> the searches as  "shocking abuses."</p>\n<p>Among the most concerning <a href="https://cdt.org/insights/cdt-issue-brief-debunking-myths-fixing-fisa-s702-backdoor-search-loophole/">so-called backdoor searches</a> on Americans were disclosures that the FBI ran more than 23,000 queries on people involved in storming the US Capitol, 19,000 on political campaign donors, and 133 on protesters after the police killing of George Floyd. The deputy director of the Center for Democracy and Technology''s Security and Surveillance Project, Jake Laperruque, said that "these latest revelations should set off alarm bells across Congress," urging lawmakers in a <a href="https://cdt.org/press/shocking-new-fbi-political-surveillance-disclosures-highlight-need-for-fisa-reform/">statement</a> not to re-authorize FISA Section 702 at the end of this year—when it''s due to expire—without a "full overhaul."</p>\n<p>"The systemic misuse of this warrantless surveillance tool has made FISA 702 as toxic as COINTELPRO and the FBI abuses of the Hoover years," Laperruque said, while his group''s press release noted that the court opinion "confirmed the worst fears of civil rights and civil liberties advocates.</p></div><p><a href="https://arstechnica.com/?p=1941492#p3">Read 30 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941492&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 22:09:25','Ashley Belanger','https://arstechnica.com/?p=1941492');
-INSERT INTO entries VALUES(27,'https://arstechnica.com/?p=1941574',3,'Netflix crackdown on account sharing hits US with $8 fee for each extra user','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Illustration of a house with a Netflix logo and several TV screens." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/netflix-household-800x532.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/netflix-household.jpg">Enlarge</a> (credit: Netflix)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Netflix is now telling US customers to stop sharing accounts with people outside their households or pay $7.99 a month for each extra member. "Your Netflix account is for you and the people you live with—your household," Netflix says in an email targeted at customers whose accounts are being used in multiple locations.</p>\n<p>The email provides two options: transfer the extra person''s profile to a new membership that they can pay for separately, or spend $7.99 a month extra to "share your Netflix account with someone who doesn''t live with you."</p>\n<p>"Starting today, we will be sending this email to members who are sharing Netflix outside their household in the United States," <a href="https://about.netflix.com/en/news/update-on-sharing-may-us">Netflix announced</a>.</p></div><p><a href="https://arstechnica.com/?p=1941574#p3">Read 4 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941574&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 21:35:18','Jon Brodkin','https://arstechnica.com/?p=1941574');
-INSERT INTO entries VALUES(28,'https://arstechnica.com/?p=1941475',3,'Fake Pentagon “explosion” photo sows confusion on Twitter','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A fake AI-generated image of an " src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/AI_explosion_image-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/AI_explosion_image.jpg">Enlarge</a> <span class="sep">/</span> A fake image of an "explosion" near the Pentagon that went viral on Twitter. (credit: Twitter)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>On Monday, a <a href="https://twitter.com/AndyBCampbell/status/1660654574644887558?s=20">tweeted</a> AI-generated image suggesting a large explosion at the Pentagon led to brief confusion, which included a reported small drop in the stock market. It originated from a verified Twitter account named "Bloomberg Feed," unaffiliated with the well-known Bloomberg media company, and was quickly exposed as a hoax. However, before it was debunked, large accounts such as Russia Today had already spread the misinformation, <a href="https://www.washingtonpost.com/technology/2023/05/22/pentagon-explosion-ai-image-hoax/">The Washington Post reported</a>.</p>\n\n<p>The fake image depicted a large plume of black smoke alongside a building vaguely reminiscent of the Pentagon with the tweet "Large Explosion near The Pentagon Complex in Washington D.C. — Inital Report." Upon closer inspection, local authorities confirmed that the image was not an accurate representation of the Pentagon. Also, with blurry fence bars and building columns, it looks like a fairly sloppy AI-generated image created by a model like <a href="https://arstechnica.com/information-technology/2022/09/with-stable-diffusion-you-may-never-believe-what-you-see-online-again/">Stable Diffusion</a>.</p>\n<p>Before Twitter suspended the false Bloomberg account, it had a total post count of 224,000 tweets and had reached fewer than 1,000 followers overall, according to the Post, but it''s unclear who ran it or the motives behind sharing the false image. In addition to Bloomberg Feed, other accounts that shared the false report include “Walter Bloomberg” and “Breaking Market News," both unaffiliated with the real Bloomberg organization.</p></div><p><a href="https://arstechnica.com/?p=1941475#p3">Read 6 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941475&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 21:01:42','Benj Edwards','https://arstechnica.com/?p=1941475');
-INSERT INTO entries VALUES(29,'https://arstechnica.com/?p=1941294',3,'The $1,600 Dyson 360 Vis Nav promises to be the world’s most powerful robovac','text/html',replace('<div id="rss-wrap">\n\n\n\n\n\n<div><a name="page-1"></a></div>\n  <ul class="gallery shortcode-gallery gallery-wide">\n          <li>\n        <div class="gallery-item-content">\n          <div class="gallery-image"><img alt="" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/RB03_SUBLNK_034_RGB_FrontOn3QVert_A4_REFW-980x569.jpg" /></div>\n          <p>\n            The extremely colored Dyson 360 Vis Nav.                          [credit:\n                              Dyson                            ]\n                      </p>\n        </div>\n      </li>\n      </ul>\n\n<p>Swanky vacuum manufacturer Dyson has had a turbulent relationship with robovacs. The company''s first swing at the idea came in 2016 with the <a href="https://www.dyson.com/support/journey/guides/64989-01?machineId=64989-01">Dyson 360 Eye</a>, which sported a weird tall and stumpy form factor that didn''t fit under furniture. A 2020 sequel, the <a href="https://www.dyson.ie/vacuum-cleaners/robot-vacuums/dyson-360-heurist/dyson-360-heurist-overview">Dyson 360 Heurist</a>, kept the ultra-tall form factor and<a href="https://www.techradar.com/news/first-look-dyson-360-heurist-robot-wants-to-be-the-smartest-vacuum-cleaner-ever"> wasn''t even released</a> in the US as a result. This new robovac, the "<a href="https://www.dyson.co.uk/newsroom/overview/news/may-2023/dyson-launches-most-powerful-robot-vacuum">Dyson 360 Vis Nav</a>," opts for a more typical low, wide body design, making it look like a normal robot vacuum. Or at least, it''s as normal as a Dyson product can ever look—it still has a screaming metallic purple paint job and what looks like a silver <em>Alien</em>-like facehugger on the top deck.</p>\n<p>Old Dyson robovacs were around 9 inches wide and 4.7 inches tall, so the company previously opted for a robot with a small footprint and a tall body. That theoretically allowed it to maneuver into tighter places than your average short, flat disk vacuum, but it can''t kill the dust bunnies under the couch. Dyson says this new model can fit under a 99 mm (3.9 inch) tall gap, which is right in line with the normal height of a Roomba. It''s also D-shaped now, like a Neato vac or <a href="https://arstechnica.com/gadgets/2019/05/the-2019-roomba-gets-an-all-new-design-companion-mop-bot/">high-end Roomba</a>, which allows for a wider coverage path and to really get into those corners.</p>\n<p>Edge coverage is normally done by a spinning brush, but you won''t find one here. Instead, there is what looks like an extendable, L-shaped red squeegee just behind the brush bar. When the robot detects a wall, the squeegee extends to connect with the wall, and Dyson says this will "redirect suction" and pick up everything.</p></div><p><a href="https://arstechnica.com/?p=1941294#p3">Read 6 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941294&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 20:17:24','Ron Amadeo','https://arstechnica.com/?p=1941294');
-INSERT INTO entries VALUES(30,'https://arstechnica.com/?p=1941465',3,'Woman with untreated TB still on the lam three months after arrest warrant','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Scanning electron micrograph of &lt;em&gt;Mycobacterium tuberculosis&lt;/em&gt; bacteria, which cause TB." src="https://cdn.arstechnica.net/wp-content/uploads/2015/03/5149398678_97948614ea_o-514x640.jpg" />\n      <p class="caption" style="font-size: 0.8em;">Scanning electron micrograph of <em>Mycobacterium tuberculosis</em> bacteria, which cause TB. (credit: <a class="caption-link" href="http://www.flickr.com/photos/niaid/5149398678/" rel="nofollow">National Institute of Allergy and Infectious Diseases</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>A woman with an <a href="https://arstechnica.com/science/2023/02/us-woman-has-walked-around-with-untreated-tb-for-over-a-year-now-faces-jail/">untreated infectious case of tuberculosis</a> and a months-old civil warrant out for her arrest continues to evade the sheriff''s department in Tacoma, Washington, drawing local frustration.</p>\n<p> On Friday, the woman failed to show up <a href="https://arstechnica.com/science/2023/03/us-woman-headed-to-jail-for-refusing-tb-treatment-for-over-a-year/">to yet another court hearing</a>, to which she has been summoned on a roughly monthly basis since January 2022. That''s when the county health department began using court orders to try to compel her to get her deadly respiratory infection treated and/or remain in isolation to protect the public until she is no longer infectious.</p>\n<p>Pierce County Superior Court Judge Philip Sorensen ruled once again Friday that the woman—known only by the initials "V.N." in court documents—was in contempt of those court orders. Sorensen had initially issued a civil arrest warrant on March 2, 2023, ordering her to involuntary detention for testing and treatment. He extended the warrant Friday.</p></div><p><a href="https://arstechnica.com/?p=1941465#p3">Read 11 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941465&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 20:01:21','Beth Mole','https://arstechnica.com/?p=1941465');
-INSERT INTO entries VALUES(31,'https://arstechnica.com/?p=1941414',3,'Study: People think undermining democracy is ok if others do it first','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Image of a fractured US capital building, highlighted in red and blue." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1421641499-800x566.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1421641499.jpg">Enlarge</a> (credit: <a class="caption-link" href="https://www.gettyimages.com/detail/photo/midterm-election-u-s-voting-rights-and-election-royalty-free-image/1421641499?phrase=voting+protest&amp;adppopup=true" rel="nofollow">Douglas Rissing</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Many Americans have been shocked by the frequency with which people who claim to love our democracy have supported blatantly undemocratic efforts to limit people''s ability to vote or to selectively discard votes already cast. Unfortunately, this sort of democratic backsliding is far from a US-specific problem. Despite widespread support for democracy in countries like Venezuela and Hungary, people have turned out in large numbers to vote for autocrats.</p>\n<p>A new study performed in the US suggests at least one explanation for the problem: People across the political spectrum appear to believe their political opponents are likely to take anti-democratic action if given the opportunity. And the strength of this belief correlates with a slightly increased willingness to take those actions first.</p>\n<h2>Nobody says they like this stuff</h2>\n<p>The finding, from a University of California, Berkeley-Massachusetts Institute of Technology collaboration, is based on demographically representative survey populations, which were asked about several potential anti-democratic actions. For example, those surveyed were asked if they agreed with reducing the number of voting facilities in towns that support the opposing party. Similar questions got at things like banning rallies, limiting freedom of expression, ignoring court rulings, or resorting to violence. After being asked for their own opinions, people were then asked whether they thought their political opponents supported these anti-democratic approaches.</p></div><p><a href="https://arstechnica.com/?p=1941414#p3">Read 11 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941414&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 19:51:15','John Timmer','https://arstechnica.com/?p=1941414');
-INSERT INTO entries VALUES(32,'https://arstechnica.com/?p=1941388',3,'Google bans Downloader app after TV firms complain it can load a pirate website','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Screenshot of the Google home page displayed on Downloader, an Android app with a built-in browser." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/downloader-browser-800x450.png" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/downloader-browser.png">Enlarge</a> <span class="sep">/</span> The Downloader app that was suspended from Google Play. (credit: <a class="caption-link" href="https://www.aftvnews.com/downloader/screenshots/downloader-v1-4-1-browser/" rel="nofollow">Elias Saba</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>The Google Play Store suspended an app that combines a web browser with a file manager after a Digital Millennium Copyright Act (DMCA) complaint pointed out that the app is capable of loading a piracy website—even though that same pirate website can be loaded on any standard browser, including Google Chrome.</p>\n<p>The free <a href="https://play.google.com/store/apps/details?id=com.esaba.downloader">app</a>, which is designed for Android TV devices and is called Downloader, had been installed from Google Play over 5 million times before its suspension on Friday, an <a href="https://web.archive.org/web/20230219204835/https://play.google.com/store/apps/details?id=com.esaba.downloader">Internet Archive</a> capture shows. The suspension notice that Google sent to Downloader app developer Elias Saba cites a complaint from several Israeli TV companies that said the app "allows users to view the infamous copyright infringing website known as SDAROT."</p>\n<p>Saba provided us with a copy of the suspension notice.</p></div><p><a href="https://arstechnica.com/?p=1941388#p3">Read 12 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941388&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 19:13:03','Jon Brodkin','https://arstechnica.com/?p=1941388');
-INSERT INTO entries VALUES(33,'https://arstechnica.com/?p=1941261',3,'Adobe Photoshop’s new “Generative Fill” AI tool lets you manipulate photos with text','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="An example of a 1983 file photo of the Apple Lisa computer that has been significantly enhanced by Generative Fill in the Adobe Photoshop beta." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/generative_fill_hero_3-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/generative_fill_hero_3.jpg">Enlarge</a> <span class="sep">/</span> An example of a 1983 file photo of the Apple Lisa computer that has been significantly enhanced by the new "Generative Fill" AI tool in the Adobe Photoshop beta. (credit: Apple / Benj Edwards / Adobe)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>On Tuesday, Adobe <a href="https://blog.adobe.com/en/publish/2023/05/23/photoshop-new-features-ai-contextual-presets">added</a> a new tool to its Photoshop beta called "Generative Fill," which uses cloud-based image synthesis to fill selected areas of an image with new AI-generated content based on a text description. Powered by Adobe Firefly, Generative Fill works similarly to a technique called "inpainting" used in <a href="https://arstechnica.com/information-technology/2022/09/openai-image-generator-dall-e-now-available-without-waitlist/">DALL-E</a> and <a href="https://arstechnica.com/information-technology/2022/09/with-stable-diffusion-you-may-never-believe-what-you-see-online-again/">Stable Diffusion</a> releases since last year.</p>\n\n<p>At the core of Generative Fill is <a href="https://arstechnica.com/information-technology/2023/03/ethical-ai-art-generation-adobe-firefly-may-be-the-answer/">Adobe Firefly</a>, which is Adobe''s custom image-synthesis model. As a deep learning AI model, Firefly has been trained on millions of images in Adobe''s stock library to associate certain imagery with text descriptions of them. Now part of Photoshop, people can type in what they want to see (i.e., "a clown on a computer monitor"), and Firefly will synthesize several options for the user to choose from. Generative Fill uses a well-known AI technique called "<a href="https://www.nvidia.com/research/inpainting/index.html">inpainting</a>" to create a context-aware generation that can seamlessly blend synthesized imagery into an existing image.</p>\n<p>To use Generative Fill, users select an area of an existing image they want to modify. After selecting it, a "Contextual Task Bar" pops up that allows users to type in a description of what they want to see generated in the selected area. Photoshop sends this data to Adobe''s servers for processing, then returns results in the app. After generating, the user has the option to select between several options of generations or to create more options to browse through.</p></div><p><a href="https://arstechnica.com/?p=1941261#p3">Read 7 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941261&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 19:07:19','Benj Edwards','https://arstechnica.com/?p=1941261');
-INSERT INTO entries VALUES(34,'https://arstechnica.com/?p=1941299',3,'Meta has no choice but to sell Giphy at $262M loss to Shutterstock','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Giphy logo displayed on a phone screen and Meta logo displayed on a laptop screen" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1236896689-800x474.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1236896689.jpg">Enlarge</a> (credit: <a class="caption-link" href="https://www.gettyimages.com/detail/news-photo/giphy-logo-displayed-on-a-phone-screen-and-meta-logo-news-photo/1236896689" rel="nofollow">Getty</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<div class="c-virtual_list__item c-virtual_list__item--initial-activeitem" id="1684861893.663099" tabindex="0">\n<div class="c-message_kit__background c-message_kit__background--hovered p-message_pane_message__message c-message_kit__message">\n<div class="c-message_kit__hover c-message_kit__hover--hovered">\n<div class="c-message_kit__actions c-message_kit__actions--default">\n<div class="c-message_kit__gutter">\n<div class="c-message_kit__gutter__right">\n<div class="c-message_kit__blocks c-message_kit__blocks--rich_text">\n<div class="c-message__message_blocks c-message__message_blocks--rich_text">\n<div class="p-block_kit_renderer">\n<div class="p-block_kit_renderer__block_wrapper p-block_kit_renderer__block_wrapper--first">\n<div class="p-rich_text_block" dir="auto">\n<div class="p-rich_text_section">Talk about a fire sale. With limited interest in GIF platforms and UK regulators <a href="https://arstechnica.com/tech-policy/2021/12/metas-failed-giphy-deal-could-end-big-techs-spending-spree/">forcing</a> a sale, Meta has decided to sell Giphy to Shutterstock for a mere $53 million. After purchasing it for $315 million in 2020 and subsequently being <a href="https://arstechnica.com/tech-policy/2022/10/meta-grudgingly-agrees-to-sell-giphy-after-admitting-defeat-in-uk-battle/">ordered to sell it</a> by the UK''s Competition and Markets Authority (CMA), Meta has been challenged to find a suitable Giphy buyer at a time when GIFs are perceived to be less trendy than three years ago. The GIF library has found a fitting future owner in Shutterstock, but for Meta, it means a $262 million loss.</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n<h2>The deal</h2>\n<p>Shutterstock announced today its definitive agreement to buy Giphy for $53 million, seven months after Meta said it would accept the CMA''s ruling that it <a href="https://www.gov.uk/cma-cases/facebook-inc-giphy-inc-merger-inquiry#final-order">must divest Giphy</a>. Shutterstock said the deal is expected to close in June and is "subject to customary closing conditions."</p>\n<p>The deal should assuage trepidation from Giphy, which encouraged the CMA to enact behavioral ordinances rather than force Meta to sell Giphy. The animated images company feared GIFs just weren''t as cool as they were in 2020, and so the platform would mostly attract "weak or inappropriate" suitors.</p>\n<p>“User sentiment towards GIFs on social media shows that they have fallen out of fashion as a content form, with younger users in particular describing GIFs as ‘for boomers’ and ‘cringe,’" <a href="https://assets.publishing.service.gov.uk/media/62fe118dd3bf7f06e5a1c454/Giphy_Submission_on_Remittal_18.8.22.pdf">Giphy told the CMA</a> in August.</p></div><p><a href="https://arstechnica.com/?p=1941299#p3">Read 18 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941299&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 18:15:52','Scharon Harding','https://arstechnica.com/?p=1941299');
-INSERT INTO entries VALUES(35,'https://arstechnica.com/?p=1941347',3,'Unexpected 3DS update breaks many common homebrew hacking methods','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A few of the 3DS variations that were once supported by Nintendo." src="https://cdn.arstechnica.net/wp-content/uploads/2020/09/3ds6-800x534.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2020/09/3ds6.jpg">Enlarge</a> <span class="sep">/</span> A few of the 3DS variations that were once supported by Nintendo. (credit: Mark Walton)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>It has been years since <a href="https://arstechnica.com/gaming/2020/09/the-end-of-the-3ds-marks-an-inflection-point-for-portable-gaming/">Nintendo stopped producing its Nintendo 3DS line</a> of portable hardware and months since the company <a href="https://arstechnica.com/gaming/2023/03/todays-the-last-day-to-buy-eshop-games-for-the-wii-u-and-3ds/">officially shut down the 3DS eShop</a> for new downloadable game purchases. But those facts haven''t stopped the company from issuing a new firmware update that seems at least partly focused on impeding some of the most common methods for installing homebrew software on the defunct console.</p>\n<p>Monday night''s surprise release of 3DS firmware Ver. 11.17.0-50 is the first official system update for the console since last September and the fifth update since the hardware was officially discontinued in 2020. The <a href="a%20href=">official patch notes</a> for the sudden update cover the now-standard (if vague) promise of "further improvements to overall system stability and other minor adjustments [that] have been made to enhance the user experience."</p>\n<p>But console hacking groups quickly noticed that downloading the update ruined <a href="https://3ds.hacks.guide/">many of the documented hacking methods</a> that could previously be used to install custom 3DS firmware.</p></div><p><a href="https://arstechnica.com/?p=1941347#p3">Read 6 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941347&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 17:37:46','Kyle Orland','https://arstechnica.com/?p=1941347');
-INSERT INTO entries VALUES(36,'https://arstechnica.com/?p=1941293',3,'Built-in ChatGPT-driven Copilot will transform Windows 11 starting in June','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Windows Copilot is an AI-assisted feature coming to Windows 11 preview builds starting in June." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/windows-copilot-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/windows-copilot.jpg">Enlarge</a> <span class="sep">/</span> Windows Copilot is an AI-assisted feature coming to Windows 11 preview builds starting in June. (credit: Microsoft)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>A couple of months ago, Microsoft added generative AI features to Windows 11 in the form of <a href="https://arstechnica.com/gadgets/2023/02/new-windows-11-update-puts-ai-powered-bing-chat-directly-in-the-taskbar/">a taskbar-mounted version of the Bing chatbot</a>. Starting this summer, the company will be going even further, adding <a href="https://blogs.windows.com/windowsdeveloper/2023/05/23/bringing-the-power-of-ai-to-windows-11-unlocking-a-new-era-of-productivity-for-customers-and-developers-with-windows-copilot-and-dev-home/">a new ChatGPT-driven Copilot feature</a> that can be used alongside your other Windows apps. The company announced the change at its Build developer conference alongside another new batch of Windows 11 updates due later this year. Windows Copilot will be available to Windows Insiders starting in June.</p>\n\n<p><a href="https://arstechnica.com/information-technology/2023/03/microsoft-365s-ai-powered-copilot-is-like-an-omniscient-version-of-clippy/">Like the Microsoft 365 Copilot</a>, Windows Copilot is a separate window that opens up along the right side of your screen and assists with various tasks based on what you ask it to do. A Microsoft demo video shows Copilot changing Windows settings, <a href="https://arstechnica.com/gadgets/2021/10/windows-11-the-ars-technica-review/6/#h3">rearranging windows with Snap Layouts</a>, summarizing and rewriting documents that were dragged into it, and opening apps like Spotify, Adobe Express, and Teams. Copilot is launched with a dedicated button on the taskbar.</p>\n<p>"Once open, the Windows Copilot side bar stays consistent across your apps, programs and windows, always available to act as your personal assistant. It makes every user a power user, helping you take action, customize your settings, and seamlessly connect across your favorite apps," <a href="https://blogs.windows.com/windowsdeveloper/2023/05/23/bringing-the-power-of-ai-to-windows-11-unlocking-a-new-era-of-productivity-for-customers-and-developers-with-windows-copilot-and-dev-home/">wrote</a> Microsoft Chief Product Officer Panos Panay.</p></div><p><a href="https://arstechnica.com/?p=1941293#p3">Read 7 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941293&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 17:08:01','Andrew Cunningham','https://arstechnica.com/?p=1941293');
-INSERT INTO entries VALUES(37,'https://arstechnica.com/?p=1941303',3,'Activision shuts down popular fan servers for legacy Call of Duty games','text/html',replace('<div id="rss-wrap">\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<div class="video"><div class="wrapper" height="360" src="https://www.youtube.com/embed/WlO07UN9MoA?start=0&amp;wmode=transparent" style="display: block;" type="text/html" width="640"></div><p class="caption" style="font-size: 0.8em;">Prerelease video of <em>Modern Warfare 2</em>''s SM2 mod, which has ceased development following an Activision cease-and-desist request. </p></div>\n<p>Activision has sent cease-and-desist letters to two makers of popular fan clients for legacy Call of Duty titles in recent weeks. The move cuts off access to the many gameplay and quality-of-life improvements brought by these clients and stops what fans say is the only safe way to play these older games without the threat of damaging hacking by opponents.</p>\n<p>The first victim of Activision''s recent efforts was SM2, a major <em>Modern Warfare 2</em> modding project whose development <a href="https://web.archive.org/web/20230123173904/https://sm2.gg/faq/">started over two years ago</a>. Since then, the modding group has been working on updating that seminal 2009 release with new weapons, in-game perks, a redesigned UI, new streak and progression systems, and even <a href="https://web.archive.org/web/20230422161946/sm2.gg/devblog-4/">a recent move to a more modern game engine</a>.</p>\n<p>Those efforts stopped last week, though, before the mod could even release its first version. The SM2 Twitter account <a href="https://twitter.com/sm2game/status/1658745182819598337">reported</a> that "a team member received a Cease &amp; Desist letter on behalf of Activision Publishing in relation to the SM2 project. We are complying with this order and shutting down all operations permanently."</p></div><p><a href="https://arstechnica.com/?p=1941303#p3">Read 8 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941303&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 16:48:57','Kyle Orland','https://arstechnica.com/?p=1941303');
-INSERT INTO entries VALUES(38,'https://arstechnica.com/?p=1941308',3,'Ford reverses plan to ditch AM radio after congressional attention','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A 2012-era Ford radio" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/SYNC-GreaterMedia_02_HR-800x532.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/SYNC-GreaterMedia_02_HR.jpg">Enlarge</a> (credit: Ford)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Today is just an AM-tastic day, isn''t it? Earlier this morning, <a href="https://arstechnica.com/cars/2023/05/ev-advocates-join-tech-groups-and-automakers-to-oppose-am-radio-mandate/">we reported on industry pushback</a> against congressional plans to mandate AM radios in all new cars. The topic has been building for some time now—Tesla and BMW dropped AM radio from new electric vehicles some years ago—but it made headlines again in February when <a href="https://arstechnica.com/cars/2023/03/the-2024-ford-mustang-is-the-next-car-to-lose-am-radio/">Ford revealed that the 2024 Mustang</a> would lose the ability to pick up AM. Well, Ford has changed the channel on its decision and will restore AM radio to its place on the dashboard.</p>\n<p>The move was announced by Ford CEO Jim Farley, <a href="https://twitter.com/jimfarley98/status/1661024295110463491">who took to Twitter with the news</a>.</p>\n<p>Although AM radio is mostly used by its adherents to listen to talk radio, sports, and local traffic, a bipartisan collection of Senators and Representatives introduced a bill last week to mandate the inclusion of AM radio in all new cars so they can receive messages in the case of an emergency. That argument evidently proved compelling:</p></div><p><a href="https://arstechnica.com/?p=1941308#p3">Read 2 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941308&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 16:30:51','Jonathan M. Gitlin','https://arstechnica.com/?p=1941308');
-INSERT INTO entries VALUES(39,'https://arstechnica.com/?p=1941265',3,'Congress wants AM radio in all new cars—trade groups say that’s a mistake','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Retro styled image of an old car radio inside a green classic car" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-470623160-800x533.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-470623160-scaled.jpg">Enlarge</a> (credit: Getty Images)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>The fight over the future of AM radio got a little more heated this week as organizations representing the auto and technology industries told Congress that its plan to mandate this mode of radio wave reception is poorly conceived and will hinder progress.</p>\n<p>AM radio has seen almost every other in-car entertainment option come and go—vinyl, 8-tracks, cassettes, CDs—and it might predate just about everything other than playing "I Spy," but time is catching up with this old broadcast technology. It is starting to get left behind as new models—many of which are electric vehicles—drive off into the sunset, streaming their audio instead of modulating its amplitude.</p>\n<p><a href="https://arstechnica.com/cars/2023/03/the-2024-ford-mustang-is-the-next-car-to-lose-am-radio/">When we reported on the news that AM would be absent from the 2024 Ford Mustang</a>, we noted that some elected officials in Congress were not cool with retiring this kind of radio. Now some of them have gone a step further and introduced a bill—the "<a href="https://www.menendez.senate.gov/imo/media/doc/am_for_every_vehicle_act.pdf">AM Radio for Every Vehicle Act</a>"—that would require every new vehicle to include an AM radio receiver as standard equipment at no extra cost to the car buyer.</p></div><p><a href="https://arstechnica.com/?p=1941265#p3">Read 8 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941265&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 14:16:49','Jonathan M. Gitlin','https://arstechnica.com/?p=1941265');
-INSERT INTO entries VALUES(40,'https://arstechnica.com/?p=1941222',3,'Cadillac will electrify its most excessive SUV, the Escalade','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A Cadillac Escalade headlight" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2023-cadillac-escalade-premium-luxury-004-800x533.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2023-cadillac-escalade-premium-luxury-004.jpg">Enlarge</a> (credit: Cadillac)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>In 2020, Ars tested the then-new Cadillac Escalade. The big SUV is Cadillac''s bestseller, and while we <a href="https://arstechnica.com/cars/2020/10/an-augmented-reality-dashboard-stars-in-the-2021-cadillac-escalade/">might not have enjoyed the way it drove, or its thirst</a>, it did feature some interesting driver assistance technology. There''s a chance we might prefer driving the next Escalade, though—on Monday afternoon, Cadillac revealed that it is working on an electric Escalade, called the Escalade IQ, and it will show off the new electric SUV later this year.</p>\n<p>There''s quite a lot riding on the electric Escalade. The regular version accounts for about a third of Cadillac''s total sales each year, and automakers in general make the most money from large, loaded, and expensive vehicles.</p>\n<p>That probably explains why the electric version will still be called an Escalade—you''d be silly to throw away that brand identity—although appending an "IQ" to the end creates a corporate link with Caddy''s other EVs, the $60,000 <a href="https://arstechnica.com/cars/2022/06/not-your-grandpas-ride-the-2023-cadillac-lyriq-tested/">Lyriq</a> and $300,000 <a href="https://arstechnica.com/cars/2022/06/cadillacs-electric-flagship-will-be-hand-built-use-extensive-3d-printing/">Celestiq</a>. (No, that''s not a typo.)</p></div><p><a href="https://arstechnica.com/?p=1941222#p3">Read 4 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941222&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 13:15:37','Jonathan M. Gitlin','https://arstechnica.com/?p=1941222');
-INSERT INTO entries VALUES(41,'https://www.polygon.com/23734332/dnd-dungeons-dragons-vtt-virtual-tabletop-details-preview-price-release-date',4,'D&D’s virtual tabletop is off to a slow start, but designers say that’s very much the point','text/html',replace('<figure>\n      <img alt="A dwarf smoking a pipe stands before a roaring fire at an in. The image is from a pre-release alpha of the D&amp;amp;D virtual tabletop, shown in August 2022." src="https://cdn.vox-cdn.com/thumbor/cvm8ia5qPLPYETYUFFnV5xi2Vj8=/0x0:2558x1439/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72308469/VTT.0.jpeg" />\n        <figcaption>Image: Wizards of the Coast via <a class="ql-link" href="https://youtu.be/7RiRoslMaa0" target="_blank">YouTube</a></figcaption>\n    </figure>\n\n  <p>The VTT works surprisingly well for playing in person</p>\n  <p>\n    <a href="https://www.polygon.com/23734332/dnd-dungeons-dragons-vtt-virtual-tabletop-details-preview-price-release-date">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-24 13:00:00','Charlie Hall','https://www.polygon.com/23734332/dnd-dungeons-dragons-vtt-virtual-tabletop-details-preview-price-release-date');
-INSERT INTO entries VALUES(42,'https://www.polygon.com/23734649/playstation-showcase-2023-time-where-to-watch',4,'Watch Sony’s new PlayStation Showcase','text/html',replace('<figure>\n      <img alt="Sony Playstation logos are displayed during the Sony PlayStation E3 conference at LA Center Studios on June 11, 2018 in Los Angeles, California." src="https://cdn.vox-cdn.com/thumbor/8GZd3IJzhW8oTr4vvXesdDrfWds=/0x100:1920x1180/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72308195/GettyImages_971862184.0.jpg" />\n        <figcaption>Photo: Christian Petersen/Getty Images</figcaption>\n    </figure>\n\n  <p>Where and when to tune in for the next big look at PS5 and PSVR 2</p>\n  <p>\n    <a href="https://www.polygon.com/23734649/playstation-showcase-2023-time-where-to-watch">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-24 11:00:00','Michael McWhertor','https://www.polygon.com/23734649/playstation-showcase-2023-time-where-to-watch');
-INSERT INTO entries VALUES(43,'https://www.polygon.com/23735571/the-flash-trailer-batman-gets-nuts-again',4,'Batman still wants to get nuts in The Flash trailer','text/html',replace('<figure>\n      <img alt="Michael Keaton wearing the Batman costume, with his face exposed, in The Flash" src="https://cdn.vox-cdn.com/thumbor/HLHg318AsvYFNUqWNX3pI5ypfCE=/133x59:2480x1379/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72308153/the_flash_batman_michael_keaton.0.png" />\n        <figcaption>Image: Warner Bros./DC Studios</figcaption>\n    </figure>\n\n  <p>The last big push for the DC movie has few surprises, a lighter tone, and Jeremy Irons</p>\n  <p>\n    <a href="https://www.polygon.com/23735571/the-flash-trailer-batman-gets-nuts-again">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-24 10:22:53','Oli Welsh','https://www.polygon.com/23735571/the-flash-trailer-batman-gets-nuts-again');
-INSERT INTO entries VALUES(44,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734302/turakamik-shrine-puzzle-solution-chest',4,'Turakamik Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="A screenshot shows a shrine in The Legend of Zelda: Tears of the Kingdom. It looks like a rock emitting swirling green energy." src="https://cdn.vox-cdn.com/thumbor/WBkcdDoavw_1TSdi4R--MVhUjmY=/0x0:1920x1080/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307372/My_Great_Game___Zelda_Tears_of_the_Kingdom_2023_05_23_14_25_38__1_.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>How to complete the ‘Hidden Metal’ puzzle</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734302/turakamik-shrine-puzzle-solution-chest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 23:16:14','Ana Diaz','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734302/turakamik-shrine-puzzle-solution-chest');
-INSERT INTO entries VALUES(45,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734195/miryotanog-shrine-solution-puzzle-chest',4,'Miryotanog Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="Link running into Miryotanog Shrine in the Gerudo Desert of Zelda: Tears of the Kingdom" src="https://cdn.vox-cdn.com/thumbor/PEWTj1AqpHRbqovJZUWN6FnnYHA=/0x0:1920x1080/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307197/vlcsnap_2023_05_23_14h36m54s846.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>How to complete the ‘Proving Grounds: Lure’ challenge</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734195/miryotanog-shrine-solution-puzzle-chest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 22:01:45','Maddy Myers','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734195/miryotanog-shrine-solution-puzzle-chest');
-INSERT INTO entries VALUES(46,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734862/ganos-shrine-puzzle-solution-chest-tabantha-sky-crystal-quest',4,'Ganos Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="An image shows Ganos Shrine in The Legend of Zelda: Tears of the Kingdom. It looks like a rock with a portal to another cave." src="https://cdn.vox-cdn.com/thumbor/ZM9bQGbBWLgGA2RDdNwOZKlOL6U=/0x0:1920x1080/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307175/Tears_of_the_Kingdom_Ganos_Shrine_exterior.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>How to access Ganos Shrine</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734862/ganos-shrine-puzzle-solution-chest-tabantha-sky-crystal-quest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 21:54:29','Ana Diaz','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734862/ganos-shrine-puzzle-solution-chest-tabantha-sky-crystal-quest');
-INSERT INTO entries VALUES(47,'https://www.polygon.com/23734839/destiny-2-season-deep-armor-skins-items-crossovers',4,'Destiny 2’s latest season kicks off with Kratos and The Last of Us crossover gear','text/html',replace('<figure>\n      <img alt="screenshot showing a new skin for Destiny 2’s “season of the deep” season — it’s a tribute to their colleagues who made Horizon: Zero Dawn" src="https://cdn.vox-cdn.com/thumbor/u1QsDiv8i70VS5Lhp9zWnT4k6UQ=/0x0:1600x900/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307105/52907802411_45cdd80f0d_h.0.jpg" />\n        <figcaption>Bungie’s <em>Destiny 2 </em>homage to Aloy from Guerrilla Games’ Horizon series | Image: Bungie/Sony Interactive Entertainment</figcaption>\n    </figure>\n\n  <p>Have fun with armor and items inspired by other PlayStation tentpoles</p>\n  <p>\n    <a href="https://www.polygon.com/23734839/destiny-2-season-deep-armor-skins-items-crossovers">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 21:41:53','Owen S. Good','https://www.polygon.com/23734839/destiny-2-season-deep-armor-skins-items-crossovers');
-INSERT INTO entries VALUES(48,'https://www.polygon.com/2023/5/23/23734930/netflix-password-sharing-details-and-pricing-may-2023',4,'Sharing a Netflix password will now cost $7.99 a month per additional user','text/html',replace('<figure>\n      <img alt="Bright colorful illustration of Netflix logo" src="https://cdn.vox-cdn.com/thumbor/gclUJlgC9xcHytZSsT0oPxstX2E=/0x156:3000x1844/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72306966/ArielDavis_210629_ecl1087_Netflix_0001.0.jpg" />\n        <figcaption>Illustration: Ariel Davis for Polygon</figcaption>\n    </figure>\n\n  <p>They have altered the deal, pray they do not alter it further</p>\n  <p>\n    <a href="https://www.polygon.com/2023/5/23/23734930/netflix-password-sharing-details-and-pricing-may-2023">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 21:20:33','Toussaint Egan','https://www.polygon.com/2023/5/23/23734930/netflix-password-sharing-details-and-pricing-may-2023');
-INSERT INTO entries VALUES(49,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23688353/totk-shrine-map-locations',4,'Shrine map and locations for Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="The Legend of Zelda: Tears of the Kingdom Link entering a shrine on a Sky Island" src="https://cdn.vox-cdn.com/thumbor/U8Sp2quL2cc5AAIaDdfxhn73NiY=/0x1:2880x1621/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72270335/Tears_of_the_Kingdom_Shrine_header.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>Our in-progress list of shrines and where to find them</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23688353/totk-shrine-map-locations">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 20:43:41','Jeffrey Parkin','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23688353/totk-shrine-map-locations');
-INSERT INTO entries VALUES(50,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734853/kamatukis-shrine-solution-puzzle-chest',4,'Kamatukis Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="Kamatukis Shrine location in Hyrule in Zelda: Tears of the Kingdom" src="https://cdn.vox-cdn.com/thumbor/gDuJy-Vkfw-iNxjS_q4cMO9lQgU=/0x0:1280x720/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72306812/Fw1gstsacAAlUSz.0.jpg" />\n        <figcaption>Image: Nintendo EPD/Nintendo</figcaption>\n    </figure>\n\n  <p>How to complete the ‘A Precise Strike’ puzzle</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734853/kamatukis-shrine-solution-puzzle-chest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 20:41:25','Nicole Carpenter','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734853/kamatukis-shrine-solution-puzzle-chest');
-INSERT INTO entries VALUES(51,'tag:daringfireball.net,2023:/linked//6.39952',5,'Tickets for The Talk Show Live From WWDC 2023','text/html',replace('<p>First batch of tickets is on sale now.</p>\n\n<p><strong>Location:</strong> The California Theatre, San Jose <br />\n<strong>Showtime:</strong> Wednesday, 7 June 2023, 5 pm PT (Doors open 4 pm) <br />\n<strong>Special Guest(s):</strong> <em>Yes</em>  </p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/tickets-for-the-talk-show-live-from-wwdc-2023" title="Permanent link to ‘Tickets for The Talk Show Live From WWDC 2023’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-24 02:25:12','John Gruber','https://ti.to/daringfireball/the-talk-show-live-from-wwdc-2023');
-INSERT INTO entries VALUES(52,'tag:daringfireball.net,2023:/linked//6.39951',5,'Adobe Adds AI Generative Fill to Photoshop','text/html',replace('<p>Pam Clark, writing for the Adobe Blog:</p>\n\n<blockquote>\n  <p>We are thrilled to announce that the Photoshop (beta) app has\nreleased Generative Fill, the world’s first co-pilot in creative\nand design workflows, giving users a magical new way to work.\nGenerative Fill is powered by <a href="https://firefly.adobe.com/">Adobe Firefly</a>, Adobe’s\nfamily of creative generative AI models. Starting today,\nPhotoshop subscribers can create extraordinary imagery from a\nsimple text prompt.</p>\n\n<p>This brings two imaging powerhouses together — Photoshop and\ngenerative AI, enabling you to generate content from inside\nPhotoshop with a text prompt and edit it with Photoshop’s\ncomprehensive range of tools to create extraordinary results.</p>\n</blockquote>\n\n<p>“Extraordinary” is no exaggeration. Just amazing stuff.</p>\n\n<p><strong>See also:</strong> <a href="https://www.youtube.com/watch?v=Sp6K3qpVFO0">This 5-minute video</a> on Adobe’s YouTube channel, and <a href="https://twitter.com/scottbelsky/status/1660992735040663553">this thread on Twitter from Adobe’s Scott Belsky</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/photoshop-generative-fill" title="Permanent link to ‘Adobe Adds AI Generative Fill to Photoshop’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:51:19','John Gruber','https://blog.adobe.com/en/publish/2023/05/23/future-of-photoshop-powered-by-adobe-firefly');
-INSERT INTO entries VALUES(53,'tag:daringfireball.net,2023:/linked//6.39950',5,'The Verge: The 5 Biggest Announcements at Microsoft Build 2023','text/html',replace('<p>All five items on The Verge’s list are AI-related, topped by an AI-powered personal assistant (named Copilot, natch) built into the Windows 11 task bar.</p>\n\n<p>How many AI announcements will Apple have at WWDC?</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/microsoft-build-top-5" title="Permanent link to ‘The Verge: The 5 Biggest Announcements at Microsoft Build 2023’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:37:20','John Gruber','https://www.theverge.com/23734104/microsoft-build-2023-ai-bing-copilot');
-INSERT INTO entries VALUES(54,'tag:daringfireball.net,2023:/linked//6.39949',5,'CNN Fucked Around With Trump’s Town Hall, Now Finding Out','text/html',replace('<p>CNN — now owned by Warner “Bros” Discovery, who, <a href="https://daringfireball.net/linked/2023/05/23/max-tvos">as I’ve mentioned</a>, are morons — is learning the same thing as Twitter: there’s no mainstream audience for right-wing media, and no mainstream tolerance for insurrectionists or their sympathizers. Two weeks ago they <a href="https://www.cnn.com/2023/05/18/media/christiane-amanpour-trump-town-hall-reliable-sources/index.html">embarrassed themselves</a> by handing over a prime time hour of TV to Donald Trump. WBD CEO (and Biff-Tannen-in-glasses lookalike) David Zaslav <a href="https://deadline.com/2023/05/cnn-republicans-warner-bros-discovery-david-zaslav-1235371510/">bragged</a>, “Republicans are back on the air.” </p>\n\n<p>Now, reports Justin Baragona at The Daily Beast:</p>\n\n<blockquote>\n  <p>More than a week after CNN’s <a href="https://www.thedailybeast.com/inside-the-cnn-meltdown-over-its-town-hall-disaster">disastrous town hall</a> with\nformer President Donald Trump, the negative impact the fiasco had\non the network’s ratings is coming into clearer focus. Last week,\nthe cable news pioneer suffered its lowest-rated week since June\n2015, averaging just 429,000 total daily viewers from\nMonday-Friday. CNN was also down double digits compared to the\nsame week last year in both total viewership and in the key\nadvertising demographic of viewers ages 25-54. MSNBC more than\ndoubled CNN’s daily audience, drawing 976,000 total viewers, while\nFox News averaged 1.4 million. [...]</p>\n\n<p>Since the town hall, CNN has seen <a href="https://www.thedailybeast.com/surging-newsmax-crows-about-beating-cnn-in-ratings">several of its weeknight\nhours</a> — including Anderson Cooper — <a href="https://www.thedailybeast.com/cnn-loses-to-newsmax-in-primetime-ratings-two-days-after-trump-town-hall">fall behind\nNewsmax</a>, the fringe-right channel that has surged since\nCarlson’s ouster. And on Friday night, the channel’s <a href="https://www.thedailybeast.com/cnn-moving-chris-wallaces-sunday-interview-show-to-friday-nights">much-hyped\ninterview show</a> hosted by Chris Wallace averaged only\n224,000 total viewers at 10 p.m., drawing 60,000 fewer viewers\nthan Newsmax’s offering.</p>\n</blockquote>\n\n<p>Losing to Newsmax. Jiminy.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/cnn-fucked-around-found-out" title="Permanent link to ‘CNN Fucked Around With Trump’s Town Hall, Now Finding Out’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:33:26','John Gruber','https://www.thedailybeast.com/heres-how-bad-cnns-post-trump-town-hall-ratings-have-been');
-INSERT INTO entries VALUES(55,'tag:daringfireball.net,2023:/linked//6.39948',5,'Charlie Warzel: ‘Twitter Is a Far-Right Social Network’','text/html',replace('<p>Charlie Warzel, writing for The Atlantic:</p>\n\n<blockquote>\n  <p>Twitter has so fully assumed the role of a far-right platform that\nit might be killing its competitors. When Parler shut down in\nApril, its parent company noted <a href="https://variety.com/2023/digital/news/parler-shut-down-new-owner-starboard-twitter-clone-conservatives-1235583709/">that</a> “no reasonable person\nbelieves that a Twitter clone just for conservatives is a viable\nbusiness any more.” Left unspoken is the reason: Twitter has\nbecome a right-wing echo chamber.</p>\n\n<p>If Musk weren’t too preoccupied lapping up approval from trolls,\nreactionaries, and Dogecoin enthusiasts — a few of the\nconstituencies left on his site that still seem to adore him — the Parler statement should worry him. Right-wing alt-tech\nplatforms may attract investors and a flood of indignant new users\nwith persecution complexes, but they are, ultimately, bad\nbusinesses.</p>\n</blockquote>\n\n<p>A fairer headline would be “Twitter Is a Far-Right-Friendly Social Network”, but that’s enough to be a problem.</p>\n\n<p>I still check in on Twitter, but with each passing week, less and less. It’s not fun, it’s hard to use without Tweetbot, and the new algorithm that puts paying Twitter Blue users’ replies at the top of every thread has <a href="https://twitter.com/mattyglesias/status/1660692106782883841">ruined</a> political Twitter. It’s like letting people suffering from incontinence try on all the pants in a store before anyone else.</p>\n\n<p>And the right-wing veer is most obvious in the ads that I see. (And I now see a lot of them — one every 3–4 posts.) Almost <em>all</em> of them are for no-name gimmicks and gadgets, the sort of crap that used to be sold at the mall <a href="https://www.mentalfloss.com/article/504249/history-spencer-gifts">at Spencer Gifts</a> or in the middle of the night on cable TV commercials.</p>\n\n<p>One of the few exceptions I see is Apple, which continues to place ads on Twitter.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/warzel-twitter-rightwing" title="Permanent link to ‘Charlie Warzel: ‘Twitter Is a Far-Right Social Network’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:23:07','John Gruber','https://www.theatlantic.com/technology/archive/2023/05/elon-musk-ron-desantis-2024-twitter/674149/');
-INSERT INTO entries VALUES(56,'tag:daringfireball.net,2023:/linked//6.39947',5,'The Talk Show: ‘No False Humidity’','text/html',replace('<p>Special guest: Jason Snell. Topics: Headset, headseat, headset. And no baseball talk other than how games might look in VR. Also: Final Cut Pro and Logic Pro for iPad, and GM’s dumb decision to drop CarPlay.</p>\n\n<p>Sponsored by:</p>\n\n<ul>\n<li><a href="https://squarespace.com/talkshow">Squarespace</a>: Make your next move. Use code <strong>talkshow</strong> for 10% off your first order.</li>\n<li><a href="https://kolide.com/thetalkshow">Kolide</a>: Cross-platform endpoint security solution for teams that value privacy and transparency.</li>\n<li><a href="https://backblaze.com/thetalkshow">Backblaze</a>: Makes backing up and accessing your data astonishingly easy.</li>\n</ul>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/the-talk-show-375" title="Permanent link to ‘The Talk Show: ‘No False Humidity’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 21:32:40','John Gruber','https://daringfireball.net/thetalkshow/2023/05/23/ep-375');
-INSERT INTO entries VALUES(57,'tag:daringfireball.net,2023:/linked//6.39946',5,'Today Is the Launch of Max, and It Sucks Even More Than I Thought It Would','text/html',replace('<p>Sigmund Judge, on Twitter:</p>\n\n<blockquote>\n  <p>Max launches today, and with it brings yet another chapter in the\nbattle between Warner/Discovery executives and Apple TV customers.</p>\n\n<p><a href="https://twitter.com/StreamOnMax">@StreamOnMax</a> switches away from Apple’s native video player in\nthe continued pursuit of creating an inferior product...</p>\n</blockquote>\n\n<p><a href="https://daringfireball.net/2023/04/warner_max">I told you</a> these Warner “Bros” Discovery executives are morons. On all the good platforms, you have to install an altogether new app. Why not just update the existing HBO Max app with (<a href="https://twitter.com/gilbert/status/1660878157162090496">yet another</a>) a new name and icon? Because they’re morons. (Even better: when I launch the old HBO Max app on my Apple TV, it doesn’t tell me anything about the new app — it just shows an error screen saying “Something went wrong.”)</p>\n\n<p>This much moronity I expected. But it gets worse. As Judge documents, with the new app they’ve <a href="https://9to5mac.com/2023/05/23/hbo-max-app-tvos-apple-tv/">once again</a> dropped tvOS’s excellent native video player for a custom video player that utterly sucks: “up next” support in the TV app is now broken or missing, HDR and frame-rate match are gone, the new video player doesn’t support the Siri remote’s jog support, no picture-in-picture, and no support for the wonderful “What did they just say?” feature (speak that to your Siri remote and the video jumps back 10 seconds or so and temporarily enables subtitles).</p>\n\n<p>HBO Max was a really good tvOS app. Max is a poor one.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/max-tvos" title="Permanent link to ‘Today Is the Launch of Max, and It Sucks Even More Than I Thought It Would’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 20:45:41','John Gruber','https://twitter.com/sigjudge/status/1660991982095745024?s=61&t=IO0gpJ6MMbM8xFDvXZt-Nw');
-INSERT INTO entries VALUES(58,'tag:daringfireball.net,2023:/linked//6.39945',5,'YouTube Pitching Advertisers on Unskippable 30-Second Ads for TV Content','text/html',replace('<p>Todd Spangler, reporting for Variety:</p>\n\n<blockquote>\n  <p>YouTube’s biggest ad innovation for 2023? It might be borrowing a\nwell-worn page from old-fashioned linear TV.</p>\n\n<p>At the YouTube Brandcast upfront event Wednesday in New York,\nexecs announced the introduction of 30-second unskippable ads in\ntop-performing YouTube content on TVs — you know, just like the\ncommercials that have run on broadcast and cable networks for\ndecades. YouTube also will start testing new “Pause Experiences”\nfor YouTube on TV screens, showing an ad when viewers pause a\nvideo akin to the pause ads Hulu first bowed four years ago.</p>\n</blockquote>\n\n<p>I bring this up on my podcast often, but it never ceases to depress me that 20 years ago, when TV-watching first became computerized through DVRs like TiVo and ReplayTV, one of the <em>primary</em> selling points was the ability to fast-forward through commercials. Computers made watching TV not just a little better, but a lot better. That’s what computers can do. That’s why we love them.</p>\n\n<p>Now though, in the streaming era, more and more we’re seeing streaming apps making commercials unskippable. They’re making TV watching not just worse but a lot worse. That’s also what computers can do. That’s why we hate them.</p>\n\n<p>No surprise which side of this Google is on.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/youtube-unskippable-ads" title="Permanent link to ‘YouTube Pitching Advertisers on Unskippable 30-Second Ads for TV Content’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 18:46:45','John Gruber','https://variety.com/2023/digital/news/youtube-upfront-2023-unskippable-30-second-ads-tvs-sunday-ticket-1235616175/');
-INSERT INTO entries VALUES(59,'tag:daringfireball.net,2023:/feeds/sponsors//11.39944',5,'[Sponsor] Kolide — Zero Trust for Okta','text/html',replace('<p>Here’s an uncomfortable fact: at most companies, employees can download sensitive company data onto any device, keep it there forever, and never even know that they’re doing something wrong.</p>\n\n<p>Kolide’s new report, <a href="https://l.kolide.co/3I7025A">The State of Sensitive Data</a>, shines a light on an area of security that is often ignored, but is nevertheless a massive hole in many companies’ Zero Trust fortress.</p>\n\n<p><img alt="Study results showing that companies have poor policies for requiring user authentication to access sensitive data (65%); prohibiting downloading sensitive data onto personal devices (46%); ensuring plain-text access credentions are not stored on employee devices (38%); setting a specified time period sensitive data can reside on an employee device (16%)." src="https://daringfireball.net/martini/images/kolide-survey-results.png" width="600" /></p>\n\n<p>These findings are particularly alarming given the overall state of device security. IT teams routinely struggle to enforce timely OS updates and patch management, meaning that end users are storing your most sensitive data–things like customer records, confidential IP, and plain-text access credentials–on devices that are vulnerable to attack.</p>\n\n<p>This problem has gone unaddressed because until now there hasn’t been a good solution for it. <a href="https://l.kolide.co/3lch4WK">MDM solutions are too blunt an instrument</a> for dealing with sensitive data, and <a href="https://l.kolide.co/3DTTpRA">DLP tools are too extreme and invasive</a> for most companies. After all, you’re not trying to ban downloads together, nor regard every download as suspicious. You’re just trying to make sure employees aren’t keeping data for longer than they need or keeping it on an unmanaged or un-secure device.</p>\n\n<p>Kolide offers a more nuanced approach to setting and enforcing sensitive data policies. </p>\n\n<p><em>Our premise is simple: if an employee’s device is out of compliance, it can’t access your apps.</em></p>\n\n<p>Kolide lets admins run queries to detect sensitive data, flag devices that have violated policies, and enforce OS and browser updates so vulnerable devices aren’t accessing data.</p>\n\n<p>Our unique approach makes device compliance part of the authentication process. If a device isn’t compliant, users can’t log in to their cloud apps until they’ve fixed the problem. But instead of creating more work for IT, Kolide provides instructions so users can get unblocked on their own.</p>\n\n<p>To learn more and see our product in action, <a href="https://l.kolide.co/3XlSqAq">visit kolide.com</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/feeds/sponsors/2023/05/kolide_zero_trust_for_okta" title="Permanent link to ‘Kolide — Zero Trust for Okta’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 18:15:42','Daring Fireball Department of Commerce','https://l.kolide.co/3JWbXEv');
-INSERT INTO entries VALUES(60,'tag:daringfireball.net,2023:/linked//6.39943',5,'Save the Date: The Talk Show Live From WWDC 2023','text/html',replace('<p><strong>Location:</strong> The California Theatre, San Jose <br />\n<strong>Showtime:</strong> Wednesday, 7 June 2023, 5:00 pm PT <br />\n<strong>Tickets:</strong> First batch goes on sale Tuesday 23 May <br />\n<strong>Special Guest(s):</strong> <em>For me to know and you to find out</em> <br />\n<strong>Previous Shows:</strong> <a href="https://www.youtube.com/daringfireball">On YouTube</a></p>\n\n<p>(Next batch will go on sale later in the week.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/the-talk-show-wwdc-2023-save-the-date" title="Permanent link to ‘Save the Date: The Talk Show Live From WWDC 2023’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 03:50:47','John Gruber','https://daringfireball.net/thetalkshow/');
-INSERT INTO entries VALUES(61,'tag:daringfireball.net,2023:/linked//6.39942',5,'Leaked EU Document Shows Spain Wants to Ban End-to-End Encryption; Other EU Countries Hanging Their Hopes on Impossible Solutions','text/html',replace('<p>Wired:</p>\n\n<blockquote>\n  <p>Spain has advocated banning encryption for hundreds of millions of\npeople within the European Union, according to a leaked document\nobtained by Wired that reveals strong support among EU member\nstates for proposals to scan private messages for illegal content.</p>\n\n<p>The document, a European Council survey of member countries’ views\non encryption regulation, offered officials’ behind-the-scenes\nopinions on how to craft a highly controversial law to stop the\nspread of child sexual abuse material (CSAM) in Europe. The\nproposed law would require tech companies to scan their platforms,\nincluding users’ private messages, to find illegal material.\nHowever, the proposal from Ylva Johansson, the EU commissioner in\ncharge of home affairs, has drawn ire from cryptographers,\ntechnologists, and privacy advocates for its potential impact on\nend-to-end encryption. [...]</p>\n\n<p>Of the 20 EU countries represented in the document leaked to\nWIRED, the majority said they are in favor of some form of\nscanning of encrypted messages, with Spain’s position emerging as\nthe most extreme. “Ideally, in our view, it would be desirable to\nlegislatively prevent EU-based service providers from implementing\nend-to-end encryption,” Spanish representatives said in the\ndocument.</p>\n</blockquote>\n\n<p>If the EU goes ahead with this, I think it means the end of services like WhatsApp, Signal, and iMessage in the EU. There’s no way to architect a messaging system that uses E2EE in some regions and doesn’t in others. The only way to comply would be to rearchitect these systems to not use E2EE anywhere. Signal certainly wouldn’t do that. Apple wouldn’t either.</p>\n\n<blockquote>\n  <p>Denmark and Ireland expressed support for scanning encrypted\nmessengers for child sexual abuse material while also endorsing\nthe inclusion of wording in the law that protects end-to-end\nencryption from being weakened. The ability to do this would rely\non the invention of technology that can scan encrypted messages\nfor illegal content without altering or breaking the security\nfeatures offered by encryption — a feat cryptographers and\ncybersecurity experts have said is technically impossible.</p>\n</blockquote>\n\n<p>It <em>is</em> technically impossible. There is no he-said/she-said debate here. The cryptographers are correct and the lawmakers are so ignorant that they’re proposing a fantasy. It’s a downwind effect of Arthur C. Clarke’s famous maxim that sufficiently advanced technology is indistinguishable from magic: the technology of E2EE is so far above the heads of lawmakers and law enforcement officials that they feel free to demand magic solutions. “<em>Just <a href="https://boingboing.net/2018/01/12/imaginary-numbers.html">nerd harder</a></em>.”</p>\n\n<blockquote>\n  <p>The Netherlands, however, stated that this would be possible\nthrough “on-device” scanning before the illegal material is\nencrypted and sent to its recipient. “There are … technologies\nwhich may allow for automatic detection of CSAM while at the same\ntime leaving end-to-end encryption intact,” the country’s\nrepresentatives stated in the document.</p>\n</blockquote>\n\n<p>Somewhere in Cupertino, <a href="https://daringfireball.net/2021/08/apple_child_safety_initiatives_slippery_slope">a head bangs against a desk</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/wired-spain-e2ee" title="Permanent link to ‘Leaked EU Document Shows Spain Wants to Ban End-to-End Encryption; Other EU Countries Hanging Their Hopes on Impossible Solutions’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 00:55:01','John Gruber','https://www.wired.com/story/europe-break-encryption-leaked-document-csa-law/');
-INSERT INTO entries VALUES(62,'tag:daringfireball.net,2023:/linked//6.39941',5,'Facebook Fined $1.3 Billion for Violating EU Data Privacy Rules','text/html',replace('<p>Adam Satariano, reporting for The New York Times:</p>\n\n<blockquote>\n  <p>Meta on Monday was fined a record 1.2 billion euros ($1.3 billion)\nand ordered to stop transferring data collected from Facebook\nusers in Europe to the United States, in a major ruling against\nthe social media company for violating European Union data\nprotection rules.</p>\n\n<p>The penalty, announced by Ireland’s Data Protection Commission, is\npotentially one of the most consequential in the five years since\nthe European Union enacted the landmark data privacy law known as\nthe General Data Protection Regulation. Regulators said the\ncompany failed to comply with a 2020 decision by the European\nUnion’s highest court that Facebook data shipped across the\nAtlantic was not sufficiently protected from American spy\nagencies.</p>\n\n<p>But it remains unclear if or when Meta will ever need to cordon\noff the data of Facebook users in Europe. Meta said it would\nappeal the decision, setting up a potentially lengthy legal\nprocess.</p>\n</blockquote>\n\n<p>A billion here, a billion there, and soon enough you’re talking about real money.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/facebook-eu-fine" title="Permanent link to ‘Facebook Fined $1.3 Billion for Violating EU Data Privacy Rules’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 23:11:42','John Gruber','https://www.nytimes.com/2023/05/22/business/meta-facebook-eu-privacy-fine.html');
-INSERT INTO entries VALUES(63,'tag:daringfireball.net,2023:/linked//6.39940',5,'Neeva, Upstart Search Engine, Shuts Down','text/html',replace('<p>Sridhar Ramaswamy and Vivek Raghunathan, writing on the Neeva blog:</p>\n\n<blockquote>\n  <p>In early 2022, the upcoming impact of generative AI and LLMs\nbecame clear to us. We embarked on an ambitious effort to\nseamlessly blend LLMs into our search stack. We rallied the Neeva\nteam around the vision to create an answer engine. We are proud of\nbeing the first search engine to provide cited, real-time AI\nanswers to a majority of queries early this year.</p>\n\n<p>But throughout this journey, we’ve discovered that it is one thing\nto build a search engine, and an entirely different thing to\nconvince regular users of the need to switch to a better choice.\nFrom the unnecessary friction required to change default search\nsettings, to the challenges in helping people understand the\ndifference between a search engine and a browser, acquiring users\nhas been really hard. Contrary to popular belief, convincing users\nto pay for a better experience was actually a less difficult\nproblem compared to getting them to try a new search engine in the\nfirst place.</p>\n</blockquote>\n\n<p>I tried Neeva, briefly, but it never stuck for me. Part of the problem, even if you’re open to trying new search engines — clearly a big <em>if</em> — is that there’s a bit of a renaissance at the moment in new search engines. I’d been using <a href="https://duckduckgo.com/">DuckDuckGo</a> as my default for years, but about six months ago I switched to <a href="https://kagi.com/">Kagi</a>, and so far I haven’t looked back. I pay $10/month for Kagi. A paid search engine! Good search results and absolutely zero clutter from ads or paid placement. They’ve also got a <a href="https://labs.kagi.com/fastgpt">GPT-backed search</a> that includes up-to-date results and works very fast.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/neeva-shuts-down" title="Permanent link to ‘Neeva, Upstart Search Engine, Shuts Down’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 23:08:00','John Gruber','https://neeva.com/blog/may-announcement');
-INSERT INTO entries VALUES(64,'tag:daringfireball.net,2023:/linked//6.39939',5,'A Twitter Bug Is Restoring ‘Deleted’ Tweets and Retweets','text/html',replace('<p>James Vincent, writing at The Verge:</p>\n\n<blockquote>\n  <p>Earlier this year on the 8th of May I deleted all my tweets, just\nunder 5,000 of them. I know the exact day because I <a href="https://twitter.com/jjvincent/status/1655572613157068809">tweeted about\nit</a>.</p>\n\n<p>This morning, though, I discovered that Twitter has restored a\nhandful of my old re-tweets; interactions I <em>know</em> I scrubbed from\nmy profile. Those re-tweets were gone. I remember surveying my\nbare timeline with satisfaction before thinking, “great, time to\ndraw attention to myself.” But now they’re back. You can see them\nby scrolling down my timeline past May 8th, with even more\nappearing if you select “<a href="https://twitter.com/jjvincent/with_replies">tweets with replies</a>.”</p>\n</blockquote>\n\n<p>Twitter is far from alone being a service where “deletion” needs dick quotes around it. This bug is bad and likely will soon be fixed, but the persistence of ostensibly deleted tweets is a profound design flaw.</p>\n\n<p>(The nightmare scenario: a bug that exposes DMs — which infamously are not encrypted — publicly.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/twitter-bug-deleted-tweets" title="Permanent link to ‘A Twitter Bug Is Restoring ‘Deleted’ Tweets and Retweets’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 22:26:19','John Gruber','https://www.theverge.com/2023/5/22/23732497/twitter-bug-restoring-deleted-tweets-retweets');
-INSERT INTO entries VALUES(65,'tag:daringfireball.net,2023:/linked//6.39938',5,'Leaks Regarding Instagram’s Purportedly Imminent Twitter-Like App','text/html',replace('<p>Lia Haberman, writing at ICYMI:</p>\n\n<blockquote>\n  <p>Codename: P92, Project 92 or Barcelona, as it’s been\nalternately called.</p>\n\n<p>Tagline: “Instagram for your thoughts.”</p>\n\n<p>All new details have surfaced based on secret calls Meta has\nbeen having with select creators, hinting at a potential release\nin late June. Here’s what I’ve been told by a creator who met\nwith Meta.</p>\n\n<p>The decentralized app is built on the back of Instagram but will\nbe compatible with some other apps like Mastodon:</p>\n\n<ul>\n<li>There’s a single sign-on with your IG username and password</li>\n<li>You can sync up with your existing followers</li>\n<li>Your handle, bio and even verification will carry over from IG</li>\n<li>Users on other apps will be able search for, follow and interact\nwith your profile and content</li>\n</ul>\n</blockquote>\n\n<p>Sounds like it’s ActivityPub-compatible, which is how it will be possible to federate with Mastodon instances.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/haberman-instagram-barcelona" title="Permanent link to ‘Leaks Regarding Instagram’s Purportedly Imminent Twitter-Like App’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 20:59:04','John Gruber','https://liahaberman.substack.com/p/icymi-instagrams-new-app-could-be');
-INSERT INTO entries VALUES(66,'tag:daringfireball.net,2023:/linked//6.39936',5,'Recommended: ‘Chimp Empire’','text/html',replace('<p><em>Chimp Empire</em> is a four-part (an hour-ish each) documentary about two rival chimpanzee groups in Uganda. It’s one of the best, most enjoyable, most engaging, and most informative cinematic experiences I’ve ever had. My wife and I devoured it. It’s extraordinarily beautiful and compelling. It’s a story about two warring groups, replete with interesting characters and compelling drama. Scheming, backstabbing, loyalty, social climbing, bravery, cowardice. It’s all there.</p>\n\n<p>The question my wife and I kept asking ourselves was, <em>How the hell did they capture this remarkable footage?</em> It couldn’t be fake, but it seemed utterly impossible how <em>close</em> the camera crews got to the chimps — including while the two tribes fight. <a href="https://www.netflix.com/tudum/articles/how-chimp-empire-was-made">Netflix has a behind-the-scenes video and story</a> that explains how this was even possible:</p>\n\n<blockquote>\n  <p>While it would normally be impossible to capture the intimacy of\nwarring chimps in the wild, the filmmakers benefited from an\nenvironment long marked by human activity — thanks to a constant\nswarm of researchers. “It took 25 years to reach the point where\nwe can walk out and be near the chimps. We’re humans, so the\nchimps just see us as an extension of the presence that’s been in\nthe forest for years,” Reed told Netflix.</p>\n\n<p>This familiarity allowed the camera crew to capture <em>Chimp Empire</em>’s\nmost stunning scenes. But up-close encounters were still just\nas bizarre as you might expect.</p>\n\n<p>“I remember suddenly being aware that the Ngogo chimps were all\naround. It’s like being on <em>The Truman Show</em> or something — you\nfeel like you’re on a set, because you can’t quite believe they’re\nreal,” Reed said. “They’re so human, you know that they’re\nassessing you in the same way that you’re assessing them. You\ncan’t quite believe that they accept you into their world. You go\nwhere they go, but they make all the decisions. The only thing you\ncan control is where you turn your cameras, or whether you keep up\nwith the action. It’s quite humbling, and I quite like it. The\nonly thing you can do is put yourself in the best position\npossible to record what they’re doing.”</p>\n</blockquote>\n\n<p>If you’ve got Netflix, start watching <em>Chimp Empire</em> tonight. If you don’t have Netflix, sign up for a month just to get <em>Chimp Empire</em>. Just watch it first, then read the behind-the-scenes stuff.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/chimp-empire" title="Permanent link to ‘Recommended: ‘Chimp Empire’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 20:30:00','John Gruber','https://www.netflix.com/title/81311783');
-INSERT INTO entries VALUES(67,'tag:daringfireball.net,2023:/linked//6.39937',5,'In Transition to Micro-LED, Apple Is Attempting to Reduce Its Reliance on Samsung for Displays','text/html',replace('<p>Lauly Li, reporting for Nikkei Asia:</p>\n\n<blockquote>\n  <p>Apple is getting involved in the mass production of\nnext-generation displays to lessen its reliance on rival Samsung\nand increase its own control over the supply of a key component,\nNikkei Asia has learned. Taking a hands-on approach to production\nis a stark contrast to the iPhone maker’s usual approach of\nproviding display makers with screen specifications and leaving\nthe actual production to them. [...]</p>\n\n<p>Displays are one of the most expensive components in all of\nApple’s devices. Since the American company first introduced OLED\ndisplays on its iPhone in 2017, its reliance on Samsung Display\nfor the screens has only grown. To reduce that dependence and gain\nprice-bargaining power, Apple tried to bring in other suppliers,\nnamely LG Display and China’s display champion BOE Technology, but\nthey lag the South Korean leader in terms of technology and\nquality stability, according to multiple sources familiar with the\nsituation.</p>\n\n<p>“Apple has spent at least $1 billion on the R&amp;D and samples for\nmicro-LED technologies in the past nearly 10 years,” said one of\nthe people who has been directly involved in the project for\nyears. “It wants to secure more control over the next-gen display\ntechnologies for its future products.”</p>\n</blockquote>\n\n<p>Apple’s relationship with Samsung is one of the most interesting in all of tech. On the consumer side, Samsung has been Apple’s only serious rival for high-end phones for almost the entirety of the smartphone era. But for certain chips and especially displays, Samsung has been one of Apple’s most essential suppliers. So I think it’s quite obvious why Apple would try to take display development into its own hands. Imagine if Apple had a display technology lead analogous to its performance-per-watt chip technology lead.</p>\n\n<p>From the <a href="http://www.asymco.com/2011/01/17/the-cook-doctrine/">Cook Doctrine</a>: “We believe that we need to own and control the primary technologies behind the products we make, and participate only in markets where we can make a significant contribution.”</p>\n\n<p>(I’ve also long wondered how much effort Apple is putting into developing its own camera sensors.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/apple-micro-led-cook-doctrine" title="Permanent link to ‘In Transition to Micro-LED, Apple Is Attempting to Reduce Its Reliance on Samsung for Displays’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 20:25:07','John Gruber','https://asia.nikkei.com/Spotlight/Supply-Chain/Apple-dives-into-display-making-to-cut-reliance-on-Samsung');
-INSERT INTO entries VALUES(68,'tag:daringfireball.net,2023:/linked//6.39935',5,'Onin','text/html',replace('<p>My thanks to Onin for sponsoring last week at DF. Onin is a free iPhone keyboard app that puts your calendar right in your keyboard. Or is it a calendar app that adds a keyboard? Whichever way you want to look at it, it’s a very clever idea. Most people only add a fraction of their events they work out in a messaging app in their calendar. With Onin, you can check your availability, add new events, and even share invites — right inside <em>any</em> app where you use the keyboard. It works with all your existing calendars (after granting it access), in all your apps, and is end-to-end encrypted.</p>\n\n<p>It’s free and fun — I say check it out.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/21/onin" title="Permanent link to ‘Onin’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-21 22:06:25','John Gruber','https://apps.apple.com/gb/app/onin-keyboard-calendar/id6448070850');
-INSERT INTO entries VALUES(69,'tag:daringfireball.net,2023://1.39934',5,'★ On Apple Fitting a Headset Announcement Into the Always-Packed WWDC Keynote','text/html',replace('<p><a href="https://twitter.com/benbajarin/status/1659593595643662336-vhv6gL8w">Ben Bajarin on Twitter</a>:</p>\n\n<blockquote>\n  <p>If Apple is releasing a VR/AR headset this year, it makes more\nsense for a dedicated event or bundle it with a Mac event in\nthe fall.</p>\n\n<p>There is too much ground to cover at WWDC, and 30 min is not\nenough to tell the full product story.</p>\n</blockquote>\n\n<p>I’ve been thinking about this too. The WWDC keynote is <em>always</em> packed. And in recent years, Federighi has gotten Apple’s software factory into such disciplined shape that there are always major updates to every single platform. There are going to be major new features to announce and demo for iOS/iPadOS 17, MacOS 14, and WatchOS 10. I suspect we’re going to see new Mac hardware announced. If it’s just the 15-inch MacBook Air, that’s an easy announcement: it’s a MacBook Air with a bigger display. But if it’s the M-series Mac Pro (finally), <em>that’s</em> going to demand some presentation time. <a href="https://podcasts.apple.com/us/podcast/apple-events-video/id275834665?i=1000565413850">Last year’s keynote</a> ran 1h:48m; <a href="https://www.theverge.com/2022/6/6/23141939/apple-wwdc-2022-biggest-announcements-ios-16-macbook-air-macos-watchos">here’s a rundown from The Verge</a> of the major announcements.</p>\n\n<p>But I do think the headset is going to be announced at WWDC. There’s just too much smoke for there not to be a fire. And, seemingly, Apple isn’t quietly trying to dampen expectations for the headset behind the scenes. The same thing happened with the iPhone before Macworld Expo 2007 — there were rampant rumors that the Apple phone was finally coming, and no one hearing from sources that it wouldn’t. They might have ideally wanted to announce it <em>before</em> this year’s WWDC at a special event, but if they want developers to start creating software for the platform, this is the time. (And why wouldn’t they want developers to start working on ideas?)</p>\n\n<p>Apple does not like for keynotes to run longer than two hours. The glaring exception that springs to mind was the WWDC 2015 keynote, which ran a grueling 2h:25m. That was the one with a long section on Apple Music with Jimmy Iovine on stage. Probably the worst WWDC keynote ever, and the only one that ever felt under-rehearsed.</p>\n\n<p>Here’s the thing though: post-COVID keynotes aren’t just pre-recorded, they’re very tightly edited. I suspect we’ll get a keynote that still comes in under 2 hours even with an entire 40-minute-ish segment announcing both the headset and xrOS. It’ll just go fast. Fitting the headset and xrOS developer frameworks into the old-style on-stage WWDC keynote would have posed a problem. I don’t think it’s a problem with the new “keynote movie” format.<sup id="fnr1-2023-05-19"><a href="https://daringfireball.net/#fn1-2023-05-19">1</a></sup> We won’t come out of the keynote thinking it was too long; we’ll come out of it with our heads spinning because it’s going to cover so much, so fast.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n<li id="fn1-2023-05-19">\n<p>And if I’m right, I bet this is one of those years where after the keynote is over, and people start poring over everything Apple puts on the web, we discover a surprising number of very cool iOS and MacOS features that didn’t make it into the keynote. Anything and everything from the OSes might get cut to make time for the headset, xrOS, and Mac hardware announcements. There’s a whole second State of the Union technical keynote in the afternoon where features cut from the main morning keynote can go.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-19" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n</ol>\n</div>','\n',char(10)),'','2023-05-19 19:00:37','John Gruber','https://daringfireball.net/2023/05/bajarin_wwdc_headset');
-INSERT INTO entries VALUES(70,'tag:daringfireball.net,2023:/linked//6.39932',5,'‘Die of Boils, Mr. Sparky Car’','text/html',replace('<p>Back in November, David Simon left Twitter and signed off with this exquisite essay:</p>\n\n<blockquote>\n  <p>I know there are many who found neither decorum nor dignity in the\nblunt ugliness of what for me was very much a bit of decade-long\nperformance art. There I was in the gutter, trading spit and\nflinging sewage. Well, yes, but it was fun. And if you came\ncorrect, we could argue, perhaps even laugh, as many new friends\ncame to understand. But if you came to play, we played. I’m from\nBaltimore, where The Dozens are an American cultural artform like\nany other.</p>\n\n<p>An aggrieved bystander once called the act graceless. I\nreadily agreed:</p>\n\n<p>“This is Twitter. There is no grace. None. Here in an orgy of\norganized disinformation and trollery, our republic has come to\ndie. There is no teaching the fuckmooks and deplorati. Go down\nswinging. Use every cruel word. Invoke their mothers. Lather them\nwith contempt. Enjoy.”</p>\n</blockquote>\n\n<p>In need of an outlet while the WGA strike continues, <a href="https://twitter.com/aodespair">he’s back</a>. (And hell yeah I just invoked “<a href="https://mastodon.social/@gruber/110313691364236126">Learn Spelling</a>” on <em>trollery</em>, <em>deplorati</em>, and especially <em>fuckmooks</em>.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/simon-twitter" title="Permanent link to ‘‘Die of Boils, Mr. Sparky Car’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-19 03:59:00','John Gruber','https://davidsimon.com/die-of-boils-mr-sparky-car/');
-INSERT INTO entries VALUES(71,'tag:daringfireball.net,2023:/linked//6.39933',5,'Mark Gurman Recaps His Reporting on Apple’s Upcoming XR Headset and He’s Sticking With the Front-Facing Display for Googly Eyes','text/html',replace('<p>Mark Gurman, reporting for Bloomberg:<sup>*</sup></p>\n\n<blockquote>\n  <p>Other key figures in Apple’s top ranks, such as Craig Federighi,\nsenior vice president for software engineering, have also kept\ntheir distance and seemed wary of the headset, according to people\nfamiliar with the project. Johny Srouji, Apple’s senior vice\npresident for hardware technologies, has privately been a skeptic,\nlikening it to a science project. Internally he’s warned that\nbuilding the high-performing chips needed for the device could\ndistract from new iPhone chips, which would probably drive more\nrevenue.</p>\n</blockquote>\n\n<p>That’s some legitimately juicy gossip. But I’m not sure how Federighi, the head of all software at Apple, could keep any distance at all from Apple’s first major new software platform since the iPhone.</p>\n\n<blockquote>\n  <p>Srouji’s group did end up developing some of Apple’s most advanced\nchips to date for the headset, while <a href="https://www.bloomberg.com/news/newsletters/2022-07-03/apple-aapl-iphone-apple-watch-take-a-back-seat-to-the-mac-in-chip-upgrades-l55d87p9">iPhone speed gains have\nindeed slowed</a> in recent years.</p>\n</blockquote>\n\n<p>Well of course Srouji’s group developed advanced chips for the headset. Where else would the chips come from? “<em>Well Tim, Johny is skeptical about this project, so I guess we’ll commission all the custom silicon designs from Qualcomm.</em>”</p>\n\n<p>And comparing benchmark results for <a href="https://browser.geekbench.com/ios-benchmarks/">iPhones</a> vs. <a href="https://browser.geekbench.com/android-benchmarks/">Android phones</a>, I’d love to know what speed gains have slowed. It seems like nonsense to me. If anything, Apple’s A-series chips are further ahead of the competition than ever in both raw performance and performance-per-watt.</p>\n\n<blockquote>\n  <p>In an attempt to keep headset wearers engaged with the real\nworld, the device will have an outward-facing display showing\ntheir eye movements and facial expressions. Apple regards this\nfeature as a key differentiator from enclosed VR headsets. One\nperson familiar with the device says the exterior screens allow\npeople to interact with a headset wearer without feeling as if\nthey’re talking to a robot.</p>\n</blockquote>\n\n<p>I’ll buy this front-facing display rumor <a href="https://daringfireball.net/misc/2023/05/cylon.gif">if there’s a Cylon mode</a>.</p>\n\n<p>Otherwise I’ll stick with <a href="https://daringfireball.net/2023/01/if_a_tree_that_was_never_announced_falls_in_a_forest_does_it_make_a_sound">my previous understanding</a> that this is an internal joke that has been taken as real; that it would look <a href="https://www.pinterest.com/pin/299770918930142474/">goofy</a>, not humane; and that even if it didn’t look goofy, <a href="https://daringfireball.net/linked/2023/02/03/report-it-all">it would make no sense</a> to add the financial cost of an outward-facing display to an already-expensive device, and even less sense to incur the battery-life drain of powering that external display on an already-battery-life-constrained device.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/gurman-headset-recap" title="Permanent link to ‘Mark Gurman Recaps His Reporting on Apple’s Upcoming XR Headset and He’s Sticking With the Front-Facing Display for Googly Eyes’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-19 03:52:10','John Gruber','https://www.bloomberg.com/news/features/2023-05-18/apple-s-mixed-reality-headset-may-define-tim-cook-s-legacy');
-INSERT INTO entries VALUES(72,'tag:daringfireball.net,2023:/linked//6.39931',5,'OpenAI Releases ChatGPT App for iOS','text/html',replace('<p>OpenAI, in a postscript to their iOS app announcement:</p>\n\n<blockquote>\n  <p>P.S. Android users, you’re next! ChatGPT will be coming to your devices soon.</p>\n</blockquote>\n\n<p>Are Android users <em>next</em>, or are they <em>last</em>? Is there anyone else in line?</p>\n\n<p>Anyway, I guess <a href="https://daringfireball.net/linked/2011/04/03/android-first">Fred Wilson isn’t an advisor to OpenAI</a>?</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/chatgpt-ios-app" title="Permanent link to ‘OpenAI Releases ChatGPT App for iOS’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-19 02:43:14','John Gruber','https://openai.com/blog/introducing-the-chatgpt-app-for-ios');
-INSERT INTO entries VALUES(73,'tag:daringfireball.net,2023://1.39930',5,'★ Do Wall Street Journal Reporters Read The Wall Street Journal?','text/html',replace('<p>Aaron Tilley and Yang Jie, reporting last week for The Wall Street Journal, “<a href="https://www.wsj.com/articles/apple-is-breaking-its-own-rules-with-a-new-headset-80c9b36c">Apple Is Breaking Its Own Rules With a New Headset</a>” (<a href="https://apple.news/AdSGSL1h8RBa5WioRJe_T9g">News+ link</a>):</p>\n\n<blockquote>\n  <p>Apple’s launch plans break many of its traditions and rules about\nnew products that have become the industry gold standard. Unlike\nother Apple products, the device is debuting in a\nstill-experimental mode. Apple predicts slower adoption for the\nheadset compared with the Apple Watch or the iPhone, both of which\nquickly became consumer must-haves. Taking seven years in\ndevelopment before hitting the market, it will be one of the most\ncomplex consumer products any company has ever sold.</p>\n</blockquote>\n\n<p>That’s a lot to unpack in one paragraph. Here goes:</p>\n\n<p>I’d argue Apple has never introduced two new products the same way. Every new product introduction has been different. I honestly don’t know any more about the headset than the rumor mill consensus but I guarantee it isn’t in an “experimental mode”. Neither Apple Watch nor iPhone “quickly became consumer must-haves”. <a href="https://www.wsj.com/articles/apple-watch-with-sizable-sales-cant-shake-its-critics-1461524901">Here’s a report from Daisuke Wakabayashi</a> in ... <em>checks notes</em> ... The Wall Street Fucking Journal itself in April 2016, a year after Apple Watch shipped, that says, in the opening paragraph, “Yet the smartwatch is dogged by a perception that seems premature given the history of Apple’s most popular devices: disappointment.” (The next paragraph claimed that “sales of iPhones are slowing”.)<sup id="fnr1-2023-05-18"><a href="https://daringfireball.net/#fn1-2023-05-18">1</a></sup></p>\n\n<p>The pattern for Apple’s entries into new product categories generally goes like this:</p>\n\n<ul>\n<li>Apple releases the first version. It’s expensive. It’s missing a few obvious features. It has a few obvious limitations. But it’s a breakthrough.</li>\n<li>Early adopters wait in line outside Apple Stores overnight to buy it. Online sales are backordered by weeks or even months soon after they launch.</li>\n<li>That early fervor aside, it’s an early adopter product, and sales are less than those of Apple’s established products.</li>\n<li>After a few months or maybe a year, the immediate-gratification-obsessed business press runs <a href="https://www.wsj.com/articles/apple-watch-with-sizable-sales-cant-shake-its-critics-1461524901">articles</a> declaring the product a dud.</li>\n<li>Apple releases a second-gen version that’s better. Sales go up. Word continues to spread.</li>\n<li><a href="https://daringfireball.net/2010/05/this_is_how_apple_rolls">With each successive year</a>, Apple releases improved models. Those obvious missing features are added. The obvious limitations are removed. Older models stay on sale at lower price points. It becomes a hit product.</li>\n<li>Years later, when Apple is poised to release another altogether new product, the last one — the one written off as a dud after its first year — is held up as a product that was universally hailed as a sensation and smash hit from day one.</li>\n</ul>\n\n<p>A few paragraphs later in Aaron Tilley and Yang Jie’s report:</p>\n\n<blockquote>\n  <p>For Apple’s first new major product in a decade — the Apple Watch\nwas announced in 2014 — Chief Executive Tim Cook has a lot on the\nline as the device attempts to dominate the virtual world where\npeople spend time for work or leisure, called the metaverse, which\nhasn’t yet reached mass adoption or understanding.</p>\n\n<p>There is growing skepticism among some investors and potential\nfuture partners that consumers will spend money and time on the\nmetaverse. They note some early adopters are disillusioned with\nthe technology.</p>\n</blockquote>\n\n<p>It’s a sidenote perhaps, but I’d argue that AirPods are a major new product — and that AirPods Pro are the first true mass-market augmented reality devices. The fact that they’re audio-only, and not visual, blinds people (sorry) to the fact that they’re <a href="https://daringfireball.net/2019/10/airpods_pro_first_impressions">remarkable AR products</a>. Apple doesn’t break out unit sales, but estimates suggest that if AirPods — just AirPods — were a standalone company, <a href="https://daringfireball.net/2010/05/this_is_how_apple_rolls">it would have more revenue</a> than Nvidia, Adobe, or Uber, and might soon catch up to Netflix. But that’s a sidenote. </p>\n\n<p>The bigger issue is that back in October, <a href="https://daringfireball.net/linked/2022/10/26/stern-federighi-joz">in an on-stage interview</a>, Greg Joswiak was asked to complete the sentence “The metaverse is...”, and his answer was, “...a word I’ll never use.” The fact that people don’t use or even know what the hell the metaverse means is irrelevant to Apple’s headset. I don’t know how much more clear Joz could have been without revealing Apple’s headset then and there — <em>Apple’s not making something that’s just like what other companies already have on the market</em>. That on-stage interview was with ... <em>checks notes</em> ... <a href="https://www.youtube.com/watch?v=m-ugwoEOMvg">Joanna Stern at The Wall Street Journal Tech Live conference</a>. It’s enough to make you think Wall Street Journal reporters don’t read The Wall Street Journal.</p>\n\n<p>That no XR headset introduced so far has made much of a dent in the universe isn’t a sign that Apple’s effort is ill-fated. It’s a sign that Apple has an opportunity. In a sense, Apple <em>does</em> have one tradition when entering a new product category: they endeavor to make <a href="https://www.fastcompany.com/40435064/what-alan-kay-thinks-about-the-iphone-and-technology-now">the first one good enough to be criticized</a>.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n<li id="fn1-2023-05-18">\n<p>Here’s a paragraph for the Annals of Prognostication from that same 2016 Wakabayashi report for the Journal:</p>\n\n<blockquote>\n  <p>And yet, there are detractors such as Fred Wilson, co-founder of\nventure-capital firm Union Square Ventures, in December declared\nthe Watch a “flop.” Mr. Wilson, who owns shares of Fitbit through\na fund, had earlier predicted the Watch wouldn’t be a “home run”\nlike the iPad, iPhone and iPod, saying many people wouldn’t want\nto wear a computer on their wrist.</p>\n</blockquote>\n\n<p><a href="https://daringfireball.net/linked/2016/01/02/fred-wilson-predictions">Fred Wilson</a>, the <a href="https://daringfireball.net/linked/2014/05/05/wilson">next best thing</a> to <a href="https://nypost.com/2023/03/10/cnbcs-jim-cramer-touted-silicon-valley-bank-stock/">Jim Cramer</a>.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-18" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n</ol>\n</div>','\n',char(10)),'','2023-05-19 01:41:49','John Gruber','https://daringfireball.net/2023/05/do_wall_street_journal_reporters_read_the_wall_street_journal');
-INSERT INTO entries VALUES(74,'tag:daringfireball.net,2023:/linked//6.39929',5,'New EU Cryptocurrency Rules Make Exchanges Liable If They Lose Customers’ Assets','text/html',replace('<p>Ashley Belanger, reporting for Ars Technica:</p>\n\n<blockquote>\n  <p>Today, the European Union <a href="https://www.consilium.europa.eu/en/press/press-releases/2023/05/16/digital-finance-council-adopts-new-rules-on-markets-in-crypto-assets-mica/">approved</a> a comprehensive set of\ncryptocurrency regulations seeking to lay the groundwork for how\ncrypto is regulated globally. The rules — which make providers\nliable if they lose investors’ crypto assets — will go into\neffect in 2024 across 27 EU member states.</p>\n</blockquote>\n\n<p>The EU’s muscular regulation regime finally lands on a worthwhile target.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/eu-cryptocurrency-rules" title="Permanent link to ‘New EU Cryptocurrency Rules Make Exchanges Liable If They Lose Customers’ Assets’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 22:21:24','John Gruber','https://arstechnica.com/tech-policy/2023/05/landmark-crypto-rules-make-exchanges-liable-for-customer-losses-in-eu/');
-INSERT INTO entries VALUES(75,'tag:daringfireball.net,2023://1.39928',5,'★ Let’s Check in on Supermicro, the Target of Bloomberg’s ‘The Big Hack’','text/html',replace('<p><a href="https://mastodon.social/@kimahlberg/110386827166566142">Kim Ahlberg, posting on Mastodon</a>:</p>\n\n<blockquote>\n  <p>Putting some money into SMCI after reading <a href="https://mastodon.social/@gruber">@gruber</a>’s posts\ncalling out Bloomberg¹ on their bullshit story has been a good\nmove so far…</p>\n\n<p>¹ Bloomberg, of course, is the publication that\n  published “The Big Hack” in October 2018 — a sensational story\n  alleging that data centers of Apple, Amazon, and dozens of other\n  companies were compromised by China’s intelligence services. The\n  story presented no confirmable evidence at all.</p>\n</blockquote>\n\n<p>Supermicro (SMCI) was the company whose server motherboards Bloomberg alleged were compromised by rogue chips designed to surreptitiously phone home to Chinese intelligence servers. Bloomberg presented zero actual evidence then, and five years later, zero evidence of such rogue chips has been found. Every company Bloomberg alleged was compromised flatly denied the report. Bloomberg has never retracted the report, thus forever tarnishing their journalistic integrity. <a href="https://daringfireball.net/2018/10/bloomberg_the_big_hack">Here’s my first report on the story</a>, and <a href="https://daringfireball.net/search/bloomberg+big+hack">this search</a> should get you to my follow-ups.</p>\n\n<p>When Bloomberg published their spectacular but seemingly completely false report, <a href="https://www.wolframalpha.com/input?i=smci+stock+price+september+2018+to+november+2018">Supermicro’s stock price plummeted by almost half</a>, from $21.50 to $11.65 per share.</p>\n\n<p>I can’t believe I never thought to follow-up on their share price, given my years-long zealotry reminding people, via footnotes in other reports from Bloomberg, that “The Big Hack” was by all available evidence complete bullshit, yet never retracted.</p>\n\n<p>Turns out Supermicro <a href="https://www.wolframalpha.com/input?i=smci+stock+price+september+2018+to+may+2023">has done OK in the intervening years</a>. Their stock closed today at $164.56 — over 14 times higher than it was after “The Big Hack” dropped. That’s <a href="https://daringfireball.net/misc/2023/05/supermicro-stock-2018-2023.jpeg">a tidy return</a> for Ahlberg and anyone else who invested similarly. What a nice postscript to a disgraceful story.</p>','\n',char(10)),'','2023-05-18 21:19:24','John Gruber','https://daringfireball.net/2023/05/lets_check_in_on_supermicro');
-INSERT INTO entries VALUES(76,'tag:daringfireball.net,2023:/linked//6.39927',5,'CNBC: ‘Google to Save Money on Employee Laptops, Services, and Staplers’','text/html',replace('<p>Jennifer Elias, reporting for CNBC back in early April (sorry — I’m cleaning up old open tabs):</p>\n\n<blockquote>\n  <p>Among the equipment changes, Google is pausing refreshes for\nlaptops, desktop PCs and monitors. It’s also “changing how often\nequipment is replaced,” according to internal documents viewed\nby CNBC.</p>\n\n<p>Google employees who are not in engineering roles but require a\nnew laptop will receive a Chromebook by default. Chromebooks are\nlaptops made by Google and use a Google-based operating system\ncalled Chrome OS.</p>\n\n<p>It’s a shift from the range of offerings, such as Apple MacBooks,\nthat were previously available to employees. “It also provides the\nbest opportunity across all of our managed devices to prevent\nexternal compromise,” one document about the laptop changes said.</p>\n</blockquote>\n\n<p>Google has this backwards. They should force all their engineers to use Chromebooks, and let everyone else continue using MacBooks. Maybe then they’ll turn ChromeOS into something useable for real work.</p>\n\n<blockquote>\n  <p>Google employees have also noticed some more extreme cutbacks to\noffice supplies in recent weeks. Staplers and tape are no longer\nbeing provided to print stations companywide as “part of a cost\neffectiveness initiative,” according to a separate, internal\nfacilities directive viewed by CNBC.</p>\n\n<p>“We have been asked to pull all tape/dispensers throughout the\nbuilding,” a San Francisco facility directive stated. “If you need\na stapler or tape, the receptionist desk has them to borrow.”</p>\n\n<p>A Google spokesperson said the internal message about staplers and\ntape was misinformed. “Staplers and tape continue to be provided\nto print stations. Any internal messages that claim otherwise are\nmisinformed.″</p>\n</blockquote>\n\n<p>Please tell me they haven’t dismantled <a href="https://www.businessinsider.com/googles-office-slides-2012-5#8-google-detroit-1">the slides</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/google-chromebooks-staplers" title="Permanent link to ‘CNBC: ‘Google to Save Money on Employee Laptops, Services, and Staplers’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 19:57:38','John Gruber','https://www.cnbc.com/2023/04/03/google-to-cut-down-on-employee-laptops-services-and-staplers-to-save.html');
-INSERT INTO entries VALUES(77,'tag:daringfireball.net,2023:/linked//6.39926',5,'Disney Pulls Plug on $1 Billion Development in Florida','text/html',replace('<p>Brooks Barnes, reporting for The New York Times:</p>\n\n<blockquote>\n  <p>In March, Disney called Gov. Ron DeSantis of Florida\n“anti-business” for his scorched-earth attempt to tighten\noversight of the company’s theme park resort near Orlando. Last\nmonth, when Disney sued the governor and his allies for what it\ncalled “a targeted campaign of government retaliation,” the\ncompany made clear that $17 billion in planned investment in Walt\nDisney World was on the line.</p>\n\n<p>“Does the state want us to invest more, employ more people, and\npay more taxes, or not?” Robert A. Iger, Disney’s chief\nexecutive, said on an earnings-related conference call with\nanalysts last week.</p>\n\n<p>On Thursday, Mr. Iger and Josh D’Amaro, Disney’s theme park and\nconsumer products chairman, showed that they were not bluffing,\npulling the plug on a nearly $1 billion office complex that was\nscheduled for construction in Orlando. It would have brought more\nthan 2,000 jobs to the region, with $120,000 as the average\nsalary, according to an estimate from the Florida Department of\nEconomic Opportunity.</p>\n</blockquote>\n\n<p>Vote for Republicans, they’re good for business.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/disney-florida-pulls-plug" title="Permanent link to ‘Disney Pulls Plug on $1 Billion Development in Florida’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 19:50:22','John Gruber','https://www.nytimes.com/2023/05/18/business/disney-ron-desantis-florida.html?smtyp=cur&smid=tw-nytimes');
-INSERT INTO entries VALUES(78,'tag:daringfireball.net,2023:/linked//6.39925',5,'Porsche Adds Support for Apple Maps EV Routing','text/html',replace('<p>Chance Miller, 9to5Mac:</p>\n\n<blockquote>\n  <p>Porsche is signing on to be the second EV maker to officially\nadopt support for EV routing in Apple Maps. This means that\nPorsche Taycan drivers can now use Apple Maps via CarPlay,\nsignaling Porsche’s continued commitment to CarPlay as other\n<a href="https://9to5mac.com/2023/03/31/gm-carplay-support-ev/">automakers abandon Apple’s platform</a>.</p>\n</blockquote>\n\n<p>It’s not other automakers plural. It’s just one: GM.</p>\n\n<p>But I’m sure GM knows better than Porsche.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/porsche-apple-maps" title="Permanent link to ‘Porsche Adds Support for Apple Maps EV Routing’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 01:42:13','John Gruber','https://9to5mac.com/2023/05/17/apple-maps-porsche-ev-routing/');
-INSERT INTO entries VALUES(79,'tag:daringfireball.net,2023:/linked//6.39920',5,'Follow-Up on GM’s ‘Edsel’ Pipe Dream for Tens of Billions in Annual Services Revenue: Apple Makes Most of Its Services Revenue From the App Store','text/html',replace('<p>In <a href="https://daringfireball.net/2023/05/gm_edsel">my piece yesterday</a> digging into the numbers on GM’s plan to generate $20–25 billion in annual subscription services revenue by the end of the decade, I originally neglected to mention (but have since added) the single largest source of services revenue for Apple: the App Store. Here’s Kif Leswing reporting for CNBC in January this year:</p>\n\n<blockquote>\n  <p>On Tuesday, <a href="https://www.apple.com/newsroom/2023/01/apple-celebrates-a-groundbreaking-year-in-entertainment/">Apple said it has paid $320 billion to\ndevelopers</a>, up from $260 billion as of last year, a jump of\n$60 billion. Developers receive between 70% and 85% of gross\nsales, depending on if they qualify for Apple’s reduced rate.</p>\n\n<p>If all developers paid a 30% cut to Apple, Apple’s App Store\ngrossed more than $85 billion in 2022, based on a CNBC analysis.\nIf Apple’s commissions were all 15%, the App Store’s estimated\ngross would come in lower, around $70 billion.</p>\n</blockquote>\n\n<p><s>I’m not quite sure how to square these estimates with <a href="https://sixcolors.com/post/2023/05/apple-q2-2023-results-94-8b-revenue-better-than-expected/">Apple’s figures from their quarterly reports</a> — according to Apple’s reports, the company only booked a total of about $80 billion in services revenue for 2022.</s> <a href="https://www.cnbc.com/2021/09/10/apple-vs-epic-70percent-of-app-store-revenue-from-customers-playing-games.html">And we know from the Apple v. Epic lawsuit</a> that 70 percent of App Store revenue comes from gaming.</p>\n\n<p>[<strong>Wait wait wait I figured it out:</strong> My bad for misreading the numbers (which I think were confusingly described). I mistakenly thought Leswing was saying that Apple’s commissions were $70-85 billion last year. That’s <em>not</em> what he meant and that’s obviously far too high. But the math is really rather simple. $320 billion is the sum of Apple’s <em>cumulative</em> payments to developers from 2008 to 2022. $60 billion is what Apple paid to developers in 2022. Duh. Of <em>course</em> they didn’t pay $320 billion last year alone. So let’s assume that Apple’s average commission from App Store purchases is 25 percent, which seems both fair (given that 70 percent of App Store revenue comes from gaming and in-app purchases carry a 70/30 split) and makes the math really easy for last year. With $60 billion in payments to developers in 2022, Apple’s take was $20 billion. So about one quarter of Apple’s services revenue comes from App Store commissions — <em>that</em> squares perfectly with a common sense estimate. (Also: the fact that almost 20 percent of the App Store’s <em>cumulative</em> revenue was generated last year alone goes to show just how much it’s still growing.)]</p>\n\n<p>How in the world does GM CEO Mary Barra think they’re going to replicate anything like this? Why drop support for the much-liked CarPlay — a feature <a href="https://www.theverge.com/2022/6/6/23156741/ios-16-carplay-apple-wwdc-hvac-deeper-integration">Apple says 79 percent of new car buyers in the U.S. want</a> — to chase a pipe dream? I can’t put it better than <a href="https://mastodon.social/@jamesdempsey/110385234972539439">James Dempsey quipped on Mastodon</a>: “It’s like CurrentC, but for cars!”</p>\n\n<p>But it’s even worse than that, because at least the <a href="https://daringfireball.net/search/CurrentC">CurrentC consortium’s ill-fated scheme</a> to avoid supporting Apple Pay at brick-and-mortar retail stores came at a time when Apple Pay was nascent. Back in 2014 a survey never would have found that 79 percent of U.S. shoppers wanted Apple Pay support at the register. GM is making this move now, after CarPlay has become both standard and liked by an overwhelming majority of buyers — including GM’s own customers.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/edsel-follow-up-app-store" title="Permanent link to ‘Follow-Up on GM’s ‘Edsel’ Pipe Dream for Tens of Billions in Annual Services Revenue: Apple Makes Most of Its Services Revenue From the App Store’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 00:45:00','John Gruber','https://www.cnbc.com/2023/01/10/apple-app-store-revenue-update-shows-slowing-growth-.html');
-INSERT INTO entries VALUES(80,'tag:daringfireball.net,2023:/linked//6.39924',5,'Pew Research Center: ‘Majority of U.S. Twitter Users Say They’ve Taken a Break From the Platform in the Past Year’','text/html',replace('<p>Pew Research Center:</p>\n\n<blockquote>\n  <p>A majority of Americans who have used Twitter in the past year\nreport taking a break from the platform during that time, and a\nquarter say they are not likely to use it a year from now,\naccording to a Pew Research Center survey conducted about five\nmonths after billionaire Elon Musk acquired the site.</p>\n</blockquote>\n\n<p>The saving grace for Twitter might be that people don’t always follow through with what they tell pollsters. They might answer honestly with what they think they’ll do, or should do, but they don’t really know what they <em>will</em> do. Commission a poll in December and ask people how many books they plan to read next year, or how often they plan to hit the gym, for example.</p>\n\n<p>But with that caveat out of the way, this survey is pretty damning. A lot of Twitter users no longer enjoy Twitter, and Twitter is meant for enjoyment. Musk’s only hope is that people will continue using Twitter even if they don’t enjoy it, and I don’t see that happening. Facebook gets away with that to a large extent because so many people feel obligated to use it to stay in touch with family and friends. Twitter doesn’t carry <em>any</em> sense of obligation.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/pew-twitter-poll" title="Permanent link to ‘Pew Research Center: ‘Majority of U.S. Twitter Users Say They’ve Taken a Break From the Platform in the Past Year’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 23:02:34','John Gruber','https://www.pewresearch.org/short-reads/2023/05/17/majority-of-us-twitter-users-say-theyve-taken-a-break-from-the-platform-in-the-past-year/');
-INSERT INTO entries VALUES(81,'tag:daringfireball.net,2023:/linked//6.39923',5,'Elon Musk Defends Anti-Soros Tweets in Bananas Interview on CNBC: ‘I’ll Say What I Want’','text/html',replace('<p>CNBC:</p>\n\n<blockquote>\n  <p>Elon Musk told CNBC’s David Faber on Tuesday that he doesn’t care\nif his inflammatory tweets scare away potential Tesla buyers or\nTwitter advertisers. “I’ll say what I want, and if the consequence\nof that is losing money, so be it,” said Musk, who owns Twitter.\nMusk has for years tweeted controversial items, including\nconspiracy theories and comments his critics have called broadly\ndiscriminatory.</p>\n\n<p>His defense came after Musk caught renewed criticism for <a href="https://twitter.com/elonmusk/status/1658294821679951872">a\ntweet</a> in which he likened liberal billionaire and\nDemocratic donor George Soros to <a href="https://twitter.com/elonmusk/status/1658291808592629761">X-Men villain Magneto</a>,\na Jewish Holocaust survivor.</p>\n\n<p>“He wants to erode the very fabric of civilization. Soros hates\nhumanity,” Musk tweeted Monday.</p>\n</blockquote>\n\n<p>There are some moments in this video interview that are <a href="https://www.mediaite.com/news/kara-swisher-torpedoes-bonkers-elon-musk-interview-especially-stuff-about-white-supremacist-mall-shooter/">just cringe-inducing</a>. Even just the awkward pauses. (Faber, to my mind, did a hell of a job — Musk is obviously a very difficult person to interview.) I’m starting to get real <a href="https://www.npr.org/2011/01/30/133272280/the-troubled-genius-of-bobby-fischer">Bobby Fischer vibes</a> from Musk — a genius, yes, but descending into conspirational hateful madness. But Fischer became a recluse; Musk is one of the most prominent people in the world.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/musk-faber-cnbc-interview" title="Permanent link to ‘Elon Musk Defends Anti-Soros Tweets in Bananas Interview on CNBC: ‘I’ll Say What I Want’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 22:27:29','John Gruber','https://www.cnbc.com/2023/05/16/elon-musk-defends-inflammatory-tweets-ill-say-what-i-want.html');
-INSERT INTO entries VALUES(82,'tag:daringfireball.net,2023:/linked//6.39922',5,'Jason Snell on Final Cut and Logic for iPad','text/html',replace('<p>Jason Snell, writing at Six Colors:</p>\n\n<blockquote>\n  <p>Final Cut Pro for iPad seems to be a subset of the Mac version.\nYou can start on iPad and move to Mac, but the migration won’t\nwork the other way, and a bunch of features from the Mac just\naren’t there on the iPad.</p>\n\n<p>This is disappointing. Yes, the lack of feature parity is\nunfortunate — but perhaps a bit understandable? But as someone\nwho rarely uses those pro-level features, it’s also frustrating to\nrealize that even my simple projects won’t be portable in case I\nneed to leave home and run off somewhere with an iPad.</p>\n</blockquote>\n\n<p>Logic Pro users can roundtrip between Mac and iPad, but as Snell points out, <em>not</em> if you’re using any Audio Unit plugins that are Mac-only.</p>\n\n<p>The lack of roundtripping with Final Cut is disappointing, but I agree with Snell that it’s understandable. Presumably, roundtrip support between iPad and Mac is forthcoming, and requires engineering work that isn’t yet finished — either in iPadOS itself or in Final Cut Pro for iPad (or both). But what would we prefer? To wait for months or another year for Final Cut to hit iPad? After waiting this long, Apple wouldn’t release Final Cut for iPad now if they didn’t think it was a viable product as it stands, even without roundtrip project support with the Mac.</p>\n\n<p>Don’t miss my favorite part of Snell’s piece, where he describes how productive he is editing podcasts on iPad with Ferrite Recording Studio because it has rich support for multitouch. It’s a perfect example of <a href="https://daringfireball.net/2020/01/the_ipad_awkwardly_turns_10">Steve Jobs’s guiding maxim</a> for the iPad when he introduced it in 2010: that it needs to be able to do some things better than either the iPhone or Mac.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/snell-final-cut-logic-ipad" title="Permanent link to ‘Jason Snell on Final Cut and Logic for iPad’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 22:08:47','John Gruber','https://sixcolors.com/post/2023/05/final-cut-and-logic-arrive-on-ipad-questions-and-some-answers/');
-INSERT INTO entries VALUES(83,'tag:daringfireball.net,2023:/linked//6.39921',5,'Drudge Hints That Laura Ingraham Is Next on Fox News’s Shitcan List','text/html',replace('<p>Alex Griffing, writing for Mediaite:</p>\n\n<blockquote>\n  <p>The Drudge Report dropped a siren-blaring scoop on Wednesday\nannouncing an imminent shake-up at Fox News, eventually reporting\nthat Sean Hannity will take over at 8 p.m.</p>\n\n<p>“WORLD EXCLUSIVE: FOXNEWS SETS NEW SCHEDULE” read the headline\nfrom Matt Drudge on the highly-trafficked website he founded.\nDrudge eventually updated that headline to note Hannity’s new gig\nas well as report both Jesse Watters and Greg Gutfeld would be\nheading to prime time.</p>\n\n<p>Watters currently hosts one of Fox’s top-rated shows at 7 p.m.\nwhile Gutfeld hosts a highly-rated late-night show at 11 p.m. — both co-host Fox’s top-rated program The Five at 5 p.m. Hannity,\nmeanwhile, broke the record for longest-running cable news prime\ntime host in April of 2022, eclipsing Larry King at 25 years, six\nmonths, and 15 days.</p>\n\n<p>“FOXNEWS is preparing to announce an ambitious new schedule, the\nDrudge Report has learned, a schedule where ever hour of primetime\nwill change!” Drudge reported. “TOP SOURCE TELLS DRUDGE: ‘IT’S OUR\nBOLDEST AND MOST FEARLESS LINE-UP EVER’…”</p>\n</blockquote>\n\n<p>Ingraham isn’t mentioned by name, but there are only three prime-time hours, so if they go to Hannity, Watters, and Gutfeld, she’s following Tucker Carlson out the door. Tomorrow will mark six years since <a href="https://en.wikipedia.org/wiki/Roger_Ailes">Roger Ailes’s death</a>. It feels like Fox News was running on autopilot since then — but the Murdochs have woken from their slumber and are shaking things up.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/drudge-ingraham" title="Permanent link to ‘Drudge Hints That Laura Ingraham Is Next on Fox News’s Shitcan List’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 22:02:03','John Gruber','https://www.mediaite.com/news/just-in-matt-drudge-teases-bombshell-about-fox-news-schedule-shakeup/');
-INSERT INTO entries VALUES(84,'tag:daringfireball.net,2023://1.39919',5,'★ Proposed Name for GM’s Upcoming In-House Software Platform (You Know, the One That Isn’t Going to Support CarPlay): Edsel','text/html',replace('<p><a href="https://www.cnbc.com/2023/05/09/gm-hires-ex-apple-exec-mike-abbott-to-lead-new-software-unit.html">Michael Wayland, reporting last week for CNBC</a>:</p>\n\n<blockquote>\n  <p>General Motors has hired former Apple executive Mike Abbott to\nlead a newly created software unit for the Detroit automaker.\nAbbott, former vice president of engineering for Apple’s cloud\nservices division, will join GM as executive vice president of\nsoftware, effective May 22. He will report to GM CEO Mary Barra.</p>\n\n<p>Abbott’s newly created role will bring together three separate\nfunctions within the company: software-defined vehicle and\noperating systems; information and digital technology; and the\ncompany’s digital business. [...]</p>\n\n<p>GM has a target to grow profit margins and double its revenue to\nabout $280 billion by the end of this decade. That includes\nsignificant growth in new business units and software.</p>\n</blockquote>\n\n<p>I’m not familiar with Mike Abbott, but it sounds like his expertise is entirely in cloud services, not user-facing software design and engineering. So I don’t think Barra was thinking “<em>Apple makes great software that people love, so we should hire someone from Apple who knows how to lead such a team</em>”,<sup id="fnr1-2023-05-16"><a href="https://daringfireball.net/#fn1-2023-05-16">1</a></sup> but instead more like “<em>Apple has built an $80 billion per year services division that continues to grow each quarter, so we should hire someone who knows how to lead such a team</em>”. Barra is looking at <a href="https://sixcolors.com/post/2023/05/apple-q2-2023-results-94-8b-revenue-better-than-expected/">Apple’s services revenue</a>, not the quality of Apple’s CarPlay.</p>\n\n<p>That’s fine, and maybe someone like Abbott is exactly who GM needs. But I don’t look at this hire and think that GM is any more likely to come up with a CarPlay-quality interface for its own platform. Some back-of-the-envelope math on Barra’s services revenue goals for GM makes it sound to me like Mike Abbott is being tasked with designing an in-dash slot machine.</p>\n\n<p>When <a href="https://daringfireball.net/2023/04/gm_carplay_iphones">GM announced they were dropping CarPlay from their EVs</a> last month, <a href="https://www.reuters.com/technology/gm-plans-phase-out-apple-carplay-evs-with-googles-help-2023-03-31/">Reuters reported</a> that “Barra is aiming for $20 billion to $25 billion in annual revenue from subscriptions by 2030.”</p>\n\n<p>That seems very ambitious.</p>\n\n<p>Let’s look at GM’s current subscription services revenue. <a href="https://www.fool.com/investing/2022/07/24/why-wall-street-loves-this-new-car-option-that-dri/">Here’s Larry Printz, writing for Motley Fool last July</a>:</p>\n\n<blockquote>\n  <p>According to company officials, GM generated nearly $2 billion in\nsubscription services revenue and EBIT margins north of 70% in\nfiscal 2021. The automaker currently has more than 4 million\nsubscribers. For 2021, GM’s global revenue was $127 billion,\nmeaning that if forecast proved true, OnStar accounted for 1.6% of\nGM’s worldwide revenue. While that may seem like a minimal\ncontribution to the bottom line, that figure should grow thanks to\nrecent additions to OnStar.</p>\n\n<p>GM recently announced a subscription plan for its SuperCruise\nself-driving feature, which is free for the first three years on\nnew vehicles. It also opened OnStar to owners of non-GM vehicles\nthrough a smartphone app, which should bring additional\nsubscribers — and income.</p>\n</blockquote>\n\n<p>To grow from $2 billion to $20 billion (the low end of Barra’s stated goal) by 2030, it seems safe to assume she’s expecting this growth to come from future car sales, not GM vehicles that are already on the road today.</p>\n\n<p><a href="https://www.statista.com/statistics/225326/amount-of-cars-sold-by-general-motors-worldwide/">GM sells about 6 million vehicles per year</a> — but that number has been declining since a peak of 10 million in 2016. Presumably, these future services will require vehicles equipped with GM’s new software platform. Right now they’re claiming this system will only be going into EVs, and in 2022, <a href="https://insideevs.com/news/629611/us-gm-plugin-car-sales-2022q4/">only 1.7 percent of GM vehicles sold were all-electric</a>.</p>\n\n<p>So let’s be generous and say that by 2030, GM has sold 30 million vehicles eligible for <em>and subscribed to</em> the company’s new services. I think 30 million is very generous — if not outlandish — and would require them to put the new software platform in their gas and hybrid vehicles, too. Keep in mind they only had 4 million subscribers in 2021 and their vehicle sales are in decline.</p>\n\n<p>$20 billion in revenue from 30 million subscribers = $666/year/vehicle = $55/month/vehicle. That’s in line with their current average of $500/year per services subscriber ($2 billion in revenue from 4 million subscribers, per Motley Fool above), but it’s a lot of money per subscriber. I just don’t see how they grow from 4 million subscribers today to 30 million or more by 2030.</p>\n\n<p>What services could they offer that new car buyers would pay north of $50/month for? Maps and navigation? Everyone has that on their phones already. Music and podcasts? Everyone has that on their phones already. Crash detection? By 2030 everyone will have that on their phones already (or at least they will <a href="https://support.apple.com/en-us/HT213225">if they have iPhones</a>, but I bet that will soon become a standard feature on Android phones too). GM wants to sell “behavior based insurance” (translation: tracking/surveillance), but <a href="https://www.reuters.com/business/autos-transportation/gm-set-launch-behavior-based-us-driver-insurance-q1-executive-2022-01-24/">according to Reuters</a>, their goal for insurance is just $6 billion/year by 2030. I find it hard to see where the rest of the money will come from.</p>\n\n<p>GM executives might be dreaming that car buyers will pay GM for services they already get on their phones by not supporting CarPlay and Android Auto, but today’s reality shows that people will just buy $5 mounts to attach their phones to their vehicles’ dashboards. And if every other automaker continues to support CarPlay and Android Auto, it just seems like this entire endeavor will turn into an expensive boondoggle that steers would-be GM buyers to other brands.</p>\n\n<p>One idea that occurred to me is the equivalent of Apple’s services revenue dark matter: payments from Google for default placement as Safari’s search engine. Neither Apple nor Google has ever disclosed those numbers, but <a href="https://9to5mac.com/2022/01/05/apple-default-search-engine/">one recent estimate</a> pegs it at $20 billion per year. At a minimum, it’s $10 billion per year. Those payments from Google go into “Services” in Apple’s quarterly results. Apple now reports $20 billion in services revenue per <em>quarter</em> — so most of that is coming from the App Store, and then customer subscriptions to things like iCloud Plus, Apple Music, etc., but somewhere around 20-25 percent of it comes from Google paying to be the default search engine in Safari. With GM’s upcoming in-house software system not supporting CarPlay or Android Auto, but made in partnership with Google (based on Google’s confusingly-named <a href="https://source.android.com/docs/devices/automotive/start/what_automotive">Android Automotive</a> platform) presumably Google Maps (and/or <a href="https://www.theverge.com/2022/12/8/23499734/google-maps-waze-development-teams-combined-productivity">Waze</a>?) will be the one and only choice for mapping and navigation, and perhaps Google will pay GM for that privilege? And for default placement for other services like music? Even if that’s the deal, though, I don’t see how it gets GM close to $20 billion in services revenue per year. Apple gets $15-20 billion from Google for default search engine placement in Safari on <a href="https://www.theverge.com/2021/1/27/22253162/iphone-users-total-number-billion-apple-tim-cook-q1-2021">over one billion</a> iPhones, iPads, and Macs. Even my kindest, most optimistic estimate pegs eligible GM vehicles at just 30 million by 2030. Would Google pay GM 30–40 times more per car to provide the default mapping app than they pay Apple per iPhone/iPad/Mac? That doesn’t make sense to me, but I suppose it’s theoretically possible that mapping surveillance data is <em>that</em> valuable to Google. I really fucking doubt it, though.</p>\n\n<p>The one and only thing I can think of that GM can charge a subscription for that drivers can’t get via their phones is semi-autonomous driving. GM calls this Super Cruise and <a href="https://www.onstar.com/plans/premium">currently charges $25/month for it</a>, or $15/month for drivers who also subscribe to OnStar. (OnStar offers roadside assistance and crash detection — which, again, everyone will have for free with their phones by 2030.) But Super Cruise could exist as a standalone subscription feature <em>alongside</em> support for CarPlay and Android Auto — and in fact does today. Charging a subscription fee for Super Cruise doesn’t require GM to drop support for CarPlay and Android Auto integration.</p>\n\n<p>I can’t see how these ballpark numbers make any sense. It’s an enormous bet against the primacy of the phone in people’s lives, with no one yet, in any industry, ever having won a bet against the phone. GM’s $20–25 billion target for services revenue by 2030 feels like a <a href="https://succession.fandom.com/wiki/Kendall_Roy">Kendall Roy number</a> — plucked out of thin air by someone just making up figures in an Excel spreadsheet until they get the <code>SUM()</code> result they’re looking for.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n<li id="fn1-2023-05-16">\n<p>I don’t think there’s any chance whatsoever this could have happened, but imagine if GM had hired Scott Forstall to lead their software division. That would have been interesting.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-16" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n</ol>\n</div>','\n',char(10)),'','2023-05-17 02:27:30','John Gruber','https://daringfireball.net/2023/05/gm_edsel');
-INSERT INTO entries VALUES(85,'tag:daringfireball.net,2023:/linked//6.39918',5,'‘You Either Know or You Don’t Know’ — and Dianne Feinstein Does Not Seem to Know','text/html',replace('<p>Jim Newell, writing for Slate under the headline “A Brief, Concerning Conversation With Dianne Feinstein”:</p>\n\n<blockquote>\n  <p>I asked her how she was feeling.</p>\n\n<p>“Oh, I’m feeling fine. I have a problem with the leg.” A\nfellow reporter staking out the elevator asked what was wrong\nwith the leg.</p>\n\n<p>“Well, nothing that’s anyone concern but mine,” she said.</p>\n\n<p>When the fellow reporter asked her what the response from her\ncolleagues had been like since her return, though, the\nconversation took an odd turn.</p>\n\n<p>“No, I haven’t been gone,” she said.</p>\n\n<p>OK.</p>\n\n<p>“You should follow the — I haven’t been gone. I’ve been working.”</p>\n\n<p>When asked whether she meant that she’d been working from home,\nshe turned feisty.</p>\n\n<p>“No, I’ve been here. I’ve been voting,” she said. “Please. You\neither know or don’t know.”</p>\n\n<p>After deflecting one final question about those, like Rep. Ro\nKhanna, who’ve called on her to resign, she was wheeled away.</p>\n</blockquote>\n\n<p>Feinstein’s months-long absence from the Senate has been one of the biggest political stories (and <a href="https://www.theonion.com/dianne-feinstein-america-is-out-of-touch-gerontocracy-1850429436">jokes</a>) of the year. Her senescence is truly sad at a personal level, but the U.S. Senate, ostensibly the greatest deliberative body in the history of democracy, is no place for a person who doesn’t know where she’s been for the last three months. Anyone on her staff or in her family who isn’t urging her to resign ought to be ashamed.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/16/feinstein-doesnt-know" title="Permanent link to ‘‘You Either Know or You Don’t Know’ — and Dianne Feinstein Does Not Seem to Know’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-16 23:34:34','John Gruber','https://slate.com/news-and-politics/2023/05/dianne-feinstein-health-return-to-senate.html');
-INSERT INTO entries VALUES(86,'tag:daringfireball.net,2023:/feeds/sponsors//11.39917',5,'[Sponsor] Onin Keyboard Calendar','text/html',replace('<p>Only 40% of the plans we make in messaging apps end up in our calendar. Onin is the free iPhone keyboard that brings your calendar into every conversation. Check your calendar, add events, and share invites inside any app. Onin works with all your existing calendars, in all your apps, and is end-to-end encrypted.</p>\n\n<div>\n<a href="https://daringfireball.net/feeds/sponsors/2023/05/onin_keyboard_calendar" title="Permanent link to ‘Onin Keyboard Calendar’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 21:05:34','Daring Fireball Department of Commerce','https://apps.apple.com/gb/app/onin-keyboard-calendar/id6448070850');
-INSERT INTO entries VALUES(87,'tag:daringfireball.net,2023:/linked//6.39916',5,'Elon Musk Hires New Twitter CEO: NBCUniversal Ad Chief Linda Yaccarino','text/html',replace('<p>Lillian Rizzo, reporting for CNBC:</p>\n\n<blockquote>\n  <p>NBCUniversal global advertising chief Linda Yaccarino has resigned\nto join Twitter as its next chief executive. Twitter owner Elon\nMusk <a href="https://twitter.com/elonmusk/status/1657050349608501249">confirmed the hire</a> in a tweet Friday.</p>\n\n<p>“I am excited to welcome Linda Yaccarino as the new CEO of\nTwitter!” Musk tweeted. He said she “will focus primarily on\nbusiness operations, while I focus on product design &amp; new\ntechnology.”</p>\n\n<p>He added, “Looking forward to working with Linda to transform this\nplatform into X, the everything app.”</p>\n</blockquote>\n\n<p>I wish Yaccarino luck, truly. But the CEO needs to run the company, and I find it unlikely that she’s going to have that authority with Musk running “product design and new technology”.</p>\n\n<p>Tim Cook is an obvious example of a non-product person who is very successfully leading a product-first company. But while Cook is not a product designer or product visionary, there is zero question within Apple that Cook is the boss. The buck stops at Cook’s desk — including on product decisions.</p>\n\n<p><strong>Sidenote:</strong> I <a href="https://bsky.app/profile/gruber.bsky.social/post/3jup7lhivok25">noticed</a> about two weeks ago that Musk has largely stopped referring to Twitter by name and instead saying “<a href="https://twitter.com/elonmusk/status/1652048146195959809">this platform</a>”. Months ago he <a href="https://www.wsj.com/articles/twitter-inc-changes-its-name-to-x-corp-and-moves-to-nevada-703ac892">changed the name of the holding company</a> from “Twitter Inc.” to “X Corp.”. The fact that he largely refers to it now as “this platform” makes me think he’s going to rename it X sooner rather than later. Seems crazy to me to throw away the Twitter brand name though, so maybe “X” will just be to Twitter what “Meta” is to Facebook and “Alphabet” is to Google. But also: Musk does crazy things. Throwing away the entire Twitter brand would be less crazy than his buying it in the first place.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/15/twitter-ceo-linda-yaccarino" title="Permanent link to ‘Elon Musk Hires New Twitter CEO: NBCUniversal Ad Chief Linda Yaccarino’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 20:50:42','John Gruber','https://www.cnbc.com/2023/05/12/nbcuniversal-ad-chief-yaccarino-resigns-as-sources-say-shes-in-talks-to-be-twitter-ceo.html');
-INSERT INTO entries VALUES(88,'tag:daringfireball.net,2023:/linked//6.39915',5,'Ming-Chi Kuo: Apple ‘Well Prepared’ for Headset Announcement at WWDC','text/html',replace('<p>Tim Hardwick, writing for MacRumors:</p>\n\n<blockquote>\n  <p>In a brief report posted to <a href="https://medium.com/@mingchikuo/apple-ar-mr頭戴裝置發佈預測與供應鏈投資策略-高偉電子為最大受益者-apple-ar-mr-headset-announcement-prediction-and-supply-e44e3bbecb77">Medium</a> on Monday, Kuo wrote\nthat the headset’s announcement next month “bodes well” for the\nsupply chain share price, with the analyst touching on five of the\ndevice’s components that — apart from assembly — represent its\n“most expensive material costs” in his view.</p>\n\n<p>Those include the 4K micro-OLED displays, dual M2-based\nprocessors, the headset casing, 12 optical cameras for tracking\nhand movements, and the external power supply. These components\nare being supplied by Sony, TSMC, Everwin Precision, Cowell, and\nGoretek, respectively.</p>\n\n<p>Pricing on the headset is expected to begin somewhere around\n$3,000. Perhaps with that in mind, Apple won’t aim it at general\nconsumers to start with, but will instead position it as a device\nfor developers, content creators, and professionals. Apple expects\nto sell just one headset per day per retail store, and it has told\nsuppliers that it expects sales of seven to 10 million units\nduring the first year of availability.</p>\n</blockquote>\n\n<p>Kuo doesn’t mention the purported $3,000 price in his report, but a price like that would certainly jibe with an expectation that they might sell only one unit per day per store for this model. One part of me says that’s just crazy expensive for an entertainment gadget. Another part of me says that if it really is going to cost that much, it must be much more than an entertainment device — it must be useful for some forms of work too.</p>\n\n<p>The original Macintosh in 1984 cost $2,500 — inflation-adjusted that’s about $7,500 today. If it’s amazing, $3,000 isn’t absurd.</p>\n\n<p>But I also keep thinking back to rumors that the original iPad was going to start at $1,000, and it instead debuted with an entry price of $500.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/15/kuo-headset-wwdc" title="Permanent link to ‘Ming-Chi Kuo: Apple ‘Well Prepared’ for Headset Announcement at WWDC’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 20:28:48','John Gruber','https://www.macrumors.com/2023/05/15/kuo-apple-well-prepared-headset-unveiling/');
-INSERT INTO entries VALUES(89,'tag:daringfireball.net,2023:/linked//6.39914',5,'WorkOS','text/html',replace('<p>My thanks to WorkOS for sponsoring last week at DF once again. WorkOS is like “Stripe for enterprise features.” They make it easy for developers to build features needed by enterprise customers, such as Single Sign-On and SCIM.</p>\n\n<p>Shipping these features is important because they enable selling upmarket for bigger deals. Without these features, the IT department will reject your app. But these enterprise features are complex and time-consuming to build yourself, usually taking months.</p>\n\n<p>With WorkOS you can integrate and ship enterprise features in minutes. Beautiful API docs guide you through every step of the way, and transparent pricing scales based on usage. It’s a product built by developers, for developers.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/14/workos" title="Permanent link to ‘WorkOS’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 00:38:44','John Gruber','https://workos.com/');
-INSERT INTO entries VALUES(90,'tag:daringfireball.net,2023:/linked//6.39913',5,'Heather Armstrong, Writer of ‘Dooce.com’, Dies of Suicide at 47','text/html',replace('<p>Alex Williams, The New York Times:</p>\n\n<blockquote>\n  <p>Heather Armstrong, an explosively popular web writer and entrepreneur who, with her website Dooce, was hailed as the queen of the so-called mommy bloggers for giving millions of readers intimate glimpses of her joys and challenges in parenthood and marriage, as well as of her harrowing struggles with depression, died on Tuesday at her home in Salt Lake City. She was 47.</p>\n\n<p>Her death was announced on <a href="https://www.instagram.com/p/CsERc9lR_XC/">her Instagram channel</a>. Pete Ashdown, her longtime partner, said the cause was suicide. He said he had found her body in the home.</p>\n</blockquote>\n\n<p>Unspeakably sad. Nothing but love and warm thoughts for her children, family, and friends.</p>\n\n<p>(If you are in crisis, please call, text, or chat with the Suicide and Crisis Lifeline at 988. There is hope and there is help.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/10/heather-armstrong-rip" title="Permanent link to ‘Heather Armstrong, Writer of ‘Dooce.com’, Dies of Suicide at 47’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-10 21:42:02','John Gruber','https://www.nytimes.com/2023/05/10/us/heather-armstrong-dead.html');
-INSERT INTO entries VALUES(91,'tag:daringfireball.net,2023:/linked//6.39912',5,'Imran Chaudhri’s Humane Demo at TED','text/html',replace('<p>I’m rooting for Humane, but honestly, I just don’t get it from what I see here.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/09/humane-ted-video" title="Permanent link to ‘Imran Chaudhri’s Humane Demo at TED’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-09 23:33:00','John Gruber','https://youtu.be/gMsQO5u7-NQ');
-INSERT INTO entries VALUES(92,'tag:daringfireball.net,2023:/linked//6.39911',5,'Apple Launches Final Cut Pro and Logic Pro for iPad','text/html',replace('<p>Apple Newsroom:</p>\n\n<blockquote>\n  <p>Apple today unveiled Final Cut Pro and Logic Pro for iPad.\nVideo and music creators can now unleash their creativity in\nnew ways that are only possible on iPad. Final Cut Pro and\nLogic Pro for iPad bring all-new touch interfaces that allow\nusers to enhance their workflows with the immediacy and\nintuitiveness of Multi-Touch. Final Cut Pro for iPad introduces\na powerful set of tools for video creators to record, edit,\nfinish, and share, all from one portable device. Logic Pro for\niPad puts the power of professional music creation in the hands\nof the creator — no matter where they are — with a complete\ncollection of sophisticated tools for songwriting, beat making,\nrecording, editing, and mixing. Final Cut Pro and Logic Pro for\niPad will be available on the App Store as subscriptions\nstarting Tuesday, May 23.</p>\n</blockquote>\n\n<p>Both apps are priced the same: $5/month or $50/year, with a one-month free trial.</p>\n\n<p>We’ve all been waiting for these two apps to come to iPad, and at a glance, both of them look very good. Subscription pricing is interesting, and makes me wonder if the Mac apps are going to switch to that too. And a sidenote, releasing/announcing these apps now makes me think that next month’s WWDC keynote is chockablock with other announcements.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/09/final-cut-pro-logic-pro-ipad" title="Permanent link to ‘Apple Launches Final Cut Pro and Logic Pro for iPad’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-09 22:46:01','John Gruber','https://www.apple.com/newsroom/2023/05/apple-brings-final-cut-pro-and-logic-pro-to-ipad/');
-INSERT INTO entries VALUES(93,'tag:daringfireball.net,2023:/linked//6.39909',5,'Kolide','text/html',replace('<p>My thanks to Kolide for sponsoring last week at DF. Right now, “Zero Trust” is in serious danger of becoming an empty buzzword. The problem isn’t just that marketers have slapped the Zero Trust label on everything short of breakfast cereal — it’s that for all the hype, <a href="https://www.cshub.com/attacks/articles/the-biggest-data-breaches-and-leaks-of-2022">we don’t seem to be getting any safer</a>.</p>\n\n<p>At the heart of Zero Trust is a good idea, but the way most companies execute that idea is <em>incomplete</em>. Specifically, most security practitioners forget that device compliance is a crucial element of Zero Trust. Kolide solves the device compliance element of Zero Trust for companies that use Okta. Kolide’s premise is simple: if an employee’s device is out of compliance, they can’t log in to their cloud apps until they’ve fixed the problem. And instead of creating more work for IT, Kolide provides instructions so users can get unblocked on their own.</p>\n\n<p>Kolide works across your Mac, Windows, and even Linux devices, with mobile support coming soon. To learn more and see their product in action, <a href="https://l.kolide.co/3XlSqAq">simply visit their website</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/07/kolide" title="Permanent link to ‘Kolide’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-07 18:17:33','John Gruber','https://l.kolide.co/3JWbXEv');
-INSERT INTO entries VALUES(94,'tag:daringfireball.net,2023:/linked//6.39908',5,'Clarence Thomas Corruption Scandal Gets Worse','text/html',replace('<p>Joshua Kaplan, Justin Elliott, and Alex Mierjeski, reporting for ProPublica:</p>\n\n<blockquote>\n  <p>In 2008, Supreme Court Justice Clarence Thomas decided to send his teenage grandnephew to Hidden Lake Academy, a private boarding school in the foothills of northern Georgia. The boy, Mark Martin, was far from home. For the previous decade, he had lived with the justice and his wife in the suburbs of Washington, D.C. Thomas had taken legal custody of Martin when he was 6 years old and had recently told an interviewer he was “raising him as a son.”</p>\n\n<p>Tuition at the boarding school ran more than $6,000 a month. But Thomas did not cover the bill. A bank statement for the school from July 2009, buried in unrelated court filings, shows the source of Martin’s tuition payment for that month: the company of billionaire real estate magnate Harlan Crow. […]</p>\n\n<p>“You can’t be having secret financial arrangements,” said Mark W. Bennett, a retired federal judge appointed by President Bill Clinton. Bennett said he was friendly with Thomas and declined to comment for the record about the specifics of Thomas’ actions. But he said that when he was on the bench, he wouldn’t let his lawyer friends buy him lunch. […]</p>\n\n<p>“This is way outside the norm. This is way in excess of anything I’ve seen,” said Richard Painter, former chief White House ethics lawyer for President George W. Bush, referring to the cascade of gifts over the years.</p>\n\n<p>Painter said that when he was at the White House, an official who’d taken what Thomas had would have been fired: “This amount of undisclosed gifts? You’d want to get them out of the government.”</p>\n</blockquote>\n\n<p>Just breathtaking corruption. And Thomas’s response is basically, “Fuck you.”</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/06/thomas-corruption" title="Permanent link to ‘Clarence Thomas Corruption Scandal Gets Worse’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-06 21:08:18','John Gruber','https://www.propublica.org/article/clarence-thomas-harlan-crow-private-school-tuition-scotus');
-INSERT INTO entries VALUES(95,'tag:daringfireball.net,2023:/linked//6.39907',5,'Dithering','text/html',replace('<p><a class="noborder" href="https://dithering.fm/">\n<img alt="May 2023 cover art for Dithering, depicting two girls having fun on a swing set." src="https://daringfireball.net/misc/2023/05/dithering-cover-may-2023.jpeg" width="500" /></a></p>\n\n<p>Yours truly and Ben Thompson’s podcast — two episodes per week, 15 minutes per episode. Not a minute less, not a minute more. If you’re not listening, you’re missing out. $5/month or $50/year. We’re now in our fourth year, and we’ve had remarkably little churn — people who subscribe to Dithering tend to stay subscribed, which warms my heart. It’s a fun show and everyone loves the enforced brevity and regularity.</p>\n\n<p>Bonus: At the end of March we started a Dithering group in <a href="https://wavelength.app/">Wavelength</a>, the new private group messaging app <a href="https://daringfireball.net/2023/03/wavelength">I started advising earlier this year</a>. It’s sort of an unofficial perk and an experiment. Subscribers can find the link to join the group in the show notes for each episode. We had no idea how this group would go, but it’s been wild. As of this typing there are over 2,900 members, and activity every day across a wide range of threads. I believe it’s the single largest group on all of Wavelength. (I just tonight told the story there of the piece of shit 2021 Kia Sorento I was bamboozled by Hertz into renting for a road trip to Boston this week, to pick my son up at the end of the college year.) It’s a nice, smart, fun little community.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/05/dithering" title="Permanent link to ‘Dithering’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-06 01:22:25','John Gruber','https://dithering.fm/');
-INSERT INTO entries VALUES(96,'tag:daringfireball.net,2023:/linked//6.39906',5,'Ford CEO Jim Farley Seems Very Happy That GM Is Dropping CarPlay','text/html',replace('<p>Great 3-minute clip from Joanna Stern’s interview with Ford CEO Jim Farley at the WSJ’s Future of Everything Festival. She asks him about GM’s plan to drop CarPlay from their future EVs, and Farley starts by saying “Yeah, how about that?” and laughing.</p>\n\n<p>Farley says, “The interior has to be really well done. But in terms of content? We kind of lost that battle 10 years ago. So get real with it, because you’re not going to make a ton of money on content inside the vehicle. It’s going to be safety/security, partial autonomy, and productivity in our eyes. [...] 70 percent of our Ford customers in the U.S. are Apple customers. Why would I go to an Apple customer and say ‘Good luck!’? That doesn’t seem customer centric.”</p>\n\n<p>Farley and Ford have it exactly right. New car buyers, even from mainstream brands like Ford, are overwhelmingly iPhone users — exactly <a href="https://www.theverge.com/2022/6/6/23156741/ios-16-carplay-apple-wwdc-hvac-deeper-integration">as Apple bragged at WWDC last June</a>, and what iPhone users want in their cars is CarPlay. If anything, Farley is being kind to GM and GM CEO Mary Barra when he says their message to iPhone users is “Good luck” — it’s really more like “Fuck you.” And again, the most telling part of the whole exchange is the way Farley laughs at the start. You really have to hear it — his laugh implies a certain <em>I can’t believe our good fortune that GM is doing this.</em> It’s enough to make you think Mary Barra is a mole from Ford, planted to steer would-be Chevy buyers into Ford dealerships.</p>\n\n<p>If you’re asking how it can be that 70 percent of Ford’s customers are iPhone users when the iPhone has maybe just over 50 percent market share in the U.S., the key is <em>new</em> car buyers. The Android masses are buying used cars, either because they don’t have the budget for a new car or because they don’t care about buying nice things (or both). So even a non-luxury brand like Ford has an overwhelming majority of customers with iPhones.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/05/ford-ceo-jim-farley-carplay" title="Permanent link to ‘Ford CEO Jim Farley Seems Very Happy That GM Is Dropping CarPlay’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-06 00:59:02','John Gruber','https://www.wsj.com/video/ford-ceo-on-apple-google-and-elon-musk/B6D8BC45-1C4A-45D3-97AC-933A57B76E31.html');
-INSERT INTO entries VALUES(97,'tag:daringfireball.net,2023://1.39896',5,'★ Browser and OS Market Share Trends in the Mobile Age','text/html',replace('<p><a href="https://twitter.com/jbenton/status/1653394051889082368">Joshua Benton on Twitter</a>, linking to <a href="https://gs.statcounter.com/browser-market-share/desktop/united-states-of-america#monthly-202201-202303">Statcounter’s U.S. browser share data for March</a>:</p>\n\n<blockquote>\n  <p>For the first time ever, Safari has more than 20% of desktop\nbrowser share in the U.S.</p>\n\n<p>Since last June, Chrome is down 6% (61.35% to 55.28%), while\nSafari is up by a similar amount (15.58% to 22.3%).</p>\n\n<p>Seems driven entirely by increased Mac market share. Over the same\nspan, Windows is down 14% (67.57% to 53.43%) and macOS is up 6%\n(24.27% to 31.34%). ChromeOS went from 3.75% to 8.47% (though\nthe school year makes that comp a bit unfair).</p>\n</blockquote>\n\n<p><a href="https://gs.statcounter.com/browser-market-share/desktop/worldwide/#monthly-202201-202303">Statcounter’s latest <em>global</em> numbers</a>:</p>\n\n<ul>\n<li>Chrome: 66.1%</li>\n<li>Safari: 11.9%</li>\n<li>Edge: 11%</li>\n<li>Firefox: 5.7%</li>\n<li>Opera: 3.1%</li>\n</ul>\n\n<p>Looking at the <a href="https://gs.statcounter.com/browser-market-share/desktop/worldwide/#monthly-202201-202303">global chart</a>, Chrome seems to be holding steady in the desktop market over the  last year, but Safari does show an uptick from about 9.5 to just under 11 percent. As Benton points out, the most striking thing in Statcounter’s report is the decline in Windows’s desktop OS share over the last year, both <a href="https://gs.statcounter.com/os-market-share/desktop/worldwide#monthly-202201-202303">globally</a> and <a href="https://gs.statcounter.com/os-market-share/desktop/worldwide#monthly-202201-202303">in the U.S.</a> I suspect Windows is losing share to <em>mobile</em> browsing just as much as or more than it is to MacOS and ChromeOS. Back when Windows had over 90 percent market share, a huge chunk of that was people who didn’t really choose a Windows PC because of Windows, but who just wanted a “computer”. They took the default, and the default computer ran Windows.</p>\n\n<p>Nowadays, Windows still gets most of the default <em>desktop</em> market (although it seem ChromeOS continues to eat into that, especially in K-12 education). But for more and more people, their default “computer” is their phone. They might have a PC, but they use it less and less.</p>\n\n<p>Which brings me to another real eye-opener: Statcounter’s OS market share numbers — across all devices, desktop and mobile — from 2009 until now.</p>\n\n<p><a href="https://gs.statcounter.com/os-market-share#monthly-200901-202303">Globally</a>:</p>\n\n<p><a class="noborder" href="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-ww-monthly-200901-202303.png">\n  <img alt="Chart showing Statcounter''s global market share for operating system from January 2009 through March 2023." src="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-ww-monthly-200901-202303.png" width="500" /></a></p>\n\n<p><a href="https://gs.statcounter.com/os-market-share/all/united-states-of-america#monthly-200901-202303">United States</a>:</p>\n\n<p><a class="noborder" href="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-US-monthly-200901-202303.png">\n  <img alt="Chart showing Statcounter''s U.S. market share for operating system from January 2009 through March 2023." src="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-US-monthly-200901-202303.png" width="500" /></a></p>\n\n<p>Globally, Windows was surpassed by Android back in 2017. The decline in Windows’s dominance has been precipitous: in 2009 Statcounter pegged its share at 95 percent; today it’s 28 percent. In the U.S., Windows is effectively neck-and-neck with iOS, each hovering around 30 percent for the last few years. It doesn’t seem outlandish to project that Mac and iOS, combined, might soon surpass Windows and Android combined in Statcounter’s share numbers for the U.S.</p>\n\n<p>The Mac, on the other hand, is clearly seeing impressive market share growth. We all kind of knew this was true from the Mac revenue numbers <a href="https://sixcolors.com/tag/quarterly/">Apple reports each quarter</a>, but Statcounter’s data backs up Apple’s claims that the Mac continues to gain new users. And that in turn leads to more desktop Safari users — even though recent switchers strike me as among the most likely Mac users to use Chrome, which they’re likely familiar with. But if desktop Safari usage share is growing, it must mean Mac usage is growing.</p>\n\n<p>The rise of iOS and Android as humanity’s primary computing platforms has obliterated Windows’s decades-long hegemony. To be fair, when your usage share was at one time 95 percent <em>of all web browsing</em>, there’s nowhere to go but down. But today, Windows is just one of four major platforms — and is the only one of the four that is in obvious decline, both in usage and relevance. The Mac, on the other hand, has seemingly been <em>bolstered</em> by the rise of the iPhone. We talked a lot about <a href="https://daringfireball.net/2007/10/milhouse">the “halo effect” of the iPod</a> on Mac sales in the mid-2000s, but it’s more true today with the iPhone and iPad. Mac unit sales are up and its share of desktop computing is <em>way</em> up. People who don’t care about desktop computing are just using their phones and tablets for everything; people who do care are more likely than ever to be using a Mac.</p>\n\n<p>One more nugget, just for kicks — <a href="https://gs.statcounter.com/os-market-share/mobile/united-states-of-america#monthly-202201-202303">U.S.</a> and <a href="https://gs.statcounter.com/os-market-share/mobile/worldwide#monthly-202201-202303">worldwide</a> numbers for iOS and Android in the mobile market:</p>\n\n<table>\n<thead>\n<tr>\n  <th></th>\n  <th>U.S.</th>\n  <th>Global</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n  <td>iOS</td>\n  <td>60</td>\n  <td>30</td>\n</tr>\n<tr>\n  <td>Android</td>\n  <td>40</td>\n  <td>69</td>\n</tr>\n</tbody>\n</table>\n\n<p>It’s also worth noting on the charts above that in hindsight, it wasn’t clear that mobile browsing would surpass desktop browsing until 2013 or 2014 — six or seven years after the debut of the iPhone. That’s a timeframe worth keeping in mind for — oh, just to pick a random up-and-coming product category — AR/VR headsets. The iPhone did change everything, but it took a while to show it outside the enthusiast / early-adopter market.</p>','\n',char(10)),'','2023-05-02 23:11:18','John Gruber','https://daringfireball.net/2023/05/browser_and_os_market_share_trends_in_the_mobile_age');
-INSERT INTO entries VALUES(98,'tag:daringfireball.net,2023://1.39890',5,'★ Follow-Up on ‘Adware for Apple Services in iOS’','text/html',replace('<p><a href="https://daringfireball.net/2023/04/ios_adware">Yours truly, two weeks ago</a>:</p>\n\n<blockquote>\n  <p>For the last several weeks, I’ve noticed <a href="https://daringfireball.net/misc/2023/04/ios-settings-arcade-ad.png">an ad in Settings on my\niPhone</a>, in the iCloud section at the very top of the first\nscreen: “Apple Arcade Free for 3 Months”. The reason this is dumb\nis that I pay for a family account for Apple One, <em>so we already\nhave Apple Arcade</em>. But here’s Apple badgering me to sign up for a\n3-month free trial that I don’t need.</p>\n\n<p>If I tap into that ad’s section in Settings it explains why\nthey’re offering it: “Services Included With Purchase”. I’m not\neven sure what device I bought that earned me this offer, but it\nshouldn’t matter. Why are they showing me something I already\npay for?</p>\n</blockquote>\n\n<p>This prompted some give-and-take with, well, <em>people familiar with the matter</em>, and I have an answer to share. The problem I was running into was a bug that resulted from the fact I have <em>split</em> Apple ID accounts: one account for iTunes and App Store purchases, and a separate account for my Apple ID. Long story short:</p>\n\n<ul>\n<li><p>I created my mac.com iCloud account back in January 2000, <a href="https://apple.fandom.com/wiki/Mac.com">when Apple launched the service under the name iTools</a>. That same service was soon renamed .Mac, then MobileMe (and Apple <a href="https://support.apple.com/en-us/HT201771">changed the domain name to me.com</a>), then, finally, iCloud (and icloud.com).</p></li>\n<li><p>When I signed up for my iTunes account <a href="https://www.macworld.com/article/227143/15-years-of-itunes-a-look-at-apples-media-app-and-its-influence-on-an-industry.html">when the iTunes Music Store launched back in April 2003</a>, I used my primary @daringfireball.net address, not my @mac.com address. I don’t recall why I did this exactly, but I <em>think</em> that what I was thinking was something along the lines of “<em>I’m still not sure about this whole .Mac thing, but I’m pretty sure I’ll have my daringfireball.net address forever.</em>”</p></li>\n</ul>\n\n<p>In hindsight, this was a mistake on my part. Everything is simpler if you only have one Apple ID that you use for both iCloud and iTunes/App Store purchases. The reason I never switched to using my mac.com iCloud account for everything, including purchases, is that there’s never been a way to migrate old purchases from a different account. And I’ve bought a lot of music, movies, and apps over the years using my other account.<sup id="fnr1-2023-05-01"><a href="https://daringfireball.net/#fn1-2023-05-01">1</a></sup></p>\n\n<p>Using split accounts has always been a bit weird, occasionally problematic and/or confusing — but has mostly just worked out. It helps quite a bit that there are a <em>lot</em> of people working at Apple in the same situation. By the time the iPhone became a hit product, users new to the Apple ecosystem naturally used one address for everything. But split accounts are common from long-time Mac users, and there are a lot of long-time Mac users inside Apple.</p>\n\n<p>This situation I ran into — seeing a promotion for a three-month Apple Arcade trial despite the fact that I pay for Apple One (which includes Arcade) — is just one of those glitches. Most Apple One subscribers don’t have split accounts, so they never saw the unnecessary promotion. And even amongst those who <em>do</em> have split accounts, they’d have to run into a certain set of circumstances to make it appear.<sup id="fnr2-2023-05-01"><a href="https://daringfireball.net/#fn2-2023-05-01">2</a></sup></p>\n\n<p>So, it was a bug. And I am reliably informed that a fix is in the works that will appear in a near-future update to iOS.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n\n<li id="fn1-2023-05-01">\n<p>No joke, I’ve purchased 744 movies (and counting) from iTunes over the last two decades. Money runs through my fingers like water.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-01" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n\n<li id="fn2-2023-05-01">\n<p>One way that it’s confusing to have multiple Apple IDs is that it’s my iCloud account — my mac.com address — that serves as the primary account for family sharing with my wife and son. But it’s my other account — my daringfireball.net address — that has made all my iTunes and App Store purchases for 23 years. That includes making the purchase to subscribe to Apple One, even though Apple One includes features like additional iCloud storage space that apply to my iCloud account. So even though I have two accounts, one for iCloud and one for purchases, Apple’s back end is somehow capable of making it all work. They are two different accounts, but my iTunes account purchases can be shared through my iCloud account’s family sharing. It sounds confusing, I know. But for the last decade or so, it really has <em>just worked</em> and I haven’t had to think about it often, other than keeping two different passwords in my head.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr2-2023-05-01" title="Jump back to footnote 2 in the text.">&#x21a9;&#xfe0e;︎</a></p>\n</li>\n\n</ol>\n</div>','\n',char(10)),'','2023-05-01 21:27:40','John Gruber','https://daringfireball.net/2023/05/followup_on_apple_services_ad');
-INSERT INTO entries VALUES(99,'t3_13q95kv',6,'Caffè Italia * 24/05/23','text/html','<!-- SC_OFF --><div class="md"><p>Sciam bbuen, cumpà? </p> <blockquote> <p>Patrovaro, Puglia</p> </blockquote> <h2>In Evidenza</h2> <p>⭐ <strong>Hai visto un commento interessante?</strong> Pensi meriti un suo thread? Dillo a OP! Oppure fai report sul suo commento scegliendo l''opzione &quot;Merita un thread dedicato!&quot;</p> <p>❗ Feedback / segnalazioni ai mod: <a href="https://www.reddit.com/message/compose?to=%2Fr%2Fitaly">clicca qui</a> | <strong>Attenzione</strong>: discutere della moderazione nei thread o nel caffè comporta un giorno di sospensione. </p> <p>🇺🇦 Argomento Ucraina: <a href="/r/italy/wiki/regolamento#wiki_.5B12.2.5D_argomenti_con_limitazioni_nel_caff.E8">nel Caffè sono permesse solo le storie personali</a>. Vuoi commentare le notizie o la situazione generale? Fai un post! </p> <h2>Menu del giorno</h2> <ul> <li><a href="/r/italy/comments/13q95kv/caff%C3%A8_italia_240523/jle8h4d/">Post interessanti da altri subreddit italiani</a></li> <li>Oggi è aperto <a href="/r/DimmiOuija">/r/DimmiOuija</a>, dove si possono fare domande e ricevere risposte, una lettera alla volta. Partecipazione aperta a tutti.</li> </ul> <h2>Da ieri</h2> <ul> <li><a href="/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">Di tutto un pod - il thread dei podcast</a></li> <li><a href="/r/italy/comments/13pc0ox/caff%C3%A8_italia_230523/jl9drmm/">Post interessanti da altri subreddit italiani</a></li> </ul> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/RedditItalyBot"> /u/RedditItalyBot </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13q95kv/caffè_italia_240523/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13q95kv/caffè_italia_240523/">[comments]</a></span>','','2023-05-24 03:00:09','/u/RedditItalyBot','https://www.reddit.com/r/italy/comments/13q95kv/caffè_italia_240523/');
-INSERT INTO entries VALUES(100,'t3_13pguah',6,'Di tutto un pod - il thread dei podcast','text/html','<!-- SC_OFF --><div class="md"><p>Sei alla ricerca di un podcast da seguire? Ne hai uno da consigliare a tutti? Oppure vuoi semplicemente parlare del mondo dei podcast?</p> <p>Benvenuto! Sei nel posto giusto.</p> <p>Questo thread periodico ha lo scopo di raccogliere domande, discussioni e consigli sull''argomento podcast. Ogni 23 del mese verrà creato un nuovo thread.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/RedditItalyBot"> /u/RedditItalyBot </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">[comments]</a></span>','','2023-05-23 07:01:21','/u/RedditItalyBot','https://www.reddit.com/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/');
-INSERT INTO entries VALUES(101,'t3_13qcvnf',6,'Rapporto della CGIA di Mestre sull''evasione in Italia regione per regione','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qcvnf/rapporto_della_cgia_di_mestre_sullevasione_in/"> <img alt="Rapporto della CGIA di Mestre sull''evasione in Italia regione per regione" src="https://external-preview.redd.it/YFBm-hdE_urbXMQJE1-ykwbuLjFWihMUdZxx08knNYw.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=03f4bc57e347f5eda308fd815886bea224290a67" title="Rapporto della CGIA di Mestre sull''evasione in Italia regione per regione" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Archetypus"> /u/Archetypus </a> <br /> <span><a href="https://www.corriere.it/economia/tasse/23_maggio_22/tasse-dove-si-evadono-piu-calabria-campania-puglia-guidano-classifica-85f2687a-f880-11ed-8bca-35ac6820436c.shtml">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qcvnf/rapporto_della_cgia_di_mestre_sullevasione_in/">[comments]</a></span> </td></tr></table>','','2023-05-24 05:52:38','/u/Archetypus','https://www.reddit.com/r/italy/comments/13qcvnf/rapporto_della_cgia_di_mestre_sullevasione_in/');
-INSERT INTO entries VALUES(102,'t3_13qhobi',6,'Medici di famiglia sono in via di estinzione, i numeri','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qhobi/medici_di_famiglia_sono_in_via_di_estinzione_i/"> <img alt="Medici di famiglia sono in via di estinzione, i numeri" src="https://external-preview.redd.it/zO6FB59kse2Zu4YQzwL6vfcTEZJ0XEed0AweZvm9vW4.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=30556c032316ce72f62a6c19e3bed6433413f639" title="Medici di famiglia sono in via di estinzione, i numeri" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/mirkul"> /u/mirkul </a> <br /> <span><a href="https://www.fortuneita.com/2023/05/24/medici-di-famiglia-in-via-di-estinzione-i-numeri/?swcfpc=1">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qhobi/medici_di_famiglia_sono_in_via_di_estinzione_i/">[comments]</a></span> </td></tr></table>','','2023-05-24 10:27:21','/u/mirkul','https://www.reddit.com/r/italy/comments/13qhobi/medici_di_famiglia_sono_in_via_di_estinzione_i/');
-INSERT INTO entries VALUES(103,'t3_13qf6kp',6,'Produttività oraria: Italia al palo da 20 anni','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/"> <img alt="Produttività oraria: Italia al palo da 20 anni" src="https://external-preview.redd.it/ON8e-82A8cxCJFRftO8IJhnnRutmzyLUrMO_YKVtFng.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=459647e213539dacc5808498a381bb5c8ebe8c13" title="Produttività oraria: Italia al palo da 20 anni" /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>Come da titolo, confrontando la produttività oraria di alcuni dei Paesi piu sviluppati, emerge chiaramente che quella italiana sia rimasta quasi del tutto ferma durante gli ultimi 20 anni.</p> <p>Paesi come USA, Francia e Germania sono andati di pari passo, mentre Cina e India hanno di fatto quintuplicato la propria produttivitá.</p> <p>Si puó pure notare la stagnazione giapponese, simile a quella italiana.</p> <p>Secondo me l''Italia ha perso il treno delle innovazioni tecnologiche dell''ultimo ventennio. Questo fattore, unito alla tendenza di comprimere i salari non potendo contare sulla svalutazione della moneta, ha causato il livello basso degli stipendi italiani di cui si lamentano tutti.</p> <p>Mi piacerebbe conoscere le vostre opinioni a tal proposito.</p> <p>&#x200b;</p> <p>Fonte: <a href="https://ourworldindata.org/grapher/labor-productivity-per-hour-PennWorldTable?tab=chart&amp;time=1990..latest&amp;country=PRT%7EJPN%7EGBR%7EUSA%7EFRA%7EDEU%7EITA%7EESP%7ECHN%7EIND">https://ourworldindata.org/grapher/labor-productivity-per-hour-PennWorldTable?tab=chart&amp;time=1990..latest&amp;country=PRT~JPN~GBR~USA~FRA~DEU~ITA~ESP~CHN~IND</a></p> <p><a href="https://preview.redd.it/wydojd52gq1b1.png?width=3400&amp;format=png&amp;auto=webp&amp;s=7dab8408223a4042f9144cd7c8436128982e7280">https://preview.redd.it/wydojd52gq1b1.png?width=3400&amp;format=png&amp;auto=webp&amp;s=7dab8408223a4042f9144cd7c8436128982e7280</a></p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/tipotimido83"> /u/tipotimido83 </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/">[comments]</a></span> </td></tr></table>','','2023-05-24 08:01:46','/u/tipotimido83','https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/');
-INSERT INTO entries VALUES(104,'t3_13pqf45',6,'Ho intercettato un satellite meteorologico e ottenuto immagini in tempo reale dell''europa.','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/"> <img alt="Ho intercettato un satellite meteorologico e ottenuto immagini in tempo reale dell''europa." src="https://external-preview.redd.it/1ymsrXD4zEctUK0-fmAvYxTs74uFL9YkO1xM4BkdB08.jpg?width=320&amp;crop=smart&amp;auto=webp&amp;s=60b0b2a429c49be4530e66901fd56cb7c526dee7" title="Ho intercettato un satellite meteorologico e ottenuto immagini in tempo reale dell''europa." /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>Ciao a tutti! </p> <p>Oggi voglio condividere con voi la mia emozionante esperienza nell''intercettare un satellite meteorologico utilizzando un''antenna autocostruita.</p> <p>È stato un progetto affascinante e ho imparato molto lungo il percorso. Vorrei condividere con voi i passaggi che ho seguito e i risultati che ho ottenuto. </p> <p><strong>Cosa ho utilizzato:</strong></p> <p>Prima di tutto ho acquistato su amazon un RTL-SDR v3, non è altro che un dongle USB con chip RTL2832U che riceve i segnali radio e li tramuta in segnale per il software sul pc.</p> <p><a href="https://preview.redd.it/zxg2ri3lal1b1.jpg?width=1079&amp;format=pjpg&amp;auto=webp&amp;s=eac9ed607d2435a7537bcfa1f2c26b30eb9cc599">https://preview.redd.it/zxg2ri3lal1b1.jpg?width=1079&amp;format=pjpg&amp;auto=webp&amp;s=eac9ed607d2435a7537bcfa1f2c26b30eb9cc599</a></p> <p>Ho poi costruito un''antenna chiamata V-DIPOLE: </p> <p>Prende il nome dalla sua forma a &quot;V&quot; rovesciata. È costituita da due bracci di lunghezza uguale collegati a un punto comune al centro.</p> <p>Questa configurazione a &quot;V&quot; permette all''antenna di essere bilanciata e di ricevere segnali da diverse direzioni. L''ampiezza dell''angolo della V può variare a seconda delle esigenze. </p> <p>Ho comprato un mammut a 2 entrate e un cavo coassiale normalissimo, spellato e inserito in un''entrata del mammut il conduttore centrale e in un''altra la schermatura.</p> <p><a href="https://preview.redd.it/afsfkyjfbl1b1.jpg?width=1075&amp;format=pjpg&amp;auto=webp&amp;s=c7ce21fc97fab712af16c09aacc4376ef0b428b3">https://preview.redd.it/afsfkyjfbl1b1.jpg?width=1075&amp;format=pjpg&amp;auto=webp&amp;s=c7ce21fc97fab712af16c09aacc4376ef0b428b3</a></p> <p>Ho acquistato due bacchette di ottone, tagliate esattamente a 53,4 cm (considerate che la misura parte dall''inizio del mammut, non dall''inizio della bacchetta. Piegate le estremità per farle entrare facilmente.</p> <p><a href="https://preview.redd.it/gccobeeobl1b1.jpg?width=1067&amp;format=pjpg&amp;auto=webp&amp;s=8772dcfb3112d3d6763632027e7a147f6c7c2c1e">https://preview.redd.it/gccobeeobl1b1.jpg?width=1067&amp;format=pjpg&amp;auto=webp&amp;s=8772dcfb3112d3d6763632027e7a147f6c7c2c1e</a></p> <p>Dopo averle inserite nel mammut e strette, mi sono assicurato che fossero aperte a un''ampiezza di esattamente 120 gradi, potete usare un goniometro.</p> <p>Dall''altro lato del coassiale ho messo un connettore maschio che poi entra in un''adattatore F-SMA nel dongle usb.</p> <p>Ed ecco l''antenna finita:</p> <p><a href="https://preview.redd.it/jlyv1h21cl1b1.jpg?width=1205&amp;format=pjpg&amp;auto=webp&amp;s=fe43aad18bfa089afb4d0acc4716d389b3a19591">https://preview.redd.it/jlyv1h21cl1b1.jpg?width=1205&amp;format=pjpg&amp;auto=webp&amp;s=fe43aad18bfa089afb4d0acc4716d389b3a19591</a></p> <p>Come vedete è estremamente rudimentale, ma funziona.</p> <p>Dopo aver finito tutto, ho scaricato SDR# che vi permette di esplorare un po'' tutte le frequenze da 40 a 1700 MHZ.</p> <p>Ora arriva il bello:</p> <p>I satelliti che attualmente trasmettono APT (automatic picture transmission) sono 3, NOAA15, NOAA 18 e NOAA19. </p> <p>Queste immagini vengono trasmesse tramite segnali radio ad apposite stazioni di ricezione a terra, dove vengono decodificate e visualizzate come immagini meteorologiche, noi lo intercettiamo e decodifichiamo da soli il segnale.</p> <p>Ho scaricato ORBITRON che mi permette di tracciarli e sapere quando passeranno sull''italia.</p> <p><a href="https://preview.redd.it/yrseodkycl1b1.png?width=3837&amp;format=png&amp;auto=webp&amp;s=785d60d8a59dcc15b5dac00761e411a5dd84a305">https://preview.redd.it/yrseodkycl1b1.png?width=3837&amp;format=png&amp;auto=webp&amp;s=785d60d8a59dcc15b5dac00761e411a5dd84a305</a></p> <p>Salito sul terrazzo, ho orientato l''apertura dell''antenna verso SUD (la v-dipole va orientata così) e ho cercato online la frequenza APT del satellite interessato, in questo caso intorno ai 137MHZ.</p> <p>Ragazzi, appena ho ricevuto il segnale è stata davvero un''emozione incredibile, ho iniziato subito a registrare (sdr# permettere di registrare l''audio per decodificarlo successivamente).</p> <p>Ecco un piccolo video per sentire la &quot;voce&quot; del NOAA:</p> <p><a href="https://imgur.com/a/ntN8WlA">https://imgur.com/a/ntN8WlA</a></p> <p>Una volta fatto ciò, ho ricampionato il file audio in 11025 hz, e inserito su WXTOLIMG (un programma che decodifica audio satellitari).</p> <p>Ecco a voi le immagini, che non sono perfette per via di piccole interferenze (anche colpa mia che non riuscivo a tenere l''antenna ferma).</p> <p><a href="https://preview.redd.it/6fmnizkndl1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=1c070f907e22ba0bba25b465f5f4bc20a76aad8d">CANALE NEAR INFRARED</a></p> <p><a href="https://preview.redd.it/7yo8q91ydl1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=1da987e0f2a481dbc7f8f6f1b7b3374a4bb85f79">CANALE FULL IR </a></p> <p><a href="https://preview.redd.it/x0jpsz70el1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=b183e8e5ecf1138a9b243d27b1b6f31578aa7883">CANALE FULL IR CON SENSORE PRECIPITAZIONI</a></p> <p><a href="https://preview.redd.it/xebpi3x1el1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=4a85f332602837820d4167effeaf41b797ad63e8">Canale NEAR IR senza confini che secondo me è più carino</a></p> <p>Voi direte, ma si trovano le stesse immagini (con risoluzione anche maggiore) online!!! </p> <p>E io vi rispondo che non c''è soddisfazione più grande di aver intercettato io stesso il segnale e decodificato :) </p> <p>L''ultima cosa che voglio dire è che questo è un mondo veramente pieno zeppo di roba da imparare, ed io fino ad ora so credo meno dell''1%, ci sono tanti altri tipi di antenne, addirittura paraboliche con cui captare segnali ad alta risoluzione, con immagini che sono assurde.</p> <p>Grazie per l''attenzione!!!</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Marcoc0202"> /u/Marcoc0202 </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/">[comments]</a></span> </td></tr></table>','','2023-05-23 14:38:04','/u/Marcoc0202','https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/');
-INSERT INTO entries VALUES(105,'t3_13q9q7r',6,'Netflix, arriva la stretta anche in Italia. Un abbonamento per solo nucleo domestico','text/html','<!-- SC_OFF --><div class="md"><p>Alla fine, il provvedimento di netflix contro il password sharing, è arrivato anche in Italia. Cosa ne pensate? Avete ricevuto già l’email nel caso condividiate l’account?</p> <p>Personalmente è da qualche mese che non guardo nulla su netflix, ma continuo a pagare l’account perchè lo usano anche i miei genitori. Probabilmente questa sarà l’occasione buona per fare pulizia.</p> <p><a href="https://www.ilsole24ore.com/art/netflix-abbonamento-e-solo-nucleo-domestico-non-si-puo-condividere-di-fuori-AEh4qBXD">https://www.ilsole24ore.com/art/netflix-abbonamento-e-solo-nucleo-domestico-non-si-puo-condividere-di-fuori-AEh4qBXD</a></p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/ksnll"> /u/ksnll </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13q9q7r/netflix_arriva_la_stretta_anche_in_italia_un/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13q9q7r/netflix_arriva_la_stretta_anche_in_italia_un/">[comments]</a></span>','','2023-05-24 03:27:07','/u/ksnll','https://www.reddit.com/r/italy/comments/13q9q7r/netflix_arriva_la_stretta_anche_in_italia_un/');
-INSERT INTO entries VALUES(106,'t3_13qk0cl',6,'Che ne è stato del Qatargate','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qk0cl/che_ne_è_stato_del_qatargate/"> <img alt="Che ne è stato del Qatargate" src="https://external-preview.redd.it/x8PPFhzdisUEtMY4Gce5gP4NU-C8bhWMPm5KDjYkM9I.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=e91ce15a2453dcdf0f86f8aacadb3603dca80c8e" title="Che ne è stato del Qatargate" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/notizia"> /u/notizia </a> <br /> <span><a href="https://www.ilpost.it/2023/05/24/qatargate-conseguenze/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qk0cl/che_ne_è_stato_del_qatargate/">[comments]</a></span> </td></tr></table>','','2023-05-24 12:19:55','/u/notizia','https://www.reddit.com/r/italy/comments/13qk0cl/che_ne_è_stato_del_qatargate/');
-INSERT INTO entries VALUES(107,'t3_13phgo0',6,'Mion: "Nel 2010 seppi che il Morandi era a rischio crollo". Il comitato vittime: "Come ha fatto a stare zitto?"','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13phgo0/mion_nel_2010_seppi_che_il_morandi_era_a_rischio/"> <img alt="Mion: &quot;Nel 2010 seppi che il Morandi era a rischio crollo&quot;. Il comitato vittime: &quot;Come ha fatto a stare zitto?&quot;" src="https://external-preview.redd.it/rBQCFrZ_OqX-fAUyJCtC5Nl0tPG0mG_-L3wnT5h_nCM.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=3464c899510a6fea0093dc3c9037b03808506d29" title="Mion: &quot;Nel 2010 seppi che il Morandi era a rischio crollo&quot;. Il comitato vittime: &quot;Come ha fatto a stare zitto?&quot;" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/w0b"> /u/w0b </a> <br /> <span><a href="https://www.ansa.it/liguria/notizie/2023/05/22/nel-2010-seppi-che-il-morandi-era-a-rischio-crollo_69512a95-37a6-476c-a775-ebfd6eadfa2f.html">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13phgo0/mion_nel_2010_seppi_che_il_morandi_era_a_rischio/">[comments]</a></span> </td></tr></table>','','2023-05-23 07:34:57','/u/w0b','https://www.reddit.com/r/italy/comments/13phgo0/mion_nel_2010_seppi_che_il_morandi_era_a_rischio/');
-INSERT INTO entries VALUES(108,'t3_13pr8pr',6,'Cosa pensi un straniero deve sapere sul la tua regione','text/html','<!-- SC_OFF --><div class="md"><p>Salve a tutti,</p> <p>Vivo a Italia da poco e ancora so poco sull''Italia, a parte quello piu conosciuto e delle città piu grande.</p> <p>Quindi, cosa pensi che ogni straniero dovrebbe sapere della tua regione? Potrebbe essere un pezzo di storia, un cibo da mangiare, un cantante da ascoltare, un libro, un film, una leggenda, ecc.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/alleryannah_karwenny"> /u/alleryannah_karwenny </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pr8pr/cosa_pensi_un_straniero_deve_sapere_sul_la_tua/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pr8pr/cosa_pensi_un_straniero_deve_sapere_sul_la_tua/">[comments]</a></span>','','2023-05-23 15:09:10','/u/alleryannah_karwenny','https://www.reddit.com/r/italy/comments/13pr8pr/cosa_pensi_un_straniero_deve_sapere_sul_la_tua/');
-INSERT INTO entries VALUES(109,'t3_13pmh1h',6,'Milano. Il volume della musica nei locali pubblici in cui si mangia (tre note catene milanesi).','text/html','&#32; submitted by &#32; <a href="https://www.reddit.com/user/culturedperv"> /u/culturedperv </a> <br /> <span><a href="/r/milano/comments/13pi6b0/milano_il_volume_della_musica_nei_locali_pubblici/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pmh1h/milano_il_volume_della_musica_nei_locali_pubblici/">[comments]</a></span>','','2023-05-23 12:01:08','/u/culturedperv','https://www.reddit.com/r/italy/comments/13pmh1h/milano_il_volume_della_musica_nei_locali_pubblici/');
-INSERT INTO entries VALUES(110,'t3_13phjsf',6,'Ho studiato lingue in Italia, linguistica in UK e ora ho un contratto a tempo indeterminato da ricercatore in Germania. AMA','text/html','<!-- SC_OFF --><div class="md"><p>Ciao <a href="/r/Italy">r/Italy</a>, </p> <p>Come da titolo, ho avuto — penso — un percorso di studi e lavorativo non comune e ho avuto la fortuna e la possibilità di studiare e lavorare in università in più paesi. Vi faccio un resoconto del mio percorso qui sotto e sono felice di rispondere a domande su tutti gli aspetti del caso: studiare, vivere e dottorato in UK, linguistica e tutti gli aspetti che la compongono, statistica / metodi quantitativi per la ricerca linguistica, Germania, cibo (ovviamente), etc. </p> <p>Mod, fatemi sapere se sia necessario provvedere prove sulla mia identità! </p> <p>Incominciamo: </p> <p>- Triennale in Lingue e Letterature Straniere all’Università degli Studi di Milano (ENG/PT). Fino a qui nulla di che, sono sempre stato interessato agli aspetti più analitici della lingua e del linguaggio. ho bei ricordi a livello umano del mio periodo qui ma a livello “accademico” non ho portato via molto. Adoro il Portoghese come lingua e la lettrice era fantastica :)</p> <p>- MA in Linguistica a Manchester, MSc in Forensic Speech Science a York. Qui mi sono specializzato in fonetica, linguistica sperimentale e metodi quantitativi per l’analisi dei dati (ho imparato a programmare in R, Python)</p> <p>- PhD (Dottorato) in Linguistica a Manchester. Tesi metodologica su alcuni aspetti dell’uso di elettro encefalogramma per lo studio del linguaggio (ovviamente molto generalizzato, entro nei dettagli per gli interessati). Qui ho imparato a programmare anche in Matlab. </p> <p>- Dal 2021 ho un contratto permanente come “Academic Staff”. In particolare, il ruolo è un mix tra “lecturer” (ma con molte meno ore, solo 4 settimanali), “data scientist” e “lab manager”. La paga è da post-doc. Lavoro in un’università della Germania del sud, in un dipartimento di Linguistica. Sono molto contento della mia posizione e delle mansioni, non ho mai avuto particolare interesse ad intraprendere la (precaria) via per diventare Prof. Tra le mie mansioni, in ordine di importanza: </p> <ul> <li><p>Insegnare corsi universitari su “quantitative methods”, “experimental methods”, etc. a studenti del dipartimento di linguistica. </p></li> <li><p>partecipare in gruppi di ricerca esistenti nel ruolo di data scientist. in poche parole, passo gran parte della mia giornata ad analizzare dati sperimentali in R, creare grafici e a scrivere piccoli report per i principal investigator (PI) dei vari progetti. Per gli interessati, divento poi co-autore di tutti i progetti su cui lavoro. </p></li> <li><p>ricerca. Quando non sto facendo altro, sono invitato anche a lavorare sulla mia ricerca. Nella mia posizione questo però non è requisito, è più considerato un bonus per me</p></li> <li><p>upgrade di hardware nei laboratori, training di staff e studenti sull’uso di un sacco di hardware diversi tra cui molti eye-tracker, pupillometry, elettro encefalogramma, tongue ultrasound, electro glottography, media device, etc. </p></li> <li><p>varie e altre: supervisione tesi, consultazioni con studenti, meeting vari.. </p></li> </ul> <p>AMA!</p> <p>Edit: formatting</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/thrndbck"> /u/thrndbck </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13phjsf/ho_studiato_lingue_in_italia_linguistica_in_uk_e/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13phjsf/ho_studiato_lingue_in_italia_linguistica_in_uk_e/">[comments]</a></span>','','2023-05-23 07:40:07','/u/thrndbck','https://www.reddit.com/r/italy/comments/13phjsf/ho_studiato_lingue_in_italia_linguistica_in_uk_e/');
-INSERT INTO entries VALUES(111,'t3_13pok5m',6,'Azione-Iv, la tregua «Lista unica alle europee»','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13pok5m/azioneiv_la_tregua_lista_unica_alle_europee/"> <img alt="Azione-Iv, la tregua «Lista unica alle europee»" src="https://external-preview.redd.it/n6auEs_fy9NRgoNiYJLDLqi3WUMDG_zeMZYYXNbpLAk.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=a79a95b6ccf23d1d654a6cf3eb978ac9d13e510c" title="Azione-Iv, la tregua «Lista unica alle europee»" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/VirtualBit-"> /u/VirtualBit- </a> <br /> <span><a href="https://www.ilsole24ore.com/art/azione-iv-tregua-fragile-lista-unica-europee-AEglvjWD">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pok5m/azioneiv_la_tregua_lista_unica_alle_europee/">[comments]</a></span> </td></tr></table>','','2023-05-23 13:28:28','/u/VirtualBit-','https://www.reddit.com/r/italy/comments/13pok5m/azioneiv_la_tregua_lista_unica_alle_europee/');
-INSERT INTO entries VALUES(112,'t3_13p1pk5',6,'Maltempo Emilia-Romagna, in Italia manca un''app di allerta per i cittadini. A febbraio prorogata (ancora) la sperimentazione','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13p1pk5/maltempo_emiliaromagna_in_italia_manca_unapp_di/"> <img alt="Maltempo Emilia-Romagna, in Italia manca un''app di allerta per i cittadini. A febbraio prorogata (ancora) la sperimentazione" src="https://external-preview.redd.it/soJ2tkML5_0nNpPRR8tVkRaGOrWdyHm_4hXndo8_M9c.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=523e9bb4c01d914970da49e976afe85b41345204" title="Maltempo Emilia-Romagna, in Italia manca un''app di allerta per i cittadini. A febbraio prorogata (ancora) la sperimentazione" /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>L’Italia non riesce ancora dotarsi di un sistema di allerta pubblica basata su cell-broadcast nonostante anni di “sperimentazione”. Secondo voi avrebbe potuto cambiare il destino delle 14 vittime in Emilia Romagna? Per chi abita all’estero vi è mai capitato di ricevere un messaggio di allerta pubblica? Come vi siete comportati? È stato utile?</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Future_Reality4833"> /u/Future_Reality4833 </a> <br /> <span><a href="https://www.open.online/2023/05/17/maltempo-emilia-romagna-it-alert-app-protezione-civile/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13p1pk5/maltempo_emiliaromagna_in_italia_manca_unapp_di/">[comments]</a></span> </td></tr></table>','','2023-05-22 20:09:37','/u/Future_Reality4833','https://www.reddit.com/r/italy/comments/13p1pk5/maltempo_emiliaromagna_in_italia_manca_unapp_di/');
-INSERT INTO entries VALUES(113,'t3_13oniq9',6,'Facebook ha ricevuto una multa di 1.3 miliardi per violazione del GDPR','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13oniq9/facebook_ha_ricevuto_una_multa_di_13_miliardi_per/"> <img alt="Facebook ha ricevuto una multa di 1.3 miliardi per violazione del GDPR" src="https://external-preview.redd.it/IFoVIMuLZiu62Yr_TJ2qCHsq6yFNoz0P64NJPOYJhLc.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=425766a278df120de8b9ca8dd28c71b2b367c6ef" title="Facebook ha ricevuto una multa di 1.3 miliardi per violazione del GDPR" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/DurangoGango"> /u/DurangoGango </a> <br /> <span><a href="https://www.businessinsider.com/meta-fined-record-13-billion-for-data-privacy-breaches-2023-5?op=1&amp;r=US&amp;IR=T">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13oniq9/facebook_ha_ricevuto_una_multa_di_13_miliardi_per/">[comments]</a></span> </td></tr></table>','','2023-05-22 10:53:49','/u/DurangoGango','https://www.reddit.com/r/italy/comments/13oniq9/facebook_ha_ricevuto_una_multa_di_13_miliardi_per/');
-INSERT INTO entries VALUES(114,'t3_13os5m4',6,'Estero, Irlanda: l''etichetta sanitaria su vino e alcol è legge','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13os5m4/estero_irlanda_letichetta_sanitaria_su_vino_e/"> <img alt="Estero, Irlanda: l''etichetta sanitaria su vino e alcol è legge" src="https://external-preview.redd.it/kZd1COIG1wJ0wB5OCv6MYmSBuzBsGc8eYxCud5Jm_Jo.jpg?width=320&amp;crop=smart&amp;auto=webp&amp;s=1ce48821ad298a5b07b6186fcc4c452237a0dd38" title="Estero, Irlanda: l''etichetta sanitaria su vino e alcol è legge" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/VirtualBit-"> /u/VirtualBit- </a> <br /> <span><a href="https://tg24.sky.it/mondo/2023/05/22/irlanda-etichetta-vino-alcol">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13os5m4/estero_irlanda_letichetta_sanitaria_su_vino_e/">[comments]</a></span> </td></tr></table>','','2023-05-22 14:15:49','/u/VirtualBit-','https://www.reddit.com/r/italy/comments/13os5m4/estero_irlanda_letichetta_sanitaria_su_vino_e/');
-INSERT INTO entries VALUES(115,'t3_13omvae',6,'È molto probabile che supereremo il limite di 1,5 °C entro il 2027','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13omvae/è_molto_probabile_che_supereremo_il_limite_di_15/"> <img alt="È molto probabile che supereremo il limite di 1,5 °C entro il 2027" src="https://external-preview.redd.it/K4lHw4T3jqkIrLHDWmydah421PRbdJrBOHF3EZqV-q4.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=bacaf40e495a6ead139739252866366aa2107404" title="È molto probabile che supereremo il limite di 1,5 °C entro il 2027" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/DurangoGango"> /u/DurangoGango </a> <br /> <span><a href="https://www.ilpost.it/2023/05/17/1-5-limite-riscaldamento-globale-2027/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13omvae/è_molto_probabile_che_supereremo_il_limite_di_15/">[comments]</a></span> </td></tr></table>','','2023-05-22 10:19:41','/u/DurangoGango','https://www.reddit.com/r/italy/comments/13omvae/è_molto_probabile_che_supereremo_il_limite_di_15/');
-INSERT INTO entries VALUES(116,'t3_13orc5p',6,'Le Mafie nell''era digitale. Il Procuratore Gratteri ribadisce: "Dobbiamo assumere più ingegneri informatici per i Servizi segreti"','text/html','<!-- SC_OFF --><div class="md"><p>Per chi se lo fosse perso, il 9 Maggio si è discusso a Montecitorio il <a href="https://fondazionemagnagrecia.it/wp-content/uploads/2023/03/Le-mafie-nellera-digitale_Abstract.pdf">report</a> delle Mafie nell''era digitale, promosso dalla Fondazione Magna Grecia.</p> <p><a href="https://youtu.be/T_Y8Ks3JAVc">https://youtu.be/T_Y8Ks3JAVc</a></p> <p>Il procuratore Nicola Gratteri ha partecipato alla presentazione del primo rapporto sulle mafie nell''era digitale, evidenziando come queste organizzazioni abbiano adattato le proprie strategie alla tecnologia moderna. Gratteri afferma che hanno costruito nuovi sistemi di comunicazione sopra le nostre teste, utilizzando hacker che vengono pagati per garantire la sicurezza delle loro comunicazioni. Al contrario, l''Italia non è stata in grado di infiltrare o intercettare tali sistemi come hanno fatto altri paesi come il Costa Rica, la Francia, l''Olanda e la Germania. Il Procuratore sostiene ulteriormente che l''Italia dovrebbe investire in tecnologie, ricerca e assumere ingegneri informatici e hacker per colmare questa lacuna.</p> <p>Queste organizzazioni hanno adattato le proprie attività ai cambiamenti della società e hanno iniziato a utilizzare i social media, in particolare TikTok, per promuovere il proprio potere, l''immagine e reclutare nuovi membri. Utilizzando queste piattaforme, trasmettono uno stile di vita basato su lusso, soldi, potere e influenze.</p> <p>La delinquenza organizzata sta creando una nuova narrazione di sé stessa sui social media, che non richiede più il cinema come intermediario. Utilizzando emoji, hashtag virali e musica trap, comunicano in modo criptico ma efficace. La narrazione è basata su denaro contante, lusso, feste, minacce ai rivali, armi e simboli che indicano appartenenza al clan.</p> <p>Le organizzazioni italiane hanno imparato molte tattiche dai cartelli messicani del narcotraffico, che utilizzano da tempo YouTube per sfidare lo Stato mostrando la propria forza militare. Tuttavia, differiscono dai cartelli sudamericani, perché quest''ultimi hanno una strategia comunicativa più consolidata, mentre le organizzazioni italiane sfruttano i social media in modo più individuale.</p> <p>In conclusione, tutte le organizzazioni criminali, comprese le mafie italiane, reclutano hacker e utilizzano i social media come strumenti di comunicazione e reclutamento.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/AlessandroIT"> /u/AlessandroIT </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13orc5p/le_mafie_nellera_digitale_il_procuratore_gratteri/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13orc5p/le_mafie_nellera_digitale_il_procuratore_gratteri/">[comments]</a></span>','','2023-05-22 13:44:06','/u/AlessandroIT','https://www.reddit.com/r/italy/comments/13orc5p/le_mafie_nellera_digitale_il_procuratore_gratteri/');
-INSERT INTO entries VALUES(117,'t3_13pc0ox',6,'Caffè Italia * 23/05/23','text/html','<!-- SC_OFF --><div class="md"><p>We compà! gna'' và? </p> <blockquote> <p>Pescara, Abruzzo</p> </blockquote> <h2>In Evidenza</h2> <p>⭐ <strong>Hai visto un commento interessante?</strong> Pensi meriti un suo thread? Dillo a OP! Oppure fai report sul suo commento scegliendo l''opzione &quot;Merita un thread dedicato!&quot;</p> <p>❗ Feedback / segnalazioni ai mod: <a href="https://www.reddit.com/message/compose?to=%2Fr%2Fitaly">clicca qui</a> | <strong>Attenzione</strong>: discutere della moderazione nei thread o nel caffè comporta un giorno di sospensione. </p> <p>🇺🇦 Argomento Ucraina: <a href="/r/italy/wiki/regolamento#wiki_.5B12.2.5D_argomenti_con_limitazioni_nel_caff.E8">nel Caffè sono permesse solo le storie personali</a>. Vuoi commentare le notizie o la situazione generale? Fai un post! </p> <h2>Menu del giorno</h2> <ul> <li><a href="/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">Di tutto un pod - il thread dei podcast</a></li> <li><a href="/r/italy/comments/13pc0ox/caff%C3%A8_italia_230523/jl9drmm/">Post interessanti da altri subreddit italiani</a></li> </ul> <h2>Da ieri</h2> <ul> <li><a href="/r/italy/comments/13oj83p/la_grande_fiera_dei_sub_italiani/">La grande fiera dei sub italiani</a></li> <li><a href="/r/italy/comments/13oeijv/caff%C3%A8_italia_220523/jl4kf1c/">Post interessanti da altri subreddit italiani</a></li> </ul> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/RedditItalyBot"> /u/RedditItalyBot </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pc0ox/caffè_italia_230523/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pc0ox/caffè_italia_230523/">[comments]</a></span>','','2023-05-23 03:00:04','/u/RedditItalyBot','https://www.reddit.com/r/italy/comments/13pc0ox/caffè_italia_230523/');
-INSERT INTO entries VALUES(118,'t3_13oqa4m',6,'ANPR, ecco il codice identificativo univoco (ID ANPR): cos''è e a cosa servirà','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13oqa4m/anpr_ecco_il_codice_identificativo_univoco_id/"> <img alt="ANPR, ecco il codice identificativo univoco (ID ANPR): cos''è e a cosa servirà" src="https://external-preview.redd.it/91fY-k30oM6GailbBF1z1Tt5eT9bpoFOBUzuDBeAvXs.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=16804d7bc3f657078a51a1e8861ba3fdf8f1d4c3" title="ANPR, ecco il codice identificativo univoco (ID ANPR): cos''è e a cosa servirà" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/lorem"> /u/lorem </a> <br /> <span><a href="https://www.agendadigitale.eu/cittadinanza-digitale/anagrafe-unica/anpr-in-arrivo-il-codice-identificativo-univoco-id-anpr-cose-e-a-cosa-servira/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13oqa4m/anpr_ecco_il_codice_identificativo_univoco_id/">[comments]</a></span> </td></tr></table>','','2023-05-22 13:01:08','/u/lorem','https://www.reddit.com/r/italy/comments/13oqa4m/anpr_ecco_il_codice_identificativo_univoco_id/');
-INSERT INTO entries VALUES(119,'t3_13ojwzk',6,'Numeri Casuali: Quando pure il caos della casualità si perde nella burocrazia (WoT)','text/html','<!-- SC_OFF --><div class="md"><p><strong>Premessa</strong></p> <p>Mentre stavo cercando informazioni su una pratica edile (per chi segue le peripezie, no ancora non sono riuscito a comprare casa) mi sono imbattuto in riferimenti e in un link a un &quot;generatore di numeri casuali&quot; governativo. Colpito dal flashback del progetto di programmazione sui cui lavorai (secoli fa) con amici (e amica speciale) ho deciso di darci un''occhiata,very bad.</p> <p><strong>Il generatore - Chi lo usa</strong></p> <p>Il software in oggetto è il <a href="https://wwwservizi.regione.emilia-romagna.it/generatore/Default.aspx">Generatore di numeri casuali dell''Emilia-Romagna</a> con una descrizione algoritmica <a href="https://wwwservizi.regione.emilia-romagna.it/generatore/Note.aspx">qui</a> Il generatore è usato da una grande quantità di enti (non solo dell''Emilia-Romagna) ogni qual volta è necessario fare un sorteggio: dall''ispezione delle pratiche sismiche, a concorsi, a bandi di appalto etc. Con una ricerca su google:</p> <pre><code>link:https://wwwservizi.regione.emilia-romagna.it/generatore/Default.aspx </code></pre> <p>potete farvi un''idea (tra l''altro un''idea dei solo documenti pubblici, pubblicati online e che hanno copiato il link direttamente nel documento).</p> <p><strong>Il generatore - Come funziona</strong></p> <p>Leggendo i dettagli già la prima frase indica un nozionismo che era già veccchio quando entrai all''università:</p> <blockquote> <p>Si premette subito che un computer, in quanto macchina assolutamente priva di arbitrio (ovvero deterministica), non è in grado di generare dei numeri casuali nel senso letterale del termine.</p> </blockquote> <p>La riflessione filosofica accidentale per cui avere &quot;arbitrio&quot; sia necessario per generare numeri casuali è interessante (lo sapevo che il D20 aveva libero arbitrio!) specialmente per il fatto che chi ha scritto questa descrizione ha già confusione tra &quot;arbitrio&quot; e &quot;determinismo&quot;.</p> <p>Ma passiamo ai dettagli:</p> <blockquote> <p>L''algoritmo utilizzato in questo sito è noto in letteratura e la sua &quot;bontà&quot;, nel senso che genera una sequenza con le stesse proprietà statistiche di una sequenza casuale, è stata dimostrata, con i test statistici del caso. Si tratta di un generatore di Lehmer, ovverosia un generatore congruenziale moltiplicativo. Di particolare importanza per la bontà della sequenza è la scelta dei valori di a, c e m. Nel caso di questo sito i valori scelti sono stati tratti dalla letteratura e sono: m=2147483647 (2<sup>31-1),</sup> a=1103515245 e c=0 Allora già qui il discorso è chiuso, nel senso che l''algoritmo è considerato &quot;debole&quot;.</p> </blockquote> <p>Ma qui siamo ben oltre le considerazioni dimensionali o statistiche dell''algoritmo (pessime in raffronto con altre implementazioni): al di là della fragilità dell''algoritmo il problema è che viene lasciato all''utilizzatore la scelta del &quot;seed&quot;. dato il seed è possibile prevedere i numeri. Ora lasciare all''utilizzatore (dotato di arbitrio) la scelta del seme porta a situazioni così:</p> <p><a href="https://bandigare.comune.cento.fe.it/PortaleAppalti/do/FrontEnd/DocDig/downloadDocumentoPubblico.action;jsessionid=7C1D71FE3D903B8CC99F36EBD11901F2?id=1043&amp;idprg=&amp;_csrf=F3P8STAN9JLK9URGWLLJI2DE73H7AT5K">Comune di cento: Data del sorteggio</a></p> <p><a href="https://www.comune.santavenerina.ct.it/wp-content/uploads/2022/05/Sorteggio-componenti-commissione-giudicatrice.pdf">Comune di santavenerina: Seme &quot;scelto&quot; dal dipendente</a></p> <p>Apprezzabile e concettualmente difendibile: <a href="https://sua.cittametropolitana.genova.it/sites/default/files/Allegati/ID.4514.G.08.00_verbale%20seduta%20sorteggio%20operatori%20da%20inv%20per%20SUA.pdf">Comune di genova: Estrazioni del lotto</a></p> <p>Altri li potete trovare online trattandosi di che per loro stessa natura dovrebbero essere pubblicati.</p> <p><strong>Riassumendo</strong> </p> <p>Chi sceglie il seed decide l''esito del sorteggio: pensate a un funzionario che sceglie la data del sorteggio di una gara: saprà già chi viene estratto.</p> <p>Pensate a chi deve presentare una pratica che potrebbe essere sottoposta a ispezione &quot;a sorteggio&quot;, ma sa che l''estrazione viene fatta con il seed YYYYMMDD per cui certi numeri non saranno generati (esempio &quot;1&quot;) e quindi si presenta alle 4 del mattino per essere il primo del mese a presentare la pratica.</p> <p>Tra l''altro il seme deve avere certe caratteristiche quando impiegato con quel tipo di algoritmi deboli, pena proprietà indesiderabili... E no scegliere &quot;6&quot; come seme perchè si devono fare &quot;6&quot; estrazioni non è un buon criterio.</p> <p>** Basta scritto troppo. **</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/_moria_"> /u/_moria_ </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13ojwzk/numeri_casuali_quando_pure_il_caos_della/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13ojwzk/numeri_casuali_quando_pure_il_caos_della/">[comments]</a></span>','','2023-05-22 07:37:42','/u/_moria_','https://www.reddit.com/r/italy/comments/13ojwzk/numeri_casuali_quando_pure_il_caos_della/');
-INSERT INTO entries VALUES(120,'t3_13okblu',6,'GialappaShow: pensieri e opinioni','text/html','<!-- SC_OFF --><div class="md"><p>Ieri sera c''è stata la prima puntata di GialappaShow sulla 8.</p> <p>Avevo aspettative piuttosto alte che sono state parzialmente disattese, Foresti sempre molto bravo, ma le nuove/vecchie gag un po'' sotto le aspettative.</p> <p>Il punto è che, secondo me, quello che veramente rendeva superlativi i programmi dei gialappi erano i personaggi che ci gravitavano intorno: Teocoli, Aldo Giovanni e Giacomo, Fabio De Luigi per dirne alcuni, poi il commento agli episodi calcistici era godibile anche da chi , come me, non segue molto il calcio.Senza tutto questo ne risulta un programma molto &quot;diluito&quot;, che vive un po'' più della sua eredità che di quello che ha effettivamente da offrire adesso.</p> <p>Per chi li ha seguiti negli anni 90 e nei 2000 sicuramente sono un gradito ritorno, ma per eventuali nuovi telespettatori che finora avevano solo visto degli estratti dei loro programmi su yt direi che di carne al fuoco non c''è poi così tanta.</p> <p>Cosa ne pensate?</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Manzanarre"> /u/Manzanarre </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13okblu/gialappashow_pensieri_e_opinioni/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13okblu/gialappashow_pensieri_e_opinioni/">[comments]</a></span>','','2023-05-22 07:59:57','/u/Manzanarre','https://www.reddit.com/r/italy/comments/13okblu/gialappashow_pensieri_e_opinioni/');
-INSERT INTO entries VALUES(121,'t3_13opb8o',6,'La Via della Seta dell''Italia sul viale del tramonto','text/html','&#32; submitted by &#32; <a href="https://www.reddit.com/user/Berix__"> /u/Berix__ </a> <br /> <span><a href="https://www.huffingtonpost.it/blog/2023/05/22/news/la_via_della_seta_italiana_al_tramonto-12183761/amp/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13opb8o/la_via_della_seta_dellitalia_sul_viale_del/">[comments]</a></span>','','2023-05-22 12:19:20','/u/Berix__','https://www.reddit.com/r/italy/comments/13opb8o/la_via_della_seta_dellitalia_sul_viale_del/');
-INSERT INTO entries VALUES(122,'t3_13oqie3',6,'La Cina si è arrabbiata con i paesi del G7 - Il Post','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13oqie3/la_cina_si_è_arrabbiata_con_i_paesi_del_g7_il_post/"> <img alt="La Cina si è arrabbiata con i paesi del G7 - Il Post" src="https://external-preview.redd.it/arFuTiiA2t4ji1yVkdTHZX06K3NTxian7nTObf0Qw00.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=cd11d7637fa841947344b182608b8596e551eb11" title="La Cina si è arrabbiata con i paesi del G7 - Il Post" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/notizia"> /u/notizia </a> <br /> <span><a href="https://www.ilpost.it/2023/05/22/cina-g7/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13oqie3/la_cina_si_è_arrabbiata_con_i_paesi_del_g7_il_post/">[comments]</a></span> </td></tr></table>','','2023-05-22 13:10:19','/u/notizia','https://www.reddit.com/r/italy/comments/13oqie3/la_cina_si_è_arrabbiata_con_i_paesi_del_g7_il_post/');
-INSERT INTO entries VALUES(123,'t3_13ov79k',6,'Chitarra "da spiaggia": quali canzoni italiane dovrei imparare?','text/html','<!-- SC_OFF --><div class="md"><p>Ciao a tutti, Suono la chitarra da qualche mese e sto finalmente iniziando a imparare le mie canzoni preferite. Uno dei punti deboli del mio repertorio, però, è la musica italiana: ammetto la mia totale ignoranza in quest''ambito, specialmente per quanto riguarda le classiche canzoni &quot;da spiaggia&quot; che ci si aspetta che chiunque con una chitarra in mano sappia suonare - come dire, l''equivalente italiano di Wonderwall.</p> <p>Se avete voglia di darmi una mano a costruire il mio repertorio italiano, accetto suggerimenti:)</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/KarabTorje"> /u/KarabTorje </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13ov79k/chitarra_da_spiaggia_quali_canzoni_italiane/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13ov79k/chitarra_da_spiaggia_quali_canzoni_italiane/">[comments]</a></span>','','2023-05-22 16:10:51','/u/KarabTorje','https://www.reddit.com/r/italy/comments/13ov79k/chitarra_da_spiaggia_quali_canzoni_italiane/');
-INSERT INTO entries VALUES(124,'t3_13nzyki',6,'Ecco quanto guadagna un cassiere / scaffalista al supermercato in Olanda. Si comincia a 13 anni dopo scuola, è troppo presto secondo voi?','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13nzyki/ecco_quanto_guadagna_un_cassiere_scaffalista_al/"> <img alt="Ecco quanto guadagna un cassiere / scaffalista al supermercato in Olanda. Si comincia a 13 anni dopo scuola, è troppo presto secondo voi?" src="https://preview.redd.it/2il6rbz4a91b1.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=ac88ee17d14d53fca94b273c062ba4e2d009cd54" title="Ecco quanto guadagna un cassiere / scaffalista al supermercato in Olanda. Si comincia a 13 anni dopo scuola, è troppo presto secondo voi?" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Alex_Cheese94"> /u/Alex_Cheese94 </a> <br /> <span><a href="https://i.redd.it/2il6rbz4a91b1.jpg">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13nzyki/ecco_quanto_guadagna_un_cassiere_scaffalista_al/">[comments]</a></span> </td></tr></table>','','2023-05-21 16:52:04','/u/Alex_Cheese94','https://www.reddit.com/r/italy/comments/13nzyki/ecco_quanto_guadagna_un_cassiere_scaffalista_al/');
-INSERT INTO entries VALUES(125,'t3_13npvsk',6,'Macron: riflessioni sulla de-industrializzazione francese e sulla sovranità industriale europea','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13npvsk/macron_riflessioni_sulla_deindustrializzazione/"> <img alt="Macron: riflessioni sulla de-industrializzazione francese e sulla sovranità industriale europea" src="https://external-preview.redd.it/nsbluRGmxPLBn2v3Ri_MIpGb3BswBfLdMXaHjSqv8Js.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=8a44efe594be889e5374d7a701213cb14a61d473" title="Macron: riflessioni sulla de-industrializzazione francese e sulla sovranità industriale europea" /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>Davanti ad una assemblea gremita di industriali, Macron ha detto da che la Francia si è deindustrializzata più di altri paesi europei: “C’è stata una scelta quasi ideologica per dire all’industria che questi non sono buoni lavori. Meglio essere un Paese di servizi e di turismo. Dalla fine del 2000 fino all’estate del 2017, abbiamo perso quasi un milione di posti di lavoro nell’industria. Ciò che abbiamo scoperto a nostre spese è che questo trascina l’intera economia verso il basso, perché quando l’industria se ne va, se ne vanno i servizi annessi e se ne vanno le amministrazioni che restano a tenere un territorio”.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Archetypus"> /u/Archetypus </a> <br /> <span><a href="https://www.startmag.it/energia/macron-industrializzazione-green-francia/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13npvsk/macron_riflessioni_sulla_deindustrializzazione/">[comments]</a></span> </td></tr></table>','','2023-05-21 10:52:55','/u/Archetypus','https://www.reddit.com/r/italy/comments/13npvsk/macron_riflessioni_sulla_deindustrializzazione/');
 CREATE TABLE IF NOT EXISTS "groups" ("id" INTEGER NOT NULL PRIMARY KEY, "title" VARCHAR(255) NOT NULL, "color" VARCHAR(255) NOT NULL);
 INSERT INTO groups VALUES(1,'Default','#FFFFFF');
 INSERT INTO groups VALUES(2,'Reserved 2','#FFFFFF');
@@ -157,10 +24,291 @@ INSERT INTO subscriptions VALUES(3,1,12,3);
 INSERT INTO subscriptions VALUES(4,1,12,4);
 INSERT INTO subscriptions VALUES(5,1,12,5);
 INSERT INTO subscriptions VALUES(6,1,1,6);
-CREATE UNIQUE INDEX "feed_self_link" ON "feeds" ("self_link");
-CREATE INDEX "feed_last_checked_on" ON "feeds" ("last_checked_on");
-CREATE UNIQUE INDEX "entry_guid" ON "entries" ("guid");
-CREATE INDEX "entry_feed_id" ON "entries" ("feed_id");
+CREATE TABLE IF NOT EXISTS "migrations" ("id" INTEGER NOT NULL PRIMARY KEY, "name" VARCHAR(255) NOT NULL, "applied_on" DATETIME NOT NULL);
+INSERT INTO migrations VALUES(1,'add_feed_next_check_on','2026-10-18 17:14:23.618642');
+INSERT INTO migrations VALUES(2,'add_feed_body_hash','2026-10-18 17:17:29.180508');
+INSERT INTO migrations VALUES(3,'add_entry_content_hash','2026-10-18 17:17:57.094794');
+INSERT INTO migrations VALUES(4,'add_feed_last_modified','2026-10-18 17:18:41.841594');
+INSERT INTO migrations VALUES(5,'add_jobs_table','2026-10-18 17:25:15.371715');
+INSERT INTO migrations VALUES(6,'move_feed_icons','2026-10-18 17:26:55.252233');
+INSERT INTO migrations VALUES(7,'add_entry_compressed_content','2026-10-18 17:33:40.540389');
+INSERT INTO migrations VALUES(8,'add_entry_guid_hash','2026-10-18 17:36:28.173660');
+INSERT INTO migrations VALUES(9,'add_query_indexes','2026-10-18 17:37:52.609255');
+INSERT INTO migrations VALUES(10,'add_unread_table','2026-10-18 17:42:13.728628');
+INSERT INTO migrations VALUES(11,'add_counters_table','2026-10-18 17:45:16.862674');
+CREATE TABLE IF NOT EXISTS "jobs" ("id" INTEGER NOT NULL PRIMARY KEY, "kind" VARCHAR(255) NOT NULL, "feed_id" INTEGER, "payload" TEXT NOT NULL, "run_after" DATETIME NOT NULL, "attempts" INTEGER NOT NULL, "worker_id" VARCHAR(255) NOT NULL, "locked_until" DATETIME, FOREIGN KEY ("feed_id") REFERENCES "feeds" ("id") ON DELETE CASCADE);
+CREATE TABLE IF NOT EXISTS "icons" ("id" INTEGER NOT NULL PRIMARY KEY, "data_hash" VARCHAR(40) NOT NULL, "content_type" VARCHAR(255) NOT NULL, "data" BLOB NOT NULL);
+INSERT INTO icons VALUES(1,'9db529915029f6a411d35a4465ea160f86c6d041','image/x-icon',X'000001000100404000000100200028420000160000002800000040000000800000000100200000000000004000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000002100000089000000c9000000d9000000b50000006b00000003000000000000000000000000000000000000000000000000000000000000003a0000009b000000db000000f6000000f0000000cf000000860000001f000000000000000000000000000000000000000000000000000000000000000000000000000000250000008b000000d2000000f2000000f5000000d8000000950000003300000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000058000000f1000000f9000000bb0000009c000000d6000000ff000000cd0000001f000000000000000000000000000000000000000f000000ab000000ff000000ff000000d8000000b6000000bf000000ec000000ff000000f80000007d0000000100000000000000000000000000000000000000000000000300000089000000fb000000ff000000e3000000bb000000b8000000de000000ff000000fe000000a00000000a00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000034000000fd000000c80000001e0000000000000000000000000000004c000000f3000000c600000004000000000000000000000011000000d4000000ff000000c20000002a0000000000000000000000000000000300000059000000ec000000ff000000a20000000000000000000000000000000000000002000000b1000000ff000000db000000420000000000000000000000000000000000000036000000d1000000ff000000c90000000a0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000ca000000e80000000e000000000000000000000000000000000000000000000056000000ff000000670000000000000000000000b6000000ff0000007f0000000100000000000000000000000000000000000000000000000000000018000000c7000000ff0000007300000000000000000000000000000084000000ff000000a90000000a0000000000000000000000000000000000000000000000000000000600000098000000ff000000a50000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000480000004000000000000000000000000000000000000000000000000000000001000000de000000ad000000000000004b000000ff000000b800000000000000000000000000000000000000000000000000000000000000000000000000000021000000f4000000f2000000150000000000000020000000f9000000de0000000c000000000000000000000000000000000000000000000000000000000000000000000006000000d3000000ff0000003a0000000000000043000000f600000033000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000bd000000db00000000000000b1000000fb0000001c0000000000000000000000000000000000000000000000000000000000000000000000000000000000000073000000ff0000006e000000000000007f000000ff000000490000000000000000000000000000000000000000000000000000000000000000000000000000000000000039000000ff000000a00000000000000055000000ff00000044000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000d4000000be00000001000000f5000000be000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000018000000ff000000b400000000000000c5000000ed000000030000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000e1000000e60000000000000055000000ff0000004400000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000037000000600000000000000000000000000000000000000000000000000000003b000000ff0000009100000015000000ff00000098000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000f0000000d100000000000000e3000000c9000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000bc000000fe0000000500000055000000ff00000044000000000000003e0000003e000000040000000000000000000000000000002900000009000000000000000000000000000000000000000800000025000000a7000000ff00000083000000030000000000000000000000000000002a000000e1000000f90000002100000015000000ff0000009a000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000f1000000d000000000000000e3000000cc000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000c0000000fe0000000500000055000000ff0000004400000000000000ee000000ff000000e500000038000000000000000a000000f7000000c00000000b000000000000000000000009000000bb000000de000000a7000000ff000000ff000000d8000000850000006e000000a3000000f7000000fd000000580000000000000001000000f6000000c400000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001c000000ff000000b000000000000000c5000000f1000000050000000000000000000000000000000000000000000000000000000000000000000000000000000000000001000000e8000000e50000000000000056000000ff00000044000000000000002400000059000000d7000000f6000000400000000000000063000000fe000000c00000000b00000009000000bb000000f300000039000000a7000000e100000066000000e1000000ff000000ff000000fe000000c70000003a000000000000000000000000000000b1000000fc000000260000000000000000000000000000000000000000000000000000000000000000000000000000000000000079000000ff000000690000000000000080000000ff000000550000000000000000000000000000000000000000000000000000000000000000000000000000000000000048000000ff000000a00000000000000055000000ff0000004400000000000000000000000000000011000000f3000000ca000000000000000000000068000000ff000000c0000000bb000000f50000003f00000000000000a7000000dd0000000000000005000000300000003b0000001700000000000000000000000000000000000000000000004b000000ff000000c500000002000000000000000000000000000000000000000000000000000000000000000000000028000000f7000000ef000000110000000000000020000000f9000000e70000001200000000000000000000000000000000000000000000000000000000000000000000000d000000e0000000ff000000390000000000000052000000ff0000004700000000000000000000000000000000000000a5000000fe00000007000000000000000000000073000000ff000000ff0000004b0000000000000000000000a7000000dd0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000b6000000ff000000930000000600000000000000000000000000000000000000000000000000000020000000d0000000ff0000006a00000000000000000000000000000084000000ff000000b8000000130000000000000000000000000000000000000000000000000000000f000000af000000ff000000a400000000000000000000002b000000ff0000007300000000000000000000000000000000000000b4000000f4000000000000000000000008000000b8000000f8000000fd000000b30000000600000000000000a7000000dd000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000011000000d4000000ff000000d20000003e0000000100000000000000000000000b0000006c000000f3000000ff000000970000000000000000000000000000000000000002000000b0000000ff000000e7000000560000000600000000000000000000000400000051000000e3000000ff000000c90000000a000000000000000000000003000000d3000000e90000002a000000000000000000000056000000fe000000ac0000000000000008000000b8000000f90000004a0000005c000000fd000000b300000006000000a8000000f5000000ae000000ae000000ae000000ae000000ae000000ae000000ae00000043000000000000000000000000000000000000000e000000ab000000ff000000ff000000eb000000cb000000d3000000f8000000ff000000f5000000730000000000000000000000000000000000000000000000000000000300000089000000fb000000ff000000f3000000d0000000cf000000f1000000ff000000fe0000009f000000090000000000000000000000000000000000000037000000ef000000fa000000bf000000cd000000ff000000e90000002300000002000000b8000000fb0000005000000000000000000000005d000000fd000000b100000066000000d6000000d7000000d7000000d7000000d7000000d7000000d7000000d7000000530000000000000000000000000000000000000000000000000000003a0000009a000000db000000f6000000ee000000cb000000800000001a000000000000000000000000000000000000000000000000000000000000000000000000000000250000008a000000d2000000f1000000f4000000d8000000940000003100000000000000000000000000000000000000000000000000000000000000230000009c000000e5000000e9000000a30000001b0000000000000006000000b800000055000000000000000000000000000000000000005b00000095000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffc07f00ff807fffff803c003e001fffff0e18383c1e0fffff1f187e1c3f0fffff3f11ff087f847fffff91ff88ffc47fffff83ff88ffe47fff3f03ffc9ffe0473c0e03ffc9ffe042180023ff88ffc441000071ff88ffc4718121f0ff087f8478c33ff87e1c3f0c79813ff8183c0c0c3100003c007e001e0018003f00ff807f023cffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff');
+INSERT INTO icons VALUES(2,'1ba125ae2564fffc4ed93528373aec11d138d577','image/x-icon',X'0000010003002020000001002000a810000036000000101000000100200068040000de10000040400000010020002842000046150000280000002000000040000000010020000000000080100000130b0000130b0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff0a145dff42145dff7c145dffa9145dffc4145dffd2145dffd2145dffc5145dffad145dff83145dff48145dff0e000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff1a145dff7a145dffd3145dfffe145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffdb145dff85145dff21000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff68145dffe0145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe8145dff78145dff060000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff17145dffaa145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffbc145dff21000000000000000000000000000000000000000000000000000000000000000000000000145dff1d145dffcb145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd9145dff2900000000000000000000000000000000000000000000000000000000145dff15145dffcd145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffdc145dff200000000000000000000000000000000000000000145dff02145dffac145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffc2145dff0900000000000000000000000000000000145dff66145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff7e000000000000000000000000145dff17145dffe4145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfff2145dff260000000000000000145dff7a145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff9200000000145dff09145dffd6145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe9145dff16145dff40145dffff145dffff145dffff145dffff145dffff145dffff135cffff0854ffff0553ffff0653ffff0e59ffff0754ffff115bffff115bffff0653ffff125bffff155dffff155dffff0f5affff0653ffff0452ffff0453ffff0855ffff135dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff56145dff7b145dffff145dffff145dffff145dffff145dffff135cffff105bffff6595ffffa6c2ffff81a7ffff2c6dffff709cfeff276affff296bffff7da5feff2568ffff105affff115bffff286bffff709dffffa6c1ffffa2bfffff5388ffff0d59ffff135cffff145dffff145dffff145dffff145dffff145dffff145dff94145dffa9145dffff145dffff145dffff145dffff145dffff0854ffff6494ffffffffffffb4cbffffb9ceffffdee8ffffffffffff3c78ffff457effffffffffff3a77ffff0b57ffff0654ffff9bbafeffe3ebfeffaac4ffffb2cafffff7f9ffff6998ffff0855ffff145dffff145dffff145dffff145dffff145dffff145dffbf145dffc2145dffff145dffff145dffff145dffff145dffff0452ffff9cbbfeffe2ebfeff004effff0047ffff729effffffffffff3976ffff427cfffffafaffff3876ffff0c57ffff115bffff3473feff1b62ffff0046ffff0048ffffc8d9ffffb8ceffff0653ffff135dffff145dffff145dffff145dffff145dffff145dffd7145dffd1145dffff145dffff145dffff145dffff145dffff0956ffff5086fefff9fbfeffa2bfffff3b74ffff5187fffffbfcffff3a77ffff427cfffff9faffff3574ffff0c57ffff165effff0653ffff2166ffff6b99ffffb8cdffffffffffff729effff0754ffff145dffff145dffff145dffff145dffff145dffff145dffe3145dffd1145dffff145dffff145dffff145dffff145dffff145dffff0b57ffff4a83feffb6cdffffdae6feffe6eefffffcfdffff3976ffff417bfffffbfcffff3c78ffff0451ffff0b57ffff3e7affffe3ecfffff3f7ffffbcd1ffff5c8fffff0e59ffff135cffff145dffff145dffff145dffff145dffff145dffff145dffe4145dffc4145dffff145dffff145dffff145dffff145dffff145dffff165effff135cffff004dffff0653ffff6594ffffffffffff3775ffff3f7affffffffffffc8d8ffff2468ffff004cffff9cbbffffe9efffff1e62ffff0049ffff0a56ffff165fffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd8145dffac145dffff145dffff145dffff145dffff145dffff0f5affff2569ffffd2e0feffb5ccffff92b3ffffd6e3ffffe6eeffff165effff4b82fffff4f7feffc9d9fffff0f5ffff719dfeff5d8ffffff7f9feff9bb9feff9ebcffffd7e3feff3b78ffff0b57ffff145dffff145dffff145dffff145dffff145dffff145dffc1145dff80145dffff145dffff145dffff145dffff145dffff135cffff155effff5c8fffffa4c0ffffb9cffeffa4c0ffff3d79ffff0854ffff3473ffff77a1feff1960ffff82a9ffff709cffff0653ffff6494ffffb2cafeffb2cafeff83a9ffff2165ffff105bffff145dffff145dffff145dffff145dffff145dffff145dff99145dff45145dffff145dffff145dffff145dffff145dffff145dffff135cffff0854ffff0553ffff0955ffff0653ffff0b57ffff155effff105bffff0755ffff105affff0653ffff0c58ffff145dffff0854ffff0855ffff0855ffff0653ffff115bffff155dffff145dffff145dffff145dffff145dffff145dffff145dff5d145dff0d145dffdc145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff135cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff135dffff135dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffec145dff1a00000000145dff83145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff9c0000000000000000145dff1d145dffeb145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfff7145dff30000000000000000000000000145dff74145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff8b00000000000000000000000000000000145dff06145dffbb145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffce145dff0f0000000000000000000000000000000000000000145dff1d145dffda145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe5145dff2b00000000000000000000000000000000000000000000000000000000145dff28145dffd9145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe3145dff39000000000000000000000000000000000000000000000000000000000000000000000000145dff22145dffbe145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffcc145dff2b0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff08145dff7c145dffed145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfff5145dff89145dff100000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff29145dff91145dffe3145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffea145dff9a145dff33000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff14145dff54145dff92145dffbb145dffd6145dffde145dffde145dffd7145dffbf145dff97145dff5a145dff1a00000000000000000000000000000000000000000000000000000000000000000000000000000000ffc003ffff0000fffe00003ff800001ff000000fe0000007c0000003c000000380000001800000010000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000008000000180000001c0000003c0000003e0000007f000000ff800001ffc00003fff0000ffffc003ff280000001000000020000000010020000000000040040000130b0000130b00000000000000000000000000000000000000000000000000009ec0fe604084febf005bffff005bffff005bffff005bffff4084febf9ec0fe60000000000000000000000000000000000000000000000000dee9fe1f3079fecf005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff3079fecfdee9fe1f000000000000000000000000dee9fe1f1065feee005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff1065feeedee9fe1f00000000000000003079fecf005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff3079fecf000000009ec0fe60005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff9ec0fe604084febf005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff4084febf005bffff005bffff005bffffc7dbffffe7f0fffff7faffff80adffffdfebffff4084ffff307afffff7faffffeff5ffffc7dbffff005bffff005bffff005bffff005bffff005bffff005bffffd7e6ffff80adffffcfe1ffff80adffffdfebffff4084ffff1065ffff4084ffff9fc2ffffdfebffff005bffff005bffff005bffff005bffff005bffff005bffff1065ffff80adffffeff5ffff80adffffdfebffff70a3ffff307afffff7faffff80adffff2070ffff005bffff005bffff005bffff005bffff005bffff005bffffb8d1ffffeff5fffff7faffff508effffbfd6ffffe7f0ffff8fb7ffffeff5ffffe7f0ffffc0d6ffff005bffff005bffff005bffff4084febf005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff4084febf9ec0fe60005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff9ec0fe60000000003079fecf005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff3079fecf0000000000000000dee9fe1f1065feee005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff1065feeedee9fe1f000000000000000000000000dee9fe1f3079fecf005bffff005bffff005bffff005bffff005bffff005bffff005bffff005bffff3079fecfdee9fe1f0000000000000000000000000000000000000000000000009ec0fe604084febf005bffff005bffff005bffff005bffff4084febf9ec0fe6000000000000000000000000000000000f00f0000c003f0bf800100008001000000000000000000000000000000000000000000000000000000000000000000008001ffff8001ffffc0030000f00f0000280000004000000080000000010020000000000000420000130b0000130b00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff06145dff1f145dff4b145dff72145dff90145dffa3145dffb6145dffbe145dffbe145dffb8145dffa5145dff93145dff7a145dff54145dff29145dff0c000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff15145dff4f145dff99145dffcd145dfff7145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfffd145dffd8145dffa5145dff5e145dff1d00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff36145dff97145dffe2145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffee145dffa9145dff4b145dff050000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff47145dffb6145dfffc145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffc8145dff5c145dff0400000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff2f145dffab145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffc4145dff4600000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff03145dff79145dfff5145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff9c145dff1600000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff26145dffbd145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd6145dff400000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff46145dffe4145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfff7145dff68000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff5d145dfff6145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff8600000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff5e145dfffc145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff8c0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff5e145dfffd145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff8a000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff45145dfff8145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff6f00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff22145dffe6145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfffb145dff480000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff05145dffbf145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe2145dff1900000000000000000000000000000000000000000000000000000000000000000000000000000000145dff79145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffaa000000000000000000000000000000000000000000000000000000000000000000000000145dff28145dfff3145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff530000000000000000000000000000000000000000000000000000000000000000145dffaf145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd9145dff0d000000000000000000000000000000000000000000000000145dff41145dfffc145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff6f000000000000000000000000000000000000000000000000145dffb8145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffde145dff0f00000000000000000000000000000000145dff35145dfffa145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff6200000000000000000000000000000000145dff95145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffc6145dff030000000000000000145dff10145dffe2145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfffd145dff320000000000000000145dff4d145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff810000000000000000145dff97145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff105affff0c58ffff0c58ffff0f59ffff135cffff145dffff145dffff105bffff105affff135cffff145dffff145dffff125cffff105affff105affff135cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff115bffff0d59ffff0c58ffff0c58ffff0e59ffff135cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffc1145dff02145dff05145dffcc145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff125cffff0956ffff2166ffff3876ffff3976ffff296bffff0d58ffff0b57ffff145dffff1e64feff2266feff1860ffff135dffff135dffff1961ffff2266feff2166feff175fffff145dffff145dffff145dffff145dffff145dffff135cffff0b57ffff0754ffff1a61ffff3070ffff3976ffff3976ffff2b6cffff0f59ffff0955ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfff3145dff1a145dff1e145dfff6145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff125cffff105affff7da5feffdce7feffffffffffffffffffe9effeffb0c8feff407bfeff155effffc5d7feffdee8feff5d8ffeff0b56ffff0855ffff6a97feffdde7feffdde7feff437dffff0c57ffff145dffff145dffff145dffff135cffff165effff4d84feffa1bdffffd2e0fefff4f7feffffffffffffffffffebf1feffbdd1feff588cfeff0c58ffff135cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff4f145dff47145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0955ffff7ca4fefffffffffffffffffffffffffffffffffffffffffffffffffffbfcffff97b7fefffafbffffffffffff6d9afeff0955ffff0653ffff7da4feffffffffffffffffff4d84ffff0a56ffff145dffff145dffff145dffff0a56ffff4b83fefffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffeffffff739efeff0956ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff7a145dff6e145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff115bffff1b62ffffdde7fefffffffffff4f8ffff76a0feff3775ffff4c83ffff98b7fefff4f7ffffffffffffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffff4b83ffff0a56ffff145dffff145dffff145dffff0c58ffff3f7afefffffffeffe1eafeff95b5ffff5488feff3c79ffff3a78ffff6c99feffe2ebffffffffffffedf2feff2b6dfeff0f5affff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff9e145dff8b145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0e59ffff3272feffeff4feffffffffffacc6feff0250ffff0a56ffff0956ffff0552ffff3e7afeffd9e5ffffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffff4b83ffff0a56ffff145dffff145dffff145dffff115bffff2569feff79a2feff2669ffff0553ffff0a56ffff0b57ffff0b57ffff004cffff6695feffffffffffffffffff5287ffff0955ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffbb145dffa1145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0f59ffff2c6efeffecf2feffffffffffb3cbfeff0654ffff105affff145dffff145dffff004effff759ffeffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffff4b83ffff0a56ffff145dffff145dffff145dffff145dffff135cffff0956ffff0f59ffff145dffff145dffff115bffff0c57ffff004dffff79a2feffffffffffffffffff5489ffff0955ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd0145dffae145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff135cffff105bffffc3d5fefffffffffff9faffff76a1feff0e59ffff0754ffff0b57ffff004fffff739efeffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffff4b83ffff0a56ffff145dffff145dffff145dffff145dffff145dffff145dffff135cffff0a56ffff0754ffff1960feff3976ffff8caefefff3f7fffffffffffff5f7feff3271feff0e59ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd6145dffbe145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0b57ffff467ffefff1f6feffffffffffffffffffcadaffff7ba3feff457fffff2065feff7ba3feffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffff4b83ffff0a56ffff145dffff145dffff145dffff145dffff155dffff0e59ffff115bffff5085feff9fbcfeffd2e0fefffbfcffffffffffffffffffffffffffff8daffeff0c58ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe8145dffbe145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0a56ffff437efeffbfd2feffffffffffffffffffffffffffffffffffebf1feffeaf1ffffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffff4680ffff0a56ffff145dffff145dffff145dffff145dffff0f5affff2065ffffb3cbfeffffffffffffffffffffffffffffffffffffffffffd8e4feff729dfeff105affff125cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffeb145dffb0145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0b57ffff105bffff4881feff8eb0feffbcd1feffe2eafefffefeffffffffffffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffff709bffff0251ffff145dffff145dffff145dffff135dffff0c58ffffa8c3feffffffffffffffffffffffffffcadafeff94b5feff5187feff1b62ffff0855ffff125cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd6145dffa2145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0f5affff115bffff0b57ffff0553ffff0f5affff2166ffff2569ffff8fb2feffffffffffffffffff6a98feff0955ffff0653ffff7aa2feffffffffffffffffffe9effeff3f7afeff0452ffff135cffff145dffff105affff2669ffffebf1ffffffffffffdee8ffff4c83ffff125bffff0553ffff0a56ffff105bffff105affff135cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd5145dff92145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff155dffff2a6cffff105affff0754ffff0c57ffff0c57ffff0956ffff0048ffff83aafeffffffffffffffffff578bffff0956ffff0653ffff7aa2feffffffffffffffffffffffffffe5edffff5288feff0855ffff0654ffff0956ffff3a77fefff5f8feffffffffff89adffff0048ffff0d58ffff0e59ffff0b57ffff0754ffff2166ffff1b62ffff135cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffbd145dff75145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff125cffff175fffffd0defeffbfd2ffff709cfeff3c78ffff3070ffff2c6effff5c8effffebf1fffffffffffffbfcfeff3c78feff0c58ffff0653ffff7aa2fefffffffffff3f7feffe0e9fefffffffffffefeffffb2c9feff709cfeff2b6dffff1860ffffe0eaffffffffffffdbe6feff4a81feff2367feff2a6cffff4680ffff8db0feffdce7feff437dfeff0c57ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffa4145dff51145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff0e59ffff2e6ffefffafcfffffffffffffffffffffffffffff2f5fefff2f5feffffffffffffffffffffffffffafc7feff0f5affff135dffff0653ffff7ca3feffffffffffe2ebfeff407bfeffd0defeffffffffffffffffffffffffff5c8effff004effff76a0feffffffffffffffffffffffffffe4ecfeffebf1feffffffffffffffffffffffffff6493ffff0754ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff83145dff23145dfffa145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff125cffff1b62ffff6f9bfeffbed2feffeef3fefffffffffffffffffffffffffffffffffff4f7ffffa6c0feff2166ffff0f59ffff145dffff0754ffff729dfefff3f6feffc3d5feff0955ffff2468ffffa5c1fefff3f7fefffefdfeff3e79feff0a57ffff0e59ffff739efeffdee8feffffffffffffffffffffffffffffffffffeff4feffc0d3feff457effff0d58ffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff53145dff08145dffd5145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff125cffff0754ffff0e59ffff2b6dffff4780ffff5c8efeff6695feff4f86ffff3272ffff0e58ffff0f5affff145dffff145dffff125cffff1f64ffff3070ffff2669ffff135cffff0e59ffff0d58ffff3272ffff4e85feff1d63ffff125cffff135cffff0955ffff2166ffff467fffff6393feff5c8ffeff4881ffff2c6dffff105affff0e59ffff155dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfffa145dff2400000000145dffa0145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff135cffff0e59ffff0b57ffff0956ffff0955ffff0a56ffff0d58ffff135cffff145dffff145dffff145dffff145dffff115bffff0d59ffff0f5affff145dffff145dffff135cffff0d58ffff0b57ffff135cffff145dffff145dffff145dffff105affff0b57ffff0955ffff0956ffff0b57ffff0e59ffff135cffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffcd145dff0500000000145dff5b145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff8c0000000000000000145dff17145dffed145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfffe145dff3d000000000000000000000000145dffa5145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffd2145dff08000000000000000000000000145dff44145dfffd145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff7600000000000000000000000000000000145dff04145dffc7145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffeb145dff190000000000000000000000000000000000000000145dff53145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff8b000000000000000000000000000000000000000000000000145dff04145dffc5145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe9145dff1700000000000000000000000000000000000000000000000000000000145dff3e145dfffd145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff6d000000000000000000000000000000000000000000000000000000000000000000000000145dff94145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffc5145dff04000000000000000000000000000000000000000000000000000000000000000000000000145dff11145dffd7145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfff1145dff2c0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff3a145dfff6145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff6300000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff64145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff91000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff80145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffa8145dff0600000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff8c145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffba145dff0c000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff86145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffa7145dff0c0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff6b145dfff8145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dff8e145dff0300000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff43145dffdc145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffef145dff6500000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff19145dffa5145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffbc145dff2f00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff50145dffd0145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe4145dff6c145dff03000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff0c145dff71145dffda145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffe6145dff8b145dff1900000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff0f145dff61145dffbf145dfffa145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffcf145dff74145dff19000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff2b145dff79145dffbc145dfff2145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dffff145dfff6145dffc7145dff8a145dff3b145dff070000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000145dff1a145dff47145dff76145dff99145dffb7145dffce145dffd7145dffd6145dffd6145dffd7145dffd0145dffba145dff9f145dff7f145dff52145dff20145dff030000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000ffffff0000fffffffffff800001fffffffffe0000003ffffffff80000000fffffffe000000007ffffff8000000001ffffff0000000000fffffe00000000007ffffc00000000003ffff800000000001ffff000000000000fffe0000000000007ffc0000000000003ff80000000000001ff80000000000001ff00000000000000ff000000000000007e000000000000007e000000000000003c000000000000003c0000000000000018000000000000001800000000000000180000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000800000000000000080000000000000018000000000000001c000000000000001c000000000000003c000000000000003e000000000000007e000000000000007f00000000000000ff80000000000000ff80000000000001ffc0000000000003ffe0000000000007fff0000000000007fff800000000000ffffc00000000001ffffe00000000003fffff0000000000ffffff8000000001ffffffe000000003fffffff00000000ffffffffc0000003fffffffff800000fffffffffff00007fffff');
+INSERT INTO icons VALUES(3,'16bfedcc4b65095c4ac5be1c0252930f3ec18c98','image/x-icon',X'89504e470d0a1a0a0000000d4948445200000026000000260806000000a83de9ae00000a44694343504943432050726f66696c650000480d9d96775414d717c7dfcc6c2fb45d962265e9bdb705a42ebd4895260acbee024b59d66517b0374405228a880856242862c06828122ba258080816ec0109224a0c46111595ccc61cf5f73b27f9fd4ede1f773ef37df79e77e7defbce190028012102610eac0040b650228ef4f766c6c52730f1bd0006448003360070b8b9a2d028bf6880ae405f3633177592f15f0b02e0f52d805a00ae5b048433997fe9ffef43912b124b0080c2d1003b1e3f978b7221ca59f912914c9f44999e922963182363319a20caaa324efbc4e67ffa7c624f19f3b2853cd44796b38897cd937117ca1bf3a47c949110948bf204fc7c946fa0ac9f25cd16a0fc06657a369f930b008622d3257c6e3acad62853c4d1916c94e70240a0a47dc5295fb1845f80e609003b47b4442c484b97308db9264c1b67671633809f9fc597482cc239dc4c8e98c764e7648b38c225007cfa6659145092d5968916d9d1c6d9d1d1c2d6122dffe7f58f9b9fbdfe1964bdfde4f132e2cf9e418c9e2fda97d82f5a4e2d00ac29b4365bbe68293b01685b0f80eadd2f9afe3e00e40b0168edfbea7b18b279499748442e5656f9f9f996023ed75256d0cfeb7f3a7cf6fc7bf8ea3c4bd9799f6bc7f4e1a772a45912a6aca8dc9cac1ca998992be270f94c8bff1ee27f1df8555a5fe5611ec94fe58bf942f4a81874ca04c234b4dd429e4022c8113205c2bfebf0bf0cfb2a07197e9a6b1468751f013dc91228f4d101f26b0fc0d0c80049dc83ee409ffb16428c01b29b17ab3df669ee5146f7ffb4ff61e032f415ce15a43165323b329ac9958af3648cde0999c10212900774a006b4801e300616c016380157e0097c41100803d1201e2c025c900eb28118e483e5600d280225600bd80eaac15e50071a40133806dac049700e5c0457c1357013dc034360143c0393e035988120080f51211aa4066943069019640bb12077c8170a8122a17828194a838490145a0ead834aa072a81ada0f3540df4327a073d065a81fba030d43e3d0efd03b188129301dd6840d612b98057bc1c17034bc104e8317c34be14278335c05d7c247e056f81c7c15be090fc1cfe0290420648481e82016080b6123614802928a88919548315289d4224d4807d28d5c47869009e42d0687a16198180b8c2b2600331fc3c52cc6acc49462aa318730ad982ecc75cc306612f3114bc56a60cdb02ed8406c1c360d9b8f2dc25662ebb12dd80bd89bd851ec6b1c0ec7c019e19c7001b8785c066e19ae14b71bd78c3b8bebc78de0a6f078bc1ade0cef860fc373f0127c117e27fe08fe0c7e003f8a7f432013b409b6043f42024148584ba8241c269c260c10c608334405a201d1851846e4119710cb8875c40e621f7194384352241991dc48d1a40cd21a5215a9897481749ff4924c26eb929dc91164017935b98a7c947c893c4c7e4b51a29852d894448a94b299729072967287f2924aa51a523da90954097533b5817a9efa90fa468e2667291728c7935b255723d72a3720f75c9e286f20ef25bf487ea97ca5fc71f93ef90905a282a1025b81a3b052a146e184c2a0c294224dd146314c315bb154f1b0e265c5274a782543255f259e52a1d201a5f34a233484a64763d3b8b475b43ada05da281d4737a207d233e825f4efe8bdf4496525657be518e502e51ae553ca430c8461c808646431ca18c718b718ef543455bc54f82a9b549a540654a655e7a87aaaf2558b559b556faabe5363aaf9aa65aa6d556b537ba08e5137558f50cf57dfa37e417d620e7d8eeb1cee9ce239c7e6dcd580354c35223596691cd0e8d198d2d4d2f4d71469eed43caf39a1c5d0f2d4cad0aad03aad35ae4dd376d7166857689fd17eca54667a31b39855cc2ee6a48e864e808e5467bf4eafce8cae91ee7cddb5bacdba0ff4487a2cbd54bd0abd4ebd497d6dfd50fde5fa8dfa770d88062c8374831d06dd06d3864686b1861b0cdb0c9f18a91a051a2d356a34ba6f4c35f6305e6c5c6b7cc30467c232c934d96d72cd143675304d37ad31ed3383cd1ccd0466bbcdfacdb1e6cee642f35af3410b8a8597459e45a3c5b025c332c472ad659be5732b7dab04abad56dd561fad1dacb3acebacefd928d904d9acb5e9b0f9ddd6d4966b5b637bc38e6ae767b7caaeddee85bd993ddf7e8ffd6d079a43a8c306874e870f8e4e8e62c726c771277da764a75d4e832c3a2b9c55cabae48c75f6765ee57cd2f9ad8ba38bc4e598cb6fae16ae99ae875d9fcc359acb9f5b3777c44dd78de3b6df6dc89de99eecbecf7dc843c783e351ebf1c853cf93e759ef39e665e295e175c4ebb9b7b5b7d8bbc57b9aedc25ec13eeb83f8f8fb14fbf4fa2af9cef7adf67de8a7eb97e6d7e837e9efe0bfccff6c00362038606bc060a0662037b0217032c829684550573025382ab83af85188698838a423140e0d0add167a7f9ec13ce1bcb630101618b62dec41b851f8e2f01f237011e11135118f236d2297477647d1a292a20e47bd8ef68e2e8bbe37df78be747e678c7c4c624c43cc74ac4f6c79ec509c55dc8ab8abf1eaf182f8f6047c424c427dc2d402df05db178c263a241625de5a68b4b060e1e545ea8bb2169d4a924fe2241d4fc626c7261f4e7ecf09e3d472a652025376a54c72d9dc1ddc673c4f5e056f9cefc62fe78fa5baa596a73e49734bdb96369eee915e993e21600baa052f320232f6664c6786651ecc9ccd8acd6ace266427679f102a0933855d395a390539fd223351916868b1cbe2ed8b27c5c1e2fa5c2877616ebb848efe4cf5488da5eba5c379ee7935796ff263f28f172816080b7a96982ed9b4646ca9dfd26f9761967197752ed759be66f9f00aaf15fb57422b535676aed25b55b86a74b5ffea436b486b32d7fcb4d67a6df9da57eb62d775146a16ae2e1c59efbfbeb148ae485c34b8c175c3de8d988d828dbd9bec36eddcf4b198577ca5c4baa4b2e47d29b7f4ca3736df547d33bb3975736f9963d99e2db82dc22db7b67a6c3d54ae58beb47c645be8b6d60a664571c5abed49db2f57da57eedd41da21dd31541552d5be537fe7969defabd3ab6fd678d734efd2d8b569d7f46edeee813d9e7b9af66aee2dd9fb6e9f60dfedfdfefb5b6b0d6b2b0fe00ee41d785c1753d7fd2debdb867af5fa92fa0f078507870e451eea6a706a6838ac71b8ac116e94368e1f493c72ed3b9fefda9b2c9af637339a4b8e82a3d2a34fbf4ffefed6b1e0639dc759c79b7e30f861570bada5b8156a5dd23ad996de36d41edfde7f22e84467876b47cb8f963f1e3ca973b2e694f2a9b2d3a4d385a767cf2c3d3375567476e25cdab991cea4ce7be7e3cedfe88ae8eabd107ce1d245bf8be7bbbdbacf5c72bb74f2b2cbe513575857daae3a5e6ded71e869f9c9e1a7965ec7ded63ea7bef66bced73afae7f69f1ef0183877dde7fac51b8137aede9c77b3ffd6fc5bb7071307876ef36e3fb99375e7c5ddbcbb33f756dfc7de2f7ea0f0a0f2a1c6c3da9f4d7e6e1e721c3a35ec33dcf328ead1bd11eec8b35f727f793f5af898fab8724c7bace189ed9393e37ee3d79e2e783afa4cf46c66a2e857c55f773d377efec36f9ebff54cc64d8ebe10bf98fdbdf4a5dacb83afec5f754e854f3d7c9dfd7a66baf88dda9b436f596fbbdfc5be1b9bc97f8f7f5ff5c1e443c7c7e08ff767b36767ff000398f3fc110ed160000000097048597300002e2300002e230178a53f76000004f4494441545809bd98df6f145514c7bfbbd36dd9529ab848224891b6f40711431a4be98ba1447c15445a5013913e1a6d312a88044d5044313eb0143031f6112b6f1aff031f800713f545a5280a3cd44db42596847677e67abe73f7cece8eb3bbb33fe26976eebd73cfbdf7b3df73e6ded9c69418ea344e118bc5bc59826dafa38a4abc0adf5057e5382e542e97c37757afb93e84acfbfbca04359b63dbded88b5353545e7d3373d9bbe7388e57afb6c26f5693f9a12e9c4dbb507b0686d42302f7d5a5196fce5ae16a022b824a6ba881decd6ac45aa30e743fa6d63600ae6a30db17be0be973ae52db046a3d5ad40eac567b9bd6abd1ae2daaa34eb8aac0c2a00605aa1bad02b6428de041f50cd6aadd8987d598c06da8032e325828544fbfea42320f96cc83ad534fe321b5270f576bce45da2e2481118f6bd78be9737879e2550cf6f4e3efd95bf2209afd8b51d516937b2aeb60f9f63cb6776ec1e4f307f0f5175fba9d51b7928a60ff819a9cf0411994f052656d2cdf99c79081bb341319ae2c5818d436516a4194e2c0b82853288d727ec8bc7277165cb8c32f3c07d94a22c135f9a7f1d76523f2c277fe6c1aaf1c9ec48040cdcdfee173d3e18b43e13e1cf9d36d5e89694a279bc392283728ca4d081c6db784d784d57f9cb99d722901a6cf3e2af6e9d479176a7bcf66dc15a556ba1a15abc35693a0f0c3ba0983f172ef4acee544b9e18d8fe284c0659796b0efa5834567ac8162190aa61c018bc7b0f0f3752424a73eeb1b417c765114e8f78ff5ea54c612a48ce896c1920ba8b5f35c7425ab9048b6a35d5affdcb809c7b111b72c9156bc7d2f01740e05d3b300cdb2d81036e1d6620cf764692a12b6a0015b440e0964e5c3e0063d05aa6f35323f5dc1ae93a7b1fff85191561ff661a134aa1b96a2d2715bf7b10149b4c42c2f8f72b2a81df2618e1187575dea3c63cbea4b61ee972b7842a0c68e1f290bc565cb82d141494a53a92ec9ae36a9112a3888b964f289638a8d4aa59011a81def7d284a1d91341145f3af4bc5be8556708d428faf46e508d78956c1d370a5417c03e54b247a53f853a046deff08fbdf7eb30095dfb0fddefe7a24304230744da2557438f127d4750d3576ec8dc850048c0446c76ae1089521d4a933183b165d29ae458b0c4667036795558e4a3de042ed24d45b544a9e3ee65485f0710d6355817110e1f8f4f9e1b2d2e67d9a516ae7071f63b44628ce53114c9f8604324beb41dc024ccead721f0807894ded925357a1a15eaf492942d1ca82f1bcb4659bb585497e76b84a512d3e082cb372257087ec73ad1d6d98bbf12d769da65202c55f4a55864f23e96bd99dbf498e8b36fc062bb915ca924d438eaaa0f18eb54ec06edf44ead427183efa9ac85b1f14d708053349bab2bf07bdd39781f19340f756e0f7654a17640356b4c83de97bea490d65db88f10cacc34a8792072bedd028f0f93bc0af3f021b9b459e42ae6907b9babecd50f2c6c05161679fe71bb1521a4cc2a1179499c6097742e07ec8c385cdce5725be3a36c64a8371fe20dcf4bb7938095d7d91aa485f1e2c0877681ff03fc155062b09f73dd029ca352a76010d439fca808f6e9ab0b2a472b471096df7402117f5dd865ca38371b9503879621f1f66674380cc24d581715428dc19e958d550b6eac1c2e02c49d583cfca01172d65394525ab0d8cb3fa957b712ff0d7b4fcf4b95769bdc8fd31fe872db27798238713326703f377813529fd30f05e1d563f18173770c17a1d60ff02c717d5adad3afa100000000049454e44ae426082');
+INSERT INTO icons VALUES(4,'c066c70aa1dd2b4347d3095592aac28b55e85d04','image/x-icon',X'000001000200101000000100200028050000260000002020000001002000281400004e05000028000000100000002000000001002000000000000005000000000000000000000000000000000000000000000000000000000000000000000e0c0b2a322d29904b423cd5544c46f3544c46f34b423cd5322d29900e0c0b2a00000000000000000000000000000000000000000000000001010105332f2a94594f48fd5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff594f48fd332f2a940101010500000000000000000000000001010105423b35bc5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff423b35bc010101050000000000000000332f2a945a524aff5a524aff8d8783ff756e69ff5a524aff5a524aff5a524aff5a524aff756f6aff8c8782ff5a524aff5a524aff332d2a93000000000e0c0b2a594f48fd5a524aff5a524aff78716cffececebff9b9692ff5a524aff5a524aff9b9793ffececebff766f6aff5a524aff5a524aff594f48fd0e0c0b2a322d29905a524aff5a524aff5a524aff5a524affdddcdbfff1f1f1ffc4c1bfffc4c1bffff1f1f1ffdcdbdaff5a524aff5a524aff5a524aff5a524aff322d29904b423cd55a524aff5a524aff5a524aff5a524affb0aca9fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffb0aca9ff5a524aff5a524aff5a524aff5a524aff4b423cd5544c46f35a524aff5a524aff5a524aff5b534bffb8b5b3fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffb8b5b2ff5b534bff5a524aff5a524aff5a524aff544c46f3544c46f35a524aff5a524aff6b645dffd0ceccfff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffcfcdccff6a635dff5a524aff5a524aff544c46f34b423cd55a524aff857f7bffe4e3e3fff0f0f0fff0f0f0fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff0f0f0fff0f0f0ffe3e3e2ff847e79ff5a524aff4b423cd5322d29905a524aff5a524aff5a524aff5a524aff5a524aff827c77fff1f1f1fff1f1f1ff817a76ff5a524aff5a524aff5a524aff5a524aff5a524aff322d29900e0c0b2a594f48fd5a524aff5a524aff5a524aff5a524aff5a524bffe4e4e3ffe3e3e2ff5a524aff5a524aff5a524aff5a524aff5a524aff594f48fd0e0c0b2a00000000332f2a945a524aff5a524aff5a524aff5a524aff5a524affb8b5b3ffb8b5b2ff5a524aff5a524aff5a524aff5a524aff5a524aff332f2a94000000000000000001010105423b35bc5a524aff5a524aff5a524aff5a524aff86807cff857f7bff5a524aff5a524aff5a524aff5a524aff423b35bc0101010500000000000000000000000001010105332f2a94594f48fd5a524aff5a524aff5c544dff5c544dff5a524aff5a524aff594f48fd332f2a94010101050000000000000000000000000000000000000000000000000e0c0b2a322d29904b423cd5544c46f3544c46f34b423cd5322d29900e0c0b2a000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000028000000200000004000000001002000000000000014000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000101010719151447332d2a93433c38c24c443edb544c46f3544c46f34c443edb433c38c2332d2a93191514470101010700000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000007060617332d2a93554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f4332d2a93070606170000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000010101062e292684554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f42e29268401010106000000000000000000000000000000000000000000000000000000000000000000000000000000000000000007060617443d38c55a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff443d38c5070606170000000000000000000000000000000000000000000000000000000000000000000000000f0d0c2d504740e35a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff504740e30f0d0c2d0000000000000000000000000000000000000000000000000000000007060617504740e35a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff504740e307060617000000000000000000000000000000000000000001010106443d38c55a524aff5a524aff5a524aff5a524aff69615bff8e8985ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff908c88ff665e58ff5a524aff5a524aff5a524aff5a524aff443d38c501010106000000000000000000000000000000002e2926845a524aff5a524aff5a524aff5a524aff5a524aff5a524affdad9d8ffb8b5b3ff605851ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff615852ffbab7b5ffd8d6d6ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff2e29268400000000000000000000000007060617554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524affaca9a6fff1f1f1ffdbdad9ff78726dff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff79726dffdbdad9fff1f1f1ffa9a6a3ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f4070606170000000000000000332d2a935a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff79726dfff1f1f1fff1f1f1ffedededff9f9b97ff5a524aff5a524aff5a524aff5a524aff9f9c98ffedededfff1f1f1fff1f1f1ff77706bff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff332d2a930000000001010107554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524affdfdeddfff1f1f1fff1f1f1fff1f1f1ffc8c5c5ff676059ff676059ffc8c6c5fff1f1f1fff1f1f1fff1f1f1ffdddcdbff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f401010107191514475a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524affb1adabfff1f1f1fff1f1f1fff1f1f1fff1f1f1ffe3e3e2ffe4e3e3fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffb0aca9ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff19151447332d2a935a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff7f7974fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ff7e7773ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff332d2a93433c38c25a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524affe3e2e1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffe2e1e0ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff433c38c24c443edb5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524affc7c5c4fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffc7c5c4ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff4c443edb544c46f35a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff635b55ffc0bebcfff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffc0bebcff635a53ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff544c46f3544c46f35a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff79726dffdddcdbfff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffdcdbdaff78726dff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff544c46f34c443edb5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff9c9794ffedededfff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffedececff9a9591ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff4c443edb433c38c25a524aff5a524aff5a524aff5a524aff635a53ffc0bebcfff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffbfbcbaff625952ff5a524aff5a524aff5a524aff5a524aff433c38c2332d2a935a524aff5a524aff5a524aff766f6affdad8d7ffeeeeedffeeeeedffeeeeedffeeeeedffeeeeedffeeeeedffeeeeedfff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1fff1f1f1ffeeeeedffeeeeedffeeeeedffeeeeedffeeeeedffeeeeedffeeeeedffd8d7d6ff746d68ff5a524aff5a524aff5a524aff332d2a93191514475a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524affbfbdbbfff1f1f1fff1f1f1fff1f1f1fff1f1f1ffbcb9b7ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff1915144701010107554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff8e8985fff1f1f1fff1f1f1fff1f1f1fff1f1f1ff8b8581ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f40101010700000000332d2a935a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff605851ffeaeaeafff1f1f1fff1f1f1ffe9e9e8ff5d554fff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff332d2a93000000000000000007060617554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524affc2c0befff1f1f1fff1f1f1ffc0bfbcff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f4070606170000000000000000000000002e2926845a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff928d89fff1f1f1fff1f1f1ff908b87ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff2e2926840000000000000000000000000000000001010106443d38c55a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff635a53ffedededffedececff615852ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff443d38c501010106000000000000000000000000000000000000000007060617504740e35a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524affc6c5c3ffc5c3c1ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff504740e307060617000000000000000000000000000000000000000000000000000000000f0d0c2d504740e35a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff95918dff95918dff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff504740e30f0d0c2d00000000000000000000000000000000000000000000000000000000000000000000000007060617443d38c55a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff655c57ff655c57ff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff443d38c5070606170000000000000000000000000000000000000000000000000000000000000000000000000000000000000000010101062e292684554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f42e29268401010106000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000007060617332d2a93554d45f45a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff5a524aff554d45f4332d2a93070606170000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000101010719151447332d2a93433c38c24c443edb544c46f3544c46f34c443edb433c38c2332d2a9319151447010101070000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000');
+INSERT INTO icons VALUES(5,'a70ab5d077374748901898cfcd9c7a09b8a303a9','image/x-icon',X'89504e470d0a1a0a0000000d49484452000000c0000000c0080600000052dc6c07000021af494441547801ecdb038c34cb1ac6f177bd9f6ddbb617d53d8b6bdbb66d3bb8b67d6cdbb66d7b3978ce3f9349f259abc1dbc9af9f5a638add5de6c7a11f6ab47205ab5164433092f2584ca3bc1eafc5a715db4fc9bfe2045ca460b790f7e2493c83366472daf00c9ec4bdb9cfbd10c7e3afb9eff569bc86f23a722ac6622486e47e9772983b2407f5492e61958ab3957d34a62ad846f21df8218e51b09bc8a7d0860e74a20bdd48228534323b117696d9491a2924d18d2e74a2036d780a37e118fc00efc0064c138d911c4656c3dcfeeded9daec12ab29528b689988f567c95f71d87fb76aadc3b576cf5ab9d1aca4e8de461053b9bfc09dea0842d22272ad830b202e67c04d8bb26ab26c7618e8225c86f29ce56a66706b8a2f7a4613c83b314ec1b64ac98bf8dbfd14707c04780c82a315eb12dc69b28ff11b723051599a462bb8dfc03de4879293909553e02949a6023c925783d7e8d3b91814ac803f83bde8c258a6d24acd4702a11cdd99e6e26227c1bd7210d95b834aecd4df9023953c12a7d0a542c22abc90df7efc2fff124e4f6ea49fc0fefc24a35da105831e354a4221b8e2df834ce4637e40e4a0a97e08bd8a2840d8315234e45a6c1062bb23a7c17d742ae47aec577152c2687f922385f85ec54671be56f7bc5ef13b7e287086ab4c13e05ca172fb33245b609dfc1e590eb53d7e3fb0ab6d117c1032db6b9f85ceeb919b97e93c105f82c16f814a8bf35db08f29d380e2f406e40bc8013f10e0cf706d03fd6e1b778007279e101fc5eb16df71b617d25b251f8382e401272792585cb15dba7d56463618580530108d9ab3bffc26390cb6b4fe03fd8e653a09e6ab55af2fdb80249c8158424aec08730c41bc0e1886d21f91b3c0cb982f4a882fd5ab12df035c0a1882c8133d006b982d686b314acc5ef031c489c9df2bc0737fa94a7a8a4700b3ea0d806fb08b0a7324c5264dfc363c840aea864f038be8b890a56261f011059b9629b47fec16f6a958417f017055ba8849597f6d3a0915560158e4227e44a42274e516c1bc88ad2bc0a145b2559870b7dbe5f92928aed1232286155a5350204ab566ccdf06d89be1df346c5d68aead2580437f287067b59eef9725fecba0ceec02b95b09ae21e0182d58a3f14772003399773b7627b0d595b9c6b8046ab51b05753be1f726e2feecfd691d86a8a6b0ad464950af652457617e4dc7edcabd85ea16055c5711fa0317b99ab89f2cda49c3b08b72958b362ab28ec11609c9529581d6e38c47f8073d7a35ef3ad0cd65738f5a1606b721b583290738720838bb1ba5017c1f370bc5fe7ef0197c6b10ab6a0a0d600b907dbfe8814d403cea5f067c536b130d600c10629b2efa10372ae17b4e3bb4ad8e0fcbf1116d97b7def6e1f704fe003f9bd0608169337f570d1eb1ab06327f5684023a23e14d0803aec4023ea77fa1dc2802f8a6f516ccdf93a055a94dbc69884dc616aae923ebe49faef0fa5137e2bfdeb7bd2cfde2d7db6417acb0c29512ed5e52a64632f56ca7abc74283fa751fafde7a4637e219dfa67e9c4df49fffc8ef4bd374a6f98b2d3cf1c10299c89f9f93502d4d91005fb8dcffb7b282e933ebc46bae532299d52f648764b4f3c28dd75ad74d599d259ff96fef3031ac57ba44fd7496f9c92abc068388c4611d054297d3e924eff1b3fe73ae98567b5f3a16497f4c8ddd2e5a748bff8a8f48a1103d9085e6cef2ca0e33896af5f92991dce7bcf2f9c38cc8cdadd999119c3ccccccb1e5303333333327a6b0d971383133936449f7ab7b7ace67fdf7ad41da9d9d5ea9fb9c5f4fc8d246ea9aaeaeaebab54479406965930b749a325581a38e780a17d6b36558e5285f628ce2af51c088af80af5e313bc66d2700e7ed071cbc1e904a3308b2a2ef79cf19c03f6381ea2aac72cc9e6a7686233702fca2d8d4269433ec3000235af5430efc7e6700877500867d863a8d258b8c51fc3d0618331818f4ba318a5b8f03ced91be8bbb631869af46803dc7b26306b326a352a96025fabd11dfa6fee5a719d077e8027fbc47b0f90645b51794129579025ce008eeb08cc998e9c8dc50bcce21e3fceb85543de025eba11b8f918e0ccdd81eb0e05a6fe8d3a8df2c5c02bb7025d9bc7f5332b579e4327592b3e69445fce53662ac812476923e0d2c0b821518dea6a60f17c60d61460d26fc08c09c86af0eb5c70000fe6718646cf8fc705f2645ff691ca91ebe3e8de0a78f07c641c13c6013f7c04cc9ec2c3b1526516338973f080fefe23409766f1e60b05b2677ec3a049694739ec1c359e73784adfb51885c9ecc63c3700e8b31e70d446c69fbffb74139e1c3304983fdb2cc4ca65cb0d235f83df6bf21f409f35e2fcf9952b0fa193b4cd8f0be44bb1729cd3e7cfb101309cf9fb30a40d137ebcfed0e517514131fd6e13bd39701de0d8cd81ab7b004f5d057cfd2a5d1b1a0d23450c5f72c788d62868803c4f98c3705c8c4720c7506c2bf243302f2122c8f2749cb48d89e4a40f1e5ecfdc6de5b7c08ce3776b01f46c6b769213b606ca0e049e290386bc094cfbc7f8fe4b17874691c373c6c2b9c0e59d699836648d6e1aad01f8d258b94859a0c091c3dbdf010799b775faf8f63d13c2f46a79a146a3e04ec1b305778af3f665bcdff8ecbffe4063a84f064016846bb3719487e0bd5d43ba08e8d19ae906e91120f3f7ef3f0c2472e05e3052d3a909d0b91970f4a6c067cf212763de4ce0941de276810819a8ec118d011c20cd99e6ec5c9f08e8b326f0cd3bf4d5d3fd6b939793c8f1798317608f5d969b43f0f89f81deed6d2aa019500b7da15a69fa24e0cb30058e1cc30370a60b291e68fbf5069239fe7e2985c975f36721abc1f3c46bb7a7854163e747e580dcee009da455286b0d478e098a1945318b297dfcfc2d70e236402aa2a8d3078f6517219a361e3875c734ffdf0a583cd32a773b802f29250a650707df9e779c0c545600e9e39b7781aeada2c9bcf494f3f737497075198be6034f5c61dbdb9f901108a42437176129691bfafe704474007efbbef408903188b7ef074a22bc7be0819879fe53feacfde26734c9f8feb63240699d0b17681f65a40247047011f14637dd15993b1db8ff1c2019f1051c43a5d71ec2cfb07aa1d149bf03afdc6242b3bed8cc3065afec0c20252df579b102471414b1cacb8412d3c7845f80cb4af35306c9277d7966778e1a084c1f0f2c5dc4f40a7336a131fe31c214e394f5a5db13fe39ebb9102969a1c80ae0b4127cd9dec5fd23a453235de49d4cda42fa18f72d8d237f0b2d15de15f0d07dd351c09357b1f28cf713e602edc204d0ad65da8e643d0395edeab6033096eacbf111e7fabb0330e3f1e91120ba4343df0182c6f9ff4c292551a3309ecfb0dcd218634151ae1c8f52695afb28902f1b29af2a88109702fde54bc6d5a839e87ebc7a7b6e2ec01c2f2b1bd67e0708c40bdb5a2242dc019837a97ce3a7179adc7e526efc7fc77425553b032895f6086440c41fcc2940300374e1dccc07e0f3f6c99501383ce98f94b45bfd4370a96ce3429f11c36ccd1b8e30ee4efaf8e57ba635e7cee7760c87275baf5e3a340f0c811cea04ae22a64b531376a4c242cdc10bb1c1af035e0eb32b1d15f0e42024a4892235e094862feb2a0f2b8810072fa07efad42cf8f45bd6e7afcbbdfbe3b81f81acb3ea548852d9daf5f2ca032c52e18553faa0b6cf0d87e7de001c7fa054b65a7918d474e73bdce9fae72103f4fcfd800573903e30f1571698e4deff7754229043d0499aaeb828de977594c714448cd300baef2c60c9c20c07e0ef58df1bcdf7753cacacbde23068209b2abf46fc211c2c4dfcf071a0a2fc7f0b4cbe78debdfda3c2939f954d32478192d2489fa52efa93a71408863ad36b807927f0f815ce00a263193cf1909046ff1b05f2a58d52a620621c476f620ebbe963d6646afc38038896ab11489b4c51a0f5952ff2f001dc0d70bf5eacc7cd5c034ce3f0252a1c9e7caaac9fe922ac237c99ab20629c013c7d4d86037035f0f3501e90a3fdfe8eb94ac7ff7b084e491378d2d7853feb88476a4478e8e333d393f285d4cd645a03e3fe07ad6b34f587be6df43cd335f73f7e12e8dc946912cb0bcdbd34fc2c7154c2939e4a939a3b406bc569fed476b173b1f66c6316f7e1ff054edc1ab83845fd7d5330fece03c0c057811f3e06460f067efb8971fecca587e58b4dd3092ac451698d4a6e276f6744acf8b50f599f8644f943738b1c14d5cd301c55f0a44c69bddc007c594bf9c8499daf62d1f3cddc7b0de0880d80d376622dadd1df1cf81a30f1175676d5902f27a47a3920ab109ae29faf095d259e0d867f41f568932671ebf14625fa98cdb8a3f03331b4ea0c62f5a856de0fd7fcffd7faffaf3e272b0871784a2a0c597291f16ddcbfb729081f3bd408d9c6392a2b29a665b4435fbed9ec1cbc413ebc83519af056d230cf3149e9a030042ac5f0642f57fa5863d1d38fa7cb71facea6f1dc172f9abc1ddbc7ccc9c0e03728a7685c314aa7d3454ba51983a31c81ec815229e60ed04c394ea968d00b3f69347af8a6a7560e756fa8cd5fb08387eae19f9b9ae30b4b80a3363629d84967084a8572b4d24cc27eab3735c8089069256a7ce8b3f7e262a11ca1f1c5ebd3e09dc3a0d74c67993376037ab56fe886c01be11b94563480f6ca5b0511014a85246b9052bc3abef1d94ff7f24ec08b37984e8a0d61fc31dcb45cba28c1e8554335842ae57578d24e745a4b196b5f04284da623283271f4e3b7341198d37731ee0a43840c0b96ac867487a724cc1b9fa1464a1232fda0410ef6f67ae36ee08a2e0caf862d986ab97396901abfa35046c5bc98ac8f048d56d692300234db5af7840bfcaaeec0a397b0319cd1cb614870e457c08f1f039f3e033c7f2d70e39134081e60338b372595ee2d818b524672840bc00d13497afd4ee012df9c8112abf13b39e45fc0b9fb983ec3779f063c7209f0d00574b1f8cf8ce8eec1eb9bff96f856320b9e74a00bb4bbb25881352414fe006f3a9a9d4cf84b5aad563d6c254a43a12118d7a806276c033cdd0ff86b14dcc830a8124d25b8b3f6342f91540697f184ad803b4fe18d35eb16324b3af29ffdf623ff1b1a84f933be953bc26278b28b209083e0cb12ab2e9cf84be0db7ef6d4ba453fbeff00b8ee10f6de623a8291fafbfe437351e5c68a072ff028927bdfd9c021ff0692358204b71c4bb976d62cd7ae53fd77ef03b79f4837cbb6dd6089d2472820aa2cb562f10745e6504af7a6aa327b1f97aa0b6fde63ba24ba51bbbe5f9f3f6f3ad79fb41df0f22dd99d95f867e9661db7a54d6a774b11c879a2d36d565c8279c21f380b45727a5bcaa4b33a0e37fe1cc997917993673ba87f4475691a54d21addd05b44a7a762bf044b2a8cec5026a4fe0e37e8827ef81870e4c636184185f284e8f46eac65909e72e0baa6d91afdf7fa3ddc60b082178edddb005eec97616fd1051a12eb2d7052b9a657438ac7bbc194f04bfcb877814a65a0e8342eb65be0940977326fde8d0634aaab78283637d15eacb7c16345a789b1dd0227150a445122dc8d8635268c331766c9586f83c78b4e336233004fb9f538d320c28d8635f83be7a55a501ca7014c139de6c562009ec24b2a5638b9d13007ef6898dfe5c566007324b6348894c2eaa58f9e841b0d7430afebb82de24c93582cb1458052ca319b9a7a5adb46753543b2a61e77d13c60e11c652e2f84c2badf2a4b53192af9b94d81fd52857f6db37bf9f3376ccf1ae739a0325e0338da4203e0c2618b22de4b5cd5cd9415b22934b3522f28a1da03f365680c8c66d873c134671af0e327266d81b93c84eee590b7582a192a5154c3aaf1eb8f4c6b8fdd00627481fe4b17c89eb7fe9ca9a62fee111b9a627866450645cb9b5a97161bf5051ac41d27318332de372c7722260c32afff94eda94544a916a54948532a4d1bf58867cb58e269d78e30ea6be0e4ede33480c5f11e82d925f1851b2c2910f91de8d73b94262f5a3d89739651b236218e454577873a4357766341d02a3e7391a9073ec77c5e6bf2a3a8834429c854bc87e0f8c2a0e4d6e3e37e2bf12dcac5cf37662d8db8888b8abe6cfe77ab5f7f002e386055c69a4611f3f359486487fbf6c2f5e625e8c517068dfd228cbf448a4ac5369695d3af6748b6eebf08aa48cc9d81bc8d19138d0e902f75c0182d2fa2623fb7b0159417f7459817732a0445a7de7f18b10dbe49e93fa7b2f87f60f1c8078fe6cff5614967ef3ab651f5149e15ee3f375e5768d44093019c8c3f156270acc97029a5ac2f30773a62192c93ec99c5db9f248415538c0ce5a78697d1a992ac765e861f99ef1f9f66d1e39703dd5a015e9c22b92619ee9d38d3a14d42dcbf80b7ee032a2bf2ff8b60266a2a07aedc79fb99dd24ea31e875de9f64f7993de10d2c6f62e38bfe9cb673dcd9a0cb943745a727632f88492867ed018c1e88bc8ee9e373939095528eef6864cfa31ebc9fe8da02f0b234001ef8ef3903791fec8c73e31140d0c8868298c7059e0d2591a488f227f9dd9679e1c503612e0ce0c80d812f5fca8fcb96ccd1ce4b09937c8e39d34d314caf3500cf0a7dd09bb9035c604d513c63ebd7f4645891a1be3ced00fbe5c60078633cf8cdc232806b0fc96fe4ea892b4df55fcaa6a278df325914dff8d3d4c2a7a665e4690f3c5026b33f03d085638a44e4e3f53bcc659d9775af62ca95e427ed79dc77bc3937f22a298b645102e92d3aed66a13016d324f8438bfe8ee0e18b806e2db35b50250a7588282712ede02ec3dd26fb433017e3f3d723d2c16442def69eb3af692e92b24c182b909d858d02ac9546f414a6cc4639467c011cd711486653d7b026f0da1df93bb85fdd134864f9b3651af2b0cfa2bf6167d1cbfe764a232aff91b055cc182bc571f9d66007942807538729e1d7b58ebb404a28309b3fad51a630bc711713f2eafe462d6d020c389829ded11b00234d092bc57147296b49288ffea695f2e8f453bf7d17910fd6245f94ac7d795e320c7f0e793bffa144a65ff0f37a754c43fffe83fce458f1e592b0521efd35a59d840d326eb4b2414652613e7b3e06bb38b2934a2917d5ea467eb630e2bd3c4ce77b3013f4e254e886d5c25debb326f0ea6dccc5c98fa1de76a28d06b04cb90e011b6478c21649c75ad922a944d89f2b7f19967f8ee096cd0e2a991b6f784a2abc44bab22bd5a829f9175ffdc2efc380eb0f35e9d0a9d5bcfde55965c16ce4655093f5a6236d9448af402047a1549a8a4ec56c18c68b012b0d80bdbaaa2af39b1acd854dbd7b8636b9684a1b533b9fa9c4ec016c8463a7fc598bcf15f1a198728397f8cb0dc14b8367a92b3a0343df32259ef91afc19316bd53e032847a9ec8ece522c3a0902e910b68e84552414b35de7ffed3a6f1630e977de4c1bbdfbdf879b364ab3a6d827b8cb9f0f93e4460f322f8ca7ae61a36d76c16198976714fefbfcd75df06c7559271b0d60e2f236a9be90b5940f946aeb0ce0e96b6afbd67202b4fc7971679839d1b83b9531ed547c71b0295fcab2085020ef2a6b2a229c94d6cab5d6458292ca6dc79b5fa41b853778cf60747fec8a0005d25f6955d3009a28bdad8b04a59473f606fe1a8d021b6ed08dfcf459206542cb165189407aa0549a28223a197ce9a8cc55600d61d88ef9e30536dc583087a5a63686406723902d14219c0cbeacaf7c6edf5d40113b41461e717123820850bfde361e803f0ed7ba104e8640da28fdadbc0cbbe36460f61414d070eecfa881acf7b6af09b72757296d14219c0cbe3452026599756ed0519b44506ee846a459a00c5f278b6cbc01f69092468a104ecb096453e5572b3343df7bc8b5392d94c1fb934b3c1b7b038f55365184104e3559477954b16ddba2025a7ac36c376c15e86502236b2c7cb18b401e52d6562484530d3c690a5f0eb33231ae4b33165744a01ce1460499aa36befd2b958395a62bde0148a96ca5cf3facdc052e0d6cdf055cd717a65d306fca17dbf88d6b5b911a704a239075e1cb830aacac0ff8e809ca19e6572e7ddcb7d4d3645e90f5ed9c988149015c36b8a6647a5ec78c0954f6b02ff263b83774f165e53b404a9ae8f310eba241849cb91b6f86f3a31a4143fbe011e0e4eda81d4a1d53cab93321cece1c209677de7c3470f07aa6a6fa81f3f859f3f3b3aa2867a082aeaa8d8bbf423990b7bfabde014820dbc097110aac8439fbbc698c3a96cdcb9c2336003c31a414d60af0fb33f3b262a93d7d77a917ca746d4f0c46fc8ad9a1dcb5a2ef53307688a933f6c54686c193ad14498353060296494a99022ba18fc937715565b4b5b7bc7b488f66784a5064a4fd5ebc819559f1b54c9a3e81f231bc71356a71a90c35d52c498cda5079495976a0adae0fe9a7b453241d4e9909c40b7b07c04a4edc866fe108dbfe549b5fec4589ccd56149854d272e4c50e79e379ff9ab0e635dc2078f01371c618ae3932bf87c8775601a09778068cf48cf0d48efad6013d3959422b533004f36d4e72b0aac8551a1bfc7441bd366221e175aa637aca72494ce4d4cdefbbd679943fa1f23727f6937ed6fd6479bfa88cbbb007dd6001219167e2adca1580cf3c9536cf017edcfe7dd078183d683c5ebe42565c3da1b408ab5c272bcb2548195044594f733c51f510e2ebe976ee66138f3dbd653924a4ae10194bbc26d27002fde087cf532306630fb73f1dc42d76ad587599665b202eddbf781b7ee3587d9ab7a98227c46c24a56f01912a146e9a397326295bf1647bed84ab9723c6b7f15c900a795b21d021964f52ec0ad97e24b73a7472fa5ce028ffbcf010ef957e64548524a2284e707e6313172c5d2c0fe7d819b8ea224a172521a27b26bbeb944baba8791873c716ba6832f5fdca995185fcfb6fcda548ecb4f05ddf71f9ac622bed8ccd708643b455600a795d212be5ca8542bb015763ca18c22e3d0918f793328834e43a04e7fb8305772799752924a22a464354828c9f4059ff98dcfe61e3c04d3d7e74e9897c1e27a1ab5e94f663317209016d91800d91bbe0c57602d9e421ffdc62381c97f222f833b0e7704ca7d9fba03f584d2dca3083006454cebd37bce340d3326fd96bfa677d4413a65874258fc3f297b2ab23238ad9c52694311210556e385f942fdfbe4b7c7008bcea9cff3f973c01da700276dcb4371fa1bbcf6a4ef204111fd6d1ec819dba7e2727e6f7ac3032f7554ed5ffc6479dd6f763b00f124492dc58230824e4d8de6ffe037f29f05c9b0e95fa38caed02bb7f120ccdb6386236914cb17b4b712524a506c222b67efc95d8dcdbb4d8ecd1fc3e9e6e537158483aad7dce90eef50288b7f8452a248f63b0049484b78548d10588f172e204a88bf7c331bd7c55714c2680e6f93ff1ecd0b3393a333f035e0b3678dcf9e0e23463f7d0afcf23d0dc9e4d5cf9acc436d7c7d7d6974d71e6c0ed9be140846f65091dcec00c458d44f0a0a06465028abf2cf58a636d89331c93778451afc679515f67c4e7e9e2f5f04ceda13e8d42cdd95b3991f94fd15c9dd0e4052d21c7ed4da4111d0a539fbd19a44ad85f3566781b98216362561be13c3bd41a3425afc554a99d22cf70660d85319a8a0a0088a4d3627e3f06387f28deb0c2153421b5d2de6589dbe0bd0a505e04ba1f1153b1e294272eb02115f1a2b172af315141c9d9a00476e043c7231752b79b94543706f7c9e93467cc98436f3a2307d120a8d79caf908a471740660d80cbebc1da12b147dfa44e7662675f7d93213432f5f4c4368780b9f6f7c26f1f1f6993dc3983dea4b2152a5bc89403651246a03280afb094c50400ad6101832657ecf0b3700e3c7b26550fd17e0e2aec7fb03469b983ad1672d23ffee4b21335e398a6b337a0320beb4551e562a1414be213466121b737118aa641515d37ceb977f4fe39efc3b33449929ca3c259358e74ba153ae3c8884b451a4b670aa1b81ec035fbe89364f280663e0c260d3bbb7ef670c9c2a0726cfbfe046355d1c66b29ab73dfb04b0628c291b81b9ccaa07542b43943d14a9039cb2c09373a32f9a89d1187ab73745de6fde03fcfa23152998d26c9f9b949e4a3de11760f8e73ce330abd414eef8521f99a99ca7481c0640d6565e88aabd9255ddebfbae650a701ebf1cf8fa55367fe02d2fd304e857c7a3bfb9783e6f8a19d132853bef3c60d2aa4fddd1b8759e18fc7a49b9f21c3c594b91bac2293b7cd957f9c1a2a850f4d998be72e87fd828cff4127be77ef633e61d036f9d294dc283265d90ecdb293142c584bb9993e9c3b350c6489e7cf9124b31cd4df799bb1bd72d959e80576fa952be53f65624ce1dc010c8a9fa9caaa0c1909eeb1f149964b1f3f73761c5fbce069ee9cfb304172b0d84da4226859a31f751838c920219a3705153d6e4c74f80ef3f32e58f1f3f05bc7a2b13d15834c34219f376efd90648a6d70c3428a628272b628701a4583823f72b4b14c4807d464112350a5ce89230a18c45ec940d3f6a63de45281df9a48e0f530f28bb620a7cbc1a7f9624c58e377cfc2c51ee451769a148b670ca0d013bccc8272b11d4727869a46ae0a5e167c0b14cf9089e6cae482ee0943b7cf195b11184461d8e6a6534024929922b38e5165f4e54a62b703872c834e504457209a7dc1298b4e91c9e071c8ec54a19ba4a73457208a708304dc81ecb419f0187a352791c9eaca748aee1140d816c9e65d6a8c351a5bca16ca14814708a0e4f7666018d3b143bea40353c19a2eca44854708a8e0da588b5c4755094703846c293043a4a912251c1295a3c6984403ac1979f15381cabc4742aed8c5269a44894708a9e2e2ca5946eabd17bcce1f81b81f4d4671345a28653be680a4ffaaea492cce118aff441a93453241f70ca1f94ab08a4173bf6b983711aeec0fb97d297f23b8ae40b4ef925609f56e9ae8c539c1138aac3b5d01d4969a6481ee11403f4ef0229a5866383be277054c193d14a977cf9fc69708a09a3df7200ef095c066983cdec1c4ae165b6e655240638c548208de0cb8ecaebca52050d02c752e54378b2bb3e1b2912139c62a7181ec5b6e41165a10247bd66a1f284d2119e142b12279c6c808246eb8759a4d3dce1b8de1e76a72b0398d8a6cf2245e286933d24a479d899729452a1a0dee0fcfdb1cac948480b456c81937df892503e54162928789ccbf3313cf114b10d4e76625260ef53262b70142453957b79c653c419406d2991e6fa3c891a302e545a505428df2ba7a1445a2a622b9cecc7a30ea93cab4c53e0b09a19caf3e9a255b6c2a930484a7b7d9ead0c7207642ba954862ae72b6b29e20c201a76531e50c62bb00697c5f9a0b2972251e20c80500b3e90a3c31be4b90a62c1b140794b390a9eb456a4d0e054c86c48796c57771c4bb1fad7ca85086453450a154e858f6990d04f19aac01129c39401caee8a143a9cea073da571e8839629c3153872ca18e57a2581aed24c91fa00a7fa8547a56a394019a00c53e0c88a9f94322519999fefce0011e04b6b04b22743a7f0e4935a77b171b93b83940be1c95ed12f7c670051d244d91abe1ca7bca4cc54b042dc25d64bcaf1ca0e4a7345ea319c1a08469a65232665e9b3bf321c4ebb94542ac3947e4a4ad9903f2b451a009c1a2081b4832fdbe8b387723375e71b98315429bf2b0fc29383f5b9b53edb29d2c0e0d480e926c508644d944a477d1e1236ff1e574f13ef96c1939f15ded81e8252d94a9feb22298d1569a8707290ced2246cfbbaa9e22190abe1c9a7ca9c7077a82a90cbb6eaf0b3562ab3954fe0c955746ff4b989b2b6d24411383865c0413dd336fa5c3fac4be8098fa140794f99a4942b15cab2180dc32c74f3192a94f2f0b3bdc7cf1aba77fcecebc39336289562451cb557867350b386a14066397ad221543338469fd787f948a39559ca226589b234cd48cc0e62a8ae0148da3fab0aa94c5bdc4bc3afbd28fc5ea3c3ef7dbd72343cd94de9107ec6d62895268a389c01e49ea41453e6119eb4d267bb1a86b10bb52df5c9fca45bf4f964d82464903256f94b99a9cc55162ad5210bc37f3633fc6fc6867fe6edf06bdc127ecd3ecaceca7f94b5c2efdd8a6a7bfc4c8a386ac7ff03f29b68af526e39b90000000049454e44ae426082');
+CREATE TABLE IF NOT EXISTS "feeds" ("id" INTEGER NOT NULL PRIMARY KEY, "enabled" INTEGER NOT NULL, "self_link" VARCHAR(511) NOT NULL, "error_count" INTEGER NOT NULL, "title" VARCHAR(255) NOT NULL, "alternate_link" VARCHAR(511) NOT NULL, "etag" VARCHAR(255) NOT NULL, "source" CHAR(1) NOT NULL, "last_updated_on" DATETIME, "last_checked_on" DATETIME, "last_status" INTEGER, "icon_url" VARCHAR(511) NOT NULL, "icon_last_updated_on" DATETIME, "next_check_on" DATETIME, "body_hash" VARCHAR(40) NOT NULL, "last_modified" VARCHAR(255) NOT NULL, "icon_id" INTEGER REFERENCES "icons" ("id") ON DELETE SET NULL);
+INSERT INTO feeds VALUES(1,1,'https://lab.passiomatic.com/coldsweat/tests/wrong-feed.xml',1,'404 Test','https://lab.passiomatic.com/coldsweat/','','G',NULL,'2023-07-09 15:04:20.770416',404,'',NULL,NULL,'','',NULL);
+INSERT INTO feeds VALUES(2,1,'https://lab.passiomatic.com/coldsweat/tests/feed1.xml',0,'500px: Editor’s Choice','https://500px.com/editors.rss','"5403-5fc70f2249c07-gzip"','G','2022-06-08 18:58:09','2023-07-09 15:04:21.491449',200,'https://icons.duckduckgo.com/ip3/500px.com.ico','2023-07-09 15:04:21.491449',NULL,'','',1);
+INSERT INTO feeds VALUES(3,1,'https://lab.passiomatic.com/coldsweat/tests/feed2.xml',0,'Ars Technica','https://arstechnica.com','"1451e-5fc70f22d8542-gzip"','G','2023-05-24 13:26:29','2023-07-09 15:04:22.655855',200,'https://icons.duckduckgo.com/ip3/arstechnica.com.ico','2023-07-09 15:04:22.655855',NULL,'','',2);
+INSERT INTO feeds VALUES(4,1,'https://lab.passiomatic.com/coldsweat/tests/feed3.xml',0,'Polygon','https://www.polygon.com/','"33a0-5fc70f2287465-gzip"','G','2023-05-24 13:00:00','2023-07-09 15:04:23.917718',200,'https://icons.duckduckgo.com/ip3/www.polygon.com.ico','2023-07-09 15:04:23.917718',NULL,'','',3);
+INSERT INTO feeds VALUES(5,1,'https://lab.passiomatic.com/coldsweat/tests/feed5.xml',0,'Daring Fireball','https://daringfireball.net/','"22c78-5fc70f2312ec0-gzip"','G','2023-05-24 02:51:01','2023-07-09 15:04:24.987618',200,'https://icons.duckduckgo.com/ip3/daringfireball.net.ico','2023-07-09 15:04:24.987618',NULL,'','',4);
+INSERT INTO feeds VALUES(6,1,'https://lab.passiomatic.com/coldsweat/tests/feed4.xml',0,'Reddit Italy','https://www.reddit.com/r/italy','"10866-5fc711f20eb3b-gzip"','G','2023-05-24 14:13:51','2023-07-09 15:04:26.430919',200,'https://icons.duckduckgo.com/ip3/www.reddit.com.ico','2023-07-09 15:04:26.430919',NULL,'','',5);
+CREATE TABLE IF NOT EXISTS "entries" ("id" INTEGER NOT NULL PRIMARY KEY, "guid" VARCHAR(511) NOT NULL, "feed_id" INTEGER NOT NULL, "title" VARCHAR(255) NOT NULL, "content_type" VARCHAR(255) NOT NULL, "content" TEXT NOT NULL, "thumbnail_url" VARCHAR(511) NOT NULL, "published_on" DATETIME NOT NULL, "author" VARCHAR(255) NOT NULL, "link" VARCHAR(511) NOT NULL, "content_hash" VARCHAR(40) NOT NULL, "compressed_content" BLOB, "guid_hash" VARCHAR(40) NOT NULL, FOREIGN KEY ("feed_id") REFERENCES "feeds" ("id") ON DELETE CASCADE);
+INSERT INTO entries VALUES(1,'https://500px.com/photo/1049390382/-by-oprisco-',2,'*** by oprisco','text/html',replace('<a href="https://500px.com/photo/1049390382"><img src="https://drscdn.500px.org/photo/1049390382/q%3D50_h%3D450/v2?sig=ef71ba188888bfa209c61b176ad1ce2ebff74011a78e4aebc729ce69cc6369ab" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049390382">***</a> by <a href="https://500px.com/oprisco">oprisco </a></h2>\n          <br />\n          <h3>check video backstages on my instagram.com/oprisco/</h3>\n          <br />\n          <small>oprisco : <a href="https://500px.com/oprisco">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 16:50:14','','https://500px.com/photo/1049390382/-by-oprisco-','',NULL,'78c1b730653f894169afd8d52cd8071e078e8017');
+INSERT INTO entries VALUES(2,'https://500px.com/photo/1049369564/navegando-entre-a-espuma-das-palavras-by-António-Leão-de-Sousa',2,'navegando entre a espuma das palavras by António Leão de Sousa','text/html',replace('<a href="https://500px.com/photo/1049369564"><img src="https://drscdn.500px.org/photo/1049369564/q%3D50_h%3D450/v2?sig=bcb7bb166f409c2ed64471246ebbc425d7b84e4f4be574e20d619af0c63dd071" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049369564">navegando entre a espuma das palavras</a> by <a href="https://500px.com/antonio_leao">António Leão de Sousa</a></h2>\n          <br />\n          <h3>          </h3>\n          <br />\n          <small>António Leão de Sousa: <a href="https://500px.com/antonio_leao">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 08:44:08','','https://500px.com/photo/1049369564/navegando-entre-a-espuma-das-palavras-by-António-Leão-de-Sousa','',NULL,'fc351fc6cef7e669f4de2fe6649f62d8cf98d960');
+INSERT INTO entries VALUES(3,'https://500px.com/photo/1049348329/Lighthouse-at-Dyrhólaey--by-Hayden-Scott',2,'Lighthouse at Dyrhólaey  by Hayden Scott','text/html',replace('<a href="https://500px.com/photo/1049348329"><img src="https://drscdn.500px.org/photo/1049348329/q%3D50_h%3D450/v2?sig=eb1c141465d5f4a9baf9fb23e8240427913c3b1866d9cae449cbb20555572892" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049348329">Lighthouse at Dyrhólaey </a> by <a href="https://500px.com/HaydenScott">Hayden Scott</a></h2>\n          <br />\n          <h3>One of many of the Icelandic Lighthouses </h3>\n          <br />\n          <small>Hayden Scott: <a href="https://500px.com/HaydenScott">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-07 19:23:00','','https://500px.com/photo/1049348329/Lighthouse-at-Dyrhólaey--by-Hayden-Scott','',NULL,'51b443cc2b450979d0126742c18de8fda0a7d6b1');
+INSERT INTO entries VALUES(4,'https://500px.com/photo/1049364498/swimming-pool-2014-by-Cristina-Coral',2,'swimming pool 2014 by Cristina Coral','text/html',replace('<a href="https://500px.com/photo/1049364498"><img src="https://drscdn.500px.org/photo/1049364498/q%3D50_h%3D450/v2?sig=04d535273340076036c8af98f9a4b49aa1a94ace76f4ab5d81cdaa729a272d80" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049364498">swimming pool 2014</a> by <a href="https://500px.com/cristinacoral">Cristina Coral</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Cristina Coral: <a href="https://500px.com/cristinacoral">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 06:36:52','','https://500px.com/photo/1049364498/swimming-pool-2014-by-Cristina-Coral','',NULL,'bc85669daf7207424c6140c6502a99cb225d1ba4');
+INSERT INTO entries VALUES(5,'https://500px.com/photo/1049377656/Sleeping-in-the-ocean-by-Sylvain-Girardot',2,'Sleeping in the ocean by Sylvain Girardot','text/html',replace('<a href="https://500px.com/photo/1049377656"><img src="https://drscdn.500px.org/photo/1049377656/q%3D50_h%3D450/v2?sig=fecb46674b905a7ffa6baddad16e5fb7f1ecc188961314b670fd5641a2b1e3ad" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049377656">Sleeping in the ocean</a> by <a href="https://500px.com/sylvaingirardottahiti">Sylvain Girardot</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Sylvain Girardot: <a href="https://500px.com/sylvaingirardottahiti">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-08 11:58:50','','https://500px.com/photo/1049377656/Sleeping-in-the-ocean-by-Sylvain-Girardot','',NULL,'dd83680cf5564448bd12a46bf5232ebf2c0e1220');
+INSERT INTO entries VALUES(6,'https://500px.com/photo/1049332413/Seasoning-Sauce-by-Sarawut-Intarob',2,'Seasoning Sauce by Sarawut Intarob','text/html',replace('<a href="https://500px.com/photo/1049332413"><img src="https://drscdn.500px.org/photo/1049332413/q%3D50_h%3D450/v2?sig=e761e5f2543fe507e0d52653cfeac5f9b4b0be905a47559269c81e68804f51f5" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049332413">Seasoning Sauce</a> by <a href="https://500px.com/sarawutkaka">Sarawut Intarob</a></h2>\n          <br />\n          <h3>Seasoning Sauce</h3>\n          <br />\n          <small>Sarawut Intarob: <a href="https://500px.com/sarawutkaka">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-07 12:34:55','','https://500px.com/photo/1049332413/Seasoning-Sauce-by-Sarawut-Intarob','',NULL,'3c725168387b8458814b54ec4ecae2bd4075575f');
+INSERT INTO entries VALUES(7,'https://500px.com/photo/1049306168/like-a-bird-by-Jordie-Hennigar',2,'like a bird by Jordie Hennigar','text/html',replace('<a href="https://500px.com/photo/1049306168"><img src="https://drscdn.500px.org/photo/1049306168/q%3D50_h%3D450/v2?sig=f0bc9b4fa8f64bf82a9143c30d25c5a41668c58f2b65343580690ac0c066a9c1" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049306168">like a bird</a> by <a href="https://500px.com/jordiehennigar">Jordie Hennigar</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Jordie Hennigar: <a href="https://500px.com/jordiehennigar">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-07 00:50:20','','https://500px.com/photo/1049306168/like-a-bird-by-Jordie-Hennigar','',NULL,'348ea7546610eb7ce3a525787ec5ead769a453dd');
+INSERT INTO entries VALUES(8,'https://500px.com/photo/1049072560/Streets-of-Toronto-by-Rakesh-Baro',2,'Streets of Toronto by Rakesh Baro','text/html',replace('<a href="https://500px.com/photo/1049072560"><img src="https://drscdn.500px.org/photo/1049072560/q%3D50_h%3D450/v2?sig=063c9ddde7477cc43dd07cccdc1d9a2224487c0ed06cfb5d3d472d00cdebe8c2" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049072560">Streets of Toronto</a> by <a href="https://500px.com/RakeshBaro2013">Rakesh Baro</a></h2>\n          <br />\n          <h3>Whenever time permits I go out and do some street photography in Toronto. These are some of them.</h3>\n          <br />\n          <small>Rakesh Baro: <a href="https://500px.com/RakeshBaro2013">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-01 18:22:08','','https://500px.com/photo/1049072560/Streets-of-Toronto-by-Rakesh-Baro','',NULL,'91045ec4e74e7aaa919798a020d1e790427d23a3');
+INSERT INTO entries VALUES(9,'https://500px.com/photo/1049200521/NO-ENTRY-by-Alireza-Bagheri-Sani',2,'NO ENTRY by Alireza Bagheri Sani','text/html',replace('<a href="https://500px.com/photo/1049200521"><img src="https://drscdn.500px.org/photo/1049200521/q%3D50_h%3D450/v2?sig=00a4ed2acef5a3a8c9e9e7d0168cae8867508afa7326959f89b591c53792fd22" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049200521">NO ENTRY</a> by <a href="https://500px.com/alirezabagherisani">Alireza Bagheri Sani</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Alireza Bagheri Sani: <a href="https://500px.com/alirezabagherisani">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-04 17:33:44','','https://500px.com/photo/1049200521/NO-ENTRY-by-Alireza-Bagheri-Sani','',NULL,'e3c1985d981c33e4c8b8ec0c6b6a01e014a1a667');
+INSERT INTO entries VALUES(10,'https://500px.com/photo/1049277127/Sunrise-in-the-Dolomites-by-Michael--Bottari',2,'Sunrise in the Dolomites by Michael  Bottari','text/html',replace('<a href="https://500px.com/photo/1049277127"><img src="https://drscdn.500px.org/photo/1049277127/q%3D50_h%3D450/v2?sig=aa77975d0df2c8cda8bacaf9c22e9d897d0d2491e9eda9ae1d761c4abe75345b" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049277127">Sunrise in the Dolomites</a> by <a href="https://500px.com/michaelbottari">Michael  Bottari</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Michael  Bottari: <a href="https://500px.com/michaelbottari">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-06 10:29:12','','https://500px.com/photo/1049277127/Sunrise-in-the-Dolomites-by-Michael--Bottari','',NULL,'ec777f4b7e90693aa229f63c7ae89074fc562043');
+INSERT INTO entries VALUES(11,'https://500px.com/photo/1049184377/Katya-by-PHOTOGRAPHER-ANNA--',2,'Katya by PHOTOGRAPHER ANNA','text/html',replace('<a href="https://500px.com/photo/1049184377"><img src="https://drscdn.500px.org/photo/1049184377/q%3D50_h%3D450/v2?sig=5de8b5382bb79524399e8d421025acc7c0ea7eb8f0ab9652963cd10e4126e913" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049184377">Katya</a> by <a href="https://500px.com/photographerann">PHOTOGRAPHER ANNA  </a></h2>\n          <br />\n          <h3>instagram  photographer.ann</h3>\n          <br />\n          <small>PHOTOGRAPHER ANNA  : <a href="https://500px.com/photographerann">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-04 10:27:36','','https://500px.com/photo/1049184377/Katya-by-PHOTOGRAPHER-ANNA--','',NULL,'8aeb26406a9305431309b99257a1f5354255cdf3');
+INSERT INTO entries VALUES(12,'https://500px.com/photo/1049245019/Roebuck-by-Gusztáv-Sebestyén',2,'Roebuck by Gusztáv Sebestyén','text/html',replace('<a href="https://500px.com/photo/1049245019"><img src="https://drscdn.500px.org/photo/1049245019/q%3D50_h%3D450/v2?sig=154835a666ba1c19723793a558666b4a42140c18cf90efb2badbb4e9ca7d27d2" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049245019">Roebuck</a> by <a href="https://500px.com/SGuszti">Gusztáv Sebestyén</a></h2>\n          <br />\n          <h3>Thanks for watching!\nFacebook: https://www.facebook.com/sebestyengusztavphotography\nInstagram: https://www.instagram.com/sguszti_photo</h3>\n          <br />\n          <small>Gusztáv Sebestyén: <a href="https://500px.com/SGuszti">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 17:31:05','','https://500px.com/photo/1049245019/Roebuck-by-Gusztáv-Sebestyén','',NULL,'37adbbf5604e7219e7cd54d25053a2343e5dea46');
+INSERT INTO entries VALUES(13,'https://500px.com/photo/1049258253/三幅人像天青色等烟雨-by-三幅人像-',2,'三幅人像：天青色等烟雨 by 三幅人像','text/html',replace('<a href="https://500px.com/photo/1049258253"><img src="https://drscdn.500px.org/photo/1049258253/q%3D50_h%3D450/v2?sig=66c81ceee679de9c23342649189a3d52f92ca647189fe3a14ec5444a42d09112" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049258253">三幅人像：天青色等烟雨</a> by <a href="https://500px.com/vcg-15460c2f64fafb7b3d60055602bbd8524">三幅人像 </a></h2>\n          <br />\n          <h3>目之所及，皆是回忆。心之所向，皆是过往。我们不慌不忙，总以为来日方长。 @无忌  @黄山  @行者｜LC  @姜渔火 /视觉中国  @子晴｜LC  @吉礼  @龙摄天下（刘承斌）  @摄行天下  @都市流浪  @释然  #这几年#  #每一处都有生命#  #清新夏日#  #都市故事#  #路在脚下#  #光影的魅力# </h3>\n          <br />\n          <small>三幅人像 : <a href="https://500px.com/vcg-15460c2f64fafb7b3d60055602bbd8524">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-06 03:23:06','','https://500px.com/photo/1049258253/三幅人像天青色等烟雨-by-三幅人像-','',NULL,'91d9e8b4c0f85d73779ee98271520b86f7448b99');
+INSERT INTO entries VALUES(14,'https://500px.com/photo/1049252765/青山图书馆楼梯-by-FGL-',2,'青山图书馆楼梯 by F.G.L','text/html',replace('<a href="https://500px.com/photo/1049252765"><img src="https://drscdn.500px.org/photo/1049252765/q%3D50_h%3D450/v2?sig=768c77fa8df394f8a620ec28671714bbc66db470879f0d8349bcf0539a62087e" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049252765">青山图书馆楼梯</a> by <a href="https://500px.com/vcg-FGLiu">F.G.L </a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>F.G.L : <a href="https://500px.com/vcg-FGLiu">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 23:54:03','','https://500px.com/photo/1049252765/青山图书馆楼梯-by-FGL-','',NULL,'35f9c709f676d2cc25755e9a8a1f5ebe0a5b3e09');
+INSERT INTO entries VALUES(15,'https://500px.com/photo/1049246537/A-Dream-Within-a-Dream--by-Pedro-Quintela',2,'A Dream Within a Dream  by Pedro Quintela','text/html',replace('<a href="https://500px.com/photo/1049246537"><img src="https://drscdn.500px.org/photo/1049246537/q%3D50_h%3D450/v2?sig=a58e93917a0a9e268f508cbf55bd1b354135d665bcd7a7b4b3ed6e290756cb56" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049246537">A Dream Within a Dream </a> by <a href="https://500px.com/PedroQuintela1">Pedro Quintela</a></h2>\n          <br />\n          <h3>I wanted to shoot in the Palazzo Comunale, Siena (Italy) for many years. Finally, I got the chance to make that trip and found that this was really a dream within a dream... </h3>\n          <br />\n          <small>Pedro Quintela: <a href="https://500px.com/PedroQuintela1">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 18:28:48','','https://500px.com/photo/1049246537/A-Dream-Within-a-Dream--by-Pedro-Quintela','',NULL,'70c1396c7a2a43d29b9ba4bbbeafa59687396f82');
+INSERT INTO entries VALUES(16,'https://500px.com/photo/1049242021/池鹭探鱼-by-黄添福-',2,'池鹭探鱼 by 黄添福','text/html',replace('<a href="https://500px.com/photo/1049242021"><img src="https://drscdn.500px.org/photo/1049242021/q%3D50_h%3D450/v2?sig=42a2445528dcab496b4bfd52f5b3bdaca2a7fc33be1eaa52909d021a2a6a6cc3" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049242021">池鹭探鱼</a> by <a href="https://500px.com/vcg-49622a40246b082753dc9e31cf9831762">黄添福 </a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>黄添福 : <a href="https://500px.com/vcg-49622a40246b082753dc9e31cf9831762">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 16:10:17','','https://500px.com/photo/1049242021/池鹭探鱼-by-黄添福-','',NULL,'f3f19c332b9a7a84771e4ad59bfa589c379abd50');
+INSERT INTO entries VALUES(17,'https://500px.com/photo/1049250340/沙海丽影-by-bingo-',2,'沙海丽影 by bingo','text/html',replace('<a href="https://500px.com/photo/1049250340"><img src="https://drscdn.500px.org/photo/1049250340/q%3D50_h%3D450/v2?sig=e1fe40497e48b0c7f029f1c92605bb17db611194a3d954d2ac0fc1404616e0c0" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049250340">沙海丽影</a> by <a href="https://500px.com/vcg-bingo">bingo </a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>bingo : <a href="https://500px.com/vcg-bingo">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 21:26:42','','https://500px.com/photo/1049250340/沙海丽影-by-bingo-','',NULL,'01f86f1d7ebd85af2ff1b5ada00ef4098f25a524');
+INSERT INTO entries VALUES(18,'https://500px.com/photo/1049247095/The-Apartment-by-Ash-Camas',2,'The Apartment by Ash Camas','text/html',replace('<a href="https://500px.com/photo/1049247095"><img src="https://drscdn.500px.org/photo/1049247095/q%3D50_h%3D450/v2?sig=5ffc8b3526b0c6d6fec8708652b264cff9c67ff37a94352a2249c130cbf2360f" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049247095">The Apartment</a> by <a href="https://500px.com/adyy_cam">Ash Camas</a></h2>\n          <br />\n          <h3></h3>\n          <br />\n          <small>Ash Camas: <a href="https://500px.com/adyy_cam">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 18:43:08','','https://500px.com/photo/1049247095/The-Apartment-by-Ash-Camas','',NULL,'f8c666c7b6767f20846723773b37ca61fd269162');
+INSERT INTO entries VALUES(19,'https://500px.com/photo/1049158020/Lighthouse---by-Joachim-Bergauer',2,'***Lighthouse***   by Joachim Bergauer','text/html',replace('<a href="https://500px.com/photo/1049158020"><img src="https://drscdn.500px.org/photo/1049158020/q%3D50_h%3D450/v2?sig=0eda1ad7edae898bea49c83555a7c4a4c9f6bbc8442f4c2be0a7b68cee8abe6c" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049158020">***Lighthouse***  </a> by <a href="https://500px.com/joachimbergauer">Joachim Bergauer</a></h2>\n          <br />\n          <h3>www.bergauer.cc</h3>\n          <br />\n          <small>Joachim Bergauer: <a href="https://500px.com/joachimbergauer">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-03 19:59:24','','https://500px.com/photo/1049158020/Lighthouse---by-Joachim-Bergauer','',NULL,'fed1b02745f7f89d9bfe34db1252debbcddd79ee');
+INSERT INTO entries VALUES(20,'https://500px.com/photo/1049231221/Lonely-Chapel-by-Marc-Hennige',2,'Lonely Chapel by Marc Hennige','text/html',replace('<a href="https://500px.com/photo/1049231221"><img src="https://drscdn.500px.org/photo/1049231221/q%3D50_h%3D450/v2?sig=d982e95d5ed781c443418413599bcdd00f840ebbe15776a6c6d76f685e709354" /></a>\n          <br /><br />\n          <h2><a href="https://500px.com/photo/1049231221">Lonely Chapel</a> by <a href="https://500px.com/Marc_Hennige">Marc Hennige</a></h2>\n          <br />\n          <h3>Building a little chapel in the middle of a meadow - awesome!\nMore content: https://www.instagram.com/marc.hennige/ </h3>\n          <br />\n          <small>Marc Hennige: <a href="https://500px.com/Marc_Hennige">Photos</a></small>\n          <!--Digg rss verification-->\n          <!--6bb05c4847db4cd09753932043098fb2-->\n          <br /><br />','\n',char(10)),'','2022-06-05 12:31:56','','https://500px.com/photo/1049231221/Lonely-Chapel-by-Marc-Hennige','',NULL,'80da867ec6e6ac233d88cbf4594c7f2412e959db');
+INSERT INTO entries VALUES(21,'https://arstechnica.com/?p=1941623',3,'Internet from a small satellite in geostationary orbit? Sure, why not','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Employees at Astranis'' headquarters in San Francisco react to deployment of the Arcturus satellite this month." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/fb92110a-cdeb-4951-b3cb-4e03db20e695-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/fb92110a-cdeb-4951-b3cb-4e03db20e695.jpg">Enlarge</a> <span class="sep">/</span> Employees at Astranis'' headquarters in San Francisco react to deployment of the Arcturus satellite this month. (credit: Astranis)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>A startup space company says it has successfully deployed and tested a kitchen-stove-sized satellite in geostationary orbit and begun delivering Internet service to Alaska.</p>\n<p>Earlier this month, the ''Arcturus'' satellite, built by a company named Astranis, launched as a rideshare payload on a Falcon Heavy rocket, separating a few hours after liftoff and successfully deploying its solar arrays, boom, and a subreflector.</p>\n<p>After gaining control of the satellite, Astranis began to send commands and update the flight software before raising Arcturus'' orbit and slotting it into a geostationary position directly over Alaska. Once there, the satellite linked up with an Internet gateway in Utah and communicated with multiple user terminals in Alaska, where Astranis will provide high-speed bandwidth to an Internet service provider, Pacific Dataport.</p></div><p><a href="https://arstechnica.com/?p=1941623#p3">Read 8 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941623&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 13:06:14','Eric Berger','https://arstechnica.com/?p=1941623','',NULL,'3ab1a8587904ba53020739a49b4788e70e4ee7cc');
+INSERT INTO entries VALUES(22,'https://arstechnica.com/?p=1941045',3,'AMD Radeon RX 7600 review: Another water-treading mid-range GPU for $269','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="AMD''s Radeon RX 7600." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/IMG_1114-800x533.jpeg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/IMG_1114.jpeg">Enlarge</a> <span class="sep">/</span> AMD''s Radeon RX 7600. (credit: Andrew Cunningham)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Earlier this month, AMD briefed the press on its first mainstream RX 7000-series card, the RX 7600. A mostly incremental upgrade over the original RX 6600 but with many of the new features from the <a href="https://arstechnica.com/gadgets/2022/12/review-amds-radeon-rx-7900-gpus-are-great-4k-gaming-gpus-with-caveats/">RX 7900 XTX and XT</a>, it would come with a price cut, from the RX 6600''s $329 to $299. Nvidia then briefed the press on its new mainstream RTX 4060 series. The prices for the higher-end 8GB and 16GB RTX 4060 Ti are already set at $399 and $499. The price for the lower-end RTX 4060 was left undisclosed.</p>\n<p>A few days later, presumably having caught wind of AMD''s pricing plan for the RX 7600, Nvidia <a href="https://arstechnica.com/gadgets/2023/05/nvidias-399-4060-ti-comes-with-no-price-hike-but-mild-performance-improvements/">announced the price for the RTX 4060</a>: also a surprisingly low $299. (This entire time, review embargoes and briefings have been shifting by a few days here and there as the companies maneuver around each other.) Then, around 36 hours before this article was published, a new update came from AMD: The RX 7600 will now be launching for $269, $30 less than the RTX 4060 and $50 less than the old RX 6600.</p>\n\n<p>This is what competition in the mid-range GPU market looks like after a years-long cryptocurrency-and-scalper-fueled shortage and many more months of Nvidia and AMD focusing on their pricey flagships. These are new, modern cards with modern features available at a price that can at least be called "literally affordable" even if they aren''t quite "budget."</p></div><p><a href="https://arstechnica.com/?p=1941045#p3">Read 18 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941045&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 13:00:05','Andrew Cunningham','https://arstechnica.com/?p=1941045','',NULL,'205fb0529906fffbbe6fb25fa2f1eacb55ad8eb6');
+INSERT INTO entries VALUES(23,'https://arstechnica.com/?p=1941561',3,'BMW plays it safe with design of new electric sedan, the 2024 i5','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="BMW i5 in grey, seen from the front 3/4s" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-1-800x600.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-1-scaled.jpg">Enlarge</a> <span class="sep">/</span> The eighth-generation 5 Series has the least-outrageous styling we''ve seen from BMW in some time. (credit: Jonathan Gitlin)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<aside class="pullbox sidebar fullwidth">BMW provided flights from DC to Milan and back, plus three nights in a hotel so we could get a preview of the new 5 Series and i5. Ars does not accept paid editorial content.</aside>\n<p>COMO, ITALY—BMW has earned a reputation for challenging car designs. It''s not a new thing, either. People mocked the Z1''s disappearing doors. The Z3 coupe''s "clown shoe" nickname was not at all affectionate. And few could find a kind word about the infamous "Bangle butt" on the fourth-gen 7 Series. But it doesn''t take those kinds of risks with every model, particularly not the latest 5 Series, which now includes a fully electric i5.</p>\n<p>The 5 Series is BMW''s midsize sedan, and until the advent of the luxury SUV—a category that BMW basically invented—it was the company''s bread and butter. There''s a new 5 Series out this October, the eighth generation to bear the nameplate. Like other recent BMWs, it uses the manufacturer''s latest flexible architecture that supports battery-electric, plug-in hybrid, and conventional powertrains, something we''ve seen to good effect with the <a href="https://arstechnica.com/cars/2021/10/the-2023-bmw-i4-is-the-electric-bmw-sedan-youve-been-waiting-for/">4 Series</a> and particularly with last year''s <a href="https://arstechnica.com/cars/2022/11/how-the-the-wire-helped-me-understand-the-2023-bmw-760i-xdrive/">7 Series</a> and <a href="https://arstechnica.com/cars/2022/11/testing-bmws-biggest-and-best-sedan-now-fully-electric-the-2023-i7/">i7</a>.</p>\n<div class="image shortcode-img center"><a href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-12-scaled.jpg"><img alt="Now try to picture it wearing a taxi livery or perhaps a police version." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-12-980x735.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2024-BMW-i5-preview-12-scaled.jpg" rel="nofollow">Now try to picture it wearing a taxi livery or perhaps a police version.</a> (credit: Jonathan Gitlin)</p></div>\n<h2>The sedan is not dead</h2>\n<p>"We''re particularly happy with how it turned out proportion-wise. I think it is a long, elegant, sporty sedan, and that, for me, is the essence of any BMW anyway. And the 5 series, of course, is the core of the brand in many, many markets," said Adrian van Hooydonk, design director at BMW Group.</p></div><p><a href="https://arstechnica.com/?p=1941561#p3">Read 13 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941561&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 12:00:42','Jonathan M. Gitlin','https://arstechnica.com/?p=1941561','',NULL,'8958486ca1defa09c6e4cfdd9aec13d1d9abd702');
+INSERT INTO entries VALUES(24,'https://arstechnica.com/?p=1941281',3,'Dealmaster: Save on Lenovo’s latest ThinkPad X1 Gen 11 laptop, and more','text/html',replace('<div id="rss-wrap">\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Summer is so close we can almost smell the suntan lotion and burnt hot dogs. Today''s Dealmaster has the usual office fare—including a great deal on Lenovo''s gold-standard business-class <a href="https://howl.me/cjNRIP1B6zM" rel="noopener" target="_blank">ThinkPad X1</a> Carbon series, including the <a href="https://howl.me/cjNRHe4tlBm" rel="noopener" target="_blank">Gen 11 model</a> with Intel''s 13th Gen processor—but also a few picks for relaxing and travel. That includes a great price on Sony''s highly rated <a href="https://amzn.to/43jDZAq" rel="noopener" target="_blank">WH-1000XM5</a> noise-canceling headphones, as well as <a href="https://howl.me/cjNRAnazb3P" rel="noopener" target="_blank">Microsoft''s Surface Pro 9</a> tablet.</p>\n<h2>Featured deals</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2022/08/IMG_0331.jpeg"><img alt="Lenovo''s ThinkPad X1 Carbon Gen 10." src="https://cdn.arstechnica.net/wp-content/uploads/2022/08/IMG_0331-640x427.jpeg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2022/08/IMG_0331.jpeg" rel="nofollow">Lenovo''s ThinkPad X1 Carbon Gen 10.</a> (credit: Andrew Cunningham)</p></div>\n<ul>\n<li>Lenovo ThinkPad X1 Carbon Gen 11 laptop starting at $1,598 with THINKVICW1 coupon (was $2,619) at <a href="https://howl.me/cjNRHe4tlBm" rel="noopener" target="_blank">Lenovo</a></li>\n<li>Lenovo ThinkPad X1 Carbon Gen 10 laptop for $1,804 with THKNKMEMDEALS coupon (was $3,609) at <a href="https://howl.me/cjNRIP1B6zM" rel="noopener" target="_blank">Lenovo</a></li>\n</ul>\n<h2>Headphones</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2022/05/Sony-WH-1000XM5-and-folded-Sony-WH-1000XM4.jpg"><img alt="The WH-1000XM5''s earcups can''t fold up for easier storage, sadly." src="https://cdn.arstechnica.net/wp-content/uploads/2022/05/Sony-WH-1000XM5-and-folded-Sony-WH-1000XM4-640x427.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2022/05/Sony-WH-1000XM5-and-folded-Sony-WH-1000XM4.jpg" rel="nofollow">The WH-1000XM5''s earcups can''t fold up for easier storage, sadly.</a> (credit: Jeff Dunn)</p></div>\n<ul>\n<li>Sony WH-1000XM5 noise-canceling headphones for $348 (was $400) at <a href="https://amzn.to/43jDZAq" rel="noopener" target="_blank">Amazon</a></li>\n<li>Sony WH-1000XM4 noise-canceling headphones for $278 (was $350) at <a href="https://amzn.to/45pSoNa" rel="noopener" target="_blank">Amazon</a> | $280 at <a href="https://howl.me/cjNROjNeYiC" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Sony LinkBud S noise-canceling earbuds for $150 (was $200) at <a href="https://amzn.to/3IwKWpx" rel="noopener" target="_blank">Amazon</a> | $150 at <a href="https://howl.me/cjNRRpLN57o" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Apple AirPods Pro (2nd Gen) for $200 (was $250) at <a href="https://howl.me/cjNRPO7j8o0" rel="noopener" target="_blank">Best Buy</a></li>\n</ul>\n<h2>Desktop and laptop PCs</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2022/10/render_04_RGB_engrave.jpg"><img alt="A snazzy sub-variant of the blue Surface Pro 9 includes an intricate pattern called &quot;Liberty,&quot; which will sadly only be available at Liberty and Microsoft Stores and only for a limited time." src="https://cdn.arstechnica.net/wp-content/uploads/2022/10/render_04_RGB_engrave-640x360.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2022/10/render_04_RGB_engrave.jpg" rel="nofollow">A snazzy sub-variant of the blue Surface Pro 9 includes an intricate pattern called "Liberty," which will sadly only be available at Liberty and Microsoft Stores and only for a limited time.</a> (credit: Microsoft)</p></div>\n<ul>\n<li>Microsoft Surface Pro 9 with Core i5 and Signature Keyboard bundle for $1,000 (was $1,280) at <a href="https://howl.me/cjNRAnazb3P" rel="noopener" target="_blank">Best Buy</a></li>\n<li>HP Spectre 2-in-1 with Intel Core i7 for $1,150 (was $1,650) at <a href="https://howl.me/cjNRCGXbbeT" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Lenovo Yoga 7i 2-in-1 with Intel Core i5 for $700 (was $850) at <a href="https://howl.me/cjNRD8APkBH" rel="noopener" target="_blank">Best Buy</a></li>\n<li>HP Victus 15L gaming desktop with AMD Ryzen 7 5700G and Radeon RX 6600XT for $750 (was $1,260) at <a href="https://amzn.to/3IYuPBJ" rel="noopener" target="_blank">Amazon</a></li>\n<li>Asus ROG Strix G15 gaming desktop with Intel Core i7-12700F and Nvidia RTX 3060 for $1,355 (was $1,430) at <a href="https://amzn.to/3IAgH18" rel="noopener" target="_blank">Amazon</a></li>\n<li>Cyberpower Gamer Xtreme gaming desktop with Intel Core i5-12400F and RTX 3050 for $850 (was $950) at <a href="https://amzn.to/43h0Ddb" rel="noopener" target="_blank">Amazon</a></li>\n<li>Zotak MEK Hero G1 gaming desktop with AMD Ryzen 7 5800X and RTX 3070 for $1,260 (was $1,900) at <a href="https://amzn.to/42ZNqoB" rel="noopener" target="_blank">Amazon</a></li>\n<li>MSI Pulse GL76 17.3-inch gaming laptop with Intel Core i7-12700H and RTX 3060 for $1,150 (was $1,400) at <a href="https://amzn.to/3q9cif4" rel="noopener" target="_blank">Amazon</a></li>\n<li>MSI Stealth 15M gaming laptop with Intel Core i7-1260P and RTX 3060 for $1,150 (was $1,400) at <a href="https://amzn.to/43nSovw" rel="noopener" target="_blank">Amazon</a></li>\n<li>Acer Swift X creator laptop with AMD Ryzen 7 5825U and RTX 3050 Ti for $800 (was $1,100) at <a href="https://amzn.to/3OAwqB7" rel="noopener" target="_blank">Amazon</a></li>\n<li>Asus TUF F17 gaming laptop with Intel Core i5-11400H and RTX 3050 for $800 (was $900) at <a href="https://amzn.to/3IwLI6b" rel="noopener" target="_blank">Amazon</a></li>\n<li>MSI Stealth 17 Studio gaming laptop with 13th Gen Intel Core i9 and RTX 4080 for $2,640 (was $2,800) at <a href="https://amzn.to/3BRXX9O" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Drones</h2>\n<div class="image shortcode-img center full"><img src="https://cdn.arstechnica.net/wp-content/uploads/2018/11/dji-mavic-air.jpg" /></div>\n<ul>\n<li>DJI Air 2S Quadcopter drone with 5.4K video recording for $849 (was $999) at <a href="https://amzn.to/45COuki" rel="noopener" target="_blank">Amazon</a></li>\n<li>DJI Air 2S Fly More Combo for $1,109 (was $1,299) at <a href="https://amzn.to/3MtJ2Y7" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Robot vacuums</h2>\n<ul>\n<li>iRobot Roomba j6+ robot vacuum for $650 (was $800) at <a href="https://amzn.to/3q12Ieh" rel="noopener" target="_blank">Amazon</a></li>\n<li>iRobot Braava Jet m6 robot mop for $400 (was $500) at <a href="https://amzn.to/45tMTNI" rel="noopener" target="_blank">Amazon</a></li>\n<li>iRobot Roomba s9+ robot vacuum for $899 (was $999) at <a href="https://howl.me/cjNTHbnExpB" rel="noopener" target="_blank">Best Buy</a></li>\n<li>iRobot Roomba i3+ EVO robot vacuum for $500 (was $550) at <a href="https://howl.me/cjNTKOdPR9w" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Roborock s7 smart vacuum and mop for $400 (was $650) at <a href="https://amzn.to/43jGjYa" rel="noopener" target="_blank">Amazon</a></li>\n<li>Narwal Freo smart vacuum and mop with auto dry for $1,000 after coupon (was $1,400) at <a href="https://amzn.to/3q15C2F" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Gaming accessories</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2019/08/steelseries7.jpg"><img src="https://cdn.arstechnica.net/wp-content/uploads/2019/08/steelseries7-640x752.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2019/08/steelseries7.jpg" rel="nofollow"></a> (credit: SteelSeries)</p></div>\n<ul>\n<li>SteelSeries Arctis 9 wireless gaming headset for $126 (was $200) at <a href="https://amzn.to/3q3Zt63" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Stratus Duo wireless gaming controller for $39 (was $60) at <a href="https://amzn.to/41WSUPS" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Arctis Nova 3 gaming headset for $70 (was $100) at <a href="https://amzn.to/43gmy3q" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Arena 7 2.1 desktop speakers for $240 (was $300) at <a href="https://amzn.to/45ukZAT" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Rival 5 wired gaming mouse for $40 (was $60) at <a href="https://amzn.to/3IAILBq" rel="noopener" target="_blank">Amazon</a></li>\n<li>SteelSeries Arctis 1 wireless gaming headset for $63 (was $100) at <a href="https://amzn.to/3ol1YjV" rel="noopener" target="_blank">Amazon</a></li>\n<li>Logitech Blue Yeti USB microphone for $90 (was $130) at <a href="https://amzn.to/45CR61A" rel="noopener" target="_blank">Amazon</a></li>\n</ul>\n<h2>Smart home and personal care</h2>\n<div class="image shortcode-img center large"><a href="https://cdn.arstechnica.net/wp-content/uploads/2023/04/Ecobee-Smart-Thermostat-scaled.jpg"><img alt="Ecobee''s Smart Thermostat comes with a presence sensor to automatically shut off when no one''s around." src="https://cdn.arstechnica.net/wp-content/uploads/2023/04/Ecobee-Smart-Thermostat-640x360.jpg" /></a><p class="caption" style="font-size: 0.8em;"><a class="caption-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/04/Ecobee-Smart-Thermostat-scaled.jpg" rel="nofollow">Ecobee''s Smart Thermostat comes with a presence sensor to automatically shut off when no one''s around.</a> (credit: Chuong Nguyen)</p></div>\n<ul>\n<li>Levoit smart air purifier for homes up to 1,900 square feet for $155 after coupon (was $190) at <a href="https://amzn.to/3ojQE7D" rel="noopener" target="_blank">Amazon</a></li>\n<li>ecobee Smart Thermostat Enhanced for $170 (was $190) at <a href="https://amzn.to/43gUoWN" rel="noopener" target="_blank">Amazon</a> | $170 at <a href="https://howl.me/cjNRST0THkn" rel="noopener" target="_blank">Best Buy</a></li>\n<li>ecobee Smart Thermostat Premium with smart sensors for $240 (was $330) at <a href="https://amzn.to/3IwFovt" rel="noopener" target="_blank">Amazon</a></li>\n<li>ecobee Smart Thermostat Enhanced with smart sensors for $190 (was $270) at <a href="https://amzn.to/3or4KEc" rel="noopener" target="_blank">Amazon</a></li>\n<li>ecobee smart sensors (2-pack) for $60 (was $80) at <a href="https://amzn.to/43l0btJ" rel="noopener" target="_blank">Amazon</a></li>\n<li>TP-Link Deco XE75 Pro AXE5400 (2-pack) mesh Wi-Fi 6E for $270 (was $350) at <a href="https://amzn.to/431PLzo" rel="noopener" target="_blank">Amazon</a></li>\n<li>Philips Sonicare DiamondClean Smart 9300 electric toothbrush for $200 (was $230) at <a href="https://howl.me/cjNTbJGJIi3" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Philips Sonicare Power Flosser 3000 cordless for $65 (was $80) at <a href="https://howl.me/cjNTcVVsVhP" rel="noopener" target="_blank">Best Buy</a></li>\n</ul>\n<h2>Kitchen, grilling, and power tools</h2>\n<ul>\n<li>Ninja OG751 Woodfire Pro outdoor grill and smoker for $350 (was $400) at <a href="https://amzn.to/41XsddH" rel="noopener" target="_blank">Amazon</a></li>\n<li>Ninja Compact Kitchen System with blender and food processor for $130 (was $160) at <a href="https://amzn.to/430GTKF" rel="noopener" target="_blank">Amazon</a></li>\n<li>Ninja KT200 electric kettle for $70 (was $90) at <a href="https://amzn.to/3BSRAmm" rel="noopener" target="_blank">Amazon</a></li>\n<li>Dewalt 20V MAX cordless drill and impact driver combo kit for $149 (was $239) at <a href="https://amzn.to/3q45ShB" rel="noopener" target="_blank">Amazon</a></li>\n<li>Ooni Karu multi-fuel outdoor pizza oven for $640 (was $800) at <a href="https://howl.me/cjNS6dui6Mx" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Ooni Koda 16 gas outdoor pizza oven for $480 (was $600) at <a href="https://howl.me/cjNS7rbbi7X" rel="noopener" target="_blank">Best Buy</a></li>\n<li>Weber Genesis S-w335 propane gas grill for $1,329 (was $1,429) at <a href="https://howl.me/cjNS9mDWaFp" rel="noopener" target="_blank">Best Buy</a></li>\n</ul>\n\n</div><p><a href="https://arstechnica.com/?p=1941281">Read on Ars Technica</a> | <a href="https://arstechnica.com/?p=1941281&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-24 11:00:02','Chuong Nguyen','https://arstechnica.com/?p=1941281','',NULL,'688ee25947d44cb4cc6ab0795f4513f9f212b764');
+INSERT INTO entries VALUES(25,'https://arstechnica.com/?p=1941212',3,'Your fave illustration of Franklin’s kite experiment is likely riddled with errors','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Hand-colored lithograph of Ben Franklin''s kite experiment published by Currier &amp; Ives in 1876" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/franklin1CROP-800x533.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/franklin1CROP.jpg">Enlarge</a> <span class="sep">/</span> Hand-colored lithograph published by Currier &amp; Ives in 1876, probably the most widely distributed illustration of Benjamin Franklin''s kite experiment. Franklin is wrongly shown to be holding the string in one hand above where the key is attached. (credit: Public domain)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Most Americans are familiar with the story of <a href="https://en.wikipedia.org/wiki/Benjamin_Franklin">Benjamin Franklin</a> and his famous <a href="https://en.wikipedia.org/wiki/Kite_experiment">18th-century experiment</a> in which he attached a metal key <a href="https://founders.archives.gov/documents/Franklin/01-04-02-0135">to a kite</a> during a thunderstorm to see if the lightning would pass through the metal. That''s largely due to many iconic illustrations commemorating the event that found their way into the popular imagination and became part of our shared cultural lore. But most of those classic illustrations are riddled with historical errors, according to a <a href="https://link.springer.com/article/10.1007/s11191-023-00421-y">new paper</a> published in the journal Science and Education.</p>\n<p>Franklin''s <a href="https://arstechnica.com/science/2019/11/that-time-benjamin-franklin-tried-and-failed-to-electrocute-a-turkey/">explorations into electricity</a> began as he was approaching 40 years old after his thriving career as an entrepreneur in the printing business. His scientific interest was piqued in 1743 when he saw a demonstration by scientist/showman <a href="https://en.wikipedia.org/wiki/Archibald_Spencer">Archibald Spencer</a>, known for performing various amusing parlor tricks involving electricity. He soon started a correspondence with a British botanist named <a href="https://en.wikipedia.org/wiki/Peter_Collinson_(botanist)">Peter Collinson</a> and began reproducing some of Spencer''s impressive parlor tricks in his own home.</p>\n<p>He would have guests rub a tube to create static and then have them kiss, producing an electrical shock. He designed a fake spider suspended by two electrified wires so that it seemed to swing back and forth of its own accord. And he devised a game dubbed "Treason," whereby he wired up a portrait of King George so that anyone who touched the monarch''s crown would be shocked. And he once infamously shocked himself while trying to kill a turkey with electricity. </p></div><p><a href="https://arstechnica.com/?p=1941212#p3">Read 13 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941212&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 22:46:20','Jennifer Ouellette','https://arstechnica.com/?p=1941212','',NULL,'4c695026662132313a7529ef49045794e55455b7');
+INSERT INTO entries VALUES(26,'https://arstechnica.com/?p=1941492',3,'Widespread FBI abuse of foreign spy law sets off “alarm bells,” tech group says','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Widespread FBI abuse of foreign spy law sets off “alarm bells,” tech group says" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-73534290-800x534.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-73534290.jpg">Enlarge</a> (credit: <a class="caption-link" href="https://www.gettyimages.com/detail/news-photo/the-seal-of-the-f-b-i-hangs-in-the-flag-room-at-the-bureaus-news-photo/73534290" rel="nofollow">Chip Somodevilla / Staff | Getty Images North America</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>The FBI isn''t supposed to use <a href="https://arstechnica.com/tech-policy/2023/02/the-fbis-most-controversial-surveillance-tool-is-under-threat/2/">its most controversial spy tool</a> to snoop on emails, texts, and other private communications of Americans or anyone located in the United States. However, that didn''t stop the FBI from sometimes knowingly using its Foreign Intelligence Surveillance Act (FISA) Section 702 powers to conduct warrantless searches on US persons more than 280,000 times in 2020 and 2021, according to <a href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/US-Foreign-Intelligence-Surveillance-Court-Section-702-FBI-report-4-21-2022.pdf">new disclosures</a>. US Senator Ron Wyden (D-Ore.) <a href="https://www.wyden.senate.gov/news/press-releases/wyden-calls-for-reforms-to-fisa-surveillance-following-disclosure-of-new-abuses">described</a> the searches as  "shocking abuses."</p>\n<p>Among the most concerning <a href="https://cdt.org/insights/cdt-issue-brief-debunking-myths-fixing-fisa-s702-backdoor-search-loophole/">so-called backdoor searches</a> on Americans were disclosures that the FBI ran more than 23,000 queries on people involved in storming the US Capitol, 19,000 on political campaign donors, and 133 on protesters after the police killing of George Floyd. The deputy director of the Center for Democracy and Technology''s Security and Surveillance Project, Jake Laperruque, said that "these latest revelations should set off alarm bells across Congress," urging lawmakers in a <a href="https://cdt.org/press/shocking-new-fbi-political-surveillance-disclosures-highlight-need-for-fisa-reform/">statement</a> not to re-authorize FISA Section 702 at the end of this year—when it''s due to expire—without a "full overhaul."</p>\n<p>"The systemic misuse of this warrantless surveillance tool has made FISA 702 as toxic as COINTELPRO and the FBI abuses of the Hoover years," Laperruque said, while his group''s press release noted that the court opinion "confirmed the worst fears of civil rights and civil liberties advocates.</p></div><p><a href="https://arstechnica.com/?p=1941492#p3">Read 30 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941492&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 22:09:25','Ashley Belanger','https://arstechnica.com/?p=1941492','',NULL,'96febf4b2568cb95f7cdc11c4fc2fabeaa7b5715');
+INSERT INTO entries VALUES(27,'https://arstechnica.com/?p=1941574',3,'Netflix crackdown on account sharing hits US with $8 fee for each extra user','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Illustration of a house with a Netflix logo and several TV screens." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/netflix-household-800x532.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/netflix-household.jpg">Enlarge</a> (credit: Netflix)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Netflix is now telling US customers to stop sharing accounts with people outside their households or pay $7.99 a month for each extra member. "Your Netflix account is for you and the people you live with—your household," Netflix says in an email targeted at customers whose accounts are being used in multiple locations.</p>\n<p>The email provides two options: transfer the extra person''s profile to a new membership that they can pay for separately, or spend $7.99 a month extra to "share your Netflix account with someone who doesn''t live with you."</p>\n<p>"Starting today, we will be sending this email to members who are sharing Netflix outside their household in the United States," <a href="https://about.netflix.com/en/news/update-on-sharing-may-us">Netflix announced</a>.</p></div><p><a href="https://arstechnica.com/?p=1941574#p3">Read 4 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941574&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 21:35:18','Jon Brodkin','https://arstechnica.com/?p=1941574','',NULL,'d2bc32a337200e8bffd8f2b74f6551c7ef1ab522');
+INSERT INTO entries VALUES(28,'https://arstechnica.com/?p=1941475',3,'Fake Pentagon “explosion” photo sows confusion on Twitter','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A fake AI-generated image of an " src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/AI_explosion_image-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/AI_explosion_image.jpg">Enlarge</a> <span class="sep">/</span> A fake image of an "explosion" near the Pentagon that went viral on Twitter. (credit: Twitter)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>On Monday, a <a href="https://twitter.com/AndyBCampbell/status/1660654574644887558?s=20">tweeted</a> AI-generated image suggesting a large explosion at the Pentagon led to brief confusion, which included a reported small drop in the stock market. It originated from a verified Twitter account named "Bloomberg Feed," unaffiliated with the well-known Bloomberg media company, and was quickly exposed as a hoax. However, before it was debunked, large accounts such as Russia Today had already spread the misinformation, <a href="https://www.washingtonpost.com/technology/2023/05/22/pentagon-explosion-ai-image-hoax/">The Washington Post reported</a>.</p>\n\n<p>The fake image depicted a large plume of black smoke alongside a building vaguely reminiscent of the Pentagon with the tweet "Large Explosion near The Pentagon Complex in Washington D.C. — Inital Report." Upon closer inspection, local authorities confirmed that the image was not an accurate representation of the Pentagon. Also, with blurry fence bars and building columns, it looks like a fairly sloppy AI-generated image created by a model like <a href="https://arstechnica.com/information-technology/2022/09/with-stable-diffusion-you-may-never-believe-what-you-see-online-again/">Stable Diffusion</a>.</p>\n<p>Before Twitter suspended the false Bloomberg account, it had a total post count of 224,000 tweets and had reached fewer than 1,000 followers overall, according to the Post, but it''s unclear who ran it or the motives behind sharing the false image. In addition to Bloomberg Feed, other accounts that shared the false report include “Walter Bloomberg” and “Breaking Market News," both unaffiliated with the real Bloomberg organization.</p></div><p><a href="https://arstechnica.com/?p=1941475#p3">Read 6 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941475&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 21:01:42','Benj Edwards','https://arstechnica.com/?p=1941475','',NULL,'0fcd921e874c201e74f1da7df0a8ed97f2b4df8f');
+INSERT INTO entries VALUES(29,'https://arstechnica.com/?p=1941294',3,'The $1,600 Dyson 360 Vis Nav promises to be the world’s most powerful robovac','text/html',replace('<div id="rss-wrap">\n\n\n\n\n\n<div><a name="page-1"></a></div>\n  <ul class="gallery shortcode-gallery gallery-wide">\n          <li>\n        <div class="gallery-item-content">\n          <div class="gallery-image"><img alt="" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/RB03_SUBLNK_034_RGB_FrontOn3QVert_A4_REFW-980x569.jpg" /></div>\n          <p>\n            The extremely colored Dyson 360 Vis Nav.                          [credit:\n                              Dyson                            ]\n                      </p>\n        </div>\n      </li>\n      </ul>\n\n<p>Swanky vacuum manufacturer Dyson has had a turbulent relationship with robovacs. The company''s first swing at the idea came in 2016 with the <a href="https://www.dyson.com/support/journey/guides/64989-01?machineId=64989-01">Dyson 360 Eye</a>, which sported a weird tall and stumpy form factor that didn''t fit under furniture. A 2020 sequel, the <a href="https://www.dyson.ie/vacuum-cleaners/robot-vacuums/dyson-360-heurist/dyson-360-heurist-overview">Dyson 360 Heurist</a>, kept the ultra-tall form factor and<a href="https://www.techradar.com/news/first-look-dyson-360-heurist-robot-wants-to-be-the-smartest-vacuum-cleaner-ever"> wasn''t even released</a> in the US as a result. This new robovac, the "<a href="https://www.dyson.co.uk/newsroom/overview/news/may-2023/dyson-launches-most-powerful-robot-vacuum">Dyson 360 Vis Nav</a>," opts for a more typical low, wide body design, making it look like a normal robot vacuum. Or at least, it''s as normal as a Dyson product can ever look—it still has a screaming metallic purple paint job and what looks like a silver <em>Alien</em>-like facehugger on the top deck.</p>\n<p>Old Dyson robovacs were around 9 inches wide and 4.7 inches tall, so the company previously opted for a robot with a small footprint and a tall body. That theoretically allowed it to maneuver into tighter places than your average short, flat disk vacuum, but it can''t kill the dust bunnies under the couch. Dyson says this new model can fit under a 99 mm (3.9 inch) tall gap, which is right in line with the normal height of a Roomba. It''s also D-shaped now, like a Neato vac or <a href="https://arstechnica.com/gadgets/2019/05/the-2019-roomba-gets-an-all-new-design-companion-mop-bot/">high-end Roomba</a>, which allows for a wider coverage path and to really get into those corners.</p>\n<p>Edge coverage is normally done by a spinning brush, but you won''t find one here. Instead, there is what looks like an extendable, L-shaped red squeegee just behind the brush bar. When the robot detects a wall, the squeegee extends to connect with the wall, and Dyson says this will "redirect suction" and pick up everything.</p></div><p><a href="https://arstechnica.com/?p=1941294#p3">Read 6 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941294&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 20:17:24','Ron Amadeo','https://arstechnica.com/?p=1941294','',NULL,'f654a42774b24a3f7aaca7031a29c4f8ba348b04');
+INSERT INTO entries VALUES(30,'https://arstechnica.com/?p=1941465',3,'Woman with untreated TB still on the lam three months after arrest warrant','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Scanning electron micrograph of &lt;em&gt;Mycobacterium tuberculosis&lt;/em&gt; bacteria, which cause TB." src="https://cdn.arstechnica.net/wp-content/uploads/2015/03/5149398678_97948614ea_o-514x640.jpg" />\n      <p class="caption" style="font-size: 0.8em;">Scanning electron micrograph of <em>Mycobacterium tuberculosis</em> bacteria, which cause TB. (credit: <a class="caption-link" href="http://www.flickr.com/photos/niaid/5149398678/" rel="nofollow">National Institute of Allergy and Infectious Diseases</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>A woman with an <a href="https://arstechnica.com/science/2023/02/us-woman-has-walked-around-with-untreated-tb-for-over-a-year-now-faces-jail/">untreated infectious case of tuberculosis</a> and a months-old civil warrant out for her arrest continues to evade the sheriff''s department in Tacoma, Washington, drawing local frustration.</p>\n<p> On Friday, the woman failed to show up <a href="https://arstechnica.com/science/2023/03/us-woman-headed-to-jail-for-refusing-tb-treatment-for-over-a-year/">to yet another court hearing</a>, to which she has been summoned on a roughly monthly basis since January 2022. That''s when the county health department began using court orders to try to compel her to get her deadly respiratory infection treated and/or remain in isolation to protect the public until she is no longer infectious.</p>\n<p>Pierce County Superior Court Judge Philip Sorensen ruled once again Friday that the woman—known only by the initials "V.N." in court documents—was in contempt of those court orders. Sorensen had initially issued a civil arrest warrant on March 2, 2023, ordering her to involuntary detention for testing and treatment. He extended the warrant Friday.</p></div><p><a href="https://arstechnica.com/?p=1941465#p3">Read 11 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941465&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 20:01:21','Beth Mole','https://arstechnica.com/?p=1941465','',NULL,'c8deb43b6d29805a8032db79b2ca06fb440ec926');
+INSERT INTO entries VALUES(31,'https://arstechnica.com/?p=1941414',3,'Study: People think undermining democracy is ok if others do it first','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Image of a fractured US capital building, highlighted in red and blue." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1421641499-800x566.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1421641499.jpg">Enlarge</a> (credit: <a class="caption-link" href="https://www.gettyimages.com/detail/photo/midterm-election-u-s-voting-rights-and-election-royalty-free-image/1421641499?phrase=voting+protest&amp;adppopup=true" rel="nofollow">Douglas Rissing</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Many Americans have been shocked by the frequency with which people who claim to love our democracy have supported blatantly undemocratic efforts to limit people''s ability to vote or to selectively discard votes already cast. Unfortunately, this sort of democratic backsliding is far from a US-specific problem. Despite widespread support for democracy in countries like Venezuela and Hungary, people have turned out in large numbers to vote for autocrats.</p>\n<p>A new study performed in the US suggests at least one explanation for the problem: People across the political spectrum appear to believe their political opponents are likely to take anti-democratic action if given the opportunity. And the strength of this belief correlates with a slightly increased willingness to take those actions first.</p>\n<h2>Nobody says they like this stuff</h2>\n<p>The finding, from a University of California, Berkeley-Massachusetts Institute of Technology collaboration, is based on demographically representative survey populations, which were asked about several potential anti-democratic actions. For example, those surveyed were asked if they agreed with reducing the number of voting facilities in towns that support the opposing party. Similar questions got at things like banning rallies, limiting freedom of expression, ignoring court rulings, or resorting to violence. After being asked for their own opinions, people were then asked whether they thought their political opponents supported these anti-democratic approaches.</p></div><p><a href="https://arstechnica.com/?p=1941414#p3">Read 11 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941414&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 19:51:15','John Timmer','https://arstechnica.com/?p=1941414','',NULL,'832d5d1522906d7ec913590565fb86f0b8536fd9');
+INSERT INTO entries VALUES(32,'https://arstechnica.com/?p=1941388',3,'Google bans Downloader app after TV firms complain it can load a pirate website','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Screenshot of the Google home page displayed on Downloader, an Android app with a built-in browser." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/downloader-browser-800x450.png" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/downloader-browser.png">Enlarge</a> <span class="sep">/</span> The Downloader app that was suspended from Google Play. (credit: <a class="caption-link" href="https://www.aftvnews.com/downloader/screenshots/downloader-v1-4-1-browser/" rel="nofollow">Elias Saba</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>The Google Play Store suspended an app that combines a web browser with a file manager after a Digital Millennium Copyright Act (DMCA) complaint pointed out that the app is capable of loading a piracy website—even though that same pirate website can be loaded on any standard browser, including Google Chrome.</p>\n<p>The free <a href="https://play.google.com/store/apps/details?id=com.esaba.downloader">app</a>, which is designed for Android TV devices and is called Downloader, had been installed from Google Play over 5 million times before its suspension on Friday, an <a href="https://web.archive.org/web/20230219204835/https://play.google.com/store/apps/details?id=com.esaba.downloader">Internet Archive</a> capture shows. The suspension notice that Google sent to Downloader app developer Elias Saba cites a complaint from several Israeli TV companies that said the app "allows users to view the infamous copyright infringing website known as SDAROT."</p>\n<p>Saba provided us with a copy of the suspension notice.</p></div><p><a href="https://arstechnica.com/?p=1941388#p3">Read 12 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941388&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 19:13:03','Jon Brodkin','https://arstechnica.com/?p=1941388','',NULL,'3bdbf6d30496e465dc04c27bbbd643d83d68b723');
+INSERT INTO entries VALUES(33,'https://arstechnica.com/?p=1941261',3,'Adobe Photoshop’s new “Generative Fill” AI tool lets you manipulate photos with text','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="An example of a 1983 file photo of the Apple Lisa computer that has been significantly enhanced by Generative Fill in the Adobe Photoshop beta." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/generative_fill_hero_3-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/generative_fill_hero_3.jpg">Enlarge</a> <span class="sep">/</span> An example of a 1983 file photo of the Apple Lisa computer that has been significantly enhanced by the new "Generative Fill" AI tool in the Adobe Photoshop beta. (credit: Apple / Benj Edwards / Adobe)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>On Tuesday, Adobe <a href="https://blog.adobe.com/en/publish/2023/05/23/photoshop-new-features-ai-contextual-presets">added</a> a new tool to its Photoshop beta called "Generative Fill," which uses cloud-based image synthesis to fill selected areas of an image with new AI-generated content based on a text description. Powered by Adobe Firefly, Generative Fill works similarly to a technique called "inpainting" used in <a href="https://arstechnica.com/information-technology/2022/09/openai-image-generator-dall-e-now-available-without-waitlist/">DALL-E</a> and <a href="https://arstechnica.com/information-technology/2022/09/with-stable-diffusion-you-may-never-believe-what-you-see-online-again/">Stable Diffusion</a> releases since last year.</p>\n\n<p>At the core of Generative Fill is <a href="https://arstechnica.com/information-technology/2023/03/ethical-ai-art-generation-adobe-firefly-may-be-the-answer/">Adobe Firefly</a>, which is Adobe''s custom image-synthesis model. As a deep learning AI model, Firefly has been trained on millions of images in Adobe''s stock library to associate certain imagery with text descriptions of them. Now part of Photoshop, people can type in what they want to see (i.e., "a clown on a computer monitor"), and Firefly will synthesize several options for the user to choose from. Generative Fill uses a well-known AI technique called "<a href="https://www.nvidia.com/research/inpainting/index.html">inpainting</a>" to create a context-aware generation that can seamlessly blend synthesized imagery into an existing image.</p>\n<p>To use Generative Fill, users select an area of an existing image they want to modify. After selecting it, a "Contextual Task Bar" pops up that allows users to type in a description of what they want to see generated in the selected area. Photoshop sends this data to Adobe''s servers for processing, then returns results in the app. After generating, the user has the option to select between several options of generations or to create more options to browse through.</p></div><p><a href="https://arstechnica.com/?p=1941261#p3">Read 7 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941261&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 19:07:19','Benj Edwards','https://arstechnica.com/?p=1941261','',NULL,'de6050ae1b6ae1e2270e1df355232b2e31a2b9bf');
+INSERT INTO entries VALUES(34,'https://arstechnica.com/?p=1941299',3,'Meta has no choice but to sell Giphy at $262M loss to Shutterstock','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Giphy logo displayed on a phone screen and Meta logo displayed on a laptop screen" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1236896689-800x474.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-1236896689.jpg">Enlarge</a> (credit: <a class="caption-link" href="https://www.gettyimages.com/detail/news-photo/giphy-logo-displayed-on-a-phone-screen-and-meta-logo-news-photo/1236896689" rel="nofollow">Getty</a>)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<div class="c-virtual_list__item c-virtual_list__item--initial-activeitem" id="1684861893.663099" tabindex="0">\n<div class="c-message_kit__background c-message_kit__background--hovered p-message_pane_message__message c-message_kit__message">\n<div class="c-message_kit__hover c-message_kit__hover--hovered">\n<div class="c-message_kit__actions c-message_kit__actions--default">\n<div class="c-message_kit__gutter">\n<div class="c-message_kit__gutter__right">\n<div class="c-message_kit__blocks c-message_kit__blocks--rich_text">\n<div class="c-message__message_blocks c-message__message_blocks--rich_text">\n<div class="p-block_kit_renderer">\n<div class="p-block_kit_renderer__block_wrapper p-block_kit_renderer__block_wrapper--first">\n<div class="p-rich_text_block" dir="auto">\n<div class="p-rich_text_section">Talk about a fire sale. With limited interest in GIF platforms and UK regulators <a href="https://arstechnica.com/tech-policy/2021/12/metas-failed-giphy-deal-could-end-big-techs-spending-spree/">forcing</a> a sale, Meta has decided to sell Giphy to Shutterstock for a mere $53 million. After purchasing it for $315 million in 2020 and subsequently being <a href="https://arstechnica.com/tech-policy/2022/10/meta-grudgingly-agrees-to-sell-giphy-after-admitting-defeat-in-uk-battle/">ordered to sell it</a> by the UK''s Competition and Markets Authority (CMA), Meta has been challenged to find a suitable Giphy buyer at a time when GIFs are perceived to be less trendy than three years ago. The GIF library has found a fitting future owner in Shutterstock, but for Meta, it means a $262 million loss.</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n</div>\n<h2>The deal</h2>\n<p>Shutterstock announced today its definitive agreement to buy Giphy for $53 million, seven months after Meta said it would accept the CMA''s ruling that it <a href="https://www.gov.uk/cma-cases/facebook-inc-giphy-inc-merger-inquiry#final-order">must divest Giphy</a>. Shutterstock said the deal is expected to close in June and is "subject to customary closing conditions."</p>\n<p>The deal should assuage trepidation from Giphy, which encouraged the CMA to enact behavioral ordinances rather than force Meta to sell Giphy. The animated images company feared GIFs just weren''t as cool as they were in 2020, and so the platform would mostly attract "weak or inappropriate" suitors.</p>\n<p>“User sentiment towards GIFs on social media shows that they have fallen out of fashion as a content form, with younger users in particular describing GIFs as ‘for boomers’ and ‘cringe,’" <a href="https://assets.publishing.service.gov.uk/media/62fe118dd3bf7f06e5a1c454/Giphy_Submission_on_Remittal_18.8.22.pdf">Giphy told the CMA</a> in August.</p></div><p><a href="https://arstechnica.com/?p=1941299#p3">Read 18 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941299&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 18:15:52','Scharon Harding','https://arstechnica.com/?p=1941299','',NULL,'6441c8e63b61055cb3d24285314a8563ef5d514a');
+INSERT INTO entries VALUES(35,'https://arstechnica.com/?p=1941347',3,'Unexpected 3DS update breaks many common homebrew hacking methods','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A few of the 3DS variations that were once supported by Nintendo." src="https://cdn.arstechnica.net/wp-content/uploads/2020/09/3ds6-800x534.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2020/09/3ds6.jpg">Enlarge</a> <span class="sep">/</span> A few of the 3DS variations that were once supported by Nintendo. (credit: Mark Walton)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>It has been years since <a href="https://arstechnica.com/gaming/2020/09/the-end-of-the-3ds-marks-an-inflection-point-for-portable-gaming/">Nintendo stopped producing its Nintendo 3DS line</a> of portable hardware and months since the company <a href="https://arstechnica.com/gaming/2023/03/todays-the-last-day-to-buy-eshop-games-for-the-wii-u-and-3ds/">officially shut down the 3DS eShop</a> for new downloadable game purchases. But those facts haven''t stopped the company from issuing a new firmware update that seems at least partly focused on impeding some of the most common methods for installing homebrew software on the defunct console.</p>\n<p>Monday night''s surprise release of 3DS firmware Ver. 11.17.0-50 is the first official system update for the console since last September and the fifth update since the hardware was officially discontinued in 2020. The <a href="a%20href=">official patch notes</a> for the sudden update cover the now-standard (if vague) promise of "further improvements to overall system stability and other minor adjustments [that] have been made to enhance the user experience."</p>\n<p>But console hacking groups quickly noticed that downloading the update ruined <a href="https://3ds.hacks.guide/">many of the documented hacking methods</a> that could previously be used to install custom 3DS firmware.</p></div><p><a href="https://arstechnica.com/?p=1941347#p3">Read 6 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941347&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 17:37:46','Kyle Orland','https://arstechnica.com/?p=1941347','',NULL,'63fdc4ccb728d21cb4d5fb0439ce5904dd03bfde');
+INSERT INTO entries VALUES(36,'https://arstechnica.com/?p=1941293',3,'Built-in ChatGPT-driven Copilot will transform Windows 11 starting in June','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Windows Copilot is an AI-assisted feature coming to Windows 11 preview builds starting in June." src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/windows-copilot-800x450.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/windows-copilot.jpg">Enlarge</a> <span class="sep">/</span> Windows Copilot is an AI-assisted feature coming to Windows 11 preview builds starting in June. (credit: Microsoft)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>A couple of months ago, Microsoft added generative AI features to Windows 11 in the form of <a href="https://arstechnica.com/gadgets/2023/02/new-windows-11-update-puts-ai-powered-bing-chat-directly-in-the-taskbar/">a taskbar-mounted version of the Bing chatbot</a>. Starting this summer, the company will be going even further, adding <a href="https://blogs.windows.com/windowsdeveloper/2023/05/23/bringing-the-power-of-ai-to-windows-11-unlocking-a-new-era-of-productivity-for-customers-and-developers-with-windows-copilot-and-dev-home/">a new ChatGPT-driven Copilot feature</a> that can be used alongside your other Windows apps. The company announced the change at its Build developer conference alongside another new batch of Windows 11 updates due later this year. Windows Copilot will be available to Windows Insiders starting in June.</p>\n\n<p><a href="https://arstechnica.com/information-technology/2023/03/microsoft-365s-ai-powered-copilot-is-like-an-omniscient-version-of-clippy/">Like the Microsoft 365 Copilot</a>, Windows Copilot is a separate window that opens up along the right side of your screen and assists with various tasks based on what you ask it to do. A Microsoft demo video shows Copilot changing Windows settings, <a href="https://arstechnica.com/gadgets/2021/10/windows-11-the-ars-technica-review/6/#h3">rearranging windows with Snap Layouts</a>, summarizing and rewriting documents that were dragged into it, and opening apps like Spotify, Adobe Express, and Teams. Copilot is launched with a dedicated button on the taskbar.</p>\n<p>"Once open, the Windows Copilot side bar stays consistent across your apps, programs and windows, always available to act as your personal assistant. It makes every user a power user, helping you take action, customize your settings, and seamlessly connect across your favorite apps," <a href="https://blogs.windows.com/windowsdeveloper/2023/05/23/bringing-the-power-of-ai-to-windows-11-unlocking-a-new-era-of-productivity-for-customers-and-developers-with-windows-copilot-and-dev-home/">wrote</a> Microsoft Chief Product Officer Panos Panay.</p></div><p><a href="https://arstechnica.com/?p=1941293#p3">Read 7 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941293&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 17:08:01','Andrew Cunningham','https://arstechnica.com/?p=1941293','',NULL,'1195bf484bb4f3d5dc2b99145731eb416dbe4e16');
+INSERT INTO entries VALUES(37,'https://arstechnica.com/?p=1941303',3,'Activision shuts down popular fan servers for legacy Call of Duty games','text/html',replace('<div id="rss-wrap">\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<div class="video"><div class="wrapper" height="360" src="https://www.youtube.com/embed/WlO07UN9MoA?start=0&amp;wmode=transparent" style="display: block;" type="text/html" width="640"></div><p class="caption" style="font-size: 0.8em;">Prerelease video of <em>Modern Warfare 2</em>''s SM2 mod, which has ceased development following an Activision cease-and-desist request. </p></div>\n<p>Activision has sent cease-and-desist letters to two makers of popular fan clients for legacy Call of Duty titles in recent weeks. The move cuts off access to the many gameplay and quality-of-life improvements brought by these clients and stops what fans say is the only safe way to play these older games without the threat of damaging hacking by opponents.</p>\n<p>The first victim of Activision''s recent efforts was SM2, a major <em>Modern Warfare 2</em> modding project whose development <a href="https://web.archive.org/web/20230123173904/https://sm2.gg/faq/">started over two years ago</a>. Since then, the modding group has been working on updating that seminal 2009 release with new weapons, in-game perks, a redesigned UI, new streak and progression systems, and even <a href="https://web.archive.org/web/20230422161946/sm2.gg/devblog-4/">a recent move to a more modern game engine</a>.</p>\n<p>Those efforts stopped last week, though, before the mod could even release its first version. The SM2 Twitter account <a href="https://twitter.com/sm2game/status/1658745182819598337">reported</a> that "a team member received a Cease &amp; Desist letter on behalf of Activision Publishing in relation to the SM2 project. We are complying with this order and shutting down all operations permanently."</p></div><p><a href="https://arstechnica.com/?p=1941303#p3">Read 8 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941303&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 16:48:57','Kyle Orland','https://arstechnica.com/?p=1941303','',NULL,'ec0d135bc5cd57b10cc773bb27f1c9c4d022f021');
+INSERT INTO entries VALUES(38,'https://arstechnica.com/?p=1941308',3,'Ford reverses plan to ditch AM radio after congressional attention','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A 2012-era Ford radio" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/SYNC-GreaterMedia_02_HR-800x532.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/SYNC-GreaterMedia_02_HR.jpg">Enlarge</a> (credit: Ford)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>Today is just an AM-tastic day, isn''t it? Earlier this morning, <a href="https://arstechnica.com/cars/2023/05/ev-advocates-join-tech-groups-and-automakers-to-oppose-am-radio-mandate/">we reported on industry pushback</a> against congressional plans to mandate AM radios in all new cars. The topic has been building for some time now—Tesla and BMW dropped AM radio from new electric vehicles some years ago—but it made headlines again in February when <a href="https://arstechnica.com/cars/2023/03/the-2024-ford-mustang-is-the-next-car-to-lose-am-radio/">Ford revealed that the 2024 Mustang</a> would lose the ability to pick up AM. Well, Ford has changed the channel on its decision and will restore AM radio to its place on the dashboard.</p>\n<p>The move was announced by Ford CEO Jim Farley, <a href="https://twitter.com/jimfarley98/status/1661024295110463491">who took to Twitter with the news</a>.</p>\n<p>Although AM radio is mostly used by its adherents to listen to talk radio, sports, and local traffic, a bipartisan collection of Senators and Representatives introduced a bill last week to mandate the inclusion of AM radio in all new cars so they can receive messages in the case of an emergency. That argument evidently proved compelling:</p></div><p><a href="https://arstechnica.com/?p=1941308#p3">Read 2 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941308&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 16:30:51','Jonathan M. Gitlin','https://arstechnica.com/?p=1941308','',NULL,'97f1a4f86932a1d8b74b0b166529b9c926a317f1');
+INSERT INTO entries VALUES(39,'https://arstechnica.com/?p=1941265',3,'Congress wants AM radio in all new cars—trade groups say that’s a mistake','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="Retro styled image of an old car radio inside a green classic car" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-470623160-800x533.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/GettyImages-470623160-scaled.jpg">Enlarge</a> (credit: Getty Images)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>The fight over the future of AM radio got a little more heated this week as organizations representing the auto and technology industries told Congress that its plan to mandate this mode of radio wave reception is poorly conceived and will hinder progress.</p>\n<p>AM radio has seen almost every other in-car entertainment option come and go—vinyl, 8-tracks, cassettes, CDs—and it might predate just about everything other than playing "I Spy," but time is catching up with this old broadcast technology. It is starting to get left behind as new models—many of which are electric vehicles—drive off into the sunset, streaming their audio instead of modulating its amplitude.</p>\n<p><a href="https://arstechnica.com/cars/2023/03/the-2024-ford-mustang-is-the-next-car-to-lose-am-radio/">When we reported on the news that AM would be absent from the 2024 Ford Mustang</a>, we noted that some elected officials in Congress were not cool with retiring this kind of radio. Now some of them have gone a step further and introduced a bill—the "<a href="https://www.menendez.senate.gov/imo/media/doc/am_for_every_vehicle_act.pdf">AM Radio for Every Vehicle Act</a>"—that would require every new vehicle to include an AM radio receiver as standard equipment at no extra cost to the car buyer.</p></div><p><a href="https://arstechnica.com/?p=1941265#p3">Read 8 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941265&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 14:16:49','Jonathan M. Gitlin','https://arstechnica.com/?p=1941265','',NULL,'13862484b78600c99a2242c3261d0236291325c0');
+INSERT INTO entries VALUES(40,'https://arstechnica.com/?p=1941222',3,'Cadillac will electrify its most excessive SUV, the Escalade','text/html',replace('<div id="rss-wrap">\n<figure class="intro-image intro-left">\n  <img alt="A Cadillac Escalade headlight" src="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2023-cadillac-escalade-premium-luxury-004-800x533.jpg" />\n      <p class="caption" style="font-size: 0.8em;"><a class="enlarge-link" href="https://cdn.arstechnica.net/wp-content/uploads/2023/05/2023-cadillac-escalade-premium-luxury-004.jpg">Enlarge</a> (credit: Cadillac)</p>  </figure>\n\n\n\n\n\n\n<div><a name="page-1"></a></div>\n<p>In 2020, Ars tested the then-new Cadillac Escalade. The big SUV is Cadillac''s bestseller, and while we <a href="https://arstechnica.com/cars/2020/10/an-augmented-reality-dashboard-stars-in-the-2021-cadillac-escalade/">might not have enjoyed the way it drove, or its thirst</a>, it did feature some interesting driver assistance technology. There''s a chance we might prefer driving the next Escalade, though—on Monday afternoon, Cadillac revealed that it is working on an electric Escalade, called the Escalade IQ, and it will show off the new electric SUV later this year.</p>\n<p>There''s quite a lot riding on the electric Escalade. The regular version accounts for about a third of Cadillac''s total sales each year, and automakers in general make the most money from large, loaded, and expensive vehicles.</p>\n<p>That probably explains why the electric version will still be called an Escalade—you''d be silly to throw away that brand identity—although appending an "IQ" to the end creates a corporate link with Caddy''s other EVs, the $60,000 <a href="https://arstechnica.com/cars/2022/06/not-your-grandpas-ride-the-2023-cadillac-lyriq-tested/">Lyriq</a> and $300,000 <a href="https://arstechnica.com/cars/2022/06/cadillacs-electric-flagship-will-be-hand-built-use-extensive-3d-printing/">Celestiq</a>. (No, that''s not a typo.)</p></div><p><a href="https://arstechnica.com/?p=1941222#p3">Read 4 remaining paragraphs</a> | <a href="https://arstechnica.com/?p=1941222&amp;comments=1">Comments</a></p>','\n',char(10)),'','2023-05-23 13:15:37','Jonathan M. Gitlin','https://arstechnica.com/?p=1941222','',NULL,'e5ad6d4a0d2bd63fc466a025c5a782fc471894a0');
+INSERT INTO entries VALUES(41,'https://www.polygon.com/23734332/dnd-dungeons-dragons-vtt-virtual-tabletop-details-preview-price-release-date',4,'D&D’s virtual tabletop is off to a slow start, but designers say that’s very much the point','text/html',replace('<figure>\n      <img alt="A dwarf smoking a pipe stands before a roaring fire at an in. The image is from a pre-release alpha of the D&amp;amp;D virtual tabletop, shown in August 2022." src="https://cdn.vox-cdn.com/thumbor/cvm8ia5qPLPYETYUFFnV5xi2Vj8=/0x0:2558x1439/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72308469/VTT.0.jpeg" />\n        <figcaption>Image: Wizards of the Coast via <a class="ql-link" href="https://youtu.be/7RiRoslMaa0" target="_blank">YouTube</a></figcaption>\n    </figure>\n\n  <p>The VTT works surprisingly well for playing in person</p>\n  <p>\n    <a href="https://www.polygon.com/23734332/dnd-dungeons-dragons-vtt-virtual-tabletop-details-preview-price-release-date">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-24 13:00:00','Charlie Hall','https://www.polygon.com/23734332/dnd-dungeons-dragons-vtt-virtual-tabletop-details-preview-price-release-date','',NULL,'5a72fc1e140c492d1e6c9b6d98e7f080ab0dd1f4');
+INSERT INTO entries VALUES(42,'https://www.polygon.com/23734649/playstation-showcase-2023-time-where-to-watch',4,'Watch Sony’s new PlayStation Showcase','text/html',replace('<figure>\n      <img alt="Sony Playstation logos are displayed during the Sony PlayStation E3 conference at LA Center Studios on June 11, 2018 in Los Angeles, California." src="https://cdn.vox-cdn.com/thumbor/8GZd3IJzhW8oTr4vvXesdDrfWds=/0x100:1920x1180/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72308195/GettyImages_971862184.0.jpg" />\n        <figcaption>Photo: Christian Petersen/Getty Images</figcaption>\n    </figure>\n\n  <p>Where and when to tune in for the next big look at PS5 and PSVR 2</p>\n  <p>\n    <a href="https://www.polygon.com/23734649/playstation-showcase-2023-time-where-to-watch">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-24 11:00:00','Michael McWhertor','https://www.polygon.com/23734649/playstation-showcase-2023-time-where-to-watch','',NULL,'b27308a2f4785783c00c3419ee58069df0a86a15');
+INSERT INTO entries VALUES(43,'https://www.polygon.com/23735571/the-flash-trailer-batman-gets-nuts-again',4,'Batman still wants to get nuts in The Flash trailer','text/html',replace('<figure>\n      <img alt="Michael Keaton wearing the Batman costume, with his face exposed, in The Flash" src="https://cdn.vox-cdn.com/thumbor/HLHg318AsvYFNUqWNX3pI5ypfCE=/133x59:2480x1379/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72308153/the_flash_batman_michael_keaton.0.png" />\n        <figcaption>Image: Warner Bros./DC Studios</figcaption>\n    </figure>\n\n  <p>The last big push for the DC movie has few surprises, a lighter tone, and Jeremy Irons</p>\n  <p>\n    <a href="https://www.polygon.com/23735571/the-flash-trailer-batman-gets-nuts-again">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-24 10:22:53','Oli Welsh','https://www.polygon.com/23735571/the-flash-trailer-batman-gets-nuts-again','',NULL,'ac9b639a93a4ed7e6dd7612f1411274afc7a1aec');
+INSERT INTO entries VALUES(44,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734302/turakamik-shrine-puzzle-solution-chest',4,'Turakamik Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="A screenshot shows a shrine in The Legend of Zelda: Tears of the Kingdom. It looks like a rock emitting swirling green energy." src="https://cdn.vox-cdn.com/thumbor/WBkcdDoavw_1TSdi4R--MVhUjmY=/0x0:1920x1080/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307372/My_Great_Game___Zelda_Tears_of_the_Kingdom_2023_05_23_14_25_38__1_.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>How to complete the ‘Hidden Metal’ puzzle</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734302/turakamik-shrine-puzzle-solution-chest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 23:16:14','Ana Diaz','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734302/turakamik-shrine-puzzle-solution-chest','',NULL,'58245856d203130d02ba6cf04cd7dbf759b558bd');
+INSERT INTO entries VALUES(45,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734195/miryotanog-shrine-solution-puzzle-chest',4,'Miryotanog Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="Link running into Miryotanog Shrine in the Gerudo Desert of Zelda: Tears of the Kingdom" src="https://cdn.vox-cdn.com/thumbor/PEWTj1AqpHRbqovJZUWN6FnnYHA=/0x0:1920x1080/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307197/vlcsnap_2023_05_23_14h36m54s846.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>How to complete the ‘Proving Grounds: Lure’ challenge</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734195/miryotanog-shrine-solution-puzzle-chest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 22:01:45','Maddy Myers','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734195/miryotanog-shrine-solution-puzzle-chest','',NULL,'6311805d6f7982d0a15a99a43e244014c37d9f61');
+INSERT INTO entries VALUES(46,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734862/ganos-shrine-puzzle-solution-chest-tabantha-sky-crystal-quest',4,'Ganos Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="An image shows Ganos Shrine in The Legend of Zelda: Tears of the Kingdom. It looks like a rock with a portal to another cave." src="https://cdn.vox-cdn.com/thumbor/ZM9bQGbBWLgGA2RDdNwOZKlOL6U=/0x0:1920x1080/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307175/Tears_of_the_Kingdom_Ganos_Shrine_exterior.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>How to access Ganos Shrine</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734862/ganos-shrine-puzzle-solution-chest-tabantha-sky-crystal-quest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 21:54:29','Ana Diaz','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734862/ganos-shrine-puzzle-solution-chest-tabantha-sky-crystal-quest','',NULL,'4e8f73c113bd0a8088e1bece96954905bdec0aea');
+INSERT INTO entries VALUES(47,'https://www.polygon.com/23734839/destiny-2-season-deep-armor-skins-items-crossovers',4,'Destiny 2’s latest season kicks off with Kratos and The Last of Us crossover gear','text/html',replace('<figure>\n      <img alt="screenshot showing a new skin for Destiny 2’s “season of the deep” season — it’s a tribute to their colleagues who made Horizon: Zero Dawn" src="https://cdn.vox-cdn.com/thumbor/u1QsDiv8i70VS5Lhp9zWnT4k6UQ=/0x0:1600x900/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72307105/52907802411_45cdd80f0d_h.0.jpg" />\n        <figcaption>Bungie’s <em>Destiny 2 </em>homage to Aloy from Guerrilla Games’ Horizon series | Image: Bungie/Sony Interactive Entertainment</figcaption>\n    </figure>\n\n  <p>Have fun with armor and items inspired by other PlayStation tentpoles</p>\n  <p>\n    <a href="https://www.polygon.com/23734839/destiny-2-season-deep-armor-skins-items-crossovers">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 21:41:53','Owen S. Good','https://www.polygon.com/23734839/destiny-2-season-deep-armor-skins-items-crossovers','',NULL,'d04e3458076fc69614cc31e75725878e6099fd24');
+INSERT INTO entries VALUES(48,'https://www.polygon.com/2023/5/23/23734930/netflix-password-sharing-details-and-pricing-may-2023',4,'Sharing a Netflix password will now cost $7.99 a month per additional user','text/html',replace('<figure>\n      <img alt="Bright colorful illustration of Netflix logo" src="https://cdn.vox-cdn.com/thumbor/gclUJlgC9xcHytZSsT0oPxstX2E=/0x156:3000x1844/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72306966/ArielDavis_210629_ecl1087_Netflix_0001.0.jpg" />\n        <figcaption>Illustration: Ariel Davis for Polygon</figcaption>\n    </figure>\n\n  <p>They have altered the deal, pray they do not alter it further</p>\n  <p>\n    <a href="https://www.polygon.com/2023/5/23/23734930/netflix-password-sharing-details-and-pricing-may-2023">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 21:20:33','Toussaint Egan','https://www.polygon.com/2023/5/23/23734930/netflix-password-sharing-details-and-pricing-may-2023','',NULL,'335c42f2fdbcee4dbdf60d638c78a09cb4044f72');
+INSERT INTO entries VALUES(49,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23688353/totk-shrine-map-locations',4,'Shrine map and locations for Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="The Legend of Zelda: Tears of the Kingdom Link entering a shrine on a Sky Island" src="https://cdn.vox-cdn.com/thumbor/U8Sp2quL2cc5AAIaDdfxhn73NiY=/0x1:2880x1621/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72270335/Tears_of_the_Kingdom_Shrine_header.0.png" />\n        <figcaption>Image: Nintendo EPD/Nintendo via Polygon</figcaption>\n    </figure>\n\n  <p>Our in-progress list of shrines and where to find them</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23688353/totk-shrine-map-locations">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 20:43:41','Jeffrey Parkin','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23688353/totk-shrine-map-locations','',NULL,'10db84d238d8ef7ed2226748552d0dfd8733dc46');
+INSERT INTO entries VALUES(50,'https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734853/kamatukis-shrine-solution-puzzle-chest',4,'Kamatukis Shrine solution in Zelda: Tears of the Kingdom','text/html',replace('<figure>\n      <img alt="Kamatukis Shrine location in Hyrule in Zelda: Tears of the Kingdom" src="https://cdn.vox-cdn.com/thumbor/gDuJy-Vkfw-iNxjS_q4cMO9lQgU=/0x0:1280x720/640x360/cdn.vox-cdn.com/uploads/chorus_image/image/72306812/Fw1gstsacAAlUSz.0.jpg" />\n        <figcaption>Image: Nintendo EPD/Nintendo</figcaption>\n    </figure>\n\n  <p>How to complete the ‘A Precise Strike’ puzzle</p>\n  <p>\n    <a href="https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734853/kamatukis-shrine-solution-puzzle-chest">Continue reading&hellip;</a>\n  </p>','\n',char(10)),'','2023-05-23 20:41:25','Nicole Carpenter','https://www.polygon.com/zelda-tears-of-the-kingdom-guide/23734853/kamatukis-shrine-solution-puzzle-chest','',NULL,'f41491191da2078456dd76894ac680e8ff8a64be');
+INSERT INTO entries VALUES(51,'tag:daringfireball.net,2023:/linked//6.39952',5,'Tickets for The Talk Show Live From WWDC 2023','text/html',replace('<p>First batch of tickets is on sale now.</p>\n\n<p><strong>Location:</strong> The California Theatre, San Jose <br />\n<strong>Showtime:</strong> Wednesday, 7 June 2023, 5 pm PT (Doors open 4 pm) <br />\n<strong>Special Guest(s):</strong> <em>Yes</em>  </p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/tickets-for-the-talk-show-live-from-wwdc-2023" title="Permanent link to ‘Tickets for The Talk Show Live From WWDC 2023’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-24 02:25:12','John Gruber','https://ti.to/daringfireball/the-talk-show-live-from-wwdc-2023','',NULL,'3c7811c8031ce56a0b89bdaf843ffe95d24d2f68');
+INSERT INTO entries VALUES(52,'tag:daringfireball.net,2023:/linked//6.39951',5,'Adobe Adds AI Generative Fill to Photoshop','text/html',replace('<p>Pam Clark, writing for the Adobe Blog:</p>\n\n<blockquote>\n  <p>We are thrilled to announce that the Photoshop (beta) app has\nreleased Generative Fill, the world’s first co-pilot in creative\nand design workflows, giving users a magical new way to work.\nGenerative Fill is powered by <a href="https://firefly.adobe.com/">Adobe Firefly</a>, Adobe’s\nfamily of creative generative AI models. Starting today,\nPhotoshop subscribers can create extraordinary imagery from a\nsimple text prompt.</p>\n\n<p>This brings two imaging powerhouses together — Photoshop and\ngenerative AI, enabling you to generate content from inside\nPhotoshop with a text prompt and edit it with Photoshop’s\ncomprehensive range of tools to create extraordinary results.</p>\n</blockquote>\n\n<p>“Extraordinary” is no exaggeration. Just amazing stuff.</p>\n\n<p><strong>See also:</strong> <a href="https://www.youtube.com/watch?v=Sp6K3qpVFO0">This 5-minute video</a> on Adobe’s YouTube channel, and <a href="https://twitter.com/scottbelsky/status/1660992735040663553">this thread on Twitter from Adobe’s Scott Belsky</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/photoshop-generative-fill" title="Permanent link to ‘Adobe Adds AI Generative Fill to Photoshop’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:51:19','John Gruber','https://blog.adobe.com/en/publish/2023/05/23/future-of-photoshop-powered-by-adobe-firefly','',NULL,'00acba6369c0a2582fdf6db69859fe360adb0efc');
+INSERT INTO entries VALUES(53,'tag:daringfireball.net,2023:/linked//6.39950',5,'The Verge: The 5 Biggest Announcements at Microsoft Build 2023','text/html',replace('<p>All five items on The Verge’s list are AI-related, topped by an AI-powered personal assistant (named Copilot, natch) built into the Windows 11 task bar.</p>\n\n<p>How many AI announcements will Apple have at WWDC?</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/microsoft-build-top-5" title="Permanent link to ‘The Verge: The 5 Biggest Announcements at Microsoft Build 2023’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:37:20','John Gruber','https://www.theverge.com/23734104/microsoft-build-2023-ai-bing-copilot','',NULL,'248cf6d2988e6d9aa8e799ea74b92ba3279e6d43');
+INSERT INTO entries VALUES(54,'tag:daringfireball.net,2023:/linked//6.39949',5,'CNN Fucked Around With Trump’s Town Hall, Now Finding Out','text/html',replace('<p>CNN — now owned by Warner “Bros” Discovery, who, <a href="https://daringfireball.net/linked/2023/05/23/max-tvos">as I’ve mentioned</a>, are morons — is learning the same thing as Twitter: there’s no mainstream audience for right-wing media, and no mainstream tolerance for insurrectionists or their sympathizers. Two weeks ago they <a href="https://www.cnn.com/2023/05/18/media/christiane-amanpour-trump-town-hall-reliable-sources/index.html">embarrassed themselves</a> by handing over a prime time hour of TV to Donald Trump. WBD CEO (and Biff-Tannen-in-glasses lookalike) David Zaslav <a href="https://deadline.com/2023/05/cnn-republicans-warner-bros-discovery-david-zaslav-1235371510/">bragged</a>, “Republicans are back on the air.” </p>\n\n<p>Now, reports Justin Baragona at The Daily Beast:</p>\n\n<blockquote>\n  <p>More than a week after CNN’s <a href="https://www.thedailybeast.com/inside-the-cnn-meltdown-over-its-town-hall-disaster">disastrous town hall</a> with\nformer President Donald Trump, the negative impact the fiasco had\non the network’s ratings is coming into clearer focus. Last week,\nthe cable news pioneer suffered its lowest-rated week since June\n2015, averaging just 429,000 total daily viewers from\nMonday-Friday. CNN was also down double digits compared to the\nsame week last year in both total viewership and in the key\nadvertising demographic of viewers ages 25-54. MSNBC more than\ndoubled CNN’s daily audience, drawing 976,000 total viewers, while\nFox News averaged 1.4 million. [...]</p>\n\n<p>Since the town hall, CNN has seen <a href="https://www.thedailybeast.com/surging-newsmax-crows-about-beating-cnn-in-ratings">several of its weeknight\nhours</a> — including Anderson Cooper — <a href="https://www.thedailybeast.com/cnn-loses-to-newsmax-in-primetime-ratings-two-days-after-trump-town-hall">fall behind\nNewsmax</a>, the fringe-right channel that has surged since\nCarlson’s ouster. And on Friday night, the channel’s <a href="https://www.thedailybeast.com/cnn-moving-chris-wallaces-sunday-interview-show-to-friday-nights">much-hyped\ninterview show</a> hosted by Chris Wallace averaged only\n224,000 total viewers at 10 p.m., drawing 60,000 fewer viewers\nthan Newsmax’s offering.</p>\n</blockquote>\n\n<p>Losing to Newsmax. Jiminy.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/cnn-fucked-around-found-out" title="Permanent link to ‘CNN Fucked Around With Trump’s Town Hall, Now Finding Out’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:33:26','John Gruber','https://www.thedailybeast.com/heres-how-bad-cnns-post-trump-town-hall-ratings-have-been','',NULL,'2e57004457861be4d0131d073aa7da471be20f53');
+INSERT INTO entries VALUES(55,'tag:daringfireball.net,2023:/linked//6.39948',5,'Charlie Warzel: ‘Twitter Is a Far-Right Social Network’','text/html',replace('<p>Charlie Warzel, writing for The Atlantic:</p>\n\n<blockquote>\n  <p>Twitter has so fully assumed the role of a far-right platform that\nit might be killing its competitors. When Parler shut down in\nApril, its parent company noted <a href="https://variety.com/2023/digital/news/parler-shut-down-new-owner-starboard-twitter-clone-conservatives-1235583709/">that</a> “no reasonable person\nbelieves that a Twitter clone just for conservatives is a viable\nbusiness any more.” Left unspoken is the reason: Twitter has\nbecome a right-wing echo chamber.</p>\n\n<p>If Musk weren’t too preoccupied lapping up approval from trolls,\nreactionaries, and Dogecoin enthusiasts — a few of the\nconstituencies left on his site that still seem to adore him — the Parler statement should worry him. Right-wing alt-tech\nplatforms may attract investors and a flood of indignant new users\nwith persecution complexes, but they are, ultimately, bad\nbusinesses.</p>\n</blockquote>\n\n<p>A fairer headline would be “Twitter Is a Far-Right-Friendly Social Network”, but that’s enough to be a problem.</p>\n\n<p>I still check in on Twitter, but with each passing week, less and less. It’s not fun, it’s hard to use without Tweetbot, and the new algorithm that puts paying Twitter Blue users’ replies at the top of every thread has <a href="https://twitter.com/mattyglesias/status/1660692106782883841">ruined</a> political Twitter. It’s like letting people suffering from incontinence try on all the pants in a store before anyone else.</p>\n\n<p>And the right-wing veer is most obvious in the ads that I see. (And I now see a lot of them — one every 3–4 posts.) Almost <em>all</em> of them are for no-name gimmicks and gadgets, the sort of crap that used to be sold at the mall <a href="https://www.mentalfloss.com/article/504249/history-spencer-gifts">at Spencer Gifts</a> or in the middle of the night on cable TV commercials.</p>\n\n<p>One of the few exceptions I see is Apple, which continues to place ads on Twitter.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/warzel-twitter-rightwing" title="Permanent link to ‘Charlie Warzel: ‘Twitter Is a Far-Right Social Network’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 23:23:07','John Gruber','https://www.theatlantic.com/technology/archive/2023/05/elon-musk-ron-desantis-2024-twitter/674149/','',NULL,'45ff6c883b4fb027ffa1d128021f55e511938def');
+INSERT INTO entries VALUES(56,'tag:daringfireball.net,2023:/linked//6.39947',5,'The Talk Show: ‘No False Humidity’','text/html',replace('<p>Special guest: Jason Snell. Topics: Headset, headseat, headset. And no baseball talk other than how games might look in VR. Also: Final Cut Pro and Logic Pro for iPad, and GM’s dumb decision to drop CarPlay.</p>\n\n<p>Sponsored by:</p>\n\n<ul>\n<li><a href="https://squarespace.com/talkshow">Squarespace</a>: Make your next move. Use code <strong>talkshow</strong> for 10% off your first order.</li>\n<li><a href="https://kolide.com/thetalkshow">Kolide</a>: Cross-platform endpoint security solution for teams that value privacy and transparency.</li>\n<li><a href="https://backblaze.com/thetalkshow">Backblaze</a>: Makes backing up and accessing your data astonishingly easy.</li>\n</ul>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/the-talk-show-375" title="Permanent link to ‘The Talk Show: ‘No False Humidity’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 21:32:40','John Gruber','https://daringfireball.net/thetalkshow/2023/05/23/ep-375','',NULL,'5eff268897cc861cfb6be0d4cefc6892202d327d');
+INSERT INTO entries VALUES(57,'tag:daringfireball.net,2023:/linked//6.39946',5,'Today Is the Launch of Max, and It Sucks Even More Than I Thought It Would','text/html',replace('<p>Sigmund Judge, on Twitter:</p>\n\n<blockquote>\n  <p>Max launches today, and with it brings yet another chapter in the\nbattle between Warner/Discovery executives and Apple TV customers.</p>\n\n<p><a href="https://twitter.com/StreamOnMax">@StreamOnMax</a> switches away from Apple’s native video player in\nthe continued pursuit of creating an inferior product...</p>\n</blockquote>\n\n<p><a href="https://daringfireball.net/2023/04/warner_max">I told you</a> these Warner “Bros” Discovery executives are morons. On all the good platforms, you have to install an altogether new app. Why not just update the existing HBO Max app with (<a href="https://twitter.com/gilbert/status/1660878157162090496">yet another</a>) a new name and icon? Because they’re morons. (Even better: when I launch the old HBO Max app on my Apple TV, it doesn’t tell me anything about the new app — it just shows an error screen saying “Something went wrong.”)</p>\n\n<p>This much moronity I expected. But it gets worse. As Judge documents, with the new app they’ve <a href="https://9to5mac.com/2023/05/23/hbo-max-app-tvos-apple-tv/">once again</a> dropped tvOS’s excellent native video player for a custom video player that utterly sucks: “up next” support in the TV app is now broken or missing, HDR and frame-rate match are gone, the new video player doesn’t support the Siri remote’s jog support, no picture-in-picture, and no support for the wonderful “What did they just say?” feature (speak that to your Siri remote and the video jumps back 10 seconds or so and temporarily enables subtitles).</p>\n\n<p>HBO Max was a really good tvOS app. Max is a poor one.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/max-tvos" title="Permanent link to ‘Today Is the Launch of Max, and It Sucks Even More Than I Thought It Would’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 20:45:41','John Gruber','https://twitter.com/sigjudge/status/1660991982095745024?s=61&t=IO0gpJ6MMbM8xFDvXZt-Nw','',NULL,'d396c3b7ea5ae543a46dac908418c91559c1fe67');
+INSERT INTO entries VALUES(58,'tag:daringfireball.net,2023:/linked//6.39945',5,'YouTube Pitching Advertisers on Unskippable 30-Second Ads for TV Content','text/html',replace('<p>Todd Spangler, reporting for Variety:</p>\n\n<blockquote>\n  <p>YouTube’s biggest ad innovation for 2023? It might be borrowing a\nwell-worn page from old-fashioned linear TV.</p>\n\n<p>At the YouTube Brandcast upfront event Wednesday in New York,\nexecs announced the introduction of 30-second unskippable ads in\ntop-performing YouTube content on TVs — you know, just like the\ncommercials that have run on broadcast and cable networks for\ndecades. YouTube also will start testing new “Pause Experiences”\nfor YouTube on TV screens, showing an ad when viewers pause a\nvideo akin to the pause ads Hulu first bowed four years ago.</p>\n</blockquote>\n\n<p>I bring this up on my podcast often, but it never ceases to depress me that 20 years ago, when TV-watching first became computerized through DVRs like TiVo and ReplayTV, one of the <em>primary</em> selling points was the ability to fast-forward through commercials. Computers made watching TV not just a little better, but a lot better. That’s what computers can do. That’s why we love them.</p>\n\n<p>Now though, in the streaming era, more and more we’re seeing streaming apps making commercials unskippable. They’re making TV watching not just worse but a lot worse. That’s also what computers can do. That’s why we hate them.</p>\n\n<p>No surprise which side of this Google is on.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/23/youtube-unskippable-ads" title="Permanent link to ‘YouTube Pitching Advertisers on Unskippable 30-Second Ads for TV Content’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 18:46:45','John Gruber','https://variety.com/2023/digital/news/youtube-upfront-2023-unskippable-30-second-ads-tvs-sunday-ticket-1235616175/','',NULL,'5d93b9ca3fbcbff75a03a4335919442f49327101');
+INSERT INTO entries VALUES(59,'tag:daringfireball.net,2023:/feeds/sponsors//11.39944',5,'[Sponsor] Kolide — Zero Trust for Okta','text/html',replace('<p>Here’s an uncomfortable fact: at most companies, employees can download sensitive company data onto any device, keep it there forever, and never even know that they’re doing something wrong.</p>\n\n<p>Kolide’s new report, <a href="https://l.kolide.co/3I7025A">The State of Sensitive Data</a>, shines a light on an area of security that is often ignored, but is nevertheless a massive hole in many companies’ Zero Trust fortress.</p>\n\n<p><img alt="Study results showing that companies have poor policies for requiring user authentication to access sensitive data (65%); prohibiting downloading sensitive data onto personal devices (46%); ensuring plain-text access credentions are not stored on employee devices (38%); setting a specified time period sensitive data can reside on an employee device (16%)." src="https://daringfireball.net/martini/images/kolide-survey-results.png" width="600" /></p>\n\n<p>These findings are particularly alarming given the overall state of device security. IT teams routinely struggle to enforce timely OS updates and patch management, meaning that end users are storing your most sensitive data–things like customer records, confidential IP, and plain-text access credentials–on devices that are vulnerable to attack.</p>\n\n<p>This problem has gone unaddressed because until now there hasn’t been a good solution for it. <a href="https://l.kolide.co/3lch4WK">MDM solutions are too blunt an instrument</a> for dealing with sensitive data, and <a href="https://l.kolide.co/3DTTpRA">DLP tools are too extreme and invasive</a> for most companies. After all, you’re not trying to ban downloads together, nor regard every download as suspicious. You’re just trying to make sure employees aren’t keeping data for longer than they need or keeping it on an unmanaged or un-secure device.</p>\n\n<p>Kolide offers a more nuanced approach to setting and enforcing sensitive data policies. </p>\n\n<p><em>Our premise is simple: if an employee’s device is out of compliance, it can’t access your apps.</em></p>\n\n<p>Kolide lets admins run queries to detect sensitive data, flag devices that have violated policies, and enforce OS and browser updates so vulnerable devices aren’t accessing data.</p>\n\n<p>Our unique approach makes device compliance part of the authentication process. If a device isn’t compliant, users can’t log in to their cloud apps until they’ve fixed the problem. But instead of creating more work for IT, Kolide provides instructions so users can get unblocked on their own.</p>\n\n<p>To learn more and see our product in action, <a href="https://l.kolide.co/3XlSqAq">visit kolide.com</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/feeds/sponsors/2023/05/kolide_zero_trust_for_okta" title="Permanent link to ‘Kolide — Zero Trust for Okta’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 18:15:42','Daring Fireball Department of Commerce','https://l.kolide.co/3JWbXEv','',NULL,'8f3271de5d3065630218b2ad21e6a8f4ed0f020d');
+INSERT INTO entries VALUES(60,'tag:daringfireball.net,2023:/linked//6.39943',5,'Save the Date: The Talk Show Live From WWDC 2023','text/html',replace('<p><strong>Location:</strong> The California Theatre, San Jose <br />\n<strong>Showtime:</strong> Wednesday, 7 June 2023, 5:00 pm PT <br />\n<strong>Tickets:</strong> First batch goes on sale Tuesday 23 May <br />\n<strong>Special Guest(s):</strong> <em>For me to know and you to find out</em> <br />\n<strong>Previous Shows:</strong> <a href="https://www.youtube.com/daringfireball">On YouTube</a></p>\n\n<p>(Next batch will go on sale later in the week.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/the-talk-show-wwdc-2023-save-the-date" title="Permanent link to ‘Save the Date: The Talk Show Live From WWDC 2023’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 03:50:47','John Gruber','https://daringfireball.net/thetalkshow/','',NULL,'b87975f327d964489ea6d6f2a800eada6f31074e');
+INSERT INTO entries VALUES(61,'tag:daringfireball.net,2023:/linked//6.39942',5,'Leaked EU Document Shows Spain Wants to Ban End-to-End Encryption; Other EU Countries Hanging Their Hopes on Impossible Solutions','text/html',replace('<p>Wired:</p>\n\n<blockquote>\n  <p>Spain has advocated banning encryption for hundreds of millions of\npeople within the European Union, according to a leaked document\nobtained by Wired that reveals strong support among EU member\nstates for proposals to scan private messages for illegal content.</p>\n\n<p>The document, a European Council survey of member countries’ views\non encryption regulation, offered officials’ behind-the-scenes\nopinions on how to craft a highly controversial law to stop the\nspread of child sexual abuse material (CSAM) in Europe. The\nproposed law would require tech companies to scan their platforms,\nincluding users’ private messages, to find illegal material.\nHowever, the proposal from Ylva Johansson, the EU commissioner in\ncharge of home affairs, has drawn ire from cryptographers,\ntechnologists, and privacy advocates for its potential impact on\nend-to-end encryption. [...]</p>\n\n<p>Of the 20 EU countries represented in the document leaked to\nWIRED, the majority said they are in favor of some form of\nscanning of encrypted messages, with Spain’s position emerging as\nthe most extreme. “Ideally, in our view, it would be desirable to\nlegislatively prevent EU-based service providers from implementing\nend-to-end encryption,” Spanish representatives said in the\ndocument.</p>\n</blockquote>\n\n<p>If the EU goes ahead with this, I think it means the end of services like WhatsApp, Signal, and iMessage in the EU. There’s no way to architect a messaging system that uses E2EE in some regions and doesn’t in others. The only way to comply would be to rearchitect these systems to not use E2EE anywhere. Signal certainly wouldn’t do that. Apple wouldn’t either.</p>\n\n<blockquote>\n  <p>Denmark and Ireland expressed support for scanning encrypted\nmessengers for child sexual abuse material while also endorsing\nthe inclusion of wording in the law that protects end-to-end\nencryption from being weakened. The ability to do this would rely\non the invention of technology that can scan encrypted messages\nfor illegal content without altering or breaking the security\nfeatures offered by encryption — a feat cryptographers and\ncybersecurity experts have said is technically impossible.</p>\n</blockquote>\n\n<p>It <em>is</em> technically impossible. There is no he-said/she-said debate here. The cryptographers are correct and the lawmakers are so ignorant that they’re proposing a fantasy. It’s a downwind effect of Arthur C. Clarke’s famous maxim that sufficiently advanced technology is indistinguishable from magic: the technology of E2EE is so far above the heads of lawmakers and law enforcement officials that they feel free to demand magic solutions. “<em>Just <a href="https://boingboing.net/2018/01/12/imaginary-numbers.html">nerd harder</a></em>.”</p>\n\n<blockquote>\n  <p>The Netherlands, however, stated that this would be possible\nthrough “on-device” scanning before the illegal material is\nencrypted and sent to its recipient. “There are … technologies\nwhich may allow for automatic detection of CSAM while at the same\ntime leaving end-to-end encryption intact,” the country’s\nrepresentatives stated in the document.</p>\n</blockquote>\n\n<p>Somewhere in Cupertino, <a href="https://daringfireball.net/2021/08/apple_child_safety_initiatives_slippery_slope">a head bangs against a desk</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/wired-spain-e2ee" title="Permanent link to ‘Leaked EU Document Shows Spain Wants to Ban End-to-End Encryption; Other EU Countries Hanging Their Hopes on Impossible Solutions’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-23 00:55:01','John Gruber','https://www.wired.com/story/europe-break-encryption-leaked-document-csa-law/','',NULL,'aa9affb8ba3157ff6da61b7f1a11add1f4972281');
+INSERT INTO entries VALUES(62,'tag:daringfireball.net,2023:/linked//6.39941',5,'Facebook Fined $1.3 Billion for Violating EU Data Privacy Rules','text/html',replace('<p>Adam Satariano, reporting for The New York Times:</p>\n\n<blockquote>\n  <p>Meta on Monday was fined a record 1.2 billion euros ($1.3 billion)\nand ordered to stop transferring data collected from Facebook\nusers in Europe to the United States, in a major ruling against\nthe social media company for violating European Union data\nprotection rules.</p>\n\n<p>The penalty, announced by Ireland’s Data Protection Commission, is\npotentially one of the most consequential in the five years since\nthe European Union enacted the landmark data privacy law known as\nthe General Data Protection Regulation. Regulators said the\ncompany failed to comply with a 2020 decision by the European\nUnion’s highest court that Facebook data shipped across the\nAtlantic was not sufficiently protected from American spy\nagencies.</p>\n\n<p>But it remains unclear if or when Meta will ever need to cordon\noff the data of Facebook users in Europe. Meta said it would\nappeal the decision, setting up a potentially lengthy legal\nprocess.</p>\n</blockquote>\n\n<p>A billion here, a billion there, and soon enough you’re talking about real money.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/facebook-eu-fine" title="Permanent link to ‘Facebook Fined $1.3 Billion for Violating EU Data Privacy Rules’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 23:11:42','John Gruber','https://www.nytimes.com/2023/05/22/business/meta-facebook-eu-privacy-fine.html','',NULL,'d6f9796a68067805bebeb8aa6fd2ba479e5a6d3e');
+INSERT INTO entries VALUES(63,'tag:daringfireball.net,2023:/linked//6.39940',5,'Neeva, Upstart Search Engine, Shuts Down','text/html',replace('<p>Sridhar Ramaswamy and Vivek Raghunathan, writing on the Neeva blog:</p>\n\n<blockquote>\n  <p>In early 2022, the upcoming impact of generative AI and LLMs\nbecame clear to us. We embarked on an ambitious effort to\nseamlessly blend LLMs into our search stack. We rallied the Neeva\nteam around the vision to create an answer engine. We are proud of\nbeing the first search engine to provide cited, real-time AI\nanswers to a majority of queries early this year.</p>\n\n<p>But throughout this journey, we’ve discovered that it is one thing\nto build a search engine, and an entirely different thing to\nconvince regular users of the need to switch to a better choice.\nFrom the unnecessary friction required to change default search\nsettings, to the challenges in helping people understand the\ndifference between a search engine and a browser, acquiring users\nhas been really hard. Contrary to popular belief, convincing users\nto pay for a better experience was actually a less difficult\nproblem compared to getting them to try a new search engine in the\nfirst place.</p>\n</blockquote>\n\n<p>I tried Neeva, briefly, but it never stuck for me. Part of the problem, even if you’re open to trying new search engines — clearly a big <em>if</em> — is that there’s a bit of a renaissance at the moment in new search engines. I’d been using <a href="https://duckduckgo.com/">DuckDuckGo</a> as my default for years, but about six months ago I switched to <a href="https://kagi.com/">Kagi</a>, and so far I haven’t looked back. I pay $10/month for Kagi. A paid search engine! Good search results and absolutely zero clutter from ads or paid placement. They’ve also got a <a href="https://labs.kagi.com/fastgpt">GPT-backed search</a> that includes up-to-date results and works very fast.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/neeva-shuts-down" title="Permanent link to ‘Neeva, Upstart Search Engine, Shuts Down’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 23:08:00','John Gruber','https://neeva.com/blog/may-announcement','',NULL,'0c760a323e9578cb68851a8a8cb0891c158c23c2');
+INSERT INTO entries VALUES(64,'tag:daringfireball.net,2023:/linked//6.39939',5,'A Twitter Bug Is Restoring ‘Deleted’ Tweets and Retweets','text/html',replace('<p>James Vincent, writing at The Verge:</p>\n\n<blockquote>\n  <p>Earlier this year on the 8th of May I deleted all my tweets, just\nunder 5,000 of them. I know the exact day because I <a href="https://twitter.com/jjvincent/status/1655572613157068809">tweeted about\nit</a>.</p>\n\n<p>This morning, though, I discovered that Twitter has restored a\nhandful of my old re-tweets; interactions I <em>know</em> I scrubbed from\nmy profile. Those re-tweets were gone. I remember surveying my\nbare timeline with satisfaction before thinking, “great, time to\ndraw attention to myself.” But now they’re back. You can see them\nby scrolling down my timeline past May 8th, with even more\nappearing if you select “<a href="https://twitter.com/jjvincent/with_replies">tweets with replies</a>.”</p>\n</blockquote>\n\n<p>Twitter is far from alone being a service where “deletion” needs dick quotes around it. This bug is bad and likely will soon be fixed, but the persistence of ostensibly deleted tweets is a profound design flaw.</p>\n\n<p>(The nightmare scenario: a bug that exposes DMs — which infamously are not encrypted — publicly.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/twitter-bug-deleted-tweets" title="Permanent link to ‘A Twitter Bug Is Restoring ‘Deleted’ Tweets and Retweets’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 22:26:19','John Gruber','https://www.theverge.com/2023/5/22/23732497/twitter-bug-restoring-deleted-tweets-retweets','',NULL,'198db44a92ad303421f9b8aa817492631bdfc711');
+INSERT INTO entries VALUES(65,'tag:daringfireball.net,2023:/linked//6.39938',5,'Leaks Regarding Instagram’s Purportedly Imminent Twitter-Like App','text/html',replace('<p>Lia Haberman, writing at ICYMI:</p>\n\n<blockquote>\n  <p>Codename: P92, Project 92 or Barcelona, as it’s been\nalternately called.</p>\n\n<p>Tagline: “Instagram for your thoughts.”</p>\n\n<p>All new details have surfaced based on secret calls Meta has\nbeen having with select creators, hinting at a potential release\nin late June. Here’s what I’ve been told by a creator who met\nwith Meta.</p>\n\n<p>The decentralized app is built on the back of Instagram but will\nbe compatible with some other apps like Mastodon:</p>\n\n<ul>\n<li>There’s a single sign-on with your IG username and password</li>\n<li>You can sync up with your existing followers</li>\n<li>Your handle, bio and even verification will carry over from IG</li>\n<li>Users on other apps will be able search for, follow and interact\nwith your profile and content</li>\n</ul>\n</blockquote>\n\n<p>Sounds like it’s ActivityPub-compatible, which is how it will be possible to federate with Mastodon instances.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/haberman-instagram-barcelona" title="Permanent link to ‘Leaks Regarding Instagram’s Purportedly Imminent Twitter-Like App’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 20:59:04','John Gruber','https://liahaberman.substack.com/p/icymi-instagrams-new-app-could-be','',NULL,'32a07884719f0669bfc085f789a0a1928d6cfe18');
+INSERT INTO entries VALUES(66,'tag:daringfireball.net,2023:/linked//6.39936',5,'Recommended: ‘Chimp Empire’','text/html',replace('<p><em>Chimp Empire</em> is a four-part (an hour-ish each) documentary about two rival chimpanzee groups in Uganda. It’s one of the best, most enjoyable, most engaging, and most informative cinematic experiences I’ve ever had. My wife and I devoured it. It’s extraordinarily beautiful and compelling. It’s a story about two warring groups, replete with interesting characters and compelling drama. Scheming, backstabbing, loyalty, social climbing, bravery, cowardice. It’s all there.</p>\n\n<p>The question my wife and I kept asking ourselves was, <em>How the hell did they capture this remarkable footage?</em> It couldn’t be fake, but it seemed utterly impossible how <em>close</em> the camera crews got to the chimps — including while the two tribes fight. <a href="https://www.netflix.com/tudum/articles/how-chimp-empire-was-made">Netflix has a behind-the-scenes video and story</a> that explains how this was even possible:</p>\n\n<blockquote>\n  <p>While it would normally be impossible to capture the intimacy of\nwarring chimps in the wild, the filmmakers benefited from an\nenvironment long marked by human activity — thanks to a constant\nswarm of researchers. “It took 25 years to reach the point where\nwe can walk out and be near the chimps. We’re humans, so the\nchimps just see us as an extension of the presence that’s been in\nthe forest for years,” Reed told Netflix.</p>\n\n<p>This familiarity allowed the camera crew to capture <em>Chimp Empire</em>’s\nmost stunning scenes. But up-close encounters were still just\nas bizarre as you might expect.</p>\n\n<p>“I remember suddenly being aware that the Ngogo chimps were all\naround. It’s like being on <em>The Truman Show</em> or something — you\nfeel like you’re on a set, because you can’t quite believe they’re\nreal,” Reed said. “They’re so human, you know that they’re\nassessing you in the same way that you’re assessing them. You\ncan’t quite believe that they accept you into their world. You go\nwhere they go, but they make all the decisions. The only thing you\ncan control is where you turn your cameras, or whether you keep up\nwith the action. It’s quite humbling, and I quite like it. The\nonly thing you can do is put yourself in the best position\npossible to record what they’re doing.”</p>\n</blockquote>\n\n<p>If you’ve got Netflix, start watching <em>Chimp Empire</em> tonight. If you don’t have Netflix, sign up for a month just to get <em>Chimp Empire</em>. Just watch it first, then read the behind-the-scenes stuff.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/chimp-empire" title="Permanent link to ‘Recommended: ‘Chimp Empire’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 20:30:00','John Gruber','https://www.netflix.com/title/81311783','',NULL,'f0b96805bdbe17453af4486a50939297f30462b2');
+INSERT INTO entries VALUES(67,'tag:daringfireball.net,2023:/linked//6.39937',5,'In Transition to Micro-LED, Apple Is Attempting to Reduce Its Reliance on Samsung for Displays','text/html',replace('<p>Lauly Li, reporting for Nikkei Asia:</p>\n\n<blockquote>\n  <p>Apple is getting involved in the mass production of\nnext-generation displays to lessen its reliance on rival Samsung\nand increase its own control over the supply of a key component,\nNikkei Asia has learned. Taking a hands-on approach to production\nis a stark contrast to the iPhone maker’s usual approach of\nproviding display makers with screen specifications and leaving\nthe actual production to them. [...]</p>\n\n<p>Displays are one of the most expensive components in all of\nApple’s devices. Since the American company first introduced OLED\ndisplays on its iPhone in 2017, its reliance on Samsung Display\nfor the screens has only grown. To reduce that dependence and gain\nprice-bargaining power, Apple tried to bring in other suppliers,\nnamely LG Display and China’s display champion BOE Technology, but\nthey lag the South Korean leader in terms of technology and\nquality stability, according to multiple sources familiar with the\nsituation.</p>\n\n<p>“Apple has spent at least $1 billion on the R&amp;D and samples for\nmicro-LED technologies in the past nearly 10 years,” said one of\nthe people who has been directly involved in the project for\nyears. “It wants to secure more control over the next-gen display\ntechnologies for its future products.”</p>\n</blockquote>\n\n<p>Apple’s relationship with Samsung is one of the most interesting in all of tech. On the consumer side, Samsung has been Apple’s only serious rival for high-end phones for almost the entirety of the smartphone era. But for certain chips and especially displays, Samsung has been one of Apple’s most essential suppliers. So I think it’s quite obvious why Apple would try to take display development into its own hands. Imagine if Apple had a display technology lead analogous to its performance-per-watt chip technology lead.</p>\n\n<p>From the <a href="http://www.asymco.com/2011/01/17/the-cook-doctrine/">Cook Doctrine</a>: “We believe that we need to own and control the primary technologies behind the products we make, and participate only in markets where we can make a significant contribution.”</p>\n\n<p>(I’ve also long wondered how much effort Apple is putting into developing its own camera sensors.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/22/apple-micro-led-cook-doctrine" title="Permanent link to ‘In Transition to Micro-LED, Apple Is Attempting to Reduce Its Reliance on Samsung for Displays’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-22 20:25:07','John Gruber','https://asia.nikkei.com/Spotlight/Supply-Chain/Apple-dives-into-display-making-to-cut-reliance-on-Samsung','',NULL,'ed91a8481929b7ffdc46c092fb9230fb7392bd13');
+INSERT INTO entries VALUES(68,'tag:daringfireball.net,2023:/linked//6.39935',5,'Onin','text/html',replace('<p>My thanks to Onin for sponsoring last week at DF. Onin is a free iPhone keyboard app that puts your calendar right in your keyboard. Or is it a calendar app that adds a keyboard? Whichever way you want to look at it, it’s a very clever idea. Most people only add a fraction of their events they work out in a messaging app in their calendar. With Onin, you can check your availability, add new events, and even share invites — right inside <em>any</em> app where you use the keyboard. It works with all your existing calendars (after granting it access), in all your apps, and is end-to-end encrypted.</p>\n\n<p>It’s free and fun — I say check it out.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/21/onin" title="Permanent link to ‘Onin’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-21 22:06:25','John Gruber','https://apps.apple.com/gb/app/onin-keyboard-calendar/id6448070850','',NULL,'f2afcfd17861d5b6b787452aa0d1cf94ae74f52a');
+INSERT INTO entries VALUES(69,'tag:daringfireball.net,2023://1.39934',5,'★ On Apple Fitting a Headset Announcement Into the Always-Packed WWDC Keynote','text/html',replace('<p><a href="https://twitter.com/benbajarin/status/1659593595643662336-vhv6gL8w">Ben Bajarin on Twitter</a>:</p>\n\n<blockquote>\n  <p>If Apple is releasing a VR/AR headset this year, it makes more\nsense for a dedicated event or bundle it with a Mac event in\nthe fall.</p>\n\n<p>There is too much ground to cover at WWDC, and 30 min is not\nenough to tell the full product story.</p>\n</blockquote>\n\n<p>I’ve been thinking about this too. The WWDC keynote is <em>always</em> packed. And in recent years, Federighi has gotten Apple’s software factory into such disciplined shape that there are always major updates to every single platform. There are going to be major new features to announce and demo for iOS/iPadOS 17, MacOS 14, and WatchOS 10. I suspect we’re going to see new Mac hardware announced. If it’s just the 15-inch MacBook Air, that’s an easy announcement: it’s a MacBook Air with a bigger display. But if it’s the M-series Mac Pro (finally), <em>that’s</em> going to demand some presentation time. <a href="https://podcasts.apple.com/us/podcast/apple-events-video/id275834665?i=1000565413850">Last year’s keynote</a> ran 1h:48m; <a href="https://www.theverge.com/2022/6/6/23141939/apple-wwdc-2022-biggest-announcements-ios-16-macbook-air-macos-watchos">here’s a rundown from The Verge</a> of the major announcements.</p>\n\n<p>But I do think the headset is going to be announced at WWDC. There’s just too much smoke for there not to be a fire. And, seemingly, Apple isn’t quietly trying to dampen expectations for the headset behind the scenes. The same thing happened with the iPhone before Macworld Expo 2007 — there were rampant rumors that the Apple phone was finally coming, and no one hearing from sources that it wouldn’t. They might have ideally wanted to announce it <em>before</em> this year’s WWDC at a special event, but if they want developers to start creating software for the platform, this is the time. (And why wouldn’t they want developers to start working on ideas?)</p>\n\n<p>Apple does not like for keynotes to run longer than two hours. The glaring exception that springs to mind was the WWDC 2015 keynote, which ran a grueling 2h:25m. That was the one with a long section on Apple Music with Jimmy Iovine on stage. Probably the worst WWDC keynote ever, and the only one that ever felt under-rehearsed.</p>\n\n<p>Here’s the thing though: post-COVID keynotes aren’t just pre-recorded, they’re very tightly edited. I suspect we’ll get a keynote that still comes in under 2 hours even with an entire 40-minute-ish segment announcing both the headset and xrOS. It’ll just go fast. Fitting the headset and xrOS developer frameworks into the old-style on-stage WWDC keynote would have posed a problem. I don’t think it’s a problem with the new “keynote movie” format.<sup id="fnr1-2023-05-19"><a href="https://daringfireball.net/#fn1-2023-05-19">1</a></sup> We won’t come out of the keynote thinking it was too long; we’ll come out of it with our heads spinning because it’s going to cover so much, so fast.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n<li id="fn1-2023-05-19">\n<p>And if I’m right, I bet this is one of those years where after the keynote is over, and people start poring over everything Apple puts on the web, we discover a surprising number of very cool iOS and MacOS features that didn’t make it into the keynote. Anything and everything from the OSes might get cut to make time for the headset, xrOS, and Mac hardware announcements. There’s a whole second State of the Union technical keynote in the afternoon where features cut from the main morning keynote can go.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-19" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n</ol>\n</div>','\n',char(10)),'','2023-05-19 19:00:37','John Gruber','https://daringfireball.net/2023/05/bajarin_wwdc_headset','',NULL,'57c859147782b2530628d70a91fe1ecb48728271');
+INSERT INTO entries VALUES(70,'tag:daringfireball.net,2023:/linked//6.39932',5,'‘Die of Boils, Mr. Sparky Car’','text/html',replace('<p>Back in November, David Simon left Twitter and signed off with this exquisite essay:</p>\n\n<blockquote>\n  <p>I know there are many who found neither decorum nor dignity in the\nblunt ugliness of what for me was very much a bit of decade-long\nperformance art. There I was in the gutter, trading spit and\nflinging sewage. Well, yes, but it was fun. And if you came\ncorrect, we could argue, perhaps even laugh, as many new friends\ncame to understand. But if you came to play, we played. I’m from\nBaltimore, where The Dozens are an American cultural artform like\nany other.</p>\n\n<p>An aggrieved bystander once called the act graceless. I\nreadily agreed:</p>\n\n<p>“This is Twitter. There is no grace. None. Here in an orgy of\norganized disinformation and trollery, our republic has come to\ndie. There is no teaching the fuckmooks and deplorati. Go down\nswinging. Use every cruel word. Invoke their mothers. Lather them\nwith contempt. Enjoy.”</p>\n</blockquote>\n\n<p>In need of an outlet while the WGA strike continues, <a href="https://twitter.com/aodespair">he’s back</a>. (And hell yeah I just invoked “<a href="https://mastodon.social/@gruber/110313691364236126">Learn Spelling</a>” on <em>trollery</em>, <em>deplorati</em>, and especially <em>fuckmooks</em>.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/simon-twitter" title="Permanent link to ‘‘Die of Boils, Mr. Sparky Car’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-19 03:59:00','John Gruber','https://davidsimon.com/die-of-boils-mr-sparky-car/','',NULL,'6b96281716d989f69a03b0283071425808e76f36');
+INSERT INTO entries VALUES(71,'tag:daringfireball.net,2023:/linked//6.39933',5,'Mark Gurman Recaps His Reporting on Apple’s Upcoming XR Headset and He’s Sticking With the Front-Facing Display for Googly Eyes','text/html',replace('<p>Mark Gurman, reporting for Bloomberg:<sup>*</sup></p>\n\n<blockquote>\n  <p>Other key figures in Apple’s top ranks, such as Craig Federighi,\nsenior vice president for software engineering, have also kept\ntheir distance and seemed wary of the headset, according to people\nfamiliar with the project. Johny Srouji, Apple’s senior vice\npresident for hardware technologies, has privately been a skeptic,\nlikening it to a science project. Internally he’s warned that\nbuilding the high-performing chips needed for the device could\ndistract from new iPhone chips, which would probably drive more\nrevenue.</p>\n</blockquote>\n\n<p>That’s some legitimately juicy gossip. But I’m not sure how Federighi, the head of all software at Apple, could keep any distance at all from Apple’s first major new software platform since the iPhone.</p>\n\n<blockquote>\n  <p>Srouji’s group did end up developing some of Apple’s most advanced\nchips to date for the headset, while <a href="https://www.bloomberg.com/news/newsletters/2022-07-03/apple-aapl-iphone-apple-watch-take-a-back-seat-to-the-mac-in-chip-upgrades-l55d87p9">iPhone speed gains have\nindeed slowed</a> in recent years.</p>\n</blockquote>\n\n<p>Well of course Srouji’s group developed advanced chips for the headset. Where else would the chips come from? “<em>Well Tim, Johny is skeptical about this project, so I guess we’ll commission all the custom silicon designs from Qualcomm.</em>”</p>\n\n<p>And comparing benchmark results for <a href="https://browser.geekbench.com/ios-benchmarks/">iPhones</a> vs. <a href="https://browser.geekbench.com/android-benchmarks/">Android phones</a>, I’d love to know what speed gains have slowed. It seems like nonsense to me. If anything, Apple’s A-series chips are further ahead of the competition than ever in both raw performance and performance-per-watt.</p>\n\n<blockquote>\n  <p>In an attempt to keep headset wearers engaged with the real\nworld, the device will have an outward-facing display showing\ntheir eye movements and facial expressions. Apple regards this\nfeature as a key differentiator from enclosed VR headsets. One\nperson familiar with the device says the exterior screens allow\npeople to interact with a headset wearer without feeling as if\nthey’re talking to a robot.</p>\n</blockquote>\n\n<p>I’ll buy this front-facing display rumor <a href="https://daringfireball.net/misc/2023/05/cylon.gif">if there’s a Cylon mode</a>.</p>\n\n<p>Otherwise I’ll stick with <a href="https://daringfireball.net/2023/01/if_a_tree_that_was_never_announced_falls_in_a_forest_does_it_make_a_sound">my previous understanding</a> that this is an internal joke that has been taken as real; that it would look <a href="https://www.pinterest.com/pin/299770918930142474/">goofy</a>, not humane; and that even if it didn’t look goofy, <a href="https://daringfireball.net/linked/2023/02/03/report-it-all">it would make no sense</a> to add the financial cost of an outward-facing display to an already-expensive device, and even less sense to incur the battery-life drain of powering that external display on an already-battery-life-constrained device.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/gurman-headset-recap" title="Permanent link to ‘Mark Gurman Recaps His Reporting on Apple’s Upcoming XR Headset and He’s Sticking With the Front-Facing Display for Googly Eyes’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-19 03:52:10','John Gruber','https://www.bloomberg.com/news/features/2023-05-18/apple-s-mixed-reality-headset-may-define-tim-cook-s-legacy','',NULL,'77aa6b73ebda7a5de48f1c61065653cc69a25e51');
+INSERT INTO entries VALUES(72,'tag:daringfireball.net,2023:/linked//6.39931',5,'OpenAI Releases ChatGPT App for iOS','text/html',replace('<p>OpenAI, in a postscript to their iOS app announcement:</p>\n\n<blockquote>\n  <p>P.S. Android users, you’re next! ChatGPT will be coming to your devices soon.</p>\n</blockquote>\n\n<p>Are Android users <em>next</em>, or are they <em>last</em>? Is there anyone else in line?</p>\n\n<p>Anyway, I guess <a href="https://daringfireball.net/linked/2011/04/03/android-first">Fred Wilson isn’t an advisor to OpenAI</a>?</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/chatgpt-ios-app" title="Permanent link to ‘OpenAI Releases ChatGPT App for iOS’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-19 02:43:14','John Gruber','https://openai.com/blog/introducing-the-chatgpt-app-for-ios','',NULL,'1ac8df245aed95c46facbe2549fc750b2b2664fc');
+INSERT INTO entries VALUES(73,'tag:daringfireball.net,2023://1.39930',5,'★ Do Wall Street Journal Reporters Read The Wall Street Journal?','text/html',replace('<p>Aaron Tilley and Yang Jie, reporting last week for The Wall Street Journal, “<a href="https://www.wsj.com/articles/apple-is-breaking-its-own-rules-with-a-new-headset-80c9b36c">Apple Is Breaking Its Own Rules With a New Headset</a>” (<a href="https://apple.news/AdSGSL1h8RBa5WioRJe_T9g">News+ link</a>):</p>\n\n<blockquote>\n  <p>Apple’s launch plans break many of its traditions and rules about\nnew products that have become the industry gold standard. Unlike\nother Apple products, the device is debuting in a\nstill-experimental mode. Apple predicts slower adoption for the\nheadset compared with the Apple Watch or the iPhone, both of which\nquickly became consumer must-haves. Taking seven years in\ndevelopment before hitting the market, it will be one of the most\ncomplex consumer products any company has ever sold.</p>\n</blockquote>\n\n<p>That’s a lot to unpack in one paragraph. Here goes:</p>\n\n<p>I’d argue Apple has never introduced two new products the same way. Every new product introduction has been different. I honestly don’t know any more about the headset than the rumor mill consensus but I guarantee it isn’t in an “experimental mode”. Neither Apple Watch nor iPhone “quickly became consumer must-haves”. <a href="https://www.wsj.com/articles/apple-watch-with-sizable-sales-cant-shake-its-critics-1461524901">Here’s a report from Daisuke Wakabayashi</a> in ... <em>checks notes</em> ... The Wall Street Fucking Journal itself in April 2016, a year after Apple Watch shipped, that says, in the opening paragraph, “Yet the smartwatch is dogged by a perception that seems premature given the history of Apple’s most popular devices: disappointment.” (The next paragraph claimed that “sales of iPhones are slowing”.)<sup id="fnr1-2023-05-18"><a href="https://daringfireball.net/#fn1-2023-05-18">1</a></sup></p>\n\n<p>The pattern for Apple’s entries into new product categories generally goes like this:</p>\n\n<ul>\n<li>Apple releases the first version. It’s expensive. It’s missing a few obvious features. It has a few obvious limitations. But it’s a breakthrough.</li>\n<li>Early adopters wait in line outside Apple Stores overnight to buy it. Online sales are backordered by weeks or even months soon after they launch.</li>\n<li>That early fervor aside, it’s an early adopter product, and sales are less than those of Apple’s established products.</li>\n<li>After a few months or maybe a year, the immediate-gratification-obsessed business press runs <a href="https://www.wsj.com/articles/apple-watch-with-sizable-sales-cant-shake-its-critics-1461524901">articles</a> declaring the product a dud.</li>\n<li>Apple releases a second-gen version that’s better. Sales go up. Word continues to spread.</li>\n<li><a href="https://daringfireball.net/2010/05/this_is_how_apple_rolls">With each successive year</a>, Apple releases improved models. Those obvious missing features are added. The obvious limitations are removed. Older models stay on sale at lower price points. It becomes a hit product.</li>\n<li>Years later, when Apple is poised to release another altogether new product, the last one — the one written off as a dud after its first year — is held up as a product that was universally hailed as a sensation and smash hit from day one.</li>\n</ul>\n\n<p>A few paragraphs later in Aaron Tilley and Yang Jie’s report:</p>\n\n<blockquote>\n  <p>For Apple’s first new major product in a decade — the Apple Watch\nwas announced in 2014 — Chief Executive Tim Cook has a lot on the\nline as the device attempts to dominate the virtual world where\npeople spend time for work or leisure, called the metaverse, which\nhasn’t yet reached mass adoption or understanding.</p>\n\n<p>There is growing skepticism among some investors and potential\nfuture partners that consumers will spend money and time on the\nmetaverse. They note some early adopters are disillusioned with\nthe technology.</p>\n</blockquote>\n\n<p>It’s a sidenote perhaps, but I’d argue that AirPods are a major new product — and that AirPods Pro are the first true mass-market augmented reality devices. The fact that they’re audio-only, and not visual, blinds people (sorry) to the fact that they’re <a href="https://daringfireball.net/2019/10/airpods_pro_first_impressions">remarkable AR products</a>. Apple doesn’t break out unit sales, but estimates suggest that if AirPods — just AirPods — were a standalone company, <a href="https://daringfireball.net/2010/05/this_is_how_apple_rolls">it would have more revenue</a> than Nvidia, Adobe, or Uber, and might soon catch up to Netflix. But that’s a sidenote. </p>\n\n<p>The bigger issue is that back in October, <a href="https://daringfireball.net/linked/2022/10/26/stern-federighi-joz">in an on-stage interview</a>, Greg Joswiak was asked to complete the sentence “The metaverse is...”, and his answer was, “...a word I’ll never use.” The fact that people don’t use or even know what the hell the metaverse means is irrelevant to Apple’s headset. I don’t know how much more clear Joz could have been without revealing Apple’s headset then and there — <em>Apple’s not making something that’s just like what other companies already have on the market</em>. That on-stage interview was with ... <em>checks notes</em> ... <a href="https://www.youtube.com/watch?v=m-ugwoEOMvg">Joanna Stern at The Wall Street Journal Tech Live conference</a>. It’s enough to make you think Wall Street Journal reporters don’t read The Wall Street Journal.</p>\n\n<p>That no XR headset introduced so far has made much of a dent in the universe isn’t a sign that Apple’s effort is ill-fated. It’s a sign that Apple has an opportunity. In a sense, Apple <em>does</em> have one tradition when entering a new product category: they endeavor to make <a href="https://www.fastcompany.com/40435064/what-alan-kay-thinks-about-the-iphone-and-technology-now">the first one good enough to be criticized</a>.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n<li id="fn1-2023-05-18">\n<p>Here’s a paragraph for the Annals of Prognostication from that same 2016 Wakabayashi report for the Journal:</p>\n\n<blockquote>\n  <p>And yet, there are detractors such as Fred Wilson, co-founder of\nventure-capital firm Union Square Ventures, in December declared\nthe Watch a “flop.” Mr. Wilson, who owns shares of Fitbit through\na fund, had earlier predicted the Watch wouldn’t be a “home run”\nlike the iPad, iPhone and iPod, saying many people wouldn’t want\nto wear a computer on their wrist.</p>\n</blockquote>\n\n<p><a href="https://daringfireball.net/linked/2016/01/02/fred-wilson-predictions">Fred Wilson</a>, the <a href="https://daringfireball.net/linked/2014/05/05/wilson">next best thing</a> to <a href="https://nypost.com/2023/03/10/cnbcs-jim-cramer-touted-silicon-valley-bank-stock/">Jim Cramer</a>.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-18" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n</ol>\n</div>','\n',char(10)),'','2023-05-19 01:41:49','John Gruber','https://daringfireball.net/2023/05/do_wall_street_journal_reporters_read_the_wall_street_journal','',NULL,'c86d4d28ef0e73e11c497e4b50baf8ddec711524');
+INSERT INTO entries VALUES(74,'tag:daringfireball.net,2023:/linked//6.39929',5,'New EU Cryptocurrency Rules Make Exchanges Liable If They Lose Customers’ Assets','text/html',replace('<p>Ashley Belanger, reporting for Ars Technica:</p>\n\n<blockquote>\n  <p>Today, the European Union <a href="https://www.consilium.europa.eu/en/press/press-releases/2023/05/16/digital-finance-council-adopts-new-rules-on-markets-in-crypto-assets-mica/">approved</a> a comprehensive set of\ncryptocurrency regulations seeking to lay the groundwork for how\ncrypto is regulated globally. The rules — which make providers\nliable if they lose investors’ crypto assets — will go into\neffect in 2024 across 27 EU member states.</p>\n</blockquote>\n\n<p>The EU’s muscular regulation regime finally lands on a worthwhile target.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/eu-cryptocurrency-rules" title="Permanent link to ‘New EU Cryptocurrency Rules Make Exchanges Liable If They Lose Customers’ Assets’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 22:21:24','John Gruber','https://arstechnica.com/tech-policy/2023/05/landmark-crypto-rules-make-exchanges-liable-for-customer-losses-in-eu/','',NULL,'af4b02bdd992bad1b8781b3b314a8d9eff38a01c');
+INSERT INTO entries VALUES(75,'tag:daringfireball.net,2023://1.39928',5,'★ Let’s Check in on Supermicro, the Target of Bloomberg’s ‘The Big Hack’','text/html',replace('<p><a href="https://mastodon.social/@kimahlberg/110386827166566142">Kim Ahlberg, posting on Mastodon</a>:</p>\n\n<blockquote>\n  <p>Putting some money into SMCI after reading <a href="https://mastodon.social/@gruber">@gruber</a>’s posts\ncalling out Bloomberg¹ on their bullshit story has been a good\nmove so far…</p>\n\n<p>¹ Bloomberg, of course, is the publication that\n  published “The Big Hack” in October 2018 — a sensational story\n  alleging that data centers of Apple, Amazon, and dozens of other\n  companies were compromised by China’s intelligence services. The\n  story presented no confirmable evidence at all.</p>\n</blockquote>\n\n<p>Supermicro (SMCI) was the company whose server motherboards Bloomberg alleged were compromised by rogue chips designed to surreptitiously phone home to Chinese intelligence servers. Bloomberg presented zero actual evidence then, and five years later, zero evidence of such rogue chips has been found. Every company Bloomberg alleged was compromised flatly denied the report. Bloomberg has never retracted the report, thus forever tarnishing their journalistic integrity. <a href="https://daringfireball.net/2018/10/bloomberg_the_big_hack">Here’s my first report on the story</a>, and <a href="https://daringfireball.net/search/bloomberg+big+hack">this search</a> should get you to my follow-ups.</p>\n\n<p>When Bloomberg published their spectacular but seemingly completely false report, <a href="https://www.wolframalpha.com/input?i=smci+stock+price+september+2018+to+november+2018">Supermicro’s stock price plummeted by almost half</a>, from $21.50 to $11.65 per share.</p>\n\n<p>I can’t believe I never thought to follow-up on their share price, given my years-long zealotry reminding people, via footnotes in other reports from Bloomberg, that “The Big Hack” was by all available evidence complete bullshit, yet never retracted.</p>\n\n<p>Turns out Supermicro <a href="https://www.wolframalpha.com/input?i=smci+stock+price+september+2018+to+may+2023">has done OK in the intervening years</a>. Their stock closed today at $164.56 — over 14 times higher than it was after “The Big Hack” dropped. That’s <a href="https://daringfireball.net/misc/2023/05/supermicro-stock-2018-2023.jpeg">a tidy return</a> for Ahlberg and anyone else who invested similarly. What a nice postscript to a disgraceful story.</p>','\n',char(10)),'','2023-05-18 21:19:24','John Gruber','https://daringfireball.net/2023/05/lets_check_in_on_supermicro','',NULL,'a17325e87a473e1919159c08f88a6ef638e486fc');
+INSERT INTO entries VALUES(76,'tag:daringfireball.net,2023:/linked//6.39927',5,'CNBC: ‘Google to Save Money on Employee Laptops, Services, and Staplers’','text/html',replace('<p>Jennifer Elias, reporting for CNBC back in early April (sorry — I’m cleaning up old open tabs):</p>\n\n<blockquote>\n  <p>Among the equipment changes, Google is pausing refreshes for\nlaptops, desktop PCs and monitors. It’s also “changing how often\nequipment is replaced,” according to internal documents viewed\nby CNBC.</p>\n\n<p>Google employees who are not in engineering roles but require a\nnew laptop will receive a Chromebook by default. Chromebooks are\nlaptops made by Google and use a Google-based operating system\ncalled Chrome OS.</p>\n\n<p>It’s a shift from the range of offerings, such as Apple MacBooks,\nthat were previously available to employees. “It also provides the\nbest opportunity across all of our managed devices to prevent\nexternal compromise,” one document about the laptop changes said.</p>\n</blockquote>\n\n<p>Google has this backwards. They should force all their engineers to use Chromebooks, and let everyone else continue using MacBooks. Maybe then they’ll turn ChromeOS into something useable for real work.</p>\n\n<blockquote>\n  <p>Google employees have also noticed some more extreme cutbacks to\noffice supplies in recent weeks. Staplers and tape are no longer\nbeing provided to print stations companywide as “part of a cost\neffectiveness initiative,” according to a separate, internal\nfacilities directive viewed by CNBC.</p>\n\n<p>“We have been asked to pull all tape/dispensers throughout the\nbuilding,” a San Francisco facility directive stated. “If you need\na stapler or tape, the receptionist desk has them to borrow.”</p>\n\n<p>A Google spokesperson said the internal message about staplers and\ntape was misinformed. “Staplers and tape continue to be provided\nto print stations. Any internal messages that claim otherwise are\nmisinformed.″</p>\n</blockquote>\n\n<p>Please tell me they haven’t dismantled <a href="https://www.businessinsider.com/googles-office-slides-2012-5#8-google-detroit-1">the slides</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/google-chromebooks-staplers" title="Permanent link to ‘CNBC: ‘Google to Save Money on Employee Laptops, Services, and Staplers’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 19:57:38','John Gruber','https://www.cnbc.com/2023/04/03/google-to-cut-down-on-employee-laptops-services-and-staplers-to-save.html','',NULL,'9064455cbb6df43cdaaa02aedff14912e71bf87e');
+INSERT INTO entries VALUES(77,'tag:daringfireball.net,2023:/linked//6.39926',5,'Disney Pulls Plug on $1 Billion Development in Florida','text/html',replace('<p>Brooks Barnes, reporting for The New York Times:</p>\n\n<blockquote>\n  <p>In March, Disney called Gov. Ron DeSantis of Florida\n“anti-business” for his scorched-earth attempt to tighten\noversight of the company’s theme park resort near Orlando. Last\nmonth, when Disney sued the governor and his allies for what it\ncalled “a targeted campaign of government retaliation,” the\ncompany made clear that $17 billion in planned investment in Walt\nDisney World was on the line.</p>\n\n<p>“Does the state want us to invest more, employ more people, and\npay more taxes, or not?” Robert A. Iger, Disney’s chief\nexecutive, said on an earnings-related conference call with\nanalysts last week.</p>\n\n<p>On Thursday, Mr. Iger and Josh D’Amaro, Disney’s theme park and\nconsumer products chairman, showed that they were not bluffing,\npulling the plug on a nearly $1 billion office complex that was\nscheduled for construction in Orlando. It would have brought more\nthan 2,000 jobs to the region, with $120,000 as the average\nsalary, according to an estimate from the Florida Department of\nEconomic Opportunity.</p>\n</blockquote>\n\n<p>Vote for Republicans, they’re good for business.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/18/disney-florida-pulls-plug" title="Permanent link to ‘Disney Pulls Plug on $1 Billion Development in Florida’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 19:50:22','John Gruber','https://www.nytimes.com/2023/05/18/business/disney-ron-desantis-florida.html?smtyp=cur&smid=tw-nytimes','',NULL,'f5663db5bbae23631fc68df87bccb5e1a8ba4d56');
+INSERT INTO entries VALUES(78,'tag:daringfireball.net,2023:/linked//6.39925',5,'Porsche Adds Support for Apple Maps EV Routing','text/html',replace('<p>Chance Miller, 9to5Mac:</p>\n\n<blockquote>\n  <p>Porsche is signing on to be the second EV maker to officially\nadopt support for EV routing in Apple Maps. This means that\nPorsche Taycan drivers can now use Apple Maps via CarPlay,\nsignaling Porsche’s continued commitment to CarPlay as other\n<a href="https://9to5mac.com/2023/03/31/gm-carplay-support-ev/">automakers abandon Apple’s platform</a>.</p>\n</blockquote>\n\n<p>It’s not other automakers plural. It’s just one: GM.</p>\n\n<p>But I’m sure GM knows better than Porsche.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/porsche-apple-maps" title="Permanent link to ‘Porsche Adds Support for Apple Maps EV Routing’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 01:42:13','John Gruber','https://9to5mac.com/2023/05/17/apple-maps-porsche-ev-routing/','',NULL,'c2439cd3f3c9d8e404be6ee525bc15dd39dfbb61');
+INSERT INTO entries VALUES(79,'tag:daringfireball.net,2023:/linked//6.39920',5,'Follow-Up on GM’s ‘Edsel’ Pipe Dream for Tens of Billions in Annual Services Revenue: Apple Makes Most of Its Services Revenue From the App Store','text/html',replace('<p>In <a href="https://daringfireball.net/2023/05/gm_edsel">my piece yesterday</a> digging into the numbers on GM’s plan to generate $20–25 billion in annual subscription services revenue by the end of the decade, I originally neglected to mention (but have since added) the single largest source of services revenue for Apple: the App Store. Here’s Kif Leswing reporting for CNBC in January this year:</p>\n\n<blockquote>\n  <p>On Tuesday, <a href="https://www.apple.com/newsroom/2023/01/apple-celebrates-a-groundbreaking-year-in-entertainment/">Apple said it has paid $320 billion to\ndevelopers</a>, up from $260 billion as of last year, a jump of\n$60 billion. Developers receive between 70% and 85% of gross\nsales, depending on if they qualify for Apple’s reduced rate.</p>\n\n<p>If all developers paid a 30% cut to Apple, Apple’s App Store\ngrossed more than $85 billion in 2022, based on a CNBC analysis.\nIf Apple’s commissions were all 15%, the App Store’s estimated\ngross would come in lower, around $70 billion.</p>\n</blockquote>\n\n<p><s>I’m not quite sure how to square these estimates with <a href="https://sixcolors.com/post/2023/05/apple-q2-2023-results-94-8b-revenue-better-than-expected/">Apple’s figures from their quarterly reports</a> — according to Apple’s reports, the company only booked a total of about $80 billion in services revenue for 2022.</s> <a href="https://www.cnbc.com/2021/09/10/apple-vs-epic-70percent-of-app-store-revenue-from-customers-playing-games.html">And we know from the Apple v. Epic lawsuit</a> that 70 percent of App Store revenue comes from gaming.</p>\n\n<p>[<strong>Wait wait wait I figured it out:</strong> My bad for misreading the numbers (which I think were confusingly described). I mistakenly thought Leswing was saying that Apple’s commissions were $70-85 billion last year. That’s <em>not</em> what he meant and that’s obviously far too high. But the math is really rather simple. $320 billion is the sum of Apple’s <em>cumulative</em> payments to developers from 2008 to 2022. $60 billion is what Apple paid to developers in 2022. Duh. Of <em>course</em> they didn’t pay $320 billion last year alone. So let’s assume that Apple’s average commission from App Store purchases is 25 percent, which seems both fair (given that 70 percent of App Store revenue comes from gaming and in-app purchases carry a 70/30 split) and makes the math really easy for last year. With $60 billion in payments to developers in 2022, Apple’s take was $20 billion. So about one quarter of Apple’s services revenue comes from App Store commissions — <em>that</em> squares perfectly with a common sense estimate. (Also: the fact that almost 20 percent of the App Store’s <em>cumulative</em> revenue was generated last year alone goes to show just how much it’s still growing.)]</p>\n\n<p>How in the world does GM CEO Mary Barra think they’re going to replicate anything like this? Why drop support for the much-liked CarPlay — a feature <a href="https://www.theverge.com/2022/6/6/23156741/ios-16-carplay-apple-wwdc-hvac-deeper-integration">Apple says 79 percent of new car buyers in the U.S. want</a> — to chase a pipe dream? I can’t put it better than <a href="https://mastodon.social/@jamesdempsey/110385234972539439">James Dempsey quipped on Mastodon</a>: “It’s like CurrentC, but for cars!”</p>\n\n<p>But it’s even worse than that, because at least the <a href="https://daringfireball.net/search/CurrentC">CurrentC consortium’s ill-fated scheme</a> to avoid supporting Apple Pay at brick-and-mortar retail stores came at a time when Apple Pay was nascent. Back in 2014 a survey never would have found that 79 percent of U.S. shoppers wanted Apple Pay support at the register. GM is making this move now, after CarPlay has become both standard and liked by an overwhelming majority of buyers — including GM’s own customers.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/edsel-follow-up-app-store" title="Permanent link to ‘Follow-Up on GM’s ‘Edsel’ Pipe Dream for Tens of Billions in Annual Services Revenue: Apple Makes Most of Its Services Revenue From the App Store’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-18 00:45:00','John Gruber','https://www.cnbc.com/2023/01/10/apple-app-store-revenue-update-shows-slowing-growth-.html','',NULL,'9d8e8936dd9eb6928c53364b760d08c93597cd5b');
+INSERT INTO entries VALUES(80,'tag:daringfireball.net,2023:/linked//6.39924',5,'Pew Research Center: ‘Majority of U.S. Twitter Users Say They’ve Taken a Break From the Platform in the Past Year’','text/html',replace('<p>Pew Research Center:</p>\n\n<blockquote>\n  <p>A majority of Americans who have used Twitter in the past year\nreport taking a break from the platform during that time, and a\nquarter say they are not likely to use it a year from now,\naccording to a Pew Research Center survey conducted about five\nmonths after billionaire Elon Musk acquired the site.</p>\n</blockquote>\n\n<p>The saving grace for Twitter might be that people don’t always follow through with what they tell pollsters. They might answer honestly with what they think they’ll do, or should do, but they don’t really know what they <em>will</em> do. Commission a poll in December and ask people how many books they plan to read next year, or how often they plan to hit the gym, for example.</p>\n\n<p>But with that caveat out of the way, this survey is pretty damning. A lot of Twitter users no longer enjoy Twitter, and Twitter is meant for enjoyment. Musk’s only hope is that people will continue using Twitter even if they don’t enjoy it, and I don’t see that happening. Facebook gets away with that to a large extent because so many people feel obligated to use it to stay in touch with family and friends. Twitter doesn’t carry <em>any</em> sense of obligation.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/pew-twitter-poll" title="Permanent link to ‘Pew Research Center: ‘Majority of U.S. Twitter Users Say They’ve Taken a Break From the Platform in the Past Year’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 23:02:34','John Gruber','https://www.pewresearch.org/short-reads/2023/05/17/majority-of-us-twitter-users-say-theyve-taken-a-break-from-the-platform-in-the-past-year/','',NULL,'18ad0b25cdee2e79a62ef76a600052d56eb2e758');
+INSERT INTO entries VALUES(81,'tag:daringfireball.net,2023:/linked//6.39923',5,'Elon Musk Defends Anti-Soros Tweets in Bananas Interview on CNBC: ‘I’ll Say What I Want’','text/html',replace('<p>CNBC:</p>\n\n<blockquote>\n  <p>Elon Musk told CNBC’s David Faber on Tuesday that he doesn’t care\nif his inflammatory tweets scare away potential Tesla buyers or\nTwitter advertisers. “I’ll say what I want, and if the consequence\nof that is losing money, so be it,” said Musk, who owns Twitter.\nMusk has for years tweeted controversial items, including\nconspiracy theories and comments his critics have called broadly\ndiscriminatory.</p>\n\n<p>His defense came after Musk caught renewed criticism for <a href="https://twitter.com/elonmusk/status/1658294821679951872">a\ntweet</a> in which he likened liberal billionaire and\nDemocratic donor George Soros to <a href="https://twitter.com/elonmusk/status/1658291808592629761">X-Men villain Magneto</a>,\na Jewish Holocaust survivor.</p>\n\n<p>“He wants to erode the very fabric of civilization. Soros hates\nhumanity,” Musk tweeted Monday.</p>\n</blockquote>\n\n<p>There are some moments in this video interview that are <a href="https://www.mediaite.com/news/kara-swisher-torpedoes-bonkers-elon-musk-interview-especially-stuff-about-white-supremacist-mall-shooter/">just cringe-inducing</a>. Even just the awkward pauses. (Faber, to my mind, did a hell of a job — Musk is obviously a very difficult person to interview.) I’m starting to get real <a href="https://www.npr.org/2011/01/30/133272280/the-troubled-genius-of-bobby-fischer">Bobby Fischer vibes</a> from Musk — a genius, yes, but descending into conspirational hateful madness. But Fischer became a recluse; Musk is one of the most prominent people in the world.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/musk-faber-cnbc-interview" title="Permanent link to ‘Elon Musk Defends Anti-Soros Tweets in Bananas Interview on CNBC: ‘I’ll Say What I Want’’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 22:27:29','John Gruber','https://www.cnbc.com/2023/05/16/elon-musk-defends-inflammatory-tweets-ill-say-what-i-want.html','',NULL,'5aeb655f7e120409b1b144dcb65ddfdfdb8c560d');
+INSERT INTO entries VALUES(82,'tag:daringfireball.net,2023:/linked//6.39922',5,'Jason Snell on Final Cut and Logic for iPad','text/html',replace('<p>Jason Snell, writing at Six Colors:</p>\n\n<blockquote>\n  <p>Final Cut Pro for iPad seems to be a subset of the Mac version.\nYou can start on iPad and move to Mac, but the migration won’t\nwork the other way, and a bunch of features from the Mac just\naren’t there on the iPad.</p>\n\n<p>This is disappointing. Yes, the lack of feature parity is\nunfortunate — but perhaps a bit understandable? But as someone\nwho rarely uses those pro-level features, it’s also frustrating to\nrealize that even my simple projects won’t be portable in case I\nneed to leave home and run off somewhere with an iPad.</p>\n</blockquote>\n\n<p>Logic Pro users can roundtrip between Mac and iPad, but as Snell points out, <em>not</em> if you’re using any Audio Unit plugins that are Mac-only.</p>\n\n<p>The lack of roundtripping with Final Cut is disappointing, but I agree with Snell that it’s understandable. Presumably, roundtrip support between iPad and Mac is forthcoming, and requires engineering work that isn’t yet finished — either in iPadOS itself or in Final Cut Pro for iPad (or both). But what would we prefer? To wait for months or another year for Final Cut to hit iPad? After waiting this long, Apple wouldn’t release Final Cut for iPad now if they didn’t think it was a viable product as it stands, even without roundtrip project support with the Mac.</p>\n\n<p>Don’t miss my favorite part of Snell’s piece, where he describes how productive he is editing podcasts on iPad with Ferrite Recording Studio because it has rich support for multitouch. It’s a perfect example of <a href="https://daringfireball.net/2020/01/the_ipad_awkwardly_turns_10">Steve Jobs’s guiding maxim</a> for the iPad when he introduced it in 2010: that it needs to be able to do some things better than either the iPhone or Mac.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/snell-final-cut-logic-ipad" title="Permanent link to ‘Jason Snell on Final Cut and Logic for iPad’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 22:08:47','John Gruber','https://sixcolors.com/post/2023/05/final-cut-and-logic-arrive-on-ipad-questions-and-some-answers/','',NULL,'df3fc8307541b294176350d85b715b3f0ead0f90');
+INSERT INTO entries VALUES(83,'tag:daringfireball.net,2023:/linked//6.39921',5,'Drudge Hints That Laura Ingraham Is Next on Fox News’s Shitcan List','text/html',replace('<p>Alex Griffing, writing for Mediaite:</p>\n\n<blockquote>\n  <p>The Drudge Report dropped a siren-blaring scoop on Wednesday\nannouncing an imminent shake-up at Fox News, eventually reporting\nthat Sean Hannity will take over at 8 p.m.</p>\n\n<p>“WORLD EXCLUSIVE: FOXNEWS SETS NEW SCHEDULE” read the headline\nfrom Matt Drudge on the highly-trafficked website he founded.\nDrudge eventually updated that headline to note Hannity’s new gig\nas well as report both Jesse Watters and Greg Gutfeld would be\nheading to prime time.</p>\n\n<p>Watters currently hosts one of Fox’s top-rated shows at 7 p.m.\nwhile Gutfeld hosts a highly-rated late-night show at 11 p.m. — both co-host Fox’s top-rated program The Five at 5 p.m. Hannity,\nmeanwhile, broke the record for longest-running cable news prime\ntime host in April of 2022, eclipsing Larry King at 25 years, six\nmonths, and 15 days.</p>\n\n<p>“FOXNEWS is preparing to announce an ambitious new schedule, the\nDrudge Report has learned, a schedule where ever hour of primetime\nwill change!” Drudge reported. “TOP SOURCE TELLS DRUDGE: ‘IT’S OUR\nBOLDEST AND MOST FEARLESS LINE-UP EVER’…”</p>\n</blockquote>\n\n<p>Ingraham isn’t mentioned by name, but there are only three prime-time hours, so if they go to Hannity, Watters, and Gutfeld, she’s following Tucker Carlson out the door. Tomorrow will mark six years since <a href="https://en.wikipedia.org/wiki/Roger_Ailes">Roger Ailes’s death</a>. It feels like Fox News was running on autopilot since then — but the Murdochs have woken from their slumber and are shaking things up.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/17/drudge-ingraham" title="Permanent link to ‘Drudge Hints That Laura Ingraham Is Next on Fox News’s Shitcan List’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-17 22:02:03','John Gruber','https://www.mediaite.com/news/just-in-matt-drudge-teases-bombshell-about-fox-news-schedule-shakeup/','',NULL,'dfc63db3858eb52a1b5425a0330d45e14c195d2d');
+INSERT INTO entries VALUES(84,'tag:daringfireball.net,2023://1.39919',5,'★ Proposed Name for GM’s Upcoming In-House Software Platform (You Know, the One That Isn’t Going to Support CarPlay): Edsel','text/html',replace('<p><a href="https://www.cnbc.com/2023/05/09/gm-hires-ex-apple-exec-mike-abbott-to-lead-new-software-unit.html">Michael Wayland, reporting last week for CNBC</a>:</p>\n\n<blockquote>\n  <p>General Motors has hired former Apple executive Mike Abbott to\nlead a newly created software unit for the Detroit automaker.\nAbbott, former vice president of engineering for Apple’s cloud\nservices division, will join GM as executive vice president of\nsoftware, effective May 22. He will report to GM CEO Mary Barra.</p>\n\n<p>Abbott’s newly created role will bring together three separate\nfunctions within the company: software-defined vehicle and\noperating systems; information and digital technology; and the\ncompany’s digital business. [...]</p>\n\n<p>GM has a target to grow profit margins and double its revenue to\nabout $280 billion by the end of this decade. That includes\nsignificant growth in new business units and software.</p>\n</blockquote>\n\n<p>I’m not familiar with Mike Abbott, but it sounds like his expertise is entirely in cloud services, not user-facing software design and engineering. So I don’t think Barra was thinking “<em>Apple makes great software that people love, so we should hire someone from Apple who knows how to lead such a team</em>”,<sup id="fnr1-2023-05-16"><a href="https://daringfireball.net/#fn1-2023-05-16">1</a></sup> but instead more like “<em>Apple has built an $80 billion per year services division that continues to grow each quarter, so we should hire someone who knows how to lead such a team</em>”. Barra is looking at <a href="https://sixcolors.com/post/2023/05/apple-q2-2023-results-94-8b-revenue-better-than-expected/">Apple’s services revenue</a>, not the quality of Apple’s CarPlay.</p>\n\n<p>That’s fine, and maybe someone like Abbott is exactly who GM needs. But I don’t look at this hire and think that GM is any more likely to come up with a CarPlay-quality interface for its own platform. Some back-of-the-envelope math on Barra’s services revenue goals for GM makes it sound to me like Mike Abbott is being tasked with designing an in-dash slot machine.</p>\n\n<p>When <a href="https://daringfireball.net/2023/04/gm_carplay_iphones">GM announced they were dropping CarPlay from their EVs</a> last month, <a href="https://www.reuters.com/technology/gm-plans-phase-out-apple-carplay-evs-with-googles-help-2023-03-31/">Reuters reported</a> that “Barra is aiming for $20 billion to $25 billion in annual revenue from subscriptions by 2030.”</p>\n\n<p>That seems very ambitious.</p>\n\n<p>Let’s look at GM’s current subscription services revenue. <a href="https://www.fool.com/investing/2022/07/24/why-wall-street-loves-this-new-car-option-that-dri/">Here’s Larry Printz, writing for Motley Fool last July</a>:</p>\n\n<blockquote>\n  <p>According to company officials, GM generated nearly $2 billion in\nsubscription services revenue and EBIT margins north of 70% in\nfiscal 2021. The automaker currently has more than 4 million\nsubscribers. For 2021, GM’s global revenue was $127 billion,\nmeaning that if forecast proved true, OnStar accounted for 1.6% of\nGM’s worldwide revenue. While that may seem like a minimal\ncontribution to the bottom line, that figure should grow thanks to\nrecent additions to OnStar.</p>\n\n<p>GM recently announced a subscription plan for its SuperCruise\nself-driving feature, which is free for the first three years on\nnew vehicles. It also opened OnStar to owners of non-GM vehicles\nthrough a smartphone app, which should bring additional\nsubscribers — and income.</p>\n</blockquote>\n\n<p>To grow from $2 billion to $20 billion (the low end of Barra’s stated goal) by 2030, it seems safe to assume she’s expecting this growth to come from future car sales, not GM vehicles that are already on the road today.</p>\n\n<p><a href="https://www.statista.com/statistics/225326/amount-of-cars-sold-by-general-motors-worldwide/">GM sells about 6 million vehicles per year</a> — but that number has been declining since a peak of 10 million in 2016. Presumably, these future services will require vehicles equipped with GM’s new software platform. Right now they’re claiming this system will only be going into EVs, and in 2022, <a href="https://insideevs.com/news/629611/us-gm-plugin-car-sales-2022q4/">only 1.7 percent of GM vehicles sold were all-electric</a>.</p>\n\n<p>So let’s be generous and say that by 2030, GM has sold 30 million vehicles eligible for <em>and subscribed to</em> the company’s new services. I think 30 million is very generous — if not outlandish — and would require them to put the new software platform in their gas and hybrid vehicles, too. Keep in mind they only had 4 million subscribers in 2021 and their vehicle sales are in decline.</p>\n\n<p>$20 billion in revenue from 30 million subscribers = $666/year/vehicle = $55/month/vehicle. That’s in line with their current average of $500/year per services subscriber ($2 billion in revenue from 4 million subscribers, per Motley Fool above), but it’s a lot of money per subscriber. I just don’t see how they grow from 4 million subscribers today to 30 million or more by 2030.</p>\n\n<p>What services could they offer that new car buyers would pay north of $50/month for? Maps and navigation? Everyone has that on their phones already. Music and podcasts? Everyone has that on their phones already. Crash detection? By 2030 everyone will have that on their phones already (or at least they will <a href="https://support.apple.com/en-us/HT213225">if they have iPhones</a>, but I bet that will soon become a standard feature on Android phones too). GM wants to sell “behavior based insurance” (translation: tracking/surveillance), but <a href="https://www.reuters.com/business/autos-transportation/gm-set-launch-behavior-based-us-driver-insurance-q1-executive-2022-01-24/">according to Reuters</a>, their goal for insurance is just $6 billion/year by 2030. I find it hard to see where the rest of the money will come from.</p>\n\n<p>GM executives might be dreaming that car buyers will pay GM for services they already get on their phones by not supporting CarPlay and Android Auto, but today’s reality shows that people will just buy $5 mounts to attach their phones to their vehicles’ dashboards. And if every other automaker continues to support CarPlay and Android Auto, it just seems like this entire endeavor will turn into an expensive boondoggle that steers would-be GM buyers to other brands.</p>\n\n<p>One idea that occurred to me is the equivalent of Apple’s services revenue dark matter: payments from Google for default placement as Safari’s search engine. Neither Apple nor Google has ever disclosed those numbers, but <a href="https://9to5mac.com/2022/01/05/apple-default-search-engine/">one recent estimate</a> pegs it at $20 billion per year. At a minimum, it’s $10 billion per year. Those payments from Google go into “Services” in Apple’s quarterly results. Apple now reports $20 billion in services revenue per <em>quarter</em> — so most of that is coming from the App Store, and then customer subscriptions to things like iCloud Plus, Apple Music, etc., but somewhere around 20-25 percent of it comes from Google paying to be the default search engine in Safari. With GM’s upcoming in-house software system not supporting CarPlay or Android Auto, but made in partnership with Google (based on Google’s confusingly-named <a href="https://source.android.com/docs/devices/automotive/start/what_automotive">Android Automotive</a> platform) presumably Google Maps (and/or <a href="https://www.theverge.com/2022/12/8/23499734/google-maps-waze-development-teams-combined-productivity">Waze</a>?) will be the one and only choice for mapping and navigation, and perhaps Google will pay GM for that privilege? And for default placement for other services like music? Even if that’s the deal, though, I don’t see how it gets GM close to $20 billion in services revenue per year. Apple gets $15-20 billion from Google for default search engine placement in Safari on <a href="https://www.theverge.com/2021/1/27/22253162/iphone-users-total-number-billion-apple-tim-cook-q1-2021">over one billion</a> iPhones, iPads, and Macs. Even my kindest, most optimistic estimate pegs eligible GM vehicles at just 30 million by 2030. Would Google pay GM 30–40 times more per car to provide the default mapping app than they pay Apple per iPhone/iPad/Mac? That doesn’t make sense to me, but I suppose it’s theoretically possible that mapping surveillance data is <em>that</em> valuable to Google. I really fucking doubt it, though.</p>\n\n<p>The one and only thing I can think of that GM can charge a subscription for that drivers can’t get via their phones is semi-autonomous driving. GM calls this Super Cruise and <a href="https://www.onstar.com/plans/premium">currently charges $25/month for it</a>, or $15/month for drivers who also subscribe to OnStar. (OnStar offers roadside assistance and crash detection — which, again, everyone will have for free with their phones by 2030.) But Super Cruise could exist as a standalone subscription feature <em>alongside</em> support for CarPlay and Android Auto — and in fact does today. Charging a subscription fee for Super Cruise doesn’t require GM to drop support for CarPlay and Android Auto integration.</p>\n\n<p>I can’t see how these ballpark numbers make any sense. It’s an enormous bet against the primacy of the phone in people’s lives, with no one yet, in any industry, ever having won a bet against the phone. GM’s $20–25 billion target for services revenue by 2030 feels like a <a href="https://succession.fandom.com/wiki/Kendall_Roy">Kendall Roy number</a> — plucked out of thin air by someone just making up figures in an Excel spreadsheet until they get the <code>SUM()</code> result they’re looking for.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n<li id="fn1-2023-05-16">\n<p>I don’t think there’s any chance whatsoever this could have happened, but imagine if GM had hired Scott Forstall to lead their software division. That would have been interesting.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-16" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n</ol>\n</div>','\n',char(10)),'','2023-05-17 02:27:30','John Gruber','https://daringfireball.net/2023/05/gm_edsel','',NULL,'515421cb335ad0c84f04076bce951290f8b760e5');
+INSERT INTO entries VALUES(85,'tag:daringfireball.net,2023:/linked//6.39918',5,'‘You Either Know or You Don’t Know’ — and Dianne Feinstein Does Not Seem to Know','text/html',replace('<p>Jim Newell, writing for Slate under the headline “A Brief, Concerning Conversation With Dianne Feinstein”:</p>\n\n<blockquote>\n  <p>I asked her how she was feeling.</p>\n\n<p>“Oh, I’m feeling fine. I have a problem with the leg.” A\nfellow reporter staking out the elevator asked what was wrong\nwith the leg.</p>\n\n<p>“Well, nothing that’s anyone concern but mine,” she said.</p>\n\n<p>When the fellow reporter asked her what the response from her\ncolleagues had been like since her return, though, the\nconversation took an odd turn.</p>\n\n<p>“No, I haven’t been gone,” she said.</p>\n\n<p>OK.</p>\n\n<p>“You should follow the — I haven’t been gone. I’ve been working.”</p>\n\n<p>When asked whether she meant that she’d been working from home,\nshe turned feisty.</p>\n\n<p>“No, I’ve been here. I’ve been voting,” she said. “Please. You\neither know or don’t know.”</p>\n\n<p>After deflecting one final question about those, like Rep. Ro\nKhanna, who’ve called on her to resign, she was wheeled away.</p>\n</blockquote>\n\n<p>Feinstein’s months-long absence from the Senate has been one of the biggest political stories (and <a href="https://www.theonion.com/dianne-feinstein-america-is-out-of-touch-gerontocracy-1850429436">jokes</a>) of the year. Her senescence is truly sad at a personal level, but the U.S. Senate, ostensibly the greatest deliberative body in the history of democracy, is no place for a person who doesn’t know where she’s been for the last three months. Anyone on her staff or in her family who isn’t urging her to resign ought to be ashamed.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/16/feinstein-doesnt-know" title="Permanent link to ‘‘You Either Know or You Don’t Know’ — and Dianne Feinstein Does Not Seem to Know’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-16 23:34:34','John Gruber','https://slate.com/news-and-politics/2023/05/dianne-feinstein-health-return-to-senate.html','',NULL,'0c29d8d5e25295d14ea4735eec6f9fc610741f73');
+INSERT INTO entries VALUES(86,'tag:daringfireball.net,2023:/feeds/sponsors//11.39917',5,'[Sponsor] Onin Keyboard Calendar','text/html',replace('<p>Only 40% of the plans we make in messaging apps end up in our calendar. Onin is the free iPhone keyboard that brings your calendar into every conversation. Check your calendar, add events, and share invites inside any app. Onin works with all your existing calendars, in all your apps, and is end-to-end encrypted.</p>\n\n<div>\n<a href="https://daringfireball.net/feeds/sponsors/2023/05/onin_keyboard_calendar" title="Permanent link to ‘Onin Keyboard Calendar’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 21:05:34','Daring Fireball Department of Commerce','https://apps.apple.com/gb/app/onin-keyboard-calendar/id6448070850','',NULL,'84f8b96175fff3a83fd54ad94c73aaa92b6ee4c6');
+INSERT INTO entries VALUES(87,'tag:daringfireball.net,2023:/linked//6.39916',5,'Elon Musk Hires New Twitter CEO: NBCUniversal Ad Chief Linda Yaccarino','text/html',replace('<p>Lillian Rizzo, reporting for CNBC:</p>\n\n<blockquote>\n  <p>NBCUniversal global advertising chief Linda Yaccarino has resigned\nto join Twitter as its next chief executive. Twitter owner Elon\nMusk <a href="https://twitter.com/elonmusk/status/1657050349608501249">confirmed the hire</a> in a tweet Friday.</p>\n\n<p>“I am excited to welcome Linda Yaccarino as the new CEO of\nTwitter!” Musk tweeted. He said she “will focus primarily on\nbusiness operations, while I focus on product design &amp; new\ntechnology.”</p>\n\n<p>He added, “Looking forward to working with Linda to transform this\nplatform into X, the everything app.”</p>\n</blockquote>\n\n<p>I wish Yaccarino luck, truly. But the CEO needs to run the company, and I find it unlikely that she’s going to have that authority with Musk running “product design and new technology”.</p>\n\n<p>Tim Cook is an obvious example of a non-product person who is very successfully leading a product-first company. But while Cook is not a product designer or product visionary, there is zero question within Apple that Cook is the boss. The buck stops at Cook’s desk — including on product decisions.</p>\n\n<p><strong>Sidenote:</strong> I <a href="https://bsky.app/profile/gruber.bsky.social/post/3jup7lhivok25">noticed</a> about two weeks ago that Musk has largely stopped referring to Twitter by name and instead saying “<a href="https://twitter.com/elonmusk/status/1652048146195959809">this platform</a>”. Months ago he <a href="https://www.wsj.com/articles/twitter-inc-changes-its-name-to-x-corp-and-moves-to-nevada-703ac892">changed the name of the holding company</a> from “Twitter Inc.” to “X Corp.”. The fact that he largely refers to it now as “this platform” makes me think he’s going to rename it X sooner rather than later. Seems crazy to me to throw away the Twitter brand name though, so maybe “X” will just be to Twitter what “Meta” is to Facebook and “Alphabet” is to Google. But also: Musk does crazy things. Throwing away the entire Twitter brand would be less crazy than his buying it in the first place.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/15/twitter-ceo-linda-yaccarino" title="Permanent link to ‘Elon Musk Hires New Twitter CEO: NBCUniversal Ad Chief Linda Yaccarino’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 20:50:42','John Gruber','https://www.cnbc.com/2023/05/12/nbcuniversal-ad-chief-yaccarino-resigns-as-sources-say-shes-in-talks-to-be-twitter-ceo.html','',NULL,'d9f60881ca4f7d86532f4d663acfcbc09fd5db8f');
+INSERT INTO entries VALUES(88,'tag:daringfireball.net,2023:/linked//6.39915',5,'Ming-Chi Kuo: Apple ‘Well Prepared’ for Headset Announcement at WWDC','text/html',replace('<p>Tim Hardwick, writing for MacRumors:</p>\n\n<blockquote>\n  <p>In a brief report posted to <a href="https://medium.com/@mingchikuo/apple-ar-mr頭戴裝置發佈預測與供應鏈投資策略-高偉電子為最大受益者-apple-ar-mr-headset-announcement-prediction-and-supply-e44e3bbecb77">Medium</a> on Monday, Kuo wrote\nthat the headset’s announcement next month “bodes well” for the\nsupply chain share price, with the analyst touching on five of the\ndevice’s components that — apart from assembly — represent its\n“most expensive material costs” in his view.</p>\n\n<p>Those include the 4K micro-OLED displays, dual M2-based\nprocessors, the headset casing, 12 optical cameras for tracking\nhand movements, and the external power supply. These components\nare being supplied by Sony, TSMC, Everwin Precision, Cowell, and\nGoretek, respectively.</p>\n\n<p>Pricing on the headset is expected to begin somewhere around\n$3,000. Perhaps with that in mind, Apple won’t aim it at general\nconsumers to start with, but will instead position it as a device\nfor developers, content creators, and professionals. Apple expects\nto sell just one headset per day per retail store, and it has told\nsuppliers that it expects sales of seven to 10 million units\nduring the first year of availability.</p>\n</blockquote>\n\n<p>Kuo doesn’t mention the purported $3,000 price in his report, but a price like that would certainly jibe with an expectation that they might sell only one unit per day per store for this model. One part of me says that’s just crazy expensive for an entertainment gadget. Another part of me says that if it really is going to cost that much, it must be much more than an entertainment device — it must be useful for some forms of work too.</p>\n\n<p>The original Macintosh in 1984 cost $2,500 — inflation-adjusted that’s about $7,500 today. If it’s amazing, $3,000 isn’t absurd.</p>\n\n<p>But I also keep thinking back to rumors that the original iPad was going to start at $1,000, and it instead debuted with an entry price of $500.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/15/kuo-headset-wwdc" title="Permanent link to ‘Ming-Chi Kuo: Apple ‘Well Prepared’ for Headset Announcement at WWDC’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 20:28:48','John Gruber','https://www.macrumors.com/2023/05/15/kuo-apple-well-prepared-headset-unveiling/','',NULL,'a8945e46f5c0c1917f5257b8ac3adfc65ac5216f');
+INSERT INTO entries VALUES(89,'tag:daringfireball.net,2023:/linked//6.39914',5,'WorkOS','text/html',replace('<p>My thanks to WorkOS for sponsoring last week at DF once again. WorkOS is like “Stripe for enterprise features.” They make it easy for developers to build features needed by enterprise customers, such as Single Sign-On and SCIM.</p>\n\n<p>Shipping these features is important because they enable selling upmarket for bigger deals. Without these features, the IT department will reject your app. But these enterprise features are complex and time-consuming to build yourself, usually taking months.</p>\n\n<p>With WorkOS you can integrate and ship enterprise features in minutes. Beautiful API docs guide you through every step of the way, and transparent pricing scales based on usage. It’s a product built by developers, for developers.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/14/workos" title="Permanent link to ‘WorkOS’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-15 00:38:44','John Gruber','https://workos.com/','',NULL,'c237c9b895137c2132a5956964e47463fa6be99d');
+INSERT INTO entries VALUES(90,'tag:daringfireball.net,2023:/linked//6.39913',5,'Heather Armstrong, Writer of ‘Dooce.com’, Dies of Suicide at 47','text/html',replace('<p>Alex Williams, The New York Times:</p>\n\n<blockquote>\n  <p>Heather Armstrong, an explosively popular web writer and entrepreneur who, with her website Dooce, was hailed as the queen of the so-called mommy bloggers for giving millions of readers intimate glimpses of her joys and challenges in parenthood and marriage, as well as of her harrowing struggles with depression, died on Tuesday at her home in Salt Lake City. She was 47.</p>\n\n<p>Her death was announced on <a href="https://www.instagram.com/p/CsERc9lR_XC/">her Instagram channel</a>. Pete Ashdown, her longtime partner, said the cause was suicide. He said he had found her body in the home.</p>\n</blockquote>\n\n<p>Unspeakably sad. Nothing but love and warm thoughts for her children, family, and friends.</p>\n\n<p>(If you are in crisis, please call, text, or chat with the Suicide and Crisis Lifeline at 988. There is hope and there is help.)</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/10/heather-armstrong-rip" title="Permanent link to ‘Heather Armstrong, Writer of ‘Dooce.com’, Dies of Suicide at 47’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-10 21:42:02','John Gruber','https://www.nytimes.com/2023/05/10/us/heather-armstrong-dead.html','',NULL,'22b42396b78b217818a00e3332728f88e84aeb7e');
+INSERT INTO entries VALUES(91,'tag:daringfireball.net,2023:/linked//6.39912',5,'Imran Chaudhri’s Humane Demo at TED','text/html',replace('<p>I’m rooting for Humane, but honestly, I just don’t get it from what I see here.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/09/humane-ted-video" title="Permanent link to ‘Imran Chaudhri’s Humane Demo at TED’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-09 23:33:00','John Gruber','https://youtu.be/gMsQO5u7-NQ','',NULL,'570d1917dfcf90959b7c9913ea3a67faa4a3773d');
+INSERT INTO entries VALUES(92,'tag:daringfireball.net,2023:/linked//6.39911',5,'Apple Launches Final Cut Pro and Logic Pro for iPad','text/html',replace('<p>Apple Newsroom:</p>\n\n<blockquote>\n  <p>Apple today unveiled Final Cut Pro and Logic Pro for iPad.\nVideo and music creators can now unleash their creativity in\nnew ways that are only possible on iPad. Final Cut Pro and\nLogic Pro for iPad bring all-new touch interfaces that allow\nusers to enhance their workflows with the immediacy and\nintuitiveness of Multi-Touch. Final Cut Pro for iPad introduces\na powerful set of tools for video creators to record, edit,\nfinish, and share, all from one portable device. Logic Pro for\niPad puts the power of professional music creation in the hands\nof the creator — no matter where they are — with a complete\ncollection of sophisticated tools for songwriting, beat making,\nrecording, editing, and mixing. Final Cut Pro and Logic Pro for\niPad will be available on the App Store as subscriptions\nstarting Tuesday, May 23.</p>\n</blockquote>\n\n<p>Both apps are priced the same: $5/month or $50/year, with a one-month free trial.</p>\n\n<p>We’ve all been waiting for these two apps to come to iPad, and at a glance, both of them look very good. Subscription pricing is interesting, and makes me wonder if the Mac apps are going to switch to that too. And a sidenote, releasing/announcing these apps now makes me think that next month’s WWDC keynote is chockablock with other announcements.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/09/final-cut-pro-logic-pro-ipad" title="Permanent link to ‘Apple Launches Final Cut Pro and Logic Pro for iPad’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-09 22:46:01','John Gruber','https://www.apple.com/newsroom/2023/05/apple-brings-final-cut-pro-and-logic-pro-to-ipad/','',NULL,'cc1d53ecfc8e3acf708aa2f550ebbb0c99ee2eb3');
+INSERT INTO entries VALUES(93,'tag:daringfireball.net,2023:/linked//6.39909',5,'Kolide','text/html',replace('<p>My thanks to Kolide for sponsoring last week at DF. Right now, “Zero Trust” is in serious danger of becoming an empty buzzword. The problem isn’t just that marketers have slapped the Zero Trust label on everything short of breakfast cereal — it’s that for all the hype, <a href="https://www.cshub.com/attacks/articles/the-biggest-data-breaches-and-leaks-of-2022">we don’t seem to be getting any safer</a>.</p>\n\n<p>At the heart of Zero Trust is a good idea, but the way most companies execute that idea is <em>incomplete</em>. Specifically, most security practitioners forget that device compliance is a crucial element of Zero Trust. Kolide solves the device compliance element of Zero Trust for companies that use Okta. Kolide’s premise is simple: if an employee’s device is out of compliance, they can’t log in to their cloud apps until they’ve fixed the problem. And instead of creating more work for IT, Kolide provides instructions so users can get unblocked on their own.</p>\n\n<p>Kolide works across your Mac, Windows, and even Linux devices, with mobile support coming soon. To learn more and see their product in action, <a href="https://l.kolide.co/3XlSqAq">simply visit their website</a>.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/07/kolide" title="Permanent link to ‘Kolide’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-07 18:17:33','John Gruber','https://l.kolide.co/3JWbXEv','',NULL,'8cb4074ab9b603c85f61174c6752043df7c81920');
+INSERT INTO entries VALUES(94,'tag:daringfireball.net,2023:/linked//6.39908',5,'Clarence Thomas Corruption Scandal Gets Worse','text/html',replace('<p>Joshua Kaplan, Justin Elliott, and Alex Mierjeski, reporting for ProPublica:</p>\n\n<blockquote>\n  <p>In 2008, Supreme Court Justice Clarence Thomas decided to send his teenage grandnephew to Hidden Lake Academy, a private boarding school in the foothills of northern Georgia. The boy, Mark Martin, was far from home. For the previous decade, he had lived with the justice and his wife in the suburbs of Washington, D.C. Thomas had taken legal custody of Martin when he was 6 years old and had recently told an interviewer he was “raising him as a son.”</p>\n\n<p>Tuition at the boarding school ran more than $6,000 a month. But Thomas did not cover the bill. A bank statement for the school from July 2009, buried in unrelated court filings, shows the source of Martin’s tuition payment for that month: the company of billionaire real estate magnate Harlan Crow. […]</p>\n\n<p>“You can’t be having secret financial arrangements,” said Mark W. Bennett, a retired federal judge appointed by President Bill Clinton. Bennett said he was friendly with Thomas and declined to comment for the record about the specifics of Thomas’ actions. But he said that when he was on the bench, he wouldn’t let his lawyer friends buy him lunch. […]</p>\n\n<p>“This is way outside the norm. This is way in excess of anything I’ve seen,” said Richard Painter, former chief White House ethics lawyer for President George W. Bush, referring to the cascade of gifts over the years.</p>\n\n<p>Painter said that when he was at the White House, an official who’d taken what Thomas had would have been fired: “This amount of undisclosed gifts? You’d want to get them out of the government.”</p>\n</blockquote>\n\n<p>Just breathtaking corruption. And Thomas’s response is basically, “Fuck you.”</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/06/thomas-corruption" title="Permanent link to ‘Clarence Thomas Corruption Scandal Gets Worse’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-06 21:08:18','John Gruber','https://www.propublica.org/article/clarence-thomas-harlan-crow-private-school-tuition-scotus','',NULL,'e3689cdb64d6d466c7c82e3511668c81ded110ea');
+INSERT INTO entries VALUES(95,'tag:daringfireball.net,2023:/linked//6.39907',5,'Dithering','text/html',replace('<p><a class="noborder" href="https://dithering.fm/">\n<img alt="May 2023 cover art for Dithering, depicting two girls having fun on a swing set." src="https://daringfireball.net/misc/2023/05/dithering-cover-may-2023.jpeg" width="500" /></a></p>\n\n<p>Yours truly and Ben Thompson’s podcast — two episodes per week, 15 minutes per episode. Not a minute less, not a minute more. If you’re not listening, you’re missing out. $5/month or $50/year. We’re now in our fourth year, and we’ve had remarkably little churn — people who subscribe to Dithering tend to stay subscribed, which warms my heart. It’s a fun show and everyone loves the enforced brevity and regularity.</p>\n\n<p>Bonus: At the end of March we started a Dithering group in <a href="https://wavelength.app/">Wavelength</a>, the new private group messaging app <a href="https://daringfireball.net/2023/03/wavelength">I started advising earlier this year</a>. It’s sort of an unofficial perk and an experiment. Subscribers can find the link to join the group in the show notes for each episode. We had no idea how this group would go, but it’s been wild. As of this typing there are over 2,900 members, and activity every day across a wide range of threads. I believe it’s the single largest group on all of Wavelength. (I just tonight told the story there of the piece of shit 2021 Kia Sorento I was bamboozled by Hertz into renting for a road trip to Boston this week, to pick my son up at the end of the college year.) It’s a nice, smart, fun little community.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/05/dithering" title="Permanent link to ‘Dithering’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-06 01:22:25','John Gruber','https://dithering.fm/','',NULL,'08da77613580f03f5b10c97f5cff0c7d7e3a7e4d');
+INSERT INTO entries VALUES(96,'tag:daringfireball.net,2023:/linked//6.39906',5,'Ford CEO Jim Farley Seems Very Happy That GM Is Dropping CarPlay','text/html',replace('<p>Great 3-minute clip from Joanna Stern’s interview with Ford CEO Jim Farley at the WSJ’s Future of Everything Festival. She asks him about GM’s plan to drop CarPlay from their future EVs, and Farley starts by saying “Yeah, how about that?” and laughing.</p>\n\n<p>Farley says, “The interior has to be really well done. But in terms of content? We kind of lost that battle 10 years ago. So get real with it, because you’re not going to make a ton of money on content inside the vehicle. It’s going to be safety/security, partial autonomy, and productivity in our eyes. [...] 70 percent of our Ford customers in the U.S. are Apple customers. Why would I go to an Apple customer and say ‘Good luck!’? That doesn’t seem customer centric.”</p>\n\n<p>Farley and Ford have it exactly right. New car buyers, even from mainstream brands like Ford, are overwhelmingly iPhone users — exactly <a href="https://www.theverge.com/2022/6/6/23156741/ios-16-carplay-apple-wwdc-hvac-deeper-integration">as Apple bragged at WWDC last June</a>, and what iPhone users want in their cars is CarPlay. If anything, Farley is being kind to GM and GM CEO Mary Barra when he says their message to iPhone users is “Good luck” — it’s really more like “Fuck you.” And again, the most telling part of the whole exchange is the way Farley laughs at the start. You really have to hear it — his laugh implies a certain <em>I can’t believe our good fortune that GM is doing this.</em> It’s enough to make you think Mary Barra is a mole from Ford, planted to steer would-be Chevy buyers into Ford dealerships.</p>\n\n<p>If you’re asking how it can be that 70 percent of Ford’s customers are iPhone users when the iPhone has maybe just over 50 percent market share in the U.S., the key is <em>new</em> car buyers. The Android masses are buying used cars, either because they don’t have the budget for a new car or because they don’t care about buying nice things (or both). So even a non-luxury brand like Ford has an overwhelming majority of customers with iPhones.</p>\n\n<div>\n<a href="https://daringfireball.net/linked/2023/05/05/ford-ceo-jim-farley-carplay" title="Permanent link to ‘Ford CEO Jim Farley Seems Very Happy That GM Is Dropping CarPlay’">&nbsp;★&nbsp;</a>\n</div>','\n',char(10)),'','2023-05-06 00:59:02','John Gruber','https://www.wsj.com/video/ford-ceo-on-apple-google-and-elon-musk/B6D8BC45-1C4A-45D3-97AC-933A57B76E31.html','',NULL,'52e54955edf6bc6f31b90781b0971406ed9be8ba');
+INSERT INTO entries VALUES(97,'tag:daringfireball.net,2023://1.39896',5,'★ Browser and OS Market Share Trends in the Mobile Age','text/html',replace('<p><a href="https://twitter.com/jbenton/status/1653394051889082368">Joshua Benton on Twitter</a>, linking to <a href="https://gs.statcounter.com/browser-market-share/desktop/united-states-of-america#monthly-202201-202303">Statcounter’s U.S. browser share data for March</a>:</p>\n\n<blockquote>\n  <p>For the first time ever, Safari has more than 20% of desktop\nbrowser share in the U.S.</p>\n\n<p>Since last June, Chrome is down 6% (61.35% to 55.28%), while\nSafari is up by a similar amount (15.58% to 22.3%).</p>\n\n<p>Seems driven entirely by increased Mac market share. Over the same\nspan, Windows is down 14% (67.57% to 53.43%) and macOS is up 6%\n(24.27% to 31.34%). ChromeOS went from 3.75% to 8.47% (though\nthe school year makes that comp a bit unfair).</p>\n</blockquote>\n\n<p><a href="https://gs.statcounter.com/browser-market-share/desktop/worldwide/#monthly-202201-202303">Statcounter’s latest <em>global</em> numbers</a>:</p>\n\n<ul>\n<li>Chrome: 66.1%</li>\n<li>Safari: 11.9%</li>\n<li>Edge: 11%</li>\n<li>Firefox: 5.7%</li>\n<li>Opera: 3.1%</li>\n</ul>\n\n<p>Looking at the <a href="https://gs.statcounter.com/browser-market-share/desktop/worldwide/#monthly-202201-202303">global chart</a>, Chrome seems to be holding steady in the desktop market over the  last year, but Safari does show an uptick from about 9.5 to just under 11 percent. As Benton points out, the most striking thing in Statcounter’s report is the decline in Windows’s desktop OS share over the last year, both <a href="https://gs.statcounter.com/os-market-share/desktop/worldwide#monthly-202201-202303">globally</a> and <a href="https://gs.statcounter.com/os-market-share/desktop/worldwide#monthly-202201-202303">in the U.S.</a> I suspect Windows is losing share to <em>mobile</em> browsing just as much as or more than it is to MacOS and ChromeOS. Back when Windows had over 90 percent market share, a huge chunk of that was people who didn’t really choose a Windows PC because of Windows, but who just wanted a “computer”. They took the default, and the default computer ran Windows.</p>\n\n<p>Nowadays, Windows still gets most of the default <em>desktop</em> market (although it seem ChromeOS continues to eat into that, especially in K-12 education). But for more and more people, their default “computer” is their phone. They might have a PC, but they use it less and less.</p>\n\n<p>Which brings me to another real eye-opener: Statcounter’s OS market share numbers — across all devices, desktop and mobile — from 2009 until now.</p>\n\n<p><a href="https://gs.statcounter.com/os-market-share#monthly-200901-202303">Globally</a>:</p>\n\n<p><a class="noborder" href="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-ww-monthly-200901-202303.png">\n  <img alt="Chart showing Statcounter''s global market share for operating system from January 2009 through March 2023." src="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-ww-monthly-200901-202303.png" width="500" /></a></p>\n\n<p><a href="https://gs.statcounter.com/os-market-share/all/united-states-of-america#monthly-200901-202303">United States</a>:</p>\n\n<p><a class="noborder" href="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-US-monthly-200901-202303.png">\n  <img alt="Chart showing Statcounter''s U.S. market share for operating system from January 2009 through March 2023." src="https://daringfireball.net/misc/2023/05/StatCounter-os_combined-US-monthly-200901-202303.png" width="500" /></a></p>\n\n<p>Globally, Windows was surpassed by Android back in 2017. The decline in Windows’s dominance has been precipitous: in 2009 Statcounter pegged its share at 95 percent; today it’s 28 percent. In the U.S., Windows is effectively neck-and-neck with iOS, each hovering around 30 percent for the last few years. It doesn’t seem outlandish to project that Mac and iOS, combined, might soon surpass Windows and Android combined in Statcounter’s share numbers for the U.S.</p>\n\n<p>The Mac, on the other hand, is clearly seeing impressive market share growth. We all kind of knew this was true from the Mac revenue numbers <a href="https://sixcolors.com/tag/quarterly/">Apple reports each quarter</a>, but Statcounter’s data backs up Apple’s claims that the Mac continues to gain new users. And that in turn leads to more desktop Safari users — even though recent switchers strike me as among the most likely Mac users to use Chrome, which they’re likely familiar with. But if desktop Safari usage share is growing, it must mean Mac usage is growing.</p>\n\n<p>The rise of iOS and Android as humanity’s primary computing platforms has obliterated Windows’s decades-long hegemony. To be fair, when your usage share was at one time 95 percent <em>of all web browsing</em>, there’s nowhere to go but down. But today, Windows is just one of four major platforms — and is the only one of the four that is in obvious decline, both in usage and relevance. The Mac, on the other hand, has seemingly been <em>bolstered</em> by the rise of the iPhone. We talked a lot about <a href="https://daringfireball.net/2007/10/milhouse">the “halo effect” of the iPod</a> on Mac sales in the mid-2000s, but it’s more true today with the iPhone and iPad. Mac unit sales are up and its share of desktop computing is <em>way</em> up. People who don’t care about desktop computing are just using their phones and tablets for everything; people who do care are more likely than ever to be using a Mac.</p>\n\n<p>One more nugget, just for kicks — <a href="https://gs.statcounter.com/os-market-share/mobile/united-states-of-america#monthly-202201-202303">U.S.</a> and <a href="https://gs.statcounter.com/os-market-share/mobile/worldwide#monthly-202201-202303">worldwide</a> numbers for iOS and Android in the mobile market:</p>\n\n<table>\n<thead>\n<tr>\n  <th></th>\n  <th>U.S.</th>\n  <th>Global</th>\n</tr>\n</thead>\n<tbody>\n<tr>\n  <td>iOS</td>\n  <td>60</td>\n  <td>30</td>\n</tr>\n<tr>\n  <td>Android</td>\n  <td>40</td>\n  <td>69</td>\n</tr>\n</tbody>\n</table>\n\n<p>It’s also worth noting on the charts above that in hindsight, it wasn’t clear that mobile browsing would surpass desktop browsing until 2013 or 2014 — six or seven years after the debut of the iPhone. That’s a timeframe worth keeping in mind for — oh, just to pick a random up-and-coming product category — AR/VR headsets. The iPhone did change everything, but it took a while to show it outside the enthusiast / early-adopter market.</p>','\n',char(10)),'','2023-05-02 23:11:18','John Gruber','https://daringfireball.net/2023/05/browser_and_os_market_share_trends_in_the_mobile_age','',NULL,'8b6746db0dae37382b75a64eb4307a99e562d2f4');
+INSERT INTO entries VALUES(98,'tag:daringfireball.net,2023://1.39890',5,'★ Follow-Up on ‘Adware for Apple Services in iOS’','text/html',replace('<p><a href="https://daringfireball.net/2023/04/ios_adware">Yours truly, two weeks ago</a>:</p>\n\n<blockquote>\n  <p>For the last several weeks, I’ve noticed <a href="https://daringfireball.net/misc/2023/04/ios-settings-arcade-ad.png">an ad in Settings on my\niPhone</a>, in the iCloud section at the very top of the first\nscreen: “Apple Arcade Free for 3 Months”. The reason this is dumb\nis that I pay for a family account for Apple One, <em>so we already\nhave Apple Arcade</em>. But here’s Apple badgering me to sign up for a\n3-month free trial that I don’t need.</p>\n\n<p>If I tap into that ad’s section in Settings it explains why\nthey’re offering it: “Services Included With Purchase”. I’m not\neven sure what device I bought that earned me this offer, but it\nshouldn’t matter. Why are they showing me something I already\npay for?</p>\n</blockquote>\n\n<p>This prompted some give-and-take with, well, <em>people familiar with the matter</em>, and I have an answer to share. The problem I was running into was a bug that resulted from the fact I have <em>split</em> Apple ID accounts: one account for iTunes and App Store purchases, and a separate account for my Apple ID. Long story short:</p>\n\n<ul>\n<li><p>I created my mac.com iCloud account back in January 2000, <a href="https://apple.fandom.com/wiki/Mac.com">when Apple launched the service under the name iTools</a>. That same service was soon renamed .Mac, then MobileMe (and Apple <a href="https://support.apple.com/en-us/HT201771">changed the domain name to me.com</a>), then, finally, iCloud (and icloud.com).</p></li>\n<li><p>When I signed up for my iTunes account <a href="https://www.macworld.com/article/227143/15-years-of-itunes-a-look-at-apples-media-app-and-its-influence-on-an-industry.html">when the iTunes Music Store launched back in April 2003</a>, I used my primary @daringfireball.net address, not my @mac.com address. I don’t recall why I did this exactly, but I <em>think</em> that what I was thinking was something along the lines of “<em>I’m still not sure about this whole .Mac thing, but I’m pretty sure I’ll have my daringfireball.net address forever.</em>”</p></li>\n</ul>\n\n<p>In hindsight, this was a mistake on my part. Everything is simpler if you only have one Apple ID that you use for both iCloud and iTunes/App Store purchases. The reason I never switched to using my mac.com iCloud account for everything, including purchases, is that there’s never been a way to migrate old purchases from a different account. And I’ve bought a lot of music, movies, and apps over the years using my other account.<sup id="fnr1-2023-05-01"><a href="https://daringfireball.net/#fn1-2023-05-01">1</a></sup></p>\n\n<p>Using split accounts has always been a bit weird, occasionally problematic and/or confusing — but has mostly just worked out. It helps quite a bit that there are a <em>lot</em> of people working at Apple in the same situation. By the time the iPhone became a hit product, users new to the Apple ecosystem naturally used one address for everything. But split accounts are common from long-time Mac users, and there are a lot of long-time Mac users inside Apple.</p>\n\n<p>This situation I ran into — seeing a promotion for a three-month Apple Arcade trial despite the fact that I pay for Apple One (which includes Arcade) — is just one of those glitches. Most Apple One subscribers don’t have split accounts, so they never saw the unnecessary promotion. And even amongst those who <em>do</em> have split accounts, they’d have to run into a certain set of circumstances to make it appear.<sup id="fnr2-2023-05-01"><a href="https://daringfireball.net/#fn2-2023-05-01">2</a></sup></p>\n\n<p>So, it was a bug. And I am reliably informed that a fix is in the works that will appear in a near-future update to iOS.</p>\n\n<div class="footnotes">\n<hr />\n<ol>\n\n<li id="fn1-2023-05-01">\n<p>No joke, I’ve purchased 744 movies (and counting) from iTunes over the last two decades. Money runs through my fingers like water.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr1-2023-05-01" title="Jump back to footnote 1 in the text.">&#x21a9;&#xfe0e;</a></p>\n</li>\n\n<li id="fn2-2023-05-01">\n<p>One way that it’s confusing to have multiple Apple IDs is that it’s my iCloud account — my mac.com address — that serves as the primary account for family sharing with my wife and son. But it’s my other account — my daringfireball.net address — that has made all my iTunes and App Store purchases for 23 years. That includes making the purchase to subscribe to Apple One, even though Apple One includes features like additional iCloud storage space that apply to my iCloud account. So even though I have two accounts, one for iCloud and one for purchases, Apple’s back end is somehow capable of making it all work. They are two different accounts, but my iTunes account purchases can be shared through my iCloud account’s family sharing. It sounds confusing, I know. But for the last decade or so, it really has <em>just worked</em> and I haven’t had to think about it often, other than keeping two different passwords in my head.&nbsp;<a class="footnoteBackLink" href="https://daringfireball.net/#fnr2-2023-05-01" title="Jump back to footnote 2 in the text.">&#x21a9;&#xfe0e;︎</a></p>\n</li>\n\n</ol>\n</div>','\n',char(10)),'','2023-05-01 21:27:40','John Gruber','https://daringfireball.net/2023/05/followup_on_apple_services_ad','',NULL,'f38f322fd2a514d7a2bd8c97b242662136ccdce1');
+INSERT INTO entries VALUES(99,'t3_13q95kv',6,'Caffè Italia * 24/05/23','text/html','<!-- SC_OFF --><div class="md"><p>Sciam bbuen, cumpà? </p> <blockquote> <p>Patrovaro, Puglia</p> </blockquote> <h2>In Evidenza</h2> <p>⭐ <strong>Hai visto un commento interessante?</strong> Pensi meriti un suo thread? Dillo a OP! Oppure fai report sul suo commento scegliendo l''opzione &quot;Merita un thread dedicato!&quot;</p> <p>❗ Feedback / segnalazioni ai mod: <a href="https://www.reddit.com/message/compose?to=%2Fr%2Fitaly">clicca qui</a> | <strong>Attenzione</strong>: discutere della moderazione nei thread o nel caffè comporta un giorno di sospensione. </p> <p>🇺🇦 Argomento Ucraina: <a href="/r/italy/wiki/regolamento#wiki_.5B12.2.5D_argomenti_con_limitazioni_nel_caff.E8">nel Caffè sono permesse solo le storie personali</a>. Vuoi commentare le notizie o la situazione generale? Fai un post! </p> <h2>Menu del giorno</h2> <ul> <li><a href="/r/italy/comments/13q95kv/caff%C3%A8_italia_240523/jle8h4d/">Post interessanti da altri subreddit italiani</a></li> <li>Oggi è aperto <a href="/r/DimmiOuija">/r/DimmiOuija</a>, dove si possono fare domande e ricevere risposte, una lettera alla volta. Partecipazione aperta a tutti.</li> </ul> <h2>Da ieri</h2> <ul> <li><a href="/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">Di tutto un pod - il thread dei podcast</a></li> <li><a href="/r/italy/comments/13pc0ox/caff%C3%A8_italia_230523/jl9drmm/">Post interessanti da altri subreddit italiani</a></li> </ul> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/RedditItalyBot"> /u/RedditItalyBot </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13q95kv/caffè_italia_240523/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13q95kv/caffè_italia_240523/">[comments]</a></span>','','2023-05-24 03:00:09','/u/RedditItalyBot','https://www.reddit.com/r/italy/comments/13q95kv/caffè_italia_240523/','',NULL,'ec09d1066b608a01c4e47fb64e07953643dff613');
+INSERT INTO entries VALUES(100,'t3_13pguah',6,'Di tutto un pod - il thread dei podcast','text/html','<!-- SC_OFF --><div class="md"><p>Sei alla ricerca di un podcast da seguire? Ne hai uno da consigliare a tutti? Oppure vuoi semplicemente parlare del mondo dei podcast?</p> <p>Benvenuto! Sei nel posto giusto.</p> <p>Questo thread periodico ha lo scopo di raccogliere domande, discussioni e consigli sull''argomento podcast. Ogni 23 del mese verrà creato un nuovo thread.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/RedditItalyBot"> /u/RedditItalyBot </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">[comments]</a></span>','','2023-05-23 07:01:21','/u/RedditItalyBot','https://www.reddit.com/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/','',NULL,'ffccab6b568da4372c8be4ff6c7588f45d6155e8');
+INSERT INTO entries VALUES(101,'t3_13qcvnf',6,'Rapporto della CGIA di Mestre sull''evasione in Italia regione per regione','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qcvnf/rapporto_della_cgia_di_mestre_sullevasione_in/"> <img alt="Rapporto della CGIA di Mestre sull''evasione in Italia regione per regione" src="https://external-preview.redd.it/YFBm-hdE_urbXMQJE1-ykwbuLjFWihMUdZxx08knNYw.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=03f4bc57e347f5eda308fd815886bea224290a67" title="Rapporto della CGIA di Mestre sull''evasione in Italia regione per regione" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Archetypus"> /u/Archetypus </a> <br /> <span><a href="https://www.corriere.it/economia/tasse/23_maggio_22/tasse-dove-si-evadono-piu-calabria-campania-puglia-guidano-classifica-85f2687a-f880-11ed-8bca-35ac6820436c.shtml">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qcvnf/rapporto_della_cgia_di_mestre_sullevasione_in/">[comments]</a></span> </td></tr></table>','','2023-05-24 05:52:38','/u/Archetypus','https://www.reddit.com/r/italy/comments/13qcvnf/rapporto_della_cgia_di_mestre_sullevasione_in/','',NULL,'0184ecb434478ecbc1b3de66ec30ab2b96174786');
+INSERT INTO entries VALUES(102,'t3_13qhobi',6,'Medici di famiglia sono in via di estinzione, i numeri','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qhobi/medici_di_famiglia_sono_in_via_di_estinzione_i/"> <img alt="Medici di famiglia sono in via di estinzione, i numeri" src="https://external-preview.redd.it/zO6FB59kse2Zu4YQzwL6vfcTEZJ0XEed0AweZvm9vW4.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=30556c032316ce72f62a6c19e3bed6433413f639" title="Medici di famiglia sono in via di estinzione, i numeri" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/mirkul"> /u/mirkul </a> <br /> <span><a href="https://www.fortuneita.com/2023/05/24/medici-di-famiglia-in-via-di-estinzione-i-numeri/?swcfpc=1">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qhobi/medici_di_famiglia_sono_in_via_di_estinzione_i/">[comments]</a></span> </td></tr></table>','','2023-05-24 10:27:21','/u/mirkul','https://www.reddit.com/r/italy/comments/13qhobi/medici_di_famiglia_sono_in_via_di_estinzione_i/','',NULL,'a3d1540287ed25167eef3fd4f0a177e3aa9c512d');
+INSERT INTO entries VALUES(103,'t3_13qf6kp',6,'Produttività oraria: Italia al palo da 20 anni','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/"> <img alt="Produttività oraria: Italia al palo da 20 anni" src="https://external-preview.redd.it/ON8e-82A8cxCJFRftO8IJhnnRutmzyLUrMO_YKVtFng.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=459647e213539dacc5808498a381bb5c8ebe8c13" title="Produttività oraria: Italia al palo da 20 anni" /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>Come da titolo, confrontando la produttività oraria di alcuni dei Paesi piu sviluppati, emerge chiaramente che quella italiana sia rimasta quasi del tutto ferma durante gli ultimi 20 anni.</p> <p>Paesi come USA, Francia e Germania sono andati di pari passo, mentre Cina e India hanno di fatto quintuplicato la propria produttivitá.</p> <p>Si puó pure notare la stagnazione giapponese, simile a quella italiana.</p> <p>Secondo me l''Italia ha perso il treno delle innovazioni tecnologiche dell''ultimo ventennio. Questo fattore, unito alla tendenza di comprimere i salari non potendo contare sulla svalutazione della moneta, ha causato il livello basso degli stipendi italiani di cui si lamentano tutti.</p> <p>Mi piacerebbe conoscere le vostre opinioni a tal proposito.</p> <p>&#x200b;</p> <p>Fonte: <a href="https://ourworldindata.org/grapher/labor-productivity-per-hour-PennWorldTable?tab=chart&amp;time=1990..latest&amp;country=PRT%7EJPN%7EGBR%7EUSA%7EFRA%7EDEU%7EITA%7EESP%7ECHN%7EIND">https://ourworldindata.org/grapher/labor-productivity-per-hour-PennWorldTable?tab=chart&amp;time=1990..latest&amp;country=PRT~JPN~GBR~USA~FRA~DEU~ITA~ESP~CHN~IND</a></p> <p><a href="https://preview.redd.it/wydojd52gq1b1.png?width=3400&amp;format=png&amp;auto=webp&amp;s=7dab8408223a4042f9144cd7c8436128982e7280">https://preview.redd.it/wydojd52gq1b1.png?width=3400&amp;format=png&amp;auto=webp&amp;s=7dab8408223a4042f9144cd7c8436128982e7280</a></p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/tipotimido83"> /u/tipotimido83 </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/">[comments]</a></span> </td></tr></table>','','2023-05-24 08:01:46','/u/tipotimido83','https://www.reddit.com/r/italy/comments/13qf6kp/produttività_oraria_italia_al_palo_da_20_anni/','',NULL,'d46a0965e4b95a6db32aced03deba4d12b6e3b88');
+INSERT INTO entries VALUES(104,'t3_13pqf45',6,'Ho intercettato un satellite meteorologico e ottenuto immagini in tempo reale dell''europa.','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/"> <img alt="Ho intercettato un satellite meteorologico e ottenuto immagini in tempo reale dell''europa." src="https://external-preview.redd.it/1ymsrXD4zEctUK0-fmAvYxTs74uFL9YkO1xM4BkdB08.jpg?width=320&amp;crop=smart&amp;auto=webp&amp;s=60b0b2a429c49be4530e66901fd56cb7c526dee7" title="Ho intercettato un satellite meteorologico e ottenuto immagini in tempo reale dell''europa." /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>Ciao a tutti! </p> <p>Oggi voglio condividere con voi la mia emozionante esperienza nell''intercettare un satellite meteorologico utilizzando un''antenna autocostruita.</p> <p>È stato un progetto affascinante e ho imparato molto lungo il percorso. Vorrei condividere con voi i passaggi che ho seguito e i risultati che ho ottenuto. </p> <p><strong>Cosa ho utilizzato:</strong></p> <p>Prima di tutto ho acquistato su amazon un RTL-SDR v3, non è altro che un dongle USB con chip RTL2832U che riceve i segnali radio e li tramuta in segnale per il software sul pc.</p> <p><a href="https://preview.redd.it/zxg2ri3lal1b1.jpg?width=1079&amp;format=pjpg&amp;auto=webp&amp;s=eac9ed607d2435a7537bcfa1f2c26b30eb9cc599">https://preview.redd.it/zxg2ri3lal1b1.jpg?width=1079&amp;format=pjpg&amp;auto=webp&amp;s=eac9ed607d2435a7537bcfa1f2c26b30eb9cc599</a></p> <p>Ho poi costruito un''antenna chiamata V-DIPOLE: </p> <p>Prende il nome dalla sua forma a &quot;V&quot; rovesciata. È costituita da due bracci di lunghezza uguale collegati a un punto comune al centro.</p> <p>Questa configurazione a &quot;V&quot; permette all''antenna di essere bilanciata e di ricevere segnali da diverse direzioni. L''ampiezza dell''angolo della V può variare a seconda delle esigenze. </p> <p>Ho comprato un mammut a 2 entrate e un cavo coassiale normalissimo, spellato e inserito in un''entrata del mammut il conduttore centrale e in un''altra la schermatura.</p> <p><a href="https://preview.redd.it/afsfkyjfbl1b1.jpg?width=1075&amp;format=pjpg&amp;auto=webp&amp;s=c7ce21fc97fab712af16c09aacc4376ef0b428b3">https://preview.redd.it/afsfkyjfbl1b1.jpg?width=1075&amp;format=pjpg&amp;auto=webp&amp;s=c7ce21fc97fab712af16c09aacc4376ef0b428b3</a></p> <p>Ho acquistato due bacchette di ottone, tagliate esattamente a 53,4 cm (considerate che la misura parte dall''inizio del mammut, non dall''inizio della bacchetta. Piegate le estremità per farle entrare facilmente.</p> <p><a href="https://preview.redd.it/gccobeeobl1b1.jpg?width=1067&amp;format=pjpg&amp;auto=webp&amp;s=8772dcfb3112d3d6763632027e7a147f6c7c2c1e">https://preview.redd.it/gccobeeobl1b1.jpg?width=1067&amp;format=pjpg&amp;auto=webp&amp;s=8772dcfb3112d3d6763632027e7a147f6c7c2c1e</a></p> <p>Dopo averle inserite nel mammut e strette, mi sono assicurato che fossero aperte a un''ampiezza di esattamente 120 gradi, potete usare un goniometro.</p> <p>Dall''altro lato del coassiale ho messo un connettore maschio che poi entra in un''adattatore F-SMA nel dongle usb.</p> <p>Ed ecco l''antenna finita:</p> <p><a href="https://preview.redd.it/jlyv1h21cl1b1.jpg?width=1205&amp;format=pjpg&amp;auto=webp&amp;s=fe43aad18bfa089afb4d0acc4716d389b3a19591">https://preview.redd.it/jlyv1h21cl1b1.jpg?width=1205&amp;format=pjpg&amp;auto=webp&amp;s=fe43aad18bfa089afb4d0acc4716d389b3a19591</a></p> <p>Come vedete è estremamente rudimentale, ma funziona.</p> <p>Dopo aver finito tutto, ho scaricato SDR# che vi permette di esplorare un po'' tutte le frequenze da 40 a 1700 MHZ.</p> <p>Ora arriva il bello:</p> <p>I satelliti che attualmente trasmettono APT (automatic picture transmission) sono 3, NOAA15, NOAA 18 e NOAA19. </p> <p>Queste immagini vengono trasmesse tramite segnali radio ad apposite stazioni di ricezione a terra, dove vengono decodificate e visualizzate come immagini meteorologiche, noi lo intercettiamo e decodifichiamo da soli il segnale.</p> <p>Ho scaricato ORBITRON che mi permette di tracciarli e sapere quando passeranno sull''italia.</p> <p><a href="https://preview.redd.it/yrseodkycl1b1.png?width=3837&amp;format=png&amp;auto=webp&amp;s=785d60d8a59dcc15b5dac00761e411a5dd84a305">https://preview.redd.it/yrseodkycl1b1.png?width=3837&amp;format=png&amp;auto=webp&amp;s=785d60d8a59dcc15b5dac00761e411a5dd84a305</a></p> <p>Salito sul terrazzo, ho orientato l''apertura dell''antenna verso SUD (la v-dipole va orientata così) e ho cercato online la frequenza APT del satellite interessato, in questo caso intorno ai 137MHZ.</p> <p>Ragazzi, appena ho ricevuto il segnale è stata davvero un''emozione incredibile, ho iniziato subito a registrare (sdr# permettere di registrare l''audio per decodificarlo successivamente).</p> <p>Ecco un piccolo video per sentire la &quot;voce&quot; del NOAA:</p> <p><a href="https://imgur.com/a/ntN8WlA">https://imgur.com/a/ntN8WlA</a></p> <p>Una volta fatto ciò, ho ricampionato il file audio in 11025 hz, e inserito su WXTOLIMG (un programma che decodifica audio satellitari).</p> <p>Ecco a voi le immagini, che non sono perfette per via di piccole interferenze (anche colpa mia che non riuscivo a tenere l''antenna ferma).</p> <p><a href="https://preview.redd.it/6fmnizkndl1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=1c070f907e22ba0bba25b465f5f4bc20a76aad8d">CANALE NEAR INFRARED</a></p> <p><a href="https://preview.redd.it/7yo8q91ydl1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=1da987e0f2a481dbc7f8f6f1b7b3374a4bb85f79">CANALE FULL IR </a></p> <p><a href="https://preview.redd.it/x0jpsz70el1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=b183e8e5ecf1138a9b243d27b1b6f31578aa7883">CANALE FULL IR CON SENSORE PRECIPITAZIONI</a></p> <p><a href="https://preview.redd.it/xebpi3x1el1b1.jpg?width=1040&amp;format=pjpg&amp;auto=webp&amp;s=4a85f332602837820d4167effeaf41b797ad63e8">Canale NEAR IR senza confini che secondo me è più carino</a></p> <p>Voi direte, ma si trovano le stesse immagini (con risoluzione anche maggiore) online!!! </p> <p>E io vi rispondo che non c''è soddisfazione più grande di aver intercettato io stesso il segnale e decodificato :) </p> <p>L''ultima cosa che voglio dire è che questo è un mondo veramente pieno zeppo di roba da imparare, ed io fino ad ora so credo meno dell''1%, ci sono tanti altri tipi di antenne, addirittura paraboliche con cui captare segnali ad alta risoluzione, con immagini che sono assurde.</p> <p>Grazie per l''attenzione!!!</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Marcoc0202"> /u/Marcoc0202 </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/">[comments]</a></span> </td></tr></table>','','2023-05-23 14:38:04','/u/Marcoc0202','https://www.reddit.com/r/italy/comments/13pqf45/ho_intercettato_un_satellite_meteorologico_e/','',NULL,'7138c00728b0a1dbdd05e079dc91e6197c192bf5');
+INSERT INTO entries VALUES(105,'t3_13q9q7r',6,'Netflix, arriva la stretta anche in Italia. Un abbonamento per solo nucleo domestico','text/html','<!-- SC_OFF --><div class="md"><p>Alla fine, il provvedimento di netflix contro il password sharing, è arrivato anche in Italia. Cosa ne pensate? Avete ricevuto già l’email nel caso condividiate l’account?</p> <p>Personalmente è da qualche mese che non guardo nulla su netflix, ma continuo a pagare l’account perchè lo usano anche i miei genitori. Probabilmente questa sarà l’occasione buona per fare pulizia.</p> <p><a href="https://www.ilsole24ore.com/art/netflix-abbonamento-e-solo-nucleo-domestico-non-si-puo-condividere-di-fuori-AEh4qBXD">https://www.ilsole24ore.com/art/netflix-abbonamento-e-solo-nucleo-domestico-non-si-puo-condividere-di-fuori-AEh4qBXD</a></p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/ksnll"> /u/ksnll </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13q9q7r/netflix_arriva_la_stretta_anche_in_italia_un/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13q9q7r/netflix_arriva_la_stretta_anche_in_italia_un/">[comments]</a></span>','','2023-05-24 03:27:07','/u/ksnll','https://www.reddit.com/r/italy/comments/13q9q7r/netflix_arriva_la_stretta_anche_in_italia_un/','',NULL,'240ef3fe3628a31e0379baf884105b886af5e2d1');
+INSERT INTO entries VALUES(106,'t3_13qk0cl',6,'Che ne è stato del Qatargate','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13qk0cl/che_ne_è_stato_del_qatargate/"> <img alt="Che ne è stato del Qatargate" src="https://external-preview.redd.it/x8PPFhzdisUEtMY4Gce5gP4NU-C8bhWMPm5KDjYkM9I.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=e91ce15a2453dcdf0f86f8aacadb3603dca80c8e" title="Che ne è stato del Qatargate" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/notizia"> /u/notizia </a> <br /> <span><a href="https://www.ilpost.it/2023/05/24/qatargate-conseguenze/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13qk0cl/che_ne_è_stato_del_qatargate/">[comments]</a></span> </td></tr></table>','','2023-05-24 12:19:55','/u/notizia','https://www.reddit.com/r/italy/comments/13qk0cl/che_ne_è_stato_del_qatargate/','',NULL,'062f3a5557fb088dc163f82c792ae09aae50d757');
+INSERT INTO entries VALUES(107,'t3_13phgo0',6,'Mion: "Nel 2010 seppi che il Morandi era a rischio crollo". Il comitato vittime: "Come ha fatto a stare zitto?"','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13phgo0/mion_nel_2010_seppi_che_il_morandi_era_a_rischio/"> <img alt="Mion: &quot;Nel 2010 seppi che il Morandi era a rischio crollo&quot;. Il comitato vittime: &quot;Come ha fatto a stare zitto?&quot;" src="https://external-preview.redd.it/rBQCFrZ_OqX-fAUyJCtC5Nl0tPG0mG_-L3wnT5h_nCM.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=3464c899510a6fea0093dc3c9037b03808506d29" title="Mion: &quot;Nel 2010 seppi che il Morandi era a rischio crollo&quot;. Il comitato vittime: &quot;Come ha fatto a stare zitto?&quot;" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/w0b"> /u/w0b </a> <br /> <span><a href="https://www.ansa.it/liguria/notizie/2023/05/22/nel-2010-seppi-che-il-morandi-era-a-rischio-crollo_69512a95-37a6-476c-a775-ebfd6eadfa2f.html">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13phgo0/mion_nel_2010_seppi_che_il_morandi_era_a_rischio/">[comments]</a></span> </td></tr></table>','','2023-05-23 07:34:57','/u/w0b','https://www.reddit.com/r/italy/comments/13phgo0/mion_nel_2010_seppi_che_il_morandi_era_a_rischio/','',NULL,'40f15f0ca89e5e59802ea6819305208af576ae52');
+INSERT INTO entries VALUES(108,'t3_13pr8pr',6,'Cosa pensi un straniero deve sapere sul la tua regione','text/html','<!-- SC_OFF --><div class="md"><p>Salve a tutti,</p> <p>Vivo a Italia da poco e ancora so poco sull''Italia, a parte quello piu conosciuto e delle città piu grande.</p> <p>Quindi, cosa pensi che ogni straniero dovrebbe sapere della tua regione? Potrebbe essere un pezzo di storia, un cibo da mangiare, un cantante da ascoltare, un libro, un film, una leggenda, ecc.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/alleryannah_karwenny"> /u/alleryannah_karwenny </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pr8pr/cosa_pensi_un_straniero_deve_sapere_sul_la_tua/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pr8pr/cosa_pensi_un_straniero_deve_sapere_sul_la_tua/">[comments]</a></span>','','2023-05-23 15:09:10','/u/alleryannah_karwenny','https://www.reddit.com/r/italy/comments/13pr8pr/cosa_pensi_un_straniero_deve_sapere_sul_la_tua/','',NULL,'1bd9606be2572f4b720cb0a071a384fc4bd4a30e');
+INSERT INTO entries VALUES(109,'t3_13pmh1h',6,'Milano. Il volume della musica nei locali pubblici in cui si mangia (tre note catene milanesi).','text/html','&#32; submitted by &#32; <a href="https://www.reddit.com/user/culturedperv"> /u/culturedperv </a> <br /> <span><a href="/r/milano/comments/13pi6b0/milano_il_volume_della_musica_nei_locali_pubblici/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pmh1h/milano_il_volume_della_musica_nei_locali_pubblici/">[comments]</a></span>','','2023-05-23 12:01:08','/u/culturedperv','https://www.reddit.com/r/italy/comments/13pmh1h/milano_il_volume_della_musica_nei_locali_pubblici/','',NULL,'330f0a0aecf93ee1c87fa647ad58a1fac7a96d68');
+INSERT INTO entries VALUES(110,'t3_13phjsf',6,'Ho studiato lingue in Italia, linguistica in UK e ora ho un contratto a tempo indeterminato da ricercatore in Germania. AMA','text/html','<!-- SC_OFF --><div class="md"><p>Ciao <a href="/r/Italy">r/Italy</a>, </p> <p>Come da titolo, ho avuto — penso — un percorso di studi e lavorativo non comune e ho avuto la fortuna e la possibilità di studiare e lavorare in università in più paesi. Vi faccio un resoconto del mio percorso qui sotto e sono felice di rispondere a domande su tutti gli aspetti del caso: studiare, vivere e dottorato in UK, linguistica e tutti gli aspetti che la compongono, statistica / metodi quantitativi per la ricerca linguistica, Germania, cibo (ovviamente), etc. </p> <p>Mod, fatemi sapere se sia necessario provvedere prove sulla mia identità! </p> <p>Incominciamo: </p> <p>- Triennale in Lingue e Letterature Straniere all’Università degli Studi di Milano (ENG/PT). Fino a qui nulla di che, sono sempre stato interessato agli aspetti più analitici della lingua e del linguaggio. ho bei ricordi a livello umano del mio periodo qui ma a livello “accademico” non ho portato via molto. Adoro il Portoghese come lingua e la lettrice era fantastica :)</p> <p>- MA in Linguistica a Manchester, MSc in Forensic Speech Science a York. Qui mi sono specializzato in fonetica, linguistica sperimentale e metodi quantitativi per l’analisi dei dati (ho imparato a programmare in R, Python)</p> <p>- PhD (Dottorato) in Linguistica a Manchester. Tesi metodologica su alcuni aspetti dell’uso di elettro encefalogramma per lo studio del linguaggio (ovviamente molto generalizzato, entro nei dettagli per gli interessati). Qui ho imparato a programmare anche in Matlab. </p> <p>- Dal 2021 ho un contratto permanente come “Academic Staff”. In particolare, il ruolo è un mix tra “lecturer” (ma con molte meno ore, solo 4 settimanali), “data scientist” e “lab manager”. La paga è da post-doc. Lavoro in un’università della Germania del sud, in un dipartimento di Linguistica. Sono molto contento della mia posizione e delle mansioni, non ho mai avuto particolare interesse ad intraprendere la (precaria) via per diventare Prof. Tra le mie mansioni, in ordine di importanza: </p> <ul> <li><p>Insegnare corsi universitari su “quantitative methods”, “experimental methods”, etc. a studenti del dipartimento di linguistica. </p></li> <li><p>partecipare in gruppi di ricerca esistenti nel ruolo di data scientist. in poche parole, passo gran parte della mia giornata ad analizzare dati sperimentali in R, creare grafici e a scrivere piccoli report per i principal investigator (PI) dei vari progetti. Per gli interessati, divento poi co-autore di tutti i progetti su cui lavoro. </p></li> <li><p>ricerca. Quando non sto facendo altro, sono invitato anche a lavorare sulla mia ricerca. Nella mia posizione questo però non è requisito, è più considerato un bonus per me</p></li> <li><p>upgrade di hardware nei laboratori, training di staff e studenti sull’uso di un sacco di hardware diversi tra cui molti eye-tracker, pupillometry, elettro encefalogramma, tongue ultrasound, electro glottography, media device, etc. </p></li> <li><p>varie e altre: supervisione tesi, consultazioni con studenti, meeting vari.. </p></li> </ul> <p>AMA!</p> <p>Edit: formatting</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/thrndbck"> /u/thrndbck </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13phjsf/ho_studiato_lingue_in_italia_linguistica_in_uk_e/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13phjsf/ho_studiato_lingue_in_italia_linguistica_in_uk_e/">[comments]</a></span>','','2023-05-23 07:40:07','/u/thrndbck','https://www.reddit.com/r/italy/comments/13phjsf/ho_studiato_lingue_in_italia_linguistica_in_uk_e/','',NULL,'0f92d9a44221145cd3e963e5c8d5afafd7feaf12');
+INSERT INTO entries VALUES(111,'t3_13pok5m',6,'Azione-Iv, la tregua «Lista unica alle europee»','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13pok5m/azioneiv_la_tregua_lista_unica_alle_europee/"> <img alt="Azione-Iv, la tregua «Lista unica alle europee»" src="https://external-preview.redd.it/n6auEs_fy9NRgoNiYJLDLqi3WUMDG_zeMZYYXNbpLAk.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=a79a95b6ccf23d1d654a6cf3eb978ac9d13e510c" title="Azione-Iv, la tregua «Lista unica alle europee»" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/VirtualBit-"> /u/VirtualBit- </a> <br /> <span><a href="https://www.ilsole24ore.com/art/azione-iv-tregua-fragile-lista-unica-europee-AEglvjWD">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pok5m/azioneiv_la_tregua_lista_unica_alle_europee/">[comments]</a></span> </td></tr></table>','','2023-05-23 13:28:28','/u/VirtualBit-','https://www.reddit.com/r/italy/comments/13pok5m/azioneiv_la_tregua_lista_unica_alle_europee/','',NULL,'47bff6cc144ea5d00b2d6d87939409bd98d10176');
+INSERT INTO entries VALUES(112,'t3_13p1pk5',6,'Maltempo Emilia-Romagna, in Italia manca un''app di allerta per i cittadini. A febbraio prorogata (ancora) la sperimentazione','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13p1pk5/maltempo_emiliaromagna_in_italia_manca_unapp_di/"> <img alt="Maltempo Emilia-Romagna, in Italia manca un''app di allerta per i cittadini. A febbraio prorogata (ancora) la sperimentazione" src="https://external-preview.redd.it/soJ2tkML5_0nNpPRR8tVkRaGOrWdyHm_4hXndo8_M9c.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=523e9bb4c01d914970da49e976afe85b41345204" title="Maltempo Emilia-Romagna, in Italia manca un''app di allerta per i cittadini. A febbraio prorogata (ancora) la sperimentazione" /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>L’Italia non riesce ancora dotarsi di un sistema di allerta pubblica basata su cell-broadcast nonostante anni di “sperimentazione”. Secondo voi avrebbe potuto cambiare il destino delle 14 vittime in Emilia Romagna? Per chi abita all’estero vi è mai capitato di ricevere un messaggio di allerta pubblica? Come vi siete comportati? È stato utile?</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Future_Reality4833"> /u/Future_Reality4833 </a> <br /> <span><a href="https://www.open.online/2023/05/17/maltempo-emilia-romagna-it-alert-app-protezione-civile/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13p1pk5/maltempo_emiliaromagna_in_italia_manca_unapp_di/">[comments]</a></span> </td></tr></table>','','2023-05-22 20:09:37','/u/Future_Reality4833','https://www.reddit.com/r/italy/comments/13p1pk5/maltempo_emiliaromagna_in_italia_manca_unapp_di/','',NULL,'98938fe7b9350ff767aee7364ba41bf61c7074b4');
+INSERT INTO entries VALUES(113,'t3_13oniq9',6,'Facebook ha ricevuto una multa di 1.3 miliardi per violazione del GDPR','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13oniq9/facebook_ha_ricevuto_una_multa_di_13_miliardi_per/"> <img alt="Facebook ha ricevuto una multa di 1.3 miliardi per violazione del GDPR" src="https://external-preview.redd.it/IFoVIMuLZiu62Yr_TJ2qCHsq6yFNoz0P64NJPOYJhLc.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=425766a278df120de8b9ca8dd28c71b2b367c6ef" title="Facebook ha ricevuto una multa di 1.3 miliardi per violazione del GDPR" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/DurangoGango"> /u/DurangoGango </a> <br /> <span><a href="https://www.businessinsider.com/meta-fined-record-13-billion-for-data-privacy-breaches-2023-5?op=1&amp;r=US&amp;IR=T">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13oniq9/facebook_ha_ricevuto_una_multa_di_13_miliardi_per/">[comments]</a></span> </td></tr></table>','','2023-05-22 10:53:49','/u/DurangoGango','https://www.reddit.com/r/italy/comments/13oniq9/facebook_ha_ricevuto_una_multa_di_13_miliardi_per/','',NULL,'22ccf1664f1f919366e410a8defcfea83d0c614c');
+INSERT INTO entries VALUES(114,'t3_13os5m4',6,'Estero, Irlanda: l''etichetta sanitaria su vino e alcol è legge','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13os5m4/estero_irlanda_letichetta_sanitaria_su_vino_e/"> <img alt="Estero, Irlanda: l''etichetta sanitaria su vino e alcol è legge" src="https://external-preview.redd.it/kZd1COIG1wJ0wB5OCv6MYmSBuzBsGc8eYxCud5Jm_Jo.jpg?width=320&amp;crop=smart&amp;auto=webp&amp;s=1ce48821ad298a5b07b6186fcc4c452237a0dd38" title="Estero, Irlanda: l''etichetta sanitaria su vino e alcol è legge" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/VirtualBit-"> /u/VirtualBit- </a> <br /> <span><a href="https://tg24.sky.it/mondo/2023/05/22/irlanda-etichetta-vino-alcol">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13os5m4/estero_irlanda_letichetta_sanitaria_su_vino_e/">[comments]</a></span> </td></tr></table>','','2023-05-22 14:15:49','/u/VirtualBit-','https://www.reddit.com/r/italy/comments/13os5m4/estero_irlanda_letichetta_sanitaria_su_vino_e/','',NULL,'b42daf41df828a9332113ac99ee914b771e47f9b');
+INSERT INTO entries VALUES(115,'t3_13omvae',6,'È molto probabile che supereremo il limite di 1,5 °C entro il 2027','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13omvae/è_molto_probabile_che_supereremo_il_limite_di_15/"> <img alt="È molto probabile che supereremo il limite di 1,5 °C entro il 2027" src="https://external-preview.redd.it/K4lHw4T3jqkIrLHDWmydah421PRbdJrBOHF3EZqV-q4.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=bacaf40e495a6ead139739252866366aa2107404" title="È molto probabile che supereremo il limite di 1,5 °C entro il 2027" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/DurangoGango"> /u/DurangoGango </a> <br /> <span><a href="https://www.ilpost.it/2023/05/17/1-5-limite-riscaldamento-globale-2027/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13omvae/è_molto_probabile_che_supereremo_il_limite_di_15/">[comments]</a></span> </td></tr></table>','','2023-05-22 10:19:41','/u/DurangoGango','https://www.reddit.com/r/italy/comments/13omvae/è_molto_probabile_che_supereremo_il_limite_di_15/','',NULL,'bd8fa5931695a0ce066bafb615087ec56873332c');
+INSERT INTO entries VALUES(116,'t3_13orc5p',6,'Le Mafie nell''era digitale. Il Procuratore Gratteri ribadisce: "Dobbiamo assumere più ingegneri informatici per i Servizi segreti"','text/html','<!-- SC_OFF --><div class="md"><p>Per chi se lo fosse perso, il 9 Maggio si è discusso a Montecitorio il <a href="https://fondazionemagnagrecia.it/wp-content/uploads/2023/03/Le-mafie-nellera-digitale_Abstract.pdf">report</a> delle Mafie nell''era digitale, promosso dalla Fondazione Magna Grecia.</p> <p><a href="https://youtu.be/T_Y8Ks3JAVc">https://youtu.be/T_Y8Ks3JAVc</a></p> <p>Il procuratore Nicola Gratteri ha partecipato alla presentazione del primo rapporto sulle mafie nell''era digitale, evidenziando come queste organizzazioni abbiano adattato le proprie strategie alla tecnologia moderna. Gratteri afferma che hanno costruito nuovi sistemi di comunicazione sopra le nostre teste, utilizzando hacker che vengono pagati per garantire la sicurezza delle loro comunicazioni. Al contrario, l''Italia non è stata in grado di infiltrare o intercettare tali sistemi come hanno fatto altri paesi come il Costa Rica, la Francia, l''Olanda e la Germania. Il Procuratore sostiene ulteriormente che l''Italia dovrebbe investire in tecnologie, ricerca e assumere ingegneri informatici e hacker per colmare questa lacuna.</p> <p>Queste organizzazioni hanno adattato le proprie attività ai cambiamenti della società e hanno iniziato a utilizzare i social media, in particolare TikTok, per promuovere il proprio potere, l''immagine e reclutare nuovi membri. Utilizzando queste piattaforme, trasmettono uno stile di vita basato su lusso, soldi, potere e influenze.</p> <p>La delinquenza organizzata sta creando una nuova narrazione di sé stessa sui social media, che non richiede più il cinema come intermediario. Utilizzando emoji, hashtag virali e musica trap, comunicano in modo criptico ma efficace. La narrazione è basata su denaro contante, lusso, feste, minacce ai rivali, armi e simboli che indicano appartenenza al clan.</p> <p>Le organizzazioni italiane hanno imparato molte tattiche dai cartelli messicani del narcotraffico, che utilizzano da tempo YouTube per sfidare lo Stato mostrando la propria forza militare. Tuttavia, differiscono dai cartelli sudamericani, perché quest''ultimi hanno una strategia comunicativa più consolidata, mentre le organizzazioni italiane sfruttano i social media in modo più individuale.</p> <p>In conclusione, tutte le organizzazioni criminali, comprese le mafie italiane, reclutano hacker e utilizzano i social media come strumenti di comunicazione e reclutamento.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/AlessandroIT"> /u/AlessandroIT </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13orc5p/le_mafie_nellera_digitale_il_procuratore_gratteri/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13orc5p/le_mafie_nellera_digitale_il_procuratore_gratteri/">[comments]</a></span>','','2023-05-22 13:44:06','/u/AlessandroIT','https://www.reddit.com/r/italy/comments/13orc5p/le_mafie_nellera_digitale_il_procuratore_gratteri/','',NULL,'c4c5e22d3e5e28579f9c9a9815287d4c56734ff0');
+INSERT INTO entries VALUES(117,'t3_13pc0ox',6,'Caffè Italia * 23/05/23','text/html','<!-- SC_OFF --><div class="md"><p>We compà! gna'' và? </p> <blockquote> <p>Pescara, Abruzzo</p> </blockquote> <h2>In Evidenza</h2> <p>⭐ <strong>Hai visto un commento interessante?</strong> Pensi meriti un suo thread? Dillo a OP! Oppure fai report sul suo commento scegliendo l''opzione &quot;Merita un thread dedicato!&quot;</p> <p>❗ Feedback / segnalazioni ai mod: <a href="https://www.reddit.com/message/compose?to=%2Fr%2Fitaly">clicca qui</a> | <strong>Attenzione</strong>: discutere della moderazione nei thread o nel caffè comporta un giorno di sospensione. </p> <p>🇺🇦 Argomento Ucraina: <a href="/r/italy/wiki/regolamento#wiki_.5B12.2.5D_argomenti_con_limitazioni_nel_caff.E8">nel Caffè sono permesse solo le storie personali</a>. Vuoi commentare le notizie o la situazione generale? Fai un post! </p> <h2>Menu del giorno</h2> <ul> <li><a href="/r/italy/comments/13pguah/di_tutto_un_pod_il_thread_dei_podcast/">Di tutto un pod - il thread dei podcast</a></li> <li><a href="/r/italy/comments/13pc0ox/caff%C3%A8_italia_230523/jl9drmm/">Post interessanti da altri subreddit italiani</a></li> </ul> <h2>Da ieri</h2> <ul> <li><a href="/r/italy/comments/13oj83p/la_grande_fiera_dei_sub_italiani/">La grande fiera dei sub italiani</a></li> <li><a href="/r/italy/comments/13oeijv/caff%C3%A8_italia_220523/jl4kf1c/">Post interessanti da altri subreddit italiani</a></li> </ul> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/RedditItalyBot"> /u/RedditItalyBot </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13pc0ox/caffè_italia_230523/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13pc0ox/caffè_italia_230523/">[comments]</a></span>','','2023-05-23 03:00:04','/u/RedditItalyBot','https://www.reddit.com/r/italy/comments/13pc0ox/caffè_italia_230523/','',NULL,'13952496ecf029120e0b2f000309be1d2f60d338');
+INSERT INTO entries VALUES(118,'t3_13oqa4m',6,'ANPR, ecco il codice identificativo univoco (ID ANPR): cos''è e a cosa servirà','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13oqa4m/anpr_ecco_il_codice_identificativo_univoco_id/"> <img alt="ANPR, ecco il codice identificativo univoco (ID ANPR): cos''è e a cosa servirà" src="https://external-preview.redd.it/91fY-k30oM6GailbBF1z1Tt5eT9bpoFOBUzuDBeAvXs.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=16804d7bc3f657078a51a1e8861ba3fdf8f1d4c3" title="ANPR, ecco il codice identificativo univoco (ID ANPR): cos''è e a cosa servirà" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/lorem"> /u/lorem </a> <br /> <span><a href="https://www.agendadigitale.eu/cittadinanza-digitale/anagrafe-unica/anpr-in-arrivo-il-codice-identificativo-univoco-id-anpr-cose-e-a-cosa-servira/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13oqa4m/anpr_ecco_il_codice_identificativo_univoco_id/">[comments]</a></span> </td></tr></table>','','2023-05-22 13:01:08','/u/lorem','https://www.reddit.com/r/italy/comments/13oqa4m/anpr_ecco_il_codice_identificativo_univoco_id/','',NULL,'8bb823d4614b0704e37362e338324a1fa32be431');
+INSERT INTO entries VALUES(119,'t3_13ojwzk',6,'Numeri Casuali: Quando pure il caos della casualità si perde nella burocrazia (WoT)','text/html','<!-- SC_OFF --><div class="md"><p><strong>Premessa</strong></p> <p>Mentre stavo cercando informazioni su una pratica edile (per chi segue le peripezie, no ancora non sono riuscito a comprare casa) mi sono imbattuto in riferimenti e in un link a un &quot;generatore di numeri casuali&quot; governativo. Colpito dal flashback del progetto di programmazione sui cui lavorai (secoli fa) con amici (e amica speciale) ho deciso di darci un''occhiata,very bad.</p> <p><strong>Il generatore - Chi lo usa</strong></p> <p>Il software in oggetto è il <a href="https://wwwservizi.regione.emilia-romagna.it/generatore/Default.aspx">Generatore di numeri casuali dell''Emilia-Romagna</a> con una descrizione algoritmica <a href="https://wwwservizi.regione.emilia-romagna.it/generatore/Note.aspx">qui</a> Il generatore è usato da una grande quantità di enti (non solo dell''Emilia-Romagna) ogni qual volta è necessario fare un sorteggio: dall''ispezione delle pratiche sismiche, a concorsi, a bandi di appalto etc. Con una ricerca su google:</p> <pre><code>link:https://wwwservizi.regione.emilia-romagna.it/generatore/Default.aspx </code></pre> <p>potete farvi un''idea (tra l''altro un''idea dei solo documenti pubblici, pubblicati online e che hanno copiato il link direttamente nel documento).</p> <p><strong>Il generatore - Come funziona</strong></p> <p>Leggendo i dettagli già la prima frase indica un nozionismo che era già veccchio quando entrai all''università:</p> <blockquote> <p>Si premette subito che un computer, in quanto macchina assolutamente priva di arbitrio (ovvero deterministica), non è in grado di generare dei numeri casuali nel senso letterale del termine.</p> </blockquote> <p>La riflessione filosofica accidentale per cui avere &quot;arbitrio&quot; sia necessario per generare numeri casuali è interessante (lo sapevo che il D20 aveva libero arbitrio!) specialmente per il fatto che chi ha scritto questa descrizione ha già confusione tra &quot;arbitrio&quot; e &quot;determinismo&quot;.</p> <p>Ma passiamo ai dettagli:</p> <blockquote> <p>L''algoritmo utilizzato in questo sito è noto in letteratura e la sua &quot;bontà&quot;, nel senso che genera una sequenza con le stesse proprietà statistiche di una sequenza casuale, è stata dimostrata, con i test statistici del caso. Si tratta di un generatore di Lehmer, ovverosia un generatore congruenziale moltiplicativo. Di particolare importanza per la bontà della sequenza è la scelta dei valori di a, c e m. Nel caso di questo sito i valori scelti sono stati tratti dalla letteratura e sono: m=2147483647 (2<sup>31-1),</sup> a=1103515245 e c=0 Allora già qui il discorso è chiuso, nel senso che l''algoritmo è considerato &quot;debole&quot;.</p> </blockquote> <p>Ma qui siamo ben oltre le considerazioni dimensionali o statistiche dell''algoritmo (pessime in raffronto con altre implementazioni): al di là della fragilità dell''algoritmo il problema è che viene lasciato all''utilizzatore la scelta del &quot;seed&quot;. dato il seed è possibile prevedere i numeri. Ora lasciare all''utilizzatore (dotato di arbitrio) la scelta del seme porta a situazioni così:</p> <p><a href="https://bandigare.comune.cento.fe.it/PortaleAppalti/do/FrontEnd/DocDig/downloadDocumentoPubblico.action;jsessionid=7C1D71FE3D903B8CC99F36EBD11901F2?id=1043&amp;idprg=&amp;_csrf=F3P8STAN9JLK9URGWLLJI2DE73H7AT5K">Comune di cento: Data del sorteggio</a></p> <p><a href="https://www.comune.santavenerina.ct.it/wp-content/uploads/2022/05/Sorteggio-componenti-commissione-giudicatrice.pdf">Comune di santavenerina: Seme &quot;scelto&quot; dal dipendente</a></p> <p>Apprezzabile e concettualmente difendibile: <a href="https://sua.cittametropolitana.genova.it/sites/default/files/Allegati/ID.4514.G.08.00_verbale%20seduta%20sorteggio%20operatori%20da%20inv%20per%20SUA.pdf">Comune di genova: Estrazioni del lotto</a></p> <p>Altri li potete trovare online trattandosi di che per loro stessa natura dovrebbero essere pubblicati.</p> <p><strong>Riassumendo</strong> </p> <p>Chi sceglie il seed decide l''esito del sorteggio: pensate a un funzionario che sceglie la data del sorteggio di una gara: saprà già chi viene estratto.</p> <p>Pensate a chi deve presentare una pratica che potrebbe essere sottoposta a ispezione &quot;a sorteggio&quot;, ma sa che l''estrazione viene fatta con il seed YYYYMMDD per cui certi numeri non saranno generati (esempio &quot;1&quot;) e quindi si presenta alle 4 del mattino per essere il primo del mese a presentare la pratica.</p> <p>Tra l''altro il seme deve avere certe caratteristiche quando impiegato con quel tipo di algoritmi deboli, pena proprietà indesiderabili... E no scegliere &quot;6&quot; come seme perchè si devono fare &quot;6&quot; estrazioni non è un buon criterio.</p> <p>** Basta scritto troppo. **</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/_moria_"> /u/_moria_ </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13ojwzk/numeri_casuali_quando_pure_il_caos_della/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13ojwzk/numeri_casuali_quando_pure_il_caos_della/">[comments]</a></span>','','2023-05-22 07:37:42','/u/_moria_','https://www.reddit.com/r/italy/comments/13ojwzk/numeri_casuali_quando_pure_il_caos_della/','',NULL,'2ff2ed33fbda7ed0946a3f99e6dddd6d4f5738f3');
+INSERT INTO entries VALUES(120,'t3_13okblu',6,'GialappaShow: pensieri e opinioni','text/html','<!-- SC_OFF --><div class="md"><p>Ieri sera c''è stata la prima puntata di GialappaShow sulla 8.</p> <p>Avevo aspettative piuttosto alte che sono state parzialmente disattese, Foresti sempre molto bravo, ma le nuove/vecchie gag un po'' sotto le aspettative.</p> <p>Il punto è che, secondo me, quello che veramente rendeva superlativi i programmi dei gialappi erano i personaggi che ci gravitavano intorno: Teocoli, Aldo Giovanni e Giacomo, Fabio De Luigi per dirne alcuni, poi il commento agli episodi calcistici era godibile anche da chi , come me, non segue molto il calcio.Senza tutto questo ne risulta un programma molto &quot;diluito&quot;, che vive un po'' più della sua eredità che di quello che ha effettivamente da offrire adesso.</p> <p>Per chi li ha seguiti negli anni 90 e nei 2000 sicuramente sono un gradito ritorno, ma per eventuali nuovi telespettatori che finora avevano solo visto degli estratti dei loro programmi su yt direi che di carne al fuoco non c''è poi così tanta.</p> <p>Cosa ne pensate?</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Manzanarre"> /u/Manzanarre </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13okblu/gialappashow_pensieri_e_opinioni/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13okblu/gialappashow_pensieri_e_opinioni/">[comments]</a></span>','','2023-05-22 07:59:57','/u/Manzanarre','https://www.reddit.com/r/italy/comments/13okblu/gialappashow_pensieri_e_opinioni/','',NULL,'cee6c0cddf46dec1f5531eb33916dee0b87aba7a');
+INSERT INTO entries VALUES(121,'t3_13opb8o',6,'La Via della Seta dell''Italia sul viale del tramonto','text/html','&#32; submitted by &#32; <a href="https://www.reddit.com/user/Berix__"> /u/Berix__ </a> <br /> <span><a href="https://www.huffingtonpost.it/blog/2023/05/22/news/la_via_della_seta_italiana_al_tramonto-12183761/amp/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13opb8o/la_via_della_seta_dellitalia_sul_viale_del/">[comments]</a></span>','','2023-05-22 12:19:20','/u/Berix__','https://www.reddit.com/r/italy/comments/13opb8o/la_via_della_seta_dellitalia_sul_viale_del/','',NULL,'c9434d3f3b5d36aa6aee6534569e2c8d3deb9012');
+INSERT INTO entries VALUES(122,'t3_13oqie3',6,'La Cina si è arrabbiata con i paesi del G7 - Il Post','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13oqie3/la_cina_si_è_arrabbiata_con_i_paesi_del_g7_il_post/"> <img alt="La Cina si è arrabbiata con i paesi del G7 - Il Post" src="https://external-preview.redd.it/arFuTiiA2t4ji1yVkdTHZX06K3NTxian7nTObf0Qw00.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=cd11d7637fa841947344b182608b8596e551eb11" title="La Cina si è arrabbiata con i paesi del G7 - Il Post" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/notizia"> /u/notizia </a> <br /> <span><a href="https://www.ilpost.it/2023/05/22/cina-g7/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13oqie3/la_cina_si_è_arrabbiata_con_i_paesi_del_g7_il_post/">[comments]</a></span> </td></tr></table>','','2023-05-22 13:10:19','/u/notizia','https://www.reddit.com/r/italy/comments/13oqie3/la_cina_si_è_arrabbiata_con_i_paesi_del_g7_il_post/','',NULL,'565216664b43fdfad4b819f25f360d3451800f7c');
+INSERT INTO entries VALUES(123,'t3_13ov79k',6,'Chitarra "da spiaggia": quali canzoni italiane dovrei imparare?','text/html','<!-- SC_OFF --><div class="md"><p>Ciao a tutti, Suono la chitarra da qualche mese e sto finalmente iniziando a imparare le mie canzoni preferite. Uno dei punti deboli del mio repertorio, però, è la musica italiana: ammetto la mia totale ignoranza in quest''ambito, specialmente per quanto riguarda le classiche canzoni &quot;da spiaggia&quot; che ci si aspetta che chiunque con una chitarra in mano sappia suonare - come dire, l''equivalente italiano di Wonderwall.</p> <p>Se avete voglia di darmi una mano a costruire il mio repertorio italiano, accetto suggerimenti:)</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/KarabTorje"> /u/KarabTorje </a> <br /> <span><a href="https://www.reddit.com/r/italy/comments/13ov79k/chitarra_da_spiaggia_quali_canzoni_italiane/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13ov79k/chitarra_da_spiaggia_quali_canzoni_italiane/">[comments]</a></span>','','2023-05-22 16:10:51','/u/KarabTorje','https://www.reddit.com/r/italy/comments/13ov79k/chitarra_da_spiaggia_quali_canzoni_italiane/','',NULL,'b2daf0b643d81711e4856bdf25f4d5aa3a8bed3e');
+INSERT INTO entries VALUES(124,'t3_13nzyki',6,'Ecco quanto guadagna un cassiere / scaffalista al supermercato in Olanda. Si comincia a 13 anni dopo scuola, è troppo presto secondo voi?','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13nzyki/ecco_quanto_guadagna_un_cassiere_scaffalista_al/"> <img alt="Ecco quanto guadagna un cassiere / scaffalista al supermercato in Olanda. Si comincia a 13 anni dopo scuola, è troppo presto secondo voi?" src="https://preview.redd.it/2il6rbz4a91b1.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=ac88ee17d14d53fca94b273c062ba4e2d009cd54" title="Ecco quanto guadagna un cassiere / scaffalista al supermercato in Olanda. Si comincia a 13 anni dopo scuola, è troppo presto secondo voi?" /> </a> </td><td> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Alex_Cheese94"> /u/Alex_Cheese94 </a> <br /> <span><a href="https://i.redd.it/2il6rbz4a91b1.jpg">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13nzyki/ecco_quanto_guadagna_un_cassiere_scaffalista_al/">[comments]</a></span> </td></tr></table>','','2023-05-21 16:52:04','/u/Alex_Cheese94','https://www.reddit.com/r/italy/comments/13nzyki/ecco_quanto_guadagna_un_cassiere_scaffalista_al/','',NULL,'ea13e3dca24eb6f30f2c5aee6789f1683853355e');
+INSERT INTO entries VALUES(125,'t3_13npvsk',6,'Macron: riflessioni sulla de-industrializzazione francese e sulla sovranità industriale europea','text/html','<table> <tr><td> <a href="https://www.reddit.com/r/italy/comments/13npvsk/macron_riflessioni_sulla_deindustrializzazione/"> <img alt="Macron: riflessioni sulla de-industrializzazione francese e sulla sovranità industriale europea" src="https://external-preview.redd.it/nsbluRGmxPLBn2v3Ri_MIpGb3BswBfLdMXaHjSqv8Js.jpg?width=640&amp;crop=smart&amp;auto=webp&amp;s=8a44efe594be889e5374d7a701213cb14a61d473" title="Macron: riflessioni sulla de-industrializzazione francese e sulla sovranità industriale europea" /> </a> </td><td> <!-- SC_OFF --><div class="md"><p>Davanti ad una assemblea gremita di industriali, Macron ha detto da che la Francia si è deindustrializzata più di altri paesi europei: “C’è stata una scelta quasi ideologica per dire all’industria che questi non sono buoni lavori. Meglio essere un Paese di servizi e di turismo. Dalla fine del 2000 fino all’estate del 2017, abbiamo perso quasi un milione di posti di lavoro nell’industria. Ciò che abbiamo scoperto a nostre spese è che questo trascina l’intera economia verso il basso, perché quando l’industria se ne va, se ne vanno i servizi annessi e se ne vanno le amministrazioni che restano a tenere un territorio”.</p> </div><!-- SC_ON --> &#32; submitted by &#32; <a href="https://www.reddit.com/user/Archetypus"> /u/Archetypus </a> <br /> <span><a href="https://www.startmag.it/energia/macron-industrializzazione-green-francia/">[link]</a></span> &#32; <span><a href="https://www.reddit.com/r/italy/comments/13npvsk/macron_riflessioni_sulla_deindustrializzazione/">[comments]</a></span> </td></tr></table>','','2023-05-21 10:52:55','/u/Archetypus','https://www.reddit.com/r/italy/comments/13npvsk/macron_riflessioni_sulla_deindustrializzazione/','',NULL,'a5cf18fe9af72adbe91db1cf618c6b9333e7eb60');
+CREATE TABLE IF NOT EXISTS "unread" ("id" INTEGER NOT NULL PRIMARY KEY, "user_id" INTEGER NOT NULL, "entry_id" INTEGER NOT NULL, FOREIGN KEY ("user_id") REFERENCES "users" ("id"), FOREIGN KEY ("entry_id") REFERENCES "entries" ("id") ON DELETE CASCADE);
+INSERT INTO unread VALUES(1,1,125);
+INSERT INTO unread VALUES(2,1,124);
+INSERT INTO unread VALUES(3,1,119);
+INSERT INTO unread VALUES(4,1,120);
+INSERT INTO unread VALUES(5,1,115);
+INSERT INTO unread VALUES(6,1,113);
+INSERT INTO unread VALUES(7,1,121);
+INSERT INTO unread VALUES(8,1,118);
+INSERT INTO unread VALUES(9,1,122);
+INSERT INTO unread VALUES(10,1,116);
+INSERT INTO unread VALUES(11,1,114);
+INSERT INTO unread VALUES(12,1,123);
+INSERT INTO unread VALUES(13,1,112);
+INSERT INTO unread VALUES(14,1,117);
+INSERT INTO unread VALUES(15,1,100);
+INSERT INTO unread VALUES(16,1,107);
+INSERT INTO unread VALUES(17,1,110);
+INSERT INTO unread VALUES(18,1,109);
+INSERT INTO unread VALUES(19,1,111);
+INSERT INTO unread VALUES(20,1,104);
+INSERT INTO unread VALUES(21,1,108);
+INSERT INTO unread VALUES(22,1,99);
+INSERT INTO unread VALUES(23,1,105);
+INSERT INTO unread VALUES(24,1,101);
+INSERT INTO unread VALUES(25,1,103);
+INSERT INTO unread VALUES(26,1,102);
+INSERT INTO unread VALUES(27,1,106);
+INSERT INTO unread VALUES(28,1,8);
+INSERT INTO unread VALUES(29,1,19);
+INSERT INTO unread VALUES(30,1,11);
+INSERT INTO unread VALUES(31,1,9);
+INSERT INTO unread VALUES(32,1,20);
+INSERT INTO unread VALUES(33,1,16);
+INSERT INTO unread VALUES(34,1,12);
+INSERT INTO unread VALUES(35,1,15);
+INSERT INTO unread VALUES(36,1,18);
+INSERT INTO unread VALUES(37,1,17);
+INSERT INTO unread VALUES(38,1,14);
+INSERT INTO unread VALUES(39,1,13);
+INSERT INTO unread VALUES(40,1,10);
+INSERT INTO unread VALUES(41,1,7);
+INSERT INTO unread VALUES(42,1,6);
+INSERT INTO unread VALUES(43,1,3);
+INSERT INTO unread VALUES(44,1,4);
+INSERT INTO unread VALUES(45,1,2);
+INSERT INTO unread VALUES(46,1,5);
+INSERT INTO unread VALUES(47,1,1);
+INSERT INTO unread VALUES(48,1,40);
+INSERT INTO unread VALUES(49,1,39);
+INSERT INTO unread VALUES(50,1,38);
+INSERT INTO unread VALUES(51,1,37);
+INSERT INTO unread VALUES(52,1,36);
+INSERT INTO unread VALUES(53,1,35);
+INSERT INTO unread VALUES(54,1,34);
+INSERT INTO unread VALUES(55,1,33);
+INSERT INTO unread VALUES(56,1,32);
+INSERT INTO unread VALUES(57,1,31);
+INSERT INTO unread VALUES(58,1,30);
+INSERT INTO unread VALUES(59,1,29);
+INSERT INTO unread VALUES(60,1,28);
+INSERT INTO unread VALUES(61,1,27);
+INSERT INTO unread VALUES(62,1,26);
+INSERT INTO unread VALUES(63,1,25);
+INSERT INTO unread VALUES(64,1,24);
+INSERT INTO unread VALUES(65,1,23);
+INSERT INTO unread VALUES(66,1,22);
+INSERT INTO unread VALUES(67,1,21);
+INSERT INTO unread VALUES(68,1,50);
+INSERT INTO unread VALUES(69,1,49);
+INSERT INTO unread VALUES(70,1,48);
+INSERT INTO unread VALUES(71,1,47);
+INSERT INTO unread VALUES(72,1,46);
+INSERT INTO unread VALUES(73,1,45);
+INSERT INTO unread VALUES(74,1,44);
+INSERT INTO unread VALUES(75,1,43);
+INSERT INTO unread VALUES(76,1,42);
+INSERT INTO unread VALUES(77,1,41);
+INSERT INTO unread VALUES(78,1,98);
+INSERT INTO unread VALUES(79,1,97);
+INSERT INTO unread VALUES(80,1,96);
+INSERT INTO unread VALUES(81,1,95);
+INSERT INTO unread VALUES(82,1,94);
+INSERT INTO unread VALUES(83,1,93);
+INSERT INTO unread VALUES(84,1,92);
+INSERT INTO unread VALUES(85,1,91);
+INSERT INTO unread VALUES(86,1,90);
+INSERT INTO unread VALUES(87,1,89);
+INSERT INTO unread VALUES(88,1,88);
+INSERT INTO unread VALUES(89,1,87);
+INSERT INTO unread VALUES(90,1,86);
+INSERT INTO unread VALUES(91,1,85);
+INSERT INTO unread VALUES(92,1,84);
+INSERT INTO unread VALUES(93,1,83);
+INSERT INTO unread VALUES(94,1,82);
+INSERT INTO unread VALUES(95,1,81);
+INSERT INTO unread VALUES(96,1,80);
+INSERT INTO unread VALUES(97,1,79);
+INSERT INTO unread VALUES(98,1,78);
+INSERT INTO unread VALUES(99,1,77);
+INSERT INTO unread VALUES(100,1,76);
+INSERT INTO unread VALUES(101,1,75);
+INSERT INTO unread VALUES(102,1,74);
+INSERT INTO unread VALUES(103,1,73);
+INSERT INTO unread VALUES(104,1,72);
+INSERT INTO unread VALUES(105,1,71);
+INSERT INTO unread VALUES(106,1,70);
+INSERT INTO unread VALUES(107,1,69);
+INSERT INTO unread VALUES(108,1,68);
+INSERT INTO unread VALUES(109,1,67);
+INSERT INTO unread VALUES(110,1,66);
+INSERT INTO unread VALUES(111,1,65);
+INSERT INTO unread VALUES(112,1,64);
+INSERT INTO unread VALUES(113,1,63);
+INSERT INTO unread VALUES(114,1,62);
+INSERT INTO unread VALUES(115,1,61);
+INSERT INTO unread VALUES(116,1,60);
+INSERT INTO unread VALUES(117,1,59);
+INSERT INTO unread VALUES(118,1,58);
+INSERT INTO unread VALUES(119,1,57);
+INSERT INTO unread VALUES(120,1,56);
+INSERT INTO unread VALUES(121,1,55);
+INSERT INTO unread VALUES(122,1,54);
+INSERT INTO unread VALUES(123,1,53);
+INSERT INTO unread VALUES(124,1,52);
+INSERT INTO unread VALUES(125,1,51);
+CREATE TABLE IF NOT EXISTS "counters" ("id" INTEGER NOT NULL PRIMARY KEY, "user_id" INTEGER NOT NULL, "feed_id" INTEGER NOT NULL, "entry_count" INTEGER NOT NULL, "unread_count" INTEGER NOT NULL, FOREIGN KEY ("user_id") REFERENCES "users" ("id"), FOREIGN KEY ("feed_id") REFERENCES "feeds" ("id") ON DELETE CASCADE);
+INSERT INTO counters VALUES(1,1,6,27,27);
+INSERT INTO counters VALUES(2,1,1,0,0);
+INSERT INTO counters VALUES(3,1,2,20,20);
+INSERT INTO counters VALUES(4,1,3,20,20);
+INSERT INTO counters VALUES(5,1,4,10,10);
+INSERT INTO counters VALUES(6,1,5,48,48);
 CREATE UNIQUE INDEX "group_title" ON "groups" ("title");
 CREATE UNIQUE INDEX "user_email" ON "users" ("email");
 CREATE INDEX "read_user_id" ON "read" ("user_id");
@@ -173,4 +321,25 @@ CREATE INDEX "subscription_user_id" ON "subscriptions" ("user_id");
 CREATE INDEX "subscription_group_id" ON "subscriptions" ("group_id");
 CREATE INDEX "subscription_feed_id" ON "subscriptions" ("feed_id");
 CREATE UNIQUE INDEX "subscription_user_id_group_id_feed_id" ON "subscriptions" ("user_id", "group_id", "feed_id");
+CREATE UNIQUE INDEX "migration_name" ON "migrations" ("name");
+CREATE INDEX "job_feed_id" ON "jobs" ("feed_id");
+CREATE INDEX "job_run_after" ON "jobs" ("run_after");
+CREATE UNIQUE INDEX "job_kind_feed_id" ON "jobs" ("kind", "feed_id");
+CREATE UNIQUE INDEX "icon_data_hash" ON "icons" ("data_hash");
+CREATE INDEX "feed_last_checked_on" ON "feeds" ("last_checked_on");
+CREATE UNIQUE INDEX "feed_self_link" ON "feeds" ("self_link");
+CREATE INDEX "feeds_icon_id" ON "feeds" ("icon_id");
+CREATE INDEX "feeds_next_check_on" ON "feeds" ("next_check_on");
+CREATE INDEX "entry_feed_id" ON "entries" ("feed_id");
+CREATE UNIQUE INDEX "entries_guid_hash" ON "entries" ("guid_hash");
+CREATE INDEX "entries_published_on" ON "entries" ("published_on");
+CREATE INDEX "entries_feed_id_published_on" ON "entries" ("feed_id", "published_on");
+CREATE INDEX "read_user_id_read_on" ON "read" ("user_id", "read_on");
+CREATE INDEX "users_fever_api_key" ON "users" ("fever_api_key");
+CREATE INDEX "unread_user_id" ON "unread" ("user_id");
+CREATE INDEX "unread_entry_id" ON "unread" ("entry_id");
+CREATE UNIQUE INDEX "unread_user_id_entry_id" ON "unread" ("user_id", "entry_id");
+CREATE INDEX "counter_user_id" ON "counters" ("user_id");
+CREATE INDEX "counter_feed_id" ON "counters" ("feed_id");
+CREATE UNIQUE INDEX "counter_user_id_feed_id" ON "counters" ("user_id", "feed_id");
 COMMIT;
@@ -0,0 +1,276 @@
+'''
+Shared feed logic tests
+'''
+from pathlib import Path
+from xml.etree import ElementTree
+from datetime import datetime
+import threading
+import pytest
+from coldsweat import create_app
+from coldsweat.models import Counter, Entry, Feed, Group, Read, Saved, Subscription, Unread, User, db_wrapper
+from coldsweat import TestingConfig
+
+import coldsweat.counters as counters
+import coldsweat.feed as feed
+
+TEST_DIR = Path(__file__).parent
+
+
+@pytest.fixture()
+def app():
+    app = create_app(config_class=TestingConfig)
+    with open(TEST_DIR.joinpath("test-data.sql"), 'r') as f:
+        # https://docs.python.org/3/library/sqlite3.html#sqlite3.Connection.executescript
+        sql = f.read()
+        db_wrapper.database.connection().executescript(sql)
+
+    yield app
+
+    db_wrapper.database.connection().close()
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_fetch_feeds_workers(app, monkeypatch, workers):
+    fetched, thread_names = [], set()
+
+    def fake_worker(feed_):
+        fetched.append(feed_.id)
+        thread_names.add(threading.current_thread().name)
+
+    monkeypatch.setattr(feed, 'feed_worker', fake_worker)
+    with app.app_context():
+        feeds = list(Feed.select())
+        feed.fetch_feeds(feeds, workers=workers)
+
+    assert sorted(fetched) == sorted(f.id for f in feeds)
+    assert len(thread_names) <= workers
+
+
+def test_add_feeds_from_opml(app, monkeypatch):
+    # Exercise batching with a tiny batch size
+    monkeypatch.setattr(feed, 'IMPORT_BATCH_SIZE', 7)
+    with app.app_context():
+        user = User.create(email='opml@example.com', fever_api_key='', password_hash='')
+        feed_count = Feed.select().count()
+
+        feed_ids = feed.add_feeds_from_opml(TEST_DIR.joinpath('sample-subscriptions.opml'), user)
+        assert len(feed_ids) == 20
+        assert Subscription.select().where(Subscription.user == user).count() == 20
+
+        # Importing again adds nothing
+        assert feed.add_feeds_from_opml(TEST_DIR.joinpath('sample-subscriptions.opml'), user) == feed_ids
+        assert Feed.select().count() == feed_count + 20
+        assert Subscription.select().where(Subscription.user == user).count() == 20
+
+        # Existing feeds are reused and nested outlines go to their group
+        feed_ids = feed.add_feeds_from_opml(TEST_DIR.joinpath('test-subscriptions.xml'), user)
+        assert sorted(feed_ids) == [1, 2, 3, 4, 5, 6]
+        subscription = Subscription.get((Subscription.user == user) & (Subscription.feed == 3))
+        assert subscription.group.title == 'Tech News & Reviews'
+        subscription = Subscription.get((Subscription.user == user) & (Subscription.feed == 6))
+        assert subscription.group.title == Group.DEFAULT_GROUP
+
+
+def test_export_subscriptions(app, tmp_path):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        opml_path = tmp_path.joinpath('export.opml')
+        with open(opml_path, 'w') as f:
+            for chunk in feed.export_subscriptions(user):
+                f.write(chunk)
+
+        # Exported file can be imported back
+        other_user = User.create(email='other@example.com', fever_api_key='', password_hash='')
+        feed_ids = feed.add_feeds_from_opml(opml_path, other_user)
+        subscribed_ids = [s.feed_id for s in Subscription.select().where(Subscription.user == user)]
+        assert sorted(feed_ids) == sorted(subscribed_ids)
+
+
+def test_export_saved_entries(app):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        Saved.insert_many([{'user': user, 'entry': entry_id} for entry_id in (1, 2, 3)]).on_conflict_ignore().execute()
+        xml = ''.join(feed.export_saved_entries(user))
+
+    root = ElementTree.fromstring(xml)
+    entries = root.findall('{http://www.w3.org/2005/Atom}entry')
+    assert len(entries) == Saved.select().where(Saved.user == user).count()
+    assert Entry.get_by_id(1).guid in [e.findtext('{http://www.w3.org/2005/Atom}id') for e in entries]
+
+
+def test_prune_entries_keep(app, monkeypatch):
+    monkeypatch.setattr(feed, 'PRUNE_BATCH_SIZE', 3)
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        feed_ = Feed.get(Feed.id == 3)
+        entries = list(Entry.select().where(Entry.feed == feed_).order_by(Entry.published_on.desc(), Entry.id.desc()))
+        oldest = entries[-1]
+        Saved.create(user=user, entry=oldest)
+        Read.insert_many([{'user': user, 'entry': e} for e in entries]).on_conflict_ignore().execute()
+        other_count = Entry.select().where(Entry.feed != feed_).count()
+
+        count = feed.prune_entries(keep=2, feeds=[feed_])
+
+        assert count == len(entries) - 3
+        kept = set(e.id for e in Entry.select().where(Entry.feed == feed_))
+        assert kept == {entries[0].id, entries[1].id, oldest.id}
+        assert Read.select().where(Read.entry << [e.id for e in entries]).count() == 3
+        # Other feeds are left alone
+        assert Entry.select().where(Entry.feed != feed_).count() == other_count
+
+
+def test_prune_entries_days(app):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        Saved.create(user=user, entry=Entry.get_by_id(1))
+        # Test entries are all older than this
+        feed.prune_entries(days=365)
+        assert [e.id for e in Entry.select()] == [1]
+
+
+def test_vacuum_database(app):
+    with app.app_context():
+        database = db_wrapper.database
+        # First run switches to incremental mode
+        feed.vacuum_database()
+        assert database.pragma('auto_vacuum') == feed.SQLITE_INCREMENTAL_VACUUM
+
+        feed.prune_entries(days=365)
+        assert database.pragma('freelist_count') > 1
+        feed.vacuum_database()
+        assert database.pragma('freelist_count') == 0
+
+
+def test_remove_feed(app):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        feed_ = Feed.get(Feed.id == 3)
+        assert not feed.remove_feed(feed_)
+
+        Subscription.delete().where(Subscription.feed == feed_).execute()
+        saved = Saved.create(user=user, entry=Entry.get(Entry.feed == feed_))
+        # Feed is kept along with the saved entry
+        assert not feed.remove_feed(feed_)
+        assert [e.id for e in Entry.select().where(Entry.feed == feed_)] == [saved.entry_id]
+
+        saved.delete_instance()
+        assert feed.remove_orphan_feeds() == 1
+        assert not Feed.select().where(Feed.id == 3).exists()
+
+
+def test_compress_entries(app):
+    with app.app_context():
+        entry = Entry.get_by_id(1)
+        content, text_content = entry.content, entry.text_content
+        count = Entry.select().count()
+        assert feed.compress_entries() == count
+        assert feed.compress_entries() == 0
+
+        entry = Entry.get_by_id(1)
+        assert entry.raw_content == ''
+        assert entry.content == content
+        assert entry.text_content == text_content
+
+        assert feed.compress_entries(False) == count
+        assert Entry.get_by_id(1).raw_content == content
+
+
+def test_compress_content_setting(app):
+    app.config['COMPRESS_CONTENT'] = True
+    with app.app_context():
+        entry = Entry.get_by_id(1)
+        entry.content = '<p>Compressed</p>'
+        entry.save()
+        entry = Entry.get_by_id(1)
+        assert entry.compressed_content is not None
+        assert entry.content == '<p>Compressed</p>'
+
+
+def test_mark_entries_as_read(app):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        feed_ = Feed.get(Feed.id == 3)
+        before = datetime.utcnow()
+        unread_count = feed.get_feed_entries(user, feed_, Entry.id).where(
+            ~(Entry.id << Read.select(Read.entry).where(Read.user == user))).count()
+        assert feed.mark_entries_as_read(user, before, feed=feed_) == unread_count
+        # Nothing left to mark in this feed
+        assert feed.mark_entries_as_read(user, before, feed=feed_) == 0
+        assert feed.mark_entries_as_read(user, before) > 0
+        assert feed.get_unread_entries(user, Entry.id).count() == 0
+
+
+def test_get_read_and_saved_ids(app):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        entries = list(Entry.select().where(Entry.id << [1, 2, 3]))
+        Read.delete().where(Read.user == user).execute()
+        Read.create(user=user, entry=entries[0])
+        Read.create(user=user, entry=Entry.get_by_id(4))
+        Saved.create(user=user, entry=entries[1])
+        # Only given entries are looked up
+        assert feed.get_read_and_saved_ids(user, entries) == ({1}, {2})
+
+
+def test_unread_index(app):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        feed_ = Feed.get(Feed.id == 3)
+        group = Subscription.get((Subscription.user == user) & (Subscription.feed == feed_)).group
+
+        def unread_ids():
+            return set(entry_id for entry_id, in Unread.select(Unread.entry).where(Unread.user == user).tuples())
+
+        def expected_ids():
+            return set(e.id for e in feed.get_all_entries(user, Entry.id).where(
+                ~(Entry.id << Read.select(Read.entry).where(Read.user == user))))
+
+        assert unread_ids() == expected_ids()
+        entry = Entry.get(Entry.feed == feed_)
+        feed.mark_entry(user, entry, 'read')
+        assert entry.id not in unread_ids()
+        feed.mark_entry(user, entry, 'unread')
+        assert entry.id in unread_ids()
+
+        feed.remove_subscription(user, feed_)
+        assert unread_ids() == expected_ids()
+        feed.add_subscription(user, feed_, group)
+        assert unread_ids() == expected_ids()
+
+        feed.mark_entries_as_read(user, datetime.utcnow(), feed=feed_)
+        assert unread_ids() == expected_ids()
+        feed.prune_entries(days=365)
+        assert unread_ids() == expected_ids() == set()
+
+
+def test_counters(app):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+        feed_ = Feed.get(Feed.id == 3)
+        group = Subscription.get((Subscription.user == user) & (Subscription.feed == feed_)).group
+
+        def snapshot():
+            return list(Counter.select(Counter.user, Counter.feed, Counter.entry_count, Counter.unread_count)
+                        .order_by(Counter.user, Counter.feed).tuples())
+
+        def assert_counters():
+            kept = snapshot()
+            counters.rebuild()
+            assert kept == snapshot()
+
+        assert counters.get_entry_count(user) == feed.get_all_entries(user, Entry.id).count()
+        assert counters.get_unread_count(user) == feed.get_unread_entries(user, Entry.id).count()
+        assert counters.get_entry_count(user, feed=feed_) == Entry.select().where(Entry.feed == feed_).count()
+
+        feed.mark_entry(user, Entry.get(Entry.feed == feed_), 'read')
+        assert_counters()
+        feed.remove_subscription(user, feed_)
+        assert_counters()
+        feed.add_subscription(user, feed_, group)
+        assert_counters()
+        assert counters.get_entry_count(user, group=group) == feed.get_group_entries(user, group, Entry.id).count()
+
+        feed.mark_entries_as_read(user, datetime.utcnow(), feed=feed_)
+        assert_counters()
+        feed.prune_entries(keep=5)
+        assert_counters()
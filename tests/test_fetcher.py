@@ -2,13 +2,20 @@
 Feed fetcher tests
 '''
 from pathlib import Path
-from requests.exceptions import RequestException
+from datetime import datetime
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from requests.exceptions import ReadTimeout, RequestException
+from peewee import fn
 import pytest
 from coldsweat import create_app
-from coldsweat.models import db_wrapper
+from coldsweat.models import Counter, Entry, Feed, Icon, Subscription, Unread, db_wrapper
 from coldsweat import TestingConfig
 
 from coldsweat import fetcher
+from coldsweat.feed import prune_entries
+from coldsweat.utilities import format_http_datetime, make_sha1_hash
 
 TEST_DIR = Path(__file__).parent
 TEST_FEEDS = (
@@ -16,6 +23,26 @@ TEST_FEEDS = (
     ('https://lab.passiomatic.com/coldsweat/tests/feed1.xml', 200),
     ('https://lab.passiomatic.com/coldsweat/tests/wrong-feed.xml', 404),
 )
+TEST_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+<channel>
+    <title>Test feed</title>
+    <link>http://example.com/</link>
+    <item>
+        <title>First entry</title>
+        <link>http://example.com/1</link>
+        <description>First &lt;b&gt;entry&lt;/b&gt;</description>
+        <pubDate>Sat, 01 Jul 2023 10:00:00 GMT</pubDate>
+    </item>
+    <item>
+        <title>Second entry</title>
+        <link>http://example.com/2</link>
+        <description>Second entry</description>
+        <pubDate>Sun, 02 Jul 2023 10:00:00 GMT</pubDate>
+    </item>
+</channel>
+</rss>"""
+
 
 @pytest.fixture()
 def app():
@@ -29,6 +56,48 @@ def app():
 
     db_wrapper.database.connection().close()
 
+@pytest.fixture()
+def server():
+    """
+    Local HTTP/1.1 server replying with the routes set by each test
+    """
+    routes, paths = {}, []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            paths.append(self.path)
+            status, headers, body = routes.get(self.path, (404, {}, b''))
+            if 'ETag' in headers and self.headers.get('If-None-Match') == headers['ETag']:
+                status, body = 304, b''
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if callable(body):
+                # Let the test write the body, say slowly
+                self.end_headers()
+                body(self.wfile)
+                return
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.routes = routes
+    httpd.paths = paths
+    httpd.base_url = 'http://127.0.0.1:%d' % httpd.server_address[1]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    yield httpd
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
 @pytest.mark.parametrize("url, status", TEST_FEEDS)
 def test_fetcher_status(app, url, status):
     with app.app_context():                
@@ -37,3 +106,212 @@ def test_fetcher_status(app, url, status):
         except RequestException:
             response = None
         assert (response == status) or (response.status_code == status)
+
+
+def test_schedule_next_check(app):
+    with app.app_context():
+        feed = Feed.get(Feed.id == 2)
+        f = fetcher.Fetcher(feed)
+        f.schedule_next_check()
+        # Test feeds went quiet long ago, hence they are polled rarely
+        interval = (feed.next_check_on - f.instant).total_seconds()
+        assert interval == fetcher.MAX_FETCH_INTERVAL
+
+
+@pytest.mark.parametrize("error_count", [1, 2, 5, 20])
+def test_schedule_retry(app, error_count):
+    with app.app_context():
+        feed = Feed.get(Feed.id == 1)
+        feed.error_count = error_count
+        f = fetcher.Fetcher(feed)
+        f.schedule_retry()
+        interval = (feed.next_check_on - f.instant).total_seconds()
+        expected = min(fetcher.BACKOFF_BASE_INTERVAL * 2 ** (error_count - 1), fetcher.MAX_BACKOFF_INTERVAL)
+        assert expected * (1 - fetcher.BACKOFF_JITTER) <= interval <= expected * (1 + fetcher.BACKOFF_JITTER)
+
+
+def test_session_reuses_connections(app, server):
+    server.routes['/feed.xml'] = (200, {'Content-Type': 'application/rss+xml'}, b'<rss></rss>')
+    with app.app_context():
+        fetcher.fetch_stats.reset()
+        for _ in range(3):
+            response = fetcher.fetch_url(server.base_url + '/feed.xml')
+        assert response.status_code == 200
+        assert fetcher.fetch_stats['new_connections'] == 1
+        assert fetcher.fetch_stats['reused_connections'] == 2
+
+
+def test_fetch_url_max_size(app, server):
+    server.routes['/big.xml'] = (200, {'Content-Type': 'application/rss+xml'}, b'<rss>' + b' ' * 4096 + b'</rss>')
+    with app.app_context():
+        with pytest.raises(fetcher.ContentTooLarge):
+            fetcher.fetch_url(server.base_url + '/big.xml', max_size=1024)
+        response = fetcher.fetch_url(server.base_url + '/big.xml', max_size=8192)
+        assert response.content.startswith(b'<rss>')
+
+
+def test_fetch_url_deadline(app, server):
+    def trickle(wfile):
+        # Stays well under the socket timeout between writes
+        try:
+            for _ in range(20):
+                wfile.write(b' ')
+                wfile.flush()
+                time.sleep(0.3)
+        except OSError:
+            pass
+
+    server.routes['/slow.xml'] = (200, {'Content-Type': 'application/rss+xml', 'Content-Length': '20'}, trickle)
+    app.config['FETCH_DEADLINE'] = 1
+    with app.app_context():
+        start = time.monotonic()
+        with pytest.raises(ReadTimeout):
+            fetcher.fetch_url(server.base_url + '/slow.xml', timeout=2)
+        assert time.monotonic() - start < 3
+
+
+def test_unchanged_body_skipped(app, server):
+    server.routes['/feed.xml'] = (200, {'Content-Type': 'application/rss+xml'}, TEST_FEED)
+    with app.app_context():
+        feed = Feed.get(Feed.id == 2)
+        feed.self_link = server.base_url + '/feed.xml'
+        # Skip favicon fetch
+        feed.icon_last_updated_on = datetime.utcnow()
+        fetcher.fetch_stats.reset()
+        for _ in range(2):
+            feed.next_check_on = None
+            fetcher.Fetcher(feed).update_feed()
+        assert feed.last_status == 200
+        assert fetcher.fetch_stats['parsed_feeds'] == 1
+        assert fetcher.fetch_stats['unchanged_bodies'] == 1
+
+
+def test_unchanged_entries_skipped(app):
+    with app.app_context():
+        feed = Feed.get(Feed.id == 2)
+        fetcher.fetch_stats.reset()
+        assert fetcher.Fetcher(feed).update_feed_with_data(TEST_FEED) == 2
+        # Same entries, yet a different feed body
+        data = TEST_FEED.replace(b'<title>Test feed</title>', b'<title>Test feed (renamed)</title>')
+        assert fetcher.Fetcher(feed).update_feed_with_data(data) == 0
+        assert fetcher.fetch_stats['unchanged_entries'] == 2
+
+
+def test_new_entries_unread(app):
+    with app.app_context():
+        feed = Feed.get(Feed.id == 3)
+        subscribers = Subscription.select().where(Subscription.feed == feed).count()
+        count = Unread.select().count()
+        entry_count = Counter.select(fn.SUM(Counter.entry_count)).where(Counter.feed == feed).scalar()
+        fetcher.Fetcher(feed).update_feed_with_data(TEST_FEED)
+        assert Unread.select().count() == count + 2 * subscribers
+        assert Counter.select(fn.SUM(Counter.unread_count)).where(Counter.feed == feed).scalar() == \
+            Unread.select().join(Entry).where(Entry.feed == feed).count()
+        # Updated entries are not counted twice
+        data = TEST_FEED.replace(b'<title>Second entry</title>', b'<title>Second entry (updated)</title>')
+        fetcher.Fetcher(feed).update_feed_with_data(data)
+        assert Counter.select(fn.SUM(Counter.entry_count)).where(Counter.feed == feed).scalar() == entry_count + 2 * subscribers
+
+
+def test_pruned_entries_not_added_back(app):
+    app.config['RETENTION_ENTRIES'] = 1
+    with app.app_context():
+        feed = Feed.get(Feed.id == 2)
+        fetcher.Fetcher(feed).update_feed_with_data(TEST_FEED)
+        prune_entries(keep=1, feeds=[feed])
+        entry_count = Counter.select(fn.SUM(Counter.entry_count)).where(Counter.feed == feed).scalar()
+        assert fetcher.Fetcher(feed).update_feed_with_data(TEST_FEED) == 0
+        assert Entry.select().where(Entry.feed == feed).count() == 1
+        assert Counter.select(fn.SUM(Counter.entry_count)).where(Counter.feed == feed).scalar() == entry_count
+
+
+def test_entries_upserted_by_guid_hash(app):
+    with app.app_context():
+        feed = Feed.get(Feed.id == 2)
+        # Pretend another entry has a colliding hash of the first guid
+        other = Entry.create(feed=Feed.get(Feed.id == 3), guid='urn:other', guid_hash=make_sha1_hash('http://example.com/1'),
+                             title='Other entry', content='Other', published_on=datetime.utcnow())
+        assert fetcher.Fetcher(feed).update_feed_with_data(TEST_FEED) == 1
+        assert Entry.get_by_id(other.id).title == 'Other entry'
+
+        data = TEST_FEED.replace(b'<title>Second entry</title>', b'<title>Second entry (updated)</title>')
+        assert fetcher.Fetcher(feed).update_feed_with_data(data) == 1
+        entry = Entry.get(Entry.guid_hash == make_sha1_hash('http://example.com/2'))
+        assert entry.title == 'Second entry (updated)'
+
+def test_conditional_get(app, server):
+    server.routes['/feed.xml'] = (200, {'Content-Type': 'application/rss+xml', 'ETag': '"v1"',
+                                        'Last-Modified': 'Sat, 01 Jul 2023 10:00:00 GMT'}, TEST_FEED)
+    with app.app_context():
+        feed = Feed.get(Feed.id == 2)
+        feed.self_link = server.base_url + '/feed.xml'
+        feed.etag = ''
+        feed.icon_last_updated_on = datetime.utcnow()
+        fetcher.fetch_stats.reset()
+        for _ in range(2):
+            feed.next_check_on = None
+            fetcher.Fetcher(feed).update_feed()
+        assert feed.last_modified == 'Sat, 01 Jul 2023 10:00:00 GMT'
+        assert feed.last_status == 304
+        assert fetcher.fetch_stats['modified'] == 1
+        assert fetcher.fetch_stats['not_modified'] == 1
+
+
+def test_icons_deduplicated(app, server):
+    icon = b'\x00\x00\x01\x00 fake icon'
+    server.routes['/a.ico'] = (200, {'Content-Type': 'image/x-icon'}, icon)
+    server.routes['/b.ico'] = (200, {'Content-Type': 'image/x-icon'}, icon)
+    with app.app_context():
+        feeds = []
+        for feed_id, path in [(2, '/a.ico'), (3, '/a.ico'), (4, '/b.ico')]:
+            feed = Feed.get(Feed.id == feed_id)
+            feed.icon_url = server.base_url + path
+            feed.icon_last_updated_on = None
+            feed.save()
+            fetcher.Fetcher(feed).refresh_icon()
+            feeds.append(feed)
+        # Same site icon is fetched once, same image is stored once
+        assert server.paths == ['/a.ico', '/b.ico']
+        assert len(set(f.icon_id for f in feeds)) == 1
+        assert Icon.get_by_id(feeds[0].icon_id).data_uri.startswith('data:image/x-icon;base64,')
+
+
+@pytest.mark.parametrize("headers, seconds", [
+    ({}, None),
+    ({'Retry-After': '120'}, 120),
+    ({'Cache-Control': 'public, max-age=3600'}, 3600),
+    ({'Cache-Control': 'max-age=3600', 'Age': '600'}, 3000),
+    ({'Cache-Control': 'no-cache, max-age=3600'}, None),
+    ({'Expires': format_http_datetime(datetime(2023, 7, 1, 12))}, 7200),
+    ({'Retry-After': '60', 'Cache-Control': 'max-age=600'}, 600),
+])
+def test_response_expiration(headers, seconds):
+    now = datetime(2023, 7, 1, 10)
+    value = fetcher.get_response_expiration(headers, now)
+    if seconds is None:
+        assert value is None
+    else:
+        assert (value - now).total_seconds() == seconds
+
+
+def test_throttling_host_defers_feeds(app, server):
+    server.routes['/feed1.xml'] = (429, {'Retry-After': '120'}, b'')
+    with app.app_context():
+        feed1, feed2 = Feed.get(Feed.id == 2), Feed.get(Feed.id == 3)
+        feed1.self_link, feed1.next_check_on = server.base_url + '/feed1.xml', None
+        feed2.self_link, feed2.next_check_on = server.base_url + '/feed2.xml', None
+        feed1.save()
+        feed2.save()
+        f = fetcher.Fetcher(feed1)
+        f.update_feed()
+        assert feed1.last_status == 429
+        assert feed1.error_count == 0
+        assert (feed1.next_check_on - f.instant).total_seconds() == 120
+        # Every feed on the same host waits too
+        feed2 = Feed.get(Feed.id == 3)
+        assert feed2.next_check_on == feed1.next_check_on
+        feed2.next_check_on = None
+        fetcher.fetch_stats.reset()
+        fetcher.Fetcher(feed2).update_feed()
+        assert fetcher.fetch_stats['deferred_feeds'] == 1
+        assert feed2.next_check_on == feed1.next_check_on
@@ -90,6 +90,21 @@ def test_items_since_id(client):
     assert len(r.json['items']) > 0
 
 
+def test_items_since_id_walk(client):
+    # Syncing a page at time returns every item exactly once, in order
+    ids, since_id = [], 0
+    while True:
+        params = DEFAULT_PARAMS | {'items': '', 'since_id': str(since_id)}
+        r = post(client, test_api_key, query_string=params)
+        page = [item['id'] for item in r.json['items']]
+        if not page:
+            break
+        ids.extend(page)
+        since_id = page[-1]
+    assert ids == sorted(set(ids))
+    assert len(ids) == r.json['total_items']
+
+
 def test_items_with_ids(client):
     params = DEFAULT_PARAMS | {'items': '', 'with_ids': '1,2'}
     r = post(client, test_api_key, query_string=params)
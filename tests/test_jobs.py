@@ -0,0 +1,80 @@
+'''
+Background jobs queue tests
+'''
+from pathlib import Path
+from datetime import datetime, timedelta
+import pytest
+from coldsweat import create_app
+from coldsweat.models import Feed, Job, db_wrapper
+from coldsweat import TestingConfig
+
+import coldsweat.feed as feed
+import coldsweat.jobs as jobs
+
+TEST_DIR = Path(__file__).parent
+
+
+@pytest.fixture()
+def app():
+    app = create_app(config_class=TestingConfig)
+    with open(TEST_DIR.joinpath("test-data.sql"), 'r') as f:
+        # https://docs.python.org/3/library/sqlite3.html#sqlite3.Connection.executescript
+        sql = f.read()
+        db_wrapper.database.connection().executescript(sql)
+
+    yield app
+
+    db_wrapper.database.connection().close()
+
+
+def test_sync_jobs(app):
+    with app.app_context():
+        jobs.sync_jobs()
+        count = Job.select().where(Job.kind == jobs.FETCH_FEED).count()
+        assert count > 0
+        # Running it again does not queue feeds twice
+        jobs.sync_jobs()
+        assert Job.select().where(Job.kind == jobs.FETCH_FEED).count() == count
+
+
+def test_claim_job_lease(app):
+    with app.app_context():
+        jobs.enqueue(jobs.FETCH_FEED, Feed.get_by_id(3))
+
+        job = jobs.claim_job('worker-1')
+        assert job.feed_id == 3
+        assert job.attempts == 1
+        # Leased jobs are not handed to other workers
+        assert jobs.claim_job('worker-2') is None
+
+        # Pretend worker-1 went away
+        Job.update(locked_until=datetime.utcnow() - timedelta(seconds=1)).execute()
+        assert jobs.recover_expired_leases() == 1
+        job_again = jobs.claim_job('worker-2')
+        assert job_again.id == job.id
+
+        # Completing a job which is now leased to someone else is a no-op
+        jobs.complete_job(job)
+        assert Job.get_by_id(job.id).worker_id == 'worker-2'
+
+
+def test_run_fetch_job(app, monkeypatch):
+    fetched = []
+
+    def fake_worker(feed_):
+        fetched.append(feed_.id)
+        feed_.next_check_on = datetime.utcnow() + timedelta(hours=1)
+        feed_.save()
+
+    monkeypatch.setattr(feed, 'feed_worker', fake_worker)
+    with app.app_context():
+        jobs.enqueue(jobs.FETCH_FEED, Feed.get_by_id(3))
+        job = jobs.claim_job('worker-1')
+        jobs.run_job(job)
+
+        assert fetched == [3]
+        # Fetch jobs are put back in queue for the next check
+        job = Job.get_by_id(job.id)
+        assert job.locked_until is None
+        assert job.run_after > datetime.utcnow()
+        assert jobs.claim_job('worker-1') is None
@@ -0,0 +1,71 @@
+'''
+Schema migration tests
+'''
+from pathlib import Path
+import sqlite3
+import pytest
+from coldsweat import create_app
+from coldsweat.models import Counter, Entry, Migration, Read, Subscription, Unread, db_wrapper
+from coldsweat import TestingConfig
+from coldsweat.utilities import make_sha1_hash
+
+import coldsweat.migrations as migrations
+import coldsweat.models as models
+
+TEST_DIR = Path(__file__).parent
+
+
+@pytest.fixture()
+def app(tmp_path):
+    # Start from a database created before migrations were introduced
+    database_path = tmp_path.joinpath('coldsweat.db')
+    with open(TEST_DIR.joinpath("test-data-baseline.sql"), 'r') as f:
+        connection = sqlite3.connect(database_path)
+        connection.executescript(f.read())
+        connection.close()
+
+    class Config(TestingConfig):
+        DATABASE_URL = f'sqlite:///{database_path}'
+
+    app = create_app(config_class=Config)
+
+    yield app
+
+    db_wrapper.database.close()
+
+
+def test_migrate_baseline(app):
+    with app.app_context():
+        read_count = Read.select().count()
+        assert migrations.migrate_database() == len(migrations.MIGRATIONS)
+        assert migrations.migrate_database() == 0
+        assert Read.select().count() == read_count
+
+        unread_count = (Entry.select(Subscription.user, Entry.id)
+                        .join(Subscription, on=(Subscription.feed == Entry.feed))
+                        .count())
+        assert Unread.select().count() == unread_count - read_count
+        for counter in Counter.select():
+            assert counter.entry_count == Entry.select().where(Entry.feed == counter.feed).count()
+            assert counter.unread_count == (Unread.select().join(Entry)
+                                            .where((Unread.user == counter.user) & (Entry.feed == counter.feed))
+                                            .count())
+
+
+def test_setup_existing_database(app):
+    with app.app_context():
+        entry_count = Entry.select().count()
+        models.setup()
+        assert Entry.select().count() == entry_count
+        assert Migration.select().count() == len(migrations.MIGRATIONS)
+        # Indexes of existing tables come from migrations only
+        indexes = [index.columns for index in db_wrapper.database.get_indexes('entries')]
+        assert indexes.count(['guid_hash']) == 1
+
+
+def test_migrate_guid_hash_batches(app, monkeypatch):
+    monkeypatch.setattr(migrations, 'GUID_HASH_BATCH_SIZE', 7)
+    with app.app_context():
+        migrations.migrate_database()
+        for entry in Entry.select(Entry.guid, Entry.guid_hash):
+            assert entry.guid_hash == make_sha1_hash(entry.guid)
@@ -0,0 +1,119 @@
+'''
+Query plan regression tests
+
+Run the queries issued by the Fever API, the web UI and the feed
+  module through SQLite EXPLAIN QUERY PLAN and make sure none of
+  them falls back to a full table scan
+'''
+from pathlib import Path
+import re
+import pytest
+from coldsweat import create_app
+from coldsweat.models import Feed, User, db_wrapper
+from coldsweat import TestingConfig
+
+import coldsweat.feed as feed
+
+TEST_DIR = Path(__file__).parent
+TEST_EMAIL = 'test@example.com'
+# A bare "SCAN table" reads every row, "SCAN table USING INDEX" walks an index instead
+RE_FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+RE_TABLE_ALIAS = re.compile(r'"(\w+)" AS "(\w+)"')
+
+FEVER_PARAMS = [
+    'groups', 'feeds', 'favicons', 'unread_item_ids', 'saved_item_ids',
+    'items', 'items&since_id=10', 'items&max_id=40', 'items&with_ids=1,2,3',
+    'unread_recently_read',
+]
+WEB_URLS = [
+    '/entries',
+    '/entries?filter=saved',
+    '/entries?filter=all',
+    '/entries?filter=group&id=1',
+    '/entries?filter=feed&id=3',
+    '/entries/1',
+    '/feeds',
+    '/groups',
+]
+
+
+@pytest.fixture()
+def app():
+    app = create_app(config_class=TestingConfig)
+    app.config['SECRET_KEY'] = 'test'
+    with open(TEST_DIR.joinpath("test-data.sql"), 'r') as f:
+        # https://docs.python.org/3/library/sqlite3.html#sqlite3.Connection.executescript
+        sql = f.read()
+        db_wrapper.database.connection().executescript(sql)
+
+    yield app
+
+    db_wrapper.database.connection().close()
+
+
+@pytest.fixture()
+def statements(app, monkeypatch):
+    '''
+    Record every query sent to the database
+    '''
+    database = db_wrapper.database.obj
+    execute_sql = database.execute_sql
+    recorded = []
+
+    def record(sql, params=None, *args, **kwargs):
+        recorded.append((sql, params))
+        return execute_sql(sql, params, *args, **kwargs)
+
+    monkeypatch.setattr(database, 'execute_sql', record)
+    return recorded
+
+
+def get_full_scans(statements):
+    database = db_wrapper.database.obj
+    tables = set(database.get_tables())
+    scans = []
+    for sql, params in statements:
+        if not sql.startswith(('SELECT', 'UPDATE', 'DELETE')):
+            continue
+        aliases = dict((alias, table) for table, alias in RE_TABLE_ALIAS.findall(sql))
+        for row in database.cursor().execute('EXPLAIN QUERY PLAN ' + sql, params or ()):
+            match = RE_FULL_SCAN.match(row[-1])
+            # Scanning a subquery result is fine
+            if match and aliases.get(match.group(1), match.group(1)) in tables:
+                scans.append((row[-1], sql))
+    return scans
+
+
+@pytest.mark.parametrize("params", FEVER_PARAMS)
+def test_fever_query_plans(app, statements, params):
+    client = app.test_client()
+    with app.app_context():
+        api_key = User.get(User.email == TEST_EMAIL).fever_api_key
+    del statements[:]
+    r = client.post(f'/fever/?api&{params}', data={'api_key': api_key})
+    assert r.status_code == 200
+    assert get_full_scans(statements) == []
+
+
+@pytest.mark.parametrize("url", WEB_URLS)
+def test_web_query_plans(app, statements, url):
+    client = app.test_client()
+    with app.app_context():
+        user = User.get(User.email == TEST_EMAIL)
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+    del statements[:]
+    r = client.get(url)
+    assert r.status_code == 200
+    assert get_full_scans(statements) == []
+
+
+def test_feed_query_plans(app, statements):
+    with app.app_context():
+        user = User.get(User.email == TEST_EMAIL)
+        del statements[:]
+        list(feed.get_feeds(user))
+        list(feed.get_groups(user))
+        list(feed.get_export_saved_entries(user))
+        feed.prune_entries(days=3650, keep=1000, feeds=[Feed.get_by_id(3)])
+        assert get_full_scans(statements) == []
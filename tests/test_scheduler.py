@@ -0,0 +1,113 @@
+'''
+Long-running fetcher tests
+'''
+from pathlib import Path
+from datetime import datetime, timedelta
+import sqlite3
+import threading
+from peewee import OperationalError
+import pytest
+from coldsweat import create_app
+from coldsweat.models import Feed, db_wrapper
+from coldsweat import TestingConfig
+
+import coldsweat.feed as feed
+import coldsweat.jobs as jobs
+from coldsweat.fetcher import fetch_stats
+from coldsweat.scheduler import FetchScheduler
+
+TEST_DIR = Path(__file__).parent
+
+
+@pytest.fixture()
+def app(tmp_path):
+    # Worker threads open their own connections, so use a database file
+    database_path = tmp_path.joinpath('coldsweat.db')
+    with open(TEST_DIR.joinpath("test-data.sql"), 'r') as f:
+        connection = sqlite3.connect(database_path)
+        connection.executescript(f.read())
+        connection.close()
+
+    class Config(TestingConfig):
+        DATABASE_URL = f'sqlite:///{database_path}'
+
+    app = create_app(config_class=Config)
+    app.instance_path = str(tmp_path)
+
+    yield app
+
+    db_wrapper.database.close()
+
+
+def test_scheduler_dispatches_due_feeds(app, monkeypatch):
+    fetched = []
+    done = threading.Event()
+
+    with app.app_context():
+        # Only feed 3 is due
+        Feed.update(next_check_on=datetime.utcnow() + timedelta(days=1)).execute()
+        Feed.update(next_check_on=None).where(Feed.id == 3).execute()
+
+        scheduler = FetchScheduler(workers=2)
+
+        def fake_worker(feed_):
+            fetched.append(feed_.id)
+            fetch_stats.incr('checked_feeds')
+            feed_.next_check_on = datetime.utcnow() + timedelta(days=1)
+            feed_.save()
+            done.set()
+
+        def run():
+            with app.app_context():
+                scheduler.run()
+
+        monkeypatch.setattr(feed, 'feed_worker', fake_worker)
+        thread = threading.Thread(target=run)
+        thread.start()
+        assert done.wait(5)
+        scheduler.stop()
+        thread.join(5)
+
+    assert not thread.is_alive()
+    assert fetched == [3]
+    assert scheduler.fetched_count == 1
+    assert Path(app.instance_path).joinpath('fetcher-heartbeat').exists()
+
+
+def test_scheduler_counts_checked_feeds(app):
+    with app.app_context():
+        Feed.update(next_check_on=datetime.utcnow() + timedelta(days=1)).execute()
+        Feed.update(next_check_on=None).where(Feed.id == 3).execute()
+        jobs.sync_jobs()
+        # Feed has been checked meanwhile, say by a manual fetch
+        Feed.update(next_check_on=datetime.utcnow() + timedelta(days=1)).where(Feed.id == 3).execute()
+
+        scheduler = FetchScheduler(workers=1, drain=True)
+        scheduler.run()
+        assert jobs.count_due_jobs() == 0
+        assert scheduler.fetched_count == 0
+
+
+def test_scheduler_worker_survives_errors(app, monkeypatch):
+    fetched = []
+    claim_job = jobs.claim_job
+
+    def failing_claim_job(worker_id):
+        monkeypatch.setattr(jobs, 'claim_job', claim_job)
+        raise OperationalError('database is locked')
+
+    def fake_worker(feed_):
+        fetched.append(feed_.id)
+        feed_.next_check_on = datetime.utcnow() + timedelta(days=1)
+        feed_.save()
+
+    with app.app_context():
+        Feed.update(next_check_on=datetime.utcnow() + timedelta(days=1)).execute()
+        Feed.update(next_check_on=None).where(Feed.id == 3).execute()
+
+        monkeypatch.setattr('coldsweat.scheduler.POLL_INTERVAL', 0.01)
+        monkeypatch.setattr(jobs, 'claim_job', failing_claim_job)
+        monkeypatch.setattr(feed, 'feed_worker', fake_worker)
+        FetchScheduler(workers=1, drain=True).run()
+
+    assert fetched == [3]
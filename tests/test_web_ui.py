@@ -1,3 +1,69 @@
+from pathlib import Path
+from peewee import fn
+import pytest
+from coldsweat import create_app
+from coldsweat.models import Entry, Icon, User, db_wrapper
+import coldsweat.feed as feed
+from coldsweat import TestingConfig
+
+TEST_DIR = Path(__file__).parent
+
+
+@pytest.fixture()
+def app():
+    app = create_app(config_class=TestingConfig)
+    app.config['SECRET_KEY'] = 'test'
+    with open(TEST_DIR.joinpath("test-data.sql"), 'r') as f:
+        # https://docs.python.org/3/library/sqlite3.html#sqlite3.Connection.executescript
+        sql = f.read()
+        db_wrapper.database.connection().executescript(sql)
+
+    yield app
+
+    db_wrapper.database.connection().close()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+def test_favicon(client):
+    assert client.get('/favicons/1').status_code == 302
+
+    icon = Icon.get_by_id(1)
+    with client.session_transaction() as session:
+        session['_user_id'] = str(User.get(User.email == 'test@example.com').id)
+    r = client.get('/favicons/1')
+    assert r.status_code == 200
+    assert r.data == bytes(icon.data)
+    assert r.headers['ETag'] == f'"{icon.data_hash}"'
+    assert 'immutable' in r.headers['Cache-Control']
+    assert 'private' in r.headers['Cache-Control']
+
+    r = client.get('/favicons/1', headers={'If-None-Match': f'"{icon.data_hash}"'})
+    assert r.status_code == 304
+    assert not r.data
+
+    assert client.get('/favicons/999').status_code == 404
+
+def test_mark_all_as_read(app, client):
+    with app.app_context():
+        user = User.get(User.email == 'test@example.com')
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+    with app.app_context():
+        max_id = Entry.select(fn.MAX(Entry.id)).scalar()
+        last_id = max(e.id for e in feed.get_unread_entries(user, Entry.id))
+    r = client.get('/entries')
+    assert f'max_id={max_id}' in r.text
+    # Pretend the last entry was fetched after the page load
+    r = client.post('/entries/mark', data={'max_id': last_id - 1})
+    assert r.status_code == 200
+    with app.app_context():
+        assert [e.id for e in feed.get_unread_entries(user, Entry.id)] == [last_id]
+    assert client.post('/entries/mark').status_code == 400
+
 # TODO: test list unread entries
 
 # TODO: add test for bookmarking: